@@ -1,10 +1,11 @@
 import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest'
 import { api } from '../client'
-import { BlobLRUCache, fileCache, thumbCache } from '../../lib/blobCache'
+import { BlobLRUCache, fileCache, previewCache, thumbCache } from '../../lib/blobCache'
 import { resetBrowseRequestBudgetForTests, runWithRequestBudget } from '../requestBudget'
 
 function resetPrefetchTestState(): void {
   fileCache.clear()
+  previewCache.clear()
   thumbCache.clear()
   resetBrowseRequestBudgetForTests()
   vi.restoreAllMocks()
@@ -17,7 +18,7 @@ function requireAbortSignal(signal: AbortSignal | null): AbortSignal {
   return signal
 }
 
-describe('file prefetch api contract', () => {
+describe('preview prefetch api contract', () => {
   beforeEach(resetPrefetchTestState)
   afterEach(resetPrefetchTestState)
 
@@ -25,10 +26,10 @@ describe('file prefetch api contract', () => {
     const fetchSpy = vi.spyOn(globalThis, 'fetch')
 
     // @ts-expect-error verifies the runtime guard for malformed callers.
-    await api.prefetchFile('/a.jpg', 'invalid')
+    await api.prefetchPreview('/a.jpg', 'invalid')
 
     expect(fetchSpy).not.toHaveBeenCalled()
-    expect(fileCache.has('/a.jpg')).toBe(false)
+    expect(previewCache.getSize()).toBe(0)
   })
 
   it('sends prefetch context header and caches the blob when successful', async () => {
@@ -36,23 +37,37 @@ describe('file prefetch api contract', () => {
       new Response(new Blob([new Uint8Array([1, 2, 3])]), { status: 200, headers: { 'content-type': 'image/jpeg' } }),
     )
 
-    await api.prefetchFile('/b.jpg', 'viewer')
+    await api.prefetchPreview('/b.jpg', 'viewer')
 
     expect(fetchSpy).toHaveBeenCalledTimes(1)
     const [url, init] = fetchSpy.mock.calls[0]
-    expect(String(url)).toContain('/file?path=%2Fb.jpg')
+    expect(String(url)).toContain('/preview?path=%2Fb.jpg&size=2400')
     expect((init?.headers as Record<string, string>)['x-lenslet-prefetch']).toBe('viewer')
-    expect(fileCache.has('/b.jpg')).toBe(true)
+    expect(previewCache.has('/b.jpg@2400')).toBe(true)
   })
 
-  it('does not refetch when file is already cached', async () => {
-    fileCache.set('/c.jpg', new Blob([new Uint8Array([9])]))
+  it('does not refetch when the preview tier is already cached', async () => {
+    previewCache.set('/c.jpg@1600', new Blob([new Uint8Array([9])]))
     const fetchSpy = vi.spyOn(globalThis, 'fetch')
 
-    await api.prefetchFile('/c.jpg', 'compare')
+    await api.prefetchPreview('/c.jpg', 'compare')
 
     expect(fetchSpy).not.toHaveBeenCalled()
   })
+
+  it('serves viewer loads from the prefetched preview and keeps tiers apart', async () => {
+    previewCache.set('/d.jpg@2400', new Blob([new Uint8Array([1, 2])]))
+    const fetchSpy = vi.spyOn(globalThis, 'fetch').mockResolvedValue(
+      new Response(new Blob([new Uint8Array([3])]), { status: 200, headers: { 'content-type': 'image/webp' } }),
+    )
+
+    expect((await api.getPreview('/d.jpg', 'viewer')).size).toBe(2)
+    expect(fetchSpy).not.toHaveBeenCalled()
+
+    expect((await api.getPreview('/d.jpg', 'compare')).size).toBe(1)
+    expect(String(fetchSpy.mock.calls[0][0])).toContain('/preview?path=%2Fd.jpg&size=1600')
+    expect(fileCache.has('/d.jpg')).toBe(false)
+  })
 })
 
 describe('blob cache promise contract', () => {
@@ -96,6 +111,53 @@ describe('thumb prefetch api contract', () => {
     expect(String(fetchSpy.mock.calls[0][0])).toContain('/thumb?path=%2Fthumb-ok.webp')
   })
 
+  it('sends thumbnail priority and viewport generation hints', async () => {
+    const fetchSpy = vi.spyOn(globalThis, 'fetch').mockResolvedValue(
+      new Response(new Blob([new Uint8Array([7])]), { status: 200, headers: { 'content-type': 'image/webp' } }),
+    )
+
+    const generation = api.advanceThumbGeneration()
+    api.prefetchThumb('/thumb-hint.webp', 'prefetch')
+    await Promise.resolve()
+
+    expect(fetchSpy).toHaveBeenCalledTimes(1)
+    expect((fetchSpy.mock.calls[0][1] as RequestInit).headers).toEqual({
+      'x-lenslet-thumb-priority': 'prefetch',
+      'x-lenslet-thumb-generation': String(generation),
+    })
+  })
+
+  it('re-requests a visible thumbnail once when the server drops its queued work', async () => {
+    const fetchSpy = vi.spyOn(globalThis, 'fetch')
+      .mockResolvedValueOnce(new Response('thumbnail_busy', { status: 503 }))
+      .mockResolvedValueOnce(
+        new Response(new Blob([new Uint8Array([4])]), { status: 200, headers: { 'content-type': 'image/webp' } }),
+      )
+
+    const blob = await api.getThumb('/thumb-dropped.webp')
+
+    expect(fetchSpy).toHaveBeenCalledTimes(2)
+    expect(blob.size).toBe(1)
+    expect(thumbCache.has('/thumb-dropped.webp')).toBe(true)
+  })
+
+  it('re-requests a visible thumbnail that shared a dropped prefetch', async () => {
+    const fetchSpy = vi.spyOn(globalThis, 'fetch')
+      .mockResolvedValueOnce(new Response('thumbnail_busy', { status: 503 }))
+      .mockResolvedValueOnce(
+        new Response(new Blob([new Uint8Array([5, 6])]), { status: 200, headers: { 'content-type': 'image/webp' } }),
+      )
+
+    api.prefetchThumb('/thumb-shared.webp', 'prefetch')
+    const blob = await api.getThumb('/thumb-shared.webp')
+
+    expect(fetchSpy).toHaveBeenCalledTimes(2)
+    expect((fetchSpy.mock.calls[1][1] as RequestInit).headers).toMatchObject({
+      'x-lenslet-thumb-priority': 'visible',
+    })
+    expect(blob.size).toBe(2)
+  })
+
   it('skips thumbnail prefetch when thumb queue is saturated', async () => {
     const fetchSpy = vi.spyOn(globalThis, 'fetch').mockResolvedValue(
       new Response(new Blob([new Uint8Array([1])]), { status: 200, headers: { 'content-type': 'image/webp' } }),
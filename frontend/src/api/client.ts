@@ -1,5 +1,5 @@
-import { fetchJSON, fetchBlob } from '../lib/fetcher'
-import { fileCache, thumbCache } from '../lib/blobCache'
+import { fetchJSON, fetchBlob, FetchError } from '../lib/fetcher'
+import { fileCache, previewCache, thumbCache } from '../lib/blobCache'
 import type { BrowseEndpoint } from '../lib/browseHotpath'
 import {
   cancelBrowseRequests as cancelBudgetedBrowseRequests,
@@ -44,6 +44,33 @@ function isFullFilePrefetchContext(value: unknown): value is FullFilePrefetchCon
   return value === 'viewer' || value === 'compare'
 }
 
+export type ThumbPriority = 'visible' | 'near' | 'prefetch'
+
+// Bumped whenever the grid viewport settles on a new set of cells; the server
+// demotes this session's queued thumbnail work from older generations and
+// drops the part of it that was only ever prefetched.
+let thumbGeneration = 0
+
+function thumbRequestHeaders(priority: ThumbPriority): Record<string, string> {
+  return {
+    'x-lenslet-thumb-priority': priority,
+    'x-lenslet-thumb-generation': String(thumbGeneration),
+  }
+}
+
+function fetchVisibleThumb(path: string) {
+  return runWithRequestBudget('thumb', () =>
+    fetchBlob(thumbUrl(path), { headers: thumbRequestHeaders('visible') }),
+  )
+}
+
+// A visible cell can share an in-flight prefetch that the server later dropped
+// (503) and that thumbCache.prefetch resolves to an empty blob; ask once more.
+function isDroppedThumbResult(result: unknown): boolean {
+  if (result instanceof Blob) return result.size === 0
+  return result instanceof FetchError && result.status === 503
+}
+
 function thumbUrl(path: string): string {
   return apiUrl(`/thumb?path=${encodeURIComponent(path)}`)
 }
@@ -52,6 +79,17 @@ function fileUrl(path: string): string {
   return apiUrl(`/file?path=${encodeURIComponent(path)}`)
 }
 
+// Matches the server's preview tiers; an explicit size keeps one URL per tier.
+const PREVIEW_LONG_SIDE: Record<FullFilePrefetchContext, number> = { viewer: 2400, compare: 1600 }
+
+function previewUrl(path: string, context: FullFilePrefetchContext): string {
+  return apiUrl(`/preview?path=${encodeURIComponent(path)}&size=${PREVIEW_LONG_SIDE[context]}`)
+}
+
+function previewCacheKey(path: string, context: FullFilePrefetchContext): string {
+  return `${path}@${PREVIEW_LONG_SIDE[context]}`
+}
+
 const CLIENT_ID_SESSION_KEY = 'lenslet.client_id.session'
 const LAST_EVENT_ID_KEY = 'lenslet.last_event_id'
 const RECONNECT_BASE_MS = 1000
@@ -707,13 +745,18 @@ export const api = {
   },
 
   getThumb: (path: string): Promise<Blob> => {
-    return thumbCache.getOrFetch(path, () =>
-      runWithRequestBudget('thumb', () =>
-        fetchBlob(thumbUrl(path)),
-      )
+    const load = () => thumbCache.getOrFetch(path, () => fetchVisibleThumb(path))
+    return load().then(
+      (blob) => (isDroppedThumbResult(blob) ? load() : blob),
+      (error: unknown) => (isDroppedThumbResult(error) ? load() : Promise.reject(error)),
     )
   },
 
+  advanceThumbGeneration: (): number => {
+    thumbGeneration += 1
+    return thumbGeneration
+  },
+
   // Uncached hover fetches stay outside fileCache so hover cancellation cannot
   // abort viewer/compare loads sharing that cache's in-flight request.
   getHoverPreview: (path: string): { promise: Promise<Blob>; abort?: () => void } => {
@@ -724,12 +767,12 @@ export const api = {
     )
   },
 
-  prefetchThumb: (path: string): void => {
+  prefetchThumb: (path: string, priority: ThumbPriority = 'near'): void => {
     const budget = getBrowseRequestBudgetSnapshot()
     if (budget.queued.thumb >= THUMB_PREFETCH_MAX_QUEUED) return
     thumbCache.prefetch(path, () =>
       runWithRequestBudget('thumb', () =>
-        fetchBlob(thumbUrl(path)),
+        fetchBlob(thumbUrl(path), { headers: thumbRequestHeaders(priority) }),
       )
     )
   },
@@ -750,21 +793,31 @@ export const api = {
     }).promise
   },
 
-  // Full-file prefetch is restricted to viewer/compare contexts and capped at
-  // 40MB so scroll/hover behavior cannot fill the shared cache with huge originals.
-  prefetchFile: async (path: string, context: FullFilePrefetchContext): Promise<void> => {
+  // Viewer and compare show viewer-sized previews; originals stay on /file for downloads.
+  getPreview: (path: string, context: FullFilePrefetchContext): Promise<Blob> => {
+    return previewCache.getOrFetch(previewCacheKey(path, context), () =>
+      runWithRequestBudget('file', () =>
+        fetchBlob(previewUrl(path, context)),
+      )
+    )
+  },
+
+  // Preview prefetch is restricted to viewer/compare contexts and capped at
+  // 40MB so scroll/hover behavior cannot fill the shared cache with huge blobs.
+  prefetchPreview: async (path: string, context: FullFilePrefetchContext): Promise<void> => {
     if (!isFullFilePrefetchContext(context)) return
+    const key = previewCacheKey(path, context)
     // Skip if already cached or in-flight
-    if (fileCache.has(path) || fileCache.isInflight(path)) return
+    if (previewCache.has(key) || previewCache.isInflight(key)) return
 
     try {
       const blob = await runWithRequestBudget('file', () =>
-        fetchBlob(fileUrl(path), {
+        fetchBlob(previewUrl(path, context), {
           headers: { 'x-lenslet-prefetch': context },
         }),
       ).promise
       if (blob.size <= MAX_PREFETCH_SIZE) {
-        fileCache.set(path, blob)
+        previewCache.set(key, blob)
       }
     } catch {
       // Silently ignore prefetch errors
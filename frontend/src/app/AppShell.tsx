@@ -72,7 +72,7 @@ import type {
 } from '../lib/types'
 import { getMetricDisplayName } from '../lib/metricDisplay'
 import { cssVars } from '../lib/cssVars'
-import { fileCache, thumbCache } from '../lib/blobCache'
+import { fileCache, previewCache, thumbCache } from '../lib/blobCache'
 import { thumbnailObjectUrlCache } from '../features/browse/model/thumbnailObjectUrlCache'
 import LeftSidebar from './components/LeftSidebar'
 import GridTopStack from './components/GridTopStack'
@@ -205,7 +205,7 @@ function useRenderSchemaRevision(schemaKey: string): number {
   return ownerRef.current.revision
 }
 
-function prefetchFilesAndThumbs(
+function prefetchPreviewsAndThumbs(
   paths: readonly string[],
   context: FullFilePrefetchContext,
   itemByPath: ReadonlyMap<string, BrowseItemPayload>,
@@ -213,9 +213,9 @@ function prefetchFilesAndThumbs(
 ): void {
   for (const path of paths) {
     if (!directOriginalImageUrl(itemByPath.get(path), proxyHttpOriginals)) {
-      api.prefetchFile(path, context)
+      api.prefetchPreview(path, context)
     }
-    api.prefetchThumb(path)
+    api.prefetchThumb(path, 'prefetch')
   }
 }
 
@@ -812,6 +812,7 @@ export default function AppShell({
         setTableSourceColumns(next.enabled ? next : null)
         setDismissedTableSourceWarning(null)
         fileCache.clear()
+        previewCache.clear()
         thumbCache.clear()
         thumbnailObjectUrlCache.clear()
         queryClient.invalidateQueries()
@@ -1284,7 +1285,7 @@ export default function AppShell({
   })
 
   useEffect(() => {
-    prefetchFilesAndThumbs(
+    prefetchPreviewsAndThumbs(
       getViewerFilePrefetchPaths(itemPaths, viewer),
       'viewer',
       itemByPath,
@@ -1294,7 +1295,7 @@ export default function AppShell({
 
   useEffect(() => {
     if (!compareOpen) return
-    prefetchFilesAndThumbs(
+    prefetchPreviewsAndThumbs(
       getCompareFilePrefetchPaths(comparePaths, compareIndexClamped),
       'compare',
       itemByPath,
@@ -1,7 +1,7 @@
 import { useCallback, useState, type Dispatch, type SetStateAction } from 'react'
 import type { QueryClient } from '@tanstack/react-query'
 import { api } from '../../api/client'
-import { fileCache, thumbCache } from '../../lib/blobCache'
+import { fileCache, previewCache, thumbCache } from '../../lib/blobCache'
 import { sanitizePath } from '../../lib/paths'
 import { thumbnailObjectUrlCache } from '../../features/browse/model/thumbnailObjectUrlCache'
 
@@ -85,6 +85,7 @@ export function useFolderRefreshActions({
     thumbCache.evictPrefix(target)
     thumbnailObjectUrlCache.evictPrefix(target)
     fileCache.evictPrefix(target)
+    previewCache.evictPrefix(target)
   }, [
     current,
     invalidateDerivedCounts,
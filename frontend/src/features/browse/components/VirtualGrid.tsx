@@ -161,6 +161,7 @@ export default function VirtualGrid({
   const appliedSelectionRestoreTokenRef = useRef(0)
   const appliedTopAnchorRestoreTokenRef = useRef(0)
   const lastVisiblePathsRef = useRef<Set<string>>(new Set())
+  const lastThumbGenerationPathsRef = useRef<Set<string>>(new Set())
   const lastTopAnchorPathRef = useRef<string | null>(null)
   const longPressControllerRef = useRef<LongPressController | null>(null)
   const longPressPathRef = useRef<string | null>(null)
@@ -806,6 +807,12 @@ export default function VirtualGrid({
     [items, layout, virtualRows, parentRef],
   )
 
+  useEffect(() => {
+    if (interactionDisabled || arePathSetsEqual(lastThumbGenerationPathsRef.current, visiblePaths)) return
+    lastThumbGenerationPathsRef.current = visiblePaths
+    api.advanceThumbGeneration()
+  }, [interactionDisabled, visiblePaths])
+
   useEffect(() => {
     if (interactionDisabled || !onVisiblePathsChange) return
     if (arePathSetsEqual(lastVisiblePathsRef.current, visiblePaths)) return
@@ -200,12 +200,12 @@ export default function CompareViewer({
   const aUnsupportedReason = aDirectUrl ? null : originalMediaUnsupportedReason(aItem)
   const bUnsupportedReason = bDirectUrl ? null : originalMediaUnsupportedReason(bItem)
   const aBlobResource = useBlobResource(
-    aPath && !aDirectUrl && !aUnsupportedReason ? () => api.getFile(aPath) : null,
+    aPath && !aDirectUrl && !aUnsupportedReason ? () => api.getPreview(aPath, 'compare') : null,
     [aPath, aDirectUrl, aUnsupportedReason],
     { source: 'proxy', unsupportedReason: aUnsupportedReason },
   )
   const bBlobResource = useBlobResource(
-    bPath && !bDirectUrl && !bUnsupportedReason ? () => api.getFile(bPath) : null,
+    bPath && !bDirectUrl && !bUnsupportedReason ? () => api.getPreview(bPath, 'compare') : null,
     [bPath, bDirectUrl, bUnsupportedReason],
     { source: 'proxy', unsupportedReason: bUnsupportedReason },
   )
@@ -97,7 +97,7 @@ export default function Viewer({
   const directUrl = directOriginalImageUrl(item, proxyHttpOriginals, directFailures)
   const unsupportedReason = directUrl ? null : originalMediaUnsupportedReason(item)
   const blobResource = useBlobResource(
-    directUrl || unsupportedReason ? null : () => api.getFile(path),
+    directUrl || unsupportedReason ? null : () => api.getPreview(path, 'viewer'),
     [path, directUrl, unsupportedReason],
     { source: 'proxy', unsupportedReason, identity: path },
   )
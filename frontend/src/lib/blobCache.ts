@@ -224,3 +224,6 @@ export class BlobLRUCache {
 export const fileCache = new BlobLRUCache(60 * 1024 * 1024)
 
 export const thumbCache = new BlobLRUCache(20 * 1024 * 1024)
+
+// Keyed `<path>@<long side>` so folder eviction still matches by path prefix.
+export const previewCache = new BlobLRUCache(40 * 1024 * 1024)
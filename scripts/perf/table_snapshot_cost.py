@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Measure table query-engine mutable snapshot cost against row count."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Sequence
+
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lenslet.browse.query import BrowseFilterAst, BrowseQuerySpec, StarsInFilter
+from lenslet.storage.table import TableStorage, TableStorageOptions
+from scripts.perf.table_query_latency import percentile
+from scripts.smoke_harness import write_json_evidence
+
+
+SCHEMA_VERSION = 1
+DEFAULT_ROW_COUNTS = (10_000, 100_000, 400_000)
+DEFAULT_REPETITIONS = 50
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROW_COUNTS))
+    parser.add_argument("--repetitions", type=int, default=DEFAULT_REPETITIONS)
+    parser.add_argument("--output-json", type=Path, default=None)
+    return parser.parse_args(argv)
+
+
+def run_benchmark(
+    *,
+    row_counts: Sequence[int] = DEFAULT_ROW_COUNTS,
+    repetitions: int = DEFAULT_REPETITIONS,
+) -> dict[str, Any]:
+    if not row_counts or any(count <= 0 for count in row_counts) or repetitions <= 0:
+        raise ValueError("row counts and repetitions must be positive")
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "repetitions": repetitions,
+        "cases": [_measure(row_count, repetitions) for row_count in row_counts],
+    }
+
+
+def _measure(row_count: int, repetitions: int) -> dict[str, Any]:
+    storage = _build_storage(row_count)
+    engine = storage.query_engine
+    mutable = engine._mutable
+    spec = BrowseQuerySpec(
+        "/gallery",
+        True,
+        0,
+        100,
+        BrowseFilterAst((StarsInFilter((5,)),)),
+    )
+    paths = engine.columns.paths
+    mutable.snapshot(spec)
+
+    unchanged: list[float] = []
+    for _ in range(repetitions):
+        start = perf_counter()
+        mutable.snapshot(spec)
+        unchanged.append((perf_counter() - start) * 1_000_000)
+
+    after_update: list[float] = []
+    for index in range(repetitions):
+        engine.update_sidecar(paths[(index * 7919) % row_count], {"star": index % 5 + 1})
+        start = perf_counter()
+        mutable.snapshot(spec)
+        after_update.append((perf_counter() - start) * 1_000_000)
+
+    # Reference cost of the previous snapshot, which copied five row-length lists.
+    tuple_copy: list[float] = []
+    columns = [
+        list(column)
+        for column in (
+            mutable._stars,
+            mutable._notes,
+            mutable._search_text,
+            mutable._dimension_overrides,
+            mutable._dynamic_metrics,
+        )
+    ]
+    for _ in range(max(1, repetitions // 10)):
+        start = perf_counter()
+        for column in columns:
+            tuple(column)
+        tuple_copy.append((perf_counter() - start) * 1_000_000)
+
+    return {
+        "row_count": row_count,
+        "snapshot_unchanged_us": _summary(unchanged),
+        "snapshot_after_update_us": _summary(after_update),
+        "full_tuple_copy_us": _summary(tuple_copy),
+    }
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "p50": round(percentile(samples, 0.5), 3),
+        "p95": round(percentile(samples, 0.95), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def _build_storage(row_count: int) -> TableStorage:
+    rows = [
+        {
+            "source": f"https://example.test/assets/item_{index:07d}.jpg",
+            "path": f"gallery/item_{index:07d}.jpg",
+        }
+        for index in range(row_count)
+    ]
+    return TableStorage(
+        rows,
+        options=TableStorageOptions(
+            source_column="source",
+            path_column="path",
+            skip_dimension_probe=True,
+            allow_local=False,
+        ),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    result = run_benchmark(row_counts=args.rows, repetitions=args.repetitions)
+    if args.output_json is not None:
+        write_json_evidence(args.output_json, result)
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
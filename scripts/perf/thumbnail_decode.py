@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Compare full-resolution and reduced-on-decode thumbnail latency and peak RSS."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Sequence
+
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lenslet.storage.image_media import make_webp_thumbnail
+from scripts.smoke_harness import write_json_evidence
+
+
+SCHEMA_VERSION = 1
+_MODES = ("full_decode", "reduced_decode")
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=6_000)
+    parser.add_argument("--height", type=int, default=4_000)
+    parser.add_argument("--thumb-size", type=int, default=256)
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--output-json", type=Path, default=None)
+    return parser.parse_args(argv)
+
+
+def run_benchmark(
+    *,
+    width: int,
+    height: int,
+    thumb_size: int = 256,
+    repetitions: int = 5,
+) -> dict[str, Any]:
+    if width <= 0 or height <= 0 or thumb_size <= 0 or repetitions <= 0:
+        raise ValueError("width, height, thumb_size, and repetitions must be positive")
+    # Each mode runs in its own process, started before the fixture is generated, so
+    # ru_maxrss (which Linux carries across fork/exec) reflects only that decode path.
+    context = multiprocessing.get_context("spawn")
+    pools = {mode: ProcessPoolExecutor(max_workers=1, mp_context=context) for mode in _MODES}
+    cases: dict[str, Any] = {}
+    try:
+        for pool in pools.values():
+            pool.submit(_peak_rss_mb).result()
+        source = _make_jpeg(width, height)
+        with tempfile.TemporaryDirectory(prefix="lenslet-thumb-decode-") as temp_dir:
+            source_path = Path(temp_dir) / "source.jpg"
+            source_path.write_bytes(source)
+            for mode, pool in pools.items():
+                cases[mode] = pool.submit(
+                    _measure_mode,
+                    str(source_path),
+                    thumb_size,
+                    repetitions,
+                    mode == "reduced_decode",
+                ).result()
+    finally:
+        for pool in pools.values():
+            pool.shutdown()
+    full = cases["full_decode"]
+    reduced = cases["reduced_decode"]
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "source": {"width": width, "height": height, "bytes": len(source)},
+        "thumb_size": thumb_size,
+        "repetitions": repetitions,
+        "cases": cases,
+        "latency_speedup": round(full["mean_ms"] / max(reduced["mean_ms"], 1e-6), 3),
+        "peak_rss_delta_saved_mb": round(
+            full["peak_rss_delta_mb"] - reduced["peak_rss_delta_mb"],
+            3,
+        ),
+    }
+
+
+def _make_jpeg(width: int, height: int) -> bytes:
+    from PIL import Image
+
+    gradient = Image.linear_gradient("L").resize((width, height))
+    noise = Image.effect_noise((width, height), 48)
+    image = Image.merge("RGB", (gradient, noise, gradient.transpose(Image.FLIP_LEFT_RIGHT)))
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def _measure_mode(
+    source_path: str,
+    thumb_size: int,
+    repetitions: int,
+    reduce_on_decode: bool,
+) -> dict[str, Any]:
+    source = Path(source_path).read_bytes()
+    baseline_rss = _peak_rss_mb()
+    latencies: list[float] = []
+    output_size: tuple[int, int] | None = None
+    for _ in range(repetitions):
+        started = time.perf_counter()
+        thumb, _dims = make_webp_thumbnail(
+            source,
+            thumb_size=thumb_size,
+            thumb_quality=70,
+            reduce_on_decode=reduce_on_decode,
+        )
+        latencies.append((time.perf_counter() - started) * 1_000.0)
+        output_size = _webp_size(thumb)
+    peak_rss = _peak_rss_mb()
+    ordered = sorted(latencies)
+    return {
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+        "peak_rss_mb": round(peak_rss, 3),
+        "peak_rss_delta_mb": round(max(0.0, peak_rss - baseline_rss), 3),
+        "thumbnail_size": list(output_size) if output_size else None,
+    }
+
+
+def _webp_size(data: bytes) -> tuple[int, int]:
+    from PIL import Image
+
+    with Image.open(BytesIO(data)) as image:
+        return image.size
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    result = run_benchmark(
+        width=args.width,
+        height=args.height,
+        thumb_size=args.thumb_size,
+        repetitions=args.repetitions,
+    )
+    if args.output_json is not None:
+        write_json_evidence(args.output_json, result, sort_keys=False)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
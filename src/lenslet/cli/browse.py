@@ -18,6 +18,7 @@ from ..embeddings.config import EmbeddingConfig, parse_embedding_columns, parse_
 from ..indexing_status import CliIndexingReporter
 from ..storage.table.input import TableInput
 from ..storage.table.launch import TableLaunchRequest, TableLaunchResult, detect_source_column, prepare_table_launch
+from ..storage.table.parquet_dataset import is_parquet_dataset_target, parquet_workspace_anchor
 from ..terminal_banner import banner_row
 from ..web.auth import trusted_write_origins_for_host
 from ..web.app.launch_session import (
@@ -84,6 +85,7 @@ class BrowseTarget:
     is_remote_table: bool
     remote_kind: str | None = None
     remote_uri: str | None = None
+    is_parquet_dataset: bool = False
 
     @property
     def is_dataset_dir(self) -> bool:
@@ -125,6 +127,15 @@ def _resolve_embedding_config_or_exit(args: BrowseCliArgs) -> EmbeddingConfig:
 
 def _resolve_browse_target_or_exit(raw_target: str) -> BrowseTarget:
     candidate = Path(raw_target).expanduser()
+    if is_parquet_dataset_target(candidate):
+        # Shard directories resolve normally; globs stay patterns and are expanded at launch.
+        return BrowseTarget(
+            raw_target=raw_target,
+            target=candidate.resolve() if candidate.exists() else candidate.absolute(),
+            is_table_file=True,
+            is_remote_table=False,
+            is_parquet_dataset=True,
+        )
     if candidate.exists():
         target = candidate.resolve()
         is_table_file = target.is_file() and target.suffix.lower() == ".parquet"
@@ -292,7 +303,7 @@ def _local_browse_target_or_exit(target_info: BrowseTarget) -> Path:
 
 
 def _maybe_embed_browse_target_or_exit(args: BrowseCliArgs, target_info: BrowseTarget) -> BrowseTarget:
-    if args.embed and target_info.is_remote_table:
+    if args.embed and (target_info.is_remote_table or target_info.is_parquet_dataset):
         raise BrowseCliError("--embed requires a local parquet file")
     if not (args.embed and target_info.is_table_file):
         return target_info
@@ -369,6 +380,8 @@ def _storage_label_for_banner(target_info: BrowseTarget) -> str:
     if target_info.is_remote_table:
         return "Table index (hf dataset)" if target_info.remote_kind == "hf" else "Table index (remote)"
     target = _local_browse_target_or_exit(target_info)
+    if target_info.is_parquet_dataset:
+        return "Table index (parquet dataset)"
     if target_info.is_table_file:
         return "Table index (parquet file)"
     has_parquet = (target / "items.parquet").is_file()
@@ -487,6 +500,12 @@ def _build_browse_runtime_options(
         thumb_size=args.thumb_size,
         thumb_quality=args.thumb_quality,
         thumb_cache=args.thumb_cache,
+        thumb_cache_layout=args.thumb_cache_layout,
+        thumb_cache_mb=args.thumb_cache_mb,
+        thumb_engine=args.thumb_engine,
+        thumb_memory_cache_mb=args.thumb_memory_cache_mb,
+        original_cache_mb=args.original_cache_mb,
+        analysis_workers=args.analysis_workers,
         indexing_listener=indexing_reporter.handle_update,
     )
     embedding_options = server_api.EmbeddingAppOptions(
@@ -545,10 +564,12 @@ def _create_remote_table_app_or_exit(plan: BrowseLaunchPlan) -> object:
 
 def _create_table_file_app_or_exit(plan: BrowseLaunchPlan, target: Path) -> object:
     args = plan.args
+    is_dataset = plan.target_info.is_parquet_dataset
+    workspace_anchor = parquet_workspace_anchor(target)
     workspace = (
-        Workspace.for_temp_dataset(str(target))
+        Workspace.for_temp_dataset(str(workspace_anchor))
         if args.no_write
-        else Workspace.for_parquet(target, can_write=True)
+        else Workspace.for_parquet(workspace_anchor, can_write=True)
     )
     launch_result = prepare_table_launch(
         TableLaunchRequest(
@@ -558,6 +579,7 @@ def _create_table_file_app_or_exit(plan: BrowseLaunchPlan, target: Path) -> obje
             path_column=args.path_column,
             cache_dimensions=args.cache_dimensions,
             dimension_cache_dir=_dimension_cache_dir_for_launch(args, workspace),
+            column_cache_dir=workspace.column_store_cache_dir(),
             skip_dimension_probe=args.skip_dimension_probe,
             embedding_config=plan.embedding_config,
             auto_detect_root=True,
@@ -575,7 +597,7 @@ def _create_table_file_app_or_exit(plan: BrowseLaunchPlan, target: Path) -> obje
             show_source=True,
             workspace=workspace,
             og_preview=args.og_preview,
-            embedding_table_path=str(target),
+            embedding_table_path=None if is_dataset else str(target),
             launch_session=_local_table_launch_session(
                 raw_target=str(target),
                 kind="local_parquet",
@@ -603,6 +625,11 @@ def _create_directory_app_or_exit(plan: BrowseLaunchPlan, target: Path) -> objec
                 path_column=args.path_column,
                 cache_dimensions=args.cache_dimensions,
                 dimension_cache_dir=_dimension_cache_dir_for_launch(args, plan.dataset_workspace),
+                column_cache_dir=(
+                    plan.dataset_workspace.column_store_cache_dir()
+                    if plan.dataset_workspace is not None
+                    else None
+                ),
                 skip_dimension_probe=args.skip_dimension_probe,
                 embedding_config=plan.embedding_config,
                 thumb_size=args.thumb_size,
@@ -6,6 +6,9 @@ import argparse
 import sys
 from dataclasses import dataclass, replace
 
+from ..web.cache.thumbs import ThumbCacheLayout
+from ..web.thumbs import ThumbnailEngineMode
+
 
 @dataclass(frozen=True, slots=True)
 class BrowseCliArgs:
@@ -21,6 +24,12 @@ class BrowseCliArgs:
     cache_dimensions: bool
     skip_dimension_probe: bool
     thumb_cache: bool
+    thumb_cache_layout: ThumbCacheLayout
+    thumb_cache_mb: int
+    thumb_engine: ThumbnailEngineMode
+    thumb_memory_cache_mb: int
+    original_cache_mb: int
+    analysis_workers: int | None
     og_preview: bool
     reload: bool
     no_write: bool
@@ -53,6 +62,12 @@ class BrowseCliArgs:
             cache_dimensions=str(args.dimension_cache) == "source",
             skip_dimension_probe=bool(args.skip_dimension_probe),
             thumb_cache=bool(args.thumb_cache),
+            thumb_cache_layout=args.thumb_cache_layout,
+            thumb_cache_mb=int(args.thumb_cache_mb),
+            thumb_engine=args.thumb_engine,
+            thumb_memory_cache_mb=int(args.thumb_memory_cache_mb),
+            original_cache_mb=int(args.original_cache_mb),
+            analysis_workers=args.analysis_workers,
             og_preview=bool(args.og_preview),
             reload=bool(args.reload),
             no_write=bool(args.no_write),
@@ -161,6 +176,57 @@ def _build_browse_parser() -> argparse.ArgumentParser:
         default=True,
         help="Disable thumbnail cache when a workspace is available",
     )
+    parser.add_argument(
+        "--thumb-cache-layout",
+        choices=("directory", "packed"),
+        default="directory",
+        help=(
+            "On-disk thumbnail cache layout: one file per thumbnail, or packed segment files "
+            "that migrate existing directory entries on read (default: directory)"
+        ),
+    )
+    parser.add_argument(
+        "--thumb-cache-mb",
+        type=int,
+        default=200,
+        help=(
+            "Workspace thumbnail disk cache cap in MiB, oldest entries evicted first; "
+            "0 disables the cap (default: 200)"
+        ),
+    )
+    parser.add_argument(
+        "--thumb-engine",
+        choices=("threads", "processes"),
+        default="threads",
+        help=(
+            "Thumbnail generation engine: in-process threads, or a worker-process pool "
+            "sized to the host's cores (default: threads)"
+        ),
+    )
+    parser.add_argument(
+        "--thumb-memory-cache-mb",
+        type=int,
+        default=256,
+        help="In-memory thumbnail cache budget in MiB; least-recently-used thumbnails are evicted (default: 256)",
+    )
+    parser.add_argument(
+        "--original-cache-mb",
+        type=int,
+        default=1024,
+        help=(
+            "Workspace disk cache for S3/HTTP originals in MiB, revalidated with ETag/Last-Modified; "
+            "0 disables (default: 1024)"
+        ),
+    )
+    parser.add_argument(
+        "--analysis-workers",
+        type=int,
+        default=None,
+        help=(
+            "Concurrent table filter/sort analyses; each one already runs parallel Arrow kernels "
+            "(default: a quarter of the CPU count, at most 8)"
+        ),
+    )
     parser.add_argument(
         "--no-og-preview",
         action="store_false",
@@ -6,6 +6,7 @@ import sys
 
 from .browse import _main_browse
 from .rank import _main_rank
+from .thumbs import _main_thumbs
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -13,6 +14,9 @@ def main(argv: list[str] | None = None) -> None:
     if argv_list and argv_list[0] == "rank":
         _main_rank(argv_list[1:])
         return
+    if argv_list and argv_list[0] == "thumbs":
+        _main_thumbs(argv_list[1:])
+        return
     _main_browse(argv_list)
 
 
@@ -0,0 +1,224 @@
+"""Thumbnail pre-generation command for the Lenslet CLI."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Any
+
+from .browse import BrowseCliError, _resolve_browse_target_or_exit
+from ..workspace import Workspace
+
+
+_BYTES_PER_MIB = 1024 * 1024
+
+
+class ThumbsCliError(RuntimeError):
+    """Raised for thumbnail command failures that should become CLI exit code 1."""
+
+
+def _build_thumbs_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lenslet thumbs",
+        description="Manage the workspace thumbnail cache",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser(
+        "build",
+        help="Pre-generate thumbnails into the workspace thumbnail cache",
+        description=(
+            "Pre-generate thumbnails for every item into the workspace thumbnail cache. "
+            "Thumbnails already cached are skipped, so an interrupted build can be rerun to resume. "
+            "Use the same --thumb-size/--thumb-quality/--thumb-cache-layout as the server."
+        ),
+        epilog="Example: lenslet thumbs build ~/Pictures --io-concurrency 8",
+    )
+    build.add_argument(
+        "target",
+        type=str,
+        help="Directory containing images or a local Parquet table",
+    )
+    build.add_argument(
+        "--thumb-size",
+        type=int,
+        default=256,
+        help="Thumbnail short edge size in pixels (default: 256)",
+    )
+    build.add_argument(
+        "--thumb-quality",
+        type=int,
+        default=70,
+        help="Thumbnail WEBP quality 1-100 (default: 70)",
+    )
+    build.add_argument(
+        "--thumb-cache-layout",
+        choices=("directory", "packed"),
+        default="directory",
+        help="On-disk thumbnail cache layout (default: directory)",
+    )
+    build.add_argument(
+        "--thumb-cache-mb",
+        type=int,
+        default=200,
+        help=(
+            "Thumbnail disk cache cap in MiB; use the server's value, or 0 for no cap "
+            "(default: 200)"
+        ),
+    )
+    build.add_argument(
+        "--source-column",
+        type=str,
+        default=None,
+        help="Column to load images from in table mode",
+    )
+    build.add_argument(
+        "--path-column",
+        type=str,
+        default=None,
+        help="Column to use as Lenslet logical paths in table mode",
+    )
+    build.add_argument(
+        "--base-dir",
+        type=str,
+        default=None,
+        help="Base directory for resolving relative paths in table mode",
+    )
+    build.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Decode worker processes (default: one per core, capped)",
+    )
+    build.add_argument(
+        "--io-concurrency",
+        type=int,
+        default=None,
+        help="Maximum concurrent source reads; lower this for network sources (default: 2 per worker)",
+    )
+    return parser
+
+
+def _open_build_target_or_exit(args: argparse.Namespace) -> tuple[Any, Workspace]:
+    try:
+        target_info = _resolve_browse_target_or_exit(args.target)
+    except BrowseCliError as exc:
+        raise ThumbsCliError(str(exc)) from exc
+    if target_info.is_remote_table or target_info.target is None:
+        raise ThumbsCliError("thumbs build needs a local directory or .parquet file with a writable workspace")
+    target = target_info.target
+
+    # Storage setup pulls in pyarrow and Pillow; keep them out of CLI import time.
+    from ..embeddings.config import EmbeddingConfig
+    from ..storage.table.launch import TableLaunchRequest, prepare_table_launch
+    from ..storage.table.parquet_dataset import parquet_workspace_anchor
+    from ..web.app.local import resolve_local_storage_startup, resolve_local_workspace
+    from ..web.app.options import BrowseAppOptions, EmbeddingAppOptions, LocalAppOptions
+
+    try:
+        if target_info.is_table_file:
+            workspace = Workspace.for_parquet(parquet_workspace_anchor(target), can_write=True)
+            workspace.ensure()
+            launch_result = prepare_table_launch(
+                TableLaunchRequest(
+                    parquet_path=target,
+                    base_dir=args.base_dir,
+                    source_column=args.source_column,
+                    path_column=args.path_column,
+                    cache_dimensions=False,
+                    dimension_cache_dir=workspace.dimension_cache_dir(),
+                    skip_dimension_probe=True,
+                    embedding_config=EmbeddingConfig(),
+                    auto_detect_root=True,
+                    thumb_size=args.thumb_size,
+                    thumb_quality=args.thumb_quality,
+                )
+            )
+            return launch_result.storage, workspace
+        options = LocalAppOptions(
+            browse=BrowseAppOptions(thumb_size=args.thumb_size, thumb_quality=args.thumb_quality),
+            source_column=args.source_column,
+            path_column=args.path_column,
+            skip_dimension_probe=True,
+        )
+        workspace = resolve_local_workspace(str(target), options)
+        startup = resolve_local_storage_startup(
+            str(target),
+            workspace,
+            options=options,
+            browse_options=options.browse,
+            embedding_options=EmbeddingAppOptions(),
+        )
+        return startup.storage, startup.workspace
+    except (ImportError, OSError, RuntimeError, ValueError) as exc:
+        raise ThumbsCliError(f"failed to open '{args.target}': {exc}") from exc
+
+
+def _format_report(report: Any) -> str:
+    return (
+        f"{report.processed}/{report.total} items "
+        f"({report.generated} generated, {report.skipped} cached, {report.failed} failed) "
+        f"in {report.elapsed_seconds:.1f}s, {report.generated_per_second:.1f} thumbs/s"
+    )
+
+
+def _warn_if_over_cap(item_count: int, args: argparse.Namespace) -> None:
+    from ..web.cache.thumb_build import estimate_thumbnail_cache_bytes
+
+    cap_mb = max(0, args.thumb_cache_mb)
+    estimated_mb = estimate_thumbnail_cache_bytes(item_count, args.thumb_size) / _BYTES_PER_MIB
+    if cap_mb == 0 or estimated_mb <= cap_mb:
+        return
+    print(
+        f"[lenslet] Warning: {item_count} thumbnails need about {estimated_mb:.0f} MiB, over the "
+        f"{cap_mb} MiB cache cap, so the build will evict its own output. Rerun with a larger "
+        "--thumb-cache-mb (0 for no cap) and pass the same value to the server.",
+        file=sys.stderr,
+    )
+
+
+def _run_thumbs_build(args: argparse.Namespace) -> None:
+    from ..web.app.shared import thumb_cache_from_workspace
+    from ..web.cache.thumb_build import build_thumbnails
+    from ..web.thumbs import MAX_PROCESS_THUMBNAIL_WORKERS
+
+    storage, workspace = _open_build_target_or_exit(args)
+    thumb_cache = thumb_cache_from_workspace(
+        workspace,
+        True,
+        args.thumb_cache_layout,
+        max(0, args.thumb_cache_mb) * _BYTES_PER_MIB,
+    )
+    if thumb_cache is None:
+        raise ThumbsCliError("workspace has no writable thumbnail cache directory")
+    workers = args.workers or min(MAX_PROCESS_THUMBNAIL_WORKERS, os.cpu_count() or 2)
+    print(
+        f"[lenslet] Building thumbnails into {workspace.thumb_cache_dir()} "
+        f"({workers} workers, {args.io_concurrency or workers * 2} concurrent reads)."
+    )
+    try:
+        report = build_thumbnails(
+            storage,
+            thumb_cache,
+            processes=workers,
+            read_concurrency=args.io_concurrency,
+            progress=lambda progress: print(f"[lenslet] Thumbnails: {_format_report(progress)}"),
+            planned=lambda item_count: _warn_if_over_cap(item_count, args),
+        )
+    except KeyboardInterrupt:
+        print("[lenslet] Thumbnail build interrupted; rerun the same command to resume.", file=sys.stderr)
+        raise SystemExit(130) from None
+    finally:
+        close = getattr(thumb_cache, "close", None)
+        if callable(close):
+            close()
+    print(f"[lenslet] Thumbnails done: {_format_report(report)}")
+
+
+def _main_thumbs(argv: list[str] | None = None) -> None:
+    args = _build_thumbs_parser().parse_args(argv)
+    try:
+        _run_thumbs_build(args)
+    except ThumbsCliError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        raise SystemExit(1) from exc
@@ -1 +1 @@
-import{r as n,e as nt,g as Ke,h as Ee,i as rt,z as ve,k as me,l as ot,p as st,m as at,o as ct,n as Be,q as it,j as i,s as ut,t as Ft,v as Ut,w as Ae}from"./index-ByoOgSP1.js";const Ot=["a[href]","button","input","select","textarea","[tabindex]"].join(",");function Kt(e){return e.disabled||e.ariaHidden||e.rendered===!1||e.visible===!1?!1:(e.tabIndex??0)>=0}function gt(e){const t=window.getComputedStyle(e);return Kt({disabled:"disabled"in e&&!!e.disabled,tabIndex:e.tabIndex,ariaHidden:e.getAttribute("aria-hidden")==="true",rendered:e.getClientRects().length>0,visible:t.display!=="none"&&t.visibility!=="hidden"})}function zt(e,t){return e.find(gt)??t}function _t(e,t,a){if(e.length===0)return null;const u=t==null?-1:e.indexOf(t);return u===-1?a?e[e.length-1]:e[0]:a&&u===0?e[e.length-1]:!a&&u===e.length-1?e[0]:null}function Wt(e){return e==="Escape"}function Xt(e,t){return e&&e.isConnected!==!1?e:t&&t.isConnected!==!1?t:null}function xt(e){return Array.from(e.querySelectorAll(Ot)).filter(gt)}function _e(e){try{e==null||e.focus({preventScroll:!0})}catch{e==null||e.focus()}}function Yt(e){const t=zt(xt(e),e);_e(t)}function Ht(e,t){_e(Xt(e,t))}function lt(e,t,a){if(Wt(e.key)){e.preventDefault(),e.stopPropagation(),a();return}if(e.key!=="Tab"||!t||typeof document>"u")return;const u=_t(xt(t),document.activeElement instanceof HTMLElement?document.activeElement:null,e.shiftKey);u&&(e.preventDefault(),e.stopPropagation(),_e(u))}function qt(e,t){const{enabled:a=!0,onEscape:u}=t,m=n.useRef(null);return n.useEffect(()=>{if(!a||typeof document>"u")return;m.current=document.activeElement instanceof HTMLElement?document.activeElement:null;let g=0,E=0;const x=()=>{const R=e.current;R&&Yt(R)};try{g=window.requestAnimationFrame(x)}catch{x()}const I=R=>{const L=e.current,ae=R.target;!L||!(ae instanceof Node)||L.contains(ae)||x()},w=()=>{E&&window.clearTimeout(E),E=window.setTimeout(()=>{const R=e.current,L=document.activeElement;!R||L instanceof Node&&R.contains(L)||x()},0)},v=R=>{lt(R,e.current,u)};return document.addEventListener("focusin",I),document.addEventListener("focusout",w,!0),document.addEventListener("keydown",v,!0),()=>{if(E&&window.clearTimeout(E),g)try{window.cancelAnimationFrame(g)}catch{}document.removeEventListener("focusin",I),document.removeEventListener("focusout",w,!0),document.removeEventListener("keydown",v,!0);const R=document.body instanceof HTMLElement?document.body:null;Ht(m.current,R)}},[e,a,u]),n.useCallback(g=>{a&&lt(g,e.current,u)},[e,a,u])}function Rt(e,t){return!e||!t?null:`${e}\0${t}`}function Vt(e){const t=Rt(e.aPath,e.bPath);return t!==null&&e.fittedPairKey!==t&&!e.userInteracted&&e.loadedAPath===e.aPath&&e.loadedBPath===e.bPath}const Zt=5,Gt=95;function Jt(e){return Math.min(Gt,Math.max(Zt,e))}function Qt(e,t){return!Number.isFinite(t.width)||t.width<=0?null:Jt((e-t.left)/t.width*100)}function en(e,t){try{e.setPointerCapture(t)}catch{}}function tn(e,t){try{e.releasePointerCapture(t)}catch{}}function nn({pointerId:e,target:t,listenerTarget:a,getStageRect:u,setSplitPct:m}){let g=!0;const E=v=>{const R=u();if(!R)return;const L=Qt(v,R);L!==null&&m(L)},x=()=>{g&&(g=!1,tn(t,e),a.removeEventListener("pointermove",I),a.removeEventListener("pointerup",w),a.removeEventListener("pointercancel",w),t.removeEventListener("lostpointercapture",w))},I=v=>{v.pointerId===e&&(v.preventDefault(),E(v.clientX))},w=v=>{v.pointerId===e&&x()};return en(t,e),a.addEventListener("pointermove",I),a.addEventListener("pointerup",w),a.addEventListener("pointercancel",w),t.addEventListener("lostpointercapture",w),{cleanup:x,isActive:()=>g}}function rn({getStage:e,setSplitPct:t,onUserInteraction:a}){const u=n.useRef(null);return n.useEffect(()=>()=>{var m;(m=u.current)==null||m.cleanup(),u.current=null},[]),n.useCallback(m=>{var E;e()&&(m.preventDefault(),m.stopPropagation(),a==null||a(),(E=u.current)==null||E.cleanup(),u.current=nn({pointerId:m.pointerId,target:m.currentTarget,listenerTarget:window,getStageRect:()=>{var x;return((x=e())==null?void 0:x.getBoundingClientRect())??null},setSplitPct:t}))},[e,a,t])}const on=1.2,dt={panSlack:!0},ft={base:1,scale:1,tx:0,ty:0},mt={scale:1,a:ft,b:ft};function pt(e,t){return Math.hypot(e.x-t.x,e.y-t.y)}function ht(e,t){return{x:(e.x+t.x)/2,y:(e.y+t.y)/2}}function sn(e,t){try{e.setPointerCapture(t)}catch{}}function an(e,t){try{e.releasePointerCapture(t)}catch{}}function be(e){if(!e)return null;const t=e.getBoundingClientRect();return!Number.isFinite(t.width)||!Number.isFinite(t.height)||t.width<=0||t.height<=0?null:{width:t.width,height:t.height}}function _(e){return!e||!e.naturalWidth||!e.naturalHeight?null:{width:e.naturalWidth,height:e.naturalHeight}}function cn(e={}){const{onUserInteraction:t}=e,[a,u]=n.useState(mt),[m,g]=n.useState(!1),{scale:E,a:x,b:I}=a,{base:w,tx:v,ty:R}=x,{base:L,tx:ae,ty:ge}=I,$=n.useRef(null),F=n.useRef(null),W=n.useRef(null),P=n.useRef(mt),ce=n.useRef(null),ie=n.useRef(null),ue=n.useRef(null),U=n.useRef({x:.5,y:.5}),O=n.useRef({x:.5,y:.5}),X=n.useRef(new Map),Z=n.useRef(null),s=n.useRef(null);ie.current===null&&(ie.current=nt()),ue.current===null&&(ue.current=nt());const Y=n.useCallback(()=>P.current.a,[]),H=n.useCallback(()=>P.current.b,[]),pe=n.useCallback(()=>{const o=ce.current;o&&(ce.current=null,u(o))},[]),S=n.useCallback(o=>{var h,f,C;const d=P.current,c=Ke(o.scale??((h=o.a)==null?void 0:h.scale)??((f=o.b)==null?void 0:f.scale)??d.scale),p={scale:c,a:o.a?{...o.a,scale:c}:{...d.a,scale:c},b:o.b?{...o.b,scale:c}:{...d.b,scale:c}};P.current=p,ce.current=p,(C=ie.current)==null||C.schedule(pe)},[pe]),y=n.useCallback((o,d)=>{Z.current={pointerId:o,startX:d.x,startY:d.y,startA:Y(),startB:H()},s.current=null,g(!0)},[Y,H]),b=n.useCallback(()=>{const o=Array.from(X.current.entries());if(o.length<2)return;const[d,c]=o,[p,h]=d,[f,C]=c,D=pt(h,C);!Number.isFinite(D)||D<=2||(s.current={pointerIds:[p,f],startDistance:D,startCenter:ht(h,C),startA:Y(),startB:H()},Z.current=null,g(!0))},[Y,H]),M=n.useCallback((o,d)=>{const c=X.current;if(!c.has(o))return;if(c.delete(o),an(d,o),c.size===0){Z.current=null,s.current=null,g(!1);return}if(c.size>=2){b();return}const[p,h]=c.entries().next().value;y(p,h)},[y,b]),G=n.useCallback(()=>{const o=be($.current);if(!o)return!1;U.current={x:.5,y:.5},O.current={x:.5,y:.5};const d=_(F.current),c=_(W.current);return!d||!c?!1:(S({a:Ee({container:o,image:d,center:{x:.5,y:.5},scale:P.current.scale}),b:Ee({container:o,image:c,center:{x:.5,y:.5},scale:P.current.scale})}),!0)},[S]),q=n.useCallback(()=>{const o=be($.current);if(!o)return;const d=_(F.current),c=_(W.current);S({a:d?Ee({container:o,image:d,center:U.current,scale:P.current.scale,clampOptions:dt}):void 0,b:c?Ee({container:o,image:c,center:O.current,scale:P.current.scale,clampOptions:dt}):void 0})},[S]);n.useEffect(()=>{const o=$.current;if(!o)return;const d=new ResizeObserver(()=>{var c;(c=ue.current)==null||c.schedule(q)});return d.observe(o),()=>{var c;d.disconnect(),(c=ue.current)==null||c.cancel()}},[q]);const xe=n.useCallback(()=>{const o=be($.current);if(!o){S({scale:1});return}U.current={x:.5,y:.5},O.current={x:.5,y:.5};const d=_(F.current),c=_(W.current);S({scale:1,a:d?rt(o,d):void 0,b:c?rt(o,c):void 0})},[S]);n.useEffect(()=>()=>{var o,d;(o=ie.current)==null||o.cancel(),(d=ue.current)==null||d.cancel(),ce.current=null,X.current.clear(),Z.current=null,s.current=null},[]);const Se=n.useCallback(o=>{o.preventDefault();const d=o.deltaY>0?-1:1,c=$.current,p=be(c),h=_(F.current),f=_(W.current);if(!c||!p||!h||!f)return;const C=c.getBoundingClientRect(),D=o.clientX-C.left,J=o.clientY-C.top,Q=P.current.scale,ee=Ke(Q*Math.pow(on,d));if(ee===Q)return;t==null||t();const te=ve({container:p,image:h,transform:Y(),point:{x:D,y:J},nextScale:ee}),ne=ve({container:p,image:f,transform:H(),point:{x:D,y:J},nextScale:ee});U.current=me({container:p,image:h,transform:te}),O.current=me({container:p,image:f,transform:ne}),S({a:te,b:ne})},[S,Y,H,t]),Le=n.useCallback(o=>{if((o.pointerType??"mouse")==="mouse"&&o.button!==0)return;const c=o.currentTarget;if(o.preventDefault(),X.current.set(o.pointerId,{x:o.clientX,y:o.clientY}),sn(c,o.pointerId),X.current.size>=2){b();return}y(o.pointerId,{x:o.clientX,y:o.clientY})},[y,b]),Pe=n.useCallback(o=>{const d=X.current;if(!d.has(o.pointerId))return;d.set(o.pointerId,{x:o.clientX,y:o.clientY});const c=be($.current),p=_(F.current),h=_(W.current);if(!c||!p||!h)return;const f=s.current;if(f){const te=d.get(f.pointerIds[0]),ne=d.get(f.pointerIds[1]);if(te&&ne){const K=pt(te,ne);if(K>2){const j=ht(te,ne),le=Ke(f.startA.scale*(K/f.startDistance)),re=ve({container:c,image:p,transform:f.startA,point:f.startCenter,nextScale:le}),z=ve({container:c,image:h,transform:f.startB,point:f.startCenter,nextScale:le}),V=ot(c,p,{...re,tx:re.tx+(j.x-f.startCenter.x),ty:re.ty+(j.y-f.startCenter.y)}),he=ot(c,h,{...z,tx:z.tx+(j.x-f.startCenter.x),ty:z.ty+(j.y-f.startCenter.y)});U.current=me({container:c,image:p,transform:V}),O.current=me({container:c,image:h,transform:he}),t==null||t(),S({a:V,b:he})}}return}const C=Z.current;if(!C||C.pointerId!==o.pointerId)return;const D=o.clientX-C.startX,J=o.clientY-C.startY,Q=st({container:c,image:p,transform:C.startA,dx:D,dy:J}),ee=st({container:c,image:h,transform:C.startB,dx:D,dy:J});U.current=me({container:c,image:p,transform:Q}),O.current=me({container:c,image:h,transform:ee}),t==null||t(),S({a:Q,b:ee})},[S,t]),De=n.useCallback(o=>{M(o.pointerId,o.currentTarget)},[M]),je=n.useCallback(o=>{M(o.pointerId,o.currentTarget)},[M]);return{scale:E,baseA:w,baseB:L,txA:v,tyA:R,txB:ae,tyB:ge,dragging:m,containerRef:$,imgARef:F,imgBRef:W,fitAndCenter:G,resetView:xe,handleWheel:Se,handlePointerDown:Le,handlePointerMove:Pe,handlePointerUp:De,handlePointerCancel:je}}function ze(e,t,a){return!e||!t?null:{identity:`${a}\0${e}\0${t}`,kind:a,path:e,url:t}}function yt(e,t,a){return e&&a.has(e.identity)?e:t&&a.has(t.identity)?t:null}function un(e,t){const a=new Set;for(const u of e)u&&t.has(u.identity)&&a.add(u.identity);return a}function ln(e,t,a,u){return!!((e||a)&&(t||u))}function ke({resource:e,onDecoded:t,onError:a}){return e?i.jsx("img",{src:e.url,alt:"","aria-hidden":"true",className:"compare-decode-candidate",onLoad:u=>{const m=u.currentTarget;m.decode().then(()=>{m.isConnected&&(m.currentSrc||m.src)===e.url&&t(e)},()=>a==null?void 0:a(e))},onError:()=>a==null?void 0:a(e)},e.identity):null}function we(e,t,a){const[u,m]=n.useState(null);return n.useLayoutEffect(()=>{m(ze(e,t,a))},[a,t]),(u==null?void 0:u.path)===e?u:null}function bt(e,t){const[a,u]=n.useState(null);return n.useLayoutEffect(()=>{u(e&&t?{path:e,error:t}:null)},[t]),(a==null?void 0:a.path)===e?a.error:null}function pn({aItem:e,bItem:t,proxyHttpOriginals:a=!1,index:u,total:m,canPrev:g,canNext:E,onNavigate:x,onClose:I}){var Je,Qe;const w=n.useRef(null),[v,R]=n.useState(50),[L,ae]=n.useState(null),[ge,$]=n.useState(null),[F,W]=n.useState(null),[P,ce]=n.useState(null),[ie,ue]=n.useState(()=>new Set),U=n.useRef(null),O=n.useRef(null),[X,Z]=n.useState(()=>new Set),[s,Y]=n.useState(null),H=n.useRef(null),pe=n.useRef(null),S=n.useRef(new Set),y=(e==null?void 0:e.path)??null,b=(t==null?void 0:t.path)??null,M=Rt(y,b),G=(s==null?void 0:s.pairKey)??null,q=n.useCallback(()=>{O.current=G??M},[M,G]),{scale:xe,baseA:Se,baseB:Le,txA:Pe,tyA:De,txB:je,tyB:o,dragging:d,containerRef:c,imgARef:p,imgBRef:h,fitAndCenter:f,resetView:C,handleWheel:D,handlePointerDown:J,handlePointerMove:Q,handlePointerUp:ee,handlePointerCancel:te}=cn({onUserInteraction:q}),ne=qt(w,{onEscape:I});n.useLayoutEffect(()=>{C(),ae(null),$(null),W(null),ce(null),U.current=null,O.current=null},[y,b,C]),n.useEffect(()=>{const r=l=>{if(!Ft(l,w.current))return;const k=Ut(l);if(k===1&&E){l.preventDefault(),x(k);return}k===-1&&g&&(l.preventDefault(),x(k))};return window.addEventListener("keydown",r),()=>window.removeEventListener("keydown",r)},[x,g,E]);const K=at(e,a,ie),j=at(t,a,ie),le=K?null:ct(e),re=j?null:ct(t),z=Be(y&&!K&&!le?()=>Ae.getFile(y):null,[y,K,le],{source:"proxy",unsupportedReason:le}),V=Be(b&&!j&&!re?()=>Ae.getFile(b):null,[b,j,re],{source:"proxy",unsupportedReason:re}),he=Be(y?()=>Ae.getThumb(y):null,[y],{source:"thumbnail"}),We=Be(b?()=>Ae.getThumb(b):null,[b],{source:"thumbnail"}),Ct=z.status==="ready"?z.url:null,Et=V.status==="ready"?V.url:null,vt=he.status==="ready"?he.url:null,Bt=We.status==="ready"?We.url:null,At=we(y,Ct,"full"),kt=we(b,Et,"full"),wt=we(y,vt,"thumbnail"),St=we(b,Bt,"thumbnail"),Lt=bt(y,z.status==="error"?z.error:null),Pt=bt(b,V.status==="error"?V.error:null),Dt=z.status==="error"?z.retry:null,jt=V.status==="error"?V.retry:null,Ne=le,Te=re,B=K?ze(y,K,"full"):At,A=j?ze(b,j,"full"):kt,de=wt,fe=St;n.useLayoutEffect(()=>{S.current=new Set([B,de,A,fe].flatMap(r=>r?[r.identity]:[])),Z(r=>{const l=un([B,de,A,fe],r);return l.size===r.size&&[...l].every(k=>r.has(k))?r:l})},[B==null?void 0:B.identity,de==null?void 0:de.identity,A==null?void 0:A.identity,fe==null?void 0:fe.identity]);const Me=F&&F.resourceIdentity===(B==null?void 0:B.identity)?F.error:Lt,Ie=P&&P.resourceIdentity===(A==null?void 0:A.identity)?P.error:Pt,$e=yt(B,de,X),Fe=yt(A,fe,X),Xe=ln($e,Fe,!!(Me||Ne),!!(Ie||Te)),Re=n.useCallback(r=>{S.current.has(r.identity)&&Z(l=>{if(l.has(r.identity))return l;const k=new Set(l);return k.add(r.identity),k})},[]),Ce=n.useCallback((r,l)=>{!r||!l||ue(k=>{if(k.has(r))return k;const ye=new Set(k);return ye.add(r),ye})},[]);n.useLayoutEffect(()=>{H.current=(B==null?void 0:B.identity)??null,pe.current=(A==null?void 0:A.identity)??null},[B==null?void 0:B.identity,A==null?void 0:A.identity]);const Ye=n.useCallback(r=>{if(H.current===r.identity){if(K===r.url){Ce(r.path,r.url);return}W({resourceIdentity:r.identity,error:it()})}},[K,Ce]),He=n.useCallback(r=>{if(pe.current===r.identity){if(j===r.url){Ce(r.path,r.url);return}ce({resourceIdentity:r.identity,error:it()})}},[j,Ce]);n.useLayoutEffect(()=>{if(!e||!t||!M){Y(null);return}if(!Xe)return;const r={pairKey:M,aItem:e,bItem:t,aResource:$e,bResource:Fe,aLoadError:Me,bLoadError:Ie,aUnsupported:Ne,bUnsupported:Te,index:u,total:m};Y(l=>{var k,ye,et,tt;return(l==null?void 0:l.pairKey)===r.pairKey&&((k=l.aResource)==null?void 0:k.identity)===((ye=r.aResource)==null?void 0:ye.identity)&&((et=l.bResource)==null?void 0:et.identity)===((tt=r.bResource)==null?void 0:tt.identity)&&l.aLoadError===r.aLoadError&&l.bLoadError===r.bLoadError&&l.aUnsupported===r.aUnsupported&&l.bUnsupported===r.bUnsupported&&l.index===r.index&&l.total===r.total?l:r})},[$e,e,Me,Ne,Fe,t,Ie,Te,u,M,Xe,m]);const oe=(s==null?void 0:s.aItem.path)??null,se=(s==null?void 0:s.bItem.path)??null,N=(s==null?void 0:s.aResource)??null,T=(s==null?void 0:s.bResource)??null,qe=(s==null?void 0:s.aItem.name)??oe??"Select an image",Ve=(s==null?void 0:s.bItem.name)??se??"Select another image",Ze=oe===y&&((Je=s==null?void 0:s.aLoadError)!=null&&Je.retryable)?Dt:null,Ge=se===b&&((Qe=s==null?void 0:s.bLoadError)!=null&&Qe.retryable)?jt:null,Ue=n.useCallback(()=>{const r=p.current;!oe||!N||!r||(r.currentSrc||r.src)!==N.url||ae(oe)},[p,oe,N]),Oe=n.useCallback(()=>{const r=h.current;!se||!T||!r||(r.currentSrc||r.src)!==T.url||$(se)},[h,se,T]);n.useEffect(()=>{Vt({aPath:oe,bPath:se,loadedAPath:L,loadedBPath:ge,fittedPairKey:U.current,userInteracted:O.current===G})&&f()&&(U.current=G)},[f,L,ge,oe,se,G]),n.useEffect(()=>{const r=p.current;r!=null&&r.complete&&r.naturalWidth>0&&Ue()},[Ue,N]),n.useEffect(()=>{const r=h.current;r!=null&&r.complete&&r.naturalWidth>0&&Oe()},[Oe,T]);const Nt=n.useCallback(r=>{const l=r.target;l!=null&&l.closest(".compare-label")||l!=null&&l.closest(".compare-divider-hit")||l!=null&&l.closest(".media-error-overlay")||J(r)},[J]),Tt=n.useCallback(r=>{q(),D(r)},[D,q]),Mt=n.useCallback(r=>{r.buttons!==0&&q(),Q(r)},[Q,q]),It=n.useCallback(()=>c.current,[c]),$t=rn({getStage:It,setSplitPct:R,onUserInteraction:q});return i.jsxs("div",{ref:w,role:"dialog","aria-modal":!0,"aria-label":"Compare images","data-compare-a-path":oe??void 0,"data-compare-b-path":se??void 0,"data-compare-target-a-path":y??void 0,"data-compare-target-b-path":b??void 0,"data-compare-target-pair":M,"data-compare-presented-pair":G??"",tabIndex:-1,className:"toolbar-offset absolute inset-0 left-[var(--overlay-left)] right-[var(--overlay-right)] bg-panel z-viewer flex flex-col overflow-hidden",onKeyDown:ne,children:[i.jsxs("div",{className:"compare-header flex items-center gap-3 px-3 py-2",children:[i.jsx("div",{className:"text-[11px] uppercase tracking-wide text-muted",children:"Compare"}),i.jsx("div",{className:"text-xs text-muted",children:s&&s.total>=2?`${s.index+1}-${Math.min(s.index+2,s.total)} of ${s.total}`:"Select 2 images"}),i.jsxs("div",{className:"ml-auto flex items-center gap-2",children:[i.jsxs("button",{className:"btn btn-sm",onClick:()=>x(-1),disabled:!g,title:"Previous (Left Arrow or A)",children:[i.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:i.jsx("path",{d:"M15 18l-6-6 6-6"})}),"Prev"]}),i.jsxs("button",{className:"btn btn-sm",onClick:()=>x(1),disabled:!E,title:"Next (Right Arrow or D)",children:["Next",i.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:i.jsx("path",{d:"M9 18l6-6-6-6"})})]}),i.jsxs("button",{className:"btn btn-sm",onClick:I,title:"Close (Esc)",children:[i.jsxs("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[i.jsx("path",{d:"M18 6 6 18"}),i.jsx("path",{d:"M6 6l12 12"})]}),"Close"]})]})]}),i.jsx("div",{className:"flex-1 min-h-0 p-3 bg-panel",children:i.jsxs("div",{ref:c,className:`compare-stage ${d?"is-dragging":""}`,onWheel:Tt,onPointerDown:Nt,onPointerMove:Mt,onPointerUp:ee,onPointerCancel:te,children:[!e||!t?i.jsx("div",{className:"absolute inset-0 flex items-center justify-center text-sm text-muted",children:"Select 2 images to compare."}):s?i.jsxs(i.Fragment,{children:[i.jsxs("div",{className:"compare-label left-3",children:[i.jsx("span",{className:"compare-label-tag",children:"A"}),i.jsx("span",{className:"truncate",title:s.aItem.path,children:qe})]}),i.jsxs("div",{className:"compare-label right-3",children:[i.jsx("span",{className:"compare-label-tag",children:"B"}),i.jsx("span",{className:"truncate",title:s.bItem.path,children:Ve})]}),i.jsxs("div",{className:"compare-layer",style:{clipPath:`inset(0 ${100-v}% 0 0)`},children:[(s.aLoadError||s.aUnsupported)&&i.jsxs("div",{className:"media-error-overlay media-error-overlay-compare",children:[i.jsx("div",{className:"media-error-title",children:s.aUnsupported?"Original unsupported":"Image A failed"}),i.jsx("div",{className:"media-error-message",children:s.aUnsupported??(s.aLoadError?ut(s.aLoadError):"")}),Ze&&i.jsx("button",{type:"button",className:"btn btn-xs",onClick:Ze,children:"Retry"})]}),N&&!s.aLoadError&&!s.aUnsupported&&i.jsx("img",{ref:p,src:N.url,alt:`Compare image A: ${qe}`,"data-compare-image":"a","data-current-path":N.path,"data-resource-kind":N.kind,className:`compare-image${N.kind==="thumbnail"?" compare-image-thumb":""}`,draggable:!1,onDragStart:r=>r.preventDefault(),onLoad:Ue,onError:N.kind==="full"?()=>Ye(N):void 0,style:{transform:`translate(${Pe}px, ${De}px) scale(${Se*xe})`,transformOrigin:"0 0",opacity:N.kind==="full"?.99:.5}})]}),i.jsxs("div",{className:"compare-layer",style:{clipPath:`inset(0 0 0 ${v}%)`},children:[(s.bLoadError||s.bUnsupported)&&i.jsxs("div",{className:"media-error-overlay media-error-overlay-compare",children:[i.jsx("div",{className:"media-error-title",children:s.bUnsupported?"Original unsupported":"Image B failed"}),i.jsx("div",{className:"media-error-message",children:s.bUnsupported??(s.bLoadError?ut(s.bLoadError):"")}),Ge&&i.jsx("button",{type:"button",className:"btn btn-xs",onClick:Ge,children:"Retry"})]}),T&&!s.bLoadError&&!s.bUnsupported&&i.jsx("img",{ref:h,src:T.url,alt:`Compare image B: ${Ve}`,"data-compare-image":"b","data-current-path":T.path,"data-resource-kind":T.kind,className:`compare-image${T.kind==="thumbnail"?" compare-image-thumb":""}`,draggable:!1,onDragStart:r=>r.preventDefault(),onLoad:Oe,onError:T.kind==="full"?()=>He(T):void 0,style:{transform:`translate(${je}px, ${o}px) scale(${Le*xe})`,transformOrigin:"0 0",opacity:T.kind==="full"?.99:.5}})]}),i.jsxs("div",{className:"compare-divider-hit",style:{left:`${v}%`},onPointerDown:$t,children:[i.jsx("div",{className:"compare-divider-line"}),i.jsx("div",{className:"compare-divider-handle"})]})]}):null,i.jsx(ke,{resource:B,onDecoded:Re,onError:Ye}),i.jsx(ke,{resource:de,onDecoded:Re}),i.jsx(ke,{resource:A,onDecoded:Re,onError:He}),i.jsx(ke,{resource:fe,onDecoded:Re})]})})]})}export{pn as default};
+import{r as n,e as nt,g as Ke,h as Ee,i as rt,z as ve,k as me,l as ot,p as st,m as at,o as ct,n as Be,q as it,j as i,s as ut,t as Ft,v as Ut,w as Ae}from"./index-ByoOgSP1.js";const Ot=["a[href]","button","input","select","textarea","[tabindex]"].join(",");function Kt(e){return e.disabled||e.ariaHidden||e.rendered===!1||e.visible===!1?!1:(e.tabIndex??0)>=0}function gt(e){const t=window.getComputedStyle(e);return Kt({disabled:"disabled"in e&&!!e.disabled,tabIndex:e.tabIndex,ariaHidden:e.getAttribute("aria-hidden")==="true",rendered:e.getClientRects().length>0,visible:t.display!=="none"&&t.visibility!=="hidden"})}function zt(e,t){return e.find(gt)??t}function _t(e,t,a){if(e.length===0)return null;const u=t==null?-1:e.indexOf(t);return u===-1?a?e[e.length-1]:e[0]:a&&u===0?e[e.length-1]:!a&&u===e.length-1?e[0]:null}function Wt(e){return e==="Escape"}function Xt(e,t){return e&&e.isConnected!==!1?e:t&&t.isConnected!==!1?t:null}function xt(e){return Array.from(e.querySelectorAll(Ot)).filter(gt)}function _e(e){try{e==null||e.focus({preventScroll:!0})}catch{e==null||e.focus()}}function Yt(e){const t=zt(xt(e),e);_e(t)}function Ht(e,t){_e(Xt(e,t))}function lt(e,t,a){if(Wt(e.key)){e.preventDefault(),e.stopPropagation(),a();return}if(e.key!=="Tab"||!t||typeof document>"u")return;const u=_t(xt(t),document.activeElement instanceof HTMLElement?document.activeElement:null,e.shiftKey);u&&(e.preventDefault(),e.stopPropagation(),_e(u))}function qt(e,t){const{enabled:a=!0,onEscape:u}=t,m=n.useRef(null);return n.useEffect(()=>{if(!a||typeof document>"u")return;m.current=document.activeElement instanceof HTMLElement?document.activeElement:null;let g=0,E=0;const x=()=>{const R=e.current;R&&Yt(R)};try{g=window.requestAnimationFrame(x)}catch{x()}const I=R=>{const L=e.current,ae=R.target;!L||!(ae instanceof Node)||L.contains(ae)||x()},w=()=>{E&&window.clearTimeout(E),E=window.setTimeout(()=>{const R=e.current,L=document.activeElement;!R||L instanceof Node&&R.contains(L)||x()},0)},v=R=>{lt(R,e.current,u)};return document.addEventListener("focusin",I),document.addEventListener("focusout",w,!0),document.addEventListener("keydown",v,!0),()=>{if(E&&window.clearTimeout(E),g)try{window.cancelAnimationFrame(g)}catch{}document.removeEventListener("focusin",I),document.removeEventListener("focusout",w,!0),document.removeEventListener("keydown",v,!0);const R=document.body instanceof HTMLElement?document.body:null;Ht(m.current,R)}},[e,a,u]),n.useCallback(g=>{a&&lt(g,e.current,u)},[e,a,u])}function Rt(e,t){return!e||!t?null:`${e}\0${t}`}function Vt(e){const t=Rt(e.aPath,e.bPath);return t!==null&&e.fittedPairKey!==t&&!e.userInteracted&&e.loadedAPath===e.aPath&&e.loadedBPath===e.bPath}const Zt=5,Gt=95;function Jt(e){return Math.min(Gt,Math.max(Zt,e))}function Qt(e,t){return!Number.isFinite(t.width)||t.width<=0?null:Jt((e-t.left)/t.width*100)}function en(e,t){try{e.setPointerCapture(t)}catch{}}function tn(e,t){try{e.releasePointerCapture(t)}catch{}}function nn({pointerId:e,target:t,listenerTarget:a,getStageRect:u,setSplitPct:m}){let g=!0;const E=v=>{const R=u();if(!R)return;const L=Qt(v,R);L!==null&&m(L)},x=()=>{g&&(g=!1,tn(t,e),a.removeEventListener("pointermove",I),a.removeEventListener("pointerup",w),a.removeEventListener("pointercancel",w),t.removeEventListener("lostpointercapture",w))},I=v=>{v.pointerId===e&&(v.preventDefault(),E(v.clientX))},w=v=>{v.pointerId===e&&x()};return en(t,e),a.addEventListener("pointermove",I),a.addEventListener("pointerup",w),a.addEventListener("pointercancel",w),t.addEventListener("lostpointercapture",w),{cleanup:x,isActive:()=>g}}function rn({getStage:e,setSplitPct:t,onUserInteraction:a}){const u=n.useRef(null);return n.useEffect(()=>()=>{var m;(m=u.current)==null||m.cleanup(),u.current=null},[]),n.useCallback(m=>{var E;e()&&(m.preventDefault(),m.stopPropagation(),a==null||a(),(E=u.current)==null||E.cleanup(),u.current=nn({pointerId:m.pointerId,target:m.currentTarget,listenerTarget:window,getStageRect:()=>{var x;return((x=e())==null?void 0:x.getBoundingClientRect())??null},setSplitPct:t}))},[e,a,t])}const on=1.2,dt={panSlack:!0},ft={base:1,scale:1,tx:0,ty:0},mt={scale:1,a:ft,b:ft};function pt(e,t){return Math.hypot(e.x-t.x,e.y-t.y)}function ht(e,t){return{x:(e.x+t.x)/2,y:(e.y+t.y)/2}}function sn(e,t){try{e.setPointerCapture(t)}catch{}}function an(e,t){try{e.releasePointerCapture(t)}catch{}}function be(e){if(!e)return null;const t=e.getBoundingClientRect();return!Number.isFinite(t.width)||!Number.isFinite(t.height)||t.width<=0||t.height<=0?null:{width:t.width,height:t.height}}function _(e){return!e||!e.naturalWidth||!e.naturalHeight?null:{width:e.naturalWidth,height:e.naturalHeight}}function cn(e={}){const{onUserInteraction:t}=e,[a,u]=n.useState(mt),[m,g]=n.useState(!1),{scale:E,a:x,b:I}=a,{base:w,tx:v,ty:R}=x,{base:L,tx:ae,ty:ge}=I,$=n.useRef(null),F=n.useRef(null),W=n.useRef(null),P=n.useRef(mt),ce=n.useRef(null),ie=n.useRef(null),ue=n.useRef(null),U=n.useRef({x:.5,y:.5}),O=n.useRef({x:.5,y:.5}),X=n.useRef(new Map),Z=n.useRef(null),s=n.useRef(null);ie.current===null&&(ie.current=nt()),ue.current===null&&(ue.current=nt());const Y=n.useCallback(()=>P.current.a,[]),H=n.useCallback(()=>P.current.b,[]),pe=n.useCallback(()=>{const o=ce.current;o&&(ce.current=null,u(o))},[]),S=n.useCallback(o=>{var h,f,C;const d=P.current,c=Ke(o.scale??((h=o.a)==null?void 0:h.scale)??((f=o.b)==null?void 0:f.scale)??d.scale),p={scale:c,a:o.a?{...o.a,scale:c}:{...d.a,scale:c},b:o.b?{...o.b,scale:c}:{...d.b,scale:c}};P.current=p,ce.current=p,(C=ie.current)==null||C.schedule(pe)},[pe]),y=n.useCallback((o,d)=>{Z.current={pointerId:o,startX:d.x,startY:d.y,startA:Y(),startB:H()},s.current=null,g(!0)},[Y,H]),b=n.useCallback(()=>{const o=Array.from(X.current.entries());if(o.length<2)return;const[d,c]=o,[p,h]=d,[f,C]=c,D=pt(h,C);!Number.isFinite(D)||D<=2||(s.current={pointerIds:[p,f],startDistance:D,startCenter:ht(h,C),startA:Y(),startB:H()},Z.current=null,g(!0))},[Y,H]),M=n.useCallback((o,d)=>{const c=X.current;if(!c.has(o))return;if(c.delete(o),an(d,o),c.size===0){Z.current=null,s.current=null,g(!1);return}if(c.size>=2){b();return}const[p,h]=c.entries().next().value;y(p,h)},[y,b]),G=n.useCallback(()=>{const o=be($.current);if(!o)return!1;U.current={x:.5,y:.5},O.current={x:.5,y:.5};const d=_(F.current),c=_(W.current);return!d||!c?!1:(S({a:Ee({container:o,image:d,center:{x:.5,y:.5},scale:P.current.scale}),b:Ee({container:o,image:c,center:{x:.5,y:.5},scale:P.current.scale})}),!0)},[S]),q=n.useCallback(()=>{const o=be($.current);if(!o)return;const d=_(F.current),c=_(W.current);S({a:d?Ee({container:o,image:d,center:U.current,scale:P.current.scale,clampOptions:dt}):void 0,b:c?Ee({container:o,image:c,center:O.current,scale:P.current.scale,clampOptions:dt}):void 0})},[S]);n.useEffect(()=>{const o=$.current;if(!o)return;const d=new ResizeObserver(()=>{var c;(c=ue.current)==null||c.schedule(q)});return d.observe(o),()=>{var c;d.disconnect(),(c=ue.current)==null||c.cancel()}},[q]);const xe=n.useCallback(()=>{const o=be($.current);if(!o){S({scale:1});return}U.current={x:.5,y:.5},O.current={x:.5,y:.5};const d=_(F.current),c=_(W.current);S({scale:1,a:d?rt(o,d):void 0,b:c?rt(o,c):void 0})},[S]);n.useEffect(()=>()=>{var o,d;(o=ie.current)==null||o.cancel(),(d=ue.current)==null||d.cancel(),ce.current=null,X.current.clear(),Z.current=null,s.current=null},[]);const Se=n.useCallback(o=>{o.preventDefault();const d=o.deltaY>0?-1:1,c=$.current,p=be(c),h=_(F.current),f=_(W.current);if(!c||!p||!h||!f)return;const C=c.getBoundingClientRect(),D=o.clientX-C.left,J=o.clientY-C.top,Q=P.current.scale,ee=Ke(Q*Math.pow(on,d));if(ee===Q)return;t==null||t();const te=ve({container:p,image:h,transform:Y(),point:{x:D,y:J},nextScale:ee}),ne=ve({container:p,image:f,transform:H(),point:{x:D,y:J},nextScale:ee});U.current=me({container:p,image:h,transform:te}),O.current=me({container:p,image:f,transform:ne}),S({a:te,b:ne})},[S,Y,H,t]),Le=n.useCallback(o=>{if((o.pointerType??"mouse")==="mouse"&&o.button!==0)return;const c=o.currentTarget;if(o.preventDefault(),X.current.set(o.pointerId,{x:o.clientX,y:o.clientY}),sn(c,o.pointerId),X.current.size>=2){b();return}y(o.pointerId,{x:o.clientX,y:o.clientY})},[y,b]),Pe=n.useCallback(o=>{const d=X.current;if(!d.has(o.pointerId))return;d.set(o.pointerId,{x:o.clientX,y:o.clientY});const c=be($.current),p=_(F.current),h=_(W.current);if(!c||!p||!h)return;const f=s.current;if(f){const te=d.get(f.pointerIds[0]),ne=d.get(f.pointerIds[1]);if(te&&ne){const K=pt(te,ne);if(K>2){const j=ht(te,ne),le=Ke(f.startA.scale*(K/f.startDistance)),re=ve({container:c,image:p,transform:f.startA,point:f.startCenter,nextScale:le}),z=ve({container:c,image:h,transform:f.startB,point:f.startCenter,nextScale:le}),V=ot(c,p,{...re,tx:re.tx+(j.x-f.startCenter.x),ty:re.ty+(j.y-f.startCenter.y)}),he=ot(c,h,{...z,tx:z.tx+(j.x-f.startCenter.x),ty:z.ty+(j.y-f.startCenter.y)});U.current=me({container:c,image:p,transform:V}),O.current=me({container:c,image:h,transform:he}),t==null||t(),S({a:V,b:he})}}return}const C=Z.current;if(!C||C.pointerId!==o.pointerId)return;const D=o.clientX-C.startX,J=o.clientY-C.startY,Q=st({container:c,image:p,transform:C.startA,dx:D,dy:J}),ee=st({container:c,image:h,transform:C.startB,dx:D,dy:J});U.current=me({container:c,image:p,transform:Q}),O.current=me({container:c,image:h,transform:ee}),t==null||t(),S({a:Q,b:ee})},[S,t]),De=n.useCallback(o=>{M(o.pointerId,o.currentTarget)},[M]),je=n.useCallback(o=>{M(o.pointerId,o.currentTarget)},[M]);return{scale:E,baseA:w,baseB:L,txA:v,tyA:R,txB:ae,tyB:ge,dragging:m,containerRef:$,imgARef:F,imgBRef:W,fitAndCenter:G,resetView:xe,handleWheel:Se,handlePointerDown:Le,handlePointerMove:Pe,handlePointerUp:De,handlePointerCancel:je}}function ze(e,t,a){return!e||!t?null:{identity:`${a}\0${e}\0${t}`,kind:a,path:e,url:t}}function yt(e,t,a){return e&&a.has(e.identity)?e:t&&a.has(t.identity)?t:null}function un(e,t){const a=new Set;for(const u of e)u&&t.has(u.identity)&&a.add(u.identity);return a}function ln(e,t,a,u){return!!((e||a)&&(t||u))}function ke({resource:e,onDecoded:t,onError:a}){return e?i.jsx("img",{src:e.url,alt:"","aria-hidden":"true",className:"compare-decode-candidate",onLoad:u=>{const m=u.currentTarget;m.decode().then(()=>{m.isConnected&&(m.currentSrc||m.src)===e.url&&t(e)},()=>a==null?void 0:a(e))},onError:()=>a==null?void 0:a(e)},e.identity):null}function we(e,t,a){const[u,m]=n.useState(null);return n.useLayoutEffect(()=>{m(ze(e,t,a))},[a,t]),(u==null?void 0:u.path)===e?u:null}function bt(e,t){const[a,u]=n.useState(null);return n.useLayoutEffect(()=>{u(e&&t?{path:e,error:t}:null)},[t]),(a==null?void 0:a.path)===e?a.error:null}function pn({aItem:e,bItem:t,proxyHttpOriginals:a=!1,index:u,total:m,canPrev:g,canNext:E,onNavigate:x,onClose:I}){var Je,Qe;const w=n.useRef(null),[v,R]=n.useState(50),[L,ae]=n.useState(null),[ge,$]=n.useState(null),[F,W]=n.useState(null),[P,ce]=n.useState(null),[ie,ue]=n.useState(()=>new Set),U=n.useRef(null),O=n.useRef(null),[X,Z]=n.useState(()=>new Set),[s,Y]=n.useState(null),H=n.useRef(null),pe=n.useRef(null),S=n.useRef(new Set),y=(e==null?void 0:e.path)??null,b=(t==null?void 0:t.path)??null,M=Rt(y,b),G=(s==null?void 0:s.pairKey)??null,q=n.useCallback(()=>{O.current=G??M},[M,G]),{scale:xe,baseA:Se,baseB:Le,txA:Pe,tyA:De,txB:je,tyB:o,dragging:d,containerRef:c,imgARef:p,imgBRef:h,fitAndCenter:f,resetView:C,handleWheel:D,handlePointerDown:J,handlePointerMove:Q,handlePointerUp:ee,handlePointerCancel:te}=cn({onUserInteraction:q}),ne=qt(w,{onEscape:I});n.useLayoutEffect(()=>{C(),ae(null),$(null),W(null),ce(null),U.current=null,O.current=null},[y,b,C]),n.useEffect(()=>{const r=l=>{if(!Ft(l,w.current))return;const k=Ut(l);if(k===1&&E){l.preventDefault(),x(k);return}k===-1&&g&&(l.preventDefault(),x(k))};return window.addEventListener("keydown",r),()=>window.removeEventListener("keydown",r)},[x,g,E]);const K=at(e,a,ie),j=at(t,a,ie),le=K?null:ct(e),re=j?null:ct(t),z=Be(y&&!K&&!le?()=>Ae.getPreview(y,"compare"):null,[y,K,le],{source:"proxy",unsupportedReason:le}),V=Be(b&&!j&&!re?()=>Ae.getPreview(b,"compare"):null,[b,j,re],{source:"proxy",unsupportedReason:re}),he=Be(y?()=>Ae.getThumb(y):null,[y],{source:"thumbnail"}),We=Be(b?()=>Ae.getThumb(b):null,[b],{source:"thumbnail"}),Ct=z.status==="ready"?z.url:null,Et=V.status==="ready"?V.url:null,vt=he.status==="ready"?he.url:null,Bt=We.status==="ready"?We.url:null,At=we(y,Ct,"full"),kt=we(b,Et,"full"),wt=we(y,vt,"thumbnail"),St=we(b,Bt,"thumbnail"),Lt=bt(y,z.status==="error"?z.error:null),Pt=bt(b,V.status==="error"?V.error:null),Dt=z.status==="error"?z.retry:null,jt=V.status==="error"?V.retry:null,Ne=le,Te=re,B=K?ze(y,K,"full"):At,A=j?ze(b,j,"full"):kt,de=wt,fe=St;n.useLayoutEffect(()=>{S.current=new Set([B,de,A,fe].flatMap(r=>r?[r.identity]:[])),Z(r=>{const l=un([B,de,A,fe],r);return l.size===r.size&&[...l].every(k=>r.has(k))?r:l})},[B==null?void 0:B.identity,de==null?void 0:de.identity,A==null?void 0:A.identity,fe==null?void 0:fe.identity]);const Me=F&&F.resourceIdentity===(B==null?void 0:B.identity)?F.error:Lt,Ie=P&&P.resourceIdentity===(A==null?void 0:A.identity)?P.error:Pt,$e=yt(B,de,X),Fe=yt(A,fe,X),Xe=ln($e,Fe,!!(Me||Ne),!!(Ie||Te)),Re=n.useCallback(r=>{S.current.has(r.identity)&&Z(l=>{if(l.has(r.identity))return l;const k=new Set(l);return k.add(r.identity),k})},[]),Ce=n.useCallback((r,l)=>{!r||!l||ue(k=>{if(k.has(r))return k;const ye=new Set(k);return ye.add(r),ye})},[]);n.useLayoutEffect(()=>{H.current=(B==null?void 0:B.identity)??null,pe.current=(A==null?void 0:A.identity)??null},[B==null?void 0:B.identity,A==null?void 0:A.identity]);const Ye=n.useCallback(r=>{if(H.current===r.identity){if(K===r.url){Ce(r.path,r.url);return}W({resourceIdentity:r.identity,error:it()})}},[K,Ce]),He=n.useCallback(r=>{if(pe.current===r.identity){if(j===r.url){Ce(r.path,r.url);return}ce({resourceIdentity:r.identity,error:it()})}},[j,Ce]);n.useLayoutEffect(()=>{if(!e||!t||!M){Y(null);return}if(!Xe)return;const r={pairKey:M,aItem:e,bItem:t,aResource:$e,bResource:Fe,aLoadError:Me,bLoadError:Ie,aUnsupported:Ne,bUnsupported:Te,index:u,total:m};Y(l=>{var k,ye,et,tt;return(l==null?void 0:l.pairKey)===r.pairKey&&((k=l.aResource)==null?void 0:k.identity)===((ye=r.aResource)==null?void 0:ye.identity)&&((et=l.bResource)==null?void 0:et.identity)===((tt=r.bResource)==null?void 0:tt.identity)&&l.aLoadError===r.aLoadError&&l.bLoadError===r.bLoadError&&l.aUnsupported===r.aUnsupported&&l.bUnsupported===r.bUnsupported&&l.index===r.index&&l.total===r.total?l:r})},[$e,e,Me,Ne,Fe,t,Ie,Te,u,M,Xe,m]);const oe=(s==null?void 0:s.aItem.path)??null,se=(s==null?void 0:s.bItem.path)??null,N=(s==null?void 0:s.aResource)??null,T=(s==null?void 0:s.bResource)??null,qe=(s==null?void 0:s.aItem.name)??oe??"Select an image",Ve=(s==null?void 0:s.bItem.name)??se??"Select another image",Ze=oe===y&&((Je=s==null?void 0:s.aLoadError)!=null&&Je.retryable)?Dt:null,Ge=se===b&&((Qe=s==null?void 0:s.bLoadError)!=null&&Qe.retryable)?jt:null,Ue=n.useCallback(()=>{const r=p.current;!oe||!N||!r||(r.currentSrc||r.src)!==N.url||ae(oe)},[p,oe,N]),Oe=n.useCallback(()=>{const r=h.current;!se||!T||!r||(r.currentSrc||r.src)!==T.url||$(se)},[h,se,T]);n.useEffect(()=>{Vt({aPath:oe,bPath:se,loadedAPath:L,loadedBPath:ge,fittedPairKey:U.current,userInteracted:O.current===G})&&f()&&(U.current=G)},[f,L,ge,oe,se,G]),n.useEffect(()=>{const r=p.current;r!=null&&r.complete&&r.naturalWidth>0&&Ue()},[Ue,N]),n.useEffect(()=>{const r=h.current;r!=null&&r.complete&&r.naturalWidth>0&&Oe()},[Oe,T]);const Nt=n.useCallback(r=>{const l=r.target;l!=null&&l.closest(".compare-label")||l!=null&&l.closest(".compare-divider-hit")||l!=null&&l.closest(".media-error-overlay")||J(r)},[J]),Tt=n.useCallback(r=>{q(),D(r)},[D,q]),Mt=n.useCallback(r=>{r.buttons!==0&&q(),Q(r)},[Q,q]),It=n.useCallback(()=>c.current,[c]),$t=rn({getStage:It,setSplitPct:R,onUserInteraction:q});return i.jsxs("div",{ref:w,role:"dialog","aria-modal":!0,"aria-label":"Compare images","data-compare-a-path":oe??void 0,"data-compare-b-path":se??void 0,"data-compare-target-a-path":y??void 0,"data-compare-target-b-path":b??void 0,"data-compare-target-pair":M,"data-compare-presented-pair":G??"",tabIndex:-1,className:"toolbar-offset absolute inset-0 left-[var(--overlay-left)] right-[var(--overlay-right)] bg-panel z-viewer flex flex-col overflow-hidden",onKeyDown:ne,children:[i.jsxs("div",{className:"compare-header flex items-center gap-3 px-3 py-2",children:[i.jsx("div",{className:"text-[11px] uppercase tracking-wide text-muted",children:"Compare"}),i.jsx("div",{className:"text-xs text-muted",children:s&&s.total>=2?`${s.index+1}-${Math.min(s.index+2,s.total)} of ${s.total}`:"Select 2 images"}),i.jsxs("div",{className:"ml-auto flex items-center gap-2",children:[i.jsxs("button",{className:"btn btn-sm",onClick:()=>x(-1),disabled:!g,title:"Previous (Left Arrow or A)",children:[i.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:i.jsx("path",{d:"M15 18l-6-6 6-6"})}),"Prev"]}),i.jsxs("button",{className:"btn btn-sm",onClick:()=>x(1),disabled:!E,title:"Next (Right Arrow or D)",children:["Next",i.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:i.jsx("path",{d:"M9 18l6-6-6-6"})})]}),i.jsxs("button",{className:"btn btn-sm",onClick:I,title:"Close (Esc)",children:[i.jsxs("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[i.jsx("path",{d:"M18 6 6 18"}),i.jsx("path",{d:"M6 6l12 12"})]}),"Close"]})]})]}),i.jsx("div",{className:"flex-1 min-h-0 p-3 bg-panel",children:i.jsxs("div",{ref:c,className:`compare-stage ${d?"is-dragging":""}`,onWheel:Tt,onPointerDown:Nt,onPointerMove:Mt,onPointerUp:ee,onPointerCancel:te,children:[!e||!t?i.jsx("div",{className:"absolute inset-0 flex items-center justify-center text-sm text-muted",children:"Select 2 images to compare."}):s?i.jsxs(i.Fragment,{children:[i.jsxs("div",{className:"compare-label left-3",children:[i.jsx("span",{className:"compare-label-tag",children:"A"}),i.jsx("span",{className:"truncate",title:s.aItem.path,children:qe})]}),i.jsxs("div",{className:"compare-label right-3",children:[i.jsx("span",{className:"compare-label-tag",children:"B"}),i.jsx("span",{className:"truncate",title:s.bItem.path,children:Ve})]}),i.jsxs("div",{className:"compare-layer",style:{clipPath:`inset(0 ${100-v}% 0 0)`},children:[(s.aLoadError||s.aUnsupported)&&i.jsxs("div",{className:"media-error-overlay media-error-overlay-compare",children:[i.jsx("div",{className:"media-error-title",children:s.aUnsupported?"Original unsupported":"Image A failed"}),i.jsx("div",{className:"media-error-message",children:s.aUnsupported??(s.aLoadError?ut(s.aLoadError):"")}),Ze&&i.jsx("button",{type:"button",className:"btn btn-xs",onClick:Ze,children:"Retry"})]}),N&&!s.aLoadError&&!s.aUnsupported&&i.jsx("img",{ref:p,src:N.url,alt:`Compare image A: ${qe}`,"data-compare-image":"a","data-current-path":N.path,"data-resource-kind":N.kind,className:`compare-image${N.kind==="thumbnail"?" compare-image-thumb":""}`,draggable:!1,onDragStart:r=>r.preventDefault(),onLoad:Ue,onError:N.kind==="full"?()=>Ye(N):void 0,style:{transform:`translate(${Pe}px, ${De}px) scale(${Se*xe})`,transformOrigin:"0 0",opacity:N.kind==="full"?.99:.5}})]}),i.jsxs("div",{className:"compare-layer",style:{clipPath:`inset(0 0 0 ${v}%)`},children:[(s.bLoadError||s.bUnsupported)&&i.jsxs("div",{className:"media-error-overlay media-error-overlay-compare",children:[i.jsx("div",{className:"media-error-title",children:s.bUnsupported?"Original unsupported":"Image B failed"}),i.jsx("div",{className:"media-error-message",children:s.bUnsupported??(s.bLoadError?ut(s.bLoadError):"")}),Ge&&i.jsx("button",{type:"button",className:"btn btn-xs",onClick:Ge,children:"Retry"})]}),T&&!s.bLoadError&&!s.bUnsupported&&i.jsx("img",{ref:h,src:T.url,alt:`Compare image B: ${Ve}`,"data-compare-image":"b","data-current-path":T.path,"data-resource-kind":T.kind,className:`compare-image${T.kind==="thumbnail"?" compare-image-thumb":""}`,draggable:!1,onDragStart:r=>r.preventDefault(),onLoad:Oe,onError:T.kind==="full"?()=>He(T):void 0,style:{transform:`translate(${je}px, ${o}px) scale(${Le*xe})`,transformOrigin:"0 0",opacity:T.kind==="full"?.99:.5}})]}),i.jsxs("div",{className:"compare-divider-hit",style:{left:`${v}%`},onPointerDown:$t,children:[i.jsx("div",{className:"compare-divider-line"}),i.jsx("div",{className:"compare-divider-handle"})]})]}):null,i.jsx(ke,{resource:B,onDecoded:Re,onError:Ye}),i.jsx(ke,{resource:de,onDecoded:Re}),i.jsx(ke,{resource:A,onDecoded:Re,onError:He}),i.jsx(ke,{resource:fe,onDecoded:Re})]})})]})}export{pn as default};
@@ -103,9 +103,9 @@ Error generating stack: `+i.message+`
  *
  * This source code is licensed under the ISC license.
  * See the LICENSE file in the root directory of this source tree.
- */const BR=[["path",{d:"M10 11v6",key:"nco0om"}],["path",{d:"M14 11v6",key:"outv1u"}],["path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6",key:"miytrc"}],["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2",key:"e791ji"}]],bb=ua("trash-2",BR),Ec={"--bg":"#0e0d0b","--panel":"#181613","--hover":"#23211e","--border":"#2b2924","--surface":"#1c1a17","--surface-hover":"#25231f","--surface-active":"#2e2b26","--surface-overlay":"#131210","--surface-inset":"#0f0e0c","--text":"#e9e5df","--text-secondary":"#d3cec6","--muted":"#918b82","--accent":"#3b82f6","--accent-hover":"#5a9bff","--accent-muted":"rgba(59, 130, 246, 0.18)","--accent-strong":"rgba(59, 130, 246, 0.32)","--highlight":"#e6a23c","--sync-recent":"#b08bff","--danger":"#ff6b6b","--success":"#9ad4b5","--warning":"#f0b660","--info":"#55b8ff","--border-subtle":"rgba(255, 255, 255, 0.06)","--border-strong":"#3a3833","--border-hover":"#4a463e","--bg-gradient":"radial-gradient(1200px 600px at 10% -10%, rgba(255, 175, 110, 0.05), transparent 60%), radial-gradient(900px 500px at 100% -20%, rgba(59, 130, 246, 0.08), transparent 55%), var(--bg)"},UR={...Ec,"--accent":"#2dd4bf","--accent-hover":"#5eead4","--accent-muted":"rgba(45, 212, 191, 0.18)","--accent-strong":"rgba(45, 212, 191, 0.32)","--bg-gradient":"radial-gradient(1200px 600px at 10% -10%, rgba(255, 175, 110, 0.05), transparent 60%), radial-gradient(900px 500px at 100% -20%, rgba(45, 212, 191, 0.08), transparent 55%), var(--bg)"},HR={...Ec,"--bg":"#111215","--panel":"#181b20","--hover":"#20252d","--border":"#3a434f","--surface":"#20252d","--surface-hover":"#2a313c","--surface-active":"#323b47","--surface-overlay":"rgba(24, 27, 32, 0.95)","--surface-inset":"#0e0f12","--text":"#f1f5f9","--text-secondary":"#cbd5e1","--muted":"#94a3b8","--accent":"#86b7ff","--accent-hover":"#a5cbff","--accent-muted":"rgba(134, 183, 255, 0.18)","--accent-strong":"rgba(134, 183, 255, 0.32)","--border-subtle":"rgba(255, 255, 255, 0.06)","--border-strong":"#556275","--border-hover":"#67778c","--bg-gradient":"radial-gradient(1200px 600px at 10% -10%, rgba(255, 175, 110, 0.04), transparent 60%), radial-gradient(900px 500px at 100% -20%, rgba(134, 183, 255, 0.06), transparent 55%), var(--bg)"},Hu={default:{id:"default",label:"Original",tokens:Ec},teal:{id:"teal",label:"Teal",tokens:UR},charcoal:{id:"charcoal",label:"Charcoal",tokens:HR}},Sb="data-lenslet-dynamic-favicon",KR=`link[${Sb}="1"]`;function kb(e){return e!==void 0?e:typeof document>"u"?null:document}function Cb(e){return e==="default"||e==="teal"||e==="charcoal"}function Eb(e){return Cb(e)?e:"default"}function VR(e){return e.trim()||Ec["--accent"]}function WR(e){return['<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64">','<defs><clipPath id="a"><rect x="10" y="10" width="44" height="44" rx="12"/></clipPath></defs>','<rect width="64" height="64" fill="#111114"/>',`<rect x="10" y="10" width="44" height="44" rx="12" fill="${e}"/>`,'<g clip-path="url(#a)">','<path d="M20 22h24v6H26v8h16v6H26v10h-6z" fill="#f7f8fa"/>',"</g>","</svg>"].join("")}function qR(e){const t=VR(e),n=WR(t);return`data:image/svg+xml,${encodeURIComponent(n)}#accent=${encodeURIComponent(t)}`}function QR(e,t){const n=kb(t),r=qR(e);if(!n)return r;const s=n.head;if(!s)return r;let i=s.querySelector(KR);return i||(i=n.createElement("link"),i.setAttribute(Sb,"1"),i.setAttribute("rel","icon"),i.setAttribute("type","image/svg+xml"),s.appendChild(i)),i.getAttribute("href")!==r&&i.setAttribute("href",r),r}function Mb(e,t){const n=Eb(e),r=Hu[n],s=kb(t);if(!s)return n;const i=s.documentElement;for(const[o,l]of Object.entries(r.tokens))i.style.setProperty(o,l);return i.setAttribute("data-lenslet-theme",n),QR(r.tokens["--accent"],s),n}const GR=["default","teal","charcoal"].map(e=>({id:e,label:Hu[e].label,accent:Hu[e].tokens["--accent"]})),Ku=8,YR=10,Rb=8,Ty=typeof window>"u"?c.useEffect:c.useLayoutEffect;function Iy(){return{x:0,y:0,ready:!1,maxHeight:null}}function XR({placement:e,anchorRect:t,panelSize:n,viewport:r}){return zl(e==="sidebar"?{x:t.right+YR,y:t.bottom-n.height,menuWidth:n.width,menuHeight:n.height,viewport:r,margin:Ku}:{x:t.left,y:t.top-n.height-Rb,menuWidth:n.width,menuHeight:n.height,viewport:r,margin:Ku})}function JR(e,t,n){const r=e==="sidebar"?t.bottom:t.top-Rb;return Math.max(1,Math.min(n.height-Ku*2,r-n.top-Ku))}function ZR(e){return Eb(e)}function eN(e){const t=(e==null?void 0:e.current)??"";return{enabled:(e==null?void 0:e.enabled)===!0&&e.columns.length>0,selectedSourceColumn:t,selectedSourceStatus:(e==null?void 0:e.columns.find(n=>n.name===t))??null}}function Ua(e,t){return t==="toggle"?!e:!1}async function tN(e,t=typeof navigator<"u"?navigator.clipboard:null){if(!t)return!1;try{return await t.writeText(e),!0}catch{return!1}}function nN({launchSession:e,onCopyCommand:t}){var r;const n=((r=e.copy_command)==null?void 0:r.trim())||null;return u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Session"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("div",{className:"theme-settings-menu-field",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Loaded from"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:e.loaded_from_label}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",style:{color:"var(--text)",overflowWrap:"anywhere"},children:e.target_label}),e.detail_label?u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:e.detail_label}):null,n?u.jsxs("button",{type:"button",className:"theme-settings-menu-option",style:{marginTop:1,paddingInline:0},onClick:()=>t==null?void 0:t(n),children:[u.jsx(AR,{size:13,strokeWidth:1.9,"aria-hidden":"true"}),u.jsx("span",{className:"theme-settings-menu-option-label",children:"Copy command"})]}):null]})})]})}function Wi(e){return e.toLocaleString()}function rN(e){return e.gallery_rows===e.source_table_rows?`${Wi(e.gallery_rows)} rows`:`${Wi(e.gallery_rows)} / ${Wi(e.source_table_rows)} rows`}function sN(e){return e.skipped_rows.total<=0?null:`${Wi(e.skipped_rows.total)} skipped`}function iN(e){const t=sN(e),n=e.source_column?`, source: ${e.source_column}`:"";return`${rN(e)}${t?`, ${t}`:""}${n}`}function oN(e){const t=e.dimension_coverage;return`${Wi(t.known)} / ${Wi(t.total)} dimensions`}function lN(e){const t=e.source_refresh;if(!t)return null;switch(t.state){case"current":return"Source snapshot: current";case"refreshing":return"Source snapshot: refreshing…";case"stale":return t.message||"Source snapshot: stale";case"restart-required":return t.message||"Source snapshot changed; restart Lenslet to reload it."}}function aN(e){switch(e){case"local_streaming":return"local streaming";case"backend_proxy_required":return"backend proxy";case"browser_direct_allowed":return"browser direct";case"browser_direct_preferred_with_proxy_fallback":return"browser direct + proxy fallback";case"unsupported":return"unsupported"}}function uN(e){return e==="sidebar"?"theme-settings-menu-trigger-sidebar w-11 h-11 rounded-md border border-border flex items-center justify-center transition-colors bg-surface text-text hover:bg-surface-hover":"theme-settings-menu-trigger-mobile mobile-pill mobile-pill-icon"}function Nb({value:e,onChange:t,placement:n,autoloadImageMetadata:r=!0,onAutoloadImageMetadataChange:s,compareOrderMode:i="gallery",onCompareOrderModeChange:o,proxyHttpOriginals:l=!1,onProxyHttpOriginalsChange:a,sourceColumns:d=null,tableLaunchStatus:f=null,launchSession:h=null,sourceColumnSwitching:m=!1,onSourceColumnChange:y}){const[b,w]=c.useState(!1),S=c.useRef(null),v=c.useRef(null),[x,p]=c.useState(Iy),g=ZR(e),k=Hu[g],C=typeof s=="function",R=typeof o=="function",E=typeof a=="function",N=eN(d),j=N.enabled&&typeof y=="function",P=j||f!==null,$=f?lN(f):null,{selectedSourceColumn:U,selectedSourceStatus:q}=N;Ty(()=>{var O;b&&(O=S.current)!=null&&O.closest("[hidden], [inert]")&&w(!1)});const V=c.useMemo(()=>(d==null?void 0:d.columns.map(O=>({value:O.name,label:O.name,keywords:[O.name]})))??[],[d]),A=c.useCallback(O=>{tN(O)},[]),Z=c.useCallback(()=>{if(!b||typeof window>"u")return;const O=S.current,L=v.current;if(!O||!L)return;const F=O.getBoundingClientRect(),T=L.getBoundingClientRect(),H=aa(),G=XR({placement:n,anchorRect:F,panelSize:{width:T.width,height:T.height},viewport:H}),Y=JR(n,F,H);p(re=>re.ready&&re.x===G.x&&re.y===G.y&&re.maxHeight===Y?re:{x:G.x,y:G.y,ready:!0,maxHeight:Y})},[b,n]);Ty(()=>{if(!b){p(Iy());return}Z();const O=v.current;if(!O||typeof ResizeObserver>"u")return;const L=new ResizeObserver(Z);return L.observe(O),()=>L.disconnect()},[b,Z]),c.useEffect(()=>{if(!b)return;const O=T=>{var G,Y;const H=T.target;H&&((G=S.current)!=null&&G.contains(H))||H&&((Y=v.current)!=null&&Y.contains(H))||w(re=>Ua(re,"outside_click"))},L=T=>{T.key==="Escape"&&w(H=>Ua(H,"escape"))};window.addEventListener("click",O),window.addEventListener("keydown",L);const F=Cc(Z);return()=>{window.removeEventListener("click",O),window.removeEventListener("keydown",L),F()}},[b,Z]);const D=`Settings (${k.label})`,z={position:"fixed",left:x.x,top:x.y,visibility:x.ready?"visible":"hidden",maxHeight:x.maxHeight??void 0},B=b?u.jsxs("div",{ref:v,className:"theme-settings-menu-panel scrollbar-thin",role:"menu","aria-label":"Settings",style:z,children:[u.jsx("div",{className:"theme-settings-menu-header",children:"Theme"}),u.jsx("div",{className:"theme-settings-menu-options",children:GR.map(O=>{const L=O.id===g;return u.jsxs("button",{type:"button",className:`theme-settings-menu-option ${L?"is-active":""}`,role:"menuitemradio","aria-checked":L,onClick:()=>{t(O.id),w(F=>Ua(F,"select"))},children:[u.jsx("span",{className:"theme-settings-menu-option-swatch",style:{backgroundColor:O.accent},"aria-hidden":"true"}),u.jsx("span",{className:"theme-settings-menu-option-label",children:O.label}),L?u.jsx("svg",{width:"13",height:"13",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2.4",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:u.jsx("polyline",{points:"20 6 9 17 4 12"})}):null]},O.id)})}),h?u.jsx(nN,{launchSession:h,onCopyCommand:A}):null,P&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Source"}),u.jsxs("div",{className:"theme-settings-menu-options",children:[j&&u.jsxs("div",{className:"theme-settings-menu-field",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Image column"}),u.jsx(Tn,{value:U,onChange:O=>y==null?void 0:y(O),options:V,"aria-label":"Image column",title:U||"Image column",disabled:m,triggerClassName:"theme-settings-menu-select theme-settings-menu-dropdown justify-between",width:"trigger",searchable:"auto",searchPlaceholder:"Search columns...",emptyMessage:"No matching columns",portal:!1}),q&&u.jsxs("span",{className:"theme-settings-menu-option-subtitle",children:[q.sample_usable," / ",q.sample_total," sampled rows look image-like"]})]}),f&&u.jsxs("div",{className:"theme-settings-menu-field",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Launch status"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:iN(f)}),u.jsxs("span",{className:"theme-settings-menu-option-subtitle",children:[oN(f),", cache: ",f.dimension_cache_policy,", write: ",f.dimension_write_policy]}),u.jsxs("span",{className:"theme-settings-menu-option-subtitle",children:["Media: ",aN(f.original_media_policy.mode),f.original_media_policy.redacted_origin?`, ${f.original_media_policy.redacted_origin}`:""]}),$&&u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:$}),f.warnings.slice(0,2).map(O=>u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:O},O))]})]})]}),C&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Inspector"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("button",{type:"button",className:`theme-settings-menu-option theme-settings-menu-option-toggle ${r?"is-active":""}`,role:"menuitemcheckbox","aria-checked":r,onClick:()=>s==null?void 0:s(!r),children:[u.jsxs("span",{className:"theme-settings-menu-option-label-group",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Autoload image metadata"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:"Load PNG metadata when selecting an image"})]}),u.jsx("span",{className:`theme-settings-menu-toggle ${r?"is-active":""}`,"aria-hidden":"true",children:u.jsx("span",{className:"theme-settings-menu-toggle-knob"})})]})})]}),E&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Media"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("button",{type:"button",className:`theme-settings-menu-option theme-settings-menu-option-toggle ${l?"is-active":""}`,role:"menuitemcheckbox","aria-checked":l,onClick:()=>a==null?void 0:a(!l),children:[u.jsxs("span",{className:"theme-settings-menu-option-label-group",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Proxy HTTP originals"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:"Off loads full-size HTTP images directly"})]}),u.jsx("span",{className:`theme-settings-menu-toggle ${l?"is-active":""}`,"aria-hidden":"true",children:u.jsx("span",{className:"theme-settings-menu-toggle-knob"})})]})})]}),R&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Compare"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("button",{type:"button",className:`theme-settings-menu-option theme-settings-menu-option-toggle ${i==="selection"?"is-active":""}`,role:"menuitemcheckbox","aria-checked":i==="selection",onClick:()=>{const O=i==="selection"?"gallery":"selection";o==null||o(O)},children:[u.jsxs("span",{className:"theme-settings-menu-option-label-group",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Order compare by selection"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:"Off uses gallery sort order (default)"})]}),u.jsx("span",{className:`theme-settings-menu-toggle ${i==="selection"?"is-active":""}`,"aria-hidden":"true",children:u.jsx("span",{className:"theme-settings-menu-toggle-knob"})})]})})]})]}):null;return u.jsxs("div",{ref:S,className:"theme-settings-menu-root relative",children:[u.jsx("button",{type:"button",className:uN(n),"aria-label":D,title:D,"aria-expanded":b,"aria-haspopup":"menu",onClick:()=>w(O=>Ua(O,"toggle")),children:n==="sidebar"?u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.8",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M10.5 2h3l.6 2.1a7.8 7.8 0 0 1 1.8.8l2-1 2.1 2.1-1 2a7.8 7.8 0 0 1 .8 1.8L22 10.5v3l-2.1.6a7.8 7.8 0 0 1-.8 1.8l1 2-2.1 2.1-2-1a7.8 7.8 0 0 1-1.8.8L13.5 22h-3l-.6-2.1a7.8 7.8 0 0 1-1.8-.8l-2 1L4 18l1-2a7.8 7.8 0 0 1-.8-1.8L2 13.5v-3l2.1-.6a7.8 7.8 0 0 1 .8-1.8l-1-2L6 4l2 1a7.8 7.8 0 0 1 1.8-.8z"}),u.jsx("circle",{cx:"12",cy:"12",r:"3.1"})]}):u.jsxs(u.Fragment,{children:[u.jsx("span",{className:"theme-settings-trigger-swatch",style:{backgroundColor:k.tokens["--accent"]},"aria-hidden":"true"}),u.jsx("span",{children:"Settings"})]})}),B&&typeof document<"u"?jo.createPortal(B,document.body):B]})}function cN({viewMode:e,currentSort:t,sortOnlyOptions:n,sortDisabled:r,sortControlsDisabled:s,sortDir:i,isRandom:o,showSelectModeToggle:l,multiSelectMode:a,selectModeLabel:d,uploadBusy:f,uploadDisabled:h,themePreset:m,autoloadImageMetadata:y,proxyHttpOriginals:b,compareOrderMode:w,sourceColumns:S,tableLaunchStatus:v,launchSession:x,sourceColumnSwitching:p,filtersOpen:g,filtersRef:k,totalFilterCount:C,filterCount:R,starsInFilterList:E,starCounts:N,refreshEnabled:j,refreshDisabledReason:P,refreshBusy:$,leftOpen:U,rightOpen:q,onViewMode:V,onSortChange:A,onToggleSortDir:Z,onToggleFilters:D,onOpenFilters:z,onToggleStarsIn:B,onClearFilters:O,onClearStarsIn:L,onRefreshRoot:F,onToggleLeft:T,onToggleRight:H,onToggleMultiSelectMode:G,onUploadClick:Y,onThemePresetChange:re,onAutoloadImageMetadataChange:le,onProxyHttpOriginalsChange:he,onCompareOrderModeChange:pe,onSourceColumnChange:Se}){const we=!!Y,Ee=$||!j||!F,xe=$?"Refreshing root folder...":j?"Refresh root folder":P||"Refresh unavailable in current mode";return u.jsx("div",{className:"mobile-drawer",children:u.jsxs("div",{className:"mobile-drawer-row",children:[u.jsx("button",{"data-toolbar-control":"drawer-layout-grid",className:`mobile-pill ${e==="grid"?"is-active":""}`,onClick:()=>V==null?void 0:V("grid"),"aria-pressed":e==="grid",children:"Grid"}),u.jsx("button",{"data-toolbar-control":"drawer-layout-adaptive",className:`mobile-pill ${e==="adaptive"?"is-active":""}`,onClick:()=>V==null?void 0:V("adaptive"),"aria-pressed":e==="adaptive",children:"Justified rows"}),u.jsx("div",{className:"mobile-drawer-theme","data-toolbar-control":"drawer-theme",children:u.jsx(Nb,{value:m,onChange:re,placement:"mobile",autoloadImageMetadata:y,onAutoloadImageMetadataChange:le,proxyHttpOriginals:b,onProxyHttpOriginalsChange:he,compareOrderMode:w,onCompareOrderModeChange:pe,sourceColumns:S,tableLaunchStatus:v,launchSession:x,sourceColumnSwitching:p,onSourceColumnChange:Se})}),u.jsx("div",{className:"mobile-drawer-sort-control","data-toolbar-control":"drawer-sort",children:u.jsx(Tn,{value:t,onChange:Re=>A==null?void 0:A(Re),options:n,"aria-label":"Sort",triggerClassName:"mobile-pill mobile-pill-dropdown",panelClassName:"mobile-drawer-panel",disabled:r,searchable:"auto",searchPlaceholder:"Search sort options...",emptyMessage:"No matching sort options"})}),u.jsx("button",{"data-toolbar-control":"drawer-sort-dir",className:`mobile-pill mobile-pill-icon ${s?"opacity-50 cursor-not-allowed":""}`,onClick:Z,title:r?"Sorting disabled":o?"Shuffle":`Sort ${i==="desc"?"descending":"ascending"}`,"aria-label":o?"Shuffle":"Toggle sort direction","aria-disabled":s,disabled:s,children:u.jsx(vb,{isRandom:o,dir:i})}),u.jsx(wb,{variant:"drawer",dataToolbarControl:"drawer-filters",viewerActive:!1,filtersOpen:g,filtersRef:k,totalFilterCount:C,filterCount:R,starsInFilterList:E,starCounts:N,onToggleFilters:D,onOpenFilters:z,onToggleStarsIn:B,onClearFilters:O,onClearStarsIn:L}),u.jsx("button",{"data-toolbar-control":"drawer-refresh",className:`mobile-pill ${Ee?"opacity-50 cursor-not-allowed":""}`,title:xe,onClick:()=>{Ee||F==null||F()},"aria-label":"Refresh root folder","aria-disabled":Ee,disabled:Ee,children:"Refresh"}),u.jsx("button",{"data-toolbar-control":"drawer-left-panel",className:`mobile-pill ${U?"is-active":""}`,title:U?"Hide left panel (Ctrl+B)":"Show left panel (Ctrl+B)",onClick:T,"aria-pressed":U,"aria-label":"Toggle left panel",children:"Left"}),u.jsx("button",{"data-toolbar-control":"drawer-right-panel",className:`mobile-pill ${q?"is-active":""}`,title:q?"Hide right panel (Ctrl+Alt+B)":"Show right panel (Ctrl+Alt+B)",onClick:H,"aria-pressed":q,"aria-label":"Toggle right panel",children:"Right"}),l&&u.jsx("button",{"data-toolbar-control":"drawer-select",className:`mobile-pill mobile-pill-select ${a?"is-active":""}`,onClick:()=>G==null?void 0:G(),"aria-pressed":a,title:a?"Exit select mode":"Enter select mode",children:d}),we&&u.jsx("button",{"data-toolbar-control":"drawer-upload",className:`mobile-pill mobile-pill-upload ${h||f?"opacity-50 cursor-not-allowed":""}`,onClick:()=>!h&&!f&&(Y==null?void 0:Y()),"aria-label":"Upload images",title:f?"Uploading...":"Upload images","aria-disabled":h||f,disabled:h||f,children:f?"Uploading...":"Upload"})]})})}const ws={min:80,max:500,step:10};function jb(e){return Math.min(ws.max,Math.max(ws.min,e))}function dN({rootRef:e,onSearch:t,viewerActive:n,onBack:r,zoomPercent:s,onZoomPercentChange:i,currentLabel:o,itemCount:l,totalCount:a,sortSpec:d,metricKeys:f,metricDisplayNames:h,onSortChange:m,sortDisabled:y=!1,filterCount:b,onOpenFilters:w,starsInFilter:S,onToggleStarsIn:v,onClearStarsIn:x,onClearFilters:p,starCounts:g,viewMode:k,onViewMode:C,gridItemSize:R,onGridItemSize:E,leftOpen:N,rightOpen:j,onToggleLeft:P,onToggleRight:$,onRefreshRoot:U,refreshEnabled:q=!0,refreshDisabledReason:V,refreshBusy:A=!1,onPrevImage:Z,onNextImage:D,canPrevImage:z,canNextImage:B,searchDisabled:O=!1,searchPlaceholder:L,mobileSearchOpen:F=!1,onMobileSearchOpenChange:T,mobileDrawerOpen:H=!0,onMobileDrawerOpenChange:G,onUploadClick:Y,uploadBusy:re=!1,uploadDisabled:le=!1,themePreset:he,onThemePresetChange:pe,autoloadImageMetadata:Se,onAutoloadImageMetadataChange:we,proxyHttpOriginals:Ee,onProxyHttpOriginalsChange:xe,compareOrderMode:Re,onCompareOrderModeChange:ue,sourceColumns:Be,tableLaunchStatus:ke,launchSession:Ye,sourceColumnSwitching:et,onSourceColumnChange:be,multiSelectMode:X=!1,selectedCount:me=0,onToggleMultiSelectMode:Ne,syncIndicator:K}){const[W,fe]=c.useState(!1),ee=c.useRef(null),ce=c.useRef(null),Te=zd(Dd.narrow),de=zd(Dd.phone),ut=zd(Dd.toolbarCompact),Ke=Te&&!n,it=!(!!n&&ut),vt=!Ke,mt=!!n&&!de,In=!!(n&&r),Ln=!!(!n&&U)&&vt,Ft=!!(!n&&Y)&&vt,Lr=!n&&!Te,Rs=!!(!n&&Te),On=Rs,Or=Rs,At=Or&&F&&!O;c.useEffect(()=>{if(!W)return;const Me=Q=>{ee.current&&!ee.current.contains(Q.target)&&fe(!1)},I=Q=>{Q.key==="Escape"&&fe(!1)};return window.addEventListener("click",Me),window.addEventListener("keydown",I),()=>{window.removeEventListener("click",Me),window.removeEventListener("keydown",I)}},[W]),c.useEffect(()=>{W&&(!it||n)&&fe(!1)},[W,it,n]);const Fn=Me=>{i==null||i(Number(Me.currentTarget.value))};c.useEffect(()=>{if(O||!Or){F&&(T==null||T(!1));return}if(!F)return;const Me=window.requestAnimationFrame(()=>{var I;return(I=ce.current)==null?void 0:I.focus()});return()=>window.cancelAnimationFrame(Me)},[F,T,O,Or]);const jt=d??{kind:"builtin",key:"added",dir:"desc"},qe=jt.dir,pt=jt.kind==="builtin"&&jt.key==="random",on=n||y,hi=f!=null&&f.length?f.map(Me=>({value:`metric:${Me}`,label:ar(Me,h),keywords:[Me],disabled:y})):[],Ns=[{value:"builtin:added",label:"Date added",disabled:y},{value:"builtin:name",label:"Filename",disabled:y},{value:"builtin:random",label:"Random",disabled:y},...hi],To=[{label:"Layout",options:[{value:"layout:grid",label:"Grid"},{value:"layout:adaptive",label:"Justified rows"}]},{label:"Sort by",options:Ns}],mi=jt.kind==="metric"?`metric:${jt.key}`:`builtin:${jt.key}`,Jn=[{label:"Sort by",options:Ns}],dr=Ke&&!!Ne,fr=A||!q||!U,Fr=A?"Refreshing root folder…":q?"Refresh root folder":V||"Refresh unavailable in current mode",Io=X?me>0?`Done (${me})`:"Done":"Select",ln=Me=>{if(Me.startsWith("layout:")){const I=Me==="layout:adaptive"?"adaptive":"grid";C==null||C(I)}else{if(y)return;m==null||m(Ly(Me,jt))}},js=()=>{!m||y||m(pt?jt:{...jt,dir:qe==="desc"?"asc":"desc"})},Zn=S??[],Ar=Zn.length,pi=hN(b,Ar),An=fN(l,a),an=o||"Root";return u.jsxs("div",{ref:e,className:`toolbar-shell ${n?"toolbar-shell-viewer":""} ${de?"toolbar-shell-phone":""} ${ut?"toolbar-shell-compact":""} ${Ke?"toolbar-shell-mobile-browse":""} ${Ke&&H?"toolbar-shell-mobile-drawer-open":""} fixed top-0 left-0 right-0 h-12 grid grid-cols-[minmax(0,1fr)_minmax(0,1fr)_auto] items-center px-3 gap-3 bg-panel border-b border-border z-[var(--z-toolbar)] col-span-full row-start-1 select-none`,children:[u.jsxs("div",{className:"toolbar-left flex items-center gap-4 min-w-0",children:[u.jsxs("div",{className:"toolbar-scope flex items-center gap-3 min-w-0",children:[u.jsxs("div",{className:"toolbar-scope-text flex flex-col min-w-0 leading-tight",children:[u.jsx("span",{className:"toolbar-scope-label text-[10px] uppercase tracking-widest text-muted",children:"Scope"}),u.jsx("span",{className:"text-sm font-medium text-text truncate",title:an,children:an})]}),u.jsx("span",{className:"toolbar-count text-xs text-muted whitespace-nowrap tabular-nums",title:An??void 0,"aria-hidden":An===null,children:An??" "})]}),vt&&u.jsxs("div",{className:"toolbar-sort flex items-center gap-2",children:[u.jsxs("div",{className:`toolbar-sort-controls flex items-center gap-2 ${it?"":"toolbar-control-hidden"}`,"aria-hidden":!it,children:[u.jsx(Tn,{value:mi,onChange:ln,options:To,title:"Sort and layout options","aria-label":"Sort and layout",triggerClassName:"toolbar-sort-trigger min-w-[110px]",disabled:on||!it,searchable:"auto",searchPlaceholder:"Search sort options...",emptyMessage:"No matching sort options"}),u.jsx("button",{className:"toolbar-sort-dir btn btn-icon",onClick:js,title:y?"Sorting disabled":pt?"Shuffle":`Sort ${qe==="desc"?"descending":"ascending"}`,"aria-label":pt?"Shuffle":"Toggle sort direction","aria-disabled":on||!it,"aria-hidden":!it,disabled:on||!it,tabIndex:it?0:-1,children:u.jsx(vb,{isRandom:pt,dir:qe})})]}),u.jsx(wb,{viewerActive:!!n,suppressed:!it,filtersOpen:W,filtersRef:ee,totalFilterCount:pi,filterCount:b,starsInFilterList:Zn,starCounts:g,onToggleFilters:()=>{!it||n||fe(Me=>!Me)},onOpenFilters:w,onToggleStarsIn:v,onClearFilters:p,onClearStarsIn:x}),u.jsx("div",{className:"toolbar-slot toolbar-slot-refresh","data-toolbar-slot":"refresh",children:u.jsx("button",{"data-toolbar-control":"refresh",className:`btn btn-icon ml-1 ${Ln?"":"toolbar-control-hidden"} ${fr?"opacity-50 cursor-not-allowed":""}`,title:Fr,onClick:()=>{!Ln||fr||U==null||U()},"aria-label":"Refresh root folder","aria-disabled":!Ln||fr,"aria-hidden":!Ln,disabled:!Ln||fr,tabIndex:Ln?0:-1,children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M21 12a9 9 0 1 1-2.64-6.36"}),u.jsx("path",{d:"M21 3v6h-6"})]})})})]}),(In||vt)&&u.jsx("div",{className:"toolbar-slot toolbar-slot-back","data-toolbar-slot":"back",children:u.jsxs("button",{"data-toolbar-control":"back",className:`toolbar-back-btn btn btn-sm ${In?"":"toolbar-control-hidden"}`,onClick:()=>{In&&(r==null||r())},title:"Back to grid","aria-label":"Back to grid","aria-hidden":!In,disabled:!In,tabIndex:In?0:-1,children:[u.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:u.jsx("path",{d:"M15 18l-6-6 6-6"})}),u.jsx("span",{className:"toolbar-back-label",children:"Back"})]})})]}),u.jsx("div",{className:"toolbar-center flex items-center gap-3 justify-center min-w-0",children:n?u.jsxs(u.Fragment,{children:[u.jsx("input",{type:"range",min:5,max:800,step:1,value:Math.round(Math.max(5,Math.min(800,s??100))),onInput:Fn,onChange:Fn,className:"zoom-slider","aria-label":"Zoom level"}),u.jsxs("span",{className:"text-xs text-muted min-w-[42px] text-right",children:[Math.round(s??100),"%"]})]}):E&&u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("span",{className:"text-xs text-muted",children:"Size"}),u.jsx("input",{type:"range",min:ws.min,max:ws.max,step:ws.step,value:R??220,onChange:Me=>E(Number(Me.target.value)),className:"w-28 h-1.5 bg-border rounded-full appearance-none cursor-pointer hover:bg-hover transition-colors [&::-webkit-slider-thumb]:appearance-none [&::-webkit-slider-thumb]:w-3 [&::-webkit-slider-thumb]:h-3 [&::-webkit-slider-thumb]:rounded-full [&::-webkit-slider-thumb]:bg-text [&::-moz-range-thumb]:w-3 [&::-moz-range-thumb]:h-3 [&::-moz-range-thumb]:rounded-full [&::-moz-range-thumb]:bg-text [&::-moz-range-thumb]:border-0","aria-label":"Thumbnail size"})]})}),u.jsxs("div",{className:"toolbar-right flex items-center gap-2 justify-end",children:[u.jsx("div",{className:"toolbar-slot toolbar-slot-nav","data-toolbar-slot":"nav",children:u.jsxs("div",{className:`toolbar-nav flex items-center gap-1 ${mt?"":"toolbar-control-hidden"}`,"aria-hidden":!mt,children:[u.jsx("button",{className:`btn btn-icon ${z?"":"opacity-40 cursor-not-allowed"}`,title:"Previous image (A / ←)",onClick:()=>mt&&z&&(Z==null?void 0:Z()),"aria-label":"Previous image","aria-disabled":!mt||!z,disabled:!mt||!z,tabIndex:mt?0:-1,children:u.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:u.jsx("path",{d:"M15 18l-6-6 6-6"})})}),u.jsx("button",{className:`btn btn-icon ${B?"":"opacity-40 cursor-not-allowed"}`,title:"Next image (D / →)",onClick:()=>mt&&B&&(D==null?void 0:D()),"aria-label":"Next image","aria-disabled":!mt||!B,disabled:!mt||!B,tabIndex:mt?0:-1,children:u.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:u.jsx("path",{d:"M9 6l6 6-6 6"})})})]})}),vt&&u.jsxs("div",{className:"toolbar-panels flex items-center gap-1",children:[u.jsx("button",{className:`btn btn-icon ${N?"":"opacity-50"}`,title:N?"Hide left panel (Ctrl+B)":"Show left panel (Ctrl+B)",onClick:P,"aria-pressed":N,"aria-label":"Toggle left panel",children:u.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:[u.jsx("rect",{x:"3",y:"5",width:"6",height:"14",rx:"1.5"}),u.jsx("rect",{x:"11",y:"5",width:"10",height:"14",rx:"1.5"})]})}),u.jsx("button",{className:`btn btn-icon ${j?"":"opacity-50"}`,title:j?"Hide right panel (Ctrl+Alt+B)":"Show right panel (Ctrl+Alt+B)",onClick:$,"aria-pressed":j,"aria-label":"Toggle right panel",children:u.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:[u.jsx("rect",{x:"15",y:"5",width:"6",height:"14",rx:"1.5"}),u.jsx("rect",{x:"3",y:"5",width:"10",height:"14",rx:"1.5"})]})})]}),vt&&u.jsx("div",{className:"toolbar-slot toolbar-slot-upload","data-toolbar-slot":"upload",children:u.jsxs("button",{"data-toolbar-control":"upload",className:`btn toolbar-upload-btn ${Ft?"":"toolbar-control-hidden"} ${le||re?"opacity-50 cursor-not-allowed":""}`,onClick:()=>Ft&&!le&&!re&&(Y==null?void 0:Y()),"aria-label":"Upload images",title:re?"Uploading…":"Upload images","aria-disabled":!Ft||le||re,"aria-hidden":!Ft,disabled:!Ft||le||re,tabIndex:Ft?0:-1,children:[u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M12 16V5"}),u.jsx("path",{d:"M7 10l5-5 5 5"}),u.jsx("path",{d:"M4 19h16"})]}),u.jsx("span",{className:"toolbar-upload-label",children:re?"Uploading…":"Upload"})]})}),K&&u.jsx(RR,{...K,isNarrow:Te||ut}),Te&&u.jsx("div",{className:"toolbar-slot toolbar-slot-search-toggle","data-toolbar-slot":"search-toggle",children:u.jsx("button",{"data-toolbar-control":"search-toggle",className:`btn btn-icon ${On?"":"toolbar-control-hidden"} ${F?"btn-active":""} ${O?"opacity-50 cursor-not-allowed":""}`,"aria-label":F?"Close search":"Open search",title:O?"Search disabled":F?"Close search":"Search",onClick:()=>On&&!O&&(T==null?void 0:T(!F)),disabled:!On||O,"aria-hidden":!On,tabIndex:On?0:-1,children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("circle",{cx:"11",cy:"11",r:"7"}),u.jsx("path",{d:"M21 21l-4.35-4.35"})]})})}),Ke&&u.jsx("div",{className:"toolbar-slot toolbar-slot-drawer-toggle","data-toolbar-slot":"drawer-toggle",children:u.jsx("button",{"data-toolbar-control":"drawer-toggle",className:`btn btn-icon ${H?"btn-active":""}`,"aria-label":H?"Hide mobile toolbar controls":"Show mobile toolbar controls",title:H?"Hide controls":"Show controls","aria-expanded":H,onClick:()=>G==null?void 0:G(!H),children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M4 7h16"}),u.jsx("path",{d:"M4 12h16"}),u.jsx("path",{d:"M4 17h16"})]})})}),Te?null:u.jsx("div",{className:"toolbar-slot toolbar-slot-search-desktop","data-toolbar-slot":"search-desktop",children:u.jsx("div",{className:`toolbar-search toolbar-search-desktop w-[240px] ${Lr?"":"toolbar-control-hidden"}`,children:u.jsx("input",{"data-toolbar-control":"search-desktop",ref:ce,"aria-label":"Search filename, tags, notes",placeholder:O?L??"Search disabled":"Search...",onChange:Me=>t(Me.target.value),className:"toolbar-search-input input w-full focus:w-full transition-all duration-200 select-text",disabled:!Lr||O,tabIndex:Lr?0:-1,"aria-hidden":!Lr})})})]}),Or&&u.jsx("div",{className:`toolbar-search-row ${At?"toolbar-search-row-active":"toolbar-search-row-hidden"}`,"data-toolbar-slot":"search-row","aria-hidden":!At,children:u.jsx("input",{"data-toolbar-control":"search-mobile",ref:ce,"aria-label":"Search filename, tags, notes","aria-hidden":!At,placeholder:L??"Search...",onChange:Me=>t(Me.target.value),className:`toolbar-search-input-mobile input input-lg w-full select-text ${At?"":"toolbar-control-hidden"}`,disabled:!At,tabIndex:At?0:-1})}),Ke&&H&&u.jsx(cN,{viewMode:k,currentSort:mi,sortOnlyOptions:Jn,sortDisabled:y,sortControlsDisabled:on,sortDir:qe,isRandom:pt,showSelectModeToggle:dr,multiSelectMode:X,selectModeLabel:Io,uploadBusy:re,uploadDisabled:le,themePreset:he,autoloadImageMetadata:Se,proxyHttpOriginals:Ee,compareOrderMode:Re,sourceColumns:Be,tableLaunchStatus:ke,launchSession:Ye,sourceColumnSwitching:et,filtersOpen:W,filtersRef:ee,totalFilterCount:pi,filterCount:b,starsInFilterList:Zn,starCounts:g,refreshEnabled:q,refreshDisabledReason:V,refreshBusy:A,leftOpen:N,rightOpen:j,onViewMode:C,onSortChange:Me=>m==null?void 0:m(Ly(Me,jt)),onToggleSortDir:js,onToggleFilters:()=>{n||fe(Me=>!Me)},onOpenFilters:w,onToggleStarsIn:v,onClearFilters:p,onClearStarsIn:x,onRefreshRoot:U,onToggleLeft:P,onToggleRight:$,onToggleMultiSelectMode:Ne,onUploadClick:Y,onThemePresetChange:pe,onAutoloadImageMetadataChange:we,onProxyHttpOriginalsChange:xe,onCompareOrderModeChange:ue,onSourceColumnChange:be})]})}function fN(e,t){if(typeof e!="number")return null;const n=e.toLocaleString();if(typeof t!="number")return`${n} items`;const r=t.toLocaleString();return t===e?`${n} items`:`${n} / ${r} items`}function hN(e,t){return typeof e=="number"?e:t>0?1:0}function Ly(e,t){if(e.startsWith("metric:")){const n=e.slice(7);return n?{kind:"metric",key:n,dir:t.dir}:t}if(e.startsWith("builtin:")){const n=e.slice(8);if(n==="name"||n==="added"||n==="random")return{kind:"builtin",key:n,dir:t.dir}}return t}class jn extends Error{constructor(n,r,s,i){super(r);ge(this,"status");ge(this,"url");ge(this,"body");this.name="FetchError",this.status=n,this.url=s,this.body=i}}function mN(e){const t=e.trim();return t.startsWith("{")||t.startsWith("[")}function pN(e,t){if(!e)return null;if(t.includes("application/json")||mN(e))try{return JSON.parse(e)}catch{return e}return e}async function _b(e){const t=await e.text().catch(()=>"");return pN(t,e.headers.get("content-type")||"")}function gN(e){if(!Array.isArray(e))return null;const t=e.flatMap(r=>{if(!r||typeof r!="object")return[];const s=r,i=typeof s.msg=="string"?s.msg:null;if(!i)return[];const o=Array.isArray(s.loc)?s.loc.map(String).join("."):null;return o?[`${o}: ${i}`]:[i]});if(t.length===0)return null;const n=t.length>3?`; +${t.length-3} more`:"";return`validation failed: ${t.slice(0,3).join("; ")}${n}`}function Pb(e,t,n){if(t&&typeof t=="object"){const r=t,s=typeof r.error=="string"?r.error:null,i=typeof r.message=="string"?r.message:null;if(s&&i)return`${s}: ${i}`;if(s)return s;if(i)return i;if(typeof r.detail=="string")return r.detail;const o=gN(r.detail);if(o)return o}return typeof t=="string"&&t?t:`HTTP ${e} for ${n}`}function Tb(e,t){const n=new AbortController;let r;const s=()=>n.abort(t==null?void 0:t.reason);return e&&(r=window.setTimeout(()=>n.abort(),e)),t!=null&&t.aborted?n.abort(t.reason):t==null||t.addEventListener("abort",s,{once:!0}),{signal:n.signal,abort:()=>n.abort(),cleanup:()=>{r&&window.clearTimeout(r),t==null||t.removeEventListener("abort",s)}}}function Xe(e,t={}){const{timeoutMs:n,signal:r,...s}=t,i=Tb(n,r);return{promise:fetch(e,{...s,signal:i.signal}).then(async l=>{const a=await _b(l);if(!l.ok)throw new jn(l.status,Pb(l.status,a,e),e,a);return a}).finally(()=>{i.cleanup()}),abort:i.abort}}function wi(e,t={}){const{timeoutMs:n,signal:r,...s}=t,i=Tb(n,r);return{promise:fetch(e,{...s,signal:i.signal}).then(async l=>{if(!l.ok){const a=await _b(l);throw new jn(l.status,Pb(l.status,a,e),e,a)}return l.blob()}).finally(()=>{i.cleanup()}),abort:i.abort}}function Ib(){return{category:"decode",message:"Browser could not decode this image.",retryable:!1}}function $l(e){if(!e||typeof e!="object")return!1;const t=e;if(t.name==="AbortError")return!0;const n=typeof t.message=="string"?t.message.toLowerCase():"";return n.includes("abort")||n.includes("cancel")}function yN(e){return e.status===403?"permission":e.status===422?"decode":e.status===504?"timeout":e.status===502?"upstream":e.status===404?e.message.toLowerCase().includes("remote")?"remote_not_found":"local_not_found":e.status>=500?"read":"unknown"}function Vu(e,t="Media failed to load."){if($l(e))return{category:"aborted",message:"Media request was cancelled.",retryable:!1};if(e instanceof jn){const n=yN(e);return{category:n,status:e.status,message:e.message||t,retryable:n!=="decode"}}return e instanceof TypeError?{category:"network",message:e.message||t,retryable:!0}:e instanceof Error?{category:"unknown",message:e.message||t,retryable:!0}:{category:"unknown",message:t,retryable:!0}}function Qm(e){return e.category==="permission"?"Permission denied.":e.category==="timeout"?"Remote source timed out.":e.category==="decode"?"Could not decode this image.":e.category==="local_not_found"?"File not found.":e.category==="remote_not_found"?"Remote source not found.":e.category==="upstream"?"Remote source failed.":e.category==="network"?"Network request failed.":e.message}function vN(e){return typeof e=="object"&&e!==null&&"promise"in e}function Oy(e){return vN(e)?{promise:e.promise,abort:e.abort}:{promise:e}}class Lb{constructor(t){ge(this,"store",new Map);ge(this,"inflight",new Map);ge(this,"totalBytes",0);this.maxBytes=t}getMaxBytes(){return this.maxBytes}getTotalBytes(){return this.totalBytes}getSize(){return this.store.size}has(t){return this.store.has(t)}isInflight(t){return this.inflight.has(t)}get(t){const n=this.store.get(t);if(n)return this.store.delete(t),this.store.set(t,n),n.blob}evictIfNeeded(t){for(;this.totalBytes+t>this.maxBytes&&this.store.size>0;){const n=this.store.keys().next().value;if(n==null)break;const r=this.store.get(n);r&&(this.totalBytes-=r.size),this.store.delete(n)}}set(t,n){const r=n.size||0;if(!(r>this.maxBytes)){if(this.store.has(t)){const s=this.store.get(t);this.totalBytes-=s.size,this.store.delete(t)}this.evictIfNeeded(r),this.store.set(t,{blob:n,size:r}),this.totalBytes+=r}}getOrFetch(t,n){const r=this.get(t);if(r)return Promise.resolve(r);const s=this.inflight.get(t);if(s)return s.promise;let i;try{i=n()}catch(d){return Promise.reject(d)}const{promise:o,abort:l}=Oy(i),a=o.then(d=>(this.set(t,d),d)).finally(()=>{this.inflight.delete(t)});return this.inflight.set(t,{promise:a,abort:l}),a}prefetch(t,n){if(this.store.has(t)||this.inflight.has(t))return;const r=n(),{promise:s,abort:i}=Oy(r),o=s.then(l=>(this.set(t,l),l)).catch(()=>new Blob).finally(()=>{this.inflight.delete(t)});this.inflight.set(t,{promise:o,abort:i})}cancelPrefetch(t){const n=this.inflight.get(t);if(n!=null&&n.abort)try{n.abort()}catch{}this.inflight.delete(t)}clear(){for(const[t,n]of this.inflight)if(n.abort)try{n.abort()}catch{}this.inflight.clear(),this.store.clear(),this.totalBytes=0}evictPrefix(t){const n=(()=>{const s=t?`/${t.replace(/^\/+/,"")}`:"/";return s==="/"?"/":s.replace(/\/+$/,"")})(),r=s=>{const i=s.startsWith("/")?s.replace(/\/+$/,""):`/${s.replace(/\/+$/,"")}`;return n==="/"?!0:i===n||i.startsWith(`${n}/`)};for(const[s,i]of Array.from(this.store.entries()))r(s)&&(this.totalBytes-=i.size,this.store.delete(s));for(const[s,i]of Array.from(this.inflight.entries()))if(r(s)){if(i.abort)try{i.abort()}catch{}this.inflight.delete(s)}this.totalBytes<0&&(this.totalBytes=0)}}const Wr=new Lb(60*1024*1024),Wu=new Lb(20*1024*1024),wN=40*1024*1024,xN=256;function bN(e){return e==="viewer"||e==="compare"}function Fy(e){return ze(`/thumb?path=${encodeURIComponent(e)}`)}function $d(e){return ze(`/file?path=${encodeURIComponent(e)}`)}const Ay="lenslet.client_id.session",Ob="lenslet.last_event_id",SN=1e3,kN=3e4,CN=5;let mh=null,lu=null,Dy=0,qi=null,Qi=0,Mc=!0,qu=!1;function Fb(){return typeof window<"u"&&typeof EventSource<"u"}function EN(e,t){if(!e)return null;try{return e.getItem(t)}catch{return null}}function MN(e,t,n){if(e)try{e.setItem(t,n)}catch{}}function RN(){if(typeof navigator>"u")return"server";const e=navigator.userAgent||"",t=navigator.language||"",n=navigator.platform||"",r=typeof Intl<"u"&&Intl.DateTimeFormat().resolvedOptions().timeZone||"",s=typeof screen<"u"?`${screen.width}x${screen.height}x${screen.colorDepth}`:"";return[e,t,n,r,s].join("|")}function NN(e){let t=2166136261;for(let n=0;n<e.length;n+=1)t^=e.charCodeAt(n),t=t*16777619>>>0;return t.toString(16).padStart(8,"0")}function jN(){return typeof crypto<"u"&&"randomUUID"in crypto?crypto.randomUUID():`client_${Math.random().toString(36).slice(2,10)}_${Date.now()}`}function Bd(e){return mh=e,e}function Gm(e){if(typeof window>"u")return null;try{return e==="local"?window.localStorage:window.sessionStorage}catch{return null}}function Ab(){if(mh)return mh;const e=Gm("session"),t=EN(e,Ay);if(t)return Bd(t);if(e){const r=jN();return MN(e,Ay,r),Bd(r)}const n=`fp_${NN(RN())}_${Math.random().toString(36).slice(2,8)}`;return Bd(n)}function Db(e="lenslet"){Dy+=1;const t=typeof crypto<"u"&&"randomUUID"in crypto?crypto.randomUUID():`nonce_${Math.random().toString(36).slice(2,10)}_${Date.now()}_${Dy}`;return`${e}:${Ab()}:${t}`}function _N(){if(lu!=null)return lu;if(typeof window>"u")return null;const e=Gm("local");if(!e)return null;try{const t=e.getItem(Ob);if(!t)return null;const n=Number(t);return!Number.isFinite(n)||n<=0?null:(lu=n,n)}catch{return null}}function PN(e){if(!Number.isFinite(e)||e<=0||(lu=e,typeof window>"u"))return;const t=Gm("local");if(t)try{t.setItem(Ob,String(e))}catch{}}function TN(){if(typeof window>"u")return ze("/events");const e=new URL(ze("/events"),window.location.origin),t=_N();return t!=null&&Number.isFinite(t)&&e.searchParams.set("last_event_id",String(t)),e.toString()}function IN(e){if(!e)return null;try{return JSON.parse(e)}catch{return null}}let Un=null,zb="idle";const ph=new Set,gh=new Set,yh=new Set,vh=new Set;function Gi(e){zb=e;for(const t of gh)t(e)}function Ym(e){if(qu!==e){qu=e;for(const t of yh)t(e)}}function Xm(){qi!=null&&(window.clearTimeout(qi),qi=null)}function LN(){Qi=0,Xm()}function ON(){if(!Mc||qi!=null)return;Qi+=1;const e=Math.min(SN*Math.pow(2,Qi-1),kN);Qi>=CN?(Gi("offline"),Ym(!0)):Gi("reconnecting"),qi=window.setTimeout(()=>{qi=null,$b()},e)}function $b(){if(!Mc||!Fb()||(Un&&Un.readyState===EventSource.CLOSED&&(Un.close(),Un=null),Un))return;Qi>0?Gi("reconnecting"):Gi("connecting");const e=new EventSource(TN());Un=e;const t=n=>r=>{const s=IN(r.data);if(!s)return;const i=r.lastEventId?Number(r.lastEventId):null,o=i!=null&&Number.isFinite(i)?i:null;o!=null&&PN(o);for(const l of ph)l({type:n,id:o,data:s})};e.addEventListener("item-updated",t("item-updated")),e.addEventListener("metrics-updated",t("metrics-updated")),e.addEventListener("persistence",t("persistence")),e.addEventListener("presence",t("presence")),e.addEventListener("table-source",t("table-source")),e.onopen=()=>{LN(),Ym(!1),Gi("live")},e.onerror=()=>{Un===e&&(e.close(),Un=null,ON())}}function FN(){Mc=!0,Fb()&&(Xm(),$b())}function AN(){Mc=!1,Xm(),Qi=0,Un&&(Un.close(),Un=null),Ym(!1),Gi("offline")}function DN(e){return ph.add(e),()=>{ph.delete(e)}}function zN(e){return gh.add(e),e(zb),()=>{gh.delete(e)}}function $N(e){return yh.add(e),e(qu),()=>{yh.delete(e)}}function zy(){for(const e of vh)e()}function BN(e){return vh.add(e),()=>vh.delete(e)}function UN(){return qu}function Bb(e){FM(e)}function HN(e,t){const n=JSON.stringify(t),r=ze(e);if(typeof navigator<"u"&&typeof navigator.sendBeacon=="function")try{if(navigator.sendBeacon(r,new Blob([n],{type:"application/json"})))return!0}catch{}if(typeof fetch!="function")return!1;try{return fetch(r,{method:"POST",headers:{"Content-Type":"application/json"},body:n,keepalive:!0}),!0}catch{return!1}}function KN(e,t){return HN("/presence/leave",{gallery_id:e,lease_id:t})}function Ud(e,t){return Xe(ze(e),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(t)}).promise}function Hd(e=0,t="browse"){const n=Ab();return{"X-Lenslet-Client-Session":t==="browse"?n:`${n}:${t}`,"X-Lenslet-Query-Revision":String(e)}}function Ha(e,t){const n=new URLSearchParams({path:e});return t!=null&&t.recursive&&n.set("recursive","1"),t!=null&&t.countOnly&&n.set("count_only","1"),(t==null?void 0:t.offset)!==void 0&&n.set("offset",String(t.offset)),(t==null?void 0:t.limit)!==void 0&&n.set("limit",String(t.limit)),n.toString()}function VN(e){return e.total_items??e.items.length}const Fe={getFolder:(e,t)=>zn("folders",()=>Xe(ze(`/folders?${Ha(e,t)}`))).promise,getFolderCount:e=>zn("folders",()=>Xe(ze(`/folders?${Ha(e,{recursive:!0,countOnly:!0})}`))).promise.then(VN),getFolderFields:e=>{const t=Ha(e,{recursive:!0});return zn("folders",()=>Xe(ze(`/folders/fields?${t}`))).promise},getFolderFacets:(e,t)=>{const n={recursive:(t==null?void 0:t.recursive)??!0};return zn("folders",()=>Xe(ze(`/folders/facets?${Ha(e,n)}`),{headers:Hd()})).promise},queryFolderFacets:(e,t)=>{const n=zn("folders",()=>Xe(ze("/folders/facets"),{method:"POST",headers:{"Content-Type":"application/json",...Hd(t==null?void 0:t.queryRevision,t==null?void 0:t.analysisChannel)},body:JSON.stringify(e),signal:t==null?void 0:t.signal})),r=t==null?void 0:t.signal;if(!r)return n.promise;const s=()=>{var i;return(i=n.abort)==null?void 0:i.call(n)};return r.aborted?(s(),n.promise):(r.addEventListener("abort",s,{once:!0}),n.promise.finally(()=>{r.removeEventListener("abort",s)}))},queryFolder:(e,t)=>{const n=zn("folders",()=>Xe(ze("/folders/query"),{method:"POST",headers:{"Content-Type":"application/json",...Hd(t==null?void 0:t.queryRevision,t==null?void 0:t.analysisChannel)},body:JSON.stringify(e),signal:t==null?void 0:t.signal})),r=t==null?void 0:t.signal;if(!r)return n.promise;const s=()=>{var i;return(i=n.abort)==null?void 0:i.call(n)};return r.aborted?(s(),n.promise):(r.addEventListener("abort",s,{once:!0}),n.promise.finally(()=>{r.removeEventListener("abort",s)}))},getFolderPaths:()=>Xe(ze("/folders/paths")).promise,search:(e,t)=>{const n=new URLSearchParams;return e&&n.set("q",e),t&&n.set("path",t),Xe(ze(`/search?${n}`)).promise},getEmbeddings:()=>Xe(ze("/embeddings")).promise,searchEmbeddings:e=>Xe(ze("/embeddings/search"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).promise,refreshFolder:e=>{const t=new URLSearchParams({path:e});return Xe(ze(`/refresh?${t}`),{method:"POST"}).promise},getSidecar:e=>Xe(ze(`/item?path=${encodeURIComponent(e)}`)).promise,getSyncState:()=>Xe(ze("/sync/state")).promise,getItemDetail:e=>Xe(ze(`/item/detail?path=${encodeURIComponent(e)}`)).promise,patchSidecar:(e,t,n)=>{const s={"Content-Type":"application/json","Idempotency-Key":(n==null?void 0:n.idempotencyKey)??Db("patch")};return(n==null?void 0:n.ifMatch)!=null&&(s["If-Match"]=String(n.ifMatch)),Xe(ze(`/item?path=${encodeURIComponent(e)}`),{method:"PATCH",headers:s,body:JSON.stringify(t)}).promise},getMetadata:e=>Xe(ze(`/metadata?path=${encodeURIComponent(e)}`)).promise,putSidecar:(e,t)=>Xe(ze(`/item?path=${encodeURIComponent(e)}`),{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(t)}).promise,getHealth:()=>Xe(ze("/health")).promise,getTableSourceColumns:()=>Xe(ze("/table/source-columns")).promise,switchTableSourceColumn:e=>Xe(ze("/table/source-column"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({source_column:e})}).promise,joinPresence:(e,t)=>Ud("/presence/join",{gallery_id:e,lease_id:t}),movePresence:(e,t,n)=>Ud("/presence/move",{from_gallery_id:e,to_gallery_id:t,lease_id:n}),leavePresence:(e,t)=>Ud("/presence/leave",{gallery_id:e,lease_id:t}),getThumb:e=>Wu.getOrFetch(e,()=>zn("thumb",()=>wi(Fy(e)))),getHoverPreview:e=>{const t=Wr.get(e);return t?{promise:Promise.resolve(t)}:zn("file",()=>wi($d(e)))},prefetchThumb:e=>{AM().queued.thumb>=xN||Wu.prefetch(e,()=>zn("thumb",()=>wi(Fy(e))))},getFile:e=>Wr.getOrFetch(e,()=>zn("file",()=>wi($d(e)))),exportComparison:e=>wi(ze("/export-comparison"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).promise,prefetchFile:async(e,t)=>{if(bN(t)&&!(Wr.has(e)||Wr.isInflight(e)))try{const n=await zn("file",()=>wi($d(e),{headers:{"x-lenslet-prefetch":t}})).promise;n.size<=wN&&Wr.set(e,n)}catch{}},cancelPrefetch:e=>{Wr.cancelPrefetch(e)},getViews:()=>Xe(ze("/views")).promise,saveViews:e=>Xe(ze("/views"),{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).promise};function WN(e){const t=e?`/${e.replace(/^\/+/,"")}`:"/";return t==="/"?t:t.replace(/\/+$/,"")}function qN(e,t){const n=e.startsWith("/")?e.replace(/\/+$/,""):`/${e.replace(/\/+$/,"")}`;return t==="/"||n===t||n.startsWith(`${t}/`)}class QN{constructor(t,n){ge(this,"entries",new Map);ge(this,"totalBytes",0);this.limits=t,this.objectUrls=n}peekExisting(t){const n=this.entries.get(t);return n?{url:n.url,decoded:n.decoded}:null}acquireExisting(t){const n=this.entries.get(t);return n?(this.touch(n),this.lease(n)):null}acquire(t,n){const r=this.entries.get(t);if((r==null?void 0:r.blob)===n)return this.touch(r),this.lease(r);r&&this.retire(r);const s={key:t,blob:n,url:this.objectUrls.createObjectURL(n),bytes:n.size,refs:0,decoded:!1,retired:!1,revoked:!1};this.entries.set(t,s),this.totalBytes+=s.bytes;const i=this.lease(s);return this.trim(),i}evictPrefix(t){const n=WN(t);for(const[r,s]of Array.from(this.entries.entries()))qN(r,n)&&this.retire(s)}clear(){for(const t of Array.from(this.entries.values()))this.retire(t)}getSize(){return this.entries.size}lease(t){t.refs+=1;let n=!1;return{url:t.url,get decoded(){return t.decoded},markDecoded:()=>{t.revoked||(t.decoded=!0)},release:()=>{n||(n=!0,t.refs=Math.max(0,t.refs-1),t.retired&&t.refs===0&&this.finalize(t),this.trim())}}}touch(t){this.entries.get(t.key)===t&&(this.entries.delete(t.key),this.entries.set(t.key,t))}retire(t){t.retired||(t.retired=!0,this.entries.get(t.key)===t&&this.entries.delete(t.key),t.refs===0&&this.finalize(t))}finalize(t){if(!t.revoked){t.revoked=!0,this.totalBytes=Math.max(0,this.totalBytes-t.bytes);try{this.objectUrls.revokeObjectURL(t.url)}catch{}}}trim(){for(;this.entries.size>this.limits.maxEntries||this.totalBytes>this.limits.maxBytes;){const t=Array.from(this.entries.values()).find(n=>n.refs===0);if(!t)return;this.retire(t)}}}const zi=new QN({maxEntries:400,maxBytes:20*1024*1024},{createObjectURL:e=>URL.createObjectURL(e),revokeObjectURL:e=>URL.revokeObjectURL(e)});function GN(e,t){const n=c.useRef(null),[r,s]=c.useState(0),i=c.useCallback(()=>s(f=>f+1),[]),[o,l]=c.useState(()=>{const f=zi.peekExisting(e);return f?{status:"ready",url:f.url,decoded:f.decoded}:{status:"idle"}}),a=c.useCallback(()=>{var f;(f=n.current)==null||f.markDecoded(),l(h=>h.status==="ready"?{...h,decoded:!0}:h)},[]),d=c.useCallback(f=>{const h=n.current;n.current=f,l({status:"ready",url:f.url,decoded:f.decoded}),h==null||h.release()},[]);return c.useLayoutEffect(()=>{if(o.status!=="ready"||n.current)return;const f=zi.acquireExisting(e);if((f==null?void 0:f.url)===o.url){n.current=f;return}f==null||f.release(),l({status:"idle"})},[e,o]),c.useEffect(()=>{if(n.current||!t)return;const f=zi.acquireExisting(e);if(f){d(f);return}let h=!0;return l({status:"loading"}),Fe.getThumb(e).then(m=>{h&&d(zi.acquire(e,m))}).catch(m=>{if(h){if($l(m)){l({status:"idle"});return}l({status:"error",error:Vu(m,"Thumbnail failed to load."),retry:i})}}),()=>{h=!1}},[d,t,e,i,r]),c.useEffect(()=>()=>{var f;(f=n.current)==null||f.release(),n.current=null},[]),o.status==="ready"?{...o,markDecoded:a}:o}async function Ub(e){await e.decode()}function YN({path:e,name:t,onClick:n,selected:r,highlighted:s,highlightKey:i,selectionOrder:o=null,displayW:l,displayH:a,fit:d,ioRoot:f,isScrolling:h,priority:m}){const y=c.useRef(null),[b,w]=c.useState(!1),[S,v]=c.useState(!1),[x,p]=c.useState(()=>m?e:null),g=GN(e,x===e),k=g.status==="ready"?g.url:null,C=g.status==="ready"?g.decoded:!1,R=S||C,E=g.status==="ready"?g.markDecoded:null,N=g.status==="error"?g.error:null,j=g.status==="error"?g.retry:null,P=c.useCallback(U=>{Ub(U).catch(()=>{}).then(()=>{var q;(q=y.current)!=null&&q.contains(U)&&(U.currentSrc||U.src)===k&&(v(!0),E==null||E(),hy(e))})},[E,e,k]);c.useEffect(()=>{const U=y.current;if(!U)return;const q=new IntersectionObserver(V=>{for(const A of V)A.target===U&&w(A.isIntersecting||A.intersectionRatio>0)},{root:f??null,rootMargin:"200px 0px",threshold:.01});return q.observe(U),()=>{q.unobserve(U),q.disconnect()}},[f]),c.useEffect(()=>{p(m?e:null)},[e,m]),c.useEffect(()=>{x!==e&&(b&&!h||m)&&p(e)},[b,h,e,m,x]),c.useEffect(()=>{var q;if(!k){v(!1);return}if(C){v(!0),hy(e);return}const U=(q=y.current)==null?void 0:q.querySelector("img");U&&U.complete&&U.naturalWidth>0?P(U):v(!1)},[C,e,P,k]);const $=["absolute inset-0 bg-surface rounded-[10px] overflow-hidden select-none","border border-border-subtle shadow-sm",r?"ring-2 ring-accent border-transparent":"transition-[border-color,box-shadow] duration-150 hover:border-border-strong hover:shadow-md",s?"thumb-updated-ring":""].filter(Boolean).join(" ");return u.jsxs("div",{ref:y,"data-highlight-key":i??void 0,className:$,onClick:n,"data-media-state":g.status,children:[o!==null&&u.jsx("div",{className:"grid-selection-order-badge","aria-label":`Selection order ${o}`,children:o}),k?u.jsx("img",{className:`w-full h-full ${d==="contain"?"object-contain":"object-cover"} block pointer-events-none select-none opacity-0 transition-opacity duration-[160ms] ${R?"opacity-100":""}`,src:k,alt:t,loading:"lazy",decoding:"async","data-thumbnail-reveal":R?"decoded":"pending",onLoad:U=>P(U.currentTarget),width:l?Math.round(l):void 0,height:a?Math.round(a):void 0}):null,N&&u.jsxs("div",{className:"media-error-overlay media-error-overlay-thumb",onClick:U=>U.stopPropagation(),children:[u.jsx("div",{className:"media-error-title",children:"Thumbnail failed"}),u.jsx("div",{className:"media-error-message",children:Qm(N)}),N.retryable&&j&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:U=>{U.preventDefault(),U.stopPropagation(),j()},children:"Retry"})]})]})}function XN(e,t){const n=(t??"").trim();if(!n)return e;const r=e.toLowerCase().indexOf(n.toLowerCase());if(r===-1)return e;const s=e.slice(0,r),i=e.slice(r,r+n.length),o=e.slice(r+n.length);return u.jsxs(u.Fragment,{children:[s,u.jsx("mark",{className:"bg-accent/20 text-inherit rounded px-0.5",children:i}),o]})}function JN({layout:e,items:t,rowIndex:n}){if(e.mode==="adaptive"){const s=e.rows[n];return s?{items:s.items,height:s.height,imageHeight:s.imageH}:null}const r=n*e.columns;return{items:t.slice(r,r+e.columns).map(s=>({item:s,displayW:e.cellW,displayH:e.mediaH}))}}function ZN({layout:e,rowStart:t,rowHeight:n,gap:r}){return e.mode==="adaptive"?{className:"absolute top-0 left-0 right-0 w-full will-change-transform",style:{height:n,transform:`translate3d(0, ${t}px, 0)`,display:"flex",gap:r,paddingBottom:r}}:{className:"absolute top-0 left-0 right-0 w-full grid will-change-transform",style:{transform:`translate3d(0, ${t}px, 0)`,gridTemplateColumns:`repeat(${e.columns}, minmax(0, 1fr))`,gap:r,paddingBottom:r}}}function ej({virtualRows:e,layout:t,items:n,gap:r,scrollRootRef:s,suppressSelectionHighlight:i,active:o,focused:l,selectedSet:a,selectionOrderByPath:d,recentlyUpdated:f,highlight:h,isScrolling:m,multiSelectMode:y,onCellFocus:b,onPointerDown:w,onPointerMove:S,onPointerUp:v,onPointerCancel:x,onContextMenuItem:p,onOpenItemActions:g,onOpenViewer:k,onClearPreview:C,onSchedulePreview:R,onItemClick:E,demandThumbPaths:N}){return u.jsx(u.Fragment,{children:e.map(j=>{const P=JN({layout:t,items:n,rowIndex:j.index});if(!P)return null;const{className:$,style:U}=ZN({layout:t,rowStart:j.start,rowHeight:P.height,gap:r});return u.jsx("div",{className:$,role:"row","data-adaptive-image-height":P.imageHeight,style:U,children:P.items.map(({item:q,displayW:V,displayH:A,fit:Z})=>{const D=!i&&(o===q.path||a.has(q.path)),z=d.get(q.path)??null,B=(f==null?void 0:f.get(q.path))??null,O=B!=null,L=t.mode==="adaptive"?{width:V}:void 0,F=t.mode==="adaptive"?{height:A}:void 0,T=t.mode==="adaptive"?"relative rounded-[10px] group shrink-0":"relative aspect-[4/3] rounded-[10px] group";return u.jsxs("div",{id:`cell-${encodeURIComponent(q.path)}`,className:"relative min-w-0",role:"gridcell","data-adaptive-fit":Z,"aria-selected":D,tabIndex:l===q.path?0:-1,onFocus:()=>b(q.path),style:L,onPointerDown:H=>w(q.path,H),onPointerMove:S,onPointerUp:v,onPointerCancel:x,onContextMenu:H=>{H.preventDefault(),H.stopPropagation(),p==null||p(H,q.path)},children:[u.jsxs("div",{className:T,style:F,onDoubleClick:()=>{y||k(q.path)},onMouseLeave:C,children:[u.jsx("button",{type:"button",className:"grid-item-action-btn touch-manipulation","data-grid-action":"1","aria-label":`Open actions for ${q.name}`,"aria-haspopup":"menu",onPointerDown:H=>H.stopPropagation(),onClick:H=>{H.stopPropagation();const G=H.currentTarget.getBoundingClientRect();g(q.path,{x:G.right-4,y:G.bottom-4})},children:u.jsxs("svg",{width:"13",height:"13",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("circle",{cx:"12",cy:"5",r:"1.5"}),u.jsx("circle",{cx:"12",cy:"12",r:"1.5"}),u.jsx("circle",{cx:"12",cy:"19",r:"1.5"})]})}),u.jsx("div",{className:"cell-content absolute inset-0",children:u.jsx(YN,{path:q.path,name:q.name,selected:D,highlighted:O,highlightKey:B,selectionOrder:z,displayW:V,displayH:A,fit:Z,ioRoot:s.current,isScrolling:m,priority:N.has(q.path),onClick:H=>E(q.path,H)})}),u.jsx("div",{className:"grid-item-preview-hotspot absolute right-0 bottom-0 w-7 h-7 cursor-zoom-in",onMouseEnter:()=>R(q.path),onMouseLeave:C,children:u.jsx("div",{className:"grid-item-preview-corner absolute right-0 bottom-0 h-[18px] w-[18px] flex items-center justify-center text-text select-none",style:{clipPath:'path("M0 9C0 4.02944 4.02944 0 9 0H18V18H0V9Z")',background:"linear-gradient(135deg, rgba(18,18,18,0.9) 0%, rgba(34,34,34,0.9) 60%, rgba(22,22,22,0.9) 100%)",borderTop:"1px solid rgba(255,255,255,0.08)",borderLeft:"1px solid rgba(255,255,255,0.08)",boxShadow:"0 1px 2px rgba(0,0,0,0.45)",backdropFilter:"blur(1px)"},children:u.jsxs("svg",{width:"11",height:"11",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.7",strokeLinecap:"round",strokeLinejoin:"round",className:"text-[#d9dce2]","aria-hidden":"true",style:{transform:"translate(0px,0px)"},children:[u.jsx("circle",{cx:"11",cy:"11",r:"5.4"}),u.jsx("path",{d:"M15.5 15.5 L19 19"})]})})})]}),u.jsxs("div",{className:"flex flex-col items-center text-center gap-0.5 mt-2 px-1 text-text-secondary",children:[u.jsx("div",{className:"text-xs font-medium leading-[16px] thumb-filename line-clamp-2 break-words hyphens-auto text-center",title:q.name,children:XN(q.name,h)}),u.jsxs("div",{className:"text-[10px] leading-[14px] text-muted",children:[q.width," × ",q.height]})]})]},q.path)})},j.key)})})}function XF(e){return e}function xi(e,t,n){let r=n.initialDeps??[],s,i=!0;function o(){var l,a,d;let f;n.key&&((l=n.debug)!=null&&l.call(n))&&(f=Date.now());const h=e();if(!(h.length!==r.length||h.some((b,w)=>r[w]!==b)))return s;r=h;let y;if(n.key&&((a=n.debug)!=null&&a.call(n))&&(y=Date.now()),s=t(...h),n.key&&((d=n.debug)!=null&&d.call(n))){const b=Math.round((Date.now()-f)*100)/100,w=Math.round((Date.now()-y)*100)/100,S=w/16,v=(x,p)=>{for(x=String(x);x.length<p;)x=" "+x;return x};console.info(`%c⏱ ${v(w,5)} /${v(b,5)} ms`,`
+ */const BR=[["path",{d:"M10 11v6",key:"nco0om"}],["path",{d:"M14 11v6",key:"outv1u"}],["path",{d:"M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6",key:"miytrc"}],["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2",key:"e791ji"}]],bb=ua("trash-2",BR),Ec={"--bg":"#0e0d0b","--panel":"#181613","--hover":"#23211e","--border":"#2b2924","--surface":"#1c1a17","--surface-hover":"#25231f","--surface-active":"#2e2b26","--surface-overlay":"#131210","--surface-inset":"#0f0e0c","--text":"#e9e5df","--text-secondary":"#d3cec6","--muted":"#918b82","--accent":"#3b82f6","--accent-hover":"#5a9bff","--accent-muted":"rgba(59, 130, 246, 0.18)","--accent-strong":"rgba(59, 130, 246, 0.32)","--highlight":"#e6a23c","--sync-recent":"#b08bff","--danger":"#ff6b6b","--success":"#9ad4b5","--warning":"#f0b660","--info":"#55b8ff","--border-subtle":"rgba(255, 255, 255, 0.06)","--border-strong":"#3a3833","--border-hover":"#4a463e","--bg-gradient":"radial-gradient(1200px 600px at 10% -10%, rgba(255, 175, 110, 0.05), transparent 60%), radial-gradient(900px 500px at 100% -20%, rgba(59, 130, 246, 0.08), transparent 55%), var(--bg)"},UR={...Ec,"--accent":"#2dd4bf","--accent-hover":"#5eead4","--accent-muted":"rgba(45, 212, 191, 0.18)","--accent-strong":"rgba(45, 212, 191, 0.32)","--bg-gradient":"radial-gradient(1200px 600px at 10% -10%, rgba(255, 175, 110, 0.05), transparent 60%), radial-gradient(900px 500px at 100% -20%, rgba(45, 212, 191, 0.08), transparent 55%), var(--bg)"},HR={...Ec,"--bg":"#111215","--panel":"#181b20","--hover":"#20252d","--border":"#3a434f","--surface":"#20252d","--surface-hover":"#2a313c","--surface-active":"#323b47","--surface-overlay":"rgba(24, 27, 32, 0.95)","--surface-inset":"#0e0f12","--text":"#f1f5f9","--text-secondary":"#cbd5e1","--muted":"#94a3b8","--accent":"#86b7ff","--accent-hover":"#a5cbff","--accent-muted":"rgba(134, 183, 255, 0.18)","--accent-strong":"rgba(134, 183, 255, 0.32)","--border-subtle":"rgba(255, 255, 255, 0.06)","--border-strong":"#556275","--border-hover":"#67778c","--bg-gradient":"radial-gradient(1200px 600px at 10% -10%, rgba(255, 175, 110, 0.04), transparent 60%), radial-gradient(900px 500px at 100% -20%, rgba(134, 183, 255, 0.06), transparent 55%), var(--bg)"},Hu={default:{id:"default",label:"Original",tokens:Ec},teal:{id:"teal",label:"Teal",tokens:UR},charcoal:{id:"charcoal",label:"Charcoal",tokens:HR}},Sb="data-lenslet-dynamic-favicon",KR=`link[${Sb}="1"]`;function kb(e){return e!==void 0?e:typeof document>"u"?null:document}function Cb(e){return e==="default"||e==="teal"||e==="charcoal"}function Eb(e){return Cb(e)?e:"default"}function VR(e){return e.trim()||Ec["--accent"]}function WR(e){return['<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64">','<defs><clipPath id="a"><rect x="10" y="10" width="44" height="44" rx="12"/></clipPath></defs>','<rect width="64" height="64" fill="#111114"/>',`<rect x="10" y="10" width="44" height="44" rx="12" fill="${e}"/>`,'<g clip-path="url(#a)">','<path d="M20 22h24v6H26v8h16v6H26v10h-6z" fill="#f7f8fa"/>',"</g>","</svg>"].join("")}function qR(e){const t=VR(e),n=WR(t);return`data:image/svg+xml,${encodeURIComponent(n)}#accent=${encodeURIComponent(t)}`}function QR(e,t){const n=kb(t),r=qR(e);if(!n)return r;const s=n.head;if(!s)return r;let i=s.querySelector(KR);return i||(i=n.createElement("link"),i.setAttribute(Sb,"1"),i.setAttribute("rel","icon"),i.setAttribute("type","image/svg+xml"),s.appendChild(i)),i.getAttribute("href")!==r&&i.setAttribute("href",r),r}function Mb(e,t){const n=Eb(e),r=Hu[n],s=kb(t);if(!s)return n;const i=s.documentElement;for(const[o,l]of Object.entries(r.tokens))i.style.setProperty(o,l);return i.setAttribute("data-lenslet-theme",n),QR(r.tokens["--accent"],s),n}const GR=["default","teal","charcoal"].map(e=>({id:e,label:Hu[e].label,accent:Hu[e].tokens["--accent"]})),Ku=8,YR=10,Rb=8,Ty=typeof window>"u"?c.useEffect:c.useLayoutEffect;function Iy(){return{x:0,y:0,ready:!1,maxHeight:null}}function XR({placement:e,anchorRect:t,panelSize:n,viewport:r}){return zl(e==="sidebar"?{x:t.right+YR,y:t.bottom-n.height,menuWidth:n.width,menuHeight:n.height,viewport:r,margin:Ku}:{x:t.left,y:t.top-n.height-Rb,menuWidth:n.width,menuHeight:n.height,viewport:r,margin:Ku})}function JR(e,t,n){const r=e==="sidebar"?t.bottom:t.top-Rb;return Math.max(1,Math.min(n.height-Ku*2,r-n.top-Ku))}function ZR(e){return Eb(e)}function eN(e){const t=(e==null?void 0:e.current)??"";return{enabled:(e==null?void 0:e.enabled)===!0&&e.columns.length>0,selectedSourceColumn:t,selectedSourceStatus:(e==null?void 0:e.columns.find(n=>n.name===t))??null}}function Ua(e,t){return t==="toggle"?!e:!1}async function tN(e,t=typeof navigator<"u"?navigator.clipboard:null){if(!t)return!1;try{return await t.writeText(e),!0}catch{return!1}}function nN({launchSession:e,onCopyCommand:t}){var r;const n=((r=e.copy_command)==null?void 0:r.trim())||null;return u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Session"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("div",{className:"theme-settings-menu-field",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Loaded from"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:e.loaded_from_label}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",style:{color:"var(--text)",overflowWrap:"anywhere"},children:e.target_label}),e.detail_label?u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:e.detail_label}):null,n?u.jsxs("button",{type:"button",className:"theme-settings-menu-option",style:{marginTop:1,paddingInline:0},onClick:()=>t==null?void 0:t(n),children:[u.jsx(AR,{size:13,strokeWidth:1.9,"aria-hidden":"true"}),u.jsx("span",{className:"theme-settings-menu-option-label",children:"Copy command"})]}):null]})})]})}function Wi(e){return e.toLocaleString()}function rN(e){return e.gallery_rows===e.source_table_rows?`${Wi(e.gallery_rows)} rows`:`${Wi(e.gallery_rows)} / ${Wi(e.source_table_rows)} rows`}function sN(e){return e.skipped_rows.total<=0?null:`${Wi(e.skipped_rows.total)} skipped`}function iN(e){const t=sN(e),n=e.source_column?`, source: ${e.source_column}`:"";return`${rN(e)}${t?`, ${t}`:""}${n}`}function oN(e){const t=e.dimension_coverage;return`${Wi(t.known)} / ${Wi(t.total)} dimensions`}function lN(e){const t=e.source_refresh;if(!t)return null;switch(t.state){case"current":return"Source snapshot: current";case"refreshing":return"Source snapshot: refreshing…";case"stale":return t.message||"Source snapshot: stale";case"restart-required":return t.message||"Source snapshot changed; restart Lenslet to reload it."}}function aN(e){switch(e){case"local_streaming":return"local streaming";case"backend_proxy_required":return"backend proxy";case"browser_direct_allowed":return"browser direct";case"browser_direct_preferred_with_proxy_fallback":return"browser direct + proxy fallback";case"unsupported":return"unsupported"}}function uN(e){return e==="sidebar"?"theme-settings-menu-trigger-sidebar w-11 h-11 rounded-md border border-border flex items-center justify-center transition-colors bg-surface text-text hover:bg-surface-hover":"theme-settings-menu-trigger-mobile mobile-pill mobile-pill-icon"}function Nb({value:e,onChange:t,placement:n,autoloadImageMetadata:r=!0,onAutoloadImageMetadataChange:s,compareOrderMode:i="gallery",onCompareOrderModeChange:o,proxyHttpOriginals:l=!1,onProxyHttpOriginalsChange:a,sourceColumns:d=null,tableLaunchStatus:f=null,launchSession:h=null,sourceColumnSwitching:m=!1,onSourceColumnChange:y}){const[b,w]=c.useState(!1),S=c.useRef(null),v=c.useRef(null),[x,p]=c.useState(Iy),g=ZR(e),k=Hu[g],C=typeof s=="function",R=typeof o=="function",E=typeof a=="function",N=eN(d),j=N.enabled&&typeof y=="function",P=j||f!==null,$=f?lN(f):null,{selectedSourceColumn:U,selectedSourceStatus:q}=N;Ty(()=>{var O;b&&(O=S.current)!=null&&O.closest("[hidden], [inert]")&&w(!1)});const V=c.useMemo(()=>(d==null?void 0:d.columns.map(O=>({value:O.name,label:O.name,keywords:[O.name]})))??[],[d]),A=c.useCallback(O=>{tN(O)},[]),Z=c.useCallback(()=>{if(!b||typeof window>"u")return;const O=S.current,L=v.current;if(!O||!L)return;const F=O.getBoundingClientRect(),T=L.getBoundingClientRect(),H=aa(),G=XR({placement:n,anchorRect:F,panelSize:{width:T.width,height:T.height},viewport:H}),Y=JR(n,F,H);p(re=>re.ready&&re.x===G.x&&re.y===G.y&&re.maxHeight===Y?re:{x:G.x,y:G.y,ready:!0,maxHeight:Y})},[b,n]);Ty(()=>{if(!b){p(Iy());return}Z();const O=v.current;if(!O||typeof ResizeObserver>"u")return;const L=new ResizeObserver(Z);return L.observe(O),()=>L.disconnect()},[b,Z]),c.useEffect(()=>{if(!b)return;const O=T=>{var G,Y;const H=T.target;H&&((G=S.current)!=null&&G.contains(H))||H&&((Y=v.current)!=null&&Y.contains(H))||w(re=>Ua(re,"outside_click"))},L=T=>{T.key==="Escape"&&w(H=>Ua(H,"escape"))};window.addEventListener("click",O),window.addEventListener("keydown",L);const F=Cc(Z);return()=>{window.removeEventListener("click",O),window.removeEventListener("keydown",L),F()}},[b,Z]);const D=`Settings (${k.label})`,z={position:"fixed",left:x.x,top:x.y,visibility:x.ready?"visible":"hidden",maxHeight:x.maxHeight??void 0},B=b?u.jsxs("div",{ref:v,className:"theme-settings-menu-panel scrollbar-thin",role:"menu","aria-label":"Settings",style:z,children:[u.jsx("div",{className:"theme-settings-menu-header",children:"Theme"}),u.jsx("div",{className:"theme-settings-menu-options",children:GR.map(O=>{const L=O.id===g;return u.jsxs("button",{type:"button",className:`theme-settings-menu-option ${L?"is-active":""}`,role:"menuitemradio","aria-checked":L,onClick:()=>{t(O.id),w(F=>Ua(F,"select"))},children:[u.jsx("span",{className:"theme-settings-menu-option-swatch",style:{backgroundColor:O.accent},"aria-hidden":"true"}),u.jsx("span",{className:"theme-settings-menu-option-label",children:O.label}),L?u.jsx("svg",{width:"13",height:"13",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2.4",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:u.jsx("polyline",{points:"20 6 9 17 4 12"})}):null]},O.id)})}),h?u.jsx(nN,{launchSession:h,onCopyCommand:A}):null,P&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Source"}),u.jsxs("div",{className:"theme-settings-menu-options",children:[j&&u.jsxs("div",{className:"theme-settings-menu-field",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Image column"}),u.jsx(Tn,{value:U,onChange:O=>y==null?void 0:y(O),options:V,"aria-label":"Image column",title:U||"Image column",disabled:m,triggerClassName:"theme-settings-menu-select theme-settings-menu-dropdown justify-between",width:"trigger",searchable:"auto",searchPlaceholder:"Search columns...",emptyMessage:"No matching columns",portal:!1}),q&&u.jsxs("span",{className:"theme-settings-menu-option-subtitle",children:[q.sample_usable," / ",q.sample_total," sampled rows look image-like"]})]}),f&&u.jsxs("div",{className:"theme-settings-menu-field",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Launch status"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:iN(f)}),u.jsxs("span",{className:"theme-settings-menu-option-subtitle",children:[oN(f),", cache: ",f.dimension_cache_policy,", write: ",f.dimension_write_policy]}),u.jsxs("span",{className:"theme-settings-menu-option-subtitle",children:["Media: ",aN(f.original_media_policy.mode),f.original_media_policy.redacted_origin?`, ${f.original_media_policy.redacted_origin}`:""]}),$&&u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:$}),f.warnings.slice(0,2).map(O=>u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:O},O))]})]})]}),C&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Inspector"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("button",{type:"button",className:`theme-settings-menu-option theme-settings-menu-option-toggle ${r?"is-active":""}`,role:"menuitemcheckbox","aria-checked":r,onClick:()=>s==null?void 0:s(!r),children:[u.jsxs("span",{className:"theme-settings-menu-option-label-group",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Autoload image metadata"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:"Load PNG metadata when selecting an image"})]}),u.jsx("span",{className:`theme-settings-menu-toggle ${r?"is-active":""}`,"aria-hidden":"true",children:u.jsx("span",{className:"theme-settings-menu-toggle-knob"})})]})})]}),E&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Media"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("button",{type:"button",className:`theme-settings-menu-option theme-settings-menu-option-toggle ${l?"is-active":""}`,role:"menuitemcheckbox","aria-checked":l,onClick:()=>a==null?void 0:a(!l),children:[u.jsxs("span",{className:"theme-settings-menu-option-label-group",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Proxy HTTP originals"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:"Off loads full-size HTTP images directly"})]}),u.jsx("span",{className:`theme-settings-menu-toggle ${l?"is-active":""}`,"aria-hidden":"true",children:u.jsx("span",{className:"theme-settings-menu-toggle-knob"})})]})})]}),R&&u.jsxs(u.Fragment,{children:[u.jsx("div",{className:"theme-settings-menu-divider"}),u.jsx("div",{className:"theme-settings-menu-header",children:"Compare"}),u.jsx("div",{className:"theme-settings-menu-options",children:u.jsxs("button",{type:"button",className:`theme-settings-menu-option theme-settings-menu-option-toggle ${i==="selection"?"is-active":""}`,role:"menuitemcheckbox","aria-checked":i==="selection",onClick:()=>{const O=i==="selection"?"gallery":"selection";o==null||o(O)},children:[u.jsxs("span",{className:"theme-settings-menu-option-label-group",children:[u.jsx("span",{className:"theme-settings-menu-option-label",children:"Order compare by selection"}),u.jsx("span",{className:"theme-settings-menu-option-subtitle",children:"Off uses gallery sort order (default)"})]}),u.jsx("span",{className:`theme-settings-menu-toggle ${i==="selection"?"is-active":""}`,"aria-hidden":"true",children:u.jsx("span",{className:"theme-settings-menu-toggle-knob"})})]})})]})]}):null;return u.jsxs("div",{ref:S,className:"theme-settings-menu-root relative",children:[u.jsx("button",{type:"button",className:uN(n),"aria-label":D,title:D,"aria-expanded":b,"aria-haspopup":"menu",onClick:()=>w(O=>Ua(O,"toggle")),children:n==="sidebar"?u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.8",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M10.5 2h3l.6 2.1a7.8 7.8 0 0 1 1.8.8l2-1 2.1 2.1-1 2a7.8 7.8 0 0 1 .8 1.8L22 10.5v3l-2.1.6a7.8 7.8 0 0 1-.8 1.8l1 2-2.1 2.1-2-1a7.8 7.8 0 0 1-1.8.8L13.5 22h-3l-.6-2.1a7.8 7.8 0 0 1-1.8-.8l-2 1L4 18l1-2a7.8 7.8 0 0 1-.8-1.8L2 13.5v-3l2.1-.6a7.8 7.8 0 0 1 .8-1.8l-1-2L6 4l2 1a7.8 7.8 0 0 1 1.8-.8z"}),u.jsx("circle",{cx:"12",cy:"12",r:"3.1"})]}):u.jsxs(u.Fragment,{children:[u.jsx("span",{className:"theme-settings-trigger-swatch",style:{backgroundColor:k.tokens["--accent"]},"aria-hidden":"true"}),u.jsx("span",{children:"Settings"})]})}),B&&typeof document<"u"?jo.createPortal(B,document.body):B]})}function cN({viewMode:e,currentSort:t,sortOnlyOptions:n,sortDisabled:r,sortControlsDisabled:s,sortDir:i,isRandom:o,showSelectModeToggle:l,multiSelectMode:a,selectModeLabel:d,uploadBusy:f,uploadDisabled:h,themePreset:m,autoloadImageMetadata:y,proxyHttpOriginals:b,compareOrderMode:w,sourceColumns:S,tableLaunchStatus:v,launchSession:x,sourceColumnSwitching:p,filtersOpen:g,filtersRef:k,totalFilterCount:C,filterCount:R,starsInFilterList:E,starCounts:N,refreshEnabled:j,refreshDisabledReason:P,refreshBusy:$,leftOpen:U,rightOpen:q,onViewMode:V,onSortChange:A,onToggleSortDir:Z,onToggleFilters:D,onOpenFilters:z,onToggleStarsIn:B,onClearFilters:O,onClearStarsIn:L,onRefreshRoot:F,onToggleLeft:T,onToggleRight:H,onToggleMultiSelectMode:G,onUploadClick:Y,onThemePresetChange:re,onAutoloadImageMetadataChange:le,onProxyHttpOriginalsChange:he,onCompareOrderModeChange:pe,onSourceColumnChange:Se}){const we=!!Y,Ee=$||!j||!F,xe=$?"Refreshing root folder...":j?"Refresh root folder":P||"Refresh unavailable in current mode";return u.jsx("div",{className:"mobile-drawer",children:u.jsxs("div",{className:"mobile-drawer-row",children:[u.jsx("button",{"data-toolbar-control":"drawer-layout-grid",className:`mobile-pill ${e==="grid"?"is-active":""}`,onClick:()=>V==null?void 0:V("grid"),"aria-pressed":e==="grid",children:"Grid"}),u.jsx("button",{"data-toolbar-control":"drawer-layout-adaptive",className:`mobile-pill ${e==="adaptive"?"is-active":""}`,onClick:()=>V==null?void 0:V("adaptive"),"aria-pressed":e==="adaptive",children:"Justified rows"}),u.jsx("div",{className:"mobile-drawer-theme","data-toolbar-control":"drawer-theme",children:u.jsx(Nb,{value:m,onChange:re,placement:"mobile",autoloadImageMetadata:y,onAutoloadImageMetadataChange:le,proxyHttpOriginals:b,onProxyHttpOriginalsChange:he,compareOrderMode:w,onCompareOrderModeChange:pe,sourceColumns:S,tableLaunchStatus:v,launchSession:x,sourceColumnSwitching:p,onSourceColumnChange:Se})}),u.jsx("div",{className:"mobile-drawer-sort-control","data-toolbar-control":"drawer-sort",children:u.jsx(Tn,{value:t,onChange:Re=>A==null?void 0:A(Re),options:n,"aria-label":"Sort",triggerClassName:"mobile-pill mobile-pill-dropdown",panelClassName:"mobile-drawer-panel",disabled:r,searchable:"auto",searchPlaceholder:"Search sort options...",emptyMessage:"No matching sort options"})}),u.jsx("button",{"data-toolbar-control":"drawer-sort-dir",className:`mobile-pill mobile-pill-icon ${s?"opacity-50 cursor-not-allowed":""}`,onClick:Z,title:r?"Sorting disabled":o?"Shuffle":`Sort ${i==="desc"?"descending":"ascending"}`,"aria-label":o?"Shuffle":"Toggle sort direction","aria-disabled":s,disabled:s,children:u.jsx(vb,{isRandom:o,dir:i})}),u.jsx(wb,{variant:"drawer",dataToolbarControl:"drawer-filters",viewerActive:!1,filtersOpen:g,filtersRef:k,totalFilterCount:C,filterCount:R,starsInFilterList:E,starCounts:N,onToggleFilters:D,onOpenFilters:z,onToggleStarsIn:B,onClearFilters:O,onClearStarsIn:L}),u.jsx("button",{"data-toolbar-control":"drawer-refresh",className:`mobile-pill ${Ee?"opacity-50 cursor-not-allowed":""}`,title:xe,onClick:()=>{Ee||F==null||F()},"aria-label":"Refresh root folder","aria-disabled":Ee,disabled:Ee,children:"Refresh"}),u.jsx("button",{"data-toolbar-control":"drawer-left-panel",className:`mobile-pill ${U?"is-active":""}`,title:U?"Hide left panel (Ctrl+B)":"Show left panel (Ctrl+B)",onClick:T,"aria-pressed":U,"aria-label":"Toggle left panel",children:"Left"}),u.jsx("button",{"data-toolbar-control":"drawer-right-panel",className:`mobile-pill ${q?"is-active":""}`,title:q?"Hide right panel (Ctrl+Alt+B)":"Show right panel (Ctrl+Alt+B)",onClick:H,"aria-pressed":q,"aria-label":"Toggle right panel",children:"Right"}),l&&u.jsx("button",{"data-toolbar-control":"drawer-select",className:`mobile-pill mobile-pill-select ${a?"is-active":""}`,onClick:()=>G==null?void 0:G(),"aria-pressed":a,title:a?"Exit select mode":"Enter select mode",children:d}),we&&u.jsx("button",{"data-toolbar-control":"drawer-upload",className:`mobile-pill mobile-pill-upload ${h||f?"opacity-50 cursor-not-allowed":""}`,onClick:()=>!h&&!f&&(Y==null?void 0:Y()),"aria-label":"Upload images",title:f?"Uploading...":"Upload images","aria-disabled":h||f,disabled:h||f,children:f?"Uploading...":"Upload"})]})})}const ws={min:80,max:500,step:10};function jb(e){return Math.min(ws.max,Math.max(ws.min,e))}function dN({rootRef:e,onSearch:t,viewerActive:n,onBack:r,zoomPercent:s,onZoomPercentChange:i,currentLabel:o,itemCount:l,totalCount:a,sortSpec:d,metricKeys:f,metricDisplayNames:h,onSortChange:m,sortDisabled:y=!1,filterCount:b,onOpenFilters:w,starsInFilter:S,onToggleStarsIn:v,onClearStarsIn:x,onClearFilters:p,starCounts:g,viewMode:k,onViewMode:C,gridItemSize:R,onGridItemSize:E,leftOpen:N,rightOpen:j,onToggleLeft:P,onToggleRight:$,onRefreshRoot:U,refreshEnabled:q=!0,refreshDisabledReason:V,refreshBusy:A=!1,onPrevImage:Z,onNextImage:D,canPrevImage:z,canNextImage:B,searchDisabled:O=!1,searchPlaceholder:L,mobileSearchOpen:F=!1,onMobileSearchOpenChange:T,mobileDrawerOpen:H=!0,onMobileDrawerOpenChange:G,onUploadClick:Y,uploadBusy:re=!1,uploadDisabled:le=!1,themePreset:he,onThemePresetChange:pe,autoloadImageMetadata:Se,onAutoloadImageMetadataChange:we,proxyHttpOriginals:Ee,onProxyHttpOriginalsChange:xe,compareOrderMode:Re,onCompareOrderModeChange:ue,sourceColumns:Be,tableLaunchStatus:ke,launchSession:Ye,sourceColumnSwitching:et,onSourceColumnChange:be,multiSelectMode:X=!1,selectedCount:me=0,onToggleMultiSelectMode:Ne,syncIndicator:K}){const[W,fe]=c.useState(!1),ee=c.useRef(null),ce=c.useRef(null),Te=zd(Dd.narrow),de=zd(Dd.phone),ut=zd(Dd.toolbarCompact),Ke=Te&&!n,it=!(!!n&&ut),vt=!Ke,mt=!!n&&!de,In=!!(n&&r),Ln=!!(!n&&U)&&vt,Ft=!!(!n&&Y)&&vt,Lr=!n&&!Te,Rs=!!(!n&&Te),On=Rs,Or=Rs,At=Or&&F&&!O;c.useEffect(()=>{if(!W)return;const Me=Q=>{ee.current&&!ee.current.contains(Q.target)&&fe(!1)},I=Q=>{Q.key==="Escape"&&fe(!1)};return window.addEventListener("click",Me),window.addEventListener("keydown",I),()=>{window.removeEventListener("click",Me),window.removeEventListener("keydown",I)}},[W]),c.useEffect(()=>{W&&(!it||n)&&fe(!1)},[W,it,n]);const Fn=Me=>{i==null||i(Number(Me.currentTarget.value))};c.useEffect(()=>{if(O||!Or){F&&(T==null||T(!1));return}if(!F)return;const Me=window.requestAnimationFrame(()=>{var I;return(I=ce.current)==null?void 0:I.focus()});return()=>window.cancelAnimationFrame(Me)},[F,T,O,Or]);const jt=d??{kind:"builtin",key:"added",dir:"desc"},qe=jt.dir,pt=jt.kind==="builtin"&&jt.key==="random",on=n||y,hi=f!=null&&f.length?f.map(Me=>({value:`metric:${Me}`,label:ar(Me,h),keywords:[Me],disabled:y})):[],Ns=[{value:"builtin:added",label:"Date added",disabled:y},{value:"builtin:name",label:"Filename",disabled:y},{value:"builtin:random",label:"Random",disabled:y},...hi],To=[{label:"Layout",options:[{value:"layout:grid",label:"Grid"},{value:"layout:adaptive",label:"Justified rows"}]},{label:"Sort by",options:Ns}],mi=jt.kind==="metric"?`metric:${jt.key}`:`builtin:${jt.key}`,Jn=[{label:"Sort by",options:Ns}],dr=Ke&&!!Ne,fr=A||!q||!U,Fr=A?"Refreshing root folder…":q?"Refresh root folder":V||"Refresh unavailable in current mode",Io=X?me>0?`Done (${me})`:"Done":"Select",ln=Me=>{if(Me.startsWith("layout:")){const I=Me==="layout:adaptive"?"adaptive":"grid";C==null||C(I)}else{if(y)return;m==null||m(Ly(Me,jt))}},js=()=>{!m||y||m(pt?jt:{...jt,dir:qe==="desc"?"asc":"desc"})},Zn=S??[],Ar=Zn.length,pi=hN(b,Ar),An=fN(l,a),an=o||"Root";return u.jsxs("div",{ref:e,className:`toolbar-shell ${n?"toolbar-shell-viewer":""} ${de?"toolbar-shell-phone":""} ${ut?"toolbar-shell-compact":""} ${Ke?"toolbar-shell-mobile-browse":""} ${Ke&&H?"toolbar-shell-mobile-drawer-open":""} fixed top-0 left-0 right-0 h-12 grid grid-cols-[minmax(0,1fr)_minmax(0,1fr)_auto] items-center px-3 gap-3 bg-panel border-b border-border z-[var(--z-toolbar)] col-span-full row-start-1 select-none`,children:[u.jsxs("div",{className:"toolbar-left flex items-center gap-4 min-w-0",children:[u.jsxs("div",{className:"toolbar-scope flex items-center gap-3 min-w-0",children:[u.jsxs("div",{className:"toolbar-scope-text flex flex-col min-w-0 leading-tight",children:[u.jsx("span",{className:"toolbar-scope-label text-[10px] uppercase tracking-widest text-muted",children:"Scope"}),u.jsx("span",{className:"text-sm font-medium text-text truncate",title:an,children:an})]}),u.jsx("span",{className:"toolbar-count text-xs text-muted whitespace-nowrap tabular-nums",title:An??void 0,"aria-hidden":An===null,children:An??" "})]}),vt&&u.jsxs("div",{className:"toolbar-sort flex items-center gap-2",children:[u.jsxs("div",{className:`toolbar-sort-controls flex items-center gap-2 ${it?"":"toolbar-control-hidden"}`,"aria-hidden":!it,children:[u.jsx(Tn,{value:mi,onChange:ln,options:To,title:"Sort and layout options","aria-label":"Sort and layout",triggerClassName:"toolbar-sort-trigger min-w-[110px]",disabled:on||!it,searchable:"auto",searchPlaceholder:"Search sort options...",emptyMessage:"No matching sort options"}),u.jsx("button",{className:"toolbar-sort-dir btn btn-icon",onClick:js,title:y?"Sorting disabled":pt?"Shuffle":`Sort ${qe==="desc"?"descending":"ascending"}`,"aria-label":pt?"Shuffle":"Toggle sort direction","aria-disabled":on||!it,"aria-hidden":!it,disabled:on||!it,tabIndex:it?0:-1,children:u.jsx(vb,{isRandom:pt,dir:qe})})]}),u.jsx(wb,{viewerActive:!!n,suppressed:!it,filtersOpen:W,filtersRef:ee,totalFilterCount:pi,filterCount:b,starsInFilterList:Zn,starCounts:g,onToggleFilters:()=>{!it||n||fe(Me=>!Me)},onOpenFilters:w,onToggleStarsIn:v,onClearFilters:p,onClearStarsIn:x}),u.jsx("div",{className:"toolbar-slot toolbar-slot-refresh","data-toolbar-slot":"refresh",children:u.jsx("button",{"data-toolbar-control":"refresh",className:`btn btn-icon ml-1 ${Ln?"":"toolbar-control-hidden"} ${fr?"opacity-50 cursor-not-allowed":""}`,title:Fr,onClick:()=>{!Ln||fr||U==null||U()},"aria-label":"Refresh root folder","aria-disabled":!Ln||fr,"aria-hidden":!Ln,disabled:!Ln||fr,tabIndex:Ln?0:-1,children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M21 12a9 9 0 1 1-2.64-6.36"}),u.jsx("path",{d:"M21 3v6h-6"})]})})})]}),(In||vt)&&u.jsx("div",{className:"toolbar-slot toolbar-slot-back","data-toolbar-slot":"back",children:u.jsxs("button",{"data-toolbar-control":"back",className:`toolbar-back-btn btn btn-sm ${In?"":"toolbar-control-hidden"}`,onClick:()=>{In&&(r==null||r())},title:"Back to grid","aria-label":"Back to grid","aria-hidden":!In,disabled:!In,tabIndex:In?0:-1,children:[u.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:u.jsx("path",{d:"M15 18l-6-6 6-6"})}),u.jsx("span",{className:"toolbar-back-label",children:"Back"})]})})]}),u.jsx("div",{className:"toolbar-center flex items-center gap-3 justify-center min-w-0",children:n?u.jsxs(u.Fragment,{children:[u.jsx("input",{type:"range",min:5,max:800,step:1,value:Math.round(Math.max(5,Math.min(800,s??100))),onInput:Fn,onChange:Fn,className:"zoom-slider","aria-label":"Zoom level"}),u.jsxs("span",{className:"text-xs text-muted min-w-[42px] text-right",children:[Math.round(s??100),"%"]})]}):E&&u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("span",{className:"text-xs text-muted",children:"Size"}),u.jsx("input",{type:"range",min:ws.min,max:ws.max,step:ws.step,value:R??220,onChange:Me=>E(Number(Me.target.value)),className:"w-28 h-1.5 bg-border rounded-full appearance-none cursor-pointer hover:bg-hover transition-colors [&::-webkit-slider-thumb]:appearance-none [&::-webkit-slider-thumb]:w-3 [&::-webkit-slider-thumb]:h-3 [&::-webkit-slider-thumb]:rounded-full [&::-webkit-slider-thumb]:bg-text [&::-moz-range-thumb]:w-3 [&::-moz-range-thumb]:h-3 [&::-moz-range-thumb]:rounded-full [&::-moz-range-thumb]:bg-text [&::-moz-range-thumb]:border-0","aria-label":"Thumbnail size"})]})}),u.jsxs("div",{className:"toolbar-right flex items-center gap-2 justify-end",children:[u.jsx("div",{className:"toolbar-slot toolbar-slot-nav","data-toolbar-slot":"nav",children:u.jsxs("div",{className:`toolbar-nav flex items-center gap-1 ${mt?"":"toolbar-control-hidden"}`,"aria-hidden":!mt,children:[u.jsx("button",{className:`btn btn-icon ${z?"":"opacity-40 cursor-not-allowed"}`,title:"Previous image (A / ←)",onClick:()=>mt&&z&&(Z==null?void 0:Z()),"aria-label":"Previous image","aria-disabled":!mt||!z,disabled:!mt||!z,tabIndex:mt?0:-1,children:u.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:u.jsx("path",{d:"M15 18l-6-6 6-6"})})}),u.jsx("button",{className:`btn btn-icon ${B?"":"opacity-40 cursor-not-allowed"}`,title:"Next image (D / →)",onClick:()=>mt&&B&&(D==null?void 0:D()),"aria-label":"Next image","aria-disabled":!mt||!B,disabled:!mt||!B,tabIndex:mt?0:-1,children:u.jsx("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:u.jsx("path",{d:"M9 6l6 6-6 6"})})})]})}),vt&&u.jsxs("div",{className:"toolbar-panels flex items-center gap-1",children:[u.jsx("button",{className:`btn btn-icon ${N?"":"opacity-50"}`,title:N?"Hide left panel (Ctrl+B)":"Show left panel (Ctrl+B)",onClick:P,"aria-pressed":N,"aria-label":"Toggle left panel",children:u.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:[u.jsx("rect",{x:"3",y:"5",width:"6",height:"14",rx:"1.5"}),u.jsx("rect",{x:"11",y:"5",width:"10",height:"14",rx:"1.5"})]})}),u.jsx("button",{className:`btn btn-icon ${j?"":"opacity-50"}`,title:j?"Hide right panel (Ctrl+Alt+B)":"Show right panel (Ctrl+Alt+B)",onClick:$,"aria-pressed":j,"aria-label":"Toggle right panel",children:u.jsxs("svg",{width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",children:[u.jsx("rect",{x:"15",y:"5",width:"6",height:"14",rx:"1.5"}),u.jsx("rect",{x:"3",y:"5",width:"10",height:"14",rx:"1.5"})]})})]}),vt&&u.jsx("div",{className:"toolbar-slot toolbar-slot-upload","data-toolbar-slot":"upload",children:u.jsxs("button",{"data-toolbar-control":"upload",className:`btn toolbar-upload-btn ${Ft?"":"toolbar-control-hidden"} ${le||re?"opacity-50 cursor-not-allowed":""}`,onClick:()=>Ft&&!le&&!re&&(Y==null?void 0:Y()),"aria-label":"Upload images",title:re?"Uploading…":"Upload images","aria-disabled":!Ft||le||re,"aria-hidden":!Ft,disabled:!Ft||le||re,tabIndex:Ft?0:-1,children:[u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M12 16V5"}),u.jsx("path",{d:"M7 10l5-5 5 5"}),u.jsx("path",{d:"M4 19h16"})]}),u.jsx("span",{className:"toolbar-upload-label",children:re?"Uploading…":"Upload"})]})}),K&&u.jsx(RR,{...K,isNarrow:Te||ut}),Te&&u.jsx("div",{className:"toolbar-slot toolbar-slot-search-toggle","data-toolbar-slot":"search-toggle",children:u.jsx("button",{"data-toolbar-control":"search-toggle",className:`btn btn-icon ${On?"":"toolbar-control-hidden"} ${F?"btn-active":""} ${O?"opacity-50 cursor-not-allowed":""}`,"aria-label":F?"Close search":"Open search",title:O?"Search disabled":F?"Close search":"Search",onClick:()=>On&&!O&&(T==null?void 0:T(!F)),disabled:!On||O,"aria-hidden":!On,tabIndex:On?0:-1,children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("circle",{cx:"11",cy:"11",r:"7"}),u.jsx("path",{d:"M21 21l-4.35-4.35"})]})})}),Ke&&u.jsx("div",{className:"toolbar-slot toolbar-slot-drawer-toggle","data-toolbar-slot":"drawer-toggle",children:u.jsx("button",{"data-toolbar-control":"drawer-toggle",className:`btn btn-icon ${H?"btn-active":""}`,"aria-label":H?"Hide mobile toolbar controls":"Show mobile toolbar controls",title:H?"Hide controls":"Show controls","aria-expanded":H,onClick:()=>G==null?void 0:G(!H),children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M4 7h16"}),u.jsx("path",{d:"M4 12h16"}),u.jsx("path",{d:"M4 17h16"})]})})}),Te?null:u.jsx("div",{className:"toolbar-slot toolbar-slot-search-desktop","data-toolbar-slot":"search-desktop",children:u.jsx("div",{className:`toolbar-search toolbar-search-desktop w-[240px] ${Lr?"":"toolbar-control-hidden"}`,children:u.jsx("input",{"data-toolbar-control":"search-desktop",ref:ce,"aria-label":"Search filename, tags, notes",placeholder:O?L??"Search disabled":"Search...",onChange:Me=>t(Me.target.value),className:"toolbar-search-input input w-full focus:w-full transition-all duration-200 select-text",disabled:!Lr||O,tabIndex:Lr?0:-1,"aria-hidden":!Lr})})})]}),Or&&u.jsx("div",{className:`toolbar-search-row ${At?"toolbar-search-row-active":"toolbar-search-row-hidden"}`,"data-toolbar-slot":"search-row","aria-hidden":!At,children:u.jsx("input",{"data-toolbar-control":"search-mobile",ref:ce,"aria-label":"Search filename, tags, notes","aria-hidden":!At,placeholder:L??"Search...",onChange:Me=>t(Me.target.value),className:`toolbar-search-input-mobile input input-lg w-full select-text ${At?"":"toolbar-control-hidden"}`,disabled:!At,tabIndex:At?0:-1})}),Ke&&H&&u.jsx(cN,{viewMode:k,currentSort:mi,sortOnlyOptions:Jn,sortDisabled:y,sortControlsDisabled:on,sortDir:qe,isRandom:pt,showSelectModeToggle:dr,multiSelectMode:X,selectModeLabel:Io,uploadBusy:re,uploadDisabled:le,themePreset:he,autoloadImageMetadata:Se,proxyHttpOriginals:Ee,compareOrderMode:Re,sourceColumns:Be,tableLaunchStatus:ke,launchSession:Ye,sourceColumnSwitching:et,filtersOpen:W,filtersRef:ee,totalFilterCount:pi,filterCount:b,starsInFilterList:Zn,starCounts:g,refreshEnabled:q,refreshDisabledReason:V,refreshBusy:A,leftOpen:N,rightOpen:j,onViewMode:C,onSortChange:Me=>m==null?void 0:m(Ly(Me,jt)),onToggleSortDir:js,onToggleFilters:()=>{n||fe(Me=>!Me)},onOpenFilters:w,onToggleStarsIn:v,onClearFilters:p,onClearStarsIn:x,onRefreshRoot:U,onToggleLeft:P,onToggleRight:$,onToggleMultiSelectMode:Ne,onUploadClick:Y,onThemePresetChange:pe,onAutoloadImageMetadataChange:we,onProxyHttpOriginalsChange:xe,onCompareOrderModeChange:ue,onSourceColumnChange:be})]})}function fN(e,t){if(typeof e!="number")return null;const n=e.toLocaleString();if(typeof t!="number")return`${n} items`;const r=t.toLocaleString();return t===e?`${n} items`:`${n} / ${r} items`}function hN(e,t){return typeof e=="number"?e:t>0?1:0}function Ly(e,t){if(e.startsWith("metric:")){const n=e.slice(7);return n?{kind:"metric",key:n,dir:t.dir}:t}if(e.startsWith("builtin:")){const n=e.slice(8);if(n==="name"||n==="added"||n==="random")return{kind:"builtin",key:n,dir:t.dir}}return t}class jn extends Error{constructor(n,r,s,i){super(r);ge(this,"status");ge(this,"url");ge(this,"body");this.name="FetchError",this.status=n,this.url=s,this.body=i}}function mN(e){const t=e.trim();return t.startsWith("{")||t.startsWith("[")}function pN(e,t){if(!e)return null;if(t.includes("application/json")||mN(e))try{return JSON.parse(e)}catch{return e}return e}async function _b(e){const t=await e.text().catch(()=>"");return pN(t,e.headers.get("content-type")||"")}function gN(e){if(!Array.isArray(e))return null;const t=e.flatMap(r=>{if(!r||typeof r!="object")return[];const s=r,i=typeof s.msg=="string"?s.msg:null;if(!i)return[];const o=Array.isArray(s.loc)?s.loc.map(String).join("."):null;return o?[`${o}: ${i}`]:[i]});if(t.length===0)return null;const n=t.length>3?`; +${t.length-3} more`:"";return`validation failed: ${t.slice(0,3).join("; ")}${n}`}function Pb(e,t,n){if(t&&typeof t=="object"){const r=t,s=typeof r.error=="string"?r.error:null,i=typeof r.message=="string"?r.message:null;if(s&&i)return`${s}: ${i}`;if(s)return s;if(i)return i;if(typeof r.detail=="string")return r.detail;const o=gN(r.detail);if(o)return o}return typeof t=="string"&&t?t:`HTTP ${e} for ${n}`}function Tb(e,t){const n=new AbortController;let r;const s=()=>n.abort(t==null?void 0:t.reason);return e&&(r=window.setTimeout(()=>n.abort(),e)),t!=null&&t.aborted?n.abort(t.reason):t==null||t.addEventListener("abort",s,{once:!0}),{signal:n.signal,abort:()=>n.abort(),cleanup:()=>{r&&window.clearTimeout(r),t==null||t.removeEventListener("abort",s)}}}function Xe(e,t={}){const{timeoutMs:n,signal:r,...s}=t,i=Tb(n,r);return{promise:fetch(e,{...s,signal:i.signal}).then(async l=>{const a=await _b(l);if(!l.ok)throw new jn(l.status,Pb(l.status,a,e),e,a);return a}).finally(()=>{i.cleanup()}),abort:i.abort}}function wi(e,t={}){const{timeoutMs:n,signal:r,...s}=t,i=Tb(n,r);return{promise:fetch(e,{...s,signal:i.signal}).then(async l=>{if(!l.ok){const a=await _b(l);throw new jn(l.status,Pb(l.status,a,e),e,a)}return l.blob()}).finally(()=>{i.cleanup()}),abort:i.abort}}function Ib(){return{category:"decode",message:"Browser could not decode this image.",retryable:!1}}function $l(e){if(!e||typeof e!="object")return!1;const t=e;if(t.name==="AbortError")return!0;const n=typeof t.message=="string"?t.message.toLowerCase():"";return n.includes("abort")||n.includes("cancel")}function yN(e){return e.status===403?"permission":e.status===422?"decode":e.status===504?"timeout":e.status===502?"upstream":e.status===404?e.message.toLowerCase().includes("remote")?"remote_not_found":"local_not_found":e.status>=500?"read":"unknown"}function Vu(e,t="Media failed to load."){if($l(e))return{category:"aborted",message:"Media request was cancelled.",retryable:!1};if(e instanceof jn){const n=yN(e);return{category:n,status:e.status,message:e.message||t,retryable:n!=="decode"}}return e instanceof TypeError?{category:"network",message:e.message||t,retryable:!0}:e instanceof Error?{category:"unknown",message:e.message||t,retryable:!0}:{category:"unknown",message:t,retryable:!0}}function Qm(e){return e.category==="permission"?"Permission denied.":e.category==="timeout"?"Remote source timed out.":e.category==="decode"?"Could not decode this image.":e.category==="local_not_found"?"File not found.":e.category==="remote_not_found"?"Remote source not found.":e.category==="upstream"?"Remote source failed.":e.category==="network"?"Network request failed.":e.message}function vN(e){return typeof e=="object"&&e!==null&&"promise"in e}function Oy(e){return vN(e)?{promise:e.promise,abort:e.abort}:{promise:e}}class Lb{constructor(t){ge(this,"store",new Map);ge(this,"inflight",new Map);ge(this,"totalBytes",0);this.maxBytes=t}getMaxBytes(){return this.maxBytes}getTotalBytes(){return this.totalBytes}getSize(){return this.store.size}has(t){return this.store.has(t)}isInflight(t){return this.inflight.has(t)}get(t){const n=this.store.get(t);if(n)return this.store.delete(t),this.store.set(t,n),n.blob}evictIfNeeded(t){for(;this.totalBytes+t>this.maxBytes&&this.store.size>0;){const n=this.store.keys().next().value;if(n==null)break;const r=this.store.get(n);r&&(this.totalBytes-=r.size),this.store.delete(n)}}set(t,n){const r=n.size||0;if(!(r>this.maxBytes)){if(this.store.has(t)){const s=this.store.get(t);this.totalBytes-=s.size,this.store.delete(t)}this.evictIfNeeded(r),this.store.set(t,{blob:n,size:r}),this.totalBytes+=r}}getOrFetch(t,n){const r=this.get(t);if(r)return Promise.resolve(r);const s=this.inflight.get(t);if(s)return s.promise;let i;try{i=n()}catch(d){return Promise.reject(d)}const{promise:o,abort:l}=Oy(i),a=o.then(d=>(this.set(t,d),d)).finally(()=>{this.inflight.delete(t)});return this.inflight.set(t,{promise:a,abort:l}),a}prefetch(t,n){if(this.store.has(t)||this.inflight.has(t))return;const r=n(),{promise:s,abort:i}=Oy(r),o=s.then(l=>(this.set(t,l),l)).catch(()=>new Blob).finally(()=>{this.inflight.delete(t)});this.inflight.set(t,{promise:o,abort:i})}cancelPrefetch(t){const n=this.inflight.get(t);if(n!=null&&n.abort)try{n.abort()}catch{}this.inflight.delete(t)}clear(){for(const[t,n]of this.inflight)if(n.abort)try{n.abort()}catch{}this.inflight.clear(),this.store.clear(),this.totalBytes=0}evictPrefix(t){const n=(()=>{const s=t?`/${t.replace(/^\/+/,"")}`:"/";return s==="/"?"/":s.replace(/\/+$/,"")})(),r=s=>{const i=s.startsWith("/")?s.replace(/\/+$/,""):`/${s.replace(/\/+$/,"")}`;return n==="/"?!0:i===n||i.startsWith(`${n}/`)};for(const[s,i]of Array.from(this.store.entries()))r(s)&&(this.totalBytes-=i.size,this.store.delete(s));for(const[s,i]of Array.from(this.inflight.entries()))if(r(s)){if(i.abort)try{i.abort()}catch{}this.inflight.delete(s)}this.totalBytes<0&&(this.totalBytes=0)}}const Wr=new Lb(60*1024*1024),Wu=new Lb(20*1024*1024),Xq=new Lb(40*1024*1024),wN=40*1024*1024,xN=256;function bN(e){return e==="viewer"||e==="compare"}let Kq=0;function Jq(e){return{"x-lenslet-thumb-priority":e,"x-lenslet-thumb-generation":String(Kq)}}function Zq(e){return zn("thumb",()=>wi(Fy(e),{headers:Jq("visible")}))}function Yq(e){return e instanceof Blob?e.size===0:e instanceof jn&&e.status===503}function Fy(e){return ze(`/thumb?path=${encodeURIComponent(e)}`)}function $d(e){return ze(`/file?path=${encodeURIComponent(e)}`)}const Vq={viewer:2400,compare:1600};function Qq(e,t){return ze(`/preview?path=${encodeURIComponent(e)}&size=${Vq[t]}`)}function Hq(e,t){return`${e}@${Vq[t]}`}const Ay="lenslet.client_id.session",Ob="lenslet.last_event_id",SN=1e3,kN=3e4,CN=5;let mh=null,lu=null,Dy=0,qi=null,Qi=0,Mc=!0,qu=!1;function Fb(){return typeof window<"u"&&typeof EventSource<"u"}function EN(e,t){if(!e)return null;try{return e.getItem(t)}catch{return null}}function MN(e,t,n){if(e)try{e.setItem(t,n)}catch{}}function RN(){if(typeof navigator>"u")return"server";const e=navigator.userAgent||"",t=navigator.language||"",n=navigator.platform||"",r=typeof Intl<"u"&&Intl.DateTimeFormat().resolvedOptions().timeZone||"",s=typeof screen<"u"?`${screen.width}x${screen.height}x${screen.colorDepth}`:"";return[e,t,n,r,s].join("|")}function NN(e){let t=2166136261;for(let n=0;n<e.length;n+=1)t^=e.charCodeAt(n),t=t*16777619>>>0;return t.toString(16).padStart(8,"0")}function jN(){return typeof crypto<"u"&&"randomUUID"in crypto?crypto.randomUUID():`client_${Math.random().toString(36).slice(2,10)}_${Date.now()}`}function Bd(e){return mh=e,e}function Gm(e){if(typeof window>"u")return null;try{return e==="local"?window.localStorage:window.sessionStorage}catch{return null}}function Ab(){if(mh)return mh;const e=Gm("session"),t=EN(e,Ay);if(t)return Bd(t);if(e){const r=jN();return MN(e,Ay,r),Bd(r)}const n=`fp_${NN(RN())}_${Math.random().toString(36).slice(2,8)}`;return Bd(n)}function Db(e="lenslet"){Dy+=1;const t=typeof crypto<"u"&&"randomUUID"in crypto?crypto.randomUUID():`nonce_${Math.random().toString(36).slice(2,10)}_${Date.now()}_${Dy}`;return`${e}:${Ab()}:${t}`}function _N(){if(lu!=null)return lu;if(typeof window>"u")return null;const e=Gm("local");if(!e)return null;try{const t=e.getItem(Ob);if(!t)return null;const n=Number(t);return!Number.isFinite(n)||n<=0?null:(lu=n,n)}catch{return null}}function PN(e){if(!Number.isFinite(e)||e<=0||(lu=e,typeof window>"u"))return;const t=Gm("local");if(t)try{t.setItem(Ob,String(e))}catch{}}function TN(){if(typeof window>"u")return ze("/events");const e=new URL(ze("/events"),window.location.origin),t=_N();return t!=null&&Number.isFinite(t)&&e.searchParams.set("last_event_id",String(t)),e.toString()}function IN(e){if(!e)return null;try{return JSON.parse(e)}catch{return null}}let Un=null,zb="idle";const ph=new Set,gh=new Set,yh=new Set,vh=new Set;function Gi(e){zb=e;for(const t of gh)t(e)}function Ym(e){if(qu!==e){qu=e;for(const t of yh)t(e)}}function Xm(){qi!=null&&(window.clearTimeout(qi),qi=null)}function LN(){Qi=0,Xm()}function ON(){if(!Mc||qi!=null)return;Qi+=1;const e=Math.min(SN*Math.pow(2,Qi-1),kN);Qi>=CN?(Gi("offline"),Ym(!0)):Gi("reconnecting"),qi=window.setTimeout(()=>{qi=null,$b()},e)}function $b(){if(!Mc||!Fb()||(Un&&Un.readyState===EventSource.CLOSED&&(Un.close(),Un=null),Un))return;Qi>0?Gi("reconnecting"):Gi("connecting");const e=new EventSource(TN());Un=e;const t=n=>r=>{const s=IN(r.data);if(!s)return;const i=r.lastEventId?Number(r.lastEventId):null,o=i!=null&&Number.isFinite(i)?i:null;o!=null&&PN(o);for(const l of ph)l({type:n,id:o,data:s})};e.addEventListener("item-updated",t("item-updated")),e.addEventListener("metrics-updated",t("metrics-updated")),e.addEventListener("persistence",t("persistence")),e.addEventListener("presence",t("presence")),e.addEventListener("table-source",t("table-source")),e.onopen=()=>{LN(),Ym(!1),Gi("live")},e.onerror=()=>{Un===e&&(e.close(),Un=null,ON())}}function FN(){Mc=!0,Fb()&&(Xm(),$b())}function AN(){Mc=!1,Xm(),Qi=0,Un&&(Un.close(),Un=null),Ym(!1),Gi("offline")}function DN(e){return ph.add(e),()=>{ph.delete(e)}}function zN(e){return gh.add(e),e(zb),()=>{gh.delete(e)}}function $N(e){return yh.add(e),e(qu),()=>{yh.delete(e)}}function zy(){for(const e of vh)e()}function BN(e){return vh.add(e),()=>vh.delete(e)}function UN(){return qu}function Bb(e){FM(e)}function HN(e,t){const n=JSON.stringify(t),r=ze(e);if(typeof navigator<"u"&&typeof navigator.sendBeacon=="function")try{if(navigator.sendBeacon(r,new Blob([n],{type:"application/json"})))return!0}catch{}if(typeof fetch!="function")return!1;try{return fetch(r,{method:"POST",headers:{"Content-Type":"application/json"},body:n,keepalive:!0}),!0}catch{return!1}}function KN(e,t){return HN("/presence/leave",{gallery_id:e,lease_id:t})}function Ud(e,t){return Xe(ze(e),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(t)}).promise}function Hd(e=0,t="browse"){const n=Ab();return{"X-Lenslet-Client-Session":t==="browse"?n:`${n}:${t}`,"X-Lenslet-Query-Revision":String(e)}}function Ha(e,t){const n=new URLSearchParams({path:e});return t!=null&&t.recursive&&n.set("recursive","1"),t!=null&&t.countOnly&&n.set("count_only","1"),(t==null?void 0:t.offset)!==void 0&&n.set("offset",String(t.offset)),(t==null?void 0:t.limit)!==void 0&&n.set("limit",String(t.limit)),n.toString()}function VN(e){return e.total_items??e.items.length}const Fe={getFolder:(e,t)=>zn("folders",()=>Xe(ze(`/folders?${Ha(e,t)}`))).promise,getFolderCount:e=>zn("folders",()=>Xe(ze(`/folders?${Ha(e,{recursive:!0,countOnly:!0})}`))).promise.then(VN),getFolderFields:e=>{const t=Ha(e,{recursive:!0});return zn("folders",()=>Xe(ze(`/folders/fields?${t}`))).promise},getFolderFacets:(e,t)=>{const n={recursive:(t==null?void 0:t.recursive)??!0};return zn("folders",()=>Xe(ze(`/folders/facets?${Ha(e,n)}`),{headers:Hd()})).promise},queryFolderFacets:(e,t)=>{const n=zn("folders",()=>Xe(ze("/folders/facets"),{method:"POST",headers:{"Content-Type":"application/json",...Hd(t==null?void 0:t.queryRevision,t==null?void 0:t.analysisChannel)},body:JSON.stringify(e),signal:t==null?void 0:t.signal})),r=t==null?void 0:t.signal;if(!r)return n.promise;const s=()=>{var i;return(i=n.abort)==null?void 0:i.call(n)};return r.aborted?(s(),n.promise):(r.addEventListener("abort",s,{once:!0}),n.promise.finally(()=>{r.removeEventListener("abort",s)}))},queryFolder:(e,t)=>{const n=zn("folders",()=>Xe(ze("/folders/query"),{method:"POST",headers:{"Content-Type":"application/json",...Hd(t==null?void 0:t.queryRevision,t==null?void 0:t.analysisChannel)},body:JSON.stringify(e),signal:t==null?void 0:t.signal})),r=t==null?void 0:t.signal;if(!r)return n.promise;const s=()=>{var i;return(i=n.abort)==null?void 0:i.call(n)};return r.aborted?(s(),n.promise):(r.addEventListener("abort",s,{once:!0}),n.promise.finally(()=>{r.removeEventListener("abort",s)}))},getFolderPaths:()=>Xe(ze("/folders/paths")).promise,search:(e,t)=>{const n=new URLSearchParams;return e&&n.set("q",e),t&&n.set("path",t),Xe(ze(`/search?${n}`)).promise},getEmbeddings:()=>Xe(ze("/embeddings")).promise,searchEmbeddings:e=>Xe(ze("/embeddings/search"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).promise,refreshFolder:e=>{const t=new URLSearchParams({path:e});return Xe(ze(`/refresh?${t}`),{method:"POST"}).promise},getSidecar:e=>Xe(ze(`/item?path=${encodeURIComponent(e)}`)).promise,getSyncState:()=>Xe(ze("/sync/state")).promise,getItemDetail:e=>Xe(ze(`/item/detail?path=${encodeURIComponent(e)}`)).promise,patchSidecar:(e,t,n)=>{const s={"Content-Type":"application/json","Idempotency-Key":(n==null?void 0:n.idempotencyKey)??Db("patch")};return(n==null?void 0:n.ifMatch)!=null&&(s["If-Match"]=String(n.ifMatch)),Xe(ze(`/item?path=${encodeURIComponent(e)}`),{method:"PATCH",headers:s,body:JSON.stringify(t)}).promise},getMetadata:e=>Xe(ze(`/metadata?path=${encodeURIComponent(e)}`)).promise,putSidecar:(e,t)=>Xe(ze(`/item?path=${encodeURIComponent(e)}`),{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(t)}).promise,getHealth:()=>Xe(ze("/health")).promise,getTableSourceColumns:()=>Xe(ze("/table/source-columns")).promise,switchTableSourceColumn:e=>Xe(ze("/table/source-column"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({source_column:e})}).promise,joinPresence:(e,t)=>Ud("/presence/join",{gallery_id:e,lease_id:t}),movePresence:(e,t,n)=>Ud("/presence/move",{from_gallery_id:e,to_gallery_id:t,lease_id:n}),leavePresence:(e,t)=>Ud("/presence/leave",{gallery_id:e,lease_id:t}),getThumb:e=>{const t=()=>Wu.getOrFetch(e,()=>Zq(e));return t().then(n=>Yq(n)?t():n,n=>Yq(n)?t():Promise.reject(n))},advanceThumbGeneration:()=>(Kq+=1,Kq),getHoverPreview:e=>{const t=Wr.get(e);return t?{promise:Promise.resolve(t)}:zn("file",()=>wi($d(e)))},prefetchThumb:(e,t="near")=>{AM().queued.thumb>=xN||Wu.prefetch(e,()=>zn("thumb",()=>wi(Fy(e),{headers:Jq(t)})))},getFile:e=>Wr.getOrFetch(e,()=>zn("file",()=>wi($d(e)))),exportComparison:e=>wi(ze("/export-comparison"),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).promise,getPreview:(e,t)=>Xq.getOrFetch(Hq(e,t),()=>zn("file",()=>wi(Qq(e,t)))),prefetchPreview:async(e,t)=>{if(!bN(t))return;const n=Hq(e,t);if(!(Xq.has(n)||Xq.isInflight(n)))try{const r=await zn("file",()=>wi(Qq(e,t),{headers:{"x-lenslet-prefetch":t}})).promise;r.size<=wN&&Xq.set(n,r)}catch{}},cancelPrefetch:e=>{Wr.cancelPrefetch(e)},getViews:()=>Xe(ze("/views")).promise,saveViews:e=>Xe(ze("/views"),{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify(e)}).promise};function WN(e){const t=e?`/${e.replace(/^\/+/,"")}`:"/";return t==="/"?t:t.replace(/\/+$/,"")}function qN(e,t){const n=e.startsWith("/")?e.replace(/\/+$/,""):`/${e.replace(/\/+$/,"")}`;return t==="/"||n===t||n.startsWith(`${t}/`)}class QN{constructor(t,n){ge(this,"entries",new Map);ge(this,"totalBytes",0);this.limits=t,this.objectUrls=n}peekExisting(t){const n=this.entries.get(t);return n?{url:n.url,decoded:n.decoded}:null}acquireExisting(t){const n=this.entries.get(t);return n?(this.touch(n),this.lease(n)):null}acquire(t,n){const r=this.entries.get(t);if((r==null?void 0:r.blob)===n)return this.touch(r),this.lease(r);r&&this.retire(r);const s={key:t,blob:n,url:this.objectUrls.createObjectURL(n),bytes:n.size,refs:0,decoded:!1,retired:!1,revoked:!1};this.entries.set(t,s),this.totalBytes+=s.bytes;const i=this.lease(s);return this.trim(),i}evictPrefix(t){const n=WN(t);for(const[r,s]of Array.from(this.entries.entries()))qN(r,n)&&this.retire(s)}clear(){for(const t of Array.from(this.entries.values()))this.retire(t)}getSize(){return this.entries.size}lease(t){t.refs+=1;let n=!1;return{url:t.url,get decoded(){return t.decoded},markDecoded:()=>{t.revoked||(t.decoded=!0)},release:()=>{n||(n=!0,t.refs=Math.max(0,t.refs-1),t.retired&&t.refs===0&&this.finalize(t),this.trim())}}}touch(t){this.entries.get(t.key)===t&&(this.entries.delete(t.key),this.entries.set(t.key,t))}retire(t){t.retired||(t.retired=!0,this.entries.get(t.key)===t&&this.entries.delete(t.key),t.refs===0&&this.finalize(t))}finalize(t){if(!t.revoked){t.revoked=!0,this.totalBytes=Math.max(0,this.totalBytes-t.bytes);try{this.objectUrls.revokeObjectURL(t.url)}catch{}}}trim(){for(;this.entries.size>this.limits.maxEntries||this.totalBytes>this.limits.maxBytes;){const t=Array.from(this.entries.values()).find(n=>n.refs===0);if(!t)return;this.retire(t)}}}const zi=new QN({maxEntries:400,maxBytes:20*1024*1024},{createObjectURL:e=>URL.createObjectURL(e),revokeObjectURL:e=>URL.revokeObjectURL(e)});function GN(e,t){const n=c.useRef(null),[r,s]=c.useState(0),i=c.useCallback(()=>s(f=>f+1),[]),[o,l]=c.useState(()=>{const f=zi.peekExisting(e);return f?{status:"ready",url:f.url,decoded:f.decoded}:{status:"idle"}}),a=c.useCallback(()=>{var f;(f=n.current)==null||f.markDecoded(),l(h=>h.status==="ready"?{...h,decoded:!0}:h)},[]),d=c.useCallback(f=>{const h=n.current;n.current=f,l({status:"ready",url:f.url,decoded:f.decoded}),h==null||h.release()},[]);return c.useLayoutEffect(()=>{if(o.status!=="ready"||n.current)return;const f=zi.acquireExisting(e);if((f==null?void 0:f.url)===o.url){n.current=f;return}f==null||f.release(),l({status:"idle"})},[e,o]),c.useEffect(()=>{if(n.current||!t)return;const f=zi.acquireExisting(e);if(f){d(f);return}let h=!0;return l({status:"loading"}),Fe.getThumb(e).then(m=>{h&&d(zi.acquire(e,m))}).catch(m=>{if(h){if($l(m)){l({status:"idle"});return}l({status:"error",error:Vu(m,"Thumbnail failed to load."),retry:i})}}),()=>{h=!1}},[d,t,e,i,r]),c.useEffect(()=>()=>{var f;(f=n.current)==null||f.release(),n.current=null},[]),o.status==="ready"?{...o,markDecoded:a}:o}async function Ub(e){await e.decode()}function YN({path:e,name:t,onClick:n,selected:r,highlighted:s,highlightKey:i,selectionOrder:o=null,displayW:l,displayH:a,fit:d,ioRoot:f,isScrolling:h,priority:m}){const y=c.useRef(null),[b,w]=c.useState(!1),[S,v]=c.useState(!1),[x,p]=c.useState(()=>m?e:null),g=GN(e,x===e),k=g.status==="ready"?g.url:null,C=g.status==="ready"?g.decoded:!1,R=S||C,E=g.status==="ready"?g.markDecoded:null,N=g.status==="error"?g.error:null,j=g.status==="error"?g.retry:null,P=c.useCallback(U=>{Ub(U).catch(()=>{}).then(()=>{var q;(q=y.current)!=null&&q.contains(U)&&(U.currentSrc||U.src)===k&&(v(!0),E==null||E(),hy(e))})},[E,e,k]);c.useEffect(()=>{const U=y.current;if(!U)return;const q=new IntersectionObserver(V=>{for(const A of V)A.target===U&&w(A.isIntersecting||A.intersectionRatio>0)},{root:f??null,rootMargin:"200px 0px",threshold:.01});return q.observe(U),()=>{q.unobserve(U),q.disconnect()}},[f]),c.useEffect(()=>{p(m?e:null)},[e,m]),c.useEffect(()=>{x!==e&&(b&&!h||m)&&p(e)},[b,h,e,m,x]),c.useEffect(()=>{var q;if(!k){v(!1);return}if(C){v(!0),hy(e);return}const U=(q=y.current)==null?void 0:q.querySelector("img");U&&U.complete&&U.naturalWidth>0?P(U):v(!1)},[C,e,P,k]);const $=["absolute inset-0 bg-surface rounded-[10px] overflow-hidden select-none","border border-border-subtle shadow-sm",r?"ring-2 ring-accent border-transparent":"transition-[border-color,box-shadow] duration-150 hover:border-border-strong hover:shadow-md",s?"thumb-updated-ring":""].filter(Boolean).join(" ");return u.jsxs("div",{ref:y,"data-highlight-key":i??void 0,className:$,onClick:n,"data-media-state":g.status,children:[o!==null&&u.jsx("div",{className:"grid-selection-order-badge","aria-label":`Selection order ${o}`,children:o}),k?u.jsx("img",{className:`w-full h-full ${d==="contain"?"object-contain":"object-cover"} block pointer-events-none select-none opacity-0 transition-opacity duration-[160ms] ${R?"opacity-100":""}`,src:k,alt:t,loading:"lazy",decoding:"async","data-thumbnail-reveal":R?"decoded":"pending",onLoad:U=>P(U.currentTarget),width:l?Math.round(l):void 0,height:a?Math.round(a):void 0}):null,N&&u.jsxs("div",{className:"media-error-overlay media-error-overlay-thumb",onClick:U=>U.stopPropagation(),children:[u.jsx("div",{className:"media-error-title",children:"Thumbnail failed"}),u.jsx("div",{className:"media-error-message",children:Qm(N)}),N.retryable&&j&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:U=>{U.preventDefault(),U.stopPropagation(),j()},children:"Retry"})]})]})}function XN(e,t){const n=(t??"").trim();if(!n)return e;const r=e.toLowerCase().indexOf(n.toLowerCase());if(r===-1)return e;const s=e.slice(0,r),i=e.slice(r,r+n.length),o=e.slice(r+n.length);return u.jsxs(u.Fragment,{children:[s,u.jsx("mark",{className:"bg-accent/20 text-inherit rounded px-0.5",children:i}),o]})}function JN({layout:e,items:t,rowIndex:n}){if(e.mode==="adaptive"){const s=e.rows[n];return s?{items:s.items,height:s.height,imageHeight:s.imageH}:null}const r=n*e.columns;return{items:t.slice(r,r+e.columns).map(s=>({item:s,displayW:e.cellW,displayH:e.mediaH}))}}function ZN({layout:e,rowStart:t,rowHeight:n,gap:r}){return e.mode==="adaptive"?{className:"absolute top-0 left-0 right-0 w-full will-change-transform",style:{height:n,transform:`translate3d(0, ${t}px, 0)`,display:"flex",gap:r,paddingBottom:r}}:{className:"absolute top-0 left-0 right-0 w-full grid will-change-transform",style:{transform:`translate3d(0, ${t}px, 0)`,gridTemplateColumns:`repeat(${e.columns}, minmax(0, 1fr))`,gap:r,paddingBottom:r}}}function ej({virtualRows:e,layout:t,items:n,gap:r,scrollRootRef:s,suppressSelectionHighlight:i,active:o,focused:l,selectedSet:a,selectionOrderByPath:d,recentlyUpdated:f,highlight:h,isScrolling:m,multiSelectMode:y,onCellFocus:b,onPointerDown:w,onPointerMove:S,onPointerUp:v,onPointerCancel:x,onContextMenuItem:p,onOpenItemActions:g,onOpenViewer:k,onClearPreview:C,onSchedulePreview:R,onItemClick:E,demandThumbPaths:N}){return u.jsx(u.Fragment,{children:e.map(j=>{const P=JN({layout:t,items:n,rowIndex:j.index});if(!P)return null;const{className:$,style:U}=ZN({layout:t,rowStart:j.start,rowHeight:P.height,gap:r});return u.jsx("div",{className:$,role:"row","data-adaptive-image-height":P.imageHeight,style:U,children:P.items.map(({item:q,displayW:V,displayH:A,fit:Z})=>{const D=!i&&(o===q.path||a.has(q.path)),z=d.get(q.path)??null,B=(f==null?void 0:f.get(q.path))??null,O=B!=null,L=t.mode==="adaptive"?{width:V}:void 0,F=t.mode==="adaptive"?{height:A}:void 0,T=t.mode==="adaptive"?"relative rounded-[10px] group shrink-0":"relative aspect-[4/3] rounded-[10px] group";return u.jsxs("div",{id:`cell-${encodeURIComponent(q.path)}`,className:"relative min-w-0",role:"gridcell","data-adaptive-fit":Z,"aria-selected":D,tabIndex:l===q.path?0:-1,onFocus:()=>b(q.path),style:L,onPointerDown:H=>w(q.path,H),onPointerMove:S,onPointerUp:v,onPointerCancel:x,onContextMenu:H=>{H.preventDefault(),H.stopPropagation(),p==null||p(H,q.path)},children:[u.jsxs("div",{className:T,style:F,onDoubleClick:()=>{y||k(q.path)},onMouseLeave:C,children:[u.jsx("button",{type:"button",className:"grid-item-action-btn touch-manipulation","data-grid-action":"1","aria-label":`Open actions for ${q.name}`,"aria-haspopup":"menu",onPointerDown:H=>H.stopPropagation(),onClick:H=>{H.stopPropagation();const G=H.currentTarget.getBoundingClientRect();g(q.path,{x:G.right-4,y:G.bottom-4})},children:u.jsxs("svg",{width:"13",height:"13",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("circle",{cx:"12",cy:"5",r:"1.5"}),u.jsx("circle",{cx:"12",cy:"12",r:"1.5"}),u.jsx("circle",{cx:"12",cy:"19",r:"1.5"})]})}),u.jsx("div",{className:"cell-content absolute inset-0",children:u.jsx(YN,{path:q.path,name:q.name,selected:D,highlighted:O,highlightKey:B,selectionOrder:z,displayW:V,displayH:A,fit:Z,ioRoot:s.current,isScrolling:m,priority:N.has(q.path),onClick:H=>E(q.path,H)})}),u.jsx("div",{className:"grid-item-preview-hotspot absolute right-0 bottom-0 w-7 h-7 cursor-zoom-in",onMouseEnter:()=>R(q.path),onMouseLeave:C,children:u.jsx("div",{className:"grid-item-preview-corner absolute right-0 bottom-0 h-[18px] w-[18px] flex items-center justify-center text-text select-none",style:{clipPath:'path("M0 9C0 4.02944 4.02944 0 9 0H18V18H0V9Z")',background:"linear-gradient(135deg, rgba(18,18,18,0.9) 0%, rgba(34,34,34,0.9) 60%, rgba(22,22,22,0.9) 100%)",borderTop:"1px solid rgba(255,255,255,0.08)",borderLeft:"1px solid rgba(255,255,255,0.08)",boxShadow:"0 1px 2px rgba(0,0,0,0.45)",backdropFilter:"blur(1px)"},children:u.jsxs("svg",{width:"11",height:"11",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.7",strokeLinecap:"round",strokeLinejoin:"round",className:"text-[#d9dce2]","aria-hidden":"true",style:{transform:"translate(0px,0px)"},children:[u.jsx("circle",{cx:"11",cy:"11",r:"5.4"}),u.jsx("path",{d:"M15.5 15.5 L19 19"})]})})})]}),u.jsxs("div",{className:"flex flex-col items-center text-center gap-0.5 mt-2 px-1 text-text-secondary",children:[u.jsx("div",{className:"text-xs font-medium leading-[16px] thumb-filename line-clamp-2 break-words hyphens-auto text-center",title:q.name,children:XN(q.name,h)}),u.jsxs("div",{className:"text-[10px] leading-[14px] text-muted",children:[q.width," × ",q.height]})]})]},q.path)})},j.key)})})}function XF(e){return e}function xi(e,t,n){let r=n.initialDeps??[],s,i=!0;function o(){var l,a,d;let f;n.key&&((l=n.debug)!=null&&l.call(n))&&(f=Date.now());const h=e();if(!(h.length!==r.length||h.some((b,w)=>r[w]!==b)))return s;r=h;let y;if(n.key&&((a=n.debug)!=null&&a.call(n))&&(y=Date.now()),s=t(...h),n.key&&((d=n.debug)!=null&&d.call(n))){const b=Math.round((Date.now()-f)*100)/100,w=Math.round((Date.now()-y)*100)/100,S=w/16,v=(x,p)=>{for(x=String(x);x.length<p;)x=" "+x;return x};console.info(`%c⏱ ${v(w,5)} /${v(b,5)} ms`,`
             font-size: .6rem;
             font-weight: bold;
-            color: hsl(${Math.max(0,Math.min(120-120*S,120))}deg 100% 31%);`,n==null?void 0:n.key)}return n!=null&&n.onChange&&!(i&&n.skipInitialOnChange)&&n.onChange(s),i=!1,s}return o.updateDeps=l=>{r=l},o}function $y(e,t){if(e===void 0)throw new Error("Unexpected undefined");return e}const tj=(e,t)=>Math.abs(e-t)<1.01,nj=(e,t,n)=>{let r;return function(...s){e.clearTimeout(r),r=e.setTimeout(()=>t.apply(this,s),n)}},By=e=>{const{offsetWidth:t,offsetHeight:n}=e;return{width:t,height:n}},rj=e=>e,sj=e=>{const t=Math.max(e.startIndex-e.overscan,0),n=Math.min(e.endIndex+e.overscan,e.count-1),r=[];for(let s=t;s<=n;s++)r.push(s);return r},ij=(e,t)=>{const n=e.scrollElement;if(!n)return;const r=e.targetWindow;if(!r)return;const s=o=>{const{width:l,height:a}=o;t({width:Math.round(l),height:Math.round(a)})};if(s(By(n)),!r.ResizeObserver)return()=>{};const i=new r.ResizeObserver(o=>{const l=()=>{const a=o[0];if(a!=null&&a.borderBoxSize){const d=a.borderBoxSize[0];if(d){s({width:d.inlineSize,height:d.blockSize});return}}s(By(n))};e.options.useAnimationFrameWithResizeObserver?requestAnimationFrame(l):l()});return i.observe(n,{box:"border-box"}),()=>{i.unobserve(n)}},Uy={passive:!0},Hy=typeof window>"u"?!0:"onscrollend"in window,oj=(e,t)=>{const n=e.scrollElement;if(!n)return;const r=e.targetWindow;if(!r)return;let s=0;const i=e.options.useScrollendEvent&&Hy?()=>{}:nj(r,()=>{t(s,!1)},e.options.isScrollingResetDelay),o=f=>()=>{const{horizontal:h,isRtl:m}=e.options;s=h?n.scrollLeft*(m&&-1||1):n.scrollTop,i(),t(s,f)},l=o(!0),a=o(!1);a(),n.addEventListener("scroll",l,Uy);const d=e.options.useScrollendEvent&&Hy;return d&&n.addEventListener("scrollend",a,Uy),()=>{n.removeEventListener("scroll",l),d&&n.removeEventListener("scrollend",a)}},lj=(e,t,n)=>{if(t!=null&&t.borderBoxSize){const r=t.borderBoxSize[0];if(r)return Math.round(r[n.options.horizontal?"inlineSize":"blockSize"])}return e[n.options.horizontal?"offsetWidth":"offsetHeight"]},aj=(e,{adjustments:t=0,behavior:n},r)=>{var s,i;const o=e+t;(i=(s=r.scrollElement)==null?void 0:s.scrollTo)==null||i.call(s,{[r.options.horizontal?"left":"top"]:o,behavior:n})};class uj{constructor(t){this.unsubs=[],this.scrollElement=null,this.targetWindow=null,this.isScrolling=!1,this.measurementsCache=[],this.itemSizeCache=new Map,this.laneAssignments=new Map,this.pendingMeasuredCacheIndexes=[],this.prevLanes=void 0,this.lanesChangedFlag=!1,this.lanesSettling=!1,this.scrollRect=null,this.scrollOffset=null,this.scrollDirection=null,this.scrollAdjustments=0,this.elementsCache=new Map,this.observer=(()=>{let n=null;const r=()=>n||(!this.targetWindow||!this.targetWindow.ResizeObserver?null:n=new this.targetWindow.ResizeObserver(s=>{s.forEach(i=>{const o=()=>{this._measureElement(i.target,i)};this.options.useAnimationFrameWithResizeObserver?requestAnimationFrame(o):o()})}));return{disconnect:()=>{var s;(s=r())==null||s.disconnect(),n=null},observe:s=>{var i;return(i=r())==null?void 0:i.observe(s,{box:"border-box"})},unobserve:s=>{var i;return(i=r())==null?void 0:i.unobserve(s)}}})(),this.range=null,this.setOptions=n=>{Object.entries(n).forEach(([r,s])=>{typeof s>"u"&&delete n[r]}),this.options={debug:!1,initialOffset:0,overscan:1,paddingStart:0,paddingEnd:0,scrollPaddingStart:0,scrollPaddingEnd:0,horizontal:!1,getItemKey:rj,rangeExtractor:sj,onChange:()=>{},measureElement:lj,initialRect:{width:0,height:0},scrollMargin:0,gap:0,indexAttribute:"data-index",initialMeasurementsCache:[],lanes:1,isScrollingResetDelay:150,enabled:!0,isRtl:!1,useScrollendEvent:!1,useAnimationFrameWithResizeObserver:!1,...n}},this.notify=n=>{var r,s;(s=(r=this.options).onChange)==null||s.call(r,this,n)},this.maybeNotify=xi(()=>(this.calculateRange(),[this.isScrolling,this.range?this.range.startIndex:null,this.range?this.range.endIndex:null]),n=>{this.notify(n)},{key:!1,debug:()=>this.options.debug,initialDeps:[this.isScrolling,this.range?this.range.startIndex:null,this.range?this.range.endIndex:null]}),this.cleanup=()=>{this.unsubs.filter(Boolean).forEach(n=>n()),this.unsubs=[],this.observer.disconnect(),this.scrollElement=null,this.targetWindow=null},this._didMount=()=>()=>{this.cleanup()},this._willUpdate=()=>{var n;const r=this.options.enabled?this.options.getScrollElement():null;if(this.scrollElement!==r){if(this.cleanup(),!r){this.maybeNotify();return}this.scrollElement=r,this.scrollElement&&"ownerDocument"in this.scrollElement?this.targetWindow=this.scrollElement.ownerDocument.defaultView:this.targetWindow=((n=this.scrollElement)==null?void 0:n.window)??null,this.elementsCache.forEach(s=>{this.observer.observe(s)}),this._scrollToOffset(this.getScrollOffset(),{adjustments:void 0,behavior:void 0}),this.unsubs.push(this.options.observeElementRect(this,s=>{this.scrollRect=s,this.maybeNotify()})),this.unsubs.push(this.options.observeElementOffset(this,(s,i)=>{this.scrollAdjustments=0,this.scrollDirection=i?this.getScrollOffset()<s?"forward":"backward":null,this.scrollOffset=s,this.isScrolling=i,this.maybeNotify()}))}},this.getSize=()=>this.options.enabled?(this.scrollRect=this.scrollRect??this.options.initialRect,this.scrollRect[this.options.horizontal?"width":"height"]):(this.scrollRect=null,0),this.getScrollOffset=()=>this.options.enabled?(this.scrollOffset=this.scrollOffset??(typeof this.options.initialOffset=="function"?this.options.initialOffset():this.options.initialOffset),this.scrollOffset):(this.scrollOffset=null,0),this.getFurthestMeasurement=(n,r)=>{const s=new Map,i=new Map;for(let o=r-1;o>=0;o--){const l=n[o];if(s.has(l.lane))continue;const a=i.get(l.lane);if(a==null||l.end>a.end?i.set(l.lane,l):l.end<a.end&&s.set(l.lane,!0),s.size===this.options.lanes)break}return i.size===this.options.lanes?Array.from(i.values()).sort((o,l)=>o.end===l.end?o.index-l.index:o.end-l.end)[0]:void 0},this.getMeasurementOptions=xi(()=>[this.options.count,this.options.paddingStart,this.options.scrollMargin,this.options.getItemKey,this.options.enabled,this.options.lanes],(n,r,s,i,o,l)=>(this.prevLanes!==void 0&&this.prevLanes!==l&&(this.lanesChangedFlag=!0),this.prevLanes=l,this.pendingMeasuredCacheIndexes=[],{count:n,paddingStart:r,scrollMargin:s,getItemKey:i,enabled:o,lanes:l}),{key:!1,skipInitialOnChange:!0,onChange:()=>{this.notify(this.isScrolling)}}),this.getMeasurements=xi(()=>[this.getMeasurementOptions(),this.itemSizeCache],({count:n,paddingStart:r,scrollMargin:s,getItemKey:i,enabled:o,lanes:l},a)=>{if(!o)return this.measurementsCache=[],this.itemSizeCache.clear(),this.laneAssignments.clear(),[];if(this.laneAssignments.size>n)for(const m of this.laneAssignments.keys())m>=n&&this.laneAssignments.delete(m);this.lanesChangedFlag&&(this.lanesChangedFlag=!1,this.lanesSettling=!0,this.measurementsCache=[],this.itemSizeCache.clear(),this.laneAssignments.clear(),this.pendingMeasuredCacheIndexes=[]),this.measurementsCache.length===0&&(this.measurementsCache=this.options.initialMeasurementsCache,this.measurementsCache.forEach(m=>{this.itemSizeCache.set(m.key,m.size)}));const d=this.lanesSettling?0:this.pendingMeasuredCacheIndexes.length>0?Math.min(...this.pendingMeasuredCacheIndexes):0;this.pendingMeasuredCacheIndexes=[],this.lanesSettling&&this.measurementsCache.length===n&&(this.lanesSettling=!1);const f=this.measurementsCache.slice(0,d),h=new Array(l).fill(void 0);for(let m=0;m<d;m++){const y=f[m];y&&(h[y.lane]=m)}for(let m=d;m<n;m++){const y=i(m),b=this.laneAssignments.get(m);let w,S;if(b!==void 0&&this.options.lanes>1){w=b;const g=h[w],k=g!==void 0?f[g]:void 0;S=k?k.end+this.options.gap:r+s}else{const g=this.options.lanes===1?f[m-1]:this.getFurthestMeasurement(f,m);S=g?g.end+this.options.gap:r+s,w=g?g.lane:m%this.options.lanes,this.options.lanes>1&&this.laneAssignments.set(m,w)}const v=a.get(y),x=typeof v=="number"?v:this.options.estimateSize(m),p=S+x;f[m]={index:m,start:S,size:x,end:p,key:y,lane:w},h[w]=m}return this.measurementsCache=f,f},{key:!1,debug:()=>this.options.debug}),this.calculateRange=xi(()=>[this.getMeasurements(),this.getSize(),this.getScrollOffset(),this.options.lanes],(n,r,s,i)=>this.range=n.length>0&&r>0?cj({measurements:n,outerSize:r,scrollOffset:s,lanes:i}):null,{key:!1,debug:()=>this.options.debug}),this.getVirtualIndexes=xi(()=>{let n=null,r=null;const s=this.calculateRange();return s&&(n=s.startIndex,r=s.endIndex),this.maybeNotify.updateDeps([this.isScrolling,n,r]),[this.options.rangeExtractor,this.options.overscan,this.options.count,n,r]},(n,r,s,i,o)=>i===null||o===null?[]:n({startIndex:i,endIndex:o,overscan:r,count:s}),{key:!1,debug:()=>this.options.debug}),this.indexFromElement=n=>{const r=this.options.indexAttribute,s=n.getAttribute(r);return s?parseInt(s,10):(console.warn(`Missing attribute name '${r}={index}' on measured element.`),-1)},this._measureElement=(n,r)=>{const s=this.indexFromElement(n),i=this.measurementsCache[s];if(!i)return;const o=i.key,l=this.elementsCache.get(o);l!==n&&(l&&this.observer.unobserve(l),this.observer.observe(n),this.elementsCache.set(o,n)),n.isConnected&&this.resizeItem(s,this.options.measureElement(n,r,this))},this.resizeItem=(n,r)=>{const s=this.measurementsCache[n];if(!s)return;const i=this.itemSizeCache.get(s.key)??s.size,o=r-i;o!==0&&((this.shouldAdjustScrollPositionOnItemSizeChange!==void 0?this.shouldAdjustScrollPositionOnItemSizeChange(s,o,this):s.start<this.getScrollOffset()+this.scrollAdjustments)&&this._scrollToOffset(this.getScrollOffset(),{adjustments:this.scrollAdjustments+=o,behavior:void 0}),this.pendingMeasuredCacheIndexes.push(s.index),this.itemSizeCache=new Map(this.itemSizeCache.set(s.key,r)),this.notify(!1))},this.measureElement=n=>{if(!n){this.elementsCache.forEach((r,s)=>{r.isConnected||(this.observer.unobserve(r),this.elementsCache.delete(s))});return}this._measureElement(n,void 0)},this.getVirtualItems=xi(()=>[this.getVirtualIndexes(),this.getMeasurements()],(n,r)=>{const s=[];for(let i=0,o=n.length;i<o;i++){const l=n[i],a=r[l];s.push(a)}return s},{key:!1,debug:()=>this.options.debug}),this.getVirtualItemForOffset=n=>{const r=this.getMeasurements();if(r.length!==0)return $y(r[Hb(0,r.length-1,s=>$y(r[s]).start,n)])},this.getOffsetForAlignment=(n,r,s=0)=>{const i=this.getSize(),o=this.getScrollOffset();r==="auto"&&(r=n>=o+i?"end":"start"),r==="center"?n+=(s-i)/2:r==="end"&&(n-=i);const l=this.getTotalSize()+this.options.scrollMargin-i;return Math.max(Math.min(l,n),0)},this.getOffsetForIndex=(n,r="auto")=>{n=Math.max(0,Math.min(n,this.options.count-1));const s=this.measurementsCache[n];if(!s)return;const i=this.getSize(),o=this.getScrollOffset();if(r==="auto")if(s.end>=o+i-this.options.scrollPaddingEnd)r="end";else if(s.start<=o+this.options.scrollPaddingStart)r="start";else return[o,r];const l=r==="end"?s.end+this.options.scrollPaddingEnd:s.start-this.options.scrollPaddingStart;return[this.getOffsetForAlignment(l,r,s.size),r]},this.isDynamicMode=()=>this.elementsCache.size>0,this.scrollToOffset=(n,{align:r="start",behavior:s}={})=>{s==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getOffsetForAlignment(n,r),{adjustments:void 0,behavior:s})},this.scrollToIndex=(n,{align:r="auto",behavior:s}={})=>{s==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),n=Math.max(0,Math.min(n,this.options.count-1));let i=0;const o=10,l=d=>{if(!this.targetWindow)return;const f=this.getOffsetForIndex(n,d);if(!f){console.warn("Failed to get offset for index:",n);return}const[h,m]=f;this._scrollToOffset(h,{adjustments:void 0,behavior:s}),this.targetWindow.requestAnimationFrame(()=>{const y=this.getScrollOffset(),b=this.getOffsetForIndex(n,m);if(!b){console.warn("Failed to get offset for index:",n);return}tj(b[0],y)||a(m)})},a=d=>{this.targetWindow&&(i++,i<o?this.targetWindow.requestAnimationFrame(()=>l(d)):console.warn(`Failed to scroll to index ${n} after ${o} attempts.`))};l(r)},this.scrollBy=(n,{behavior:r}={})=>{r==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getScrollOffset()+n,{adjustments:void 0,behavior:r})},this.getTotalSize=()=>{var n;const r=this.getMeasurements();let s;if(r.length===0)s=this.options.paddingStart;else if(this.options.lanes===1)s=((n=r[r.length-1])==null?void 0:n.end)??0;else{const i=Array(this.options.lanes).fill(null);let o=r.length-1;for(;o>=0&&i.some(l=>l===null);){const l=r[o];i[l.lane]===null&&(i[l.lane]=l.end),o--}s=Math.max(...i.filter(l=>l!==null))}return Math.max(s-this.options.scrollMargin+this.options.paddingEnd,0)},this._scrollToOffset=(n,{adjustments:r,behavior:s})=>{this.options.scrollToFn(n,{behavior:s,adjustments:r},this)},this.measure=()=>{this.itemSizeCache=new Map,this.laneAssignments=new Map,this.notify(!1)},this.setOptions(t)}}const Hb=(e,t,n,r)=>{for(;e<=t;){const s=(e+t)/2|0,i=n(s);if(i<r)e=s+1;else if(i>r)t=s-1;else return s}return e>0?e-1:0};function cj({measurements:e,outerSize:t,scrollOffset:n,lanes:r}){const s=e.length-1,i=a=>e[a].start;if(e.length<=r)return{startIndex:0,endIndex:s};let o=Hb(0,s,i,n),l=o;if(r===1)for(;l<s&&e[l].end<n+t;)l++;else if(r>1){const a=Array(r).fill(0);for(;l<s&&a.some(f=>f<n+t);){const f=e[l];a[f.lane]=f.end,l++}const d=Array(r).fill(n+t);for(;o>=0&&d.some(f=>f>=n);){const f=e[o];d[f.lane]=f.start,o--}o=Math.max(0,o-o%r),l=Math.min(s,l+(r-1-l%r))}return{startIndex:o,endIndex:l}}const Ky=typeof document<"u"?c.useLayoutEffect:c.useEffect;function dj(e){const t=c.useReducer(()=>({}),{})[1],n={...e,onChange:(s,i)=>{var o;i?jo.flushSync(t):t(),(o=e.onChange)==null||o.call(e,s,i)}},[r]=c.useState(()=>new uj(n));return r.setOptions(n),Ky(()=>r._didMount(),[]),Ky(()=>r._willUpdate()),r}function fj(e){return dj({observeElementRect:ij,observeElementOffset:oj,scrollToFn:aj,...e})}function hj({containerW:e,gap:t,targetCell:n,aspect:r,captionH:s}){const i=Math.max(1,Math.floor((e+t)/(n+t))),o=(e-t*(i-1))/i,l=o*r.h/r.w,a=l+s+t;return{columns:i,cellW:o,mediaH:l,rowH:a}}const mj=1.333,pj=.65,gj=1.35,yj=.25;function vj({items:e,containerWidth:t,targetHeight:n,gap:r,captionH:s}){if(t<=0)return[];const i=[],o=Math.max(1,n*pj),l=Math.max(o,n*gj);let a=[];const d=(p,g)=>({index:i.length,height:g+s+r,imageH:g,items:p.map(k=>({item:k.item,displayW:k.aspect*g,displayH:g,originalIndex:k.originalIndex}))}),f=(p,g)=>{i.push(d(p,g))},h=p=>{const g=Math.min(l,Math.max(o,n));i.push({index:i.length,height:g+s+r,imageH:g,items:[{item:p.item,displayW:t,displayH:g,fit:"contain",originalIndex:p.originalIndex}]})},m=p=>p.reduce((g,k)=>g+k.aspect,0),y=p=>Math.max(0,p.length-1)*r,b=(p,g)=>m(p)*g+y(p),w=p=>Math.max(1,t-y(p))/m(p),S=p=>b(p,n)<=t?n:w(p),v=p=>p.aspect<=yj||p.aspect*o>t,x=p=>{let g=[];for(const k of p){const C=[...g,k];if(b(C,n)<=t){g=C;continue}if(g.length>0){f(g,S(g)),g=[k];continue}const R=w(C);R>=o?f(C,R):h(k),g=[]}g.length>0&&f(g,S(g))};for(let p=0;p<e.length;p++){const g=e[p],k=g.width>0&&g.height>0?g.width/g.height:mj,C={item:g,aspect:k,originalIndex:p};if(v(C)){x(a),a=[],h(C);continue}if(a.length===0){a=[C];continue}const R=[...a,C],E=w(R);if(E>n){a=R;continue}const N=w(a),j=E>=o,P=N<=l,$=Math.abs(E-n),U=Math.abs(N-n);j&&(!P||$<=U)?(f(R,E),a=[]):P?(f(a,N),a=[C]):j?(f(R,E),a=[]):(f(a,Math.min(l,N)),a=[C])}return a.length>0&&x(a),i}function wj(e,t,n){return{mode:"adaptive",rows:vj({items:t,containerWidth:e,targetHeight:n.targetCell,gap:n.gap,captionH:n.captionH})}}function xj(e,t,n){const{columns:r,cellW:s,mediaH:i,rowH:o}=hj({containerW:e,gap:n.gap,targetCell:n.targetCell,aspect:n.aspect,captionH:n.captionH}),l=Math.ceil(t.length/Math.max(1,r));return{mode:"grid",columns:r,cellW:s,mediaH:i,rowH:o,rowCount:l}}function bj(e,t,n){const[r,s]=c.useState(0);c.useLayoutEffect(()=>{const a=e.current;if(!a)return;const d=()=>{const h=getComputedStyle(a),m=a.clientWidth-parseFloat(h.paddingLeft)-parseFloat(h.paddingRight);s(m)},f=new ResizeObserver(d);return f.observe(a),d(),()=>f.disconnect()},[]);const i=c.useMemo(()=>n.viewMode==="adaptive"?wj(r,t,n):xj(r,t,n),[r,t,n.viewMode,n.gap,n.targetCell,n.aspect.w,n.aspect.h,n.captionH]),o=fj({count:i.mode==="adaptive"?i.rows.length:i.rowCount,getScrollElement:()=>e.current,estimateSize:a=>i.mode==="adaptive"?i.rows[a].height:i.rowH,overscan:8}),l=o.getVirtualItems();return c.useEffect(()=>{o.measure()},[i,o]),{width:r,layout:i,rowVirtualizer:o,virtualRows:l}}function Sj(e,t,n,r){if(!e.length)return null;const s=n?e.findIndex(a=>a.path===n):0,i=Math.max(1,t);let o=s;const l=r.key.toLowerCase();if(r.key==="ArrowRight"||l==="d")o=Math.min(e.length-1,s+1);else if(r.key==="ArrowLeft"||l==="a")o=Math.max(0,s-1);else if(r.key==="ArrowDown"||l==="s")o=Math.min(e.length-1,s+i);else if(r.key==="ArrowUp"||l==="w")o=Math.max(0,s-i);else return r.key==="Enter"&&n?"open":null;return o}const kj=.8,Cj=.8,Ej=120,Mj=90;function Vy(e,t,n){return n<t?Math.max(1,n):Math.min(n,Math.max(t,e))}function Rj(e,t=la){const n=Math.max(1,e.width-t*2),r=Math.max(1,e.height-t*2),s=Math.round(e.width*kj),i=Math.round(e.height*Cj);return{width:Vy(s,Ej,n),height:Vy(i,Mj,r)}}function Nj({surfaceSize:e,viewport:t,margin:n=la}){const r=t.left+(t.width-e.width)/2,s=t.top+(t.height-e.height)/2;return zl({x:r,y:s,menuWidth:e.width,menuHeight:e.height,viewport:t,margin:n})}class jj{constructor(t,n,r){ge(this,"requestToken",0);ge(this,"activeAbort",null);ge(this,"activeUrl",null);this.fetcher=t,this.runtime=n,this.callbacks=r}begin(t){this.cancelRequest();const n=this.requestToken+1;this.requestToken=n;const r=this.fetcher(t);this.activeAbort=r.abort??null,r.promise.then(s=>{if(n!==this.requestToken)return;this.activeAbort=null;const i=this.runtime.createObjectURL(s);this.revokeActiveUrl(),this.activeUrl=i,this.callbacks.onReady({path:t,url:i})}).catch(s=>{var i,o;n===this.requestToken&&(this.activeAbort=null,!$l(s)&&((o=(i=this.callbacks).onError)==null||o.call(i,{path:t,error:Vu(s)})))})}clear(){this.cancelRequest(),this.revokeActiveUrl()}cancelRequest(){this.requestToken+=1;const t=this.activeAbort;if(this.activeAbort=null,!!t)try{t()}catch{}}revokeActiveUrl(){const t=this.activeUrl;if(this.activeUrl=null,!!t)try{this.runtime.revokeObjectURL(t)}catch{}}}function Kb(e,t,n){if(t.mode==="adaptive"){const i=t.rows[e];return i?i.items.map(o=>o.item.path):[]}const r=Math.max(1,t.columns),s=e*r;return n.slice(s,s+r).map(i=>i.path)}function _j(e,t,n){if(e.length===0)return[];const r=Array.from(new Set(e.map(d=>d.index))).sort((d,f)=>d-f),s=r[0],i=r[r.length-1],o=t.mode==="adaptive"?Math.max(0,t.rows.length-1):Math.max(0,Math.ceil(n.length/Math.max(1,t.columns))-1),l=[s-1,i+1].filter(d=>d>=0&&d<=o);if(l.length===0)return[];const a=[];for(const d of l)a.push(...Kb(d,t,n));return Array.from(new Set(a))}function Pj(e,t,n){return e.start==null?!0:(e.end??e.start+(e.size??0))>t&&e.start<n}function Tj(e,t,n,r,s){if(e.length===0)return[];const i=r+Math.max(0,s),o=[];for(const l of e)Pj(l,r,i)&&o.push(...Kb(l.index,t,n));return Array.from(new Set(o))}function Ij(e,t){var s,i;let n=0,r=e.length-1;for(;n<=r;){const o=n+r>>1,l=e[o],a=((s=l.items[0])==null?void 0:s.originalIndex)??-1,d=((i=l.items[l.items.length-1])==null?void 0:i.originalIndex)??-1;if(t>=a&&t<=d)return o;t<a?r=o-1:n=o+1}return 0}function Lj(e,t,n){const r=new Set;for(const s of n){if(t.mode==="adaptive"){const l=t.rows[s.index];if(!l)continue;for(const a of l.items)r.add(a.item.path);continue}const i=s.index*t.columns,o=Math.min(e.length,i+t.columns);for(let l=i;l<o;l+=1){const a=e[l];a&&r.add(a.path)}}return r}function Oj(e,t,n,r){var o,l,a;const s=Fj(n,r);if(!s)return null;if(t.mode==="adaptive")return((l=(o=t.rows[s.index])==null?void 0:o.items[0])==null?void 0:l.item.path)??null;const i=s.index*t.columns;return((a=e[i])==null?void 0:a.path)??null}function Fj(e,t){if(e.length===0)return null;const n=Math.max(0,t);for(const r of e){const s=r.start??0;if((r.end??s+(r.size??0))>n)return r}return e[0]}function Aj({selectionToken:e,appliedSelectionToken:t,selectedPath:n,topAnchorToken:r,appliedTopAnchorToken:s,topAnchorPath:i,hasPath:o}){const l=e??0;if(l>0&&l!==t&&n&&o(n))return{source:"selection",path:n,token:l};const a=r??0;return a>0&&a!==s&&i&&o(i)?{source:"top-anchor",path:i,token:a}:null}function Dj({path:e,pathToIndex:t,layout:n,adaptiveRowMeta:r}){var o;const s=t.get(e);if(s==null||s<0)return null;const i=n.mode==="grid"?Math.floor(s/Math.max(1,n.columns)):Ij(n.rows,s);return n.mode==="grid"?i*n.rowH:((o=r==null?void 0:r[i])==null?void 0:o.start)??0}function Wy(e,t){return e!==null&&t(e),null}function qy(e,t){if(e.current!==null)try{t(e.current)}finally{e.current=null}}const zj=500,$j=450,Bj=600,Uj=8;function Hj(e){return Math.max($j,Math.min(Bj,e))}class Kj{constructor(t){ge(this,"delayMs");ge(this,"moveTolerancePx");ge(this,"onLongPress");ge(this,"onCancel");ge(this,"timerId",null);ge(this,"activePointerId",null);ge(this,"startX",0);ge(this,"startY",0);ge(this,"lastEvent",null);ge(this,"fired",!1);this.delayMs=Hj(t.delayMs??zj),this.moveTolerancePx=Math.max(0,t.moveTolerancePx??Uj),this.onLongPress=t.onLongPress,this.onCancel=t.onCancel}pointerDown(t){return(t.pointerType??"mouse")==="mouse"?!1:t.isPrimary===!1?(this.cancel("multitouch"),!1):this.activePointerId!=null&&this.activePointerId!==t.pointerId?(this.cancel("multitouch"),!1):(this.activePointerId=t.pointerId,this.startX=t.clientX,this.startY=t.clientY,this.lastEvent=t,this.fired=!1,this.clearTimer(),this.timerId=setTimeout(()=>{this.activePointerId==null||this.fired||this.lastEvent==null||(this.fired=!0,this.clearTimer(),this.onLongPress(this.lastEvent))},this.delayMs),!0)}pointerMove(t){if(!this.matchesPointer(t.pointerId)||this.fired)return;this.lastEvent=t;const n=t.clientX-this.startX,r=t.clientY-this.startY;Math.hypot(n,r)>this.moveTolerancePx&&this.cancel("movement")}pointerUp(t){if(!(t!=null&&!this.matchesPointer(t))){if(!this.fired){this.cancel("pointerup");return}this.reset()}}pointerCancel(t){t!=null&&!this.matchesPointer(t)||this.cancel("pointercancel")}cancelFromScroll(){this.cancel("scroll")}destroy(){this.cancel("cleanup")}matchesPointer(t){return this.activePointerId!=null&&this.activePointerId===t}clearTimer(){this.timerId!=null&&(clearTimeout(this.timerId),this.timerId=null)}reset(){this.clearTimer(),this.activePointerId=null,this.lastEvent=null,this.fired=!1}cancel(t){var r;const n=this.timerId!=null&&!this.fired&&t!=="cleanup";this.reset(),n&&((r=this.onCancel)==null||r.call(this,t))}}function Vj(e){return e==="touch"||e==="pen"}function Wj(e){return e.multiSelectMode||e.isShift||e.isToggle||!Vj(e.pointerType)?!1:e.selectedPaths.length===1&&e.selectedPaths[0]===e.path}function Qy(e,t){return e.includes(t)?e.filter(n=>n!==t):[...e,t]}function Gy(e){if(!e)return!1;try{const t=new URL(e);return t.protocol==="http:"||t.protocol==="https:"}catch{return!1}}function qj(e){return(e==null?void 0:e.source_kind)==="http"&&(e.mode==="browser_direct_allowed"||e.mode==="browser_direct_preferred_with_proxy_fallback")}function Qj(e,t){return t?typeof t=="function"?t(e):t.has(e):!1}function Jm(e,t,n){return t||!e||Qj(e.path,n)||!qj(e.original_media)?null:Gy(e.url)?e.url:Gy(e.source)?e.source:null}function Gj(e){var t,n;return((t=e==null?void 0:e.original_media)==null?void 0:t.mode)!=="unsupported"?null:((n=e.original_media.warnings)==null?void 0:n[0])??e.original_media.direct_allowed_reason??"Original media is unsupported for this source."}const bi=16,Yj=56;function Yy(e){return!!(e.closest(".grid-hover-preview")||e.closest(".grid-item-preview-hotspot"))}const Xj={w:4,h:3},Jj=350,Zj=120;function e_(e,t){if(e===t)return!0;if(e.size!==t.size)return!1;for(const n of e)if(!t.has(n))return!1;return!0}function Xy(e){return{pointerId:e.pointerId,pointerType:e.pointerType,clientX:e.clientX,clientY:e.clientY,isPrimary:e.isPrimary}}function t_({items:e,interactionDisabled:t=!1,presentationPhase:n="steady",selected:r,restoreToSelectionToken:s,restoreToTopAnchorToken:i,restoreToTopAnchorPath:o,multiSelectMode:l=!1,onSelectionChange:a,onOpenViewer:d,onContextMenuItem:f,onOpenItemActions:h,highlight:m,recentlyUpdated:y,onVisiblePathsChange:b,onTopAnchorPathChange:w,suppressSelectionHighlight:S=!1,viewMode:v="grid",targetCellSize:x=220,scrollRef:p,gridStatus:g={kind:"ready",title:"Ready",message:"",showCentered:!1},loadedCount:k=e.length,filteredCount:C=e.length,onRetry:R,hasMore:E=!1,isLoadingMore:N=!1,onLoadMore:j,proxyHttpOriginals:P=!1}){const[$,U]=c.useState(null),[q,V]=c.useState(null),[A,Z]=c.useState(null),[D,z]=c.useState(null),[B,O]=c.useState(null),[L,F]=c.useState(null),[T,H]=c.useState(!1),[G,Y]=c.useState(!1),[re,le]=c.useState(()=>new Set),[he,pe]=c.useState(null),[Se,we]=c.useState(null),Ee=c.useRef(null),xe=c.useRef(null),Re=c.useRef(null),ue=c.useRef(null),Be=c.useRef(null),ke=p??Be,Ye=c.useRef(null),et=c.useRef(0),be=c.useRef(0),X=c.useRef(new Set),me=c.useRef(null),Ne=c.useRef(null),K=c.useRef(null),W=c.useRef(null),fe=c.useRef(null),ee=c.useRef({path:null,pointerType:null}),ce=x;xe.current===null&&(xe.current=new jj(I=>Fe.getHoverPreview(I),{createObjectURL:I=>URL.createObjectURL(I),revokeObjectURL:I=>URL.revokeObjectURL(I)},{onReady:({path:I,url:Q})=>{ue.current={path:I,url:Q,image:null},Re.current=null,U(I),V(Q),Z(null),z(null),Y(!1),H(!0)},onError:({path:I,error:Q})=>{ue.current=null,Re.current=Q,U(I),V(null),Z(null),z(Q),Y(!1),H(!0)}}));const{width:Te,layout:de,rowVirtualizer:ut,virtualRows:Ke}=bj(ke,e,{gap:bi,targetCell:ce,aspect:Xj,captionH:Yj,viewMode:v});c.useLayoutEffect(()=>{const I=ke.current;if(I){if(t){I.setAttribute("inert","");return}I.removeAttribute("inert")}},[t,ke]);const sn=c.useMemo(()=>{const I=new Map;for(let Q=0;Q<e.length;Q++)I.set(e[Q].path,Q);return I},[e]),it=c.useMemo(()=>{if(de.mode!=="adaptive")return null;const I=new Map;return de.rows.forEach((Q,ae)=>{let ve=0;Q.items.forEach((Ce,_e)=>{const He=ve+Ce.displayW/2;I.set(Ce.item.path,{row:ae,center:He,order:_e}),ve+=Ce.displayW+bi})}),I},[de]);c.useEffect(()=>{if(!r.length)return;const I=r[0];he!==I&&pe(I)},[r,he]);const vt=c.useMemo(()=>{if(de.mode!=="adaptive")return null;let I=0;return de.rows.map(Q=>{const ae=I;return I+=Q.height,{start:ae,height:Q.height}})},[de]),mt=c.useRef(null),In=(I,Q)=>{try{qy(mt,Oe=>window.cancelAnimationFrame(Oe));const ae=I.scrollTop,ve=Q-ae;if(Math.abs(ve)<1){I.scrollTop=Q;return}const Ce=140,_e=performance.now(),He=Oe=>1-Math.pow(1-Oe,3),Le=Oe=>{const yn=Math.min(1,(Oe-_e)/Ce),Dt=He(yn);I.scrollTop=ae+ve*Dt,yn<1?mt.current=requestAnimationFrame(Le):mt.current=null};mt.current=requestAnimationFrame(Le)}catch{I.scrollTop=Q}};c.useEffect(()=>()=>{qy(mt,I=>window.cancelAnimationFrame(I))},[]);const[Ir,Ln]=c.useState(!1);c.useEffect(()=>{const I=ke.current;if(!I)return;let Q=null;const ae=()=>{var ve;(ve=Ne.current)==null||ve.cancelFromScroll(),Ft(!0),Ln(!0),Q=Wy(Q,Ce=>window.clearTimeout(Ce)),Q=window.setTimeout(()=>Ln(!1),Zj)};return I.addEventListener("scroll",ae,{passive:!0}),()=>{I.removeEventListener("scroll",ae),Q=Wy(Q,ve=>window.clearTimeout(ve))}},[]),c.useEffect(()=>{const I=new Kj({onLongPress:Q=>{if(t)return;const ae=K.current;if(!ae||!h)return;const ve=W.current??{x:Q.clientX,y:Q.clientY};h(ae,ve),fe.current={path:ae,untilMs:Date.now()+700}}});return Ne.current=I,()=>{I.destroy(),Ne.current===I&&(Ne.current=null)}},[t,h]);function fi(){Ee.current!=null&&(window.clearTimeout(Ee.current),Ee.current=null)}function Ft(I=!1){var Q;Re.current&&!I||(fi(),(Q=xe.current)==null||Q.clear(),H(!1),U(null),V(null),Z(null),Re.current=null,z(null),Y(!1),ue.current=null,O(null),F(null))}c.useEffect(()=>{if(!D)return;const I=ae=>{const ve=ae.target;if(ve instanceof Element&&Yy(ve))return;const Ce=ae.relatedTarget;!(Ce instanceof Element)||!Yy(Ce)||Ft(!0)},Q=ae=>{ae.relatedTarget===null&&Ft(!0)};return window.addEventListener("mouseover",I),window.addEventListener("mouseout",Q),()=>{window.removeEventListener("mouseover",I),window.removeEventListener("mouseout",Q)}},[D]),c.useLayoutEffect(()=>{var I;t&&((I=Ne.current)==null||I.cancelFromScroll(),Ft(!0))},[t]);const Lr=I=>{var Le;if(t||Ir)return;fi(),(Le=xe.current)==null||Le.clear();const Q=sn.get(I),ae=Q===void 0?null:e[Q],ve=Jm(ae,P,re),Ce=aa(),_e=Rj(Ce),He=Nj({surfaceSize:_e,viewport:Ce});U(I),V(null),Z(null),Re.current=null,z(null),Y(!1),ue.current=null,O(He),F(_e),H(!1),Ee.current=window.setTimeout(()=>{var Oe;if(Ee.current=null,ve){ue.current={path:I,url:ve,image:null},U(I),V(ve),Z(I),Y(!1),H(!0);return}Z(null),Re.current=null,z(null),H(!0),(Oe=xe.current)==null||Oe.begin(I)},Jj)},Rs=I=>{var ve,Ce;const Q=ue.current;if(!Q||Q.path!==$||Q.url!==q||Q.image!==null&&Q.image!==I||!I.isConnected||(I.currentSrc||I.src)!==Q.url)return;if(ue.current=null,Y(!1),!A||A!==$){(ve=xe.current)==null||ve.clear(),V(null);const _e=Ib();Re.current=_e,z(_e);return}const ae=A;le(_e=>{if(_e.has(ae))return _e;const He=new Set(_e);return He.add(ae),He}),Z(null),V(null),Re.current=null,z(null),H(!0),(Ce=xe.current)==null||Ce.begin(ae)},On=I=>{const Q=ue.current;!Q||(I.currentSrc||I.src)!==Q.url||(ue.current={...Q,image:I},Ub(I).then(()=>{var ae;((ae=ue.current)==null?void 0:ae.path)!==Q.path||ue.current.url!==Q.url||ue.current.image!==I||!I.isConnected||(I.currentSrc||I.src)!==Q.url||Y(!0)}).catch(()=>Rs(I)))},Or=()=>{var I;$&&(V(null),Z(null),Re.current=null,z(null),Y(!1),ue.current=null,H(!0),(I=xe.current)==null||I.begin($))};c.useEffect(()=>()=>{var I;Ee.current!=null&&(window.clearTimeout(Ee.current),Ee.current=null),(I=xe.current)==null||I.clear()},[]);const At=de.mode==="grid"?de.columns:Math.max(1,Math.floor(Te/(ce+bi)));c.useEffect(()=>{var ve;if(t||!j||!E||N||!e.length||!Ke.length)return;const I=Ke[Ke.length-1],Q=de.mode==="grid"?Math.min(e.length-1,(I.index+1)*Math.max(1,de.columns)-1):Math.max(-1,...(((ve=de.rows[I.index])==null?void 0:ve.items)??[]).map(Ce=>Ce.originalIndex)),ae=Math.max(30,At*8);Q>=e.length-ae&&j()},[At,E,t,N,e.length,de,j,Ke]);const Fn=(I,Q)=>{if(de.mode!=="adaptive")return null;const ae=de.rows[I];if(!ae)return null;let ve=0,Ce=null;for(const _e of ae.items){const He=ve+_e.displayW/2,Le=Math.abs(He-Q);(!Ce||Le<Ce.dist)&&(Ce={path:_e.item.path,dist:Le}),ve+=_e.displayW+bi}return Ce?Ce.path:null},jt=(I,Q)=>{var Ve,_t,Dr,hr;if(!e.length)return null;const ae=I??e[0].path;if(de.mode!=="adaptive"){const zr=Sj(e,At,ae,Q);return zr==="open"||zr==null?zr:((Ve=e[zr])==null?void 0:Ve.path)??null}const ve=it==null?void 0:it.get(ae);if(!ve)return ae;const Ce=sn.get(ae)??0,_e=Q.key,He=_e.toLowerCase();if(_e==="Enter")return"open";if(_e==="ArrowRight"||He==="d")return((_t=e[Math.min(e.length-1,Ce+1)])==null?void 0:_t.path)??ae;if(_e==="ArrowLeft"||He==="a")return((Dr=e[Math.max(0,Ce-1)])==null?void 0:Dr.path)??ae;const Le=_e==="ArrowDown"||He==="s"?1:_e==="ArrowUp"||He==="w"?-1:0;if(Le===0)return null;const Oe=ve.row+Le;if(Oe<0||Oe>=(((hr=de.rows)==null?void 0:hr.length)??0))return ae;const yn=ve.center;return Fn(Oe,yn)??ae},qe=I=>{var Q;try{(Q=document.getElementById(`cell-${encodeURIComponent(I)}`))==null||Q.focus()}catch{}},pt=c.useCallback(I=>{try{Fe.prefetchThumb(I)}catch{}},[]),on=c.useCallback((I,Q)=>{t||h==null||h(I,Q)},[t,h]),hi=()=>{K.current=null,W.current=null},Ns=(I,Q)=>{var ae;t||Q.target.closest("[data-grid-action]")||(ee.current={path:I,pointerType:Q.pointerType},!l&&(K.current=I,W.current={x:Q.clientX,y:Q.clientY},(ae=Ne.current)==null||ae.pointerDown(Xy(Q))))},To=I=>{var Q;t||l||(W.current={x:I.clientX,y:I.clientY},(Q=Ne.current)==null||Q.pointerMove(Xy(I)))},mi=I=>{var Q;t||l||((Q=Ne.current)==null||Q.pointerUp(I.pointerId),hi())},Jn=I=>{var Q;t||l||((Q=Ne.current)==null||Q.pointerCancel(I.pointerId),hi())},dr=(I,Q)=>{if(t)return;const ae=fe.current;if(ae&&ae.path===I&&ae.untilMs>Date.now()){fe.current=null,qe(I);return}ae&&ae.untilMs<=Date.now()&&(fe.current=null),pe(I),we(I);const ve=!!Q.shiftKey,Ce=!!(Q.ctrlKey||Q.metaKey);if(l)a(Qy(r,I)),Ye.current=I;else if(Wj({pointerType:ee.current.path===I?ee.current.pointerType:null,multiSelectMode:l,isShift:ve,isToggle:Ce,selectedPaths:r,path:I}))a([I]),Ye.current=I,d(I);else if(ve){const _e=Ye.current??he??r[0]??I,He=sn.get(_e)??e.findIndex(Oe=>Oe.path===_e),Le=sn.get(I)??e.findIndex(Oe=>Oe.path===I);if(He!==-1&&Le!==-1){const Oe=Math.min(He,Le),yn=Math.max(He,Le),Dt=e.slice(Oe,yn+1).map(Ve=>Ve.path);if(Ce){const Ve=new Set(r);for(const _t of Dt)Ve.add(_t);a(Array.from(Ve))}else a(Dt)}else a([I])}else Ce?(a(Qy(r,I)),Ye.current=I):(a([I]),Ye.current=I);Ir||pt(I),qe(I)};c.useEffect(()=>{const I=ke.current;if(!I)return;const Q=ae=>{var Dt,Ve,_t;if(t)return;const ve=jt(Se,ae);if(ve==null)return;if(ae.preventDefault(),ve==="open"){Se&&d(Se);return}const Ce=e.find(Dr=>Dr.path===ve);if(!Ce)return;we(Ce.path),pe(Ce.path),a([Ce.path]),Ye.current=Ce.path;const _e=de.mode==="grid"?Math.floor((sn.get(Ce.path)??0)/Math.max(1,de.columns)):((Dt=it==null?void 0:it.get(Ce.path))==null?void 0:Dt.row)??0,He=I.scrollTop,Le=He+I.clientHeight,Oe=de.mode==="adaptive"?((Ve=vt==null?void 0:vt[_e])==null?void 0:Ve.start)??0:_e*de.rowH,yn=de.mode==="adaptive"?Oe+(((_t=vt==null?void 0:vt[_e])==null?void 0:_t.height)??0):Oe+de.rowH;(Oe<He||yn>Le)&&In(I,Oe),qe(Ce.path)};return I.addEventListener("keydown",Q),()=>{I.removeEventListener("keydown",Q)}},[e,Se,At,t,d,de,it,vt,sn]),c.useLayoutEffect(()=>{const I=ke.current;if(!I||t)return;const Q=Aj({selectionToken:s,appliedSelectionToken:et.current,selectedPath:r[0]??null,topAnchorToken:i,appliedTopAnchorToken:be.current,topAnchorPath:o??null,hasPath:ve=>sn.has(ve)});if(!Q)return;const ae=Dj({path:Q.path,pathToIndex:sn,layout:de,adaptiveRowMeta:vt});if(ae!=null){try{I.scrollTop=ae}catch{}if(Q.source==="selection"){et.current=Q.token;return}be.current=Q.token}},[s,i,o,r,sn,de,vt,t]);const fr=c.useMemo(()=>new Set(r),[r]),Fr=c.useMemo(()=>{const I=new Map;for(let Q=0;Q<r.length;Q+=1)I.set(r[Q],Q+1);return I},[r]),Io=!!($&&T&&(G||D)),ln=c.useMemo(()=>_j(Ke,de,e),[e,de,Ke]),js=c.useMemo(()=>{var I,Q;return new Set(Tj(Ke,de,e,((I=ke.current)==null?void 0:I.scrollTop)??0,((Q=ke.current)==null?void 0:Q.clientHeight)??0))},[e,de,ke,Ke]);c.useEffect(()=>{if(!(t||Ir||ln.length===0))for(const I of ln)pt(I)},[t,Ir,ln,pt]),c.useEffect(()=>{var I;t||(I=ke.current)==null||I.focus()},[t,ke]),c.useEffect(()=>{var I;if(S){try{(I=ke.current)==null||I.blur()}catch{}we(null)}},[S]);const Zn=c.useMemo(()=>Lj(e,de,Ke),[e,de,Ke]),Ar=c.useMemo(()=>{var I;return Oj(e,de,Ke,((I=ke.current)==null?void 0:I.scrollTop)??0)},[e,de,Ke,ke]);c.useEffect(()=>{t||!b||e_(X.current,Zn)||(X.current=Zn,b(Zn))},[t,b,Zn]),c.useEffect(()=>{t||!w||me.current!==Ar&&(me.current=Ar,w(Ar))},[t,w,Ar]);const pi=Se?`cell-${encodeURIComponent(Se)}`:void 0,An=g.kind==="loading"||g.kind==="updating"||N,an=C>k?`Loaded ${k} of ${C}`:`${k} loaded`,Me=g.kind==="failed"?k>0?`${an}. Query failed.`:"Query failed.":g.kind==="unsupported"?k>0?`${an}. Query unavailable.`:"Query unavailable.":g.kind==="updating"?`${an}. Updating results...`:g.kind==="loading"?g.title:N?`${an}. Loading more...`:E?`${an}. Scroll for more.`:g.kind==="empty"?g.title:an;return c.useEffect(()=>{if(!e.length||Qx().firstGridItemLatencyMs!=null)return;const I=ke.current;if(!I)return;const Q=I.querySelector('[role="gridcell"][id^="cell-"]');if(!Q)return;const ae=I.getBoundingClientRect(),ve=Q.getBoundingClientRect();if(!(ve.bottom>=ae.top&&ve.top<=ae.bottom))return;const _e=Q.id.startsWith("cell-")?Q.id.slice(5):"";let He=e[0].path;if(_e)try{He=decodeURIComponent(_e)}catch{He=e[0].path}IM(He)},[e,ke]),u.jsxs("div",{role:"grid","aria-label":"Gallery",className:`relative h-full overflow-auto p-3 outline-none scrollbar-thin ${Io?"cursor-zoom-in":""}`,ref:ke,tabIndex:0,"aria-activedescendant":pi,"aria-busy":An||void 0,"aria-disabled":t||void 0,"data-grid-presentation-phase":n,"data-grid-interaction-disabled":t?"true":"false","data-grid-loaded-count":k,onMouseDown:()=>{var I;t||(I=ke.current)==null||I.focus()},style:{"--gap":`${bi}px`},children:[u.jsxs("div",{className:"relative w-full",style:{height:ut.getTotalSize()},children:[u.jsx(ej,{virtualRows:Ke,layout:de,items:e,gap:bi,scrollRootRef:ke,suppressSelectionHighlight:S,active:he,focused:Se,selectedSet:fr,selectionOrderByPath:Fr,recentlyUpdated:y,highlight:m,isScrolling:Ir,multiSelectMode:l,onCellFocus:I=>{t||we(I)},onPointerDown:Ns,onPointerMove:To,onPointerUp:mi,onPointerCancel:Jn,onContextMenuItem:t?void 0:f,onOpenItemActions:on,onOpenViewer:I=>{t||d(I)},onClearPreview:()=>Ft(),onSchedulePreview:Lr,onItemClick:dr,demandThumbPaths:js}),$&&T&&B&&L&&(q||D)&&jo.createPortal(u.jsx("div",{className:`grid-hover-preview fixed z-[999] overflow-hidden rounded-lg border border-border bg-panel/95 shadow-lg ${D?"pointer-events-auto":"pointer-events-none"}`,"data-preview-path":$,"data-media-state":D?"error":G?"ready":"decoding","aria-hidden":D?void 0:!0,style:{left:B.x,top:B.y,width:L.width,height:L.height,visibility:D||G?"visible":"hidden"},children:q?u.jsx("img",{src:q,alt:"preview",className:"block h-full w-full object-contain",onLoad:I=>On(I.currentTarget),onError:I=>Rs(I.currentTarget)}):D?u.jsxs("div",{className:"media-error-overlay media-error-overlay-preview",children:[u.jsx("div",{className:"media-error-title",children:"Preview failed"}),u.jsx("div",{className:"media-error-message",children:Qm(D)}),D.retryable&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:Or,children:"Retry"})]}):null}),document.body)]}),g.showCentered&&u.jsx("div",{className:"pointer-events-none absolute inset-3 z-20 flex items-center justify-center",children:u.jsxs("div",{className:"pointer-events-auto w-full max-w-[580px] rounded-lg border border-border bg-panel/95 px-4 py-3 shadow-lg",children:[u.jsxs("div",{className:"flex items-center justify-between gap-3 text-xs text-text",children:[u.jsx("span",{className:"font-semibold",children:g.title}),g.kind==="failed"&&R&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:R,children:"Retry"})]}),g.message&&u.jsx("div",{className:"mt-2 text-[11px] text-muted",children:g.message})]})}),u.jsxs("div",{className:"min-h-10 px-2.5 pt-2 pb-4 flex items-center justify-center gap-2 text-muted text-[11px] leading-[1.35] text-center","data-grid-state":g.kind,"data-has-more":E?"true":"false",children:[u.jsx("span",{children:Me}),g.kind==="failed"&&R&&!g.showCentered&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:R,children:"Retry"})]})]})}function Wt(e){return typeof e=="number"&&Number.isFinite(e)?e:null}function Vb(e,t){if(!e.length)return null;const n=Math.max(1,Math.trunc(t)),r=Math.min(...e);let s=Math.max(...e);r===s&&(s=r+1);const i=new Array(n).fill(0),o=n/(s-r);for(const l of e){const a=Math.max(0,Math.min(n-1,Math.floor((l-r)*o)));i[a]+=1}return{bins:i,min:r,max:s,count:e.length}}function n_({active:e,localComplete:t,localHistogram:n,facetHistogram:r,facetState:s}){return e?r?{state:"ready",histogram:r}:t?n?{state:"ready",histogram:n}:{state:"empty",histogram:null}:s==="error"?{state:"error",histogram:null}:s==="settled"?{state:"empty",histogram:null}:{state:"pending",histogram:null}:{state:"empty",histogram:null}}function Wb(e,t,n){const r=t.max-t.min;if(r<=0)return 0;const s=Er((e-t.min)/r);return n==="desc"?1-s:s}function Jy(e,t,n){const r=n==="desc"?1-Er(e):Er(e);return t.min+(t.max-t.min)*r}function r_(e,t,n){var o;const r=Wt(n);if(r==null)return null;let s=null,i=Number.POSITIVE_INFINITY;for(const l of e){const a=Wt((o=l.metrics)==null?void 0:o[t]);if(a==null)continue;const d=Math.abs(a-r);d>=i||(i=d,s=l.path)}return s}function s_(e,t){if(!e.length)return null;const n=Math.round(Er(t)*(e.length-1)),r=e[n];if(r!=null)return r;for(let s=1;s<e.length;s+=1){const i=n-s;if(i>=0&&e[i]!=null)return e[i];const o=n+s;if(o<e.length&&e[o]!=null)return e[o]}return null}function Er(e){return e<0?0:e>1?1:e}const i_=48,o_=[.1,.24,.5,.74,.9];function l_({items:e,metricKey:t,metricLabel:n,scrollRef:r,sortDir:s,currentPath:i=null,state:o="ready",histogramOverride:l=null,populationComplete:a=!0,onJumpToMetricValue:d,onRetry:f}){const{orderedValues:h,numericValues:m}=c.useMemo(()=>{var F;const O=[],L=[];for(const T of e){const H=Wt((F=T.metrics)==null?void 0:F[t]);O.push(H),H!=null&&L.push(H)}return{orderedValues:O,numericValues:L}},[e,t]),y=c.useMemo(()=>Vb(m,i_),[m]),b=l??y,w=c.useMemo(()=>b?a_(b,o_):[],[b]),[S,v]=c.useState(0),[x,p]=c.useState(null),[g,k]=c.useState(!1),C=c.useRef(null);c.useEffect(()=>{const O=r.current;if(!O)return;const L=()=>{const F=Math.max(1,O.scrollHeight-O.clientHeight),T=Er(F>0?O.scrollTop/F:0);v(T)};return L(),O.addEventListener("scroll",L,{passive:!0}),window.addEventListener("resize",L),()=>{O.removeEventListener("scroll",L),window.removeEventListener("resize",L)}},[r,e.length]),c.useEffect(()=>{p(null)},[t,e.length]);const R=b?{min:b.min,max:b.max}:null,E=c.useMemo(()=>{var O;if(i){const L=e.find(T=>T.path===i),F=Wt((O=L==null?void 0:L.metrics)==null?void 0:O[t]);if(F!=null)return F}return s_(h,S)},[i,e,t,h,S]),N=c.useMemo(()=>x==null||R==null?null:Jy(x,R,s),[R==null?void 0:R.max,R==null?void 0:R.min,x,s]),j=n??t;if(o!=="ready"||!b||!R)return u.jsx("div",{className:"relative h-full w-full flex items-center justify-center rounded bg-surface-inset border border-border/60","data-metric-rail":t,"data-metric-rail-state":o,"aria-busy":o==="pending"||void 0,children:o==="error"&&f?u.jsx("button",{type:"button",className:"btn btn-ghost h-full w-full min-w-0 px-0 text-danger","aria-label":`Retry ${j} metric distribution`,title:`Retry ${j} metric distribution`,onClick:f,children:"!"}):u.jsx("span",{className:"text-[10px] text-muted","aria-label":o==="empty"?`No finite values for ${j} metric distribution`:`Loading ${j} metric distribution`,children:o==="empty"?"—":""})});const P=R,$=x!=null?au(x):null,U=s==="desc",q=a,V=`w-full h-full rounded bg-surface-inset border border-border/60 ${q?"cursor-crosshair":"cursor-default"}`,A=E==null?au(S):au(Wb(E,P,s));function Z(O){p(Er(O))}function D(){p(null)}function z(O){q&&d(Jy(O,P,s))}function B(O){var F;const L=(F=C.current)==null?void 0:F.getBoundingClientRect();return L?Er((O.clientY-L.top)/L.height):null}return u.jsxs("div",{className:"relative h-full w-full flex items-stretch pointer-events-auto","data-metric-rail":t,"data-metric-rail-state":"ready","data-metric-rail-count":b.count,"data-metric-rail-min":b.min,"data-metric-rail-max":b.max,"data-metric-rail-bins":b.bins.join(","),"data-metric-rail-quantiles":w.join(","),children:[u.jsxs("svg",{ref:C,viewBox:"0 0 10 100",preserveAspectRatio:"none",className:V,"aria-label":`${j} metric distribution rail`,onPointerDown:O=>{var F;O.preventDefault();const L=B(O);L!=null&&(k(!0),Z(L),z(L),(F=C.current)==null||F.setPointerCapture(O.pointerId))},onPointerMove:O=>{const L=B(O);if(L==null){g||D();return}Z(L),g&&z(L)},onPointerUp:O=>{var L;k(!1),(L=C.current)==null||L.releasePointerCapture(O.pointerId)},onPointerLeave:()=>{g||D()},children:[u.jsx("title",{children:q?j:`${j} backend summary`}),u_(b.bins,"var(--border-strong)",{flip:U}),c_(w,P,{sortDir:s,color:"var(--muted)"}),Zy(A,{color:"var(--highlight)",strokeWidth:.8}),$!=null&&Zy($,{color:"var(--text-secondary)",strokeWidth:.6,dashed:!0})]}),N!=null&&x!=null&&u.jsx("div",{className:"pointer-events-none absolute right-full mr-2 px-1.5 py-0.5 rounded border border-border bg-surface text-[10px] text-text shadow",style:{top:`calc(${(x*100).toFixed(2)}% - 8px)`},children:d_(N)})]})}function a_(e,t){const n=e.bins.reduce((s,i)=>s+i,0);if(!n||!e.bins.length)return[];const r=(e.max-e.min)/e.bins.length;return t.map(s=>{const i=Er(s)*Math.max(0,n-1);let o=0;for(let l=0;l<e.bins.length;l+=1)if(o+=e.bins[l],o>i)return e.min+(l+.5)*r;return e.max})}function u_(e,t,n){const r=Math.max(1,...e),s=100/e.length,i=(n==null?void 0:n.flip)??!1;return e.map((o,l)=>{const a=Math.max(.8,o/r*10),d=(i?e.length-1-l:l)*s;return u.jsx("rect",{x:10-a,y:d,width:a,height:Math.max(.2,s-.2),fill:t,opacity:.9},`sb-${l}`)})}function c_(e,t,n){const r=(n==null?void 0:n.sortDir)??"asc",s=n==null?void 0:n.color;return e.map((i,o)=>{const l=au(Wb(i,t,r)),a=o===2;return u.jsx("line",{x1:0,y1:l,x2:10,y2:l,stroke:s,strokeWidth:a?.8:.5,opacity:a?.9:.6,vectorEffect:"non-scaling-stroke"},`qt-${o}-${i}`)})}function Zy(e,t){return u.jsx("line",{x1:0,y1:e,x2:10,y2:e,stroke:t.color,strokeWidth:t.strokeWidth??.6,strokeDasharray:t.dashed?"1.2 1.2":void 0,opacity:.95,vectorEffect:"non-scaling-stroke"})}function au(e){return Er(e)*100}function d_(e){const t=Wt(e);if(t==null)return"-";const n=Math.abs(t);return n>=1e3?t.toFixed(0):n>=10?t.toFixed(2):t.toFixed(3)}function f_({embeddings:e,rejected:t=[],selectedPath:n,embeddingsLoading:r=!1,embeddingsError:s,onClose:i,onSearch:o}){const[l,a]=c.useState(()=>{var A;return((A=e[0])==null?void 0:A.name)??""}),[d,f]=c.useState(()=>n?"path":"vector"),[h,m]=c.useState(()=>n??""),[y,b]=c.useState(""),[w,S]=c.useState("50"),[v,x]=c.useState(""),[p,g]=c.useState(null),[k,C]=c.useState(!1),R=c.useRef(null),E=c.useRef(null),N=c.useRef(!0);c.useLayoutEffect(()=>(N.current=!0,()=>{N.current=!1}),[]);const j=c.useMemo(()=>e.find(A=>A.name===l)??e[0]??null,[e,l]);c.useEffect(()=>{e.length>0&&!e.some(A=>A.name===l)&&a(e[0].name)},[e,l]),c.useEffect(()=>{const A=d==="vector"?E.current:R.current,Z=window.requestAnimationFrame(()=>A==null?void 0:A.focus());return()=>window.cancelAnimationFrame(Z)},[d]);const P=c.useCallback(async()=>{if(g(null),!e.length){g("No embeddings available for similarity search.");return}if(!j){g("Select an embedding to search.");return}const A=h.trim(),Z=y.trim(),D=Number(w);if(!Number.isFinite(D)||D<=0){g("Top K must be a positive number.");return}const z=Math.min(1e3,Math.max(1,Math.floor(D))),B=v.trim()===""?null:Number(v);if(B!=null&&!Number.isFinite(B)){g("Min score must be a valid number.");return}if(d==="path"&&!A){g("Select an image path for the query.");return}if(d==="vector"&&!Z){g("Paste a base64 vector for the query.");return}const O={embedding:j.name,query:d==="path"?{kind:"path",path:A}:{kind:"vector",vector_b64:Z},top_k:z,min_score:B};C(!0);try{await o(O)&&N.current&&i()}catch(L){if(!N.current)return;L instanceof jn||L instanceof Error?g(L.message):g("Failed to run similarity search.")}finally{N.current&&C(!1)}},[e.length,j,h,y,w,v,d,o,i]);c.useEffect(()=>{const A=Z=>{if(Z.key==="Escape"){Z.preventDefault(),i();return}(Z.ctrlKey||Z.metaKey)&&Z.key==="Enter"&&(Z.preventDefault(),P())};return window.addEventListener("keydown",A),()=>window.removeEventListener("keydown",A)},[i,P]);const $=c.useCallback(()=>{var A;n&&(f("path"),m(n),(A=R.current)==null||A.focus())},[n]),U=e.map(A=>({value:A.name,label:A.name,keywords:[A.name]})),q=t.length>0,V=t.slice(0,3);return u.jsx("div",{className:"similarity-modal-overlay fixed inset-0 z-[var(--z-overlay)] flex items-center justify-center bg-black/40 backdrop-blur-sm p-4",onClick:A=>{A.target===A.currentTarget&&i()},children:u.jsxs("div",{className:"similarity-modal-shell w-full max-w-2xl rounded-lg border border-border bg-panel shadow-[0_20px_50px_rgba(0,0,0,0.55)]",onClick:A=>A.stopPropagation(),role:"dialog","aria-modal":"true","aria-label":"Find similar",children:[u.jsxs("div",{className:"similarity-modal-header flex items-center justify-between px-4 py-3 border-b border-border",children:[u.jsxs("div",{children:[u.jsx("div",{className:"text-sm font-semibold text-text",children:"Find similar"}),u.jsx("div",{className:"text-xs text-muted",children:"Search with embeddings"})]}),u.jsx("button",{className:"btn btn-sm",onClick:i,"aria-label":"Close",children:"Close"})]}),u.jsxs("div",{className:"similarity-modal-body scrollbar-thin px-4 py-4 space-y-4",children:[u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Embedding"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx(Tn,{value:(j==null?void 0:j.name)??"",onChange:a,options:U,placeholder:r?"Loading embeddings...":"Select embedding",disabled:!e.length,triggerClassName:"min-w-[180px]",searchable:"auto",searchPlaceholder:"Search embeddings...",emptyMessage:"No matching embeddings"}),j&&u.jsxs("span",{className:"text-xs text-muted",children:[j.dimension," dims, ",j.metric,", ",j.dtype]})]})]}),u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Query mode"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("button",{type:"button",className:`btn btn-sm ${d==="path"?"btn-active":""}`,onClick:()=>f("path"),"aria-pressed":d==="path",children:"Selected image"}),u.jsx("button",{type:"button",className:`btn btn-sm ${d==="vector"?"btn-active":""}`,onClick:()=>f("vector"),"aria-pressed":d==="vector",children:"Vector input"})]})]}),u.jsx("div",{className:"similarity-modal-query",children:d==="path"?u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Image path"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("input",{ref:R,type:"text",className:"input w-full",value:h,onChange:A=>m(A.target.value),placeholder:n?"Selected image path":"Select an image first"}),u.jsx("button",{type:"button",className:"btn btn-sm",onClick:$,disabled:!n,title:n?"Use selected image":"Select an image first",children:"Use selected"})]})]}):u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Vector (base64 float32)"}),u.jsx("textarea",{ref:E,className:"ui-textarea w-full text-[11px]",rows:5,value:y,onChange:A=>b(A.target.value),placeholder:"Paste base64-encoded float32 vector"}),u.jsx("div",{className:"text-[11px] text-muted",children:"Base64 of little-endian float32. Length must match embedding dimension."})]})}),u.jsxs("div",{className:"grid grid-cols-2 gap-3",children:[u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Top K"}),u.jsx("input",{type:"number",min:1,max:1e3,step:1,className:"input ui-number w-full",value:w,onChange:A=>S(A.target.value)})]}),u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Min score"}),u.jsx("input",{type:"number",step:.01,className:"input ui-number w-full",value:v,onChange:A=>x(A.target.value),placeholder:"Optional"})]})]}),u.jsxs("div",{className:"similarity-modal-status space-y-2",children:[s&&u.jsx("div",{className:"ui-banner ui-banner-danger text-xs",role:"alert",children:s}),q&&u.jsxs("div",{className:"ui-banner text-xs",children:[u.jsx("div",{className:"font-semibold",children:"Skipped columns"}),u.jsxs("div",{className:"mt-1 space-y-1 text-muted",children:[V.map(A=>u.jsxs("div",{children:[A.name,": ",A.reason]},A.name)),t.length>V.length&&u.jsxs("div",{children:["+",t.length-V.length," more"]})]})]}),p&&u.jsx("div",{className:"ui-banner ui-banner-danger text-xs",role:"alert",children:p})]})]}),u.jsxs("div",{className:"similarity-modal-footer flex items-center justify-between px-4 py-3 border-t border-border",children:[u.jsx("div",{className:"text-xs text-muted",children:j?`Metric: ${j.metric}`:"Metric: cosine"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("button",{className:"btn btn-sm btn-ghost",onClick:i,disabled:k,children:"Cancel"}),u.jsx("button",{className:"btn btn-sm btn-active",onClick:P,disabled:k||!e.length,children:k?"Searching...":"Find similar"})]})]})]})})}function Qu(e){try{URL.revokeObjectURL(e)}catch{}}function h_(e,t){let n=!1;const r=()=>{n||(n=!0,t())};if(typeof window<"u"&&typeof window.requestAnimationFrame=="function"){let i=0,o=0;return i=window.requestAnimationFrame(()=>{o=window.requestAnimationFrame(()=>{r(),Qu(e)})}),{url:e,cancel:()=>{i&&window.cancelAnimationFrame(i),o&&window.cancelAnimationFrame(o),r()}}}const s=setTimeout(()=>{r(),Qu(e)},0);return{url:e,cancel:()=>{clearTimeout(s),r()}}}function m_(e){const t=e.current;e.current=[];for(const n of t)n.cancel(),Qu(n.url)}function p_(e){e.current&&(Qu(e.current),e.current=null)}function Kd(e,t){m_(t),p_(e)}function g_(e,t){const n=h_(e,()=>{t.current=t.current.filter(r=>r.url!==e)});t.current.push(n)}function y_(e,t,n={}){const r=n.source??"blob",s=n.unsupportedReason??null,i=n.identity,[o,l]=c.useState({status:"idle"}),a=c.useRef(0),d=c.useRef(null),f=c.useRef([]),[h,m]=c.useState(0),y=c.useCallback(()=>{m(b=>b+1)},[]);return c.useEffect(()=>{if(s){Kd(d,f),l({status:"unsupported",reason:s,identity:i});return}if(!e){Kd(d,f),l({status:"idle",identity:i});return}let b=!0;const w=a.current+1;a.current=w,l({status:"loading",requestId:w,source:r,identity:i});let S;try{S=e()}catch(v){$l(v)?l({status:"idle",identity:i}):l({status:"error",requestId:w,error:Vu(v),retry:y,identity:i});return}return S.then(v=>{if(!b||a.current!==w)return;const x=URL.createObjectURL(v),p=d.current;d.current=x,l({status:"ready",requestId:w,source:r,url:x,identity:i}),p&&g_(p,f)}).catch(v=>{if(!(!b||a.current!==w)){if($l(v)){l({status:"idle",identity:i});return}l({status:"error",requestId:w,error:Vu(v),retry:y,identity:i})}}),()=>{b=!1}},[...t,h,r,s,i]),c.useEffect(()=>()=>{Kd(d,f)},[]),o}const v_=["button","a[href]","input","select","textarea",'[contenteditable]:not([contenteditable="false"])','[role="button"]','[role="checkbox"]','[role="combobox"]','[role="menuitem"]','[role="menuitemcheckbox"]','[role="menuitemradio"]','[role="option"]','[role="radio"]','[role="searchbox"]','[role="slider"]','[role="spinbutton"]','[role="switch"]','[role="textbox"]'].join(",");function Zm(e){return!e||typeof HTMLElement>"u"||!(e instanceof HTMLElement)?!1:e.closest('input, textarea, select, [contenteditable]:not([contenteditable="false"]), [role="textbox"], [role="searchbox"], [role="combobox"]')!==null}function qb(e){return e.altKey||e.ctrlKey||e.metaKey}function Qb(e){return!e||typeof HTMLElement>"u"||!(e instanceof HTMLElement)?!1:e.closest(v_)!==null}function ep(e){const t=e.key.toLowerCase();return e.key==="ArrowRight"||t==="d"?1:e.key==="ArrowLeft"||t==="a"?-1:null}function w_(e){if(!e.isConnected)return!1;const t=e.getBoundingClientRect();if(t.width<=0||t.height<=0)return!1;const n=window.getComputedStyle(e);return n.display!=="none"&&n.visibility!=="hidden"}function Gb(){if(typeof document>"u"||typeof window>"u")return null;const e=Array.from(document.querySelectorAll('[role="dialog"][aria-modal="true"]')).filter(w_);return e[e.length-1]??null}function x_(){return Gb()!==null}function b_(e){if(!e||typeof document>"u")return!1;const t=Gb();return t===null?document.contains(e):t===e}function JF(e,t){return ep(e)!==null&&!qb(e)&&!Qb(e.target)&&b_(t)}function S_(e){return ep(e)!==null&&!qb(e)&&!Zm(e.target)}const k_=.05,C_=8;function bt(e){return Number.isFinite(e)&&e>0}function xs(e,t,n){return Math.min(n,Math.max(t,e))}function Xs(e){return Number.isFinite(e)?Number(xs(e,k_,C_).toFixed(4)):1}function ev(e,t){return!bt(e)||!bt(t)?0:Math.min(96,Math.max(48,e*.1),t*.25)}function tv(e,t,n,r){if(t<=e){const l=(e-t)/2;if(!(r!=null&&r.panSlack))return l;const a=ev(e,t);return xs(n,l-a,l+a)}const s=e-t,i=0;if(!(r!=null&&r.panSlack))return xs(n,s,i);const o=ev(e,t);return xs(n,s-o,i+o)}function wh(e,t){if(!bt(e.width)||!bt(e.height)||!bt(t.width)||!bt(t.height))return{base:1,scale:1,tx:0,ty:0};const n=Math.min(1,e.width/t.width,e.height/t.height),r=t.width*n,s=t.height*n;return{base:n,scale:1,tx:(e.width-r)/2,ty:(e.height-s)/2}}function Bl(e,t,n,r){const s=bt(n.base)?n.base:1,i=Xs(n.scale),o=t.width*s*i,l=t.height*s*i;if(!bt(e.width)||!bt(e.height)||!bt(t.width)||!bt(t.height)||!bt(o)||!bt(l))return{base:s,scale:i,tx:n.tx,ty:n.ty};const a=tv(e.width,o,n.tx,r),d=tv(e.height,l,n.ty,r);return{base:s,scale:i,tx:a,ty:d}}function Vd(e){const t=Xs(e.transform.scale),n=Xs(e.nextScale);if(n===t)return Bl(e.container,e.image,{...e.transform,scale:t},e.clampOptions);const r=n/t;return Bl(e.container,e.image,{...e.transform,scale:n,tx:e.point.x-r*(e.point.x-e.transform.tx),ty:e.point.y-r*(e.point.y-e.transform.ty)},e.clampOptions)}function E_(e){return Bl(e.container,e.image,{...e.transform,tx:e.transform.tx+e.dx,ty:e.transform.ty+e.dy},e.clampOptions)}function Ka(e){const t=e.transform.base*e.transform.scale;return!bt(e.container.width)||!bt(e.container.height)||!bt(e.image.width)||!bt(e.image.height)||!bt(t)?{x:.5,y:.5}:{x:xs((e.container.width/2-e.transform.tx)/(e.image.width*t),0,1),y:xs((e.container.height/2-e.transform.ty)/(e.image.height*t),0,1)}}function M_(e){const t=wh(e.container,e.image),n=Xs(e.scale),r=e.container.width/2-xs(e.center.x,0,1)*e.image.width*t.base*n,s=e.container.height/2-xs(e.center.y,0,1)*e.image.height*t.base*n;return Bl(e.container,e.image,{base:t.base,scale:n,tx:r,ty:s},e.clampOptions)}function R_(e){let t=null,n=null;const r=()=>{t=null;const s=n;n=null,s==null||s()};return{schedule(s){if(n=s,t!==null)return;const i=e.requestFrame(r);if(i===null){r();return}t=i},cancel(){t!==null&&e.cancelFrame(t),t=null,n=null},hasPending(){return t!==null||n!==null}}}function nv(){return R_({requestFrame(e){return typeof window>"u"||typeof window.requestAnimationFrame!="function"?null:window.requestAnimationFrame(e)},cancelFrame(e){typeof window>"u"||typeof window.cancelAnimationFrame!="function"||window.cancelAnimationFrame(e)}})}const N_=1.2,j_=3,__=450,Si={panSlack:!0},rv={base:1,scale:1,tx:0,ty:0};function P_(e,t){return Math.hypot(t.x-e.x,t.y-e.y)>=j_}function T_(e){return e.panMoved||e.pinchActive}function sv(e,t){return Math.hypot(e.x-t.x,e.y-t.y)}function iv(e,t){return{x:(e.x+t.x)/2,y:(e.y+t.y)/2}}function I_(e,t){try{e.setPointerCapture(t)}catch{}}function L_(e,t){try{e.releasePointerCapture(t)}catch{}}function ki(e){if(!e)return null;const t=e.getBoundingClientRect();return!Number.isFinite(t.width)||!Number.isFinite(t.height)||t.width<=0||t.height<=0?null:{width:t.width,height:t.height}}function Ci(e){return!e||!e.naturalWidth||!e.naturalHeight?null:{width:e.naturalWidth,height:e.naturalHeight}}function O_(e){return e instanceof Element&&e.closest('button, a, input, select, textarea, [role="button"]')!==null}function ov(){return typeof performance<"u"&&typeof performance.now=="function"?performance.now():Date.now()}function F_(){const[e,t]=c.useState(rv),[n,r]=c.useState(!1),[s,i]=c.useState(!1),[o,l]=c.useState(0),{scale:a,tx:d,ty:f,base:h}=e,m=c.useRef(null),y=c.useRef(null),b=c.useRef(rv),w=c.useRef(null),S=c.useRef(null),v=c.useRef(null),x=c.useRef({x:.5,y:.5}),p=c.useRef(new Map),g=c.useRef(null),k=c.useRef(null),C=c.useRef(0);S.current===null&&(S.current=nv()),v.current===null&&(v.current=nv());const R=c.useCallback(()=>b.current,[]),E=c.useCallback(()=>{const T=w.current;T&&(w.current=null,t(T))},[]),N=c.useCallback(T=>{var H;b.current=T,w.current=T,(H=S.current)==null||H.schedule(E)},[E]),j=c.useCallback(()=>{l(T=>T+1)},[]),P=c.useCallback((T,H)=>{g.current={pointerId:T,startX:H.x,startY:H.y,startTransform:R(),moved:!1},k.current=null,i(!0)},[R]),$=c.useCallback(()=>{const T=Array.from(p.current.entries());if(T.length<2)return;const[H,G]=T,[Y,re]=H,[le,he]=G,pe=sv(re,he);!Number.isFinite(pe)||pe<=2||(k.current={pointerIds:[Y,le],startDistance:pe,startCenter:iv(re,he),startTransform:R()},g.current=null,i(!0))},[R]),U=c.useCallback(()=>{const T=ki(m.current),H=Ci(y.current);!T||!H||(x.current={x:.5,y:.5},N(wh(T,H)),j())},[N,j]),q=c.useCallback(T=>{var re;const H=ki(m.current),G=Ci(T);if(!H||!G)return!1;const Y=wh(H,G);return(re=S.current)==null||re.cancel(),w.current=null,x.current={x:.5,y:.5},b.current=Y,t(Y),j(),!0},[j]),V=c.useCallback(()=>{const T=ki(m.current),H=Ci(y.current);!T||!H||(N(M_({container:T,image:H,center:x.current,scale:b.current.scale,clampOptions:Si})),j())},[N,j]);c.useEffect(()=>{const T=m.current;if(!T)return;const H=new ResizeObserver(()=>{var G;(G=v.current)==null||G.schedule(V)});return H.observe(T),()=>{var G;H.disconnect(),(G=v.current)==null||G.cancel()}},[V]),c.useEffect(()=>()=>{var T,H;(T=S.current)==null||T.cancel(),(H=v.current)==null||H.cancel(),w.current=null,p.current.clear(),g.current=null,k.current=null,C.current=0},[]);const A=c.useCallback(T=>{T.preventDefault();const H=T.deltaY>0?-1:1,G=m.current,Y=Ci(y.current),re=ki(G);if(!G||!re||!Y)return;const le=G.getBoundingClientRect(),he=T.clientX-le.left,pe=T.clientY-le.top,Se=b.current.scale,we=Xs(Se*Math.pow(N_,H));if(we===Se)return;const Ee=Vd({container:re,image:Y,transform:R(),point:{x:he,y:pe},nextScale:we,clampOptions:Si});x.current=Ka({container:re,image:Y,transform:Ee}),N(Ee)},[N,R]),Z=c.useCallback(T=>{if((T.pointerType??"mouse")==="mouse"&&T.button!==0)return;const G=p.current,Y=y.current;if(!Y)return;if(G.size===0){const he=T.target;if(O_(he)||he!==Y&&b.current.scale<=1)return}const re=T.currentTarget,le=re.getBoundingClientRect();if(!(T.clientX<le.left||T.clientX>le.right||T.clientY<le.top||T.clientY>le.bottom)){if(T.preventDefault(),T.stopPropagation(),G.set(T.pointerId,{x:T.clientX,y:T.clientY}),I_(re,T.pointerId),G.size>=2){$();return}P(T.pointerId,{x:T.clientX,y:T.clientY})}},[P,$]),D=c.useCallback(T=>{const H=p.current;if(!H.has(T.pointerId))return;H.set(T.pointerId,{x:T.clientX,y:T.clientY});const G=ki(m.current),Y=Ci(y.current);if(!G||!Y)return;const re=k.current;if(re){const we=H.get(re.pointerIds[0]),Ee=H.get(re.pointerIds[1]);if(we&&Ee){const xe=sv(we,Ee);if(xe>2){const Re=iv(we,Ee),ue=Xs(re.startTransform.scale*(xe/re.startDistance)),Be=Vd({container:G,image:Y,transform:re.startTransform,point:re.startCenter,nextScale:ue,clampOptions:Si}),ke=Bl(G,Y,{...Be,tx:Be.tx+(Re.x-re.startCenter.x),ty:Be.ty+(Re.y-re.startCenter.y)},Si);x.current=Ka({container:G,image:Y,transform:ke}),N(ke)}}return}const le=g.current;if(!le||le.pointerId!==T.pointerId)return;const he=T.clientX-le.startX,pe=T.clientY-le.startY;le.moved||(le.moved=P_({x:le.startX,y:le.startY},{x:T.clientX,y:T.clientY}));const Se=E_({container:G,image:Y,transform:le.startTransform,dx:he,dy:pe,clampOptions:Si});x.current=Ka({container:G,image:Y,transform:Se}),N(Se)},[N]),z=c.useCallback((T,H)=>{const G=p.current;if(!G.has(T))return;const Y=g.current,re=k.current;if(T_({panMoved:(Y==null?void 0:Y.pointerId)===T?Y.moved:!1,pinchActive:re!==null})&&(C.current=ov()+__),G.delete(T),L_(H,T),G.size===0){g.current=null,k.current=null,i(!1);return}if(G.size>=2){$();return}const[le,he]=G.entries().next().value;P(le,he)},[P,$]),B=c.useCallback(T=>{z(T.pointerId,T.currentTarget)},[z]),O=c.useCallback(T=>{z(T.pointerId,T.currentTarget)},[z]),L=c.useCallback(()=>C.current>ov(),[]),F=c.useCallback(T=>{const H=m.current,G=ki(H),Y=Ci(y.current);if(!H||!G||!Y)return!1;const re=Xs(T/100/Math.max(1e-6,b.current.base)),le=H.getBoundingClientRect(),he=Vd({container:G,image:Y,transform:R(),point:{x:le.width/2,y:le.height/2},nextScale:re,clampOptions:Si});return x.current=Ka({container:G,image:Y,transform:he}),N(he),!0},[N,R]);return{scale:a,tx:d,ty:f,base:h,ready:n,setReady:r,dragging:s,setDragging:i,geometryVersion:o,containerRef:m,imgRef:y,resetView:U,prepareImagePromotion:q,zoomToPercent:F,handleWheel:A,handlePointerDown:Z,handlePointerMove:D,handlePointerUp:B,handlePointerCancel:O,shouldSuppressSurfaceClick:L}}const A_=150;function lv(e){return e instanceof Element&&e.closest('button, a, input, select, textarea, [role="button"]')!==null}function D_(e){return e.split(/[\\/]/).filter(Boolean).pop()||e}function z_(e,t){const n=!!(e&&e===t);return{isPresented:n,opacity:n?1:0}}function $_(e,t){return!!e&&!t}function B_({path:e,item:t=null,proxyHttpOriginals:n=!1,onClose:r,onNavigate:s,canPrev:i=!1,canNext:o=!1,onZoomChange:l,requestedZoomPercent:a,onZoomRequestConsumed:d}){const{scale:f,tx:h,ty:m,base:y,geometryVersion:b,ready:w,setReady:S,dragging:v,containerRef:x,imgRef:p,prepareImagePromotion:g,zoomToPercent:k,handleWheel:C,handlePointerDown:R,handlePointerMove:E,handlePointerUp:N,handlePointerCancel:j,shouldSuppressSurfaceClick:P}=F_(),[$,U]=c.useState(()=>new Set),q=Jm(t,n,$),V=q?null:Gj(t),A=y_(q||V?null:()=>Fe.getFile(e),[e,q,V],{source:"proxy",unsupportedReason:V,identity:e}),Z=A.identity===e,D=Z&&A.status==="ready"?A.url:null,z=q??D,B=z?`${e}
+            color: hsl(${Math.max(0,Math.min(120-120*S,120))}deg 100% 31%);`,n==null?void 0:n.key)}return n!=null&&n.onChange&&!(i&&n.skipInitialOnChange)&&n.onChange(s),i=!1,s}return o.updateDeps=l=>{r=l},o}function $y(e,t){if(e===void 0)throw new Error("Unexpected undefined");return e}const tj=(e,t)=>Math.abs(e-t)<1.01,nj=(e,t,n)=>{let r;return function(...s){e.clearTimeout(r),r=e.setTimeout(()=>t.apply(this,s),n)}},By=e=>{const{offsetWidth:t,offsetHeight:n}=e;return{width:t,height:n}},rj=e=>e,sj=e=>{const t=Math.max(e.startIndex-e.overscan,0),n=Math.min(e.endIndex+e.overscan,e.count-1),r=[];for(let s=t;s<=n;s++)r.push(s);return r},ij=(e,t)=>{const n=e.scrollElement;if(!n)return;const r=e.targetWindow;if(!r)return;const s=o=>{const{width:l,height:a}=o;t({width:Math.round(l),height:Math.round(a)})};if(s(By(n)),!r.ResizeObserver)return()=>{};const i=new r.ResizeObserver(o=>{const l=()=>{const a=o[0];if(a!=null&&a.borderBoxSize){const d=a.borderBoxSize[0];if(d){s({width:d.inlineSize,height:d.blockSize});return}}s(By(n))};e.options.useAnimationFrameWithResizeObserver?requestAnimationFrame(l):l()});return i.observe(n,{box:"border-box"}),()=>{i.unobserve(n)}},Uy={passive:!0},Hy=typeof window>"u"?!0:"onscrollend"in window,oj=(e,t)=>{const n=e.scrollElement;if(!n)return;const r=e.targetWindow;if(!r)return;let s=0;const i=e.options.useScrollendEvent&&Hy?()=>{}:nj(r,()=>{t(s,!1)},e.options.isScrollingResetDelay),o=f=>()=>{const{horizontal:h,isRtl:m}=e.options;s=h?n.scrollLeft*(m&&-1||1):n.scrollTop,i(),t(s,f)},l=o(!0),a=o(!1);a(),n.addEventListener("scroll",l,Uy);const d=e.options.useScrollendEvent&&Hy;return d&&n.addEventListener("scrollend",a,Uy),()=>{n.removeEventListener("scroll",l),d&&n.removeEventListener("scrollend",a)}},lj=(e,t,n)=>{if(t!=null&&t.borderBoxSize){const r=t.borderBoxSize[0];if(r)return Math.round(r[n.options.horizontal?"inlineSize":"blockSize"])}return e[n.options.horizontal?"offsetWidth":"offsetHeight"]},aj=(e,{adjustments:t=0,behavior:n},r)=>{var s,i;const o=e+t;(i=(s=r.scrollElement)==null?void 0:s.scrollTo)==null||i.call(s,{[r.options.horizontal?"left":"top"]:o,behavior:n})};class uj{constructor(t){this.unsubs=[],this.scrollElement=null,this.targetWindow=null,this.isScrolling=!1,this.measurementsCache=[],this.itemSizeCache=new Map,this.laneAssignments=new Map,this.pendingMeasuredCacheIndexes=[],this.prevLanes=void 0,this.lanesChangedFlag=!1,this.lanesSettling=!1,this.scrollRect=null,this.scrollOffset=null,this.scrollDirection=null,this.scrollAdjustments=0,this.elementsCache=new Map,this.observer=(()=>{let n=null;const r=()=>n||(!this.targetWindow||!this.targetWindow.ResizeObserver?null:n=new this.targetWindow.ResizeObserver(s=>{s.forEach(i=>{const o=()=>{this._measureElement(i.target,i)};this.options.useAnimationFrameWithResizeObserver?requestAnimationFrame(o):o()})}));return{disconnect:()=>{var s;(s=r())==null||s.disconnect(),n=null},observe:s=>{var i;return(i=r())==null?void 0:i.observe(s,{box:"border-box"})},unobserve:s=>{var i;return(i=r())==null?void 0:i.unobserve(s)}}})(),this.range=null,this.setOptions=n=>{Object.entries(n).forEach(([r,s])=>{typeof s>"u"&&delete n[r]}),this.options={debug:!1,initialOffset:0,overscan:1,paddingStart:0,paddingEnd:0,scrollPaddingStart:0,scrollPaddingEnd:0,horizontal:!1,getItemKey:rj,rangeExtractor:sj,onChange:()=>{},measureElement:lj,initialRect:{width:0,height:0},scrollMargin:0,gap:0,indexAttribute:"data-index",initialMeasurementsCache:[],lanes:1,isScrollingResetDelay:150,enabled:!0,isRtl:!1,useScrollendEvent:!1,useAnimationFrameWithResizeObserver:!1,...n}},this.notify=n=>{var r,s;(s=(r=this.options).onChange)==null||s.call(r,this,n)},this.maybeNotify=xi(()=>(this.calculateRange(),[this.isScrolling,this.range?this.range.startIndex:null,this.range?this.range.endIndex:null]),n=>{this.notify(n)},{key:!1,debug:()=>this.options.debug,initialDeps:[this.isScrolling,this.range?this.range.startIndex:null,this.range?this.range.endIndex:null]}),this.cleanup=()=>{this.unsubs.filter(Boolean).forEach(n=>n()),this.unsubs=[],this.observer.disconnect(),this.scrollElement=null,this.targetWindow=null},this._didMount=()=>()=>{this.cleanup()},this._willUpdate=()=>{var n;const r=this.options.enabled?this.options.getScrollElement():null;if(this.scrollElement!==r){if(this.cleanup(),!r){this.maybeNotify();return}this.scrollElement=r,this.scrollElement&&"ownerDocument"in this.scrollElement?this.targetWindow=this.scrollElement.ownerDocument.defaultView:this.targetWindow=((n=this.scrollElement)==null?void 0:n.window)??null,this.elementsCache.forEach(s=>{this.observer.observe(s)}),this._scrollToOffset(this.getScrollOffset(),{adjustments:void 0,behavior:void 0}),this.unsubs.push(this.options.observeElementRect(this,s=>{this.scrollRect=s,this.maybeNotify()})),this.unsubs.push(this.options.observeElementOffset(this,(s,i)=>{this.scrollAdjustments=0,this.scrollDirection=i?this.getScrollOffset()<s?"forward":"backward":null,this.scrollOffset=s,this.isScrolling=i,this.maybeNotify()}))}},this.getSize=()=>this.options.enabled?(this.scrollRect=this.scrollRect??this.options.initialRect,this.scrollRect[this.options.horizontal?"width":"height"]):(this.scrollRect=null,0),this.getScrollOffset=()=>this.options.enabled?(this.scrollOffset=this.scrollOffset??(typeof this.options.initialOffset=="function"?this.options.initialOffset():this.options.initialOffset),this.scrollOffset):(this.scrollOffset=null,0),this.getFurthestMeasurement=(n,r)=>{const s=new Map,i=new Map;for(let o=r-1;o>=0;o--){const l=n[o];if(s.has(l.lane))continue;const a=i.get(l.lane);if(a==null||l.end>a.end?i.set(l.lane,l):l.end<a.end&&s.set(l.lane,!0),s.size===this.options.lanes)break}return i.size===this.options.lanes?Array.from(i.values()).sort((o,l)=>o.end===l.end?o.index-l.index:o.end-l.end)[0]:void 0},this.getMeasurementOptions=xi(()=>[this.options.count,this.options.paddingStart,this.options.scrollMargin,this.options.getItemKey,this.options.enabled,this.options.lanes],(n,r,s,i,o,l)=>(this.prevLanes!==void 0&&this.prevLanes!==l&&(this.lanesChangedFlag=!0),this.prevLanes=l,this.pendingMeasuredCacheIndexes=[],{count:n,paddingStart:r,scrollMargin:s,getItemKey:i,enabled:o,lanes:l}),{key:!1,skipInitialOnChange:!0,onChange:()=>{this.notify(this.isScrolling)}}),this.getMeasurements=xi(()=>[this.getMeasurementOptions(),this.itemSizeCache],({count:n,paddingStart:r,scrollMargin:s,getItemKey:i,enabled:o,lanes:l},a)=>{if(!o)return this.measurementsCache=[],this.itemSizeCache.clear(),this.laneAssignments.clear(),[];if(this.laneAssignments.size>n)for(const m of this.laneAssignments.keys())m>=n&&this.laneAssignments.delete(m);this.lanesChangedFlag&&(this.lanesChangedFlag=!1,this.lanesSettling=!0,this.measurementsCache=[],this.itemSizeCache.clear(),this.laneAssignments.clear(),this.pendingMeasuredCacheIndexes=[]),this.measurementsCache.length===0&&(this.measurementsCache=this.options.initialMeasurementsCache,this.measurementsCache.forEach(m=>{this.itemSizeCache.set(m.key,m.size)}));const d=this.lanesSettling?0:this.pendingMeasuredCacheIndexes.length>0?Math.min(...this.pendingMeasuredCacheIndexes):0;this.pendingMeasuredCacheIndexes=[],this.lanesSettling&&this.measurementsCache.length===n&&(this.lanesSettling=!1);const f=this.measurementsCache.slice(0,d),h=new Array(l).fill(void 0);for(let m=0;m<d;m++){const y=f[m];y&&(h[y.lane]=m)}for(let m=d;m<n;m++){const y=i(m),b=this.laneAssignments.get(m);let w,S;if(b!==void 0&&this.options.lanes>1){w=b;const g=h[w],k=g!==void 0?f[g]:void 0;S=k?k.end+this.options.gap:r+s}else{const g=this.options.lanes===1?f[m-1]:this.getFurthestMeasurement(f,m);S=g?g.end+this.options.gap:r+s,w=g?g.lane:m%this.options.lanes,this.options.lanes>1&&this.laneAssignments.set(m,w)}const v=a.get(y),x=typeof v=="number"?v:this.options.estimateSize(m),p=S+x;f[m]={index:m,start:S,size:x,end:p,key:y,lane:w},h[w]=m}return this.measurementsCache=f,f},{key:!1,debug:()=>this.options.debug}),this.calculateRange=xi(()=>[this.getMeasurements(),this.getSize(),this.getScrollOffset(),this.options.lanes],(n,r,s,i)=>this.range=n.length>0&&r>0?cj({measurements:n,outerSize:r,scrollOffset:s,lanes:i}):null,{key:!1,debug:()=>this.options.debug}),this.getVirtualIndexes=xi(()=>{let n=null,r=null;const s=this.calculateRange();return s&&(n=s.startIndex,r=s.endIndex),this.maybeNotify.updateDeps([this.isScrolling,n,r]),[this.options.rangeExtractor,this.options.overscan,this.options.count,n,r]},(n,r,s,i,o)=>i===null||o===null?[]:n({startIndex:i,endIndex:o,overscan:r,count:s}),{key:!1,debug:()=>this.options.debug}),this.indexFromElement=n=>{const r=this.options.indexAttribute,s=n.getAttribute(r);return s?parseInt(s,10):(console.warn(`Missing attribute name '${r}={index}' on measured element.`),-1)},this._measureElement=(n,r)=>{const s=this.indexFromElement(n),i=this.measurementsCache[s];if(!i)return;const o=i.key,l=this.elementsCache.get(o);l!==n&&(l&&this.observer.unobserve(l),this.observer.observe(n),this.elementsCache.set(o,n)),n.isConnected&&this.resizeItem(s,this.options.measureElement(n,r,this))},this.resizeItem=(n,r)=>{const s=this.measurementsCache[n];if(!s)return;const i=this.itemSizeCache.get(s.key)??s.size,o=r-i;o!==0&&((this.shouldAdjustScrollPositionOnItemSizeChange!==void 0?this.shouldAdjustScrollPositionOnItemSizeChange(s,o,this):s.start<this.getScrollOffset()+this.scrollAdjustments)&&this._scrollToOffset(this.getScrollOffset(),{adjustments:this.scrollAdjustments+=o,behavior:void 0}),this.pendingMeasuredCacheIndexes.push(s.index),this.itemSizeCache=new Map(this.itemSizeCache.set(s.key,r)),this.notify(!1))},this.measureElement=n=>{if(!n){this.elementsCache.forEach((r,s)=>{r.isConnected||(this.observer.unobserve(r),this.elementsCache.delete(s))});return}this._measureElement(n,void 0)},this.getVirtualItems=xi(()=>[this.getVirtualIndexes(),this.getMeasurements()],(n,r)=>{const s=[];for(let i=0,o=n.length;i<o;i++){const l=n[i],a=r[l];s.push(a)}return s},{key:!1,debug:()=>this.options.debug}),this.getVirtualItemForOffset=n=>{const r=this.getMeasurements();if(r.length!==0)return $y(r[Hb(0,r.length-1,s=>$y(r[s]).start,n)])},this.getOffsetForAlignment=(n,r,s=0)=>{const i=this.getSize(),o=this.getScrollOffset();r==="auto"&&(r=n>=o+i?"end":"start"),r==="center"?n+=(s-i)/2:r==="end"&&(n-=i);const l=this.getTotalSize()+this.options.scrollMargin-i;return Math.max(Math.min(l,n),0)},this.getOffsetForIndex=(n,r="auto")=>{n=Math.max(0,Math.min(n,this.options.count-1));const s=this.measurementsCache[n];if(!s)return;const i=this.getSize(),o=this.getScrollOffset();if(r==="auto")if(s.end>=o+i-this.options.scrollPaddingEnd)r="end";else if(s.start<=o+this.options.scrollPaddingStart)r="start";else return[o,r];const l=r==="end"?s.end+this.options.scrollPaddingEnd:s.start-this.options.scrollPaddingStart;return[this.getOffsetForAlignment(l,r,s.size),r]},this.isDynamicMode=()=>this.elementsCache.size>0,this.scrollToOffset=(n,{align:r="start",behavior:s}={})=>{s==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getOffsetForAlignment(n,r),{adjustments:void 0,behavior:s})},this.scrollToIndex=(n,{align:r="auto",behavior:s}={})=>{s==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),n=Math.max(0,Math.min(n,this.options.count-1));let i=0;const o=10,l=d=>{if(!this.targetWindow)return;const f=this.getOffsetForIndex(n,d);if(!f){console.warn("Failed to get offset for index:",n);return}const[h,m]=f;this._scrollToOffset(h,{adjustments:void 0,behavior:s}),this.targetWindow.requestAnimationFrame(()=>{const y=this.getScrollOffset(),b=this.getOffsetForIndex(n,m);if(!b){console.warn("Failed to get offset for index:",n);return}tj(b[0],y)||a(m)})},a=d=>{this.targetWindow&&(i++,i<o?this.targetWindow.requestAnimationFrame(()=>l(d)):console.warn(`Failed to scroll to index ${n} after ${o} attempts.`))};l(r)},this.scrollBy=(n,{behavior:r}={})=>{r==="smooth"&&this.isDynamicMode()&&console.warn("The `smooth` scroll behavior is not fully supported with dynamic size."),this._scrollToOffset(this.getScrollOffset()+n,{adjustments:void 0,behavior:r})},this.getTotalSize=()=>{var n;const r=this.getMeasurements();let s;if(r.length===0)s=this.options.paddingStart;else if(this.options.lanes===1)s=((n=r[r.length-1])==null?void 0:n.end)??0;else{const i=Array(this.options.lanes).fill(null);let o=r.length-1;for(;o>=0&&i.some(l=>l===null);){const l=r[o];i[l.lane]===null&&(i[l.lane]=l.end),o--}s=Math.max(...i.filter(l=>l!==null))}return Math.max(s-this.options.scrollMargin+this.options.paddingEnd,0)},this._scrollToOffset=(n,{adjustments:r,behavior:s})=>{this.options.scrollToFn(n,{behavior:s,adjustments:r},this)},this.measure=()=>{this.itemSizeCache=new Map,this.laneAssignments=new Map,this.notify(!1)},this.setOptions(t)}}const Hb=(e,t,n,r)=>{for(;e<=t;){const s=(e+t)/2|0,i=n(s);if(i<r)e=s+1;else if(i>r)t=s-1;else return s}return e>0?e-1:0};function cj({measurements:e,outerSize:t,scrollOffset:n,lanes:r}){const s=e.length-1,i=a=>e[a].start;if(e.length<=r)return{startIndex:0,endIndex:s};let o=Hb(0,s,i,n),l=o;if(r===1)for(;l<s&&e[l].end<n+t;)l++;else if(r>1){const a=Array(r).fill(0);for(;l<s&&a.some(f=>f<n+t);){const f=e[l];a[f.lane]=f.end,l++}const d=Array(r).fill(n+t);for(;o>=0&&d.some(f=>f>=n);){const f=e[o];d[f.lane]=f.start,o--}o=Math.max(0,o-o%r),l=Math.min(s,l+(r-1-l%r))}return{startIndex:o,endIndex:l}}const Ky=typeof document<"u"?c.useLayoutEffect:c.useEffect;function dj(e){const t=c.useReducer(()=>({}),{})[1],n={...e,onChange:(s,i)=>{var o;i?jo.flushSync(t):t(),(o=e.onChange)==null||o.call(e,s,i)}},[r]=c.useState(()=>new uj(n));return r.setOptions(n),Ky(()=>r._didMount(),[]),Ky(()=>r._willUpdate()),r}function fj(e){return dj({observeElementRect:ij,observeElementOffset:oj,scrollToFn:aj,...e})}function hj({containerW:e,gap:t,targetCell:n,aspect:r,captionH:s}){const i=Math.max(1,Math.floor((e+t)/(n+t))),o=(e-t*(i-1))/i,l=o*r.h/r.w,a=l+s+t;return{columns:i,cellW:o,mediaH:l,rowH:a}}const mj=1.333,pj=.65,gj=1.35,yj=.25;function vj({items:e,containerWidth:t,targetHeight:n,gap:r,captionH:s}){if(t<=0)return[];const i=[],o=Math.max(1,n*pj),l=Math.max(o,n*gj);let a=[];const d=(p,g)=>({index:i.length,height:g+s+r,imageH:g,items:p.map(k=>({item:k.item,displayW:k.aspect*g,displayH:g,originalIndex:k.originalIndex}))}),f=(p,g)=>{i.push(d(p,g))},h=p=>{const g=Math.min(l,Math.max(o,n));i.push({index:i.length,height:g+s+r,imageH:g,items:[{item:p.item,displayW:t,displayH:g,fit:"contain",originalIndex:p.originalIndex}]})},m=p=>p.reduce((g,k)=>g+k.aspect,0),y=p=>Math.max(0,p.length-1)*r,b=(p,g)=>m(p)*g+y(p),w=p=>Math.max(1,t-y(p))/m(p),S=p=>b(p,n)<=t?n:w(p),v=p=>p.aspect<=yj||p.aspect*o>t,x=p=>{let g=[];for(const k of p){const C=[...g,k];if(b(C,n)<=t){g=C;continue}if(g.length>0){f(g,S(g)),g=[k];continue}const R=w(C);R>=o?f(C,R):h(k),g=[]}g.length>0&&f(g,S(g))};for(let p=0;p<e.length;p++){const g=e[p],k=g.width>0&&g.height>0?g.width/g.height:mj,C={item:g,aspect:k,originalIndex:p};if(v(C)){x(a),a=[],h(C);continue}if(a.length===0){a=[C];continue}const R=[...a,C],E=w(R);if(E>n){a=R;continue}const N=w(a),j=E>=o,P=N<=l,$=Math.abs(E-n),U=Math.abs(N-n);j&&(!P||$<=U)?(f(R,E),a=[]):P?(f(a,N),a=[C]):j?(f(R,E),a=[]):(f(a,Math.min(l,N)),a=[C])}return a.length>0&&x(a),i}function wj(e,t,n){return{mode:"adaptive",rows:vj({items:t,containerWidth:e,targetHeight:n.targetCell,gap:n.gap,captionH:n.captionH})}}function xj(e,t,n){const{columns:r,cellW:s,mediaH:i,rowH:o}=hj({containerW:e,gap:n.gap,targetCell:n.targetCell,aspect:n.aspect,captionH:n.captionH}),l=Math.ceil(t.length/Math.max(1,r));return{mode:"grid",columns:r,cellW:s,mediaH:i,rowH:o,rowCount:l}}function bj(e,t,n){const[r,s]=c.useState(0);c.useLayoutEffect(()=>{const a=e.current;if(!a)return;const d=()=>{const h=getComputedStyle(a),m=a.clientWidth-parseFloat(h.paddingLeft)-parseFloat(h.paddingRight);s(m)},f=new ResizeObserver(d);return f.observe(a),d(),()=>f.disconnect()},[]);const i=c.useMemo(()=>n.viewMode==="adaptive"?wj(r,t,n):xj(r,t,n),[r,t,n.viewMode,n.gap,n.targetCell,n.aspect.w,n.aspect.h,n.captionH]),o=fj({count:i.mode==="adaptive"?i.rows.length:i.rowCount,getScrollElement:()=>e.current,estimateSize:a=>i.mode==="adaptive"?i.rows[a].height:i.rowH,overscan:8}),l=o.getVirtualItems();return c.useEffect(()=>{o.measure()},[i,o]),{width:r,layout:i,rowVirtualizer:o,virtualRows:l}}function Sj(e,t,n,r){if(!e.length)return null;const s=n?e.findIndex(a=>a.path===n):0,i=Math.max(1,t);let o=s;const l=r.key.toLowerCase();if(r.key==="ArrowRight"||l==="d")o=Math.min(e.length-1,s+1);else if(r.key==="ArrowLeft"||l==="a")o=Math.max(0,s-1);else if(r.key==="ArrowDown"||l==="s")o=Math.min(e.length-1,s+i);else if(r.key==="ArrowUp"||l==="w")o=Math.max(0,s-i);else return r.key==="Enter"&&n?"open":null;return o}const kj=.8,Cj=.8,Ej=120,Mj=90;function Vy(e,t,n){return n<t?Math.max(1,n):Math.min(n,Math.max(t,e))}function Rj(e,t=la){const n=Math.max(1,e.width-t*2),r=Math.max(1,e.height-t*2),s=Math.round(e.width*kj),i=Math.round(e.height*Cj);return{width:Vy(s,Ej,n),height:Vy(i,Mj,r)}}function Nj({surfaceSize:e,viewport:t,margin:n=la}){const r=t.left+(t.width-e.width)/2,s=t.top+(t.height-e.height)/2;return zl({x:r,y:s,menuWidth:e.width,menuHeight:e.height,viewport:t,margin:n})}class jj{constructor(t,n,r){ge(this,"requestToken",0);ge(this,"activeAbort",null);ge(this,"activeUrl",null);this.fetcher=t,this.runtime=n,this.callbacks=r}begin(t){this.cancelRequest();const n=this.requestToken+1;this.requestToken=n;const r=this.fetcher(t);this.activeAbort=r.abort??null,r.promise.then(s=>{if(n!==this.requestToken)return;this.activeAbort=null;const i=this.runtime.createObjectURL(s);this.revokeActiveUrl(),this.activeUrl=i,this.callbacks.onReady({path:t,url:i})}).catch(s=>{var i,o;n===this.requestToken&&(this.activeAbort=null,!$l(s)&&((o=(i=this.callbacks).onError)==null||o.call(i,{path:t,error:Vu(s)})))})}clear(){this.cancelRequest(),this.revokeActiveUrl()}cancelRequest(){this.requestToken+=1;const t=this.activeAbort;if(this.activeAbort=null,!!t)try{t()}catch{}}revokeActiveUrl(){const t=this.activeUrl;if(this.activeUrl=null,!!t)try{this.runtime.revokeObjectURL(t)}catch{}}}function Kb(e,t,n){if(t.mode==="adaptive"){const i=t.rows[e];return i?i.items.map(o=>o.item.path):[]}const r=Math.max(1,t.columns),s=e*r;return n.slice(s,s+r).map(i=>i.path)}function _j(e,t,n){if(e.length===0)return[];const r=Array.from(new Set(e.map(d=>d.index))).sort((d,f)=>d-f),s=r[0],i=r[r.length-1],o=t.mode==="adaptive"?Math.max(0,t.rows.length-1):Math.max(0,Math.ceil(n.length/Math.max(1,t.columns))-1),l=[s-1,i+1].filter(d=>d>=0&&d<=o);if(l.length===0)return[];const a=[];for(const d of l)a.push(...Kb(d,t,n));return Array.from(new Set(a))}function Pj(e,t,n){return e.start==null?!0:(e.end??e.start+(e.size??0))>t&&e.start<n}function Tj(e,t,n,r,s){if(e.length===0)return[];const i=r+Math.max(0,s),o=[];for(const l of e)Pj(l,r,i)&&o.push(...Kb(l.index,t,n));return Array.from(new Set(o))}function Ij(e,t){var s,i;let n=0,r=e.length-1;for(;n<=r;){const o=n+r>>1,l=e[o],a=((s=l.items[0])==null?void 0:s.originalIndex)??-1,d=((i=l.items[l.items.length-1])==null?void 0:i.originalIndex)??-1;if(t>=a&&t<=d)return o;t<a?r=o-1:n=o+1}return 0}function Lj(e,t,n){const r=new Set;for(const s of n){if(t.mode==="adaptive"){const l=t.rows[s.index];if(!l)continue;for(const a of l.items)r.add(a.item.path);continue}const i=s.index*t.columns,o=Math.min(e.length,i+t.columns);for(let l=i;l<o;l+=1){const a=e[l];a&&r.add(a.path)}}return r}function Oj(e,t,n,r){var o,l,a;const s=Fj(n,r);if(!s)return null;if(t.mode==="adaptive")return((l=(o=t.rows[s.index])==null?void 0:o.items[0])==null?void 0:l.item.path)??null;const i=s.index*t.columns;return((a=e[i])==null?void 0:a.path)??null}function Fj(e,t){if(e.length===0)return null;const n=Math.max(0,t);for(const r of e){const s=r.start??0;if((r.end??s+(r.size??0))>n)return r}return e[0]}function Aj({selectionToken:e,appliedSelectionToken:t,selectedPath:n,topAnchorToken:r,appliedTopAnchorToken:s,topAnchorPath:i,hasPath:o}){const l=e??0;if(l>0&&l!==t&&n&&o(n))return{source:"selection",path:n,token:l};const a=r??0;return a>0&&a!==s&&i&&o(i)?{source:"top-anchor",path:i,token:a}:null}function Dj({path:e,pathToIndex:t,layout:n,adaptiveRowMeta:r}){var o;const s=t.get(e);if(s==null||s<0)return null;const i=n.mode==="grid"?Math.floor(s/Math.max(1,n.columns)):Ij(n.rows,s);return n.mode==="grid"?i*n.rowH:((o=r==null?void 0:r[i])==null?void 0:o.start)??0}function Wy(e,t){return e!==null&&t(e),null}function qy(e,t){if(e.current!==null)try{t(e.current)}finally{e.current=null}}const zj=500,$j=450,Bj=600,Uj=8;function Hj(e){return Math.max($j,Math.min(Bj,e))}class Kj{constructor(t){ge(this,"delayMs");ge(this,"moveTolerancePx");ge(this,"onLongPress");ge(this,"onCancel");ge(this,"timerId",null);ge(this,"activePointerId",null);ge(this,"startX",0);ge(this,"startY",0);ge(this,"lastEvent",null);ge(this,"fired",!1);this.delayMs=Hj(t.delayMs??zj),this.moveTolerancePx=Math.max(0,t.moveTolerancePx??Uj),this.onLongPress=t.onLongPress,this.onCancel=t.onCancel}pointerDown(t){return(t.pointerType??"mouse")==="mouse"?!1:t.isPrimary===!1?(this.cancel("multitouch"),!1):this.activePointerId!=null&&this.activePointerId!==t.pointerId?(this.cancel("multitouch"),!1):(this.activePointerId=t.pointerId,this.startX=t.clientX,this.startY=t.clientY,this.lastEvent=t,this.fired=!1,this.clearTimer(),this.timerId=setTimeout(()=>{this.activePointerId==null||this.fired||this.lastEvent==null||(this.fired=!0,this.clearTimer(),this.onLongPress(this.lastEvent))},this.delayMs),!0)}pointerMove(t){if(!this.matchesPointer(t.pointerId)||this.fired)return;this.lastEvent=t;const n=t.clientX-this.startX,r=t.clientY-this.startY;Math.hypot(n,r)>this.moveTolerancePx&&this.cancel("movement")}pointerUp(t){if(!(t!=null&&!this.matchesPointer(t))){if(!this.fired){this.cancel("pointerup");return}this.reset()}}pointerCancel(t){t!=null&&!this.matchesPointer(t)||this.cancel("pointercancel")}cancelFromScroll(){this.cancel("scroll")}destroy(){this.cancel("cleanup")}matchesPointer(t){return this.activePointerId!=null&&this.activePointerId===t}clearTimer(){this.timerId!=null&&(clearTimeout(this.timerId),this.timerId=null)}reset(){this.clearTimer(),this.activePointerId=null,this.lastEvent=null,this.fired=!1}cancel(t){var r;const n=this.timerId!=null&&!this.fired&&t!=="cleanup";this.reset(),n&&((r=this.onCancel)==null||r.call(this,t))}}function Vj(e){return e==="touch"||e==="pen"}function Wj(e){return e.multiSelectMode||e.isShift||e.isToggle||!Vj(e.pointerType)?!1:e.selectedPaths.length===1&&e.selectedPaths[0]===e.path}function Qy(e,t){return e.includes(t)?e.filter(n=>n!==t):[...e,t]}function Gy(e){if(!e)return!1;try{const t=new URL(e);return t.protocol==="http:"||t.protocol==="https:"}catch{return!1}}function qj(e){return(e==null?void 0:e.source_kind)==="http"&&(e.mode==="browser_direct_allowed"||e.mode==="browser_direct_preferred_with_proxy_fallback")}function Qj(e,t){return t?typeof t=="function"?t(e):t.has(e):!1}function Jm(e,t,n){return t||!e||Qj(e.path,n)||!qj(e.original_media)?null:Gy(e.url)?e.url:Gy(e.source)?e.source:null}function Gj(e){var t,n;return((t=e==null?void 0:e.original_media)==null?void 0:t.mode)!=="unsupported"?null:((n=e.original_media.warnings)==null?void 0:n[0])??e.original_media.direct_allowed_reason??"Original media is unsupported for this source."}const bi=16,Yj=56;function Yy(e){return!!(e.closest(".grid-hover-preview")||e.closest(".grid-item-preview-hotspot"))}const Xj={w:4,h:3},Jj=350,Zj=120;function e_(e,t){if(e===t)return!0;if(e.size!==t.size)return!1;for(const n of e)if(!t.has(n))return!1;return!0}function Xy(e){return{pointerId:e.pointerId,pointerType:e.pointerType,clientX:e.clientX,clientY:e.clientY,isPrimary:e.isPrimary}}function t_({items:e,interactionDisabled:t=!1,presentationPhase:n="steady",selected:r,restoreToSelectionToken:s,restoreToTopAnchorToken:i,restoreToTopAnchorPath:o,multiSelectMode:l=!1,onSelectionChange:a,onOpenViewer:d,onContextMenuItem:f,onOpenItemActions:h,highlight:m,recentlyUpdated:y,onVisiblePathsChange:b,onTopAnchorPathChange:w,suppressSelectionHighlight:S=!1,viewMode:v="grid",targetCellSize:x=220,scrollRef:p,gridStatus:g={kind:"ready",title:"Ready",message:"",showCentered:!1},loadedCount:k=e.length,filteredCount:C=e.length,onRetry:R,hasMore:E=!1,isLoadingMore:N=!1,onLoadMore:j,proxyHttpOriginals:P=!1}){const[$,U]=c.useState(null),[q,V]=c.useState(null),[A,Z]=c.useState(null),[D,z]=c.useState(null),[B,O]=c.useState(null),[L,F]=c.useState(null),[T,H]=c.useState(!1),[G,Y]=c.useState(!1),[re,le]=c.useState(()=>new Set),[he,pe]=c.useState(null),[Se,we]=c.useState(null),Ee=c.useRef(null),xe=c.useRef(null),Re=c.useRef(null),ue=c.useRef(null),Be=c.useRef(null),ke=p??Be,Ye=c.useRef(null),et=c.useRef(0),be=c.useRef(0),X=c.useRef(new Set),Gq=c.useRef(new Set),me=c.useRef(null),Ne=c.useRef(null),K=c.useRef(null),W=c.useRef(null),fe=c.useRef(null),ee=c.useRef({path:null,pointerType:null}),ce=x;xe.current===null&&(xe.current=new jj(I=>Fe.getHoverPreview(I),{createObjectURL:I=>URL.createObjectURL(I),revokeObjectURL:I=>URL.revokeObjectURL(I)},{onReady:({path:I,url:Q})=>{ue.current={path:I,url:Q,image:null},Re.current=null,U(I),V(Q),Z(null),z(null),Y(!1),H(!0)},onError:({path:I,error:Q})=>{ue.current=null,Re.current=Q,U(I),V(null),Z(null),z(Q),Y(!1),H(!0)}}));const{width:Te,layout:de,rowVirtualizer:ut,virtualRows:Ke}=bj(ke,e,{gap:bi,targetCell:ce,aspect:Xj,captionH:Yj,viewMode:v});c.useLayoutEffect(()=>{const I=ke.current;if(I){if(t){I.setAttribute("inert","");return}I.removeAttribute("inert")}},[t,ke]);const sn=c.useMemo(()=>{const I=new Map;for(let Q=0;Q<e.length;Q++)I.set(e[Q].path,Q);return I},[e]),it=c.useMemo(()=>{if(de.mode!=="adaptive")return null;const I=new Map;return de.rows.forEach((Q,ae)=>{let ve=0;Q.items.forEach((Ce,_e)=>{const He=ve+Ce.displayW/2;I.set(Ce.item.path,{row:ae,center:He,order:_e}),ve+=Ce.displayW+bi})}),I},[de]);c.useEffect(()=>{if(!r.length)return;const I=r[0];he!==I&&pe(I)},[r,he]);const vt=c.useMemo(()=>{if(de.mode!=="adaptive")return null;let I=0;return de.rows.map(Q=>{const ae=I;return I+=Q.height,{start:ae,height:Q.height}})},[de]),mt=c.useRef(null),In=(I,Q)=>{try{qy(mt,Oe=>window.cancelAnimationFrame(Oe));const ae=I.scrollTop,ve=Q-ae;if(Math.abs(ve)<1){I.scrollTop=Q;return}const Ce=140,_e=performance.now(),He=Oe=>1-Math.pow(1-Oe,3),Le=Oe=>{const yn=Math.min(1,(Oe-_e)/Ce),Dt=He(yn);I.scrollTop=ae+ve*Dt,yn<1?mt.current=requestAnimationFrame(Le):mt.current=null};mt.current=requestAnimationFrame(Le)}catch{I.scrollTop=Q}};c.useEffect(()=>()=>{qy(mt,I=>window.cancelAnimationFrame(I))},[]);const[Ir,Ln]=c.useState(!1);c.useEffect(()=>{const I=ke.current;if(!I)return;let Q=null;const ae=()=>{var ve;(ve=Ne.current)==null||ve.cancelFromScroll(),Ft(!0),Ln(!0),Q=Wy(Q,Ce=>window.clearTimeout(Ce)),Q=window.setTimeout(()=>Ln(!1),Zj)};return I.addEventListener("scroll",ae,{passive:!0}),()=>{I.removeEventListener("scroll",ae),Q=Wy(Q,ve=>window.clearTimeout(ve))}},[]),c.useEffect(()=>{const I=new Kj({onLongPress:Q=>{if(t)return;const ae=K.current;if(!ae||!h)return;const ve=W.current??{x:Q.clientX,y:Q.clientY};h(ae,ve),fe.current={path:ae,untilMs:Date.now()+700}}});return Ne.current=I,()=>{I.destroy(),Ne.current===I&&(Ne.current=null)}},[t,h]);function fi(){Ee.current!=null&&(window.clearTimeout(Ee.current),Ee.current=null)}function Ft(I=!1){var Q;Re.current&&!I||(fi(),(Q=xe.current)==null||Q.clear(),H(!1),U(null),V(null),Z(null),Re.current=null,z(null),Y(!1),ue.current=null,O(null),F(null))}c.useEffect(()=>{if(!D)return;const I=ae=>{const ve=ae.target;if(ve instanceof Element&&Yy(ve))return;const Ce=ae.relatedTarget;!(Ce instanceof Element)||!Yy(Ce)||Ft(!0)},Q=ae=>{ae.relatedTarget===null&&Ft(!0)};return window.addEventListener("mouseover",I),window.addEventListener("mouseout",Q),()=>{window.removeEventListener("mouseover",I),window.removeEventListener("mouseout",Q)}},[D]),c.useLayoutEffect(()=>{var I;t&&((I=Ne.current)==null||I.cancelFromScroll(),Ft(!0))},[t]);const Lr=I=>{var Le;if(t||Ir)return;fi(),(Le=xe.current)==null||Le.clear();const Q=sn.get(I),ae=Q===void 0?null:e[Q],ve=Jm(ae,P,re),Ce=aa(),_e=Rj(Ce),He=Nj({surfaceSize:_e,viewport:Ce});U(I),V(null),Z(null),Re.current=null,z(null),Y(!1),ue.current=null,O(He),F(_e),H(!1),Ee.current=window.setTimeout(()=>{var Oe;if(Ee.current=null,ve){ue.current={path:I,url:ve,image:null},U(I),V(ve),Z(I),Y(!1),H(!0);return}Z(null),Re.current=null,z(null),H(!0),(Oe=xe.current)==null||Oe.begin(I)},Jj)},Rs=I=>{var ve,Ce;const Q=ue.current;if(!Q||Q.path!==$||Q.url!==q||Q.image!==null&&Q.image!==I||!I.isConnected||(I.currentSrc||I.src)!==Q.url)return;if(ue.current=null,Y(!1),!A||A!==$){(ve=xe.current)==null||ve.clear(),V(null);const _e=Ib();Re.current=_e,z(_e);return}const ae=A;le(_e=>{if(_e.has(ae))return _e;const He=new Set(_e);return He.add(ae),He}),Z(null),V(null),Re.current=null,z(null),H(!0),(Ce=xe.current)==null||Ce.begin(ae)},On=I=>{const Q=ue.current;!Q||(I.currentSrc||I.src)!==Q.url||(ue.current={...Q,image:I},Ub(I).then(()=>{var ae;((ae=ue.current)==null?void 0:ae.path)!==Q.path||ue.current.url!==Q.url||ue.current.image!==I||!I.isConnected||(I.currentSrc||I.src)!==Q.url||Y(!0)}).catch(()=>Rs(I)))},Or=()=>{var I;$&&(V(null),Z(null),Re.current=null,z(null),Y(!1),ue.current=null,H(!0),(I=xe.current)==null||I.begin($))};c.useEffect(()=>()=>{var I;Ee.current!=null&&(window.clearTimeout(Ee.current),Ee.current=null),(I=xe.current)==null||I.clear()},[]);const At=de.mode==="grid"?de.columns:Math.max(1,Math.floor(Te/(ce+bi)));c.useEffect(()=>{var ve;if(t||!j||!E||N||!e.length||!Ke.length)return;const I=Ke[Ke.length-1],Q=de.mode==="grid"?Math.min(e.length-1,(I.index+1)*Math.max(1,de.columns)-1):Math.max(-1,...(((ve=de.rows[I.index])==null?void 0:ve.items)??[]).map(Ce=>Ce.originalIndex)),ae=Math.max(30,At*8);Q>=e.length-ae&&j()},[At,E,t,N,e.length,de,j,Ke]);const Fn=(I,Q)=>{if(de.mode!=="adaptive")return null;const ae=de.rows[I];if(!ae)return null;let ve=0,Ce=null;for(const _e of ae.items){const He=ve+_e.displayW/2,Le=Math.abs(He-Q);(!Ce||Le<Ce.dist)&&(Ce={path:_e.item.path,dist:Le}),ve+=_e.displayW+bi}return Ce?Ce.path:null},jt=(I,Q)=>{var Ve,_t,Dr,hr;if(!e.length)return null;const ae=I??e[0].path;if(de.mode!=="adaptive"){const zr=Sj(e,At,ae,Q);return zr==="open"||zr==null?zr:((Ve=e[zr])==null?void 0:Ve.path)??null}const ve=it==null?void 0:it.get(ae);if(!ve)return ae;const Ce=sn.get(ae)??0,_e=Q.key,He=_e.toLowerCase();if(_e==="Enter")return"open";if(_e==="ArrowRight"||He==="d")return((_t=e[Math.min(e.length-1,Ce+1)])==null?void 0:_t.path)??ae;if(_e==="ArrowLeft"||He==="a")return((Dr=e[Math.max(0,Ce-1)])==null?void 0:Dr.path)??ae;const Le=_e==="ArrowDown"||He==="s"?1:_e==="ArrowUp"||He==="w"?-1:0;if(Le===0)return null;const Oe=ve.row+Le;if(Oe<0||Oe>=(((hr=de.rows)==null?void 0:hr.length)??0))return ae;const yn=ve.center;return Fn(Oe,yn)??ae},qe=I=>{var Q;try{(Q=document.getElementById(`cell-${encodeURIComponent(I)}`))==null||Q.focus()}catch{}},pt=c.useCallback(I=>{try{Fe.prefetchThumb(I)}catch{}},[]),on=c.useCallback((I,Q)=>{t||h==null||h(I,Q)},[t,h]),hi=()=>{K.current=null,W.current=null},Ns=(I,Q)=>{var ae;t||Q.target.closest("[data-grid-action]")||(ee.current={path:I,pointerType:Q.pointerType},!l&&(K.current=I,W.current={x:Q.clientX,y:Q.clientY},(ae=Ne.current)==null||ae.pointerDown(Xy(Q))))},To=I=>{var Q;t||l||(W.current={x:I.clientX,y:I.clientY},(Q=Ne.current)==null||Q.pointerMove(Xy(I)))},mi=I=>{var Q;t||l||((Q=Ne.current)==null||Q.pointerUp(I.pointerId),hi())},Jn=I=>{var Q;t||l||((Q=Ne.current)==null||Q.pointerCancel(I.pointerId),hi())},dr=(I,Q)=>{if(t)return;const ae=fe.current;if(ae&&ae.path===I&&ae.untilMs>Date.now()){fe.current=null,qe(I);return}ae&&ae.untilMs<=Date.now()&&(fe.current=null),pe(I),we(I);const ve=!!Q.shiftKey,Ce=!!(Q.ctrlKey||Q.metaKey);if(l)a(Qy(r,I)),Ye.current=I;else if(Wj({pointerType:ee.current.path===I?ee.current.pointerType:null,multiSelectMode:l,isShift:ve,isToggle:Ce,selectedPaths:r,path:I}))a([I]),Ye.current=I,d(I);else if(ve){const _e=Ye.current??he??r[0]??I,He=sn.get(_e)??e.findIndex(Oe=>Oe.path===_e),Le=sn.get(I)??e.findIndex(Oe=>Oe.path===I);if(He!==-1&&Le!==-1){const Oe=Math.min(He,Le),yn=Math.max(He,Le),Dt=e.slice(Oe,yn+1).map(Ve=>Ve.path);if(Ce){const Ve=new Set(r);for(const _t of Dt)Ve.add(_t);a(Array.from(Ve))}else a(Dt)}else a([I])}else Ce?(a(Qy(r,I)),Ye.current=I):(a([I]),Ye.current=I);Ir||pt(I),qe(I)};c.useEffect(()=>{const I=ke.current;if(!I)return;const Q=ae=>{var Dt,Ve,_t;if(t)return;const ve=jt(Se,ae);if(ve==null)return;if(ae.preventDefault(),ve==="open"){Se&&d(Se);return}const Ce=e.find(Dr=>Dr.path===ve);if(!Ce)return;we(Ce.path),pe(Ce.path),a([Ce.path]),Ye.current=Ce.path;const _e=de.mode==="grid"?Math.floor((sn.get(Ce.path)??0)/Math.max(1,de.columns)):((Dt=it==null?void 0:it.get(Ce.path))==null?void 0:Dt.row)??0,He=I.scrollTop,Le=He+I.clientHeight,Oe=de.mode==="adaptive"?((Ve=vt==null?void 0:vt[_e])==null?void 0:Ve.start)??0:_e*de.rowH,yn=de.mode==="adaptive"?Oe+(((_t=vt==null?void 0:vt[_e])==null?void 0:_t.height)??0):Oe+de.rowH;(Oe<He||yn>Le)&&In(I,Oe),qe(Ce.path)};return I.addEventListener("keydown",Q),()=>{I.removeEventListener("keydown",Q)}},[e,Se,At,t,d,de,it,vt,sn]),c.useLayoutEffect(()=>{const I=ke.current;if(!I||t)return;const Q=Aj({selectionToken:s,appliedSelectionToken:et.current,selectedPath:r[0]??null,topAnchorToken:i,appliedTopAnchorToken:be.current,topAnchorPath:o??null,hasPath:ve=>sn.has(ve)});if(!Q)return;const ae=Dj({path:Q.path,pathToIndex:sn,layout:de,adaptiveRowMeta:vt});if(ae!=null){try{I.scrollTop=ae}catch{}if(Q.source==="selection"){et.current=Q.token;return}be.current=Q.token}},[s,i,o,r,sn,de,vt,t]);const fr=c.useMemo(()=>new Set(r),[r]),Fr=c.useMemo(()=>{const I=new Map;for(let Q=0;Q<r.length;Q+=1)I.set(r[Q],Q+1);return I},[r]),Io=!!($&&T&&(G||D)),ln=c.useMemo(()=>_j(Ke,de,e),[e,de,Ke]),js=c.useMemo(()=>{var I,Q;return new Set(Tj(Ke,de,e,((I=ke.current)==null?void 0:I.scrollTop)??0,((Q=ke.current)==null?void 0:Q.clientHeight)??0))},[e,de,ke,Ke]);c.useEffect(()=>{if(!(t||Ir||ln.length===0))for(const I of ln)pt(I)},[t,Ir,ln,pt]),c.useEffect(()=>{var I;t||(I=ke.current)==null||I.focus()},[t,ke]),c.useEffect(()=>{var I;if(S){try{(I=ke.current)==null||I.blur()}catch{}we(null)}},[S]);const Zn=c.useMemo(()=>Lj(e,de,Ke),[e,de,Ke]),Ar=c.useMemo(()=>{var I;return Oj(e,de,Ke,((I=ke.current)==null?void 0:I.scrollTop)??0)},[e,de,Ke,ke]);c.useEffect(()=>{t||e_(Gq.current,Zn)||(Gq.current=Zn,Fe.advanceThumbGeneration())},[t,Zn]),c.useEffect(()=>{t||!b||e_(X.current,Zn)||(X.current=Zn,b(Zn))},[t,b,Zn]),c.useEffect(()=>{t||!w||me.current!==Ar&&(me.current=Ar,w(Ar))},[t,w,Ar]);const pi=Se?`cell-${encodeURIComponent(Se)}`:void 0,An=g.kind==="loading"||g.kind==="updating"||N,an=C>k?`Loaded ${k} of ${C}`:`${k} loaded`,Me=g.kind==="failed"?k>0?`${an}. Query failed.`:"Query failed.":g.kind==="unsupported"?k>0?`${an}. Query unavailable.`:"Query unavailable.":g.kind==="updating"?`${an}. Updating results...`:g.kind==="loading"?g.title:N?`${an}. Loading more...`:E?`${an}. Scroll for more.`:g.kind==="empty"?g.title:an;return c.useEffect(()=>{if(!e.length||Qx().firstGridItemLatencyMs!=null)return;const I=ke.current;if(!I)return;const Q=I.querySelector('[role="gridcell"][id^="cell-"]');if(!Q)return;const ae=I.getBoundingClientRect(),ve=Q.getBoundingClientRect();if(!(ve.bottom>=ae.top&&ve.top<=ae.bottom))return;const _e=Q.id.startsWith("cell-")?Q.id.slice(5):"";let He=e[0].path;if(_e)try{He=decodeURIComponent(_e)}catch{He=e[0].path}IM(He)},[e,ke]),u.jsxs("div",{role:"grid","aria-label":"Gallery",className:`relative h-full overflow-auto p-3 outline-none scrollbar-thin ${Io?"cursor-zoom-in":""}`,ref:ke,tabIndex:0,"aria-activedescendant":pi,"aria-busy":An||void 0,"aria-disabled":t||void 0,"data-grid-presentation-phase":n,"data-grid-interaction-disabled":t?"true":"false","data-grid-loaded-count":k,onMouseDown:()=>{var I;t||(I=ke.current)==null||I.focus()},style:{"--gap":`${bi}px`},children:[u.jsxs("div",{className:"relative w-full",style:{height:ut.getTotalSize()},children:[u.jsx(ej,{virtualRows:Ke,layout:de,items:e,gap:bi,scrollRootRef:ke,suppressSelectionHighlight:S,active:he,focused:Se,selectedSet:fr,selectionOrderByPath:Fr,recentlyUpdated:y,highlight:m,isScrolling:Ir,multiSelectMode:l,onCellFocus:I=>{t||we(I)},onPointerDown:Ns,onPointerMove:To,onPointerUp:mi,onPointerCancel:Jn,onContextMenuItem:t?void 0:f,onOpenItemActions:on,onOpenViewer:I=>{t||d(I)},onClearPreview:()=>Ft(),onSchedulePreview:Lr,onItemClick:dr,demandThumbPaths:js}),$&&T&&B&&L&&(q||D)&&jo.createPortal(u.jsx("div",{className:`grid-hover-preview fixed z-[999] overflow-hidden rounded-lg border border-border bg-panel/95 shadow-lg ${D?"pointer-events-auto":"pointer-events-none"}`,"data-preview-path":$,"data-media-state":D?"error":G?"ready":"decoding","aria-hidden":D?void 0:!0,style:{left:B.x,top:B.y,width:L.width,height:L.height,visibility:D||G?"visible":"hidden"},children:q?u.jsx("img",{src:q,alt:"preview",className:"block h-full w-full object-contain",onLoad:I=>On(I.currentTarget),onError:I=>Rs(I.currentTarget)}):D?u.jsxs("div",{className:"media-error-overlay media-error-overlay-preview",children:[u.jsx("div",{className:"media-error-title",children:"Preview failed"}),u.jsx("div",{className:"media-error-message",children:Qm(D)}),D.retryable&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:Or,children:"Retry"})]}):null}),document.body)]}),g.showCentered&&u.jsx("div",{className:"pointer-events-none absolute inset-3 z-20 flex items-center justify-center",children:u.jsxs("div",{className:"pointer-events-auto w-full max-w-[580px] rounded-lg border border-border bg-panel/95 px-4 py-3 shadow-lg",children:[u.jsxs("div",{className:"flex items-center justify-between gap-3 text-xs text-text",children:[u.jsx("span",{className:"font-semibold",children:g.title}),g.kind==="failed"&&R&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:R,children:"Retry"})]}),g.message&&u.jsx("div",{className:"mt-2 text-[11px] text-muted",children:g.message})]})}),u.jsxs("div",{className:"min-h-10 px-2.5 pt-2 pb-4 flex items-center justify-center gap-2 text-muted text-[11px] leading-[1.35] text-center","data-grid-state":g.kind,"data-has-more":E?"true":"false",children:[u.jsx("span",{children:Me}),g.kind==="failed"&&R&&!g.showCentered&&u.jsx("button",{type:"button",className:"btn btn-xs",onClick:R,children:"Retry"})]})]})}function Wt(e){return typeof e=="number"&&Number.isFinite(e)?e:null}function Vb(e,t){if(!e.length)return null;const n=Math.max(1,Math.trunc(t)),r=Math.min(...e);let s=Math.max(...e);r===s&&(s=r+1);const i=new Array(n).fill(0),o=n/(s-r);for(const l of e){const a=Math.max(0,Math.min(n-1,Math.floor((l-r)*o)));i[a]+=1}return{bins:i,min:r,max:s,count:e.length}}function n_({active:e,localComplete:t,localHistogram:n,facetHistogram:r,facetState:s}){return e?r?{state:"ready",histogram:r}:t?n?{state:"ready",histogram:n}:{state:"empty",histogram:null}:s==="error"?{state:"error",histogram:null}:s==="settled"?{state:"empty",histogram:null}:{state:"pending",histogram:null}:{state:"empty",histogram:null}}function Wb(e,t,n){const r=t.max-t.min;if(r<=0)return 0;const s=Er((e-t.min)/r);return n==="desc"?1-s:s}function Jy(e,t,n){const r=n==="desc"?1-Er(e):Er(e);return t.min+(t.max-t.min)*r}function r_(e,t,n){var o;const r=Wt(n);if(r==null)return null;let s=null,i=Number.POSITIVE_INFINITY;for(const l of e){const a=Wt((o=l.metrics)==null?void 0:o[t]);if(a==null)continue;const d=Math.abs(a-r);d>=i||(i=d,s=l.path)}return s}function s_(e,t){if(!e.length)return null;const n=Math.round(Er(t)*(e.length-1)),r=e[n];if(r!=null)return r;for(let s=1;s<e.length;s+=1){const i=n-s;if(i>=0&&e[i]!=null)return e[i];const o=n+s;if(o<e.length&&e[o]!=null)return e[o]}return null}function Er(e){return e<0?0:e>1?1:e}const i_=48,o_=[.1,.24,.5,.74,.9];function l_({items:e,metricKey:t,metricLabel:n,scrollRef:r,sortDir:s,currentPath:i=null,state:o="ready",histogramOverride:l=null,populationComplete:a=!0,onJumpToMetricValue:d,onRetry:f}){const{orderedValues:h,numericValues:m}=c.useMemo(()=>{var F;const O=[],L=[];for(const T of e){const H=Wt((F=T.metrics)==null?void 0:F[t]);O.push(H),H!=null&&L.push(H)}return{orderedValues:O,numericValues:L}},[e,t]),y=c.useMemo(()=>Vb(m,i_),[m]),b=l??y,w=c.useMemo(()=>b?a_(b,o_):[],[b]),[S,v]=c.useState(0),[x,p]=c.useState(null),[g,k]=c.useState(!1),C=c.useRef(null);c.useEffect(()=>{const O=r.current;if(!O)return;const L=()=>{const F=Math.max(1,O.scrollHeight-O.clientHeight),T=Er(F>0?O.scrollTop/F:0);v(T)};return L(),O.addEventListener("scroll",L,{passive:!0}),window.addEventListener("resize",L),()=>{O.removeEventListener("scroll",L),window.removeEventListener("resize",L)}},[r,e.length]),c.useEffect(()=>{p(null)},[t,e.length]);const R=b?{min:b.min,max:b.max}:null,E=c.useMemo(()=>{var O;if(i){const L=e.find(T=>T.path===i),F=Wt((O=L==null?void 0:L.metrics)==null?void 0:O[t]);if(F!=null)return F}return s_(h,S)},[i,e,t,h,S]),N=c.useMemo(()=>x==null||R==null?null:Jy(x,R,s),[R==null?void 0:R.max,R==null?void 0:R.min,x,s]),j=n??t;if(o!=="ready"||!b||!R)return u.jsx("div",{className:"relative h-full w-full flex items-center justify-center rounded bg-surface-inset border border-border/60","data-metric-rail":t,"data-metric-rail-state":o,"aria-busy":o==="pending"||void 0,children:o==="error"&&f?u.jsx("button",{type:"button",className:"btn btn-ghost h-full w-full min-w-0 px-0 text-danger","aria-label":`Retry ${j} metric distribution`,title:`Retry ${j} metric distribution`,onClick:f,children:"!"}):u.jsx("span",{className:"text-[10px] text-muted","aria-label":o==="empty"?`No finite values for ${j} metric distribution`:`Loading ${j} metric distribution`,children:o==="empty"?"—":""})});const P=R,$=x!=null?au(x):null,U=s==="desc",q=a,V=`w-full h-full rounded bg-surface-inset border border-border/60 ${q?"cursor-crosshair":"cursor-default"}`,A=E==null?au(S):au(Wb(E,P,s));function Z(O){p(Er(O))}function D(){p(null)}function z(O){q&&d(Jy(O,P,s))}function B(O){var F;const L=(F=C.current)==null?void 0:F.getBoundingClientRect();return L?Er((O.clientY-L.top)/L.height):null}return u.jsxs("div",{className:"relative h-full w-full flex items-stretch pointer-events-auto","data-metric-rail":t,"data-metric-rail-state":"ready","data-metric-rail-count":b.count,"data-metric-rail-min":b.min,"data-metric-rail-max":b.max,"data-metric-rail-bins":b.bins.join(","),"data-metric-rail-quantiles":w.join(","),children:[u.jsxs("svg",{ref:C,viewBox:"0 0 10 100",preserveAspectRatio:"none",className:V,"aria-label":`${j} metric distribution rail`,onPointerDown:O=>{var F;O.preventDefault();const L=B(O);L!=null&&(k(!0),Z(L),z(L),(F=C.current)==null||F.setPointerCapture(O.pointerId))},onPointerMove:O=>{const L=B(O);if(L==null){g||D();return}Z(L),g&&z(L)},onPointerUp:O=>{var L;k(!1),(L=C.current)==null||L.releasePointerCapture(O.pointerId)},onPointerLeave:()=>{g||D()},children:[u.jsx("title",{children:q?j:`${j} backend summary`}),u_(b.bins,"var(--border-strong)",{flip:U}),c_(w,P,{sortDir:s,color:"var(--muted)"}),Zy(A,{color:"var(--highlight)",strokeWidth:.8}),$!=null&&Zy($,{color:"var(--text-secondary)",strokeWidth:.6,dashed:!0})]}),N!=null&&x!=null&&u.jsx("div",{className:"pointer-events-none absolute right-full mr-2 px-1.5 py-0.5 rounded border border-border bg-surface text-[10px] text-text shadow",style:{top:`calc(${(x*100).toFixed(2)}% - 8px)`},children:d_(N)})]})}function a_(e,t){const n=e.bins.reduce((s,i)=>s+i,0);if(!n||!e.bins.length)return[];const r=(e.max-e.min)/e.bins.length;return t.map(s=>{const i=Er(s)*Math.max(0,n-1);let o=0;for(let l=0;l<e.bins.length;l+=1)if(o+=e.bins[l],o>i)return e.min+(l+.5)*r;return e.max})}function u_(e,t,n){const r=Math.max(1,...e),s=100/e.length,i=(n==null?void 0:n.flip)??!1;return e.map((o,l)=>{const a=Math.max(.8,o/r*10),d=(i?e.length-1-l:l)*s;return u.jsx("rect",{x:10-a,y:d,width:a,height:Math.max(.2,s-.2),fill:t,opacity:.9},`sb-${l}`)})}function c_(e,t,n){const r=(n==null?void 0:n.sortDir)??"asc",s=n==null?void 0:n.color;return e.map((i,o)=>{const l=au(Wb(i,t,r)),a=o===2;return u.jsx("line",{x1:0,y1:l,x2:10,y2:l,stroke:s,strokeWidth:a?.8:.5,opacity:a?.9:.6,vectorEffect:"non-scaling-stroke"},`qt-${o}-${i}`)})}function Zy(e,t){return u.jsx("line",{x1:0,y1:e,x2:10,y2:e,stroke:t.color,strokeWidth:t.strokeWidth??.6,strokeDasharray:t.dashed?"1.2 1.2":void 0,opacity:.95,vectorEffect:"non-scaling-stroke"})}function au(e){return Er(e)*100}function d_(e){const t=Wt(e);if(t==null)return"-";const n=Math.abs(t);return n>=1e3?t.toFixed(0):n>=10?t.toFixed(2):t.toFixed(3)}function f_({embeddings:e,rejected:t=[],selectedPath:n,embeddingsLoading:r=!1,embeddingsError:s,onClose:i,onSearch:o}){const[l,a]=c.useState(()=>{var A;return((A=e[0])==null?void 0:A.name)??""}),[d,f]=c.useState(()=>n?"path":"vector"),[h,m]=c.useState(()=>n??""),[y,b]=c.useState(""),[w,S]=c.useState("50"),[v,x]=c.useState(""),[p,g]=c.useState(null),[k,C]=c.useState(!1),R=c.useRef(null),E=c.useRef(null),N=c.useRef(!0);c.useLayoutEffect(()=>(N.current=!0,()=>{N.current=!1}),[]);const j=c.useMemo(()=>e.find(A=>A.name===l)??e[0]??null,[e,l]);c.useEffect(()=>{e.length>0&&!e.some(A=>A.name===l)&&a(e[0].name)},[e,l]),c.useEffect(()=>{const A=d==="vector"?E.current:R.current,Z=window.requestAnimationFrame(()=>A==null?void 0:A.focus());return()=>window.cancelAnimationFrame(Z)},[d]);const P=c.useCallback(async()=>{if(g(null),!e.length){g("No embeddings available for similarity search.");return}if(!j){g("Select an embedding to search.");return}const A=h.trim(),Z=y.trim(),D=Number(w);if(!Number.isFinite(D)||D<=0){g("Top K must be a positive number.");return}const z=Math.min(1e3,Math.max(1,Math.floor(D))),B=v.trim()===""?null:Number(v);if(B!=null&&!Number.isFinite(B)){g("Min score must be a valid number.");return}if(d==="path"&&!A){g("Select an image path for the query.");return}if(d==="vector"&&!Z){g("Paste a base64 vector for the query.");return}const O={embedding:j.name,query:d==="path"?{kind:"path",path:A}:{kind:"vector",vector_b64:Z},top_k:z,min_score:B};C(!0);try{await o(O)&&N.current&&i()}catch(L){if(!N.current)return;L instanceof jn||L instanceof Error?g(L.message):g("Failed to run similarity search.")}finally{N.current&&C(!1)}},[e.length,j,h,y,w,v,d,o,i]);c.useEffect(()=>{const A=Z=>{if(Z.key==="Escape"){Z.preventDefault(),i();return}(Z.ctrlKey||Z.metaKey)&&Z.key==="Enter"&&(Z.preventDefault(),P())};return window.addEventListener("keydown",A),()=>window.removeEventListener("keydown",A)},[i,P]);const $=c.useCallback(()=>{var A;n&&(f("path"),m(n),(A=R.current)==null||A.focus())},[n]),U=e.map(A=>({value:A.name,label:A.name,keywords:[A.name]})),q=t.length>0,V=t.slice(0,3);return u.jsx("div",{className:"similarity-modal-overlay fixed inset-0 z-[var(--z-overlay)] flex items-center justify-center bg-black/40 backdrop-blur-sm p-4",onClick:A=>{A.target===A.currentTarget&&i()},children:u.jsxs("div",{className:"similarity-modal-shell w-full max-w-2xl rounded-lg border border-border bg-panel shadow-[0_20px_50px_rgba(0,0,0,0.55)]",onClick:A=>A.stopPropagation(),role:"dialog","aria-modal":"true","aria-label":"Find similar",children:[u.jsxs("div",{className:"similarity-modal-header flex items-center justify-between px-4 py-3 border-b border-border",children:[u.jsxs("div",{children:[u.jsx("div",{className:"text-sm font-semibold text-text",children:"Find similar"}),u.jsx("div",{className:"text-xs text-muted",children:"Search with embeddings"})]}),u.jsx("button",{className:"btn btn-sm",onClick:i,"aria-label":"Close",children:"Close"})]}),u.jsxs("div",{className:"similarity-modal-body scrollbar-thin px-4 py-4 space-y-4",children:[u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Embedding"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx(Tn,{value:(j==null?void 0:j.name)??"",onChange:a,options:U,placeholder:r?"Loading embeddings...":"Select embedding",disabled:!e.length,triggerClassName:"min-w-[180px]",searchable:"auto",searchPlaceholder:"Search embeddings...",emptyMessage:"No matching embeddings"}),j&&u.jsxs("span",{className:"text-xs text-muted",children:[j.dimension," dims, ",j.metric,", ",j.dtype]})]})]}),u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Query mode"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("button",{type:"button",className:`btn btn-sm ${d==="path"?"btn-active":""}`,onClick:()=>f("path"),"aria-pressed":d==="path",children:"Selected image"}),u.jsx("button",{type:"button",className:`btn btn-sm ${d==="vector"?"btn-active":""}`,onClick:()=>f("vector"),"aria-pressed":d==="vector",children:"Vector input"})]})]}),u.jsx("div",{className:"similarity-modal-query",children:d==="path"?u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Image path"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("input",{ref:R,type:"text",className:"input w-full",value:h,onChange:A=>m(A.target.value),placeholder:n?"Selected image path":"Select an image first"}),u.jsx("button",{type:"button",className:"btn btn-sm",onClick:$,disabled:!n,title:n?"Use selected image":"Select an image first",children:"Use selected"})]})]}):u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Vector (base64 float32)"}),u.jsx("textarea",{ref:E,className:"ui-textarea w-full text-[11px]",rows:5,value:y,onChange:A=>b(A.target.value),placeholder:"Paste base64-encoded float32 vector"}),u.jsx("div",{className:"text-[11px] text-muted",children:"Base64 of little-endian float32. Length must match embedding dimension."})]})}),u.jsxs("div",{className:"grid grid-cols-2 gap-3",children:[u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Top K"}),u.jsx("input",{type:"number",min:1,max:1e3,step:1,className:"input ui-number w-full",value:w,onChange:A=>S(A.target.value)})]}),u.jsxs("div",{className:"space-y-2",children:[u.jsx("label",{className:"ui-label",children:"Min score"}),u.jsx("input",{type:"number",step:.01,className:"input ui-number w-full",value:v,onChange:A=>x(A.target.value),placeholder:"Optional"})]})]}),u.jsxs("div",{className:"similarity-modal-status space-y-2",children:[s&&u.jsx("div",{className:"ui-banner ui-banner-danger text-xs",role:"alert",children:s}),q&&u.jsxs("div",{className:"ui-banner text-xs",children:[u.jsx("div",{className:"font-semibold",children:"Skipped columns"}),u.jsxs("div",{className:"mt-1 space-y-1 text-muted",children:[V.map(A=>u.jsxs("div",{children:[A.name,": ",A.reason]},A.name)),t.length>V.length&&u.jsxs("div",{children:["+",t.length-V.length," more"]})]})]}),p&&u.jsx("div",{className:"ui-banner ui-banner-danger text-xs",role:"alert",children:p})]})]}),u.jsxs("div",{className:"similarity-modal-footer flex items-center justify-between px-4 py-3 border-t border-border",children:[u.jsx("div",{className:"text-xs text-muted",children:j?`Metric: ${j.metric}`:"Metric: cosine"}),u.jsxs("div",{className:"flex items-center gap-2",children:[u.jsx("button",{className:"btn btn-sm btn-ghost",onClick:i,disabled:k,children:"Cancel"}),u.jsx("button",{className:"btn btn-sm btn-active",onClick:P,disabled:k||!e.length,children:k?"Searching...":"Find similar"})]})]})]})})}function Qu(e){try{URL.revokeObjectURL(e)}catch{}}function h_(e,t){let n=!1;const r=()=>{n||(n=!0,t())};if(typeof window<"u"&&typeof window.requestAnimationFrame=="function"){let i=0,o=0;return i=window.requestAnimationFrame(()=>{o=window.requestAnimationFrame(()=>{r(),Qu(e)})}),{url:e,cancel:()=>{i&&window.cancelAnimationFrame(i),o&&window.cancelAnimationFrame(o),r()}}}const s=setTimeout(()=>{r(),Qu(e)},0);return{url:e,cancel:()=>{clearTimeout(s),r()}}}function m_(e){const t=e.current;e.current=[];for(const n of t)n.cancel(),Qu(n.url)}function p_(e){e.current&&(Qu(e.current),e.current=null)}function Kd(e,t){m_(t),p_(e)}function g_(e,t){const n=h_(e,()=>{t.current=t.current.filter(r=>r.url!==e)});t.current.push(n)}function y_(e,t,n={}){const r=n.source??"blob",s=n.unsupportedReason??null,i=n.identity,[o,l]=c.useState({status:"idle"}),a=c.useRef(0),d=c.useRef(null),f=c.useRef([]),[h,m]=c.useState(0),y=c.useCallback(()=>{m(b=>b+1)},[]);return c.useEffect(()=>{if(s){Kd(d,f),l({status:"unsupported",reason:s,identity:i});return}if(!e){Kd(d,f),l({status:"idle",identity:i});return}let b=!0;const w=a.current+1;a.current=w,l({status:"loading",requestId:w,source:r,identity:i});let S;try{S=e()}catch(v){$l(v)?l({status:"idle",identity:i}):l({status:"error",requestId:w,error:Vu(v),retry:y,identity:i});return}return S.then(v=>{if(!b||a.current!==w)return;const x=URL.createObjectURL(v),p=d.current;d.current=x,l({status:"ready",requestId:w,source:r,url:x,identity:i}),p&&g_(p,f)}).catch(v=>{if(!(!b||a.current!==w)){if($l(v)){l({status:"idle",identity:i});return}l({status:"error",requestId:w,error:Vu(v),retry:y,identity:i})}}),()=>{b=!1}},[...t,h,r,s,i]),c.useEffect(()=>()=>{Kd(d,f)},[]),o}const v_=["button","a[href]","input","select","textarea",'[contenteditable]:not([contenteditable="false"])','[role="button"]','[role="checkbox"]','[role="combobox"]','[role="menuitem"]','[role="menuitemcheckbox"]','[role="menuitemradio"]','[role="option"]','[role="radio"]','[role="searchbox"]','[role="slider"]','[role="spinbutton"]','[role="switch"]','[role="textbox"]'].join(",");function Zm(e){return!e||typeof HTMLElement>"u"||!(e instanceof HTMLElement)?!1:e.closest('input, textarea, select, [contenteditable]:not([contenteditable="false"]), [role="textbox"], [role="searchbox"], [role="combobox"]')!==null}function qb(e){return e.altKey||e.ctrlKey||e.metaKey}function Qb(e){return!e||typeof HTMLElement>"u"||!(e instanceof HTMLElement)?!1:e.closest(v_)!==null}function ep(e){const t=e.key.toLowerCase();return e.key==="ArrowRight"||t==="d"?1:e.key==="ArrowLeft"||t==="a"?-1:null}function w_(e){if(!e.isConnected)return!1;const t=e.getBoundingClientRect();if(t.width<=0||t.height<=0)return!1;const n=window.getComputedStyle(e);return n.display!=="none"&&n.visibility!=="hidden"}function Gb(){if(typeof document>"u"||typeof window>"u")return null;const e=Array.from(document.querySelectorAll('[role="dialog"][aria-modal="true"]')).filter(w_);return e[e.length-1]??null}function x_(){return Gb()!==null}function b_(e){if(!e||typeof document>"u")return!1;const t=Gb();return t===null?document.contains(e):t===e}function JF(e,t){return ep(e)!==null&&!qb(e)&&!Qb(e.target)&&b_(t)}function S_(e){return ep(e)!==null&&!qb(e)&&!Zm(e.target)}const k_=.05,C_=8;function bt(e){return Number.isFinite(e)&&e>0}function xs(e,t,n){return Math.min(n,Math.max(t,e))}function Xs(e){return Number.isFinite(e)?Number(xs(e,k_,C_).toFixed(4)):1}function ev(e,t){return!bt(e)||!bt(t)?0:Math.min(96,Math.max(48,e*.1),t*.25)}function tv(e,t,n,r){if(t<=e){const l=(e-t)/2;if(!(r!=null&&r.panSlack))return l;const a=ev(e,t);return xs(n,l-a,l+a)}const s=e-t,i=0;if(!(r!=null&&r.panSlack))return xs(n,s,i);const o=ev(e,t);return xs(n,s-o,i+o)}function wh(e,t){if(!bt(e.width)||!bt(e.height)||!bt(t.width)||!bt(t.height))return{base:1,scale:1,tx:0,ty:0};const n=Math.min(1,e.width/t.width,e.height/t.height),r=t.width*n,s=t.height*n;return{base:n,scale:1,tx:(e.width-r)/2,ty:(e.height-s)/2}}function Bl(e,t,n,r){const s=bt(n.base)?n.base:1,i=Xs(n.scale),o=t.width*s*i,l=t.height*s*i;if(!bt(e.width)||!bt(e.height)||!bt(t.width)||!bt(t.height)||!bt(o)||!bt(l))return{base:s,scale:i,tx:n.tx,ty:n.ty};const a=tv(e.width,o,n.tx,r),d=tv(e.height,l,n.ty,r);return{base:s,scale:i,tx:a,ty:d}}function Vd(e){const t=Xs(e.transform.scale),n=Xs(e.nextScale);if(n===t)return Bl(e.container,e.image,{...e.transform,scale:t},e.clampOptions);const r=n/t;return Bl(e.container,e.image,{...e.transform,scale:n,tx:e.point.x-r*(e.point.x-e.transform.tx),ty:e.point.y-r*(e.point.y-e.transform.ty)},e.clampOptions)}function E_(e){return Bl(e.container,e.image,{...e.transform,tx:e.transform.tx+e.dx,ty:e.transform.ty+e.dy},e.clampOptions)}function Ka(e){const t=e.transform.base*e.transform.scale;return!bt(e.container.width)||!bt(e.container.height)||!bt(e.image.width)||!bt(e.image.height)||!bt(t)?{x:.5,y:.5}:{x:xs((e.container.width/2-e.transform.tx)/(e.image.width*t),0,1),y:xs((e.container.height/2-e.transform.ty)/(e.image.height*t),0,1)}}function M_(e){const t=wh(e.container,e.image),n=Xs(e.scale),r=e.container.width/2-xs(e.center.x,0,1)*e.image.width*t.base*n,s=e.container.height/2-xs(e.center.y,0,1)*e.image.height*t.base*n;return Bl(e.container,e.image,{base:t.base,scale:n,tx:r,ty:s},e.clampOptions)}function R_(e){let t=null,n=null;const r=()=>{t=null;const s=n;n=null,s==null||s()};return{schedule(s){if(n=s,t!==null)return;const i=e.requestFrame(r);if(i===null){r();return}t=i},cancel(){t!==null&&e.cancelFrame(t),t=null,n=null},hasPending(){return t!==null||n!==null}}}function nv(){return R_({requestFrame(e){return typeof window>"u"||typeof window.requestAnimationFrame!="function"?null:window.requestAnimationFrame(e)},cancelFrame(e){typeof window>"u"||typeof window.cancelAnimationFrame!="function"||window.cancelAnimationFrame(e)}})}const N_=1.2,j_=3,__=450,Si={panSlack:!0},rv={base:1,scale:1,tx:0,ty:0};function P_(e,t){return Math.hypot(t.x-e.x,t.y-e.y)>=j_}function T_(e){return e.panMoved||e.pinchActive}function sv(e,t){return Math.hypot(e.x-t.x,e.y-t.y)}function iv(e,t){return{x:(e.x+t.x)/2,y:(e.y+t.y)/2}}function I_(e,t){try{e.setPointerCapture(t)}catch{}}function L_(e,t){try{e.releasePointerCapture(t)}catch{}}function ki(e){if(!e)return null;const t=e.getBoundingClientRect();return!Number.isFinite(t.width)||!Number.isFinite(t.height)||t.width<=0||t.height<=0?null:{width:t.width,height:t.height}}function Ci(e){return!e||!e.naturalWidth||!e.naturalHeight?null:{width:e.naturalWidth,height:e.naturalHeight}}function O_(e){return e instanceof Element&&e.closest('button, a, input, select, textarea, [role="button"]')!==null}function ov(){return typeof performance<"u"&&typeof performance.now=="function"?performance.now():Date.now()}function F_(){const[e,t]=c.useState(rv),[n,r]=c.useState(!1),[s,i]=c.useState(!1),[o,l]=c.useState(0),{scale:a,tx:d,ty:f,base:h}=e,m=c.useRef(null),y=c.useRef(null),b=c.useRef(rv),w=c.useRef(null),S=c.useRef(null),v=c.useRef(null),x=c.useRef({x:.5,y:.5}),p=c.useRef(new Map),g=c.useRef(null),k=c.useRef(null),C=c.useRef(0);S.current===null&&(S.current=nv()),v.current===null&&(v.current=nv());const R=c.useCallback(()=>b.current,[]),E=c.useCallback(()=>{const T=w.current;T&&(w.current=null,t(T))},[]),N=c.useCallback(T=>{var H;b.current=T,w.current=T,(H=S.current)==null||H.schedule(E)},[E]),j=c.useCallback(()=>{l(T=>T+1)},[]),P=c.useCallback((T,H)=>{g.current={pointerId:T,startX:H.x,startY:H.y,startTransform:R(),moved:!1},k.current=null,i(!0)},[R]),$=c.useCallback(()=>{const T=Array.from(p.current.entries());if(T.length<2)return;const[H,G]=T,[Y,re]=H,[le,he]=G,pe=sv(re,he);!Number.isFinite(pe)||pe<=2||(k.current={pointerIds:[Y,le],startDistance:pe,startCenter:iv(re,he),startTransform:R()},g.current=null,i(!0))},[R]),U=c.useCallback(()=>{const T=ki(m.current),H=Ci(y.current);!T||!H||(x.current={x:.5,y:.5},N(wh(T,H)),j())},[N,j]),q=c.useCallback(T=>{var re;const H=ki(m.current),G=Ci(T);if(!H||!G)return!1;const Y=wh(H,G);return(re=S.current)==null||re.cancel(),w.current=null,x.current={x:.5,y:.5},b.current=Y,t(Y),j(),!0},[j]),V=c.useCallback(()=>{const T=ki(m.current),H=Ci(y.current);!T||!H||(N(M_({container:T,image:H,center:x.current,scale:b.current.scale,clampOptions:Si})),j())},[N,j]);c.useEffect(()=>{const T=m.current;if(!T)return;const H=new ResizeObserver(()=>{var G;(G=v.current)==null||G.schedule(V)});return H.observe(T),()=>{var G;H.disconnect(),(G=v.current)==null||G.cancel()}},[V]),c.useEffect(()=>()=>{var T,H;(T=S.current)==null||T.cancel(),(H=v.current)==null||H.cancel(),w.current=null,p.current.clear(),g.current=null,k.current=null,C.current=0},[]);const A=c.useCallback(T=>{T.preventDefault();const H=T.deltaY>0?-1:1,G=m.current,Y=Ci(y.current),re=ki(G);if(!G||!re||!Y)return;const le=G.getBoundingClientRect(),he=T.clientX-le.left,pe=T.clientY-le.top,Se=b.current.scale,we=Xs(Se*Math.pow(N_,H));if(we===Se)return;const Ee=Vd({container:re,image:Y,transform:R(),point:{x:he,y:pe},nextScale:we,clampOptions:Si});x.current=Ka({container:re,image:Y,transform:Ee}),N(Ee)},[N,R]),Z=c.useCallback(T=>{if((T.pointerType??"mouse")==="mouse"&&T.button!==0)return;const G=p.current,Y=y.current;if(!Y)return;if(G.size===0){const he=T.target;if(O_(he)||he!==Y&&b.current.scale<=1)return}const re=T.currentTarget,le=re.getBoundingClientRect();if(!(T.clientX<le.left||T.clientX>le.right||T.clientY<le.top||T.clientY>le.bottom)){if(T.preventDefault(),T.stopPropagation(),G.set(T.pointerId,{x:T.clientX,y:T.clientY}),I_(re,T.pointerId),G.size>=2){$();return}P(T.pointerId,{x:T.clientX,y:T.clientY})}},[P,$]),D=c.useCallback(T=>{const H=p.current;if(!H.has(T.pointerId))return;H.set(T.pointerId,{x:T.clientX,y:T.clientY});const G=ki(m.current),Y=Ci(y.current);if(!G||!Y)return;const re=k.current;if(re){const we=H.get(re.pointerIds[0]),Ee=H.get(re.pointerIds[1]);if(we&&Ee){const xe=sv(we,Ee);if(xe>2){const Re=iv(we,Ee),ue=Xs(re.startTransform.scale*(xe/re.startDistance)),Be=Vd({container:G,image:Y,transform:re.startTransform,point:re.startCenter,nextScale:ue,clampOptions:Si}),ke=Bl(G,Y,{...Be,tx:Be.tx+(Re.x-re.startCenter.x),ty:Be.ty+(Re.y-re.startCenter.y)},Si);x.current=Ka({container:G,image:Y,transform:ke}),N(ke)}}return}const le=g.current;if(!le||le.pointerId!==T.pointerId)return;const he=T.clientX-le.startX,pe=T.clientY-le.startY;le.moved||(le.moved=P_({x:le.startX,y:le.startY},{x:T.clientX,y:T.clientY}));const Se=E_({container:G,image:Y,transform:le.startTransform,dx:he,dy:pe,clampOptions:Si});x.current=Ka({container:G,image:Y,transform:Se}),N(Se)},[N]),z=c.useCallback((T,H)=>{const G=p.current;if(!G.has(T))return;const Y=g.current,re=k.current;if(T_({panMoved:(Y==null?void 0:Y.pointerId)===T?Y.moved:!1,pinchActive:re!==null})&&(C.current=ov()+__),G.delete(T),L_(H,T),G.size===0){g.current=null,k.current=null,i(!1);return}if(G.size>=2){$();return}const[le,he]=G.entries().next().value;P(le,he)},[P,$]),B=c.useCallback(T=>{z(T.pointerId,T.currentTarget)},[z]),O=c.useCallback(T=>{z(T.pointerId,T.currentTarget)},[z]),L=c.useCallback(()=>C.current>ov(),[]),F=c.useCallback(T=>{const H=m.current,G=ki(H),Y=Ci(y.current);if(!H||!G||!Y)return!1;const re=Xs(T/100/Math.max(1e-6,b.current.base)),le=H.getBoundingClientRect(),he=Vd({container:G,image:Y,transform:R(),point:{x:le.width/2,y:le.height/2},nextScale:re,clampOptions:Si});return x.current=Ka({container:G,image:Y,transform:he}),N(he),!0},[N,R]);return{scale:a,tx:d,ty:f,base:h,ready:n,setReady:r,dragging:s,setDragging:i,geometryVersion:o,containerRef:m,imgRef:y,resetView:U,prepareImagePromotion:q,zoomToPercent:F,handleWheel:A,handlePointerDown:Z,handlePointerMove:D,handlePointerUp:B,handlePointerCancel:O,shouldSuppressSurfaceClick:L}}const A_=150;function lv(e){return e instanceof Element&&e.closest('button, a, input, select, textarea, [role="button"]')!==null}function D_(e){return e.split(/[\\/]/).filter(Boolean).pop()||e}function z_(e,t){const n=!!(e&&e===t);return{isPresented:n,opacity:n?1:0}}function $_(e,t){return!!e&&!t}function B_({path:e,item:t=null,proxyHttpOriginals:n=!1,onClose:r,onNavigate:s,canPrev:i=!1,canNext:o=!1,onZoomChange:l,requestedZoomPercent:a,onZoomRequestConsumed:d}){const{scale:f,tx:h,ty:m,base:y,geometryVersion:b,ready:w,setReady:S,dragging:v,containerRef:x,imgRef:p,prepareImagePromotion:g,zoomToPercent:k,handleWheel:C,handlePointerDown:R,handlePointerMove:E,handlePointerUp:N,handlePointerCancel:j,shouldSuppressSurfaceClick:P}=F_(),[$,U]=c.useState(()=>new Set),q=Jm(t,n,$),V=q?null:Gj(t),A=y_(q||V?null:()=>Fe.getPreview(e,"viewer"),[e,q,V],{source:"proxy",unsupportedReason:V,identity:e}),Z=A.identity===e,D=Z&&A.status==="ready"?A.url:null,z=q??D,B=z?`${e}
 ${z}`:null,[O,L]=c.useState(null),[F,T]=c.useState(null),[H,G]=c.useState(null),[Y,re]=c.useState(null),[le,he]=c.useState(!1),pe=c.useRef(e),Se=c.useRef(null),we=c.useRef(null);pe.current=e;const Ee=(O==null?void 0:O.path)===e?O.error:null,xe=Ee??(Z&&A.status==="error"?A.error:null),Re=Z&&A.status==="error"?A.retry:null,ue=Z&&A.status==="unsupported"?A.reason:V,Be=w&&Y===e&&(F==null?void 0:F.path)===e&&!xe&&!ue,ke=$_(F==null?void 0:F.path,!!(xe||ue)),Ye=ue?"unsupported":xe?"error":Be?"ready":le?"loading":"pending",et=F?[F,...H&&H.key!==F.key?[H]:[]]:H?[H]:[],be=c.useCallback(()=>{r()},[r]),X=c.useCallback(ee=>{P()&&(lv(ee.target)||(ee.preventDefault(),ee.stopPropagation()))},[P]),me=c.useCallback(ee=>{if(P()||lv(ee.target)){ee.preventDefault(),ee.stopPropagation();return}ee.preventDefault(),ee.stopPropagation(),be()},[be,P]),Ne=c.useCallback(()=>{q&&U(ee=>{if(ee.has(e))return ee;const ce=new Set(ee);return ce.add(e),ce})},[q,e]),K=c.useCallback(ee=>{var ce;if(!(((ce=Se.current)==null?void 0:ce.key)!==ee.key||pe.current!==ee.path)){if(Se.current=null,G(null),ee.source==="direct"){Ne();return}L({path:ee.path,error:Ib()}),he(!1)}},[Ne]),W=c.useCallback(()=>{L(null),Re==null||Re()},[Re]),fe=c.useCallback((ee,ce)=>{ee.decode().then(()=>{var Te;((Te=Se.current)==null?void 0:Te.key)!==ce.key||pe.current!==ce.path||!ee.isConnected||(ee.currentSrc||ee.src)!==ce.url||g(ee)&&(Se.current=null,we.current=ce.path,p.current=ee,G(null),T(ce),re(ce.path),S(!0),L(null),he(!1))}).catch(()=>K(ce))},[K,p,g,S]);return c.useEffect(()=>{const ee=ce=>{if(ce.key==="Escape"&&!Zm(ce.target)){ce.preventDefault(),be();return}if(!s||!S_(ce))return;const Te=ep(ce);(Te===1&&o||Te===-1&&i)&&(ce.preventDefault(),s(Te))};return window.addEventListener("keydown",ee),()=>window.removeEventListener("keydown",ee)},[o,i,be,s]),c.useEffect(()=>{L(null),he(!1),Se.current=null,G(null);let ee=!0;const ce=window.setTimeout(()=>{ee&&we.current!==e&&he(!0)},A_);return()=>{ee=!1,window.clearTimeout(ce)}},[e]),c.useEffect(()=>{if(!z||!B||Ee)return;const ee={key:B,path:e,url:z,source:q?"direct":"proxy"};(F==null?void 0:F.key)!==ee.key&&(Se.current=ee,G(ee),L(null))},[q,e,F==null?void 0:F.key,B,Ee,z]),c.useEffect(()=>{!xe&&!ue||(Se.current=null,we.current=null,G(null),T(null),re(null),S(!1))},[xe,S,ue]),c.useEffect(()=>{l&&l(y*f*100)},[y,f,l]),c.useEffect(()=>{a!=null&&Be&&k(a)&&d&&d()},[b,Be,a,d,k]),u.jsxs("div",{ref:x,role:"dialog","aria-modal":!1,"aria-label":"Image viewer","data-current-path":e,"data-presented-path":(F==null?void 0:F.path)??"","data-viewer-loading-state":Ye,"aria-busy":Be?void 0:!0,tabIndex:-1,className:`toolbar-offset touch-none absolute inset-0 left-[var(--overlay-left)] right-[var(--overlay-right)] flex items-start justify-start bg-panel z-viewer overflow-hidden cursor-grab ${v?"cursor-grabbing select-none":""}`,onClickCapture:X,onDoubleClick:me,onWheel:C,onPointerDown:R,onPointerMove:E,onPointerUp:N,onPointerCancel:j,children:[u.jsxs("button",{"aria-label":"Close",onClick:ee=>{ee.stopPropagation(),be()},className:"btn btn-sm absolute top-3 right-3 z-10",title:"Close (Esc)",children:[u.jsxs("svg",{width:"12",height:"12",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M18 6 6 18"}),u.jsx("path",{d:"M6 6l12 12"})]}),"Close"]}),le&&!Be&&!xe&&!ue&&u.jsx("div",{"data-viewer-loader":"neutral",className:"absolute inset-0 flex items-center justify-center pointer-events-none","aria-hidden":"true",children:u.jsx("div",{className:"h-8 w-8 rounded-full border border-border border-t-accent animate-spin"})}),(xe||ue)&&u.jsxs("div",{className:"media-error-overlay media-error-overlay-viewer",children:[u.jsx("div",{className:"media-error-title",children:ue?"Original unsupported":"Image failed"}),u.jsx("div",{className:"media-error-message",children:ue??(xe?Qm(xe):"")}),(xe==null?void 0:xe.retryable)&&Re&&u.jsx("button",{type:"button",className:"btn btn-sm",onClick:W,children:"Retry"})]}),et.map(ee=>{const ce=z_(ee.key,F==null?void 0:F.key),Te=ce.isPresented&&ke;return u.jsx("img",{ref:de=>{var ut;Te?p.current=de:!de&&((ut=p.current)==null?void 0:ut.getAttribute("data-resource-key"))===ee.key&&(p.current=null)},src:ee.url,alt:`Image viewer: ${D_(ee.path)}`,"data-viewer-image":Te?"full":"candidate","data-current-path":ee.path,"data-resource-key":ee.key,"data-viewer-image-current":ee.path===e?"true":"false","aria-hidden":Te?void 0:!0,className:`${Te?"":"absolute left-0 top-0 invisible pointer-events-none"} max-w-none max-h-none object-contain will-change-transform select-none`,draggable:!1,onDragStart:de=>{de.preventDefault()},onLoad:de=>fe(de.currentTarget,ee),onError:()=>K(ee),onClick:de=>de.stopPropagation(),style:{transform:Te?`translate(${h}px, ${m}px) scale(${y*f})`:void 0,transformOrigin:"0 0",opacity:Te?ce.opacity:0,WebkitUserDrag:"none"}},ee.key)}),s&&u.jsxs("div",{className:"viewer-mobile-nav",onClick:ee=>ee.stopPropagation(),children:[u.jsx("button",{type:"button",className:`viewer-mobile-nav-btn ${i?"":"is-disabled"}`,onClick:()=>i&&s(-1),"aria-label":"Previous image","aria-disabled":!i,disabled:!i,children:"Prev"}),u.jsx("button",{type:"button",className:`viewer-mobile-nav-btn ${o?"":"is-disabled"}`,onClick:()=>o&&s(1),"aria-label":"Next image","aria-disabled":!o,disabled:!o,children:"Next"})]})]})}function Po(){const[e,t]=c.useState(UN());return c.useEffect(()=>$N(t),[]),e}const Va="/";function Yb(e){return e.trim().replace(/\s+/g," ")}function So(e){const t=e.trim();return!t||t===Va?Va:t.startsWith(Va)?t:`${Va}${t}`}function U_(e,t){const n=Yb(e);return n?{q:n,path:So(t)}:null}const H_=new Set([0,1,2,3,4,5]),tp=new Set(["<","<=",">",">="]),K_=/^\d{4}-\d{2}-\d{2}$/;function Xb(e,t){return!t||!t.and.length?e:e.filter(n=>V_(n,t.and))}function V_(e,t){for(const n of t)if(!W_(e,n))return!1;return!0}function W_(e,t){var n,r,s,i,o,l,a,d;if("starsIn"in t){const f=t.starsIn.values;if(!f||!f.length)return!0;const h=e.star??0;return f.includes(h)}if("starsNotIn"in t){const f=t.starsNotIn.values;if(!f||!f.length)return!0;const h=e.star??0;return!f.includes(h)}if("nameContains"in t){const f=(n=t.nameContains.value)==null?void 0:n.trim();return f?(e.name??"").toLowerCase().includes(f.toLowerCase()):!0}if("nameNotContains"in t){const f=(r=t.nameNotContains.value)==null?void 0:r.trim();return f?!(e.name??"").toLowerCase().includes(f.toLowerCase()):!0}if("notesContains"in t){const f=(s=t.notesContains.value)==null?void 0:s.trim();if(!f)return!0;const h=e.notes??"";return h?h.toLowerCase().includes(f.toLowerCase()):!1}if("notesNotContains"in t){const f=(i=t.notesNotContains.value)==null?void 0:i.trim();if(!f)return!0;const h=e.notes??"";return h?!h.toLowerCase().includes(f.toLowerCase()):!1}if("urlContains"in t){const f=(o=t.urlContains.value)==null?void 0:o.trim();if(!f)return!0;const h=e.source??e.url??"";return h?h.toLowerCase().includes(f.toLowerCase()):!1}if("urlNotContains"in t){const f=(l=t.urlNotContains.value)==null?void 0:l.trim();if(!f)return!0;const h=e.source??e.url??"";return h?!h.toLowerCase().includes(f.toLowerCase()):!1}if("dateRange"in t){const{from:f,to:h}=t.dateRange;if(!f&&!h)return!0;if(!e.added_at)return!1;const m=Date.parse(e.added_at);if(Number.isNaN(m))return!1;const y=uv(f,!1),b=uv(h,!0);return!(y!=null&&m<y||b!=null&&m>b)}if("widthCompare"in t){const{op:f,value:h}=t.widthCompare;if(!Number.isFinite(h))return!0;const m=e.width;return!Number.isFinite(m)||m<=0?!1:cv(m,f,h)}if("heightCompare"in t){const{op:f,value:h}=t.heightCompare;if(!Number.isFinite(h))return!0;const m=e.height;return!Number.isFinite(m)||m<=0?!1:cv(m,f,h)}if("metricRange"in t){const{key:f,min:h,max:m}=t.metricRange,y=Wt((a=e.metrics)==null?void 0:a[f]);return!(y==null||y<h||y>m)}if("categoricalIn"in t){const{key:f,values:h}=t.categoricalIn;if(!f||!h.length)return!0;const m=(d=e.categoricals)==null?void 0:d[f];return m?h.includes(m):!1}return!0}function ca(e){if(!e||typeof e!="object")return null;const t=e.and;if(!Array.isArray(t))return null;const n=[];for(const r of t){const s=l2(r);s&&n.push(s)}return{and:n}}function Jb(e){var n;const t=e.and.find(r=>"starsIn"in r);return((n=t==null?void 0:t.starsIn)==null?void 0:n.values)??[]}function xh(e,t){const n=Gu(t),r=e.and.filter(s=>!("starsIn"in s));return n.length?{and:[{starsIn:{values:n}},...r]}:{and:r}}function q_(e){var n;const t=e.and.find(r=>"starsNotIn"in r);return((n=t==null?void 0:t.starsNotIn)==null?void 0:n.values)??[]}function Zb(e,t){const n=Gu(t),r=e.and.filter(s=>!("starsNotIn"in s));return n.length?{and:[{starsNotIn:{values:n}},...r]}:{and:r}}function Q_(e){var n;const t=e.and.find(r=>"nameContains"in r);return((n=t==null?void 0:t.nameContains)==null?void 0:n.value)??null}function e1(e,t){const n=Mn(t),r=e.and.filter(s=>!("nameContains"in s));return n?{and:[{nameContains:{value:n}},...r]}:{and:r}}function G_(e){var n;const t=e.and.find(r=>"nameNotContains"in r);return((n=t==null?void 0:t.nameNotContains)==null?void 0:n.value)??null}function t1(e,t){const n=Mn(t),r=e.and.filter(s=>!("nameNotContains"in s));return n?{and:[{nameNotContains:{value:n}},...r]}:{and:r}}function Y_(e){var n;const t=e.and.find(r=>"notesContains"in r);return((n=t==null?void 0:t.notesContains)==null?void 0:n.value)??null}function n1(e,t){const n=Mn(t),r=e.and.filter(s=>!("notesContains"in s));return n?{and:[{notesContains:{value:n}},...r]}:{and:r}}function X_(e){var n;const t=e.and.find(r=>"notesNotContains"in r);return((n=t==null?void 0:t.notesNotContains)==null?void 0:n.value)??null}function r1(e,t){const n=Mn(t),r=e.and.filter(s=>!("notesNotContains"in s));return n?{and:[{notesNotContains:{value:n}},...r]}:{and:r}}function J_(e){var n;const t=e.and.find(r=>"urlContains"in r);return((n=t==null?void 0:t.urlContains)==null?void 0:n.value)??null}function s1(e,t){const n=Mn(t),r=e.and.filter(s=>!("urlContains"in s));return n?{and:[{urlContains:{value:n}},...r]}:{and:r}}function Z_(e){var n;const t=e.and.find(r=>"urlNotContains"in r);return((n=t==null?void 0:t.urlNotContains)==null?void 0:n.value)??null}function i1(e,t){const n=Mn(t),r=e.and.filter(s=>!("urlNotContains"in s));return n?{and:[{urlNotContains:{value:n}},...r]}:{and:r}}function e2(e){const t=e.and.find(n=>"dateRange"in n);return(t==null?void 0:t.dateRange)??null}function bh(e,t){const n=Yu((t==null?void 0:t.from)??null),r=Yu((t==null?void 0:t.to)??null),s=e.and.filter(i=>!("dateRange"in i));return!n&&!r?{and:s}:{and:[{dateRange:{...n?{from:n}:{},...r?{to:r}:{}}},...s]}}function t2(e){const t=e.and.find(n=>"widthCompare"in n);return(t==null?void 0:t.widthCompare)??null}function uu(e,t){const n=e.and.filter(r=>!("widthCompare"in r));return!t||!Number.isFinite(t.value)||!tp.has(t.op)?{and:n}:{and:[{widthCompare:{op:t.op,value:t.value}},...n]}}function n2(e){const t=e.and.find(n=>"heightCompare"in n);return(t==null?void 0:t.heightCompare)??null}function cu(e,t){const n=e.and.filter(r=>!("heightCompare"in r));return!t||!Number.isFinite(t.value)||!tp.has(t.op)?{and:n}:{and:[{heightCompare:{op:t.op,value:t.value}},...n]}}function o1(e,t){const n=e.and.find(r=>"metricRange"in r&&r.metricRange.key===t);return(n==null?void 0:n.metricRange)??null}function r2(e,t,n){const r=e.and.filter(o=>!("metricRange"in o&&o.metricRange.key===t));if(!n)return{and:r};const s=Wt(n.min),i=Wt(n.max);return s==null||i==null||s>i?{and:r}:{and:[{metricRange:{key:t,min:s,max:i}},...r]}}function s2(e,t){var r;const n=e.and.find(s=>"categoricalIn"in s&&s.categoricalIn.key===t);return((r=n==null?void 0:n.categoricalIn)==null?void 0:r.values)??[]}function i2(e,t,n){const r=e.and.filter(i=>!("categoricalIn"in i&&i.categoricalIn.key===t)),s=l1(n);return!t||!s.length?{and:r}:{and:[{categoricalIn:{key:t,values:s}},...r]}}function o2(e){const t=ca(e);return t?t.and.length:0}function l2(e){var t,n,r,s,i,o,l,a;if(!e||typeof e!="object")return null;if("starsIn"in e){const d=Gu((t=e.starsIn)==null?void 0:t.values);return d.length?{starsIn:{values:d}}:null}if("starsNotIn"in e){const d=Gu((n=e.starsNotIn)==null?void 0:n.values);return d.length?{starsNotIn:{values:d}}:null}if("nameContains"in e){const d=Mn((r=e.nameContains)==null?void 0:r.value);return d?{nameContains:{value:d}}:null}if("nameNotContains"in e){const d=Mn((s=e.nameNotContains)==null?void 0:s.value);return d?{nameNotContains:{value:d}}:null}if("notesContains"in e){const d=Mn((i=e.notesContains)==null?void 0:i.value);return d?{notesContains:{value:d}}:null}if("notesNotContains"in e){const d=Mn((o=e.notesNotContains)==null?void 0:o.value);return d?{notesNotContains:{value:d}}:null}if("urlContains"in e){const d=Mn((l=e.urlContains)==null?void 0:l.value);return d?{urlContains:{value:d}}:null}if("urlNotContains"in e){const d=Mn((a=e.urlNotContains)==null?void 0:a.value);return d?{urlNotContains:{value:d}}:null}if("dateRange"in e){const d=e.dateRange,f=Yu((d==null?void 0:d.from)??null),h=Yu((d==null?void 0:d.to)??null);return!f&&!h?null:{dateRange:{...f?{from:f}:{},...h?{to:h}:{}}}}if("widthCompare"in e){const d=e.widthCompare,f=av(d==null?void 0:d.op,d==null?void 0:d.value);return f?{widthCompare:f}:null}if("heightCompare"in e){const d=e.heightCompare,f=av(d==null?void 0:d.op,d==null?void 0:d.value);return f?{heightCompare:f}:null}if("metricRange"in e){const d=e.metricRange;if(!d||typeof d!="object")return null;const f=typeof d.key=="string"?d.key:"",h=Sh(d.min),m=Sh(d.max);return!f||h==null||m==null||h>m?null:{metricRange:{key:f,min:h,max:m}}}if("categoricalIn"in e){const d=e.categoricalIn;if(!d||typeof d!="object")return null;const f=typeof d.key=="string"?d.key.trim():"",h=l1(d.values);return!f||!h.length?null:{categoricalIn:{key:f,values:h}}}return null}function Gu(e){if(!Array.isArray(e))return[];const t=[],n=new Set;for(const r of e){const s=typeof r=="number"?r:typeof r=="string"?Number(r):NaN;!Number.isInteger(s)||!H_.has(s)||n.has(s)||(n.add(s),t.push(s))}return t}function Mn(e){if(typeof e!="string")return null;const t=e.trim();return t||null}function l1(e){if(!Array.isArray(e))return[];const t=[],n=new Set;for(const r of e){if(typeof r!="string")continue;const s=r.trim();!s||n.has(s)||(n.add(s),t.push(s))}return t}function Yu(e){if(typeof e!="string")return null;const t=e.trim();if(!t)return null;const n=Date.parse(t);return Number.isNaN(n)?null:t}function av(e,t){if(typeof e!="string"||!tp.has(e))return null;const n=Sh(t);return n==null?null:{op:e,value:n}}function uv(e,t){if(!e)return null;const n=e.trim();if(!n)return null;const r=Date.parse(n);return Number.isNaN(r)?null:t&&K_.test(n)?r+24*60*60*1e3-1:r}function cv(e,t,n){switch(t){case"<":return e<n;case"<=":return e<=n;case">":return e>n;case">=":return e>=n;default:return!0}}function Sh(e){if(typeof e=="number"&&Number.isFinite(e))return e;if(typeof e=="string"){const t=Number(e);if(Number.isFinite(t))return t}return null}const Xu="@derived/",dv="Derived score",a2=/^[A-Za-z0-9][A-Za-z0-9_-]{0,79}$/,u2=new Set(["zero","invalid"]),c2={filters:{and:[]},sort:{kind:"builtin",key:"added",dir:"desc"}};function ht(e){return typeof e=="string"&&e.startsWith(Xu)&&e.length>Xu.length}function ko(e){const t=typeof e=="string"?e:e.id;return`${Xu}${t}`}function Tr(e){if(!e||typeof e!="object")return null;const t=e;if(t.version!==1)return null;const n=u1(t.id),r=sp(t.intercept);if(!n||r==null)return null;const s=g2(t.numericTerms),i=y2(t.categoricalTerms);return!s||!i?null:{version:1,id:n,name:rp(t.name),intercept:r,numericTerms:s,categoricalTerms:i}}function d2(e){const t=Tr(e);return t?{metricKeys:ls(t.numericTerms.map(n=>n.key)),categoricalKeys:ls(t.categoricalTerms.map(n=>n.key))}:{metricKeys:[],categoricalKeys:[]}}function oi(e,t=c2){if(!e||typeof e!="object")return{...t};const n=e,r=ca(n.filters)??t.filters,s=p2(n.sort)??t.sort,i=da(n.selectedMetric)??t.selectedMetric,o=f2(n.derivedMetric);return{filters:r,sort:s,...i?{selectedMetric:i}:{},...o?{derivedMetric:o}:{}}}function f2(e){if(!e||typeof e!="object"||Array.isArray(e))return null;const t=Tr(e);return t||{...e}}function np({items:e,metricKeys:t,categoricalKeys:n,spec:r=null,loadedCount:s=e.length,totalItems:i=null}){const o=Eh(t),l=ls(n),a=Tr(r),d=a1(r),f=Ch(i),h=f!=null&&s<f;if(!a){const C=r==null?null:m2(r),R=(C==null?void 0:C.key)??null,E=(C==null?void 0:C.name)??null;return{items:mv(e),metricKeys:o,categoricalKeys:l,metricDisplayNames:R&&E?{[R]:E}:{},spec:null,definitionIdentity:d,key:R,name:E,status:r==null?"none":"invalid",validCount:0,invalidCount:r==null?0:e.length,invalidReasons:r==null?[]:["Invalid derived metric definition."],missingMetricKeys:[],missingCategoricalKeys:[],loadedCount:s,totalItems:f,partialLoadWarning:r==null?!1:h,scoreScope:"loaded_window",scorePopulationCount:f,zStats:{}}}const m=ko(a),y=a.name,b=hv(a.numericTerms.map(C=>C.key),o),w=hv(a.categoricalTerms.map(C=>C.key),l),S={[m]:y};if(b.length||w.length)return{items:mv(e),metricKeys:o,categoricalKeys:l,metricDisplayNames:S,spec:a,definitionIdentity:d,key:m,name:y,status:"unavailable",validCount:0,invalidCount:e.length,invalidReasons:[],missingMetricKeys:b,missingCategoricalKeys:w,loadedCount:s,totalItems:f,partialLoadWarning:h,scoreScope:"loaded_window",scorePopulationCount:f,zStats:{}};let v=!1,x=0,p=0;const g=w2(e,a.numericTerms),k=e.map(C=>{const R=x2(C,a,g);if(R==null){p+=1;const N=Mh(C.metrics);return N.changed?(v=!0,{...C,metrics:N.metrics}):C}x+=1;const E=Mh(C.metrics);return v=!0,{...C,metrics:{...E.metrics??{},[m]:R}}});return{items:v?k:e,metricKeys:c1(o,m),categoricalKeys:l,metricDisplayNames:S,spec:a,definitionIdentity:d,key:m,name:y,status:"valid",validCount:x,invalidCount:p,invalidReasons:[],missingMetricKeys:[],missingCategoricalKeys:[],loadedCount:s,totalItems:f,partialLoadWarning:h,scoreScope:"loaded_window",scorePopulationCount:f,zStats:{}}}function h2({items:e,metricKeys:t,categoricalKeys:n,spec:r=null,backendStatus:s=null,loadedCount:i=e.length,totalItems:o=null}){const l=(s==null?void 0:s.status)??"none",a=Tr(r),d=a1(r);if(l==="none"){if(r!=null&&!a)return np({items:e,metricKeys:t,categoricalKeys:n,spec:r,loadedCount:i,totalItems:o});const k=a?ko(a):null;return{items:e,metricKeys:Eh(t),categoricalKeys:ls(n),metricDisplayNames:k?{[k]:a.name}:{},spec:a,definitionIdentity:d,key:k,name:(a==null?void 0:a.name)??null,status:"none",validCount:0,invalidCount:0,invalidReasons:[],missingMetricKeys:[],missingCategoricalKeys:[],loadedCount:i,totalItems:Ch(o),partialLoadWarning:!1,scoreScope:"none",scorePopulationCount:null,zStats:{}}}const f=Eh(t),h=ls(n),m=Ch(o),y=da(s==null?void 0:s.key)??(a?ko(a):null),b=rp((s==null?void 0:s.display_name)??(a==null?void 0:a.name)),w=y?{[y]:b}:{},S=Wd(s==null?void 0:s.valid_count),v=Wd(s==null?void 0:s.invalid_count),x=Wd(s==null?void 0:s.score_population_count),p=(s==null?void 0:s.score_scope)??"none",g=(s==null?void 0:s.z_stats)??{};return{items:e,metricKeys:y&&l==="applied"?c1(f,y):f,categoricalKeys:h,metricDisplayNames:w,spec:a,definitionIdentity:d,key:y,name:y?b:null,status:l==="applied"?"valid":l,validCount:S,invalidCount:v,invalidReasons:l==="invalid"?["Invalid derived metric definition."]:[],missingMetricKeys:ls(s==null?void 0:s.missing_numeric_inputs),missingCategoricalKeys:ls(s==null?void 0:s.unavailable_categorical_inputs),loadedCount:i,totalItems:m,partialLoadWarning:!1,scoreScope:p,scorePopulationCount:x,zStats:g}}function a1(e){if(e==null)return null;const t=Tr(e);return JSON.stringify(t??kh(e))}function kh(e){if(typeof e=="number"&&!Number.isFinite(e))return{__nonfinite_number__:String(e)};if(Array.isArray(e))return e.map(kh);if(e&&typeof e=="object"){const t=e;return Object.fromEntries(Object.keys(t).sort().map(n=>[n,kh(t[n])]))}return e===void 0?{__undefined__:!0}:typeof e=="bigint"?{__bigint__:e.toString()}:typeof e=="function"||typeof e=="symbol"?String(e):e}function u1(e){if(typeof e!="string")return null;const t=e.trim();return a2.test(t)?t:null}function rp(e){return typeof e!="string"?dv:e.trim()||dv}function m2(e){if(!e||typeof e!="object")return null;const t=e,n=u1(t.id);return{key:n?ko(n):null,name:rp(t.name)}}function da(e){return typeof e!="string"?null:e.trim()||null}function p2(e){if(!e||typeof e!="object")return null;const t=e;if(t.kind==="builtin"&&(t.key==="name"||t.key==="added"||t.key==="random")&&fv(t.dir))return{kind:"builtin",key:t.key,dir:t.dir};if(t.kind==="metric"){const n=da(t.key);if(n&&fv(t.dir))return{kind:"metric",key:n,dir:t.dir}}return null}function fv(e){return e==="asc"||e==="desc"}function g2(e){if(e===void 0)return[];if(!Array.isArray(e))return null;const t=[];for(const n of e){if(!n||typeof n!="object")return null;const r=n,s=da(r.key),i=sp(r.weight);if(!s||ht(s)||i==null||!v2(r.missing))return null;t.push({key:s,weight:i,missing:r.missing,zNormalize:r.zNormalize===!0})}return t}function y2(e){if(e===void 0)return[];if(!Array.isArray(e))return null;const t=[];for(const n of e){if(!n||typeof n!="object")return null;const r=n,s=da(r.key),i=typeof r.value=="string"?r.value.trim():"",o=sp(r.weight);if(!s||ht(s)||!i||o==null)return null;t.push({key:s,value:i,weight:o})}return t}function v2(e){return typeof e=="string"&&u2.has(e)}function sp(e){return typeof e=="number"&&Number.isFinite(e)?e:null}function Ch(e){return typeof e!="number"||!Number.isFinite(e)||e<0?null:e}function Wd(e){return typeof e!="number"||!Number.isFinite(e)||e<0?0:Math.trunc(e)}function ls(e){if(!(e!=null&&e.length))return[];const t=new Set;for(const n of e){if(typeof n!="string")continue;const r=n.trim();r&&t.add(r)}return Array.from(t).sort()}function Eh(e){return ls(e).filter(t=>!ht(t))}function hv(e,t){const n=new Set(t),r=new Set;for(const s of e)n.has(s)||r.add(s);return Array.from(r).sort()}function c1(e,t){return e.includes(t)?[...e]:[...e,t]}function w2(e,t){const n=new Set(t.filter(l=>l.zNormalize).map(l=>l.key));if(!n.size)return new Map;const r=new Map,s=new Map,i=new Map;for(const l of n)r.set(l,0),s.set(l,0),i.set(l,0);for(const l of e){const a=l.metrics;if(a)for(const d of n){const f=Wt(a[d]);f!=null&&(r.set(d,(r.get(d)??0)+f),s.set(d,(s.get(d)??0)+f*f),i.set(d,(i.get(d)??0)+1))}}const o=new Map;for(const l of n){const a=i.get(l)??0;if(a<=0)continue;const d=(r.get(l)??0)/a,f=Math.max(0,(s.get(l)??0)/a-d*d);o.set(l,{mean:d,std:Math.sqrt(f)})}return o}function x2(e,t,n){var s,i;let r=t.intercept;for(const o of t.numericTerms){let l=Wt((s=e.metrics)==null?void 0:s[o.key]);if(l==null){if(o.missing==="invalid")return null;continue}if(o.zNormalize){const a=n.get(o.key);l=!a||a.std<=0?0:(l-a.mean)/a.std}r+=l*o.weight}for(const o of t.categoricalTerms)((i=e.categoricals)==null?void 0:i[o.key])===o.value&&(r+=o.weight);return Wt(r)}function mv(e){let t=!1;const n=e.map(r=>{const s=Mh(r.metrics);return s.changed?(t=!0,{...r,metrics:s.metrics}):r});return t?n:e}function Mh(e){if(!e)return{metrics:e,changed:!1};let t=!1;const n={};for(const[s,i]of Object.entries(e)){if(ht(s)){t=!0;continue}n[s]=i}return t?{metrics:Object.keys(n).length?n:void 0,changed:!0}:{metrics:e,changed:!1}}const b2=2e3,S2=5*6e4;function d1(e,t,n={}){let r=e;if(Object.prototype.hasOwnProperty.call(t,"star")&&e.star!==t.star&&(r={...r,star:t.star??null}),t.notes!==void 0&&e.notes!==t.notes&&(r={...r,notes:t.notes??""}),t.metrics===void 0)return r;const s=t.metrics??{},i=new Set(e.mutable_metric_keys??[]),o={...e.metrics??{}};if(n.replaceMutableMetrics){for(const l of i)delete o[l];i.clear()}for(const[l,a]of Object.entries(s))a==null?(delete o[l],i.delete(l)):(o[l]=a,i.add(l));return{...r,metrics:Object.keys(o).length?o:void 0,mutable_metric_keys:Array.from(i).sort()}}class k2{constructor(t=()=>Date.now(),n=b2,r=S2){ge(this,"entities",new Map);ge(this,"listeners",new Map);ge(this,"activePathsByOwner",new Map);ge(this,"activeRefCounts",new Map);ge(this,"unreferencedAt",new Map);ge(this,"lastRequestSequence",new Map);ge(this,"mutableFieldVersions",new Map);ge(this,"nextRequestSequence",0);ge(this,"mutationVersion",0);this.now=t,this.maxUnreferenced=n,this.unreferencedTtlMs=r}get(t){return this.entities.get(t)}beginRequest(t){return this.nextRequestSequence+=1,{sequence:this.nextRequestSequence,mutationVersion:this.mutationVersion,metricKeys:(t==null?void 0:t.metric_keys)??[],categoricalKeys:(t==null?void 0:t.categorical_keys)??[]}}ingest(t,n=this.beginRequest()){const r=new Map;for(const o of t)o.path&&r.set(o.path,o);const s=[],i=this.now();for(const o of Array.from(r.keys()).sort()){if((this.lastRequestSequence.get(o)??0)>n.sequence)continue;const l=this.entities.get(o),a=this.mutableFieldVersions.get(o),d=r.get(o);let f=l?C2(l,d,n):d;if(l&&a){const h={};(a.star??0)>n.mutationVersion&&(h.star=l.star),(a.notes??0)>n.mutationVersion&&(h.notes=l.notes),(a.metrics??0)>n.mutationVersion&&Object.assign(h,E2(f,l)),Object.keys(h).length&&(f={...f,...h})}this.entities.set(o,f),this.lastRequestSequence.set(o,n.sequence),this.activeRefCounts.has(o)||this.unreferencedAt.set(o,i),s.push(o)}return this.prune(i),this.notify(s),s}seed(t){const n=new Map;for(const i of t)i.path&&!this.entities.has(i.path)&&n.set(i.path,i);const r=Array.from(n.keys()).sort(),s=this.now();for(const i of r)this.entities.set(i,n.get(i)),this.activeRefCounts.has(i)||this.unreferencedAt.set(i,s);return this.prune(s),this.notify(r),r}patch(t,n={}){const r=this.entities.get(t.path);if(!r)return!1;const s=d1(r,t,n),i={};if(s===r)return!1;s.star!==r.star&&(i.star=0),s.notes!==r.notes&&(i.notes=0),s.metrics!==r.metrics&&(i.metrics=0),this.mutationVersion+=1;const o=this.mutableFieldVersions.get(t.path)??{};for(const l of Object.keys(i))o[l]=this.mutationVersion;return this.mutableFieldVersions.set(t.path,o),this.entities.set(t.path,s),this.notify([t.path]),!0}subscribe(t,n){const r=this.listeners.get(t)??new Set;return r.add(n),this.listeners.set(t,r),()=>{const s=this.listeners.get(t);s&&(s.delete(n),s.size||this.listeners.delete(t))}}setActivePaths(t,n){const r=this.activePathsByOwner.get(t)??new Set,s=new Set(n),i=this.now();for(const o of r){if(s.has(o))continue;const l=(this.activeRefCounts.get(o)??1)-1;l<=0?(this.activeRefCounts.delete(o),this.entities.has(o)&&this.unreferencedAt.set(o,i)):this.activeRefCounts.set(o,l)}for(const o of s)r.has(o)||(this.activeRefCounts.set(o,(this.activeRefCounts.get(o)??0)+1),this.unreferencedAt.delete(o));s.size?this.activePathsByOwner.set(t,s):this.activePathsByOwner.delete(t),this.prune(i)}release(t){this.setActivePaths(t,[])}evict(t){return this.activeRefCounts.has(t)||!this.entities.delete(t)?!1:(this.unreferencedAt.delete(t),this.lastRequestSequence.delete(t),this.mutableFieldVersions.delete(t),!0)}prune(t=this.now()){const n=[],r=Array.from(this.unreferencedAt.entries()).filter(([o])=>this.entities.has(o)&&!this.activeRefCounts.has(o)).sort((o,l)=>o[1]-l[1]||o[0].localeCompare(l[0]));for(const[o,l]of r)t-l<this.unreferencedTtlMs||(this.entities.delete(o)&&n.push(o),this.unreferencedAt.delete(o),this.lastRequestSequence.delete(o),this.mutableFieldVersions.delete(o));const s=r.filter(([o])=>this.entities.has(o)),i=Math.max(0,s.length-this.maxUnreferenced);for(const[o]of s.slice(0,i))this.entities.delete(o)&&n.push(o),this.unreferencedAt.delete(o),this.lastRequestSequence.delete(o),this.mutableFieldVersions.delete(o);return n}size(){return this.entities.size}notify(t){for(const n of t)for(const r of this.listeners.get(n)??[])r()}}function C2(e,t,n){const r=qd(e.metrics,t.metrics,n.metricKeys),s=qd(e.metric_labels??void 0,t.metric_labels??void 0,n.metricKeys),i=qd(e.categoricals??void 0,t.categoricals??void 0,n.categoricalKeys),o=new Set(e.mutable_metric_keys??[]);for(const l of n.metricKeys)o.delete(l);for(const l of t.mutable_metric_keys??[])o.add(l);return{...e,...t,metrics:r,metric_labels:s,categoricals:i,mutable_metric_keys:Array.from(o).sort()}}function qd(e,t,n){const r={...e??{}};for(const s of n)delete r[s];return Object.assign(r,t??{}),Object.keys(r).length?r:void 0}function E2(e,t){var r;const n={...e.metrics??{}};for(const s of e.mutable_metric_keys??[])delete n[s];for(const s of t.mutable_metric_keys??[]){const i=(r=t.metrics)==null?void 0:r[s];i!=null&&(n[s]=i)}return{metrics:Object.keys(n).length?n:void 0,mutable_metric_keys:t.mutable_metric_keys}}const St=new k2,ip=5*6e4,op=6e4,f1=1e3,h1=(e,t)=>t!=null&&t.recursive?["folder",e,"recursive",t.offset??0,t.limit??null,t.countOnly?"count":"items"]:["folder",e];function M2(e){return ca(e)??{and:[]}}function m1(e){return((e==null?void 0:e.trim().replace(/\s+/g," "))??"")||null}function R2(e){return{metric_keys:Ju(e==null?void 0:e.metric_keys),categorical_keys:Ju(e==null?void 0:e.categorical_keys)}}function lp(e){return{metric_keys:Ju(e.metric_keys),categorical_keys:Ju(e.categorical_keys)}}function Ju(e){return Array.from(new Set((e??[]).map(t=>t.trim()).filter(Boolean))).sort()}function Rc(e,t=0){const n=e.limit??f1,r=Yb(e.textQuery??""),s=Tr(e.derivedMetric??null),i=e.facetFields?lp(e.facetFields):null,o=t===0?So(e.anchorPath??""):null;return{path:So(e.path),recursive:e.recursive??!0,offset:t,limit:n,filters:M2(e.filters),sort:e.sort,text_query:r||null,random_seed:e.randomSeed??null,derived_metric:s,unsupported_metric_intent:m1(e.unsupportedToken),projection:R2(e.projection),...i?{facet_fields:i}:{},...o&&o!=="/"?{anchor_path:o}:{}}}function N2(e){return e.sort.kind!=="builtin"||e.sort.key!=="random"?null:e.random_seed??null}function p1(e,t){return["analysis-query",e.path,e.recursive?"recursive":"direct",e.filters,e.sort,e.text_query??"",N2(e),e.derived_metric??null,m1(t)]}const ap=e=>p1(Rc(e,0),e.unsupportedToken),j2=e=>{const t=ap(e),n=e.generationToken??null;return e.facetFields?["folder-facets",t,lp(e.facetFields),n]:["folder-facets",t,null,n]},_2=(e,t=0,n=null)=>{const r=Rc(e,t);return["folder-query",p1(r,e.unsupportedToken),r.offset,r.limit,JSON.stringify(r.projection),r.anchor_path??null,n]},g1=e=>_2(e,0,e.generationToken??null),pv=new Map;function y1(e,t="browse"){const n=JSON.stringify(e),r=pv.get(t);if((r==null?void 0:r.key)===n)return r.revision;const s=((r==null?void 0:r.revision)??Date.now()*1e3)+1;return pv.set(t,{key:n,revision:s}),s}function v1(e){return e[0]!=="folder"||e[2]!=="recursive"||typeof e[1]!="string"?null:e}function P2(e){return v1(e)!==null}function T2(e,t,n=!0){if(!P2(e))return!0;const r=v1(e);if(r==null)return!1;const[,s]=r;return!!(s===t||n&&s==="/")}function I2(e,t,n=!0){return!Array.isArray(e)||e[0]!=="folder"?!1:!T2(e,t,n)}const Nc=15e3;function L2(e,t){return Fe.getFolder(e,t)}function O2(e,t){St.ingest(e.items,t);const{items:n,...r}=e;return{...r,item_paths:n.map(s=>s.path)}}function F2(e,t,n,r=3){const s=JSON.stringify(n),i=e.getQueryCache().findAll({queryKey:["folder-query"]}).filter(l=>{const a=l.queryKey,d=Array.isArray(a)?a[1]:null;return Array.isArray(d)&&d[1]===t}).sort((l,a)=>a.state.dataUpdatedAt-l.state.dataUpdatedAt||l.queryHash.localeCompare(a.queryHash)),o=new Set([s]);for(const l of i){if(o.size>=r)break;o.add(JSON.stringify(l.queryKey))}for(const l of i)o.has(JSON.stringify(l.queryKey))||e.removeQueries({queryKey:l.queryKey,exact:!0})}function A2(e){const t=Po(),n=Ms(),r=g1(e),s=y1(ap(e));return gR({queryKey:r,queryFn:async({pageParam:i,signal:o})=>{const a=Rc(e,typeof i=="number"?i:0),d=St.beginRequest(a.projection),f=await Fe.queryFolder(a,{signal:o,queryRevision:s}),h=O2(f,d);return F2(n,f.path,r),h},initialPageParam:0,getNextPageParam:i=>{const o=i.offset+i.item_paths.length;return o<i.filtered_total?o:void 0},enabled:e.enabled??!0,staleTime:0,gcTime:op,retry:1,retryDelay:i=>Math.min(1e3*Math.pow(2,i),5e3),refetchOnWindowFocus:!1,refetchInterval:t?Nc:!1,refetchIntervalInBackground:t})}function D2(e,t){const n=Po(),r={recursive:(t==null?void 0:t.recursive)??!1,countOnly:t==null?void 0:t.countOnly,offset:t==null?void 0:t.offset,limit:t==null?void 0:t.limit},s=!!r.recursive;return _o({queryKey:h1(e,r),queryFn:()=>L2(e,r),enabled:(t==null?void 0:t.enabled)??!0,staleTime:1e4,gcTime:s?op:ip,retry:2,retryDelay:i=>Math.min(1e3*Math.pow(2,i),5e3),refetchOnWindowFocus:!1,refetchInterval:n?Nc:!1,refetchIntervalInBackground:n})}function gv(e){var d;const t=Po(),{enabled:n=!0,analysisChannel:r="browse",...s}=e,i=y1(ap(s),r),o=$2(s.facetFields),l=mR({queries:o.map(f=>{const h=f?{...s,facetFields:f}:s;return{queryKey:j2(h),queryFn:({signal:m})=>Fe.queryFolderFacets(Rc(h,0),{signal:m,queryRevision:i,analysisChannel:r}),enabled:n,staleTime:1e4,gcTime:op,retry:2,retryDelay:m=>Math.min(1e3*Math.pow(2,m),5e3),refetchOnWindowFocus:!1,refetchInterval:t?Nc:!1,refetchIntervalInBackground:t}})}),a=z2(o,l);return{data:B2(l.flatMap(f=>f.data?[f.data]:[])),isLoading:l.some(f=>f.isLoading),isFetching:l.some(f=>f.isFetching),isError:l.some(f=>f.isError),error:((d=l.find(f=>f.error))==null?void 0:d.error)??null,fieldStates:a,refetch:()=>Promise.all(l.map(f=>f.refetch()))}}function z2(e,t){const n={metrics:{},categoricals:{}};return e.forEach((r,s)=>{if(!r)return;const i=t[s],o=i!=null&&i.data?"settled":i!=null&&i.isFetching?"pending":i!=null&&i.isError?"error":"pending";r.metric_keys.forEach(l=>{n.metrics[l]=o}),r.categorical_keys.forEach(l=>{n.categoricals[l]=o})}),n}function $2(e){if(!e)return[void 0];const t=lp(e),n=[...t.metric_keys.map(s=>({kind:"metric",key:s})),...t.categorical_keys.map(s=>({kind:"categorical",key:s}))],r=[];for(let s=0;s<n.length;s+=24){const i=n.slice(s,s+24);r.push({metric_keys:i.filter(o=>o.kind==="metric").map(o=>o.key),categorical_keys:i.filter(o=>o.kind==="categorical").map(o=>o.key)})}return r}function B2(e){const t=e[0];if(!t)return;const n=new Set,r=new Set,s=new Set,i=new Set,o=new Set;for(const l of e)l.metric_keys.forEach(a=>n.add(a)),l.categorical_keys.forEach(a=>r.add(a)),l.dependency_manifest.fields.forEach(a=>s.add(a)),l.dependency_manifest.metric_keys.forEach(a=>i.add(a)),l.dependency_manifest.categorical_keys.forEach(a=>o.add(a));return{...t,metric_keys:Array.from(n).sort(),categorical_keys:Array.from(r).sort(),metrics:Object.assign({},...e.map(l=>l.metrics)),categoricals:Object.assign({},...e.map(l=>l.categoricals)),field_capabilities:U2(e),dependency_manifest:{fields:Array.from(s).sort(),metric_keys:Array.from(i).sort(),categorical_keys:Array.from(o).sort(),unknown:e.some(l=>l.dependency_manifest.unknown)}}}function U2(e){const t=e.flatMap(s=>s.field_capabilities?[s.field_capabilities]:[]),n=t[0];if(!n)return null;const r=s=>Array.from(new Set(t.flatMap(i=>{const o=i[s];return Array.isArray(o)?o:[]}))).sort();return{...n,metrics:Object.assign({},...t.map(s=>s.metrics)),categoricals:Object.assign({},...t.map(s=>s.categoricals)),display_metrics:r("display_metrics"),sortable_metrics:r("sortable_metrics"),filterable_metrics:r("filterable_metrics"),numeric_formula_inputs:r("numeric_formula_inputs"),categorical_inputs:r("categorical_inputs")}}function H2(e,t){const n=Po();return _o({queryKey:["folder-count",e],queryFn:()=>Fe.getFolderCount(e),enabled:(t==null?void 0:t.enabled)??!0,staleTime:1e4,gcTime:ip,retry:2,retryDelay:r=>Math.min(1e3*Math.pow(2,r),5e3),refetchOnWindowFocus:!1,refetchInterval:n?Nc:!1,refetchIntervalInBackground:n})}function K2(e,t){return _o({queryKey:["folder-fields",So(e)],queryFn:()=>Fe.getFolderFields(e),enabled:(t==null?void 0:t.enabled)??!0,staleTime:3e4,gcTime:ip,retry:2,retryDelay:n=>Math.min(1e3*Math.pow(2,n),5e3),refetchOnWindowFocus:!1})}function V2(e){return`${e.boot_epoch}:${e.event_id}`}const Rh=new Set;function nl(){for(const e of Rh)e()}function W2(e){return Rh.add(e),()=>Rh.delete(e)}class q2{constructor(){ge(this,"pending",new Map);ge(this,"uncertain",new Map);ge(this,"repairs",new Map);ge(this,"retiredEpochs",new Set);ge(this,"listeners",new Set);ge(this,"bootEpoch",null);ge(this,"durableEventId",0);ge(this,"error",null);ge(this,"repairSequence",0)}observeMutation(t,n){const r=n.accepted_event;if(!r){const s=n.durable_watermark.boot_epoch;this.bootEpoch===null&&(this.bootEpoch=s),s!==this.bootEpoch?this.addRepair(t):n.persistence==="pending"?this.uncertain.set(t,s):this.uncertain.delete(t),this.notify();return}this.observeAccepted(t,r,n.persistence,n.durable_watermark)}observeAccepted(t,n,r,s){if(this.bootEpoch===null&&(this.bootEpoch=n.boot_epoch),n.boot_epoch!==this.bootEpoch||this.retiredEpochs.has(n.boot_epoch)){this.addRepair(t),nl(),this.notify();return}s.boot_epoch===this.bootEpoch&&(this.durableEventId=Math.max(this.durableEventId,s.event_id)),n.event_id<=this.durableEventId||s.boot_epoch===n.boot_epoch&&n.event_id<=s.event_id||this.pending.set(V2(n),{identity:n,path:t}),this.notify()}observeStatus(t,n="sync"){if(this.bootEpoch!==null&&this.bootEpoch!==t.boot_epoch&&(n!=="sync"||this.retiredEpochs.has(t.boot_epoch)))return nl(),Array.from(this.repairs,([r,s])=>({path:r,token:s}));if(this.error!==null&&t.state!=="failed"&&n!=="sync")return nl(),Array.from(this.repairs,([r,s])=>({path:r,token:s}));if(this.bootEpoch!==null&&this.bootEpoch!==t.boot_epoch){this.retireEpoch(this.bootEpoch);for(const r of this.pending.values())this.addRepair(r.path);for(const r of this.uncertain.keys())this.addRepair(r);this.pending.clear(),this.uncertain.clear(),this.durableEventId=0}this.bootEpoch=t.boot_epoch,this.durableEventId=Math.max(this.durableEventId,t.durable_watermark.event_id);for(const[r,s]of this.pending){if(s.identity.boot_epoch!==t.boot_epoch){this.addRepair(s.path),this.pending.delete(r);continue}s.identity.event_id<=t.durable_watermark.event_id&&this.pending.delete(r)}for(const[r,s]of this.uncertain)s!==t.boot_epoch?(this.addRepair(r),this.uncertain.delete(r)):t.state==="saved"&&t.pending_count===0&&this.uncertain.delete(r);return this.error=t.state==="failed"?t.error||"Label storage is unavailable. Retry after storage recovers.":null,t.state==="failed"&&n!=="sync"&&nl(),this.notify(),Array.from(this.repairs,([r,s])=>({path:r,token:s}))}acknowledgeRepairs(t){let n=!1;for(const r of t)this.repairs.get(r.path)===r.token&&(n=this.repairs.delete(r.path)||n);n&&this.notify()}snapshot(){return{state:this.error?"failed":this.pending.size>0||this.uncertain.size>0||this.repairs.size>0?"saving":"saved",pendingCount:this.pending.size+this.uncertain.size+this.repairs.size,bootEpoch:this.bootEpoch,error:this.error}}subscribe(t){return this.listeners.add(t),t(this.snapshot()),()=>this.listeners.delete(t)}reset(){this.pending.clear(),this.uncertain.clear(),this.repairs.clear(),this.bootEpoch=null,this.durableEventId=0,this.error=null,this.repairSequence=0,this.retiredEpochs.clear(),this.notify()}addRepair(t){this.repairSequence+=1,this.repairs.set(t,this.repairSequence)}retireEpoch(t){for(this.retiredEpochs.add(t);this.retiredEpochs.size>8;){const n=this.retiredEpochs.values().next().value;if(n===void 0)break;this.retiredEpochs.delete(n)}}notify(){const t=this.snapshot();for(const n of this.listeners)n(t)}}const as=new q2,Js=(e,t)=>t?["item",e,t]:["item",e],up=(e,t)=>t?["item-detail",e,t]:["item-detail",e];function w1(e,t,n){var i;const r=o=>({...o,...n,table_fields:n.table_fields===void 0?o==null?void 0:o.table_fields:n.table_fields}),s=(i=e.getQueriesData({queryKey:Js(t)}).find(o=>o[1]!==void 0))==null?void 0:i[1];e.setQueryData(Js(t),r(s)),e.setQueriesData({queryKey:Js(t)},o=>r(o))}function Q2(e,t,n){e.setQueriesData({queryKey:up(t)},n)}const Nh=new Set;function G2(e){return Nh.add(e),()=>{Nh.delete(e)}}function x1(e){for(const t of Nh)t(e)}function b1(e,t){as.observeMutation(e,t),!t.accepted_event&&t.persistence==="pending"&&nl()}const Y2={v:1,tags:[],notes:"",version:1,updated_at:"",updated_by:"web"},$n=new Map,du=new Map,jh=new Map,cp=new Map;let yv=0;const cr=new Map,rl=new Map,X2=12e3,_h=new Set,Ph=new Set;let dp={state:"idle"},Ul=null,Th=0;function Ei(e){dp=e;for(const t of _h)t(e)}function ur(){const e=cr.size>0,t=$n.size+du.size+Th;if(e){Ei({state:"error",message:"Conflict detected"});return}if(Ul){Ei({state:"error",message:Ul});return}if(t>0){Ei({state:"syncing"});return}const n=as.snapshot();if(n.state==="failed"){Ei({state:"error",message:n.error??"Label storage is unavailable"});return}if(n.state==="saving"){Ei({state:"saving"});return}Ei({state:"idle"})}as.subscribe(()=>ur());function fp(){let e=null;for(const t of jh.values())e=e==null?t:Math.min(e,t);for(const t of cp.values())e=e==null?t:Math.min(e,t);return e}function Zu(){const e=fp();for(const t of Ph)t(e)}function ec(e){Ul=e,ur()}function S1(){Ul&&(Ul=null,ur())}function vv(e){Th=Math.max(0,Th+e),ur()}function J2(){yv+=1;const e=yv;return cp.set(e,Date.now()),Zu(),e}function Z2(e){e!=null&&cp.delete(e)&&Zu()}function jc(e){const t=rl.get(e);if(!t||!t.size)return;const n=cr.get(e)??null;for(const r of t)r(n)}function wv(e){return cr.get(e)??null}function hp(e){cr.delete(e)&&(jc(e),ur())}function eP(e,t){cr.set(e,t),jc(e),ur()}function tP(e,t){const n=rl.get(e)??new Set;return n.add(t),rl.set(e,n),t(cr.get(e)??null),()=>{const r=rl.get(e);r&&(r.delete(t),r.size||rl.delete(e))}}function ZF(e){const[t,n]=c.useState(()=>e?wv(e):null);return c.useEffect(()=>{if(!e){n(null);return}return n(wv(e)),tP(e,n)},[e]),t}function nP(e){return _h.add(e),e(dp),()=>{_h.delete(e)}}function rP(){const[e,t]=c.useState(dp);return c.useEffect(()=>nP(t),[]),e}function sP(e){return Ph.add(e),e(fp()),()=>{Ph.delete(e)}}function iP(){const[e,t]=c.useState(()=>fp()),[n,r]=c.useState(()=>e==null?null:Date.now()-e);return c.useEffect(()=>sP(t),[]),c.useEffect(()=>{if(e==null){r(null);return}r(Date.now()-e);const s=window.setInterval(()=>{r(Date.now()-e)},1e3);return()=>window.clearInterval(s)},[e]),n}function tc(e){const t={};return Object.prototype.hasOwnProperty.call(e,"star")&&(t.set_star=e.star??null),Object.prototype.hasOwnProperty.call(e,"notes")&&(t.set_notes=e.notes??""),Object.prototype.hasOwnProperty.call(e,"tags")&&(t.set_tags=Array.isArray(e.tags)?e.tags:[]),t}function Ih(e){var t,n;return e.set_star!==void 0||e.set_notes!==void 0||e.set_tags!==void 0||(((t=e.add_tags)==null?void 0:t.length)??0)>0||(((n=e.remove_tags)==null?void 0:n.length)??0)>0}function k1(e){var n,r;const t=[];return e.set_star!==void 0&&t.push("star"),e.set_notes!==void 0&&t.push("notes"),(e.set_tags!==void 0||(((n=e.add_tags)==null?void 0:n.length)??0)>0||(((r=e.remove_tags)==null?void 0:r.length)??0)>0)&&t.push("tags"),t}function qo(e){const t=[],n=new Set;for(const r of e??[]){if(typeof r!="string")continue;const s=r.trim();!s||n.has(s)||(n.add(s),t.push(s))}return t}function oP(e,t){if(e.length!==t.length)return!1;for(let n=0;n<e.length;n+=1)if(e[n]!==t[n])return!1;return!0}function lP(e,t){if(e.set_star!==void 0&&(t.star??null)!==e.set_star||e.set_notes!==void 0&&(t.notes??"")!==(e.set_notes??""))return!1;if(e.set_tags!==void 0){const r=qo(e.set_tags),s=qo(t.tags);return oP(r,s)}const n=qo(t.tags);for(const r of qo(e.add_tags))if(!n.includes(r))return!1;for(const r of qo(e.remove_tags))if(n.includes(r))return!1;return!0}function C1(e,t,n){if(n instanceof jn&&n.status===409){const r=n.body;if(r!=null&&r.current)return eP(e,{path:e,current:r.current,pending:t,receivedAt:new Date().toISOString()}),!0}return!1}function aP(e,t){const n=cr.get(e);if(n){if(lP(n.pending,t)){hp(e);return}cr.set(e,{...n,current:t}),jc(e),ur()}}function eA(e,t=!0,n){const r=Po();return _o({queryKey:Js(e,n),queryFn:()=>Fe.getSidecar(e),enabled:!!e&&t,staleTime:3e4,gcTime:5*6e4,retry:2,refetchInterval:t&&r?X2:!1,refetchIntervalInBackground:t&&r})}function tA(e,t=!0,n){return _o({queryKey:up(e,n),queryFn:()=>Fe.getItemDetail(e),enabled:!!e&&t,staleTime:3e4,gcTime:5*6e4,retry:2})}function nA(e,t){const n=Ms();return pR({mutationFn:async({patch:r,baseVersion:s,idempotencyKey:i})=>{const o=tc(r);if(!Ih(o))return{sidecar:n.getQueryData(Js(e,t))??Y2,mutation_id:i,accepted_event:null,persistence:"saved",durable_watermark:{boot_epoch:"client-noop",event_id:0}};const l={...o,base_version:s};try{return await Fe.patchSidecar(e,l,{idempotencyKey:i,ifMatch:s})}catch(a){throw C1(e,o,a),a}},retry:(r,s)=>s instanceof jn&&s.status===409?!1:r<2,retryDelay:r=>Math.min(1e3*Math.pow(2,r),4e3),onMutate:()=>(S1(),vv(1),{inflightId:J2()}),onSuccess:(r,s)=>{hp(e),w1(n,e,r.sidecar),r.durable_watermark.boot_epoch!=="client-noop"&&b1(e,r),r.sidecar.version!==s.baseVersion&&x1({path:e,response:r,changedFields:k1(tc(s.patch))})},onError:r=>{r instanceof jn&&r.status===409||(r instanceof jn?ec(r.message):ec("Failed to save"))},onSettled:(r,s,i,o)=>{vv(-1),Z2(o==null?void 0:o.inflightId)}})}const uP=6;async function rA(e,t){if(!e.length)return;let n=0;const r=[],s=async()=>{for(;n<e.length;){const o=n++,l=e[o];try{await cP(l,t)}catch(a){r.push({path:l,error:a}),console.error(`[bulkUpdateSidecars] Failed for ${l}:`,a)}}},i=Array.from({length:Math.min(uP,e.length)},()=>s());if(await Promise.all(i),r.length===e.length)throw new Error(`All ${e.length} sidecar updates failed`)}async function cP(e,t){const n=$n.get(e)||{};$n.set(e,{...n,...t}),S1(),ur();const r=du.get(e);if(r)return r;jh.set(e,Date.now()),Zu();const s=(async()=>{try{for(;$n.has(e);){const i=$n.get(e);if(!i)break;const o=tc(i);if(!Ih(o)){$n.get(e)===i&&$n.delete(e);continue}let l=1;try{l=(await Fe.getSidecar(e)).version??1}catch{l=1}const a={...o,base_version:l};try{const d=await Fe.patchSidecar(e,a,{idempotencyKey:Db("patch"),ifMatch:l});b1(e,d),d.sidecar.version!==l&&x1({path:e,response:d,changedFields:k1(o)}),hp(e),$n.get(e)===i&&$n.delete(e)}catch(d){if(C1(e,o,d)){const h=$n.get(e);if(h&&h!==i){const m=tc(h);if(Ih(m)){const y=cr.get(e);y&&(cr.set(e,{...y,pending:m}),jc(e))}}$n.delete(e)}else d instanceof jn?ec(d.message):ec("Failed to save");throw d}}}finally{du.delete(e),jh.delete(e),Zu(),ur()}})();return du.set(e,s),ur(),s}const dP=/^[\/@a-zA-Z0-9._\-\/]{1,512}$/;function qt(e){try{const t=decodeURI(e||""),r=(t.startsWith("/")?t:`/${t}`).replace(/\/{2,}/g,"/"),s=r.length>1?r.replace(/\/$/,""):r;return dP.test(s)?s:"/"}catch{return"/"}}function fP(e,t){const n=e.replace(/\/+$/,""),r=t.replace(/^\/+/,""),s=[n,r].filter(Boolean).join("/");return s.startsWith("/")?s:`/${s}`}const xv="!";function Lh(){return(window.location.hash||"").replace(/^#/,"")}function bv(e){const t=qt(e),n=`#${encodeURI(t)}`;window.location.hash!==n&&(window.location.hash=n)}function hP(e){const t=qt(e),n=`#!${encodeURI(t)}`;window.location.hash!==n&&(window.location.hash=n)}function Sv(e){const t=qt(e),n=`#${encodeURI(t)}`;if(window.location.hash!==n){const r=`${window.location.pathname}${window.location.search}${n}`;window.history.replaceState(window.history.state,"",r)}}function mP(e){const t=qt(e),n=`#!${encodeURI(t)}`;if(window.location.hash!==n){const r=`${window.location.pathname}${window.location.search}${n}`;window.history.replaceState(window.history.state,"",r)}}function E1(e){const n=qt(e).split("/").filter(Boolean);return n.length<=1?"/":"/"+n.slice(0,-1).join("/")}function M1(e){if(e.startsWith(xv)){const n=qt(e.slice(xv.length));return n==="/"?{folderTarget:"/",imageTarget:null}:{folderTarget:E1(n),imageTarget:n}}return{folderTarget:qt(e),imageTarget:null}}function pP(e){return qt(e).split("/").filter(Boolean).pop()||""}function sA(e){const t=["B","KB","MB","GB","TB"];let n=0,r=e;for(;r>=1024&&n<t.length-1;)r/=1024,n+=1;return`${r.toFixed(1)} ${t[n]}`}function gP(e){const t=Wt(e);if(t==null)return"–";const n=Math.abs(t);return n>=1e3?t.toFixed(0):n>=10?t.toFixed(2):t.toFixed(3)}function R1(e){if(!e)return null;try{return JSON.parse(e)}catch{return null}}function yP(e,t=28){if(e.length<=t)return e;const n=Math.max(4,Math.floor((t-1)/2));return`${e.slice(0,n)}…${e.slice(-n)}`}const vP=new Intl.DateTimeFormat("en-US",{month:"short",day:"numeric",year:"numeric",hour:"numeric",minute:"2-digit"});function wP(e){const t=e.trim();return!t||/[zZ]|[+-]\d{2}:?\d{2}$/.test(t)?t:`${t.includes("T")?t:t.replace(" ","T")}Z`}function N1(e){if(!e)return null;const t=Date.parse(wP(e));return Number.isFinite(t)?t:null}function xP(e,t=Date.now()){const n=Math.max(0,t-e),r=Math.max(1,Math.floor(n/1e3));if(r<60)return`${r} second${r===1?"":"s"} ago`;const s=Math.floor(r/60);if(s<60)return`${s} minute${s===1?"":"s"} ago`;const i=Math.floor(s/60);return`${i} hour${i===1?"":"s"} ago`}function bP(e){return vP.format(new Date(e))}const ml="sort",pl="filters",gl="derived_metric",nc="q",rc="random_seed",sc="unsupported_metric_intent",Oh={filters:{and:[]},sort:{kind:"builtin",key:"added",dir:"desc"}};function SP(e=Oh){return typeof window>"u"?_1(e):kP(window.location.search,e)}function kP(e,t=Oh){const n=j1(e);if(!(n.has(ml)||n.has(pl)||n.has(gl)||n.has(nc)||n.has(rc)||n.has(sc)))return _1(t);const i={};if(n.has(ml)){const o=jP(n.get(ml));o&&(i.sort=o)}if(n.has(pl)){const o=_P(n.get(pl));o&&(i.filters=o)}if(n.has(gl)){const o=PP(n.get(gl));o&&(i.derivedMetric=o)}return{viewState:oi(i,Oh),query:P1(n.get(nc)),randomSeed:MP(n.get(rc)),unsupportedMetricIntent:_c(n.get(sc)),hasSharedAnalysisState:!0,hasSharedViewState:!0}}function CP(e,t={}){if(typeof window>"u")return;const n=EP(window.location.search,e,t);if(window.location.search===n)return;const r=`${window.location.pathname}${n}${window.location.hash}`;window.history.replaceState(window.history.state,"",r)}function EP(e,t,n={}){const r=j1(e),s=oi(t),i=P1(n.query??null);i?r.set(nc,i):r.delete(nc),TP(s.sort)?r.delete(ml):r.set(ml,NP(s.sort));const o=ca(s.filters)??{and:[]};o.and.length?r.set(pl,JSON.stringify(o)):r.delete(pl);const l=Tr(s.derivedMetric??null);l&&LP(s.sort,o,l.id)?r.set(gl,JSON.stringify(l)):r.delete(gl);const a=RP(s.sort,n.randomSeed);a?r.set(rc,a):r.delete(rc);const d=_c(n.unsupportedMetricIntent??null);d?r.set(sc,d):r.delete(sc);const f=r.toString();return f?`?${f}`:""}function j1(e){const t=e.startsWith("?")?e.slice(1):e;return new URLSearchParams(t)}function _1(e){return{viewState:oi(e),query:"",randomSeed:null,unsupportedMetricIntent:null,hasSharedAnalysisState:!1,hasSharedViewState:!1}}function _c(e){return((e==null?void 0:e.trim().replace(/\s+/g," "))??"")||null}function P1(e){return _c(e)??""}function MP(e){const t=_c(e);if(t===null)return null;const n=Number(t);return Number.isFinite(n)?n:null}function RP(e,t){return e.kind!=="builtin"||e.key!=="random"||t==null||t===""?null:String(t).trim()||null}function NP(e){return e.kind==="metric"?`metric:${e.dir}:${e.key}`:`builtin:${e.key}:${e.dir}`}function jP(e){if(!e)return null;const t=e.split(":");if(t[0]==="metric"&&kv(t[1])&&t.length>=3){const n=t.slice(2).join(":").trim();return n?{kind:"metric",dir:t[1],key:n}:null}return t[0]==="builtin"&&t.length===3&&IP(t[1])&&kv(t[2])?{kind:"builtin",key:t[1],dir:t[2]}:null}function _P(e){const t=R1(e);return ca(t)??void 0}function PP(e){const t=R1(e);return Tr(t)??void 0}function TP(e){return e.kind==="builtin"&&e.key==="added"&&e.dir==="desc"}function IP(e){return e==="added"||e==="name"||e==="random"}function kv(e){return e==="asc"||e==="desc"}function LP(e,t,n){const r=`@derived/${n}`;if(e.kind==="metric"&&e.key===r)return!0;for(const s of t.and)if("metricRange"in s&&s.metricRange.key===r)return!0;return!1}const tt={phoneMaxWidth:480,narrowMaxWidth:900,tabletMaxWidth:1180,shortHeightMax:559,leftContentMinWidth:200,leftRailWidth:48,rightInspectorMinUsableWidth:280,baseToolbarHeight:48,mobileSearchRowHeight:48,mobileDrawerHeight:217,centerMinWidthByMode:{phone:320,narrow:360,tablet:420,desktop:520}};function Co(e,t,n){return Math.min(Math.max(e,t),n)}function Fh(e,t){return Number.isFinite(e)&&e>0?e:t}function T1(e){return e<=tt.phoneMaxWidth?"phone":e<=tt.narrowMaxWidth?"narrow":e<=tt.tabletMaxWidth?"tablet":"desktop"}function I1(e){return tt.centerMinWidthByMode[e]}function L1(e,t){return t==="phone"?tt.leftContentMinWidth:t==="narrow"?320:t==="tablet"?360:Co(Math.round(e*.22),420,760)}function Ah(e,t){return t==="phone"?tt.rightInspectorMinUsableWidth:t==="narrow"?320:t==="tablet"?440:Co(Math.round(e*.6),560,1400)}function O1(e){return e==="phone"?"viewport-too-narrow":"insufficient-center-space"}function Hl(e){return Number(e.toFixed(2))}function OP(e){const t=Math.max(0,e.viewportWidth),n=Math.max(0,e.viewportHeight),r=T1(t),s=n<tt.shortHeightMax+1,i=I1(r),o=e.overlay!=="none",l=Fh(e.leftPreferredWidth,tt.leftContentMinWidth),a=Fh(e.rightPreferredWidth,tt.rightInspectorMinUsableWidth),d=r==="phone"||r==="narrow",f={toolbarHeightPx:tt.baseToolbarHeight+(d&&e.mobileSearchOpen?tt.mobileSearchRowHeight:0),mobileDrawerHeightPx:d&&!o&&e.mobileDrawerOpen?tt.mobileDrawerHeight:0};if(s){const R="short-height";return{mode:r,shortHeight:s,centerMinWidth:i,effectiveLeftOpen:!1,effectiveRightOpen:!1,leftRailVisible:!1,leftWidth:0,rightWidth:0,leftSuppressionReason:e.userLeftOpen?R:void 0,rightSuppressionReason:e.userRightOpen?R:void 0,gridInsets:{left:0,right:0},overlayInsets:{left:0,right:0},inspector:{persistentAllowed:!1,minUsableWidth:tt.rightInspectorMinUsableWidth,suppressionReason:R},shellReserves:f}}const h=Math.max(0,t-i);let m=h,y=!1,b=0,w;if(e.userRightOpen){const R=tt.rightInspectorMinUsableWidth;if(m>=R){const E=e.userLeftOpen&&m-R>=tt.leftContentMinWidth?tt.leftContentMinWidth:0,N=Math.min(Ah(t,r),m-E);b=Hl(Co(a,R,N)),y=!0,m-=b}else w=r==="phone"?"viewport-too-narrow":"inspector-too-narrow"}let S=!1,v=0,x;if(e.userLeftOpen){const R=tt.leftContentMinWidth;m>=R?(v=Hl(Co(l,R,Math.min(L1(t,r),m))),S=!0,m-=v):x=t<i+R?O1(r):"insufficient-center-space"}const p=h>=tt.rightInspectorMinUsableWidth,g=p?void 0:r==="phone"?"viewport-too-narrow":"inspector-too-narrow",k=S||(r==="tablet"||r==="desktop")&&m>=tt.leftRailWidth,C=S?v:k?tt.leftRailWidth:0;return{mode:r,shortHeight:s,centerMinWidth:i,effectiveLeftOpen:S,effectiveRightOpen:y,leftRailVisible:k,leftWidth:C,rightWidth:b,leftSuppressionReason:x,rightSuppressionReason:w,gridInsets:{left:C,right:b},overlayInsets:o?{left:C,right:b}:{left:0,right:0},inspector:{persistentAllowed:p,minUsableWidth:tt.rightInspectorMinUsableWidth,suppressionReason:g},shellReserves:f}}function Cv(e){const t=Math.max(0,e.viewportWidth),n=T1(t),r=I1(n),s=Math.max(0,t-r),i=tt.leftContentMinWidth,o=tt.rightInspectorMinUsableWidth;if(e.activeSide==="left"){const d=e.userRightOpen&&s-i>=o?Co(Fh(e.rightPreferredWidth,o),o,Math.min(Ah(t,n),s-i)):0,f=Hl(Math.min(L1(t,n),s-d));return{minWidth:i,maxWidth:f,disabled:f<i,suppressionReason:f<i?O1(n):void 0}}const l=e.userLeftOpen&&s-o>=i?i:0,a=Hl(Math.min(Ah(t,n),s-l));return{minWidth:o,maxWidth:a,disabled:a<o,suppressionReason:a<o?n==="phone"?"viewport-too-narrow":"inspector-too-narrow":void 0}}function Wa(e,t){return t.disabled?0:Hl(Co(e,t.minWidth,t.maxWidth))}const ic={left:"leftW.shared",right:"rightW"},Ev=340,Mv=240,FP=["leftW.folders","leftW.metrics","leftW.derived","leftW"];function AP(e){return Number.isFinite(e)&&e>0}function Rv(e){const t=Number(e);return AP(t)?t:null}function DP(e){const t=Rv(e.getItem(ic.left)),n=Rv(e.getItem(ic.right));for(const r of FP)e.removeItem(r);return{leftW:t,rightW:n}}function Nv(e,t,n){e.setItem(t,String(n))}function zP(e){return(e.pointerType??"mouse")==="mouse"&&e.button!==0}function $P(e,t){try{e.setPointerCapture(t)}catch{}}function BP(e,t){try{e.releasePointerCapture(t)}catch{}}function UP(e,t){const[{leftW:n,rightW:r},s]=c.useState(()=>{try{const m=DP(window.localStorage);return{leftW:m.leftW??Ev,rightW:m.rightW??Mv}}catch{return{leftW:Ev,rightW:Mv}}}),i=c.useRef(n),o=c.useRef(r),l=c.useRef(t.userLeftOpen),a=c.useRef(t.userRightOpen);c.useEffect(()=>{i.current=n},[n]),c.useEffect(()=>{o.current=r},[r]),c.useEffect(()=>{l.current=t.userLeftOpen},[t.userLeftOpen]),c.useEffect(()=>{a.current=t.userRightOpen},[t.userRightOpen]);const d=(m,y,b)=>{if(zP(m))return;m.preventDefault();const w=m.currentTarget,S=m.pointerId;$P(w,S);const v=g=>{g.pointerId===S&&y(g)};function x(){window.removeEventListener("pointermove",v),window.removeEventListener("pointerup",p),window.removeEventListener("pointercancel",p),BP(w,S)}function p(g){g.pointerId===S&&(x(),b())}window.addEventListener("pointermove",v),window.addEventListener("pointerup",p),window.addEventListener("pointercancel",p)};return{leftW:n,rightW:r,onResizeLeft:m=>{const y=e.current;if(!y)return;const b=y.getBoundingClientRect(),w=Cv({viewportWidth:b.width,activeSide:"left",userLeftOpen:l.current,userRightOpen:a.current,leftPreferredWidth:i.current,rightPreferredWidth:o.current});if(w.disabled)return;let S=Wa(i.current,w);d(m,v=>{const x=Wa(v.clientX-b.left,w);S=x,i.current=x,s(p=>({...p,leftW:x}))},()=>{try{Nv(window.localStorage,ic.left,S)}catch{}})},onResizeRight:m=>{const y=e.current;if(!y)return;const b=y.getBoundingClientRect(),w=Cv({viewportWidth:b.width,activeSide:"right",userLeftOpen:l.current,userRightOpen:a.current,leftPreferredWidth:i.current,rightPreferredWidth:o.current});if(w.disabled)return;let S=Wa(o.current,w);d(m,v=>{const x=Wa(b.width-(v.clientX-b.left),w);S=x,o.current=x,s(p=>({...p,rightW:x}))},()=>{try{Nv(window.localStorage,ic.right,S)}catch{}})}}}function mp(e){return!e}function HP({activeTool:e,contentOpen:t,clickedTool:n}){return n===e?{nextTool:e,contentOpen:mp(t)}:{nextTool:n,contentOpen:!0}}function KP({leftContentOpen:e,rightOpen:t,altKey:n}){return n?{leftContentOpen:e,rightOpen:!t}:{leftContentOpen:mp(e),rightOpen:t}}const VP='[role="tree"] [role="treeitem"]';function WP(){return Array.from(document.querySelectorAll(VP))}function qP(e,t){var i;const n=WP(),r=n.findIndex(o=>o===e);if(r===-1)return;let s=r;t==="ArrowDown"?s=Math.min(n.length-1,r+1):t==="ArrowUp"?s=Math.max(0,r-1):t==="Home"?s=0:t==="End"&&(s=n.length-1),(i=n[s])==null||i.focus()}function QP({path:e,isLeaf:t,isExpanded:n,setExpanded:r,onOpen:s}){return c.useCallback(i=>{if(i.key==="Enter"){i.preventDefault(),s(e);return}if(i.key==="ArrowRight"){!t&&!n&&(i.preventDefault(),r(o=>{const l=new Set(o);return l.add(e),l}));return}if(i.key==="ArrowLeft"){!t&&n&&(i.preventDefault(),r(o=>{const l=new Set(o);return l.delete(e),l}));return}(i.key==="ArrowDown"||i.key==="ArrowUp"||i.key==="Home"||i.key==="End")&&(i.preventDefault(),qP(i.currentTarget,i.key))},[e,t,n,r,s])}const jv=64,GP=120;function YP(e){const t=e.split("/").filter(Boolean),n=["/"];let r="";for(const s of t)r=r?`${r}/${s}`:`/${s}`,n.push(r);return n}function XP({active:e=!0,current:t,roots:n,data:r,onOpen:s,onPullRefresh:i,onResize:o,onContextMenu:l,onOpenActions:a,countVersion:d,className:f,showResizeHandle:h=!0}){const[m,y]=c.useState(new Set(["/"])),b=c.useRef(new Map),w=c.useRef(new Map),[S,v]=c.useState(!1),[x,p]=c.useState(0),g=c.useRef(null),k=c.useRef(!1),C=Ms(),R=c.useCallback(()=>{p(0),g.current=null,k.current=!1},[]),E=c.useCallback(async z=>{const B=qt(z||"/"),O=b.current,L=w.current,F=O.get(B);if(F!==void 0)return F;const T=h1(B,{recursive:!0}),H=C.getQueryData(T);if(H){const re=H.total_items??H.items.length;return O.set(B,re),re}const G=L.get(B);if(G)return G;const Y=(async()=>{try{const re=C.getQueryState(T);if((re==null?void 0:re.fetchStatus)==="fetching"){const he=await C.fetchQuery({queryKey:T,queryFn:()=>Fe.getFolder(B,{recursive:!0})}),pe=he.total_items??he.items.length;return O.set(B,pe),pe}const le=await Fe.getFolderCount(B);return O.set(B,le),le}finally{L.delete(B)}})();return L.set(B,Y),Y},[C]);c.useEffect(()=>{b.current.clear(),w.current.clear()},[d]),c.useEffect(()=>{const z=YP(t);y(B=>{const O=new Set(B);for(const L of z)O.add(L);return O})},[t]);const N=c.useCallback(async()=>{if(!(!i||S)){v(!0);try{await i()}catch(z){console.error("Failed to refresh folders:",z)}finally{v(!1),p(0)}}},[i,S]),j=c.useCallback(z=>{!i||S||z.touches.length===1&&(z.currentTarget.scrollTop>0||(g.current=z.touches[0].clientY,k.current=!1))},[i,S]),P=c.useCallback(z=>{if(!i||S||z.touches.length!==1)return;const B=g.current;if(B==null)return;if(z.currentTarget.scrollTop>0){R();return}const O=z.touches[0].clientY-B;if(O<=0){k.current&&p(0);return}!k.current&&O<8||(k.current=!0,z.preventDefault(),p(Math.min(GP,O*.55)))},[S,i,R]),$=c.useCallback(()=>{if(!i||S){R();return}const z=k.current&&x>=jv;if(g.current=null,k.current=!1,z){N();return}p(0)},[N,S,i,x,R]),q=`${f??"h-full overflow-auto bg-panel scrollbar-thin"} folder-tree-scroll`,V=i?`${q} overscroll-y-contain`:q,A=!!i&&(S||x>0),Z=x>=jv,D=S?28:Math.min(44,x);return u.jsxs("div",{className:V,onTouchStart:i?j:void 0,onTouchMove:i?P:void 0,onTouchEnd:i?$:void 0,onTouchCancel:i?$:void 0,children:[A&&u.jsx("div",{className:"flex items-end justify-center text-[11px] text-muted select-none transition-[height,opacity] duration-150",style:{height:D,opacity:S||x>8?1:.65},"aria-live":"polite",children:S?"Refreshing…":Z?"Release to refresh":"Pull to refresh"}),u.jsx("div",{className:"p-1",role:"tree","aria-label":"Folders",children:n.map(z=>u.jsx(F1,{active:e,path:z.path,label:z.label,depth:0,current:t,expanded:m,setExpanded:y,onOpen:s,onContextMenu:l,onOpenActions:a,initial:r,getSubtreeCount:E,countVersion:d},z.path))}),h&&u.jsx("div",{className:"toolbar-offset sidebar-resize-handle absolute bottom-0 left-[calc(var(--grid-left)-6px)]",onPointerDown:o})]})}function F1({active:e,path:t,label:n,depth:r,current:s,expanded:i,setExpanded:o,onOpen:l,onContextMenu:a,onOpenActions:d,initial:f,getSubtreeCount:h,countVersion:m}){var j;const y=i.has(t),b=s===t,w=JP(e,t,y,b),{data:S,isError:v}=D2(t,{enabled:w}),x=f&&t===f.path?f:S,g=!!x?x.folders.length===0:!1,[k,C]=c.useState(x?x.items.length:null),R=QP({path:t,isLeaf:g,isExpanded:y,setExpanded:o,onOpen:l}),E=P=>{P.stopPropagation(),!g&&o($=>{const U=new Set($);return U.has(t)?U.delete(t):U.add(t),U})},N=P=>{if(P.stopPropagation(),!d)return;const $=P.currentTarget.getBoundingClientRect();d(t,{x:$.right-4,y:$.bottom-4})};return c.useEffect(()=>{let P=!1;if(!e)return;if(!x){C(null);return}if(C(x.items.length),!!(y&&(r>0||b)))return h(t).then(U=>{P||C(U)}).catch(U=>{P||console.warn(`Failed to compute subtree count for ${t}:`,U)}),()=>{P=!0}},[e,x,t,h,m,y,r,b]),u.jsxs("div",{children:[u.jsxs("div",{className:`tree-row flex items-center gap-1.5 py-1 px-2 rounded-md cursor-pointer min-h-[40px] outline-none transition-colors duration-75 ${b?"bg-accent/20 text-accent font-medium":"hover:bg-white/5 text-text"}`,role:"treeitem","aria-level":r+1,"aria-expanded":g?void 0:y,"aria-selected":b,tabIndex:b?0:-1,style:{paddingLeft:8+r*14},onClick:()=>l(t),onContextMenu:P=>{P.preventDefault(),P.stopPropagation(),a==null||a(P,t)},onKeyDown:R,children:[u.jsx("button",{type:"button",className:"tree-expand-btn touch-manipulation",onClick:E,"aria-label":g?`No subfolders in ${n}`:`${y?"Collapse":"Expand"} ${n}`,"aria-expanded":g?void 0:y,disabled:g,children:g?"•":y?"▼":"▶"}),u.jsx("span",{className:"flex-1 overflow-hidden truncate text-sm",title:n,children:yP(n,28)}),u.jsx("span",{className:"tree-row-count text-[10px] opacity-50 bg-white/5 border border-white/5 rounded px-1.5 text-center","data-pending":k===null,title:k===null?"Folder item count loading":`${k.toLocaleString()} items`,"aria-label":k===null?"Folder item count loading":`${k.toLocaleString()} items`,children:k===null?"…":k.toLocaleString()}),d?u.jsx("button",{type:"button",className:"tree-row-action-btn touch-manipulation","aria-label":`Open actions for ${n}`,"aria-haspopup":"menu",onPointerDown:P=>P.stopPropagation(),onClick:N,children:u.jsxs("svg",{width:"13",height:"13",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("circle",{cx:"12",cy:"5",r:"1.5"}),u.jsx("circle",{cx:"12",cy:"12",r:"1.5"}),u.jsx("circle",{cx:"12",cy:"19",r:"1.5"})]})}):u.jsx("span",{className:"tree-row-action-btn tree-row-action-placeholder","aria-hidden":"true"})]}),y&&!x&&u.jsx("div",{className:`tree-child-state ${v?"text-danger":"text-muted"}`,style:{paddingLeft:8+(r+1)*14},role:v?"alert":"status",children:v?"Failed to load folders":"Loading folders…"}),y&&((j=x==null?void 0:x.folders)==null?void 0:j.map(P=>u.jsx(F1,{active:e,path:fP(t,P.name),label:P.name,depth:r+1,current:s,expanded:i,setExpanded:o,onOpen:l,onContextMenu:a,onOpenActions:d,getSubtreeCount:h,countVersion:m},P.name)))]})}function JP(e,t,n,r){return e&&(t==="/"||n||r)}const ZP="score_v1",Pc="new_score",pp="1",eT=/^[A-Za-z0-9_./:]+$/;function tT(e,t,n){const r=e.spec?{kind:"valid",version:e.spec.version,id:e.spec.id,name:e.spec.name,intercept:e.spec.intercept,numericTerms:e.spec.numericTerms.map(s=>({key:s.key,weight:s.weight,missing:s.missing,zNormalize:s.zNormalize})),categoricalTerms:e.spec.categoricalTerms.map(s=>({key:s.key,value:s.value,weight:s.weight}))}:e.definitionIdentity==null?null:{kind:"invalid",identity:e.definitionIdentity};return JSON.stringify({definition:r,metricKeys:Array.from(new Set(t)).sort(),categoricalKeys:Array.from(new Set(n)).sort()})}function A1(e,t){return JSON.stringify([t,tT(e,[],[])])}function D1(e,t){return e?{id:e.id,name:e.name,intercept:Yi(e.intercept),numericTerms:e.numericTerms.map(n=>({key:n.key,weight:Yi(n.weight),missing:n.missing,zNormalize:n.zNormalize})),categoricalTerms:e.categoricalTerms.map(n=>({key:n.key,value:n.value,weight:Yi(n.weight)}))}:{id:ZP,name:Pc,intercept:"0",numericTerms:t[0]?[{key:t[0],weight:pp,missing:"invalid",zNormalize:!1}]:[],categoricalTerms:[]}}function nT(e){return{key:e[0]??"",weight:pp,missing:"invalid",zNormalize:!1}}function rT(e,t){var r;const n=e[0]??"";return{key:n,value:((r=t.get(n))==null?void 0:r[0])??"",weight:pp}}function pr(e){return{metric_keys:_v(e.numericTerms),categorical_keys:_v(e.categoricalTerms)}}function _v(e){return Array.from(new Set(e.map(t=>t.key.trim()).filter(Boolean))).sort()}function z1(e){const t=[],n=mT(e.id),r=e.name.trim()||Pc,s=fu(e.intercept);n||t.push("Score id is invalid."),s==null&&t.push("Intercept must be finite.");const i=[];e.numericTerms.forEach((l,a)=>{const d=l.key.trim(),f=fu(l.weight);d||t.push(`Numeric term ${a+1} needs a metric.`),ht(d)&&t.push(`Numeric term ${a+1} cannot use a derived score.`),f==null&&t.push(`Numeric term ${a+1} needs a finite weight.`),l.missing!=="zero"&&l.missing!=="invalid"&&t.push(`Numeric term ${a+1} has an invalid missing policy.`),d&&!ht(d)&&f!=null&&(l.missing==="zero"||l.missing==="invalid")&&i.push({key:d,weight:f,missing:l.missing,zNormalize:l.zNormalize})});const o=[];return e.categoricalTerms.forEach((l,a)=>{const d=l.key.trim(),f=l.value.trim(),h=fu(l.weight);d||t.push(`Categorical term ${a+1} needs a field.`),ht(d)&&t.push(`Categorical term ${a+1} cannot use a derived score.`),f||t.push(`Categorical term ${a+1} needs a value.`),h==null&&t.push(`Categorical term ${a+1} needs a finite weight.`),d&&!ht(d)&&f&&h!=null&&o.push({key:d,value:f,weight:h})}),!i.length&&!o.length&&t.push("Add at least one score term."),t.length||!n||s==null?{spec:null,errors:t}:{spec:{version:1,id:n,name:r,intercept:s,numericTerms:i,categoricalTerms:o},errors:[]}}function sT(e,t){const n=e.name.trim()||Pc,r=[e.intercept.trim()||"0"];for(const s of e.numericTerms){const i=s.key.trim()||"?",o=s.weight.trim()||"?",l=s.zNormalize?`znorm(${ar(i,t)})`:ar(i,t);r.push(`${o}*${l}`)}for(const s of e.categoricalTerms){const i=s.key.trim()||"?",o=s.value.trim()||"?",l=s.weight.trim()||"?";r.push(`${l} if ${i} = ${o}`)}return`${n} = ${r.join(" + ")}`}function Qd(e){const t=e.name.trim()||Pc,n=[e.intercept.trim()||"0"];for(const r of e.numericTerms){const s=r.key.trim()||"?",i=r.weight.trim()||"?",o=r.zNormalize?`znorm(${qa(s)})`:qa(s);n.push(`${i}*${o}`)}for(const r of e.categoricalTerms){const s=r.key.trim()||"?",i=r.value.trim()||"?",o=r.weight.trim()||"?";n.push(`${o} if ${qa(s)} = ${qa(i)}`)}return`${t} = ${n.join(" + ")}`}function iT(e,t,n){const r={errors:[],missingMetricKeys:[],missingCategoricalKeys:[],skippedTerms:[]},s=new Set(n.metricKeys),i=new Set(n.categoricalKeys),o=e.trim();if(!o)return{draft:t,diagnostics:{...r,errors:["Formula is empty."]},applied:!1};const l=aT(o),a=uT(l.rhs);if(!a.length)return{draft:t,diagnostics:{...r,errors:["Formula has no terms."]},applied:!1};let d=0,f=!1;const h=[],m=[],y=new Set,b=new Set;for(const w of a){const S=cT(w);if(S.kind==="invalid"){r.errors.push(S.error),r.skippedTerms.push(w.trim());continue}if(S.kind==="intercept"){d+=S.value,f=!0;continue}if(S.kind==="numeric"){if(!s.has(S.key)){y.add(S.key),r.skippedTerms.push(w.trim());continue}h.push({key:S.key,weight:Yi(S.weight),missing:hT(t,S.key),zNormalize:S.zNormalize});continue}if(!i.has(S.key)){b.add(S.key),r.skippedTerms.push(w.trim());continue}m.push({key:S.key,value:S.value,weight:Yi(S.weight)})}return r.missingMetricKeys=Array.from(y).sort(),r.missingCategoricalKeys=Array.from(b).sort(),r.missingMetricKeys.length||r.missingCategoricalKeys.length?{draft:t,diagnostics:{...r,errors:["Formula references unavailable inputs."]},applied:!1}:!h.length&&!m.length&&!f?{draft:t,diagnostics:{...r,errors:r.errors.length?r.errors:["Formula has no usable terms."]},applied:!1}:{draft:{...t,name:l.name??t.name,intercept:Yi(d),numericTerms:h,categoricalTerms:m},diagnostics:r,applied:!0}}function oT(e,t){const n=z1(e);if(!n.spec)return{disabledReason:n.errors[0]??"Score definition is invalid.",evaluation:null};const r=np({items:t.items,metricKeys:t.metricKeys,categoricalKeys:t.categoricalKeys,spec:n.spec,loadedCount:t.items.length,totalItems:t.items.length});return t.rankDisabledReason?{disabledReason:t.rankDisabledReason,evaluation:r}:r.status==="unavailable"?{disabledReason:"Score inputs are unavailable.",evaluation:r}:r.status==="invalid"?{disabledReason:r.invalidReasons[0]??"Score definition is invalid.",evaluation:r}:r.validCount<=0?{disabledReason:"Score has no valid values.",evaluation:r}:{disabledReason:null,evaluation:r}}function lT(e,t){var r,s,i;const n=new Map;for(const o of t)n.set(o,new Set);for(const o of e)for(const l of t){const a=(s=(r=o.categoricals)==null?void 0:r[l])==null?void 0:s.trim();a&&((i=n.get(l))==null||i.add(a))}return new Map(Array.from(n.entries()).map(([o,l])=>[o,Array.from(l).sort()]))}function aT(e){const t=B1(e);if(t<0)return{name:null,rhs:e};const n=e.slice(0,t).trim();return!n||n.includes("+")||n.includes("*")||$1(n)>=0?{name:null,rhs:e}:{name:n,rhs:e.slice(t+1).trim()}}function uT(e){const t=[];let n=0,r=0,s=0;for(let o=0;o<e.length;o+=1){const l=e[o],a=e[o-1];if(l==="["&&s>=0)r+=1;else if(l==="]"&&r>0)r-=1;else if(l==="("&&r===0)s+=1;else if(l===")"&&r===0&&s>0)s-=1;else if(r===0&&s===0&&(l==="+"||l==="-")&&o>n&&a!=="e"&&a!=="E"){const d=e.slice(n,o).trim();d&&t.push(d),n=o}}const i=e.slice(n).trim();return i&&t.push(i),t}function cT(e){const t=e.trim(),n=$1(t);if(n>=0)return dT(t,n);const r=U1(t,"*");if(r<0){const o=Dh(t);if(o!=null)return{kind:"intercept",value:o};const l=Kl(t);return l?{kind:"numeric",key:l,weight:1,zNormalize:!1}:{kind:"invalid",error:`Invalid metric term: ${t}.`}}const s=Dh(t.slice(0,r));if(s==null)return{kind:"invalid",error:`Invalid weight in term: ${t}.`};const i=fT(t.slice(r+1));return i?{kind:"numeric",key:i.key,weight:s,zNormalize:i.zNormalize}:{kind:"invalid",error:`Invalid metric in term: ${t}.`}}function dT(e,t){const n=e.slice(0,t).trim(),r=n?Dh(n):1;if(r==null)return{kind:"invalid",error:`Invalid categorical weight in term: ${e}.`};const s=e.slice(t).trim().replace(/^if\s+/i,""),i=B1(s);if(i<0)return{kind:"invalid",error:`Invalid categorical condition: ${e}.`};const o=Kl(s.slice(0,i)),l=s[i+1]==="="?i+2:i+1,a=Kl(s.slice(l));return!o||!a?{kind:"invalid",error:`Invalid categorical condition: ${e}.`}:{kind:"categorical",key:o,value:a,weight:r}}function fT(e){const t=e.trim();if(t.toLowerCase().startsWith("znorm(")&&t.endsWith(")")){const s=Kl(t.slice(6,-1));return s?{key:s,zNormalize:!0}:null}const r=Kl(t);return r?{key:r,zNormalize:!1}:null}function $1(e){let t=0,n=0;const r=e.toLowerCase();for(let s=0;s<e.length;s+=1){const i=e[s];if(i==="["?t+=1:i==="]"&&t>0?t-=1:i==="("&&t===0?n+=1:i===")"&&t===0&&n>0&&(n-=1),!(t!==0||n!==0)&&r.slice(s,s+2)==="if"&&(s===0||/\s/.test(e[s-1]))&&(s+2>=e.length||/\s/.test(e[s+2])))return s}return-1}function B1(e){return U1(e,"=")}function U1(e,t){let n=0,r=0;for(let s=0;s<e.length;s+=1){const i=e[s];if(i==="[")n+=1;else if(i==="]"&&n>0)n-=1;else if(i==="("&&n===0)r+=1;else if(i===")"&&n===0&&r>0)r-=1;else if(i===t&&n===0&&r===0)return s}return-1}function Kl(e){const t=e.trim();if(!t)return null;if(!t.startsWith("["))return t;if(!t.endsWith("]"))return null;let n="";for(let s=1;s<t.length-1;s+=1){const i=t[s];i==="\\"&&s+1<t.length-1?(n+=t[s+1],s+=1):n+=i}return n.trim()||null}function Dh(e){return fu(e.trim().replace(/^([+-])\s+/,"$1"))}function qa(e){const t=e.trim();return eT.test(t)?t:`[${t.replace(/\\/g,"\\\\").replace(/]/g,"\\]")}]`}function hT(e,t){var n;return((n=e.numericTerms.find(r=>r.key.trim()===t))==null?void 0:n.missing)??"invalid"}function mT(e){const t=e.trim();return!t||t.startsWith(Xu)?null:/^[A-Za-z0-9][A-Za-z0-9_-]{0,79}$/.test(t)?t:null}function fu(e){const t=e.trim();if(!t)return null;const n=Number(t);return Number.isFinite(n)?n:null}function Yi(e){return Number.isInteger(e)?String(e):String(Number(e.toPrecision(12)))}function yl(e,t,n){if(!e.length)return null;const r=n?n.min:Math.min(...e);let s=n?n.max:Math.max(...e);r===s&&(s=r+1);const i=new Array(t).fill(0),o=t/(s-r);for(const l of e){const a=Math.max(0,Math.min(t-1,Math.floor((l-r)*o)));i[a]+=1}return{bins:i,min:r,max:s,count:e.length}}function pT(e,t){const n=Math.max(1,t);return e.map(r=>r/n*100)}function H1(e,t){return e<t?{min:e,max:t}:{min:t,max:e}}function qn(e){return gP(e)}function zh(e){if(!Number.isFinite(e))return"";const t=e.toString();return t.includes("e")?e.toFixed(6):t}function Pv(e){const t=e.trim();if(!t)return{value:null,valid:!0};const n=Number(t);return Number.isFinite(n)?{value:n,valid:!0}:{value:null,valid:!1}}function Tv(e,t,n){return e<t?t:e>n?n:e}function gp(e){return e<0?0:e>1?1:e}function Vl(e,t){const n=Math.max(1,Math.abs(e),Math.abs(t));return Math.abs(e-t)<=1e-6*n}const gT=[],yT=[];function Eo(e,t){if(t!=null&&t.length)return vT(e,t);const n=new Map;for(const r of e){const s=r.metrics;if(s)for(const[i,o]of Object.entries(s)){const l=Wt(o);if(l==null)continue;const a=n.get(i);a?a.push(l):n.set(i,[l])}}return n}function vT(e,t){const n=t.map(s=>({key:s,values:[]}));for(const s of e){const i=s.metrics;if(i)for(const o of n){const l=Wt(i[o.key]);l!=null&&o.values.push(l)}}const r=new Map;for(const s of n)s.values.length&&r.set(s.key,s.values);return r}function Xi(e,t){return e.get(t)??gT}function Iv(e,t,n,r){const s=new Map;for(const i of r){const o=new Map;vl(o,i,e,"populationCount"),o.size&&(vl(o,i,t,"filteredCount"),n!=null&&n.length&&vl(o,i,n,"selectedCount"),s.set(i,Array.from(o.values()).sort((l,a)=>l.code-a.code)))}return s}function wT(e,t,n,r,s){const i=new Map;for(const o of r){const l=e.metrics[o];if(!(l!=null&&l.categories.length))continue;const a=new Map;for(const d of l.categories)a.set(d.code,{code:d.code,label:d.label,populationCount:d.population_count,filteredCount:0,selectedCount:0});s&&vl(a,o,t,"filteredCount"),n!=null&&n.length&&vl(a,o,n,"selectedCount"),i.set(o,Array.from(a.values()).sort((d,f)=>d.code-f.code))}return i}function yp(e){return!e||!e.bins.length||e.count<=0?null:{bins:[...e.bins],min:e.min,max:e.max,count:e.count}}function Lv(e,t){return e.get(t)??yT}function vl(e,t,n,r){var s,i;for(const o of n){const l=(s=o.metric_labels)==null?void 0:s[t],a=Wt((i=o.metrics)==null?void 0:i[t]);if(!l||a==null)continue;let d=e.get(a);d||(d={code:a,label:l,populationCount:0,filteredCount:0,selectedCount:0},e.set(a,d)),d[r]+=1}}function K1({histogram:e,metricKey:t,state:n=e?"ready":"empty"}){if(n!=="ready"||!e)return u.jsx("div",{className:"flex h-[3.25rem] items-center justify-center rounded-sm border border-border/50 bg-surface/60 px-2 py-1 text-[10px] text-muted","data-derived-metric-histogram":t,"data-facet-state":n,role:"status",children:n==="pending"?"Loading values…":n==="error"?"Could not load values":"No finite values"});const r=e.bins,s=Math.max(1,r.length),i=Math.max(1,...r);return u.jsxs("div",{className:"h-[3.25rem] space-y-0.5","data-derived-metric-histogram":t,"data-facet-state":"ready",children:[u.jsxs("svg",{viewBox:`0 0 ${s} 32`,preserveAspectRatio:"none",className:"h-8 w-full rounded-sm border border-border/50 bg-surface/60","aria-label":`${t} distribution`,role:"img",children:[u.jsx("line",{x1:"0",y1:"31.5",x2:s,y2:"31.5",stroke:"var(--border-strong)",strokeWidth:"0.35"}),r.map((o,l)=>{const a=Math.max(.75,o/i*29);return u.jsx("rect",{x:l+.15,y:31-a,width:.7,height:a,fill:"#7dd3fc",opacity:.68},`${t}-${l}`)})]}),u.jsxs("div",{className:"flex items-center justify-between gap-2 text-[10px] text-muted tabular-nums",children:[u.jsx("span",{children:qn(e.min)}),u.jsxs("span",{children:[e.count," values"]}),u.jsx("span",{children:qn(e.max)})]})]})}const vp=typeof window>"u"?c.useEffect:c.useLayoutEffect;function V1(e,t,n=!0){return n&&t.state==="pending"&&e?e:t}function fa(e,t="default"){const n=c.useRef({resetKey:t,terminal:e.state==="pending"?null:e}),r=n.current.resetKey===t,s=r?n.current.terminal:null,i=V1(s,e,r);return vp(()=>{n.current.resetKey!==t?n.current={resetKey:t,terminal:e.state==="pending"?null:e}:e.state!=="pending"&&(n.current.terminal=e)},[e,t]),{presentation:i,retained:r&&e.state==="pending"&&s!==null}}function xT(e,t,n=!0){return new Map(t.map(r=>{const s=n?e.get(r.key)??null:null;return[r.key,{presentation:V1(s,r,n),retained:n&&r.state==="pending"&&s!==null}]}))}function W1(e,t,n="default"){const r=c.useRef({resetKey:n,terminal:new Map}),s=r.current.resetKey===n,i=xT(r.current.terminal,e,s);return vp(()=>{r.current.resetKey!==n&&(r.current={resetKey:n,terminal:new Map});const o=new Set(t);for(const l of r.current.terminal.keys())o.has(l)||r.current.terminal.delete(l);for(const l of e)l.state!=="pending"&&r.current.terminal.set(l.key,l)},[e,n,t]),i}function Tc(e,t,n,r){return e?e[t][n]??"pending":r}function Ic({facetDataState:e,localDataState:t,queryState:n}){return e!=="absent"?e:t!=="absent"?t:n==="pending"?"pending":n==="error"?"error":"empty"}const bT=[{value:"invalid",label:"Require value"},{value:"zero",label:"Missing = 0"}],Wl=new WeakMap;let Ov=0;function $h(e,t){const n=Wl.get(e);if(n)return n;Ov+=1;const r=`${t}-${Ov}`;return Wl.set(e,r),r}function Fv(e,t){const n=Wl.get(e);n&&Wl.set(t,n)}function Av(e,t,n){t.forEach((r,s)=>{const i=e[s];i&&Wl.set(r,$h(i,n))})}function ST(e){const t=e.metricKeys.filter(r=>!ht(r)),n=A1(e.derivedMetric,e.draftResetKey??"default");return u.jsx(kT,{...e,sourceMetricKeys:t},n)}function kT({active:e=!0,items:t,sourceMetricKeys:n,categoricalKeys:r,metricDisplayNames:s,facets:i=null,facetsState:o="settled",facetFieldStates:l,populationItemsComplete:a=!0,presentationResetKey:d="default",derivedMetric:f,backendAuthoritative:h=!1,rankDisabledReason:m=null,onApplyDerivedMetric:y,onRankByDerivedMetric:b,onFacetFieldsChange:w}){var be;const S=c.useMemo(()=>{if(!e)return new Map;const X=a?lT(t,r):new Map;return r.forEach(me=>{const Ne=i==null?void 0:i.categoricals[me];Ne&&X.set(me,Ne.values.map(K=>K.value))}),X},[e,r,i,t,a]),[v,x]=c.useState(()=>D1(f.spec,n)),[p,g]=c.useState(()=>Qd(v)),[k,C]=c.useState(!1),[R,E]=c.useState(null),N=c.useMemo(()=>[{value:"",label:"Metric",keywords:["metric"]},...n.map(X=>({value:X,label:ar(X,s),keywords:[X]}))],[s,n]),j=c.useMemo(()=>[{value:"",label:"Field",keywords:["field"]},...r.map(X=>({value:X,label:X,keywords:[X]}))],[r]),P=c.useMemo(()=>Qd(v),[v]);c.useEffect(()=>{k||g(P)},[P,k]);const $=c.useMemo(()=>z1(v),[v]),U=c.useMemo(()=>e?oT(v,{items:t,metricKeys:n,categoricalKeys:r,rankDisabledReason:m}):{disabledReason:m,evaluation:null},[e,r,v,t,m,n]),q=c.useMemo(()=>sT(v,s),[v,s]),V=c.useMemo(()=>PT(R),[R]),A=c.useMemo(()=>pr(v),[v]),Z=A.metric_keys,D=A.categorical_keys,z=c.useMemo(()=>e?_T({facets:i,facetsState:o,facetFieldStates:l,items:t,metricKeys:Z,populationItemsComplete:a}):new Map,[e,l,i,o,t,Z,a]),B=$.errors[0]??null,O=!U.evaluation||U.evaluation.status==="unavailable"||U.evaluation.status==="invalid"?U.disabledReason:null,L=h?m??O:U.disabledReason,F=f.status==="none"?U.evaluation:f,T=(F==null?void 0:F.validCount)??0,H=(F==null?void 0:F.invalidCount)??t.length,G=c.useMemo(()=>TT(f),[f]),Y=c.useMemo(()=>{if(!e)return null;const X=U.evaluation;if(!(X!=null&&X.key)||X.status!=="valid")return null;const me=Eo(X.items,[X.key]);return{key:X.key,histogram:yl(Xi(me,X.key),32)}},[e,U.evaluation]),re=c.useMemo(()=>new Map(D.map(X=>{const me=S.get(X)??[];return[X,ET({key:X,values:me,facets:i,facetsState:o,facetFieldStates:l,populationItemsComplete:a})]})),[D,S,l,i,o,a]),le=MT({histogram:(Y==null?void 0:Y.histogram)??null,populationItemsComplete:a,requiredStates:[...Array.from(z.values(),X=>X.state),...D.map(X=>re.get(X)??"pending")]}),he=((be=U.evaluation)==null?void 0:be.status)==="unavailable"?[...U.evaluation.missingMetricKeys,...U.evaluation.missingCategoricalKeys].sort():[],pe=(X,me)=>{E(null);const Ne=v.numericTerms.map((W,fe)=>{if(fe!==X)return W;const ee={...W,...me};return Fv(W,ee),ee}),K={...v,numericTerms:Ne};me.key!==void 0&&(w==null||w(pr(K))),x(K)},Se=(X,me)=>{E(null);const Ne=v.categoricalTerms.map((W,fe)=>{if(fe!==X)return W;const ee={...W,...me};return Fv(W,ee),ee}),K={...v,categoricalTerms:Ne};me.key!==void 0&&(w==null||w(pr(K))),x(K)},we=()=>{$.spec&&y($.spec)},Ee=()=>{!$.spec||L||b($.spec)},xe=()=>{const X=iT(p,v,{metricKeys:n,categoricalKeys:r});if(E(X.diagnostics),!X.applied)return;const me=Qd(X.draft);Av(v.numericTerms,X.draft.numericTerms,"numeric"),Av(v.categoricalTerms,X.draft.categoricalTerms,"categorical"),w==null||w(pr(X.draft)),x(X.draft),g(me),C(!1)},Re=()=>{g(P),C(!1),E(null)},ue=()=>{const X={...v,numericTerms:[...v.numericTerms,nT(n)]};w==null||w(pr(X)),x(X)},Be=X=>{const me={...v,numericTerms:v.numericTerms.filter((Ne,K)=>K!==X)};w==null||w(pr(me)),x(me)},ke=()=>{const X={...v,categoricalTerms:[...v.categoricalTerms,rT(r,S)]};w==null||w(pr(X)),x(X)},Ye=X=>{const me={...v,categoricalTerms:v.categoricalTerms.filter((Ne,K)=>K!==X)};w==null||w(pr(me)),x(me)},et=n.length>0||r.length>0;return u.jsxs("div",{className:"ui-card","data-derived-score-card":!0,children:[u.jsxs("div",{className:"ui-card-header",children:[u.jsx("div",{className:"ui-section-title",children:"Derived Score"}),u.jsxs("div",{className:"text-[11px] text-muted tabular-nums",children:["Valid: ",T," Invalid: ",H]})]}),u.jsxs("div",{className:"space-y-3",children:[u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",htmlFor:"derived-score-name",children:"Score name"}),u.jsx("input",{id:"derived-score-name","data-derived-score-name":!0,className:"ui-input w-full",value:v.name,onChange:X=>x(me=>({...me,name:X.currentTarget.value}))})]}),u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",htmlFor:"derived-score-intercept",children:"Intercept"}),u.jsx("input",{id:"derived-score-intercept","data-derived-score-intercept":!0,type:"text",inputMode:"decimal",autoComplete:"off",spellCheck:!1,className:"ui-input ui-number w-full",value:v.intercept,onChange:X=>x(me=>({...me,intercept:X.currentTarget.value}))})]}),u.jsxs("div",{className:"space-y-2",children:[u.jsxs("div",{className:"flex items-center justify-between gap-2",children:[u.jsx("div",{className:"ui-label mb-0",children:"Numeric terms"}),u.jsxs("button",{type:"button",className:"btn btn-xs btn-ghost",onClick:ue,disabled:!n.length,title:"Add numeric term",children:[u.jsx(Py,{size:12,"aria-hidden":"true"}),u.jsx("span",{children:"Add"})]})]}),v.numericTerms.length?u.jsx("div",{className:"space-y-2",children:v.numericTerms.map((X,me)=>u.jsx(NT,{index:me,term:X,candidate:X.key.trim()?z.get(X.key.trim())??{histogram:null,state:"pending"}:{histogram:null,state:"empty"},metricOptions:N,metricDisplayNames:s,presentationResetKey:d,onChange:Ne=>pe(me,Ne),onRemove:()=>Be(me)},$h(X,"numeric")))}):u.jsx("div",{className:"text-xs text-muted",children:"No numeric terms."})]}),u.jsxs("div",{className:"space-y-2",children:[u.jsxs("div",{className:"flex items-center justify-between gap-2",children:[u.jsx("div",{className:"ui-label mb-0",children:"Categorical bonuses"}),u.jsxs("button",{type:"button",className:"btn btn-xs btn-ghost",onClick:ke,disabled:!r.length,title:"Add categorical bonus",children:[u.jsx(Py,{size:12,"aria-hidden":"true"}),u.jsx("span",{children:"Add"})]})]}),v.categoricalTerms.length?u.jsx("div",{className:"space-y-2",children:v.categoricalTerms.map((X,me)=>u.jsx(RT,{index:me,term:X,candidate:{values:S.get(X.key)??[],state:X.key?re.get(X.key)??"pending":"empty"},fieldOptions:j,presentationResetKey:d,onFieldChange:Ne=>{var K;return Se(me,{key:Ne,value:((K=S.get(Ne))==null?void 0:K[0])??""})},onChange:Ne=>Se(me,Ne),onRemove:()=>Ye(me)},$h(X,"categorical")))}):u.jsx("div",{className:"text-xs text-muted",children:"No categorical bonuses."})]}),u.jsx("div",{className:"h-16 overflow-auto scrollbar-thin rounded-md border border-border/60 bg-surface-inset px-2 py-1.5 text-[12px] text-text break-words","data-derived-formula-preview":!0,tabIndex:0,title:q,children:q}),u.jsx("div",{className:"h-10 overflow-auto scrollbar-thin text-[11px] text-muted","data-derived-score-status":!0,tabIndex:0,children:et?he.length?`Unavailable inputs: ${he.join(", ")}.`:B??L??G??"Score ready.":"No score inputs in this view."}),u.jsx("div",{"data-derived-score-preview-histogram":!0,children:u.jsx(jT,{index:"score-preview",metricKey:(Y==null?void 0:Y.key)??"Derived score preview",candidate:{histogram:(Y==null?void 0:Y.histogram)??null,state:le},presentationResetKey:d})}),u.jsxs("div",{className:"flex flex-wrap items-center gap-2",children:[u.jsx("button",{type:"button",className:"btn btn-sm","data-derived-score-apply":!0,disabled:!$.spec,title:B??"Apply score",onClick:we,children:"Apply"}),u.jsx("button",{type:"button",className:"btn btn-sm btn-active","data-derived-score-rank":!0,disabled:!$.spec||!!L,title:L??"Sort by this score",onClick:Ee,children:"Sort by score"}),u.jsx("button",{type:"button",className:"btn btn-sm btn-ghost","data-derived-score-clear":!0,onClick:()=>y(null),children:"Clear"})]}),u.jsxs("div",{className:"space-y-2 border-t border-border/60 pt-3",children:[u.jsxs("div",{className:"flex items-center justify-between gap-2",children:[u.jsx("label",{className:"ui-label mb-0",htmlFor:"derived-formula-code",children:"Formula code"}),u.jsx("button",{type:"button",className:"btn btn-xs btn-ghost","data-derived-formula-use-current":!0,onClick:Re,children:"Use current"})]}),u.jsx("textarea",{id:"derived-formula-code",className:"ui-textarea font-mono h-24 w-full resize-none text-[12px]","data-derived-formula-code":!0,value:p,spellCheck:!1,onChange:X=>{g(X.currentTarget.value),C(!0),E(null)}}),u.jsx("div",{className:"flex flex-wrap items-center gap-2",children:u.jsx("button",{type:"button",className:"btn btn-sm","data-derived-formula-apply":!0,disabled:!p.trim(),onClick:xe,children:"Apply formula"})}),u.jsx("div",{className:"h-14 overflow-auto scrollbar-thin text-[11px] text-muted","data-derived-formula-diagnostics":!0,tabIndex:0,title:V??void 0,children:V})]})]})]})}function CT(e){return e==="pending"?"Loading values…":e==="error"||e==="empty"?"Enter a value":"Value"}function ET({key:e,values:t,facets:n,facetsState:r,facetFieldStates:s,populationItemsComplete:i}){const o=Object.prototype.hasOwnProperty.call((n==null?void 0:n.categoricals)??{},e);return Ic({facetDataState:o?t.length>0?"ready":"empty":"absent",localDataState:o||!i?"absent":t.length>0?"ready":"empty",queryState:Tc(s,"categoricals",e,r)})}function MT({histogram:e,populationItemsComplete:t,requiredStates:n}){return t?e?"ready":"empty":n.length===0?"empty":n.some(r=>r==="error")?"error":"pending"}function RT({index:e,term:t,candidate:n,fieldOptions:r,presentationResetKey:s,onFieldChange:i,onChange:o,onRemove:l}){const a=t.key.trim()||"Unselected field",{presentation:d,retained:f}=fa({key:a,state:n.state,value:{term:t,values:n.values}},s),h=d.value.term,m=d.value.values;return u.jsx("div",{className:"rounded-md border border-border/60 bg-surface-inset p-2","data-derived-categorical-term-slot":e,"data-facet-requested-field":a,"data-facet-presented-field":d.key,"aria-busy":f||void 0,"aria-disabled":f||void 0,ref:y=>y==null?void 0:y.toggleAttribute("inert",f),children:u.jsxs("div",{className:"flex flex-wrap items-end gap-2",children:[u.jsxs("div",{className:"flex min-w-[12rem] flex-[1_1_14rem] flex-col gap-1",children:[u.jsx("span",{className:"ui-label mb-0 text-[10px]",children:"Field"}),u.jsx("div",{"data-derived-categorical-key":e,children:u.jsx(Tn,{value:h.key,onChange:i,options:r,"aria-label":`Categorical field ${e+1}`,title:h.key||"Field",triggerClassName:"w-full min-w-0 justify-between",width:"trigger",searchable:"auto",searchPlaceholder:"Search fields...",emptyMessage:"No matching fields"})})]}),u.jsxs("label",{className:"flex min-w-[12rem] flex-[1_1_14rem] flex-col gap-1",children:[u.jsx("span",{className:"ui-label mb-0 text-[10px]",children:"Value"}),u.jsx("div",{"data-derived-categorical-value":e,"data-facet-state":d.state,"data-facet-requested-field":a,"data-facet-presented-field":d.key,children:u.jsx(Tn,{value:h.value,onChange:y=>o({value:y}),options:m.map(y=>({value:y,label:y,keywords:[y]})),"aria-label":`Categorical value ${e+1}`,title:d.state==="pending"?"Loading known values…":h.value||"Value",placeholder:CT(d.state),triggerClassName:"w-full min-w-0",panelClassName:"min-w-[12rem]",width:"trigger",editable:!0,emptyMessage:d.state==="error"?"Known values could not be loaded; enter a custom value.":"No known values; enter a custom value."})})]}),u.jsxs("label",{className:"flex w-24 flex-col gap-1",children:[u.jsx("span",{className:"ui-label mb-0 text-[10px]",children:"Bonus"}),u.jsx("input",{className:"ui-input ui-number w-full",value:h.weight,"aria-label":`Categorical weight ${e+1}`,"data-derived-categorical-weight":e,type:"text",inputMode:"decimal",autoComplete:"off",spellCheck:!1,onChange:y=>o({weight:y.currentTarget.value})})]}),u.jsx("button",{type:"button",className:"btn btn-xs btn-ghost h-8 w-8 px-0","aria-label":`Remove categorical bonus ${e+1}`,title:"Remove categorical bonus",onClick:l,children:u.jsx(bb,{size:12,"aria-hidden":"true"})})]})})}function NT({index:e,term:t,candidate:n,metricOptions:r,metricDisplayNames:s,presentationResetKey:i,onChange:o,onRemove:l}){const a=t.key.trim()||"Unselected metric",{presentation:d,retained:f}=fa({key:a,state:n.state,value:{term:t,histogram:n.histogram}},i),h=d.value.term;return u.jsxs("div",{className:"rounded-md border border-border/60 bg-surface-inset p-2","data-derived-numeric-term-slot":e,"data-facet-requested-field":a,"data-facet-presented-field":d.key,"aria-busy":f||void 0,"aria-disabled":f||void 0,ref:m=>m==null?void 0:m.toggleAttribute("inert",f),children:[u.jsxs("div",{className:"flex flex-wrap items-end gap-2",children:[u.jsxs("div",{className:"flex min-w-[14rem] flex-[1_1_16rem] flex-col gap-1",children:[u.jsx("span",{className:"ui-label mb-0 text-[10px]",children:"Metric"}),u.jsx("div",{"data-derived-numeric-key":e,children:u.jsx(Tn,{value:h.key,onChange:m=>o({key:m}),options:r,"aria-label":`Numeric metric ${e+1}`,title:h.key?ar(h.key,s):"Metric",triggerClassName:"w-full min-w-0 justify-between",width:"trigger",searchable:"auto",searchPlaceholder:"Search metrics...",emptyMessage:"No matching metrics"})})]}),u.jsxs("label",{className:"flex w-24 flex-col gap-1",children:[u.jsx("span",{className:"ui-label mb-0 text-[10px]",children:"Weight"}),u.jsx("input",{className:"ui-input ui-number w-full",value:h.weight,"aria-label":`Numeric weight ${e+1}`,"data-derived-numeric-weight":e,type:"text",inputMode:"decimal",autoComplete:"off",spellCheck:!1,onChange:m=>o({weight:m.currentTarget.value})})]}),u.jsxs("div",{className:"flex min-w-[10rem] flex-[0_0_10.5rem] flex-col gap-1",children:[u.jsx("span",{className:"ui-label mb-0 text-[10px]",children:"Missing"}),u.jsx("div",{"data-derived-numeric-missing":e,children:u.jsx(Tn,{value:h.missing,onChange:m=>o({missing:m==="zero"?"zero":"invalid"}),options:bT,"aria-label":`Numeric missing ${e+1}`,title:h.missing==="zero"?"Missing = 0":"Require value",triggerClassName:"w-full justify-between",width:"trigger"})})]}),u.jsxs("div",{className:"ml-auto flex items-center gap-1 self-end",children:[u.jsxs("button",{type:"button",className:`btn btn-xs h-8 px-2 ${h.zNormalize?"btn-active":"btn-ghost"}`,"aria-label":`Z-normalize numeric term ${e+1}`,"aria-pressed":h.zNormalize,title:"Z-normalize this metric","data-derived-numeric-znormalize":e,onClick:()=>o({zNormalize:!h.zNormalize}),children:[u.jsx($R,{size:12,"aria-hidden":"true"}),u.jsx("span",{children:"Z"})]}),u.jsx("button",{type:"button",className:"btn btn-xs btn-ghost h-8 w-8 px-0","aria-label":`Remove numeric term ${e+1}`,title:"Remove numeric term",onClick:l,children:u.jsx(bb,{size:12,"aria-hidden":"true"})})]})]}),u.jsx("div",{className:"mt-2","data-derived-numeric-histogram-slot":e,"data-facet-requested-field":a,"data-facet-presented-field":d.key,"aria-busy":f||void 0,children:u.jsx(K1,{metricKey:d.key,histogram:d.value.histogram,state:d.state})})]})}function jT({index:e,metricKey:t,candidate:n,presentationResetKey:r}){const{presentation:s,retained:i}=fa({key:t,state:n.state,value:n.histogram},r);return u.jsx("div",{className:e==="score-preview"?"":"mt-2","data-derived-numeric-histogram-slot":e,"data-facet-requested-field":t,"data-facet-presented-field":s.key,"aria-busy":i||void 0,children:u.jsx(K1,{metricKey:s.key,histogram:s.value,state:s.state})})}function _T({facets:e,facetsState:t,facetFieldStates:n,items:r,metricKeys:s,populationItemsComplete:i}){var a;const o=new Map;if(!s.length)return o;const l=i?Eo(r,s):new Map;for(const d of s){const f=Object.prototype.hasOwnProperty.call((e==null?void 0:e.metrics)??{},d),h=yp((a=e==null?void 0:e.metrics[d])==null?void 0:a.histogram),m=i?yl(Xi(l,d),32):null,y=Ic({facetDataState:f?h?"ready":"empty":"absent",localDataState:i?m?"ready":"empty":"absent",queryState:Tc(n,"metrics",d,t)});o.set(d,{histogram:f?h:m,state:y})}return o}function PT(e){if(!e)return null;const t=[];return e.errors.length&&t.push(e.errors.join(" ")),e.missingMetricKeys.length&&t.push(`Missing metrics: ${e.missingMetricKeys.join(", ")}.`),e.missingCategoricalKeys.length&&t.push(`Missing fields: ${e.missingCategoricalKeys.join(", ")}.`),e.skippedTerms.length&&t.push(`Skipped ${e.skippedTerms.length} term${e.skippedTerms.length===1?"":"s"}.`),t.length?t.join(" "):"Formula applied."}function TT(e){if(e.status==="none")return null;if(e.status==="invalid")return e.invalidReasons[0]??"Saved score definition is invalid.";if(e.status==="unavailable")return`Unavailable inputs: ${[...e.missingMetricKeys,...e.missingCategoricalKeys].sort().join(", ")||"unknown inputs"}.`;const t=e.scorePopulationCount??e.totalItems;return t!=null&&t!==e.loadedCount?`Score ready across ${t} query-filtered items.`:"Score ready."}function IT({active:e=!0,items:t,metricKeys:n,categoricalKeys:r,metricDisplayNames:s,facets:i=null,facetsState:o="settled",facetFieldStates:l,populationItemsComplete:a=!0,presentationResetKey:d="default",draftResetKey:f="default",derivedMetric:h,backendAuthoritative:m=!1,derivedRankDisabledReason:y,onApplyDerivedMetric:b,onRankByDerivedMetric:w,onFacetFieldsChange:S}){return u.jsx("div",{className:"h-full flex flex-col gap-3 p-3 overflow-auto scrollbar-thin",children:u.jsx(ST,{active:e,items:t,metricKeys:n,categoricalKeys:r,metricDisplayNames:s,facets:i,facetsState:o,facetFieldStates:l,populationItemsComplete:a,presentationResetKey:d,draftResetKey:f,derivedMetric:h,backendAuthoritative:m,rankDisabledReason:y,onApplyDerivedMetric:b,onRankByDerivedMetric:w,onFacetFieldsChange:S})})}const Dv=[5,4,3,2,1],LT=["<","<=",">",">="],zv=LT.map(e=>({value:e,label:e})),q1=250;function OT({filters:e,onChangeFilters:t}){const n=c.useMemo(()=>Jb(e),[e]),r=c.useMemo(()=>q_(e),[e]),s=c.useMemo(()=>Q_(e)??"",[e]),i=c.useMemo(()=>G_(e)??"",[e]),o=c.useMemo(()=>Y_(e)??"",[e]),l=c.useMemo(()=>X_(e)??"",[e]),a=c.useMemo(()=>J_(e)??"",[e]),d=c.useMemo(()=>Z_(e)??"",[e]),f=c.useMemo(()=>e2(e)??{},[e]),h=c.useMemo(()=>$v(f.from),[f.from]),m=c.useMemo(()=>$v(f.to),[f.to]),y=c.useMemo(()=>t2(e),[e]),b=c.useMemo(()=>n2(e),[e]),w=Bv(y),S=Bv(b),[v,x]=c.useState(null),[p,g]=c.useState(null),k=Uv(y==null?void 0:y.op,w,v),C=Uv(b==null?void 0:b.op,S,p),R=(E,N)=>{const j=new Set(n),P=new Set(r);E==="include"?j.has(N)?j.delete(N):(j.add(N),P.delete(N)):P.has(N)?P.delete(N):(P.add(N),j.delete(N));let $=xh(e,Array.from(j));$=Zb($,Array.from(P)),t($)};return u.jsxs("div",{className:"ui-card","data-attributes-card":!0,children:[u.jsx("div",{className:"ui-section-title mb-3",children:"Attributes"}),u.jsxs("div",{className:"space-y-3",children:[u.jsxs("div",{children:[u.jsx("div",{className:"ui-subsection-title mb-2",children:"Rating"}),u.jsxs("div",{className:"space-y-2",children:[u.jsxs("div",{children:[u.jsx("div",{className:"ui-label",children:"Include"}),u.jsxs("div",{className:"flex flex-wrap gap-1",children:[Dv.map(E=>{const N=n.includes(E);return u.jsxs("button",{className:`h-7 min-w-[32px] px-2 rounded-lg border text-[11px] flex items-center justify-center transition-colors ${N?"bg-accent-muted text-star-active border-border":"bg-surface text-text border-border/70 hover:bg-surface-hover"}`,onClick:()=>R("include",E),"aria-pressed":N,title:`Include ${E} star${E>1?"s":""}`,children:[E,"★"]},`stars-in-${E}`)}),u.jsx("button",{className:`h-7 min-w-[48px] px-2 rounded-lg border text-[11px] flex items-center justify-center transition-colors ${n.includes(0)?"bg-accent-muted text-star-active border-border":"bg-surface text-text border-border/70 hover:bg-surface-hover"}`,onClick:()=>R("include",0),"aria-pressed":n.includes(0),title:"Include unrated",children:"None"})]})]}),u.jsxs("div",{children:[u.jsx("div",{className:"ui-label",children:"Exclude"}),u.jsxs("div",{className:"flex flex-wrap gap-1",children:[Dv.map(E=>{const N=r.includes(E);return u.jsxs("button",{className:`h-7 min-w-[32px] px-2 rounded-lg border text-[11px] flex items-center justify-center transition-colors ${N?"bg-accent-muted text-star-active border-border":"bg-surface text-text border-border/70 hover:bg-surface-hover"}`,onClick:()=>R("exclude",E),"aria-pressed":N,title:`Exclude ${E} star${E>1?"s":""}`,children:[E,"★"]},`stars-out-${E}`)}),u.jsx("button",{className:`h-7 min-w-[48px] px-2 rounded-lg border text-[11px] flex items-center justify-center transition-colors ${r.includes(0)?"bg-accent-muted text-star-active border-border":"bg-surface text-text border-border/70 hover:bg-surface-hover"}`,onClick:()=>R("exclude",0),"aria-pressed":r.includes(0),title:"Exclude unrated",children:"None"})]})]})]})]}),u.jsxs("div",{children:[u.jsx("div",{className:"ui-subsection-title mb-2",children:"Filename"}),u.jsxs("div",{className:"grid grid-cols-1 gap-2",children:[u.jsx("div",{children:u.jsx(Mi,{label:"Filename contains",value:s,placeholder:"e.g. draft",onCommit:E=>t(e1(e,E))})}),u.jsx("div",{children:u.jsx(Mi,{label:"Filename does not contain",value:i,placeholder:"e.g. v1",onCommit:E=>t(t1(e,E))})})]})]}),u.jsxs("div",{children:[u.jsx("div",{className:"ui-subsection-title mb-2",children:"Notes"}),u.jsxs("div",{className:"grid grid-cols-1 gap-2",children:[u.jsx("div",{children:u.jsx(Mi,{label:"Notes contain",value:o,placeholder:"e.g. hero",onCommit:E=>t(n1(e,E))})}),u.jsx("div",{children:u.jsx(Mi,{label:"Notes do not contain",value:l,placeholder:"e.g. todo",onCommit:E=>t(r1(e,E))})})]})]}),u.jsxs("div",{children:[u.jsx("div",{className:"ui-subsection-title mb-2",children:"URL"}),u.jsxs("div",{className:"grid grid-cols-1 gap-2",children:[u.jsx("div",{children:u.jsx(Mi,{label:"URL contains",value:a,placeholder:"e.g. s3://bucket",onCommit:E=>t(s1(e,E))})}),u.jsx("div",{children:u.jsx(Mi,{label:"URL does not contain",value:d,placeholder:"e.g. http://",onCommit:E=>t(i1(e,E))})})]})]}),u.jsxs("div",{children:[u.jsx("div",{className:"ui-subsection-title mb-2",children:"Date Added"}),u.jsxs("div",{className:"grid grid-cols-2 gap-2",children:[u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",children:"From"}),u.jsx("input",{type:"date",className:"ui-input w-full",value:h,onChange:E=>t(bh(e,{from:E.target.value||null,to:f.to??null}))})]}),u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",children:"To"}),u.jsx("input",{type:"date",className:"ui-input w-full",value:m,onChange:E=>t(bh(e,{from:f.from??null,to:E.target.value||null}))})]})]})]}),u.jsxs("div",{children:[u.jsx("div",{className:"ui-subsection-title mb-2",children:"Dimensions"}),u.jsxs("div",{className:"grid grid-cols-1 gap-2",children:[u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",children:"Width"}),u.jsxs("div",{className:"flex gap-2",children:[u.jsx("div",{className:"w-16 shrink-0","data-dimension-operator":"width",children:u.jsx(Tn,{value:k,onChange:E=>{const N=E;y?(t(uu(e,{op:N,value:y.value})),x(null)):x({filterIdentity:w,value:N})},options:zv,"aria-label":"Width operator",title:`Width ${k}`,triggerClassName:"w-16 justify-between px-2",width:"trigger"})}),u.jsx("input",{type:"number","aria-label":"Width pixels",className:"ui-input ui-number w-full",value:y?String(y.value):"",min:0,placeholder:"px",onChange:E=>{const N=E.target.value;if(!N){x(null),t(uu(e,null));return}const j=Number(N);Number.isFinite(j)&&(x(null),t(uu(e,{op:k,value:j})))}})]})]}),u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",children:"Height"}),u.jsxs("div",{className:"flex gap-2",children:[u.jsx("div",{className:"w-16 shrink-0","data-dimension-operator":"height",children:u.jsx(Tn,{value:C,onChange:E=>{const N=E;b?(t(cu(e,{op:N,value:b.value})),g(null)):g({filterIdentity:S,value:N})},options:zv,"aria-label":"Height operator",title:`Height ${C}`,triggerClassName:"w-16 justify-between px-2",width:"trigger"})}),u.jsx("input",{type:"number","aria-label":"Height pixels",className:"ui-input ui-number w-full",value:b?String(b.value):"",min:0,placeholder:"px",onChange:E=>{const N=E.target.value;if(!N){g(null),t(cu(e,null));return}const j=Number(N);Number.isFinite(j)&&(g(null),t(cu(e,{op:C,value:j})))}})]})]})]})]})]})]})}function $v(e){return e?e.length>=10?e.slice(0,10):e:""}function Bv(e){return e?`${e.op}:${e.value}`:"none"}function Uv(e,t,n){return(n==null?void 0:n.filterIdentity)===t?n.value:e??">="}function FT(e,t,n){return e!==null&&e!==t&&n(e),null}function Mi({label:e,value:t,placeholder:n,onCommit:r}){const[s,i]=c.useState(null),o=c.useRef(r);o.current=r;const l=s??t,a=c.useCallback(()=>{const d=FT(s,t,o.current);d!==s&&i(d)},[s,t]);return c.useEffect(()=>{if(!(s===null||s===t))return AT(a,q1)},[s,a,t]),u.jsxs("label",{className:"block",children:[u.jsx("span",{className:"ui-label",children:e.replace(/^(Filename|Notes|URL) /,"")}),u.jsxs("div",{className:"flex gap-1",children:[u.jsx("input",{className:"ui-input min-w-0 flex-1","aria-label":e,value:l,placeholder:n,onChange:d=>i(d.currentTarget.value),onBlur:()=>{a(),i(null)},onKeyDown:d=>{d.key==="Enter"&&(d.preventDefault(),a())}}),u.jsx("button",{type:"button",className:"btn btn-sm btn-ghost px-2 text-[11px]",disabled:s===null||s===t,onClick:a,"aria-label":`Apply ${e}`,children:"Apply"})]})]})}function AT(e,t=q1){const n=globalThis.setTimeout(e,Math.max(0,t));return()=>globalThis.clearTimeout(n)}const DT=[];function Hv(e,t,n,r){const s=new Map;for(const i of r){const o=new Map;wl(o,i,e,"populationCount"),o.size&&(wl(o,i,t,"filteredCount"),n!=null&&n.length&&wl(o,i,n,"selectedCount"),s.set(i,Array.from(o.values()).sort(Q1)))}return s}function zT(e,t,n,r,s){const i=new Map;for(const o of r){const l=e.categoricals[o];if(!(l!=null&&l.values.length))continue;const a=new Map;for(const d of l.values){const f=d.value.trim();f&&a.set(f,{value:f,populationCount:d.population_count,filteredCount:0,selectedCount:0})}s&&wl(a,o,t,"filteredCount"),n!=null&&n.length&&wl(a,o,n,"selectedCount"),i.set(o,Array.from(a.values()).sort(Q1))}return i}function Kv(e,t){return e.get(t)??DT}function wl(e,t,n,r){var s;for(const i of n){const o=(s=i.categoricals)==null?void 0:s[t],l=o==null?void 0:o.trim();if(!l)continue;let a=e.get(l);a||(a={value:l,populationCount:0,filteredCount:0,selectedCount:0},e.set(l,a)),a[r]+=1}}function Q1(e,t){return t.populationCount!==e.populationCount?t.populationCount-e.populationCount:e.value.localeCompare(t.value)}const $T={metric:{showAll:!1,batch:{resetKey:null,schemaKey:null,schemaRevision:null,keys:[]}},categorical:{showAll:!1,selectedKey:null,batch:{resetKey:null,schemaKey:null,schemaRevision:null,keys:[]}}};function BT(e,t,n=24){if(!t.length)return[];const r=Math.max(1,Math.floor(n)),s=new Set(t.map(i=>Math.floor(i/r)*r));return Array.from(s).sort((i,o)=>i-o).flatMap(i=>e.slice(i,i+r))}function UT(e,t=24){return e.slice(0,Math.max(1,Math.floor(t)))}function li(e){return JSON.stringify(e)}function Vv(e,t,n,r=24){return n&&t.length>0&&t.every(s=>e.includes(s))?[...t]:UT(e,r)}function HT(e,t,n,r,s={metric:0,categorical:0}){const i=e.categorical.selectedKey;return{metric:{showAll:e.metric.showAll,schemaRevision:s.metric,visibleKeys:Vv(n,e.metric.batch.keys,e.metric.batch.resetKey===t&&e.metric.batch.schemaKey===li(n)&&e.metric.batch.schemaRevision===s.metric)},categorical:{showAll:e.categorical.showAll,schemaRevision:s.categorical,selectedKey:i&&r.includes(i)?i:r[0]??null,visibleKeys:Vv(r,e.categorical.batch.keys,e.categorical.batch.resetKey===t&&e.categorical.batch.schemaKey===li(r)&&e.categorical.batch.schemaRevision===s.categorical)}}}function G1(e,t,n,r){const s=t&&n.includes(t)?t:n[0],i=e.categorical.selectedKey&&r.includes(e.categorical.selectedKey)?e.categorical.selectedKey:r[0];return{metric_keys:e.metric.showAll?e.metric.visibleKeys:s?[s]:[],categorical_keys:e.categorical.showAll?e.categorical.visibleKeys:i?[i]:[]}}function KT(e,t,n){if(t.type==="select-categorical")return e.categorical.selectedKey===t.key?e:{...e,categorical:{...e.categorical,selectedKey:t.key}};if(t.type==="set-show-all")return e[t.kind].showAll===t.showAll?e:t.kind==="metric"?{...e,metric:{...e.metric,showAll:t.showAll}}:{...e,categorical:{...e.categorical,showAll:t.showAll}};const r=e[t.kind].batch;return r.resetKey===n&&r.schemaKey===t.schemaKey&&r.schemaRevision===t.schemaRevision&&VT(r.keys,t.keys)?e:t.kind==="metric"?{...e,metric:{...e.metric,batch:{resetKey:n,schemaKey:t.schemaKey,schemaRevision:t.schemaRevision,keys:[...t.keys]}}}:{...e,categorical:{...e.categorical,batch:{resetKey:n,schemaKey:t.schemaKey,schemaRevision:t.schemaRevision,keys:[...t.keys]}}}}function VT(e,t){return e.length===t.length&&e.every((n,r)=>n===t[r])}function WT({categoricalKey:e,buckets:t,filters:n,onChangeValues:r,showTitle:s=!1,showFilteredCounts:i=!0,state:o="ready"}){const l=s2(n,e),a=new Set(l),d=t.reduce((b,w)=>b+w.populationCount,0),f=t.reduce((b,w)=>b+w.filteredCount,0),h=t.reduce((b,w)=>b+w.selectedCount,0),m=t.length?"ready":o==="ready"?"empty":o,y=b=>{const w=new Set(a);w.has(b)?w.delete(b):w.add(b),r(e,w.size?Array.from(w):null)};return u.jsxs("div",{className:"ui-card flex h-96 flex-col","data-categorical-card":e,"data-facet-state":m,children:[s&&u.jsx("div",{className:"ui-section-title mb-2",children:e}),u.jsxs("div",{className:"flex h-4 shrink-0 items-center justify-between gap-2 text-[11px] text-muted mb-2 tabular-nums whitespace-nowrap",children:[u.jsxs("div",{className:"flex min-w-0 items-center gap-2 overflow-hidden",children:[u.jsxs("span",{"data-count-role":"population",children:["Population: ",m==="ready"?d:"—"]}),u.jsxs("span",{"data-count-role":"filtered",children:["Filtered: ",i&&m==="ready"?f:"—"]})]}),u.jsxs("div",{className:"flex shrink-0 items-center gap-2",children:[u.jsxs("span",{className:"w-20 truncate text-right text-text",title:`Selected: ${h}`,"data-count-role":"selected",children:["Selected: ",h]}),u.jsx("span",{className:"w-20 text-right","data-count-role":"values",children:m==="ready"?`${t.length} value${t.length===1?"":"s"}`:"— values"})]})]}),u.jsx("div",{className:"h-64 shrink-0 overflow-auto scrollbar-thin pr-1","data-facet-body":!0,children:m==="ready"?u.jsx("div",{className:"space-y-1",children:t.map(b=>{const w=a.has(b.value);return u.jsx("button",{type:"button",className:`w-full min-w-0 rounded-md border px-2 py-1.5 text-left text-[12px] transition-colors ${w?"border-accent/70 bg-accent/20 text-text":"border-border/60 bg-surface hover:border-border hover:bg-surface-hover"}`,title:b.value,"aria-pressed":w,onClick:()=>y(b.value),children:u.jsxs("span",{className:"flex items-center justify-between gap-2 min-w-0",children:[u.jsx("span",{className:"truncate",children:b.value}),u.jsxs("span",{className:"flex w-32 shrink-0 items-center justify-end text-[11px] text-muted tabular-nums","aria-label":`Selected ${b.selectedCount}; filtered ${i?b.filteredCount:"not active"}; population ${b.populationCount}`,title:`Selected: ${b.selectedCount}; Filtered: ${i?b.filteredCount:"—"}; Population: ${b.populationCount}`,children:[u.jsx("span",{className:"w-12 text-right","data-count-role":"row-selected",children:b.selectedCount>0?`${b.selectedCount} sel`:"—"}),u.jsx("span",{className:"w-4 text-center","aria-hidden":"true",children:"·"}),u.jsxs("span",{className:"w-16 text-right","data-count-role":"row-filtered-population",children:[i?b.filteredCount:"—","/",b.populationCount]})]})]})},b.value)})}):u.jsx("div",{className:"flex h-full items-center justify-center px-3 text-center text-sm text-muted",role:"status",children:qT(m,"field")})}),u.jsx("button",{className:`btn btn-xs btn-ghost text-muted hover:text-text mt-auto self-start ${l.length?"":"invisible"}`,onClick:()=>r(e,null),disabled:!l.length,"aria-hidden":!l.length,"data-card-action":"clear",children:"Clear"})]})}function qT(e,t){return e==="pending"?`Loading values for this ${t}…`:e==="error"?`Could not load values for this ${t}.`:`No values found for this ${t}.`}function Y1({keys:e,estimateSize:t,kind:n,schemaRevision:r,active:s=!0,onVisibleKeysChange:i,renderCard:o}){const l=c.useRef(null),a=li(e),[d,f]=c.useState(()=>({schemaKey:a,schemaRevision:r,indices:hu(0,t,e.length,t)})),h=d.schemaKey===a&&d.schemaRevision===r,m=c.useMemo(()=>GT(d.schemaKey,d.schemaRevision,d.indices,a,r,e.length,t),[t,e.length,d.indices,d.schemaKey,d.schemaRevision,a,r]);vp(()=>{!h&&l.current&&(l.current.scrollTop=0)});const y=t+12,b=e.length?e.length*y-12:0,w=s?m.map(p=>e[p]):[],S=p=>{jo.flushSync(()=>{const g=BT(e,p);g.length&&(i==null||i(g)),f(k=>k.schemaKey===a&&k.schemaRevision===r&&k.indices.length===p.length&&k.indices.every((C,R)=>C===p[R])?k:{schemaKey:a,schemaRevision:r,indices:[...p]})})},v=p=>{s&&S(hu(p.currentTarget.scrollTop,p.currentTarget.clientHeight,e.length,t))},x=p=>{var j,P,$;if(p.target!==p.currentTarget)return;const g=((j=l.current)==null?void 0:j.scrollTop)??0,k=Math.min(e.length-1,Math.max(0,Math.floor(g/y))),C=Math.max(1,Math.floor((((P=l.current)==null?void 0:P.clientHeight)??t)/t)),R=QT(p.key,k,e.length,C);if(R==null)return;p.preventDefault();const E=(($=l.current)==null?void 0:$.clientHeight)??t,N=p.key==="End"?Math.max(0,(R+1)*y-E):R*y;S(hu(N,E,e.length,t)),l.current&&(l.current.scrollTop=N)};return u.jsx("div",{ref:l,className:"h-[min(55vh,36rem)] shrink-0 overflow-auto scrollbar-thin","data-virtual-field-list":n,"data-rendered-field-keys":JSON.stringify(w),role:"region","aria-label":`All ${n} fields`,tabIndex:0,onKeyDown:x,onScroll:v,children:u.jsx("div",{className:"relative w-full",style:{height:`${b}px`},children:s&&m.map(p=>{const g=e[p];return u.jsx("div",{"data-index":p,"data-virtual-field-card":n,"data-field-key":g,className:"absolute left-0 top-0 w-full",style:{transform:`translateY(${p*y}px)`},children:o(g)},g)})})})}function QT(e,t,n,r){if(n<=0)return null;const s=n-1;return e==="Home"?0:e==="End"?s:e==="ArrowDown"?Math.min(s,t+1):e==="ArrowUp"?Math.max(0,t-1):e==="PageDown"?Math.min(s,t+Math.max(1,r)):e==="PageUp"?Math.max(0,t-Math.max(1,r)):null}function hu(e,t,n,r,s=4){if(n<=0)return[];const i=r+12,o=Math.max(0,Math.floor(e/i)-s),l=e+Math.max(t,r),a=Math.min(n-1,Math.ceil(l/i)+s);return Array.from({length:a-o+1},(d,f)=>o+f)}function GT(e,t,n,r,s,i,o){const l=e===r&&t===s?n.filter(a=>a<i):[];return l.length?l:hu(0,o,i,o)}function YT({active:e=!0,items:t,filteredItems:n,categoricalKeys:r,facets:s=null,facetsState:i="settled",facetFieldStates:o,populationItemsComplete:l=!0,filteredItemsComplete:a=!0,selectedItems:d,filters:f,demand:h,presentationResetKey:m="default",onChangeValues:y,onDemandAction:b}){const w=h.selectedKey&&r.includes(h.selectedKey)?h.selectedKey:r[0],S=c.useMemo(()=>e?h.showAll?h.visibleKeys:w?[w]:[]:[],[e,w,h.showAll,h.visibleKeys]),v=c.useMemo(()=>e?s?zT(s,n,d,S,a):l?Hv(t,n,d,S):new Map:new Map,[e,s,n,a,t,l,d,S]),x=c.useMemo(()=>e&&l?Hv(t,n,d,S):new Map,[e,n,t,l,S,d]),p=c.useMemo(()=>r.map(V=>({value:V,label:V,keywords:[V]})),[r]),g=c.useCallback(V=>{if(!e)return{state:"pending",value:{buckets:[],showFilteredCounts:!1}};const A=Object.prototype.hasOwnProperty.call((s==null?void 0:s.categoricals)??{},V),Z=Kv(v,V),D=Kv(x,V);return{state:Ic({facetDataState:A?Z.length>0?"ready":"empty":"absent",localDataState:l?D.length>0?"ready":"empty":"absent",queryState:Tc(o,"categoricals",V,i)}),value:{buckets:A?Z:D,showFilteredCounts:a}}},[e,v,o,s,i,a,x,l]),k=c.useMemo(()=>{const V=w??"",A=V?g(V):{state:"empty",value:{buckets:[],showFilteredCounts:!1}};return{key:V,...A}},[w,g]),{presentation:C,retained:R}=fa(k,m),E=c.useMemo(()=>Array.from(new Set([...S,...w?[w]:[]])),[w,S]),N=c.useMemo(()=>E.map(V=>({key:V,...g(V)})),[E,g]),j=W1(N,r,m),P=c.useCallback(V=>{V.length&&b({type:"set-visible-keys",kind:"categorical",schemaKey:li(r),schemaRevision:h.schemaRevision,keys:V})},[r,h.schemaRevision,b]);if(!r.length)return null;const $=(V,A=!1,Z=g(V),D=!1,z=D?w:V)=>u.jsx("div",{"aria-busy":D||void 0,"aria-disabled":D||void 0,"data-facet-requested-field":z,"data-facet-presented-field":V,ref:B=>{D?B==null||B.setAttribute("inert",""):B==null||B.removeAttribute("inert")},children:u.jsx(WT,{categoricalKey:V,buckets:Z.value.buckets,filters:f,onChangeValues:y,showTitle:A,showFilteredCounts:Z.value.showFilteredCounts,state:Z.state})}),U=V=>{b({type:"select-categorical",key:V})},q=()=>{b({type:"set-show-all",kind:"categorical",showAll:!h.showAll})};return u.jsxs(u.Fragment,{children:[u.jsxs("div",{children:[u.jsxs("div",{className:"flex items-center justify-between gap-2",children:[u.jsx("label",{className:"ui-label",children:"Categorical"}),u.jsx("button",{className:"btn btn-sm btn-ghost text-[11px]",onClick:q,"aria-pressed":h.showAll,"data-categorical-show-all":!0,children:h.showAll?"Show one":"Show all"})]}),h.showAll?u.jsx("div",{className:"ui-input ui-input-readonly w-full flex items-center text-xs",children:"All categoricals"}):u.jsx("div",{"data-categorical-selector":!0,"data-facet-requested-field":w??"","data-facet-presented-field":C.key,"aria-busy":R||void 0,children:u.jsx(Tn,{value:C.key,onChange:U,options:p,"aria-label":"Categorical",title:C.key||"Categorical",triggerClassName:"w-full justify-between",width:"trigger",searchable:"auto",searchPlaceholder:"Search fields...",emptyMessage:"No matching fields"})})]}),u.jsx("div",{hidden:!h.showAll,"aria-hidden":!h.showAll||void 0,ref:V=>V==null?void 0:V.toggleAttribute("inert",!h.showAll),children:u.jsx(Y1,{keys:r,estimateSize:384,kind:"categorical",schemaRevision:h.schemaRevision,active:e&&h.showAll,onVisibleKeysChange:P,renderCard:V=>{const A=j.get(V);return $(V,!0,A?{state:A.presentation.state,value:A.presentation.value}:g(V),(A==null?void 0:A.retained)??!1,V)}},m)}),!h.showAll&&(C.key?$(C.key,!1,{state:C.state,value:C.value},R):u.jsx("div",{className:"text-sm text-muted",children:"No values found for this field."}))]})}function XT({metricKey:e,metricLabel:t,categories:n,filters:r,onChangeRange:s,showTitle:i=!1,showFilteredCounts:o=!0,state:l="ready",embedded:a=!1}){const d=o1(r,e),f=n.reduce((w,S)=>w+S.populationCount,0),h=n.reduce((w,S)=>w+S.filteredCount,0),m=n.reduce((w,S)=>w+S.selectedCount,0),y=t??e,b=n.length?"ready":l==="ready"?"empty":l;return u.jsxs("div",{className:a?"flex h-full flex-col":"ui-card flex h-96 flex-col","data-metric-category-card":e,"data-facet-state":b,children:[i&&u.jsx("div",{className:"ui-section-title mb-2",children:y}),u.jsxs("div",{className:"flex h-4 shrink-0 items-center justify-between gap-2 text-[11px] text-muted mb-2 tabular-nums whitespace-nowrap",children:[u.jsxs("div",{className:"flex min-w-0 items-center gap-2 overflow-hidden",children:[u.jsxs("span",{"data-count-role":"population",children:["Population: ",b==="ready"?f:"—"]}),u.jsxs("span",{"data-count-role":"filtered",children:["Filtered: ",o&&b==="ready"?h:"—"]})]}),u.jsxs("div",{className:"flex shrink-0 items-center gap-2",children:[u.jsxs("span",{className:"w-20 truncate text-right text-text",title:`Selected: ${m}`,"data-count-role":"selected",children:["Selected: ",m]}),u.jsx("span",{className:"w-20 text-right","data-count-role":"classes",children:b==="ready"?`${n.length} class${n.length===1?"":"es"}`:"— classes"})]})]}),u.jsx("div",{className:"h-64 shrink-0 overflow-auto scrollbar-thin pr-1","data-facet-body":!0,children:b==="ready"?u.jsx("div",{className:"space-y-1",children:n.map(w=>{const S=d?JT(w.code,d):!1,v=d?ZT(w.code,d):!1;return u.jsx("button",{type:"button",className:`w-full min-w-0 rounded-md border px-2 py-1.5 text-left text-[12px] transition-colors ${S?"border-accent/70 bg-accent/20 text-text":"border-border/60 bg-surface hover:border-border hover:bg-surface-hover"}`,title:w.label,"aria-pressed":S,onClick:()=>s(e,v?null:{min:w.code,max:w.code}),children:u.jsxs("span",{className:"flex items-center justify-between gap-2 min-w-0",children:[u.jsx("span",{className:"truncate",children:w.label}),u.jsxs("span",{className:"flex w-32 shrink-0 items-center justify-end text-[11px] text-muted tabular-nums","aria-label":`Selected ${w.selectedCount}; filtered ${o?w.filteredCount:"not active"}; population ${w.populationCount}`,title:`Selected: ${w.selectedCount}; Filtered: ${o?w.filteredCount:"—"}; Population: ${w.populationCount}`,children:[u.jsx("span",{className:"w-12 text-right","data-count-role":"row-selected",children:w.selectedCount>0?`${w.selectedCount} sel`:"—"}),u.jsx("span",{className:"w-4 text-center","aria-hidden":"true",children:"·"}),u.jsxs("span",{className:"w-16 text-right","data-count-role":"row-filtered-population",children:[o?w.filteredCount:"—","/",w.populationCount]})]})]})},`${w.code}:${w.label}`)})}):u.jsx("div",{className:"flex h-full items-center justify-center px-3 text-center text-sm text-muted",role:"status",children:b==="pending"?"Loading values for this metric…":b==="error"?"Could not load values for this metric.":"No values found for this metric."})}),u.jsx("button",{className:`btn btn-xs btn-ghost text-muted hover:text-text mt-auto self-start ${d?"":"invisible"}`,onClick:()=>s(e,null),disabled:!d,"aria-hidden":!d,"data-card-action":"clear",children:"Clear"})]})}function JT(e,t){return e>=t.min&&e<=t.max}function ZT(e,t){return e===t.min&&e===t.max}function eI(e,t,n){const r=gp((e-t.left)/t.width);return n.min+(n.max-n.min)*r}function tI(e,t,n=4){return e==null?!1:Math.abs(t-e)>=n}function X1(e,t){return H1(e??t,t)}function nI(e,t,n,r){return e&&t!=null?{commitRange:X1(n,t),shouldClear:!1}:{commitRange:null,shouldClear:r!=null}}function rI({metricKey:e,domain:t,activeRange:n,onChangeRange:r}){const[s,i]=c.useState(null),[o,l]=c.useState(!1),a=c.useRef(null),d=c.useRef(null),f=c.useRef(!1),h=c.useRef(null),[m,y]=c.useState(null),b=s??n;c.useEffect(()=>{y(null)},[e,t==null?void 0:t.min,t==null?void 0:t.max]);const w=p=>{var k;if(!t)return null;const g=(k=h.current)==null?void 0:k.getBoundingClientRect();return g?eI(p,{left:g.left,width:g.width},t):null};return{svgRef:h,hoverValue:m,displayRange:b,onPointerDown:p=>{var k;if(!t)return;p.preventDefault();const g=w(p.clientX);g!=null&&(l(!0),i(null),a.current=g,d.current=p.clientX,f.current=!1,y(g),(k=h.current)==null||k.setPointerCapture(p.pointerId))},onPointerMove:p=>{const g=w(p.clientX);if(g==null){o||y(null);return}y(g),o&&(!f.current&&!tI(d.current,p.clientX)||(f.current=!0,i(X1(a.current,g))))},onPointerUp:p=>{var C;if(!o)return;l(!1),(C=h.current)==null||C.releasePointerCapture(p.pointerId);const g=w(p.clientX),k=nI(f.current,g,a.current,n);k.commitRange?(y(g),r(k.commitRange)):k.shouldClear&&r(null),a.current=null,d.current=null,f.current=!1,setTimeout(()=>i(null),0)},onPointerLeave:()=>y(null)}}const zs=40;function sI({metricKey:e,metricLabel:t,populationValues:n,filteredValues:r,populationHistogram:s,selectedValues:i=[],filters:o,onChangeRange:l,showTitle:a=!1,showFilteredCounts:d=!0,state:f="ready",embedded:h=!1}){const m=c.useMemo(()=>s??yl(n,zs),[s,n]),y=c.useMemo(()=>d&&m?yl(r,zs,m):null,[r,m,d]),b=o1(o,e),w=m?{min:m.min,max:m.max}:null,{svgRef:S,hoverValue:v,displayRange:x,onPointerDown:p,onPointerMove:g,onPointerUp:k,onPointerLeave:C}=rI({metricKey:e,domain:w,activeRange:b,onChangeRange:F=>l(e,F)}),[R,E]=c.useState(null),[N,j]=c.useState(null),P=i.length===1?i[0]:null,$=t??e,U=c.useMemo(()=>!m||i.length<2?null:yl(i,zs,m),[i,m]),q=m&&w?"ready":f==="ready"?"empty":f,V=Wv(b==null?void 0:b.min,w==null?void 0:w.min),A=Wv(b==null?void 0:b.max,w==null?void 0:w.max),Z=R??V,D=N??A,z=(F,T)=>{if(!w)return;const H=Pv(F),G=Pv(T);if(!H.valid||!G.valid){H.valid||E(V),G.valid||j(A);return}if(H.value==null&&G.value==null){l(e,null);return}const Y=H.value??w.min,re=G.value??w.max,le=Tv(Y,w.min,w.max),he=Tv(re,w.min,w.max),pe=H1(le,he);if(Vl(pe.min,w.min)&&Vl(pe.max,w.max)){l(e,null);return}l(e,pe)};i.length;const B=m?Math.max(1,...m.bins):1,O=w?iI(x,w,v):{text:"",emphasized:!1},L=i.length===1?`Selected: ${qn(i[0])}`:`Selected: ${i.length}`;return u.jsxs("div",{className:h?"flex h-full flex-col":"ui-card flex h-96 flex-col","data-metric-histogram-card":e,"data-facet-state":q,children:[a&&u.jsx("div",{className:"ui-section-title mb-2",children:$}),u.jsxs("div",{className:"flex h-4 shrink-0 items-center justify-between gap-2 text-[11px] text-muted mb-2 tabular-nums whitespace-nowrap",children:[u.jsxs("div",{className:"flex min-w-0 items-center gap-2 overflow-hidden",children:[u.jsxs("span",{"data-count-role":"population",children:["Population: ",q==="ready"?m==null?void 0:m.count:"—"]}),u.jsxs("span",{"data-count-role":"filtered",children:["Filtered: ",d&&q==="ready"?(y==null?void 0:y.count)??0:"—"]})]}),u.jsx("span",{className:"w-28 shrink-0 truncate text-right text-text",title:L,"data-count-role":"selected",children:L})]}),q==="ready"&&m&&w?u.jsxs("svg",{ref:S,viewBox:`0 0 ${zs} 100`,preserveAspectRatio:"none",className:"w-full h-28 shrink-0 cursor-crosshair rounded-md bg-surface-inset",onPointerDown:p,onPointerMove:g,onPointerUp:k,onPointerLeave:C,children:[Gd(m.bins,"#2e3a4b",{scaleMax:B}),d&&y&&Gd(y.bins,"#3a8fff",{scaleMax:B}),U&&Gd(U.bins,"#f59e0b",{opacity:.55,scaleMax:B}),x&&oI(x,w),P!=null&&qv(P,w,{color:"var(--highlight)",strokeWidth:.7}),v!=null&&qv(v,w,{color:"rgba(255,255,255,0.75)",strokeWidth:.5,dashed:!0})]}):u.jsx("div",{className:"flex h-28 shrink-0 items-center justify-center rounded-md bg-surface-inset px-3 text-center text-sm text-muted",role:"status",children:q==="pending"?"Loading values for this metric…":q==="error"?"Could not load values for this metric.":"No values found for this metric."}),u.jsxs("div",{className:"flex h-4 items-center justify-between gap-2 text-[11px] text-muted mt-2 tabular-nums whitespace-nowrap","data-histogram-footer":!0,children:[u.jsx("span",{className:"w-12 shrink-0",children:w?qn(w.min):""}),u.jsx("span",{className:`min-w-0 flex-1 truncate text-center ${O.emphasized?"text-text":""}`,title:O.text,"aria-label":O.text,children:O.text}),u.jsx("span",{className:"w-12 shrink-0 text-right",children:w?qn(w.max):""})]}),u.jsxs("div",{className:"grid grid-cols-2 gap-2 mt-auto items-end",children:[u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",children:"Min"}),u.jsx("input",{type:"number","aria-label":`${$} minimum`,step:"any",className:"ui-input ui-number w-full",value:Z,placeholder:w?zh(w.min):"",disabled:!w,onBlur:()=>{R!==null&&z(R,D),E(null)},onChange:F=>E(F.target.value),onKeyDown:F=>{F.key==="Enter"&&F.currentTarget.blur()}})]}),u.jsxs("div",{children:[u.jsx("label",{className:"ui-label",children:"Max"}),u.jsx("input",{type:"number","aria-label":`${$} maximum`,step:"any",className:"ui-input ui-number w-full",value:D,placeholder:w?zh(w.max):"",disabled:!w,onBlur:()=>{N!==null&&z(Z,N),j(null)},onChange:F=>j(F.target.value),onKeyDown:F=>{F.key==="Enter"&&F.currentTarget.blur()}})]}),u.jsx("button",{className:`btn btn-xs btn-ghost text-muted hover:text-text col-span-2 justify-self-start ${b?"":"invisible"}`,onClick:()=>l(e,null),disabled:!b,"aria-hidden":!b,"data-card-action":"clear",children:"Clear"})]})]})}function Wv(e,t){return e==null||t!=null&&Vl(e,t)?"":zh(e)}function iI(e,t,n){if(!e)return n==null?{text:"Drag to filter",emphasized:!1}:{text:`Cursor: ${qn(n)}`,emphasized:!0};const r=Vl(e.min,t.min)?`≤ ${qn(e.max)}`:Vl(e.max,t.max)?`≥ ${qn(e.min)}`:`${qn(e.min)} – ${qn(e.max)}`;return{text:n==null?r:`${r} · Cursor: ${qn(n)}`,emphasized:!0}}function Gd(e,t,n){const r=n.opacity??.9;return pT(e,n.scaleMax).map((i,o)=>u.jsx("rect",{x:o+.05,y:100-i,width:.9,height:i,fill:t,opacity:r},`${t}-${o}`))}function oI(e,t){const n=(e.min-t.min)/(t.max-t.min),r=(e.max-t.min)/(t.max-t.min),s=zs*gp(Math.min(n,r)),i=zs*Math.abs(r-n);return u.jsx("rect",{x:s,y:0,width:Math.max(.5,i),height:100,fill:"rgba(255,255,255,0.08)",stroke:"rgba(255,255,255,0.4)",strokeWidth:.4})}function qv(e,t,n){const r=gp((e-t.min)/(t.max-t.min)),s=zs*r;return u.jsx("line",{x1:s,y1:0,x2:s,y2:100,stroke:n.color,strokeWidth:n.strokeWidth??.5,strokeDasharray:n.dashed?"1.2 1.2":void 0,opacity:.95,vectorEffect:"non-scaling-stroke"})}const Yd=new Map;function lI({active:e=!0,items:t,filteredItems:n,metricKeys:r,metricDisplayNames:s,facets:i=null,facetsState:o="settled",facetFieldStates:l,populationItemsComplete:a=!0,filteredItemsComplete:d=!0,selectedItems:f,selectedValuesByKey:h,selectedMetric:m,demand:y,presentationResetKey:b="default",onSelectMetric:w,filters:S,onChangeRange:v,onDemandAction:x}){const p=m&&r.includes(m)?m:r[0],g=c.useMemo(()=>e?y.showAll?y.visibleKeys:p?[p]:[]:[],[e,p,y.showAll,y.visibleKeys]),k=c.useMemo(()=>e&&a?Eo(t,g):Yd,[e,t,a,g]),C=c.useMemo(()=>e?Eo(n,g):Yd,[e,n,g]),R=c.useMemo(()=>e?i?wT(i,n,f,g,d):a?Iv(t,n,f,g):new Map:new Map,[e,i,n,d,t,a,f,g]),E=c.useMemo(()=>e&&a?Iv(t,n,f,g):new Map,[e,n,t,a,g,f]),N=h??Yd,j=c.useMemo(()=>r.map(L=>({value:L,label:ar(L,s),keywords:[L]})),[s,r]),P=c.useCallback(L=>{if(!e)return{state:"pending",value:{categories:[],filteredValues:[],label:ar(L,s),populationHistogram:null,populationValues:[],selectedValues:[],showFilteredCounts:!1}};const F=(i==null?void 0:i.metrics[L])??null,T=Object.prototype.hasOwnProperty.call((i==null?void 0:i.metrics)??{},L),H=Lv(R,L),G=Lv(E,L),Y=T?H:G,re=yp(F==null?void 0:F.histogram),le=Xi(k,L);return{state:Ic({facetDataState:T?H.length>0||re!==null?"ready":"empty":"absent",localDataState:a?G.length>0||le.length>0?"ready":"empty":"absent",queryState:Tc(l,"metrics",L,o)}),value:{categories:Y,filteredValues:d?Xi(C,L):[],label:ar(L,s),populationHistogram:re,populationValues:T?[]:le,selectedValues:Xi(N,L),showFilteredCounts:d}}},[e,R,l,i,o,d,C,E,s,a,k,N]),$=c.useMemo(()=>{const L=p??"",F=L?P(L):{state:"empty",value:{categories:[],filteredValues:[],label:"",populationHistogram:null,populationValues:[],selectedValues:[],showFilteredCounts:!1}};return{key:L,...F}},[p,P]),{presentation:U,retained:q}=fa($,b),V=c.useMemo(()=>Array.from(new Set([...g,...p?[p]:[]])),[p,g]),A=c.useMemo(()=>V.map(L=>({key:L,...P(L)})),[V,P]),Z=W1(A,r,b),D=c.useCallback(L=>{L.length&&x({type:"set-visible-keys",kind:"metric",schemaKey:li(r),schemaRevision:y.schemaRevision,keys:L})},[y.schemaRevision,r,x]),z=(L,F=!1,T=P(L),H=!1,G=H?p:L)=>u.jsx("div",{className:"ui-card h-96","data-metric-card-host":L,"data-facet-state":T.state,"data-facet-requested-field":G,"data-facet-presented-field":L,"aria-busy":H||void 0,"aria-disabled":H||void 0,ref:Y=>{H?Y==null||Y.setAttribute("inert",""):Y==null||Y.removeAttribute("inert")},children:T.value.categories.length?u.jsx(XT,{metricKey:L,metricLabel:T.value.label,categories:T.value.categories,filters:S,onChangeRange:v,showTitle:F,showFilteredCounts:T.value.showFilteredCounts,state:T.state,embedded:!0},L):u.jsx(sI,{metricKey:L,metricLabel:T.value.label,populationValues:T.value.populationValues,filteredValues:T.value.filteredValues,populationHistogram:T.value.populationHistogram,selectedValues:T.value.selectedValues,filters:S,onChangeRange:v,showTitle:F,showFilteredCounts:T.value.showFilteredCounts,state:T.state,embedded:!0},L)}),B=L=>{w(L)},O=()=>{x({type:"set-show-all",kind:"metric",showAll:!y.showAll})};return u.jsxs(u.Fragment,{children:[u.jsxs("div",{children:[u.jsxs("div",{className:"flex items-center justify-between gap-2",children:[u.jsx("label",{className:"ui-label",children:"Metric"}),u.jsx("button",{className:"btn btn-sm btn-ghost text-[11px]",onClick:O,"aria-pressed":y.showAll,"data-metric-show-all":!0,children:y.showAll?"Show one":"Show all"})]}),y.showAll?u.jsx("div",{className:"ui-input ui-input-readonly w-full flex items-center text-xs",children:"All metrics"}):u.jsx("div",{"data-metric-selector":!0,"data-facet-requested-field":p??"","data-facet-presented-field":U.key,"aria-busy":q||void 0,children:u.jsx(Tn,{value:U.key,onChange:B,options:j,"aria-label":"Metric",title:U.value.label||"Metric",triggerClassName:"w-full justify-between",width:"trigger",searchable:"auto",searchPlaceholder:"Search metrics...",emptyMessage:"No matching metrics"})})]}),u.jsx("div",{hidden:!y.showAll,"aria-hidden":!y.showAll||void 0,ref:L=>L==null?void 0:L.toggleAttribute("inert",!y.showAll),children:u.jsx(Y1,{keys:r,estimateSize:384,kind:"metric",schemaRevision:y.schemaRevision,active:e&&y.showAll,onVisibleKeysChange:D,renderCard:L=>{const F=Z.get(L);return z(L,!0,F?{state:F.presentation.state,value:F.presentation.value}:P(L),(F==null?void 0:F.retained)??!1,L)}},b)}),!y.showAll&&(U.key?z(U.key,!1,{state:U.state,value:U.value},q):u.jsx("div",{className:"text-sm text-muted",children:"No values found for this metric."}))]})}function aI({active:e=!0,items:t,filteredItems:n,metricKeys:r,categoricalKeys:s,metricDisplayNames:i,facets:o=null,facetsState:l="settled",facetFieldStates:a,populationItemsComplete:d=!0,filteredItemsComplete:f=!0,selectedItems:h,selectedMetric:m,facetDemand:y,presentationResetKey:b="default",onSelectMetric:w,filters:S,onChangeRange:v,onChangeCategoricalValues:x,onChangeFilters:p,onFacetDemandAction:g}){const k=c.useMemo(()=>e&&(h!=null&&h.length)?Eo(h,r):null,[e,h,r]),C=c.useMemo(()=>G1(y,m,r,s),[s,y,r,m]),R=u.jsx(OT,{filters:S,onChangeFilters:p}),E=u.jsx(YT,{active:e,items:t,filteredItems:n,categoricalKeys:s,facets:o,facetsState:l,facetFieldStates:a,populationItemsComplete:d,filteredItemsComplete:f,selectedItems:h,filters:S,demand:y.categorical,presentationResetKey:b,onChangeValues:x,onDemandAction:g});return!r.length&&!s.length?u.jsxs("div",{className:"h-full flex flex-col gap-3 p-3 overflow-auto scrollbar-thin","data-metrics-panel":!0,"data-presentation-reset-key":b,"data-requested-metric-fields":JSON.stringify(C.metric_keys),"data-requested-categorical-fields":JSON.stringify(C.categorical_keys),children:[R,u.jsx("div",{className:"p-4 text-sm text-muted",children:"No metrics or categoricals found in this dataset."})]}):u.jsxs("div",{className:"h-full flex flex-col gap-3 p-3 overflow-auto scrollbar-thin","data-metrics-panel":!0,"data-presentation-reset-key":b,"data-metric-field-schema":JSON.stringify(r),"data-categorical-field-schema":JSON.stringify(s),"data-requested-metric-fields":JSON.stringify(C.metric_keys),"data-requested-categorical-fields":JSON.stringify(C.categorical_keys),children:[r.length>0&&u.jsx(lI,{active:e,items:t,filteredItems:n,metricKeys:r,metricDisplayNames:i,facets:o,facetsState:l,facetFieldStates:a,populationItemsComplete:d,filteredItemsComplete:f,selectedItems:h,selectedValuesByKey:k,selectedMetric:m,demand:y.metric,presentationResetKey:b,onSelectMetric:w,filters:S,onChangeRange:v,onDemandAction:g}),E,R]})}const uI=[{label:"Root",path:"/"}],cI="w-11 h-11 rounded-md border border-border flex items-center justify-center transition-colors",dI="bg-accent-muted text-accent",fI="bg-surface text-text hover:bg-surface-hover";function Qo(e){return`${cI} ${e?dI:fI}`}function Go(e,t){e==null||e.toggleAttribute("inert",t)}function hI({visible:e,leftTool:t,contentOpen:n,onToolChange:r,compareEnabled:s,compareActive:i,onOpenCompare:o,views:l,activeViewId:a,onActivateView:d,onSaveView:f,current:h,data:m,onOpenFolder:y,onOpenFolderActions:b,onPullRefreshFolders:w,onContextMenu:S,countVersion:v,items:x,filteredItems:p,metricKeys:g,categoricalKeys:k,metricDisplayNames:C,metricsFacets:R,metricsFacetsState:E="settled",metricsFacetFieldStates:N,metricsPopulationItemsComplete:j,metricsFilteredItemsComplete:P,metricsPresentationResetKey:$,derivedDraftResetKey:U,derivedMetric:q,derivedRankDisabledReason:V,derivedMetricBackendAuthoritative:A=!1,selectedItems:Z,selectedMetric:D,metricsFacetDemand:z,onSelectMetric:B,onApplyDerivedMetric:O,onRankByDerivedMetric:L,filters:F,onChangeRange:T,onChangeCategoricalValues:H,onChangeFilters:G,onMetricsFacetDemandAction:Y,onDerivedFacetFieldsChange:re,onResize:le,themePreset:he,onThemePresetChange:pe,autoloadImageMetadata:Se,onAutoloadImageMetadataChange:we,proxyHttpOriginals:Ee,onProxyHttpOriginalsChange:xe,compareOrderMode:Re,onCompareOrderModeChange:ue,tableSourceColumns:Be,tableLaunchStatus:ke,launchSession:Ye,tableSourceSwitching:et,onTableSourceColumnChange:be}){const X=e&&n&&t==="metrics",me=e&&n&&t==="derived",Ne=Qo(t==="folders"),K=Qo(t==="metrics"),W=Qo(t==="derived"),fe=Qo(i),ee=`${Qo(!1)} cursor-pointer`;return u.jsxs("div",{className:"app-left-panel col-start-1 row-start-2 relative border-r border-border bg-panel overflow-visible","data-left-content-open":n?"true":"false","data-left-rail-visible":e?"true":"false",hidden:!e,"aria-hidden":!e||void 0,ref:ce=>Go(ce,!e),children:[u.jsxs("div",{className:"absolute inset-y-0 left-0 w-12 border-r border-border flex flex-col items-center gap-2 py-3 bg-surface-overlay",children:[u.jsx("button",{className:Ne,title:"Folders","aria-label":"Folders","aria-pressed":t==="folders",onClick:()=>r("folders"),children:u.jsx("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.8",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:u.jsx("path",{d:"M3 7.5h6l2-2h10a2 2 0 0 1 2 2v9a2 2 0 0 1-2 2H3a2 2 0 0 1-2-2v-7a2 2 0 0 1 2-2z"})})}),u.jsx("button",{className:K,title:"Metrics / Filters","aria-label":"Metrics and Filters","aria-pressed":t==="metrics",onClick:()=>r("metrics"),children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.8",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("path",{d:"M4 19V9"}),u.jsx("path",{d:"M10 19V5"}),u.jsx("path",{d:"M16 19v-7"}),u.jsx("path",{d:"M3 19h18"})]})}),u.jsx("button",{className:W,title:"Derived Score","aria-label":"Derived Score","aria-pressed":t==="derived",onClick:()=>r("derived"),children:u.jsx(OR,{size:15,strokeWidth:1.8,"aria-hidden":"true"})}),u.jsx("div",{className:"w-6 h-px bg-border/70 my-1"}),u.jsx("button",{className:`${fe} ${s?"":"opacity-40 cursor-not-allowed"}`,title:s?"Compare selected images":"Compare (select 2+)","aria-label":"Compare selected images","aria-pressed":i,"aria-disabled":!s,disabled:!s,onClick:()=>{s&&o()},children:u.jsxs("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"1.8",strokeLinecap:"round",strokeLinejoin:"round","aria-hidden":"true",children:[u.jsx("rect",{x:"3",y:"4",width:"8",height:"16",rx:"1"}),u.jsx("rect",{x:"13",y:"4",width:"8",height:"16",rx:"1"})]})}),u.jsx("div",{className:"flex-1"}),u.jsx("a",{className:ee,href:"https://github.com/trojblue/lenslet",title:"Lenslet on GitHub","aria-label":"Lenslet on GitHub",target:"_blank",rel:"noreferrer",children:u.jsx("svg",{width:"14",height:"14",viewBox:"0 0 24 24",fill:"currentColor","aria-hidden":"true",children:u.jsx("path",{d:"M12 .5C5.73.5.5 5.74.5 12.02c0 5.1 3.29 9.42 7.86 10.95.58.11.79-.25.79-.56v-2.17c-3.2.7-3.88-1.55-3.88-1.55-.53-1.35-1.29-1.71-1.29-1.71-1.05-.72.08-.71.08-.71 1.16.08 1.78 1.2 1.78 1.2 1.03 1.77 2.71 1.26 3.37.96.1-.75.4-1.26.73-1.55-2.55-.29-5.23-1.29-5.23-5.74 0-1.27.45-2.31 1.19-3.13-.12-.29-.52-1.46.11-3.05 0 0 .97-.31 3.18 1.19.92-.26 1.91-.39 2.89-.39.98 0 1.97.13 2.89.39 2.2-1.5 3.18-1.19 3.18-1.19.63 1.59.23 2.76.11 3.05.74.82 1.19 1.86 1.19 3.13 0 4.46-2.69 5.45-5.25 5.73.41.36.78 1.07.78 2.16v3.2c0 .31.21.67.8.56 4.56-1.53 7.85-5.85 7.85-10.95C23.5 5.74 18.27.5 12 .5z"})})}),u.jsx(Nb,{value:he,onChange:pe,placement:"sidebar",autoloadImageMetadata:Se,onAutoloadImageMetadataChange:we,proxyHttpOriginals:Ee,onProxyHttpOriginalsChange:xe,compareOrderMode:Re,onCompareOrderModeChange:ue,sourceColumns:Be,tableLaunchStatus:ke,launchSession:Ye,sourceColumnSwitching:et,onSourceColumnChange:be})]}),u.jsxs("div",{className:"ml-12 h-full overflow-hidden",hidden:!n,"aria-hidden":!n||void 0,ref:ce=>Go(ce,!n),children:[u.jsxs("div",{className:"h-full flex flex-col",hidden:t!=="folders","aria-hidden":t!=="folders"||void 0,ref:ce=>Go(ce,t!=="folders"),"data-left-tool-panel":"folders",children:[u.jsxs("div",{className:"px-2 py-2 border-b border-border",children:[u.jsxs("div",{className:"flex items-center justify-between mb-2",children:[u.jsx("div",{className:"text-[11px] uppercase tracking-wide text-muted",children:"Smart Folders"}),u.jsx("button",{className:"btn btn-sm btn-ghost text-xs",onClick:f,title:"Save current view as Smart Folder",children:"+ New"})]}),l.length?u.jsx("div",{className:"flex flex-col gap-1",children:l.map(ce=>{const Te=ce.id===a;return u.jsx("button",{className:`text-left px-2 py-2 rounded-md text-sm ${Te?"bg-accent-muted text-accent":"hover:bg-hover text-text"}`,onClick:()=>d(ce),children:ce.name},ce.id)})}):u.jsx("div",{className:"text-xs text-muted px-1 py-1.5",children:"No saved Smart Folders yet."})]}),u.jsx(XP,{active:e&&n&&t==="folders",current:h,roots:uI,data:m,onOpen:y,onPullRefresh:w,onContextMenu:S,onOpenActions:b,countVersion:v,className:"flex-1 min-h-0 overflow-auto scrollbar-thin",showResizeHandle:!1})]}),u.jsx("div",{className:"h-full",hidden:t!=="metrics","aria-hidden":t!=="metrics"||void 0,ref:ce=>Go(ce,t!=="metrics"),"data-left-tool-panel":"metrics",children:u.jsx(aI,{active:X,items:x,filteredItems:p,metricKeys:g,categoricalKeys:k,metricDisplayNames:C,facets:R,facetsState:E,facetFieldStates:N,populationItemsComplete:j,filteredItemsComplete:P,selectedItems:Z,selectedMetric:D,facetDemand:z,presentationResetKey:$,onSelectMetric:B,filters:F,onChangeRange:T,onChangeCategoricalValues:H,onChangeFilters:G,onFacetDemandAction:Y})}),u.jsx("div",{className:"h-full",hidden:t!=="derived","aria-hidden":t!=="derived"||void 0,ref:ce=>Go(ce,t!=="derived"),"data-left-tool-panel":"derived",children:u.jsx(IT,{active:me,items:x,metricKeys:g,categoricalKeys:k,metricDisplayNames:C,facets:R,facetsState:E,facetFieldStates:N,populationItemsComplete:j,presentationResetKey:U,draftResetKey:U,derivedMetric:q,backendAuthoritative:A,derivedRankDisabledReason:V,onApplyDerivedMetric:O,onRankByDerivedMetric:L,onFacetFieldsChange:re})})]}),n&&u.jsx("div",{className:"toolbar-offset sidebar-resize-handle sidebar-resize-handle-left absolute bottom-0",onPointerDown:le})]})}function J1({persistenceEnabled:e,showPersistenceWarning:t,indexing:n=null,offViewSummary:r,onRevealOffView:s,canRevealOffView:i=!1,browserZoomPercent:o,tableSourceWarning:l,derivedMetricWarning:a}){const d=r!=null&&r.names.length?` (${r.names.join(", ")}${r.extra?` +${r.extra}`:""})`:"",f=i&&s!=null,h=typeof o=="number"?o:null,m=h!==null&&Math.abs(h-100)>=2,y=!!l,b=!!a,w=(n==null?void 0:n.state)==="running",S=(n==null?void 0:n.state)==="error",v=n!=null&&n.scope&&n.scope!=="/"?` (${n.scope})`:"",x=(()=>{if(!w)return null;const k=typeof(n==null?void 0:n.done)=="number"?n.done:null,C=typeof(n==null?void 0:n.total)=="number"?n.total:null;return k===null&&C===null?null:C===null?`${k??0} indexed`:`${Math.min(k??0,C)} / ${C}`})(),p=!e&&t!==!1;return{offViewLabel:d,canReveal:f,zoomPercent:h,showZoomWarning:m,showTableSourceWarning:y,showIndexingRunning:w,showIndexingError:S,indexingScopeLabel:v,indexingProgressLabel:x,showAnyBanner:p||w||S||m||!!r||y||b,showReadOnlyWarning:p}}function mI(e){const t=J1(e);return[t.showReadOnlyWarning&&"read-only",t.showIndexingRunning&&"indexing-running",t.showIndexingError&&"indexing-error",t.showTableSourceWarning&&"table-source",!!e.derivedMetricWarning&&"derived-metric",t.showZoomWarning&&"browser-zoom",!!e.offViewSummary&&"off-view"].filter(Boolean).join("\0")}function pI({persistenceEnabled:e,showPersistenceWarning:t,onDismissPersistenceWarning:n,indexing:r=null,offViewSummary:s,onRevealOffView:i,canRevealOffView:o=!1,onClearOffView:l,browserZoomPercent:a,onDismissBrowserZoomWarning:d,tableSourceWarning:f,derivedMetricWarning:h,onDismissTableSourceWarning:m}){const{offViewLabel:y,canReveal:b,zoomPercent:w,showZoomWarning:S,showTableSourceWarning:v,showIndexingRunning:x,showIndexingError:p,indexingScopeLabel:g,indexingProgressLabel:k,showAnyBanner:C,showReadOnlyWarning:R}=J1({persistenceEnabled:e,showPersistenceWarning:t,indexing:r,offViewSummary:s,onRevealOffView:i,canRevealOffView:o,browserZoomPercent:a,tableSourceWarning:f,derivedMetricWarning:h});return C?u.jsxs("div",{className:"grid-top-status-list",children:[R&&u.jsxs("div",{className:"grid-top-context-item ui-banner ui-banner-danger text-xs flex items-center justify-between gap-3",children:[u.jsxs("span",{children:[u.jsx("span",{className:"font-semibold",children:"Not persisted."})," Workspace is read-only; edits stay in memory until restart."]}),n&&u.jsx("button",{type:"button",className:"text-muted hover:text-text transition-colors text-base leading-none shrink-0",onClick:n,"aria-label":"Dismiss persistence warning",children:"×"})]}),x&&u.jsxs("div",{className:"grid-top-context-item ui-banner ui-banner-accent text-xs",children:[u.jsxs("span",{className:"font-semibold",children:["Indexing in progress",g,"."]})," ",k?`${k} complete.`:"Preparing searchable index."]}),p&&u.jsxs("div",{className:"grid-top-context-item ui-banner ui-banner-danger text-xs",children:[u.jsx("span",{className:"font-semibold",children:"Indexing failed."})," ",(r==null?void 0:r.error)||"Open server logs for details."]}),v&&u.jsxs("div",{className:"grid-top-context-item ui-banner ui-banner-accent text-xs flex items-center justify-between gap-3",children:[u.jsxs("span",{children:[u.jsx("span",{className:"font-semibold",children:"Image source warning."})," ",f]}),m&&u.jsx("button",{type:"button",className:"text-muted hover:text-text transition-colors text-base leading-none shrink-0",onClick:m,"aria-label":"Dismiss image source warning",children:"×"})]}),h&&u.jsxs("div",{className:"grid-top-context-item ui-banner ui-banner-danger text-xs",children:[u.jsx("span",{className:"font-semibold",children:"Derived score."})," ",h]}),S&&u.jsxs("div",{className:"grid-top-context-item ui-banner ui-banner-accent text-xs flex items-center justify-between gap-3",children:[u.jsxs("span",{children:[u.jsxs("span",{className:"font-semibold",children:["Browser zoom ",Math.round(w??100),"%."]})," For best results, set it to 100% so UI elements stay in correct proportions."]}),d&&u.jsx("button",{type:"button",className:"text-muted hover:text-text transition-colors text-base leading-none shrink-0",onClick:d,"aria-label":"Dismiss browser zoom warning",children:"×"})]}),s&&u.jsxs("div",{className:"grid-top-context-item ui-banner ui-banner-accent text-xs flex items-center justify-between gap-3",children:[u.jsxs("span",{children:["Updates outside current view: ",s.count," item",s.count===1?"":"s",y]}),u.jsxs("div",{className:"flex items-center gap-2",children:[b&&u.jsx("button",{className:"text-muted hover:text-text transition-colors",onClick:i,"aria-label":"Reveal off-view updates",children:"Reveal"}),u.jsx("button",{className:"text-muted hover:text-text transition-colors text-base leading-none",onClick:l,"aria-label":"Clear off-view updates",children:"×"})]})]})]}):null}function gI({statusBarProps:e,actionFeedback:t,onDismissActionFeedback:n,similarity:r,onExitSimilarity:s,filterChips:i,onClearFilters:o}){const l=c.useRef(null),a=c.useRef({status:"",action:null,similarity:null}),d=mI(e),f=t?`${t.kind}\0${t.message}`:null,h=r?`${r.embedding}\0${r.queryLabel??""}`:null;return c.useLayoutEffect(()=>{const m=a.current,y=d!==""&&d!==m.status,b=f!==null&&f!==m.action,w=h!==null&&h!==m.similarity;a.current={status:d,action:f,similarity:h};const S=l.current;if(!S)return;const v=w?S.querySelector("[data-grid-top-similarity]"):b?S.querySelector("[data-grid-top-action]"):null;v?v.scrollIntoView({block:"nearest",inline:"nearest"}):y&&(S.scrollLeft=0)},[f,h,d]),u.jsx("div",{"data-grid-top-stack":!0,"data-filter-count":i.length,className:"grid-top-stack",children:u.jsxs("div",{ref:l,"data-grid-top-rail":!0,className:"grid-top-rail scrollbar-thin",role:"region","aria-label":"Gallery filters and status",tabIndex:0,children:[u.jsx(pI,{...e}),t&&u.jsxs("div",{"data-grid-top-action":!0,className:`grid-top-context-item ui-banner ${t.kind==="error"?"ui-banner-danger":"ui-banner-accent"} text-xs flex items-center justify-between gap-3`,role:"status",children:[u.jsx("span",{children:t.message}),n&&u.jsx("button",{type:"button",className:"text-muted hover:text-text transition-colors text-base leading-none shrink-0",onClick:n,"aria-label":"Dismiss action status",children:"×"})]}),r&&u.jsxs("div",{"data-grid-top-similarity":!0,className:"grid-top-context-item ui-banner ui-banner-accent text-xs flex items-center gap-2",children:[u.jsx("span",{className:"font-semibold",children:"Similarity mode"}),u.jsxs("span",{className:"text-muted",children:["Embedding: ",r.embedding]}),r.queryLabel&&u.jsxs("span",{className:"text-muted",children:["Query: ",r.queryLabel]}),r.countLabel&&u.jsxs("span",{className:"text-muted",children:["Results: ",r.countLabel]}),u.jsxs("span",{className:"text-muted",children:["Top K: ",r.topK]}),r.minScore!=null&&u.jsxs("span",{className:"text-muted",children:["Min score: ",r.minScore]}),u.jsx("button",{className:"btn btn-sm",onClick:s,children:"Exit similarity"})]}),u.jsx("span",{className:"grid-top-filter-label text-[11px] uppercase tracking-wide text-muted",children:"Filters"}),i.map(m=>u.jsxs("span",{className:"filter-chip",children:[u.jsx("span",{className:"truncate max-w-[240px]",title:m.label,children:m.label}),u.jsx("button",{className:"filter-chip-remove","aria-label":`Clear filter ${m.label}`,onClick:m.onRemove,children:"×"})]},m.id)),i.length>0&&u.jsx("button",{className:"btn btn-sm btn-ghost text-xs shrink-0",onClick:o,children:"Clear all"})]})})}function yI(e){return e.isOffline?"offline":e.isUnstable?"unstable":e.recentEditActive?"recent":Number.isFinite(e.editingCount)&&e.editingCount>0?"editing":"live"}const vI=6e3,wI=1e4,xI=24*60*6e4,bI=3e4,SI=350,kI=1400,Z1=[-2,-1,1,2],eS=[-2,-1,0,1,2,3];Z1.length;eS.length;function CI(e,t,n){return Math.min(Math.max(e,t),n)}function tS(e,t,n){const r=new Set,s=[];for(const i of n){const o=t+i;if(o<0||o>=e.length)continue;const l=e[o];!l||r.has(l)||(r.add(l),s.push(l))}return s}function EI(e,t){if(!t)return[];const n=e.indexOf(t);return n<0?[]:tS(e,n,Z1)}function MI(e,t){if(e.length<2)return[];const n=Math.max(0,e.length-2),r=CI(t,0,n);return tS(e,r,eS)}function RI(e){return JSON.stringify(e,null,2)}function NI(e){const t=s=>'"'+s.replaceAll('"','""')+'"',n="path,folder,name,star,type,size,width,height,tags,notes",r=e.map(s=>{const i=(s.tags||[]).join(" "),o=s.notes||"";return[s.path,s.folder,s.name,String(s.star??""),s.type??"",s.size??"",s.width??"",s.height??"",i,o].map(l=>t(String(l))).join(",")});return[n,...r].join(`
-`)}function jI(e){return e.map(t=>{const n=t.path.split("/").filter(Boolean);n.pop();const r=n.length?`/${n.join("/")}`:"/";return{path:t.path,folder:r,name:t.name,star:t.star??null,type:t.mime,size:t.size,width:t.width,height:t.height}})}const nS="Select a single image to search.",_I="No embeddings detected.",PI="Loading embeddings...";function TI({enabled:e,embeddingsAvailable:t,embeddingsLoading:n,selectedCount:r}){return e?t?r!==1?{canFindSimilar:!1,disabledReason:nS}:{canFindSimilar:!0,disabledReason:null}:{canFindSimilar:!1,disabledReason:n?PI:_I}:{canFindSimilar:!1,disabledReason:null}}function II({x:e,y:t,items:n}){const r=c.useRef(null),[s,i]=c.useState({x:e,y:t}),[o,l]=c.useState(!1),a=c.useCallback((f,h)=>{h.stopPropagation(),f.disabled||f.onClick()},[]),d=c.useCallback(()=>{const f=r.current,h=aa(),m=f==null?void 0:f.getBoundingClientRect(),y=Math.min(280,Math.max(0,h.width-2*la)),b=(m==null?void 0:m.height)??Math.max(40,n.length*36),w=zl({x:e,y:t,menuWidth:y,menuHeight:b,viewport:h});i(S=>S.x===w.x&&S.y===w.y&&S.width===y?S:{...w,width:y}),l(!0)},[n.length,e,t]);return c.useLayoutEffect(()=>{d()},[d]),c.useEffect(()=>Cc(d),[d]),u.jsx("div",{ref:r,className:"dropdown-panel context-menu-panel fixed",role:"menu",style:{left:s.x,top:s.y,width:s.width,visibility:o?"visible":"hidden"},onClick:f=>f.stopPropagation(),children:n.map((f,h)=>u.jsxs("button",{className:`dropdown-item w-full ${f.danger?"text-danger hover:text-danger":""}`,role:"menuitem","aria-disabled":f.disabled,disabled:f.disabled,onClick:m=>a(f,m),children:[f.icon&&u.jsx("span",{className:"shrink-0",children:f.icon}),u.jsx("span",{className:"context-menu-label",title:f.label,children:f.label})]},h))})}function mu(e,t){const n=URL.createObjectURL(e),r=document.createElement("a");r.href=n,r.download=t,document.body.appendChild(r),r.click(),r.remove(),URL.revokeObjectURL(n)}const LI="Refresh unavailable in current mode",OI="Find similar unavailable";function FI({refreshing:e,refreshEnabled:t,refreshDisabledReason:n,onRefresh:r}){return{label:t?e?"Refreshing…":"Refresh":n||LI,disabled:!t||e,onClick:r}}function AI({selectedPaths:e,canFindSimilar:t,findSimilarDisabledReason:n,onFindSimilar:r}){if(!r)return null;const s=e.length===1,i=s?e[0]:null,o=s?n||OI:n||nS,l=s&&t&&!!i;return{label:l?"Find similar":o,disabled:!l,onClick:()=>{!l||!i||r(i)}}}function rS(e){return e==="csv"?"text/csv;charset=utf-8":"application/json;charset=utf-8"}function sS(e,t){const n=jI(e);return t==="csv"?NI(n):RI(n)}function Qv(){return new Date().toISOString().replace(/[:.]/g,"-")}function DI({format:e,selectedPaths:t,items:n,setExporting:r,closeMenu:s,download:i,timestamp:o,onActionStart:l,onActionError:a}){return()=>{r(e),l==null||l();try{const d=new Set(t),f=n.filter(y=>d.has(y.path)),h=sS(f,e),m=rS(e);i(new Blob([h],{type:m}),`metadata_selection_${o()}.${e}`)}catch(d){a==null||a("Export selection metadata failed",d)}finally{r(null),s()}}}async function zI(e){return(await Fe.getFolder(e,{recursive:!0})).items}function $I({ctx:e,current:t,items:n,setCtx:r,refreshEnabled:s,refreshDisabledReason:i,onRefreshFolder:o,canFindSimilar:l=!1,findSimilarDisabledReason:a=null,onFindSimilar:d,onActionStart:f,onActionError:h}){const[m,y]=c.useState(!1),[b,w]=c.useState(null),S=e.kind==="grid"?e.payload.paths:[],v=c.useMemo(()=>new Map(n.map(E=>[E.path,E])),[n]),x=()=>{r(null)},p=async()=>{const E=e.kind==="tree"?e.payload.path:"/";y(!0),f==null||f();try{await o(E)}catch(N){h==null||h("Refresh folder failed",N)}finally{y(!1),x()}},g=E=>async()=>{w(E),f==null||f();const N=e.kind==="tree"?e.payload.path:t;try{const j=await zI(N),P=sS(j,E),$=rS(E),U=N==="/"?"root":(N.replace(/^\/+/,"")||"root").replace(/\//g,"_");mu(new Blob([P],{type:$}),`metadata_${U}_${Qv()}.${E}`)}catch(j){h==null||h("Export folder metadata failed",j)}finally{w(null),x()}},k=E=>DI({format:E,selectedPaths:S,items:n,setExporting:w,closeMenu:x,download:mu,timestamp:Qv,onActionStart:f,onActionError:h}),C=async()=>{var N;if(!S.length)return;x(),f==null||f();const E=[];for(const j of S)try{const P=await Fe.getFile(j),$=((N=v.get(j))==null?void 0:N.name)||pP(j)||"image";mu(P,$)}catch(P){E.push(P)}if(E.length){const j=E.length===S.length?"Download failed":`${E.length} download${E.length===1?"":"s"} failed`;h==null||h(j,E[0])}},R=e.kind==="tree"?[FI({refreshing:m,refreshEnabled:s,refreshDisabledReason:i,onRefresh:p}),{label:b==="csv"?"Exporting CSV…":"Export metadata (CSV)",disabled:!!b||m,onClick:g("csv")},{label:b==="json"?"Exporting JSON…":"Export metadata (JSON)",disabled:!!b||m,onClick:g("json")}]:BI({selectedPaths:S,exporting:b,canFindSimilar:l,findSimilarDisabledReason:a,onFindSimilar:d?E=>{d(E),x()}:void 0,onDownloadSelection:C,onExportCsv:k("csv"),onExportJson:k("json")});return u.jsx(II,{x:e.x,y:e.y,items:R})}function BI({selectedPaths:e,exporting:t,canFindSimilar:n,findSimilarDisabledReason:r,onFindSimilar:s,onDownloadSelection:i,onExportCsv:o,onExportJson:l}){const a=[],d=AI({selectedPaths:e,canFindSimilar:n,findSimilarDisabledReason:r,onFindSimilar:s});return d&&a.push(d),e.length&&a.push({label:e.length>1?`Download (${e.length})`:"Download",onClick:i}),e.length&&(a.push({label:t==="csv"?"Exporting CSV…":"Export metadata (CSV)",disabled:!!t,onClick:o}),a.push({label:t==="json"?"Exporting JSON…":"Export metadata (JSON)",disabled:!!t,onClick:l})),a}function ai(e){const t=c.useRef(e);return t.current=e,t}function iS(e,t){for(const n of t)if(!e.has(n))return!1;return!0}function UI(e,t=250,n=[]){const r=new Set,s=new Set(n.filter(o=>!ht(o)));let i=0;for(const o of e){const l=o.metrics;if(l)for(const a of Object.keys(l))ht(a)||r.add(a);if(i+=1,i>=t&&r.size>0&&iS(r,s))break}return Array.from(r).sort()}function HI(e,t=250,n=[]){const r=new Set,s=new Set(n);let i=0;for(const o of e){const l=o.categoricals;if(l)for(const a of Object.keys(l))r.add(a);if(i+=1,i>=t&&r.size>0&&iS(r,s))break}return Array.from(r).sort()}function KI(e,t,n,r=[]){return t?UI(n,250,r):e?e.filter(s=>!ht(s)):[]}function VI(e,t,n=null){return e&&(t.includes(e)||e===n)?e:t[0]}function WI(e,t,n,r=null,s="none"){return n||e.kind!=="metric"||t.includes(e.key)?!1:ht(e.key)?r!==e.key:!0}function qI(e,t){return t.key===e&&t.status==="valid"&&t.validCount>0}function oS(e,t){const n=new Set;for(const r of e.and){if(!("metricRange"in r))continue;const s=r.metricRange.key;ht(s)&&(qI(s,t)||n.add(s))}return Array.from(n).sort()}function QI(e){return e.length?e.join(", "):"unknown inputs"}function GI(e,t,n){const r=e.kind==="metric"&&ht(e.key)?e.key:null,s=oS(t,n);if(!(r!==null||s.length>0))return null;const o=new Set(s);if(r&&o.add(r),Array.from(o).some(a=>a!==n.key))return"Saved derived score is unavailable in this view.";if(n.status==="invalid")return n.invalidReasons[0]??"Saved derived score definition is invalid.";if(n.status==="unavailable"){const a=[...n.missingMetricKeys,...n.missingCategoricalKeys].sort();return`Derived score inputs unavailable in this view: ${QI(a)}.`}if(n.status==="valid"&&n.validCount===0)return"Derived score has no valid values in this view.";if(r&&n.partialLoadWarning){const a=n.totalItems??n.loadedCount;return`Derived score ranks only the ${n.loadedCount} loaded items out of ${a}.`}return null}function YI(e,t,n){return null}function XI(e,t,n,r=[]){return t?HI(n,250,r):e?[...e]:[]}function JI(e){return e?"Ranking disabled in similarity mode.":null}function ZI(e,t){if(t)return{...e,derivedMetric:t};const n={and:e.filters.and.filter(s=>!("metricRange"in s&&ht(s.metricRange.key)))},r={...e,filters:n,derivedMetric:null};return e.sort.kind==="metric"&&ht(e.sort.key)&&(r.sort={kind:"builtin",key:"added",dir:e.sort.dir}),e.selectedMetric&&ht(e.selectedMetric)&&delete r.selectedMetric,r}function eL(e,t){const n=ko(t);return{...e,derivedMetric:t,selectedMetric:n,sort:{kind:"metric",key:n,dir:"desc"}}}function tL(e,t){const n={0:0,1:0,2:0,3:0,4:0,5:0};for(const r of e){const s=t[r.path]??r.star??0,i=String(s);n[i]=(n[i]||0)+1}return n}function nL(e,t,n,r){return e||t?n:r}function rL(e,t,n,r,s,i){return e?n:t||i==="/"?r:s}function sL(e){if(!e)return null;if(e.queryPath){const t=e.queryPath.split("/").filter(Boolean);return t.length?t[t.length-1]:e.queryPath}return e.queryVector?"Vector query":null}function iL(e,t,n,r){return e?t>0?`${n} of ${r}`:`${r}`:null}function oL(e){return e.unavailableReason?{kind:"unsupported",title:"Query unavailable",message:e.unavailableReason,showCentered:e.itemCount===0}:e.isError?{kind:"failed",title:"Query failed",message:"Retry the current query.",showCentered:e.itemCount===0}:!e.similarityActive&&e.itemCount===0&&e.isLoading?{kind:"loading",title:"Loading gallery...",message:"Preparing gallery...",showCentered:!0}:e.itemCount>0&&e.isFetching?{kind:"updating",title:"Updating results...",message:"Showing the previous window until the backend response arrives.",showCentered:!1}:e.itemCount===0?{kind:"empty",title:(e.filteredCount??0)===0?"No matching items":"No items loaded",message:e.searching?"No filenames, tags, or notes match this search.":"No images match the current filters.",showCentered:!0}:{kind:"ready",title:"Ready",message:"",showCentered:!1}}function lL({path:e,derivedMetric:t,facetFields:n}){return{path:e,recursive:!0,filters:{and:[]},sort:{kind:"builtin",key:"added",dir:"desc"},textQuery:"",randomSeed:null,derivedMetric:t,unsupportedToken:null,facetFields:n}}function aL(e,t){const n=uL(e)||"view",r=new Set(t.map(i=>i.id));if(!r.has(n))return n;let s=2;for(;r.has(`${n}-${s}`);)s+=1;return`${n}-${s}`}function uL(e){return e.toLowerCase().trim().replace(/[^a-z0-9]+/g,"-").replace(/^-+|-+$/g,"")}function Gv(e){const t=e.filter(s=>s>0).sort((s,i)=>i-s),n=e.includes(0),r=[...t.map(s=>String(s))];return n&&r.push("None"),r.join(", ")}function cL(e,t){return e&&t?`${e} to ${t}`:e?`from ${e}`:t?`to ${t}`:""}function dL(e){if(e==="/"||e==="")return"Root";const t=e.split("/").filter(Boolean);return t.length?t.length<=2?`/${t.join("/")}`:`.../${t.slice(-2).join("/")}`:"Root"}function fL(e,t,n,r){return!n||r?t:e==="/"||e===""?e||"/":n===e||n.startsWith(`${e}/`)?e:t}function hL(e,t,n){return n&&t===e?n:null}function Bh(e){return typeof e!="number"||!Number.isFinite(e)||Math.abs(e-100)<2?null:Math.round(e/5)*5}function mL(e,t){const n=Bh(e);return n===null||n===t?null:e}function lS(e,t){return`${Yv(e)}–${Yv(t)}`}function Yv(e){const t=Math.abs(e);return t>=1e3?e.toFixed(0):t>=10?e.toFixed(2):e.toFixed(3)}function pL(e){const t=e.toLowerCase();return t.endsWith(".png")?"image/png":t.endsWith(".webp")?"image/webp":"image/jpeg"}function gL(e,t){const n=e.split("/").pop()??e;return{path:e,name:n,mime:pL(e),width:0,height:0,size:0,has_thumbnail:!0,has_metadata:!1,star:t??null}}const yL=()=>["embeddings"];function vL(){return _o({queryKey:yL(),queryFn:Fe.getEmbeddings,staleTime:6e4,gcTime:5*6e4,retry:1,refetchOnWindowFocus:!1})}function wL(e,t=250){const[n,r]=ig.useState(e);return ig.useEffect(()=>{const s=window.setTimeout(()=>r(e),Math.max(0,t));return()=>window.clearTimeout(s)},[e,t]),n}function aS(e,t){return Xb(e,t)}function xL(e,t,n){return e&&e.scopePath===qt(t)&&e.sessionResetToken===n?e:null}function bL(e,t){return e?t instanceof jn||t instanceof Error?t.message:"Failed to load embeddings.":null}function SL(e,t){if(e)return{version:1,path:e.path,generated_at:e.generated_at,items:t,folders:e.folders,metric_keys:e.metric_keys,categorical_keys:e.categorical_keys,total_items:e.scope_total,offset:0,limit:t.length}}function Uh(e){return{path:e,metricKeys:[],categoricalKeys:[],ready:!1}}function kL(e,t,n){const r=So(e);return(t==null?void 0:t.path)===r?{path:r,metricKeys:EL(t),categoricalKeys:ML(t),ready:!0}:n.path===r?n:Uh(r)}function CL(e,t){return e.path===t.path&&e.ready===t.ready&&Xv(e.metricKeys,t.metricKeys)&&Xv(e.categoricalKeys,t.categoricalKeys)}function Xv(e,t){return e.length!==t.length?!1:e.every((n,r)=>n===t[r])}function EL(e){const t=e.field_capabilities;return t?[...t.display_metrics]:[...e.metric_keys]}function ML(e){const t=e.field_capabilities;return t?[...t.categorical_inputs]:[...e.categorical_keys]}function RL(e){if(e[0]!=="folder-query")return"";const t=e[1];return Array.isArray(t)&&typeof t[1]=="string"?t[1]:""}function NL(e){const t=[],n=[],r=o=>{const l=o==null?void 0:o.trim();l&&!t.includes(l)&&t.push(l)},s=o=>{const l=o==null?void 0:o.trim();l&&!n.includes(l)&&n.push(l)};r(e.selectedMetric),e.sort.kind==="metric"&&r(e.sort.key);const i=Tr(e.derivedMetric);i&&r(ko(i));for(const o of e.filters.and)"metricRange"in o&&r(o.metricRange.key),"categoricalIn"in o&&s(o.categoricalIn.key);return{metric_keys:t.sort(),categorical_keys:n.sort()}}function jL(e){return e.metric_keys.length>64?"This view needs more than 64 metric columns. Remove metric filters to continue.":e.categorical_keys.length>32?"This view needs more than 32 categorical columns. Remove categorical filters to continue.":null}function Jv(e){return e.flatMap(t=>{const n=St.get(t);return n?[n]:[]})}function _L(e){return{and:e.and.filter(t=>!("urlContains"in t)&&!("urlNotContains"in t))}}function PL(e,t){const n=c.useRef({}),s=`${e.join("\0")}\0${JSON.stringify(t)}`,i=c.useMemo(()=>_L(t),[t]),o=c.useMemo(()=>Jv(e),[s]),[l,a]=c.useState(()=>({key:s,items:o}));return c.useEffect(()=>{const d=n.current,f=Array.from(new Set(e)),h=new Map(e.map((y,b)=>[y,b]));St.setActivePaths(d,f);const m=f.map(y=>St.subscribe(y,()=>{const b=St.get(y),w=b?aS([b],i).length===1:!1;a(S=>{const v=S.key===s?S.items:o,x=v.findIndex(C=>C.path===y);if(!w)return x<0?S.key===s?S:{key:s,items:v}:{key:s,items:v.filter((C,R)=>R!==x)};if(x>=0){if(v[x]===b)return S;const C=[...v];return C[x]=b,{key:s,items:C}}const p=h.get(y)??Number.MAX_SAFE_INTEGER,g=v.findIndex(C=>(h.get(C.path)??Number.MAX_SAFE_INTEGER)>p),k=[...v];return k.splice(g<0?k.length:g,0,b),{key:s,items:k}})}));return a({key:s,items:Jv(e)}),()=>{for(const y of m)y();St.release(d)}},[s]),l.key===s?l.items:o}function TL({current:e,query:t,similarityState:n,viewState:r,randomSeed:s,urlUnsupportedMetricIntent:i=null,localStarOverrides:o,sessionResetToken:l=0}){var ke,Ye,et;const a=Ms(),d=c.useRef(0),f=c.useMemo(()=>So(e),[e]),[h,m]=c.useState(()=>Uh(f)),y=n!==null,b=wL(t,250),w=c.useMemo(()=>y?null:U_(b,e),[y,b,e]),S=w!==null,v=(w==null?void 0:w.q)??"",x=c.useMemo(()=>NL(r),[r]),p=c.useMemo(()=>YI(r.sort,r.filters)??jL(x),[x,y,r.filters,r.sort]),g=p??i,k=c.useMemo(()=>({path:e,recursive:!0,filters:r.filters,sort:r.sort,textQuery:v,randomSeed:s,derivedMetric:r.derivedMetric??null,limit:f1,unsupportedToken:g,projection:x,generationToken:String(l)}),[g,x,e,v,s,l,r.derivedMetric,r.filters,r.sort]),C=c.useMemo(()=>JSON.stringify(n?["similarity",n.createdAt,r.filters]:g1(k)),[k,n,r.filters]),R=A2({...k,enabled:!y&&p===null}),{data:E}=H2("/",{enabled:e!=="/"}),N=K2(e,{enabled:!y}),j=c.useCallback(()=>R.refetch(),[R.refetch]);c.useEffect(()=>{a.removeQueries({predicate:({queryKey:be})=>Array.isArray(be)&&be[0]==="folder-query"?RL(be)!==e:I2(be,e,!1)})},[e,a]),c.useEffect(()=>{d.current+=1,TM({requestId:d.current})},[p,e,v,s,l,r.filters,r.sort,g]),c.useEffect(()=>()=>{Bb()},[e]),c.useEffect(()=>{var X;if(!((X=R.data)!=null&&X.pages[0]))return;const be=d.current;fy(be)},[R.data]),c.useEffect(()=>{p!==null&&fy(d.current)},[p]);const P=vL(),$=((ke=P.data)==null?void 0:ke.embeddings)??[],U=((Ye=P.data)==null?void 0:Ye.rejected)??[],q=$.length>0,V=bL(P.isError,P.error),A=(et=R.data)==null?void 0:et.pages[0],Z=c.useMemo(()=>{var be;return((be=R.data)==null?void 0:be.pages.flatMap(X=>X.item_paths))??[]},[R.data]),D=PL(Z,r.filters);c.useEffect(()=>{m(be=>{const X=kL(f,N.data,be);return CL(be,X)?be:X})},[f,N.data]);const z=c.useMemo(()=>h.path===f?h:Uh(f),[h,f]),B=D,O=c.useMemo(()=>SL(A,B),[A,B]),L=c.useMemo(()=>{const be=new Map;for(const X of B)be.set(X.path,X);return be},[B]),F=c.useMemo(()=>n?n.items.map(be=>{const X=L.get(be.path);return X||gL(be.path,o[be.path])}):[],[n,L,o]),T=c.useMemo(()=>d2(r.derivedMetric),[r.derivedMetric]),H=c.useMemo(()=>KI(z.metricKeys,y,F,T.metricKeys),[z.metricKeys,T.metricKeys,y,F]),G=c.useMemo(()=>XI(z.categoricalKeys,y,F,T.categoricalKeys),[z.categoricalKeys,T.categoricalKeys,y,F]),Y=c.useMemo(()=>{if(!y)return h2({items:B,metricKeys:H,categoricalKeys:G,spec:r.derivedMetric??null,backendStatus:(A==null?void 0:A.derived_metric_status)??null,loadedCount:B.length,totalItems:(A==null?void 0:A.filtered_total)??B.length});const be=F;return np({items:be,metricKeys:H,categoricalKeys:G,spec:r.derivedMetric??null,loadedCount:be.length,totalItems:be.length})},[A==null?void 0:A.derived_metric_status,A==null?void 0:A.filtered_total,B,F,y,G,H,r.derivedMetric]),re=y?B:Y.items,le=y?Y.items:F,he=Y.metricKeys,pe=Y.categoricalKeys,Se=c.useMemo(()=>n?aS(le,r.filters):re,[n,le,re,r.filters]),we=n?le.length:(A==null?void 0:A.scope_total)??re.length,Ee=n?Se.length:(A==null?void 0:A.filtered_total)??Se.length,xe=(A==null?void 0:A.scope_total)??(O==null?void 0:O.total_items)??(O==null?void 0:O.items.length)??we,Re=e==="/"?xe:E??xe,ue=!y&&p===null&&Se.length<Ee,Be=c.useCallback(()=>{!ue||R.isFetchingNextPage||R.fetchNextPage()},[R,ue]);return{data:O,refetch:j,isLoading:R.isLoading,isFetching:R.isFetching&&!R.isFetchingNextPage,isError:R.isError,searching:S,normalizedQ:v,similarityActive:y,embeddings:$,embeddingsRejected:U,embeddingsAvailable:q,embeddingsLoading:P.isLoading,embeddingsError:V,poolItems:re,similarityItems:le,metricKeys:he,categoricalKeys:pe,browseCapabilityKeysReady:z.ready,metricDisplayNames:Y.metricDisplayNames,derivedMetric:Y,items:Se,totalCount:we,filteredCount:Ee,scopeTotal:xe,rootTotal:Re,hasMoreFolderItems:ue,isLoadingMoreFolderItems:R.isFetchingNextPage,loadMoreFolderItems:Be,browseQueryUnavailableReason:p,analysisUnsupportedMetricIntent:g,browseTargetIdentity:C,browseTargetSettled:y||A!==void 0}}const IL=800;function LL(e,t){const n=(t==null?void 0:t.targetKey)===e.targetKey&&t.resetKey===e.resetKey,r=e.settled,s=e.statusKind==="failed"||e.statusKind==="unsupported";return{targetKey:e.targetKey,resetKey:e.resetKey,epoch:n?t.epoch:((t==null?void 0:t.epoch)??0)+1,membershipPaths:e.membershipPaths,ratingPaths:e.ratingPaths,filteredCount:r?e.filteredCount:null,displayItemCount:r?e.displayItemCount:null,displayTotalCount:r?e.displayTotalCount:null,metricsPopulationItemsComplete:r&&e.metricsPopulationItemsComplete,metricsFilteredItemsComplete:r&&e.metricsFilteredItemsComplete,metricRailState:s?"error":r?e.metricRailState:"pending",metricRailHistogram:r?e.metricRailHistogram:null,metricRailKey:s?null:e.metricRailKey,metricRailSortDir:e.metricRailSortDir}}function OL({target:e,previous:t,expiredTargetKey:n}){return!e.settled&&e.statusKind!=="failed"&&e.statusKind!=="unsupported"?(t==null?void 0:t.resetKey)===e.resetKey&&t.membershipPaths.length>0?{...t,requestedTargetKey:e.targetKey,phase:n===e.targetKey?"loading":"grace",retained:!0}:{targetKey:null,requestedTargetKey:e.targetKey,resetKey:e.resetKey,epoch:(t==null?void 0:t.epoch)??0,membershipPaths:[],ratingPaths:[],filteredCount:null,displayItemCount:null,displayTotalCount:null,metricsPopulationItemsComplete:!1,metricsFilteredItemsComplete:!1,metricRailState:"pending",metricRailHistogram:null,metricRailKey:null,metricRailSortDir:e.metricRailSortDir,phase:"loading",retained:!1}:{...LL(e,t),requestedTargetKey:e.targetKey,phase:"steady",retained:!1}}function FL(e){return{targetKey:e.targetKey,resetKey:e.resetKey,epoch:e.epoch,membershipPaths:e.membershipPaths,ratingPaths:e.ratingPaths,filteredCount:e.filteredCount,displayItemCount:e.displayItemCount,displayTotalCount:e.displayTotalCount,metricsPopulationItemsComplete:e.metricsPopulationItemsComplete,metricsFilteredItemsComplete:e.metricsFilteredItemsComplete,metricRailState:e.metricRailState,metricRailHistogram:e.metricRailHistogram,metricRailKey:e.metricRailKey,metricRailSortDir:e.metricRailSortDir}}function uS(e,t){var r;if(!e)return t;if(!t||e===t)return e;const n={...e.metrics??{}};for(const s of e.mutable_metric_keys??[])delete n[s];for(const s of t.mutable_metric_keys??[]){const i=(r=t.metrics)==null?void 0:r[s];i!=null&&(n[s]=i)}return{...e,star:t.star,notes:t.notes,metrics:Object.keys(n).length?n:void 0,mutable_metric_keys:t.mutable_metric_keys}}function AL(e,t,n,r,s){const i=c.useRef({}),[o,l]=c.useState(0),a=c.useMemo(()=>Array.from(new Set([...e.membershipPaths,...e.ratingPaths])),[e.membershipPaths,e.ratingPaths]),d=a.join("\0");c.useLayoutEffect(()=>{const m=i.current;St.seed([...r,...n]),St.setActivePaths(m,a);const y=a.map(b=>St.subscribe(b,()=>l(w=>w+1)));return l(b=>b+1),()=>{for(const b of y)b();St.release(m)}},[d]);const f=c.useMemo(()=>{const m=new Map;for(const y of r)m.set(y.path,y);for(const y of n)m.set(y.path,y);return m},[n,r]),h=e.targetKey===t&&!e.retained;return c.useMemo(()=>{const m=y=>y.flatMap(b=>{const w=h?f.get(b):s.get(b),S=uS(w,St.get(b));return S?[S]:[]});return{items:m(e.membershipPaths),ratingItems:m(e.ratingPaths)}},[e.membershipPaths,e.ratingPaths,s,f,h,o])}function DL({targetKey:e,resetKey:t,targetItems:n,targetRatingItems:r,targetFilteredCount:s,targetDisplayItemCount:i,targetDisplayTotalCount:o,targetMetricsPopulationItemsComplete:l,targetMetricsFilteredItemsComplete:a,targetMetricRailState:d,targetMetricRailHistogram:f,targetMetricRailKey:h,targetMetricRailSortDir:m,targetSettled:y,targetStatus:b}){var N,j;const w=c.useRef(null),S=c.useRef(new Map),v=c.useRef(e),[x,p]=c.useState(null);v.current=e;const g=c.useMemo(()=>({targetKey:e,resetKey:t,membershipPaths:n.map(P=>P.path),ratingPaths:r.map(P=>P.path),filteredCount:s,displayItemCount:i,displayTotalCount:o,metricsPopulationItemsComplete:l,metricsFilteredItemsComplete:a,metricRailState:d,metricRailHistogram:f,metricRailKey:h,metricRailSortDir:m,settled:y,statusKind:b.kind}),[t,i,o,s,n,e,d,f,h,m,l,a,r,y,b.kind]),k=OL({target:g,previous:w.current,expiredTargetKey:x}),C=AL(k,e,n,r,S.current),E=!y&&b.kind!=="failed"&&b.kind!=="unsupported"&&((N=w.current)==null?void 0:N.resetKey)===t&&(((j=w.current)==null?void 0:j.membershipPaths.length)??0)>0;return c.useLayoutEffect(()=>{p(null)},[t,e]),c.useEffect(()=>{if(!E)return;const P=window.setTimeout(()=>{v.current===e&&p(e)},IL);return()=>window.clearTimeout(P)},[E,t,e]),c.useLayoutEffect(()=>{if(k.phase!=="steady"||v.current!==e)return;p($=>$===e?null:$),w.current=FL(k);const P=new Map;for(const $ of r)P.set($.path,$);for(const $ of n)P.set($.path,$);S.current=P},[k,n,e,r]),{...k,...C}}function zL(e,t){return e&&!t}function $L(e,t){return{resetViewer:e!==null,resetCompare:t}}function cS(e,t,n){if(!e.length)return[];const r=new Map(t.map(i=>[i.path,i])),s=new Map(n.map(i=>[i.path,i]));return e.map(i=>r.get(i)??s.get(i)).filter(i=>!!i)}function BL(e,t){if(!e.length)return[];const n=new Set(e);return t.filter(r=>n.has(r.path))}function UL(e,t,n,r){return r==="selection"?cS(e,t,n):BL(e,n)}function Zv(e,t,n,r){if(!n)return!1;if(r)return!0;const s=new Set(t.map(i=>i.path));return e.every(i=>s.has(i))}function HL(e,t,n){if(!n||!e.length)return e;const r=new Set(t),s=e.filter(i=>r.has(i));return s.length===e.length?e:s}function KL(e,t){const n=new Map(t.map(r=>[r.path,r]));return e.flatMap(r=>{const s=n.get(r);return s?[s]:[]})}function VL(e,t,n){const r=new Set(e),s=new Map(n.map(i=>[i.path,i]));return t.filter(i=>r.has(i.path)).map(i=>s.get(i.path)??i)}function WL(e,t,n){if(!e.length||!t)return null;const r=e.indexOf(t);if(r===-1)return null;const s=Math.min(e.length-1,Math.max(0,r+n)),i=e[s];return!i||i===t?null:i}function Xd(e,t,n){return e[0]??t??n??null}function qL(e){return e||null}function QL({current:e,itemPaths:t,items:n,selectionPool:r,compareOrderMode:s,membershipSettled:i,membershipComplete:o,focusGridCell:l}){const[a,d]=c.useState([]),[f,h]=c.useState(null),[m,y]=c.useState(!1),[b,w]=c.useState(0),[S,v]=c.useState([]),[x,p]=c.useState(0),g=c.useRef(!1),k=c.useRef(!1),C=c.useRef(null),R=c.useRef({}),E=c.useRef([]),N=c.useRef([]),[j,P]=c.useState(0),$=a.join("\0");c.useLayoutEffect(()=>{const W=R.current;St.setActivePaths(W,a);const fe=a.map(ee=>St.subscribe(ee,()=>P(ce=>ce+1)));return P(ee=>ee+1),()=>{for(const ee of fe)ee();St.release(W)}},[$]);const U=c.useMemo(()=>cS(a,r,n),[a,r,n]),q=Zv(a,U,i,o);c.useLayoutEffect(()=>{q&&(E.current=U)},[q,U]);const V=q?U:E.current,A=c.useMemo(()=>KL(a,V),[V,a]),Z=c.useMemo(()=>A.flatMap(W=>{const fe=uS(W,St.get(W.path));return fe?[fe]:[]}),[A,j]),D=c.useMemo(()=>UL(a,r,n,s),[a,r,n,s]),z=Zv(a,D,i,o);c.useLayoutEffect(()=>{(!m||z)&&(N.current=D)},[z,m,D]);const B=c.useMemo(()=>!m||z?D:VL(a,N.current,Z),[z,m,Z,a,D]),O=c.useMemo(()=>B.map(W=>W.path),[B]),L=Math.max(0,B.length-2),F=Math.min(b,L),T=B[F]??null,H=B[F+1]??null,G=F>0,Y=F<B.length-2,re=B.length>=2,le=f!=null||m,he=f??a[0]??null,pe=f&&S.length?S:t,Se=he?pe.indexOf(he):-1,we=Se>0,Ee=Se>=0&&Se<pe.length-1;c.useEffect(()=>{w(W=>W>L?L:W)},[L]);const xe=c.useCallback(()=>{p(W=>W+1)},[]),Re=c.useCallback(W=>{W&&(C.current=W,p(fe=>fe+1),l(W))},[l]),ue=c.useCallback(W=>{C.current=W},[]),Be=c.useCallback(()=>{h(null),v([]),g.current=!1},[]),ke=c.useCallback(W=>{const fe=qL(W);if(y(!1),w(0),k.current=!1,g.current=!1,fe){h(fe),v(t.includes(fe)?t:[]),d([fe]),C.current=fe;return}d([]),h(null),v([]),C.current=null},[t]),Ye=c.useCallback(W=>{if(W){h(W),v(t.includes(W)?t:[]),d([W]);return}f&&Re(Xd(a,f,C.current)),Be()},[t,Be,Re,a,f]),et=c.useCallback(W=>{h(W),v(t.includes(W)?t:[]),g.current=!0,hP(W)},[t]),be=c.useCallback(()=>{const W=Xd(a,f,C.current);h(null),v([]),g.current?(g.current=!1,window.history.back()):Sv(e),Re(W)},[e,Re,a,f]),X=c.useCallback(()=>{m||!re||(a[0]&&(C.current=a[0]),w(0),y(!0),f&&(h(null),v([]),g.current&&(g.current=!1),Sv(e)),k.current||(window.history.pushState({compare:!0},"",window.location.href),k.current=!0))},[m,re,e,a,f]),me=c.useCallback(()=>{y(!1),k.current&&(k.current=!1,window.history.back()),l(C.current??a[0])},[l,a]),Ne=c.useCallback(W=>{B.length<2||w(fe=>{const ee=Math.max(0,B.length-2);return Math.min(ee,Math.max(0,fe+W))})},[B.length]),K=c.useCallback(W=>{const fe=f??a[0],ee=WL(pe,fe,W);ee&&(f&&(h(ee),mP(ee)),C.current=ee,d([ee]))},[pe,a,f]);return c.useEffect(()=>{!f||S.length||!t.includes(f)||v(t)},[t,f,S.length]),c.useLayoutEffect(()=>{zL(m,re)&&me()},[m,re,me]),c.useEffect(()=>{const W=()=>{const fe=$L(f,m);fe.resetViewer&&(Re(Xd(a,f,C.current)),g.current=!1,h(null),v([])),fe.resetCompare&&(k.current=!1,y(!1))};return window.addEventListener("popstate",W),()=>window.removeEventListener("popstate",W)},[m,Re,a,f]),{selectedPaths:a,setSelectedPaths:d,viewer:f,compareOpen:m,restoreGridToSelectionToken:x,bumpRestoreGridToSelectionToken:xe,selectedItems:Z,compareItems:B,comparePaths:O,compareIndexClamped:F,compareA:T,compareB:H,canComparePrev:G,canCompareNext:Y,compareEnabled:re,canPrevImage:we,canNextImage:Ee,overlayActive:le,rememberFocusedPath:ue,openViewer:et,closeViewer:be,openCompare:X,closeCompare:me,handleCompareNavigate:Ne,handleNavigate:K,resetViewerState:Be,resetForScopeBoundary:ke,syncHashImageSelection:Ye}}const GL=2048,YL=6,XL=10;function dS(e){const t=new Map;for(const n of e)t.set(n.path,n.name);return t}function fS(e,t){return t.get(e)??e.split("/").pop()??e}function ew(e,t){const n=e.filter(r=>!t.has(r.path));return n.length===e.length?e:n}function tw(e,t,n,r,s){const i=e.filter(l=>l.path!==t);return[{path:t,ts:n,kind:r},...i].slice(0,s)}function JL(e,t){if(!e.length)return null;const n=dS(t),r=new Set,s=[];for(const o of e)r.has(o.path)||(r.add(o.path),s.push(o.path));const i=s.slice(0,2).map(o=>fS(o,n));return{count:s.length,names:i,extra:Math.max(0,s.length-i.length)}}function ZL(e,t,n,r){if(!e.length)return[];const s=dS(t);return e.map(i=>({path:i.path,label:fS(i.path,s),timeLabel:r(i.ts,n)}))}function eO(e){const[t,n]=c.useState([]),[r,s]=c.useState([]),[i,o]=c.useState(new Map),l=c.useRef(new Map),a=c.useRef(new Set),d=c.useRef(new Set),f=c.useRef(new Set);c.useEffect(()=>()=>{for(const S of l.current.values())window.clearTimeout(S);l.current.clear(),a.current.clear()},[]),c.useEffect(()=>{d.current=new Set(e),n(S=>ew(S,f.current))},[e]);const h=c.useCallback((S,v)=>{if(v!=null){if(a.current.has(v))return;if(a.current.add(v),a.current.size>GL){const C=a.current.values().next().value;C!=null&&a.current.delete(C)}}const x=v!=null?`event:${v}`:`event:${S}:${Date.now()}`;o(C=>{if(C.get(S)===x)return C;const R=new Map(C);return R.set(S,x),R});const p=l.current,g=p.get(S);g!=null&&window.clearTimeout(g);const k=window.setTimeout(()=>{o(C=>{if(C.get(S)!==x)return C;const R=new Map(C);return R.delete(S),R}),p.delete(S)},kI);p.set(S,k)},[]),m=c.useCallback(S=>{f.current=S,n(v=>ew(v,S))},[]),y=c.useCallback((S,v,x)=>{const p=Date.now();d.current.has(S)&&f.current.has(S)||n(k=>tw(k,S,p,v,YL)),h(S,x)},[h]),b=c.useCallback((S,v,x)=>{const p=Date.now(),g=N1(x)??p;s(k=>tw(k,S,g,v,XL))},[]),w=c.useCallback(()=>{n([])},[]);return{offViewActivity:t,recentTouches:r,highlightedPaths:i,onVisiblePathsChange:m,markRecentActivity:y,markRecentTouch:b,clearOffViewActivity:w}}function tO(e){return Array.isArray(e)&&(e[0]==="folder"||e[0]==="search")}function nw(e,t){if(Array.isArray(e))for(const n of e){const r=n.path;typeof r=="string"&&r&&t.add(r)}}function nO(e){if(!e||typeof e!="object")return[];const t=new Set;nw(e.items,t);const n=e.pages;if(Array.isArray(n))for(const r of n)nw(r==null?void 0:r.items,t);return Array.from(t)}function rw(e){return e.queryHash??JSON.stringify(e.queryKey)}function rO(e,t){if(e.path!==t.path)return e;const n=Object.prototype.hasOwnProperty.call(t,"star"),r=t.metrics!==void 0,s=t.notes!==void 0;let i=e;return n&&e.star!==t.star&&(i={...i,star:t.star??null}),r&&(i={...i,metrics:t.metrics??void 0}),s&&e.notes!==t.notes&&(i={...i,notes:t.notes??""}),i}function sw(e,t){if(!e)return e;let n=!1;const r=e.items.map(s=>{const i=rO(s,t);return i!==s&&(n=!0),i});return n?{...e,items:r}:e}class sO{constructor(){ge(this,"hashesByPath",new Map);ge(this,"pathsByHash",new Map);ge(this,"queryKeyByHash",new Map)}seed(t){this.hashesByPath.clear(),this.pathsByHash.clear(),this.queryKeyByHash.clear();for(const n of t)this.syncQuery(n)}syncQuery(t){var i;const n=rw(t);if(this.deleteHash(n),!tO(t.queryKey))return;const r=nO((i=t.state)==null?void 0:i.data);if(!r.length)return;const s=new Set(r);this.pathsByHash.set(n,s),this.queryKeyByHash.set(n,t.queryKey);for(const o of s){const l=this.hashesByPath.get(o)??new Set;l.add(n),this.hashesByPath.set(o,l)}}removeQuery(t){this.deleteHash(rw(t))}getQueryKeys(t){const n=this.hashesByPath.get(t);if(!n||!n.size)return[];const r=[];for(const s of n){const i=this.queryKeyByHash.get(s);i&&r.push(i)}return r}deleteHash(t){const n=this.pathsByHash.get(t);if(n){for(const r of n){const s=this.hashesByPath.get(r);s&&(s.delete(t),s.size||this.hashesByPath.delete(r))}this.pathsByHash.delete(t)}this.queryKeyByHash.delete(t)}}function iO(e,t){const n=t==null?void 0:t.query;if(n){if((t==null?void 0:t.type)==="removed"){e.removeQuery(n);return}e.syncQuery(n)}}function oO(e,t,n,r={}){const s=Object.prototype.hasOwnProperty.call(n,"star"),i=n.metrics!==void 0,o=n.notes!==void 0;if(!(!s&&!i&&!o))for(const l of t.getQueryKeys(n.path))e.getQueryState(l)&&e.setQueryData(l,a=>aO(a,n,r.removeConclusiveFilterMismatch?lO(l):null))}function lO(e){if(!Array.isArray(e)||e[0]!=="folder-query")return null;const t=e[1];if(!Array.isArray(t))return null;const n=t[3];return!n||typeof n!="object"||!Array.isArray(n.and)?null:n}function aO(e,t,n){if(!e)return e;const r=e.pages;if(!Array.isArray(r))return sw(e,t);let s=!1,i=!1;const o=r.map(a=>{const d=sw(a,t);if(n&&d){const f=d.items.filter(h=>h.path!==t.path||Xb([h],n).length>0);if(f.length!==d.items.length)return s=!0,i=!0,{...d,items:f}}return d!==a&&(s=!0),d}),l=i?o.map(a=>{const d=a.filtered_total;return typeof d=="number"?{...a,filtered_total:Math.max(0,d-1)}:a}):o;return s?{...e,pages:l}:e}function iw(e){if(!e||typeof e!="object")return null;const t=e.dependency_manifest;if(t)return t;const n=e.pages;if(!Array.isArray(n))return null;for(const r of n){const s=r==null?void 0:r.dependency_manifest;if(s)return s}return null}function ow(e,t){if(!e.length)return!1;if(!t||t.unknown)return!0;const n=new Set(t.fields),r=new Set(t.metric_keys),s=new Set(t.categorical_keys);for(const i of e)if(n.has(i)||i==="metrics"&&r.size>0||i==="categoricals"&&s.size>0||i.startsWith("metric:")&&r.has(i.slice(7))||i.startsWith("categorical:")&&s.has(i.slice(12)))return!0;return!1}const uO=512,cO=10*6e4;class dO{constructor(t,n,r=()=>{var s;return((s=globalThis.performance)==null?void 0:s.now())??Date.now()}){ge(this,"seenMutationIds",new Map);ge(this,"pendingChangedFields",new Set);ge(this,"forceReconciliation",!1);ge(this,"throwOnReconciliationError",!1);ge(this,"active",null);ge(this,"reconciliationPasses",0);this.queryClient=t,this.project=n,this.now=r}accept(t){const n=this.now();if(this.pruneSeen(n),this.seenMutationIds.has(t.mutationId))return!1;if(this.seenMutationIds.set(t.mutationId,n),this.pruneSeen(n),this.project(t.item,{removeConclusiveFilterMismatch:!0,replaceMutableMetrics:t.replaceMutableMetrics}),!this.hasRelevantActiveQuery(t.changedFields))return!0;for(const r of t.changedFields)this.pendingChangedFields.add(r);return this.startReconciliation(),!0}diagnostics(){return this.pruneSeen(this.now()),{seenMutationIds:this.seenMutationIds.size,active:this.active!==null,reconciliationPasses:this.reconciliationPasses}}async whenIdle(){for(;this.active;)await this.active}async reconcileAll(){this.forceReconciliation=!0,this.throwOnReconciliationError=!0,this.startReconciliation(),await this.whenIdle()}pruneSeen(t){for(const[n,r]of this.seenMutationIds){if(t-r<=cO)break;this.seenMutationIds.delete(n)}for(;this.seenMutationIds.size>uO;){const n=this.seenMutationIds.keys().next().value;if(n===void 0)break;this.seenMutationIds.delete(n)}}hasRelevantActiveQuery(t){return this.queryClient.getQueryCache().findAll({type:"active"}).some(n=>lw(n.queryKey)&&ow(t,iw(n.state.data)))}startReconciliation(){if(this.active)return;const t=async()=>{await this.runPass(),(this.pendingChangedFields.size>0||this.forceReconciliation)&&await this.runPass()};this.active=t().finally(()=>{this.active=null,(this.pendingChangedFields.size>0||this.forceReconciliation)&&this.startReconciliation()})}async runPass(){const t=Array.from(this.pendingChangedFields);this.pendingChangedFields.clear();const n=this.forceReconciliation;this.forceReconciliation=!1;const r=this.throwOnReconciliationError;this.throwOnReconciliationError=!1;const s=this.queryClient.getQueryCache().findAll({type:"active"}).filter(i=>lw(i.queryKey)&&(n||ow(t,iw(i.state.data))));s.length&&(this.reconciliationPasses+=1,await Promise.all(s.map(i=>this.queryClient.invalidateQueries({queryKey:i.queryKey,exact:!0,refetchType:"active"},{throwOnError:r}))))}}function lw(e){return Array.isArray(e)&&(e[0]==="folder-query"||e[0]==="folder-facets")}function fO(e){const t=globalThis.requestIdleCallback;return typeof t=="function"?t(e):globalThis.setTimeout(e,0)}function hO(e){const t=globalThis.cancelIdleCallback;if(typeof t=="function"&&typeof e=="number"){t(e);return}globalThis.clearTimeout(e)}function mO(e,t=200){let n=null,r=null,s=null;const i=()=>{n!=null&&(globalThis.clearTimeout(n),n=null),r!=null&&(hO(r),r=null)},o=()=>{if(s==null)return;const l=s;s=null,e(l)};return{schedule(l){s=l,i(),n=globalThis.setTimeout(()=>{n=null,r=fO(()=>{r=null,o()})},t)},flush(){i(),o()},cancel(){i(),s=null}}}const pO=250,gO=[250,500,1e3,2e3,4e3];function yO(e,t=pO){let n=null;return{schedule:()=>{n!==null&&globalThis.clearTimeout(n),n=globalThis.setTimeout(()=>{n=null,e()},t)},cancel:()=>{n!==null&&globalThis.clearTimeout(n),n=null}}}function vO(e,t=gO){let n=0,r=null;const s=()=>{r!==null&&globalThis.clearTimeout(r),r=null};return{schedule:()=>{if(r!==null||n>=t.length)return;const i=t[n];n+=1,r=globalThis.setTimeout(()=>{r=null,e()},i)},reset:()=>{s(),n=0},cancel:()=>{s(),n=t.length}}}function wO(e){switch(e){case"live":return"Live";case"reconnecting":return"Reconnecting…";case"offline":return"Offline";case"connecting":case"idle":default:return"Connecting…"}}function xO({queryClient:e,updateItemCaches:t,setLocalStarOverrides:n,applyPresenceCounts:r,markRecentActivity:s,markRecentTouch:i,updateLastEdited:o}){const[l,a]=c.useState("idle"),d=c.useRef(t);d.current=t;const f=c.useRef(null);return(!f.current||f.current.queryClient!==e)&&(f.current={queryClient:e,reconciler:new dO(e,(h,m)=>d.current(h,m))}),c.useEffect(()=>{var E;const h=(E=f.current)==null?void 0:E.reconciler;if(!h)return;const m=yO(()=>{e.invalidateQueries({queryKey:["folder-fields"],refetchType:"active"})});let y=!0,b=0;const w=vO(()=>{v()}),S=async(N,j)=>{const P=as.observeStatus(N,j);if(!P.length)return;const $=P.flatMap(({path:U})=>[e.invalidateQueries({queryKey:Js(U),refetchType:"active"},{throwOnError:!0}),e.invalidateQueries({queryKey:up(U),refetchType:"active"},{throwOnError:!0})]);await Promise.all([...$,h.reconcileAll()]),y&&as.acknowledgeRepairs(P)},v=async()=>{b+=1;const N=b;try{const j=await Fe.getSyncState();if(!y||N!==b)return;await S(j,"sync"),w.reset()}catch{y&&w.schedule()}},x=(N,j,P)=>N.mutation_id||`${j}:event:${P??`${N.path}:${N.version??0}:${N.updated_at??""}`}`,p=(N,j)=>{if(!h.accept({mutationId:x(N,"item-updated",j),changedFields:N.changed_fields??["unknown"],item:{path:N.path,star:N.star??null,metrics:N.metrics,notes:N.notes??""},replaceMutableMetrics:N.metrics!==void 0}))return;N.accepted_event&&N.durable_watermark&&as.observeAccepted(N.path,N.accepted_event,N.persistence??"pending",N.durable_watermark);const U={...e.getQueryData(Js(N.path)),v:1,tags:N.tags??[],notes:N.notes??"",star:N.star??null,version:N.version??1,updated_at:N.updated_at??"",updated_by:N.updated_by??"server"};w1(e,N.path,U),aP(N.path,U),s(N.path,"item-updated",j),i(N.path,"item-updated",N.updated_at),o(N.updated_at),n(q=>{if(q[N.path]===void 0)return q;const V={...q};return delete V[N.path],V})},g=G2(N=>{p({...N.response.sidecar,path:N.path,mutation_id:N.response.mutation_id,changed_fields:N.changedFields},null)});FN();const k=DN(N=>{if(N.type==="table-source"){zy();return}if(N.type==="persistence"){S(N.data,"event").then(w.reset,w.schedule);return}if(N.type==="presence"){const $=N.data;if(!($!=null&&$.gallery_id))return;r([$]);return}const j=N.data;if(!(j!=null&&j.path))return;const P=j.path;if(N.type==="item-updated"){const $=N.data;p({...$,path:P},N.id)}else if(N.type==="metrics-updated"){const $=N.data;if(!h.accept({mutationId:x($,"metrics-updated",N.id),changedFields:$.changed_fields??["unknown"],item:{path:P,metrics:$.metrics},replaceMutableMetrics:!0}))return;$.accepted_event&&$.durable_watermark&&as.observeAccepted(P,$.accepted_event,$.persistence??"pending",$.durable_watermark),m.schedule(),s(P,"metrics-updated",N.id),i(P,"metrics-updated",$.updated_at),o($.updated_at)}}),C=zN(N=>{a(N),N==="live"&&(v(),zy())}),R=W2(()=>{v()});return()=>{y=!1,b+=1,m.cancel(),w.cancel(),g(),k(),C(),R(),AN()}},[r,s,i,e,n,o]),l}function aw(e){if(typeof e!="number"||!Number.isFinite(e))return;const t=Math.trunc(e);return t<0?0:t}function bO(e){if(typeof e!="string")return;const t=e.trim();return t.length?t:void 0}function SO(e){if(!e)return null;const t=e.state;if(t!=="idle"&&t!=="running"&&t!=="ready"&&t!=="error")return null;let n=aw(e.done);const r=aw(e.total);return n!==void 0&&r!==void 0&&n>r&&(n=r),{state:t,scope:typeof e.scope=="string"?e.scope:void 0,done:n,total:r,generation:bO(e.generation),started_at:typeof e.started_at=="string"?e.started_at:void 0,finished_at:typeof e.finished_at=="string"?e.finished_at:void 0,error:typeof e.error=="string"?e.error:void 0}}function kO(e,t){return e===t?!0:!e||!t?!1:e.state===t.state&&e.scope===t.scope&&e.done===t.done&&e.total===t.total&&e.generation===t.generation&&e.started_at===t.started_at&&e.finished_at===t.finished_at&&e.error===t.error}function CO(e){return(e==null?void 0:e.state)==="idle"||(e==null?void 0:e.state)==="running"}function EO(e,t,n){return(e==null?void 0:e.state)==="running"?t:n}const MO=1200,uw=3e3,cw="Refresh unavailable in current mode";function RO(){let e=0;return{begin:()=>(e+=1,e),isCurrent:t=>t===e}}function NO(e){const t=e==null?void 0:e.refresh;if(t&&typeof t.enabled=="boolean")return t.enabled?{enabled:!0,note:null}:{enabled:!1,note:typeof t.note=="string"&&t.note.trim()?t.note:cw};const n=(e==null?void 0:e.mode)??null;return n==="table"&&(e==null?void 0:e.can_write)===!0?{enabled:!0,note:null}:n==="dataset"||n==="table"?{enabled:!1,note:cw}:{enabled:!0,note:null}}function jO(){const[e,t]=c.useState(!0),[n,r]=c.useState(null),[s,i]=c.useState(!0),[o,l]=c.useState(null),[a,d]=c.useState(null),[f,h]=c.useState(null),[m,y]=c.useState(null);return c.useEffect(()=>{let b=!1,w=null;const S=RO(),v=()=>{w!=null&&(window.clearTimeout(w),w=null)},x=k=>{v(),w=window.setTimeout(()=>{p()},k)},p=async()=>{var C,R;const k=S.begin();try{const E=await Fe.getHealth();if(b||!S.isCurrent(k))return;t(((C=E==null?void 0:E.labels)==null?void 0:C.enabled)??!0),(R=E==null?void 0:E.labels)!=null&&R.persistence&&as.observeStatus(E.labels.persistence,"health"),r((E==null?void 0:E.mode)??null);const N=NO(E);i(N.enabled),l(N.note),h((E==null?void 0:E.table_launch_status)??null),y((E==null?void 0:E.launch_session)??null);const j=SO(E==null?void 0:E.indexing);d(P=>kO(P,j)?P:j),CO(j)&&x(EO(j,MO,uw))}catch{if(b||!S.isCurrent(k))return;x(uw)}},g=BN(()=>{p()});return p(),()=>{b=!0,v(),g()}},[]),{persistenceEnabled:e,healthMode:n,refreshEnabled:s,refreshDisabledReason:o,indexing:a,tableLaunchStatus:f,launchSession:m}}function dw(e){if(!(e instanceof jn))return null;const t=e.body;if(!t||typeof t!="object")return null;const n=t.error;return typeof n=="string"?n:null}function _O({currentGalleryId:e,connectionStatus:t,applyPresenceCounts:n,clearPresenceScope:r}){const s=c.useRef(null),i=c.useRef(null),o=c.useRef(null),l=c.useRef(!1),a=c.useRef(null),d=c.useRef("idle"),f=c.useCallback(()=>{a.current!=null&&(window.clearTimeout(a.current),a.current=null)},[]),h=c.useCallback(p=>{s.current=p.lease_id,i.current=p.gallery_id,n([p])},[n]),m=c.useCallback(async(p,g=!1)=>{const k=g?void 0:s.current??void 0,C=R=>Fe.joinPresence(p,R);try{h(await C(k));return}catch(R){if(!g&&dw(R)==="invalid_lease"){h(await C(void 0));return}throw R}},[h]),y=c.useCallback(async(p,g)=>{if(p===g){await m(g);return}const k=s.current;if(!k){await m(g,!0);return}try{const C=await Fe.movePresence(p,g,k);i.current=C.to_scope.gallery_id,n([C.from_scope,C.to_scope]);return}catch(C){const R=dw(C);if(R==="invalid_lease"){await m(g,!0);return}if(R==="scope_mismatch"){await m(g);return}throw C}},[n,m]),b=c.useCallback(async p=>{const g=i.current;if(!g){await m(p,!0);return}if(g===p){await m(p);return}await y(g,p)},[m,y]),w=c.useCallback(async()=>{if(l.current)return;const p=o.current;if(p){o.current=null,l.current=!0;try{await b(p)}catch{}finally{l.current=!1;const g=o.current;g&&g!==i.current&&w()}}},[b]),S=c.useCallback((p,g=!1)=>{if(o.current=p,f(),g||i.current==null){w();return}a.current=window.setTimeout(()=>{a.current=null,w()},SI)},[f,w]),v=c.useCallback(()=>{i.current=null,s.current=null,o.current=null,f()},[f]),x=c.useCallback(p=>{const g=i.current,k=s.current;!g||!k||(KN(g,k),p&&r(g),v())},[r,v]);c.useEffect(()=>{const p=i.current;p!==e&&S(e,p==null)},[e,S]),c.useEffect(()=>{const p=window.setInterval(()=>{const g=i.current;g&&m(g)},bI);return()=>{window.clearInterval(p)}},[m]),c.useEffect(()=>{const p=d.current;if(d.current=t,t==="live"&&p!=="live"){S(e,!0);return}(t==="reconnecting"||t==="offline")&&r(i.current)},[r,t,e,S]),c.useEffect(()=>{const p=()=>x(!0),g=()=>x(!0),k=()=>{S(e,!0)};return window.addEventListener("pagehide",p),window.addEventListener("beforeunload",g),window.addEventListener("pageshow",k),()=>{window.removeEventListener("pagehide",p),window.removeEventListener("beforeunload",g),window.removeEventListener("pageshow",k),x(!1)}},[e,S,x])}function fw(e,t){return t-e<xI?xP(e,t):bP(e)}function PO(){const[e,t]=c.useState(null),[n,r]=c.useState(null),[s,i]=c.useState(!1),[o,l]=c.useState(()=>Date.now());c.useEffect(()=>{if(n==null){i(!1);return}i(!0);const h=window.setTimeout(()=>i(!1),vI);return()=>window.clearTimeout(h)},[n]),c.useEffect(()=>{if(e==null)return;l(Date.now());const h=window.setInterval(()=>l(Date.now()),1e4);return()=>window.clearInterval(h)},[e]);const a=c.useCallback(h=>{const m=Date.now(),b=N1(h)??m,w=b>m?m:b;t(S=>S==null?w:S>w?S:w),r(m),l(m)},[]),d=e!=null,f=c.useMemo(()=>!d||e==null?"No edits yet.":fw(e,o),[d,e,o]);return{recentEditActive:s,hasEdits:d,lastEditedNow:o,lastEditedLabel:f,updateLastEdited:a,formatTimestampLabel:fw}}function TO({current:e,currentGalleryId:t,itemPaths:n,items:r,queryClient:s,updateItemCaches:i,setLocalStarOverrides:o}){const[l,a]=c.useState({}),{offViewActivity:d,recentTouches:f,highlightedPaths:h,onVisiblePathsChange:m,markRecentActivity:y,markRecentTouch:b,clearOffViewActivity:w}=eO(n),{recentEditActive:S,hasEdits:v,lastEditedNow:x,lastEditedLabel:p,updateLastEdited:g,formatTimestampLabel:k}=PO(),{persistenceEnabled:C,healthMode:R,refreshEnabled:E,refreshDisabledReason:N,indexing:j,tableLaunchStatus:P,launchSession:$}=jO(),U=c.useCallback(O=>{O.length&&a(L=>{let F=!1;const T={...L};for(const H of O){const G=L[H.gallery_id];G&&G.viewing===H.viewing&&G.editing===H.editing||(T[H.gallery_id]=H,F=!0)}return F?T:L})},[]),q=c.useCallback(O=>{O&&a(L=>{if(!(O in L))return L;const F={...L};return delete F[O],F})},[]),V=xO({queryClient:s,updateItemCaches:i,setLocalStarOverrides:o,applyPresenceCounts:U,markRecentActivity:y,markRecentTouch:b,updateLastEdited:g});_O({currentGalleryId:t,connectionStatus:V,applyPresenceCounts:U,clearPresenceScope:q});const A=l[e],Z=(A==null?void 0:A.editing)??0,D=c.useMemo(()=>wO(V),[V]),z=c.useMemo(()=>JL(d,r),[d,r]),B=c.useMemo(()=>ZL(f,r,x,k),[r,x,f]);return{connectionStatus:V,connectionLabel:D,presence:A,editingCount:Z,recentEditActive:S,hasEdits:v,lastEditedLabel:p,persistenceEnabled:C,healthMode:R,refreshEnabled:E,refreshDisabledReason:N,indexing:j,tableLaunchStatus:P,launchSession:$,highlightedPaths:h,onVisiblePathsChange:m,offViewSummary:z,recentTouchesDisplay:B,clearOffViewActivity:w}}function IO(e){return Array.from(new Set(e.filter(Boolean)))}function LO({selectedPaths:e,setSelectedPaths:t}){const[n,r]=c.useState(null),s=c.useCallback(l=>{const a=IO(e);return a.includes(l)?a:[l]},[e]),i=c.useCallback((l,a)=>{const d=s(l);t(d),r({x:a.x,y:a.y,kind:"grid",payload:{paths:d}})},[s,t]),o=c.useCallback((l,a)=>{r({x:a.x,y:a.y,kind:"tree",payload:{path:l}})},[]);return c.useEffect(()=>{const l=()=>r(null),a=d=>{d.key==="Escape"&&r(null)};return window.addEventListener("click",l),window.addEventListener("keydown",a),()=>{window.removeEventListener("click",l),window.removeEventListener("keydown",a)}},[]),{ctx:n,setCtx:r,openGridActions:i,openFolderActions:o}}function OO({setCurrent:e,syncHashImageSelection:t,bumpRestoreGridToSelectionToken:n}){const r=c.useRef(!1),s=ai(t),i=ai(n);c.useEffect(()=>{const o=a=>{const{folderTarget:d,imageTarget:f}=M1(a),h=!r.current;r.current=!0,s.current(f),e(m=>{const y=fL(m,d,f,h);return m===y?m:(i.current(),y)})};o(Lh());const l=()=>o(Lh());return window.addEventListener("hashchange",l),()=>window.removeEventListener("hashchange",l)},[i,e,s])}const Yo={kind:"none"};function FO(e,t){if(t.viewerOpen||t.compareOpen||e.activeModalOpen)return Yo;const n=e.key.toLowerCase(),r=e.ctrlKey||e.metaKey,s=r&&!e.altKey;if(r&&n==="b"&&!e.targetIsInput){const i=KP({leftContentOpen:t.leftOpen,rightOpen:t.rightOpen,altKey:e.altKey});return{kind:"toggleSidebars",leftOpen:i.leftContentOpen,rightOpen:i.rightOpen}}return e.targetIsKeyboardControl?Yo:s&&n==="a"?{kind:"selectAll"}:e.altKey||e.ctrlKey||e.metaKey?Yo:e.key==="Backspace"||e.key==="Delete"?{kind:"openParentFolder"}:e.key==="Escape"?t.selectedCount?{kind:"clearSelection"}:t.mobileSelectMode?{kind:"exitMobileSelectMode"}:Yo:e.key==="/"?t.isNarrowViewport?{kind:"openMobileSearch"}:{kind:"focusDesktopSearch"}:Yo}function AO(e){return{key:e.key,altKey:e.altKey,ctrlKey:e.ctrlKey,metaKey:e.metaKey,targetIsInput:Zm(e.target),targetIsKeyboardControl:Qb(e.target),activeModalOpen:x_()}}function DO(e){return{viewerOpen:e.viewerOpen,compareOpen:e.compareOpen,selectedCount:e.selectedPaths.length,mobileSelectMode:e.mobileSelectMode,leftOpen:e.leftOpen,rightOpen:e.rightOpen,isNarrowViewport:e.viewportWidth<=hl.narrowMax}}function zO(e){const t=ai(e);c.useEffect(()=>{const n=r=>{const s=t.current,i=FO(AO(r),DO(s));i.kind!=="none"&&(r.preventDefault(),i.kind==="toggleSidebars"?(s.setLeftOpen(i.leftOpen),s.setRightOpen(i.rightOpen)):i.kind==="selectAll"?s.setSelectedPaths(s.items.map(o=>o.path)):i.kind==="openParentFolder"?s.openFolder(E1(s.current)):i.kind==="clearSelection"?s.setSelectedPaths([]):i.kind==="exitMobileSelectMode"?s.setMobileSelectMode(!1):i.kind==="openMobileSearch"?s.setMobileSearchOpen(!0):s.focusDesktopSearch())};return window.addEventListener("keydown",n),()=>window.removeEventListener("keydown",n)},[t])}const $O=1e4;function Yn(e){const t=e.trim();return!t||t==="/"?"/":t.startsWith("/")?t:`/${t}`}function hS(e,t){const n=Yn(t),r=e[n];return r||{path:n,hydratedSnapshot:null,hydratedGeneratedAt:null,hydratedItemCount:0,hydratedAtMs:null,topAnchorPath:null}}function Hh(e,t){return t==="/"?!0:e===t||e.startsWith(`${t}/`)}function BO(e){for(const t of e)return t;return null}function UO(e,t,n,r){const s=hS(e,t),i=n.items.length<=$O?n:null,o={...s,path:Yn(t),hydratedSnapshot:i,hydratedGeneratedAt:n.generated_at??null,hydratedItemCount:n.total_items??n.items.length,hydratedAtMs:r};return s.hydratedSnapshot===o.hydratedSnapshot&&s.hydratedGeneratedAt===o.hydratedGeneratedAt&&s.hydratedItemCount===o.hydratedItemCount&&s.hydratedAtMs===o.hydratedAtMs?e:{...e,[o.path]:o}}function hw(e,t,n){const r=hS(e,t),s=Yn(t),i=n?Yn(n):null;return r.topAnchorPath===i&&r.path===s?e:{...e,[s]:{...r,path:s,topAnchorPath:i}}}function mS(e,t){const n=Yn(t);if(!e[n])return e;const r={...e};return delete r[n],r}function HO(e,t){const n=Yn(t);let r=!1;const s={...e};for(const i of Object.keys(s))Hh(i,n)&&(r=!0,delete s[i]);return r?s:e}function KO(e,t){const n=Yn(e),r=Yn(t);return!!(n===r||Hh(n,r)||Hh(r,n))}function VO(e,t,n){return KO(t,n)?e:mS(e,n)}function WO(){const e=c.useRef({}),t=c.useCallback(h=>e.current[Yn(h)]??null,[]),n=c.useCallback(h=>{var m;return((m=e.current[Yn(h)])==null?void 0:m.hydratedSnapshot)??null},[]),r=c.useCallback(h=>{var m;return((m=e.current[Yn(h)])==null?void 0:m.topAnchorPath)??null},[]),s=c.useCallback((h,m)=>{e.current=UO(e.current,h,m,Date.now())},[]),i=c.useCallback((h,m)=>{e.current=hw(e.current,h,m)},[]),o=c.useCallback((h,m)=>{const y=BO(m);y&&(e.current=hw(e.current,h,y))},[]),l=c.useCallback(h=>{e.current=mS(e.current,h)},[]),a=c.useCallback(h=>{e.current=HO(e.current,h)},[]),d=c.useCallback((h,m)=>{e.current=VO(e.current,h,m)},[]),f=c.useCallback(()=>{e.current={}},[]);return c.useMemo(()=>({getSession:t,getHydratedSnapshot:n,getTopAnchorPath:r,saveHydratedSnapshot:s,saveTopAnchorPath:i,saveTopAnchorFromVisiblePaths:o,invalidatePath:l,invalidateSubtree:a,invalidateForScopeTransition:d,clearAllSessions:f}),[t,n,r,s,i,o,l,a,d,f])}function qO(e){const t=qt(e||"/");return t===""?"/":t}function QO(e,t){return t==="/"?e.startsWith("/"):e===t||e.startsWith(`${t}/`)}function GO({current:e,refreshEnabled:t,queryClient:n,refetch:r,invalidateFolderSessionSubtree:s,setScopeSessionResetToken:i,onActionStart:o,onActionError:l}){const[a,d]=c.useState(0),[f,h]=c.useState(!1),m=c.useCallback(()=>{d(v=>v+1)},[]),y=c.useCallback(v=>{const x=p=>v==="/"?!0:p===v||p.startsWith(`${v}/`);n.invalidateQueries({predicate:({queryKey:p})=>{if(!Array.isArray(p)||p[0]!=="folder"&&p[0]!=="folder-query"&&p[0]!=="folder-facets")return!1;const g=typeof p[1]=="string"?p[1]:"";return x(g)}})},[n]),b=c.useCallback(async v=>{if(!t)return;const x=qO(v);await Fe.refreshFolder(x),y(x),m(),s(x),QO(e,x)&&(i(p=>p+1),await r()),Wu.evictPrefix(x),zi.evictPrefix(x),Wr.evictPrefix(x)},[e,m,s,y,r,t,i]),w=c.useCallback(async()=>{if(t){o==null||o();try{await b(e)}catch(v){l==null||l("Refresh folder failed",v)}}},[e,l,o,t,b]),S=c.useCallback(async()=>{if(!(!t||f)){h(!0),o==null||o();try{await b("/")}catch(v){l==null||l("Refresh root folder failed",v)}finally{h(!1)}}},[f,l,o,t,b]);return{folderCountsVersion:a,headerRefreshBusy:f,refreshFolderPath:b,handlePullRefreshFolders:w,handleHeaderRefresh:S}}const mw=[1,1.25,1.5,1.75,2,3,4];function YO(e){return mw.reduce((t,n)=>Math.abs(n-e)<Math.abs(t-e)?n:t,mw[0])}function XO(){var s;const e=window.devicePixelRatio||1,t=YO(e),n=((s=window.visualViewport)==null?void 0:s.scale)??1,r=e*n/t;return Number.isFinite(r)?Math.min(500,Math.max(25,Math.round(r*100))):null}function JO(){const[e,t]=c.useState(null),[n,r]=c.useState(null);c.useEffect(()=>{if(typeof window>"u")return;const o=()=>{t(XO())};o(),window.addEventListener("resize",o),window.addEventListener("orientationchange",o);const l=window.visualViewport;return l&&l.addEventListener("resize",o),()=>{window.removeEventListener("resize",o),window.removeEventListener("orientationchange",o),l&&l.removeEventListener("resize",o)}},[]),c.useEffect(()=>{Bh(e)===null&&r(null)},[e]);const s=c.useMemo(()=>mL(e,n),[e,n]),i=c.useCallback(()=>{r(Bh(e))},[e]);return{visibleBrowserZoomPercent:s,dismissBrowserZoomWarning:i}}const pw=100;function ZO(e){return e.ctrlKey||e.metaKey}function eF(e,t){const n=Math.trunc(t/pw);if(n===0)return{gridItemSize:e,remainingDelta:t};const r=e+n*ws.step,s=jb(r);return{gridItemSize:s,remainingDelta:s===r?t-n*pw:0}}function gw(e){if(e.length<2)return 0;const[t,n]=[e[0],e[1]];return Math.hypot(t.clientX-n.clientX,t.clientY-n.clientY)}function tF({target:e,getGridItemSize:t,onGridItemSizeChange:n,requestFrame:r,cancelFrame:s}){let i=null,o=0,l=null;const a=()=>{l=null;const y=t(),b=eF(y,o);o=b.remainingDelta,b.gridItemSize!==y&&n(b.gridItemSize)},d=y=>{ZO(y)&&(y.preventDefault(),o-=y.deltaY,l===null&&(l=r(a)))},f=y=>{if(y.touches.length!==2)return;const b=gw(y.touches);b&&(i={dist:b,size:t()})},h=y=>{if(!i||y.touches.length!==2)return;const b=gw(y.touches);b&&(y.preventDefault(),n(jb(i.size*(b/i.dist))))},m=()=>{i=null};return e.addEventListener("wheel",d,{passive:!1}),e.addEventListener("touchstart",f,{passive:!0}),e.addEventListener("touchmove",h,{passive:!1}),e.addEventListener("touchend",m),e.addEventListener("touchcancel",m),()=>{e.removeEventListener("wheel",d),e.removeEventListener("touchstart",f),e.removeEventListener("touchmove",h),e.removeEventListener("touchend",m),e.removeEventListener("touchcancel",m),l!==null&&s(l)}}function nF({gridRef:e,disabled:t,gridItemSize:n,onGridItemSizeChange:r}){const s=ai(n),i=ai(r);c.useEffect(()=>{if(t)return;const o=e.current;if(o)return tF({target:o,getGridItemSize:()=>s.current,onGridItemSizeChange:l=>{s.current=l,i.current(l)},requestFrame:window.requestAnimationFrame.bind(window),cancelFrame:window.cancelAnimationFrame.bind(window)})},[t,s,e,i])}const Kt={viewState:"viewState",viewMode:"viewMode",gridItemSize:"gridItemSize",leftOpen:"leftOpen",rightOpen:"rightOpen",autoloadImageMetadata:"autoloadImageMetadata",compareOrderMode:"compareOrderMode",proxyHttpOriginals:"proxyHttpOriginals"},rF=["sortKey","sortDir","sortSpec","filterAst","selectedMetric"];function sF(e,t){e.removeItem(Kt.viewState);for(const n of rF)e.removeItem(n);e.setItem(Kt.viewMode,t.viewMode),e.setItem(Kt.gridItemSize,String(t.gridItemSize)),e.setItem(Kt.leftOpen,t.leftOpen?"1":"0"),e.setItem(Kt.rightOpen,t.rightOpen?"1":"0"),e.setItem(Kt.autoloadImageMetadata,t.autoloadImageMetadata?"1":"0"),e.setItem(Kt.compareOrderMode,t.compareOrderMode),e.setItem(Kt.proxyHttpOriginals,t.proxyHttpOriginals?"1":"0")}function iF(e){const t={},n=e.getItem(Kt.viewMode);(n==="grid"||n==="adaptive")&&(t.viewMode=n);const r=e.getItem(Kt.gridItemSize);if(r){const d=Number(r);!Number.isNaN(d)&&d>=ws.min&&d<=ws.max&&(t.gridItemSize=d)}const s=e.getItem(Kt.leftOpen);(s==="0"||s==="false")&&(t.leftOpen=!1);const i=e.getItem(Kt.rightOpen);(i==="0"||i==="false")&&(t.rightOpen=!1);const o=e.getItem(Kt.autoloadImageMetadata);o==="0"||o==="false"?t.autoloadImageMetadata=!1:(o==="1"||o==="true")&&(t.autoloadImageMetadata=!0);const l=e.getItem(Kt.compareOrderMode);(l==="gallery"||l==="selection")&&(t.compareOrderMode=l);const a=e.getItem(Kt.proxyHttpOriginals);return a==="1"||a==="true"?t.proxyHttpOriginals=!0:(a==="0"||a==="false")&&(t.proxyHttpOriginals=!1),t}function oF(){if(typeof window>"u")return{};try{return iF(window.localStorage)}catch{return{}}}function lF(e){if(!(typeof window>"u"))try{sF(window.localStorage,e)}catch{}}function aF({viewMode:e,gridItemSize:t,leftOpen:n,rightOpen:r,autoloadImageMetadata:s,compareOrderMode:i,proxyHttpOriginals:o}){const l=c.useRef(mO(lF));c.useEffect(()=>{if(typeof window>"u")return;const d=l.current,f=()=>d.flush();return window.addEventListener("pagehide",f),window.addEventListener("beforeunload",f),()=>{window.removeEventListener("pagehide",f),window.removeEventListener("beforeunload",f),d.flush()}},[]);const a=c.useMemo(()=>({viewMode:e,gridItemSize:t,leftOpen:n,rightOpen:r,autoloadImageMetadata:s,compareOrderMode:i,proxyHttpOriginals:o}),[s,i,t,n,o,r,e]);c.useEffect(()=>{l.current.schedule(a)},[a])}function uF(e,t){return`${qt(e)}\0${t}`}function cF(e,t,n,r){return e===n&&t===r}function dF({similarityState:e,setSimilarityState:t,selectedPaths:n,setSelectedPaths:r,setQuery:s,setViewState:i,bumpRestoreGridToSelectionToken:o,scopePath:l,sessionResetToken:a}){const d=c.useRef(null),f=uF(l,a),h=c.useRef(f),m=c.useRef(0);c.useLayoutEffect(()=>{h.current!==f&&(h.current=f,m.current+=1,d.current=null)},[f]);const y=c.useCallback(()=>{m.current+=1},[]),b=c.useCallback(()=>{m.current+=1,t(null);const v=d.current;d.current=null,v&&v.length?(r(v),o()):r([])},[o,r,t]),w=c.useCallback(()=>{e&&b(),s(""),i(v=>({...v,filters:{and:[]}}))},[b,s,i,e]),S=c.useCallback(async v=>{const x=!e&&d.current===null?[...n]:null,p=m.current+1;m.current=p;const g=f,k=await Fe.searchEmbeddings(v);if(!cF(g,p,h.current,m.current))return!1;x!==null&&d.current===null&&(d.current=x);const C=v.query.kind==="path"?v.query.path:null,R=v.query.kind==="vector"?v.query.vector_b64:null;if(t({scopePath:qt(l),sessionResetToken:a,embedding:k.embedding,queryPath:C,queryVector:R,topK:v.top_k??50,minScore:v.min_score??null,items:k.items,createdAt:Date.now()}),k.items.length){const E=C&&k.items.some(N=>N.path===C)?C:k.items[0].path;r([E]),o()}else r([]);return!0},[o,f,n,l,a,r,t,e]);return{cancelPendingSimilaritySearch:y,clearSimilarity:b,handleRevealOffView:w,handleSimilaritySearch:S}}const fF="No-write mode: exported Smart Folder JSON instead of saving.";function hF(e,t,n,r){const s=aL(e,t),i={id:s,name:e,pool:{kind:"folder",path:n},view:oi(JSON.parse(JSON.stringify(r)))};return{id:s,payload:i,nextViews:[...t.filter(o=>o.id!==s),i]}}function mF(e,t,n,r){if(!e)return!1;const s=t.find(i=>i.id===e);return s?s.pool.path!==n||JSON.stringify(oi(s.view))!==JSON.stringify(oi(r)):!0}function pF(e){return e instanceof jn&&e.status===403}function gF(e,t){return{filename:`lenslet-smart-folder-${e}.json`,json:JSON.stringify({version:1,views:t},null,2),type:"application/json"}}function yF({current:e,viewState:t,setViewState:n,openFolder:r}){const[s,i]=c.useState([]),[o,l]=c.useState(null);c.useEffect(()=>{let h=!0;return Fe.getViews().then(m=>{h&&i(m.views||[])}).catch(()=>{h&&i([])}),()=>{h=!1}},[]);const a=c.useCallback(async()=>{if(typeof window>"u")return;const h=window.prompt("Save Smart Folder as:","New Smart Folder");if(!h)return;const{id:m,nextViews:y}=hF(h,s,e,t);i(y),l(m);try{await Fe.saveViews({version:1,views:y})}catch(b){if(pF(b)){const w=gF(m,y),S=new Blob([w.json],{type:w.type});mu(S,w.filename),window.alert(fF);return}console.error("Failed to save Smart Folder:",b)}},[e,t,s]);c.useEffect(()=>{mF(o,s,e,t)&&l(null)},[o,s,e,t]);const d=c.useCallback(h=>{l(h.id),n(oi(h.view)),r(h.pool.path)},[r,n]),f=c.useCallback(()=>{l(null)},[]);return{views:s,activeViewId:o,activateView:d,clearActiveView:f,saveView:a}}function vF(){const[e,t]=c.useState(()=>typeof window>"u"?1440:window.innerWidth),[n,r]=c.useState(()=>typeof window>"u"?900:window.innerHeight);return c.useEffect(()=>{if(typeof window>"u")return;const s=()=>{t(window.innerWidth),r(window.innerHeight)};return s(),window.addEventListener("resize",s),window.addEventListener("orientationchange",s),()=>{window.removeEventListener("resize",s),window.removeEventListener("orientationchange",s)}},[]),{viewportWidth:e,viewportHeight:n}}const wF={starsIn:{read:e=>{const t=e.starsIn.values||[];return t.length?{id:"stars-in",label:`Rating in: ${Gv(t)}`}:null},clear:(e,t)=>t.clearStarsIn()},starsNotIn:{read:e=>{const t=e.starsNotIn.values||[];return t.length?{id:"stars-not-in",label:`Rating not in: ${Gv(t)}`}:null},clear:(e,t)=>t.clearStarsNotIn()},nameContains:{read:e=>{var n;const t=(n=e.nameContains.value)==null?void 0:n.trim();return t?{id:"name-contains",label:`Filename contains: ${t}`}:null},clear:(e,t)=>t.clearNameContains()},nameNotContains:{read:e=>{var n;const t=(n=e.nameNotContains.value)==null?void 0:n.trim();return t?{id:"name-not-contains",label:`Filename not: ${t}`}:null},clear:(e,t)=>t.clearNameNotContains()},notesContains:{read:e=>{var n;const t=(n=e.notesContains.value)==null?void 0:n.trim();return t?{id:"notes-contains",label:`Notes contain: ${t}`}:null},clear:(e,t)=>t.clearNotesContains()},notesNotContains:{read:e=>{var n;const t=(n=e.notesNotContains.value)==null?void 0:n.trim();return t?{id:"notes-not-contains",label:`Notes not: ${t}`}:null},clear:(e,t)=>t.clearNotesNotContains()},urlContains:{read:e=>{var n;const t=(n=e.urlContains.value)==null?void 0:n.trim();return t?{id:"url-contains",label:`URL contains: ${t}`}:null},clear:(e,t)=>t.clearUrlContains()},urlNotContains:{read:e=>{var n;const t=(n=e.urlNotContains.value)==null?void 0:n.trim();return t?{id:"url-not-contains",label:`URL not: ${t}`}:null},clear:(e,t)=>t.clearUrlNotContains()},dateRange:{read:e=>{const{from:t,to:n}=e.dateRange;return!t&&!n?null:{id:"date-range",label:`Date: ${cL(t,n)}`}},clear:(e,t)=>t.clearDateRange()},widthCompare:{read:e=>({id:"width-compare",label:`Width ${e.widthCompare.op} ${e.widthCompare.value}`}),clear:(e,t)=>t.clearWidthCompare()},heightCompare:{read:e=>({id:"height-compare",label:`Height ${e.heightCompare.op} ${e.heightCompare.value}`}),clear:(e,t)=>t.clearHeightCompare()},metricRange:{read:e=>({id:`metric:${e.metricRange.key}`,label:`${e.metricRange.key}: ${lS(e.metricRange.min,e.metricRange.max)}`}),clear:(e,t)=>t.clearMetricRange(e.metricRange.key)},categoricalIn:{read:e=>{const t=e.categoricalIn.values||[];return t.length?{id:`categorical:${e.categoricalIn.key}`,label:`${e.categoricalIn.key}: ${SF(t)}`}:null},clear:(e,t)=>t.clearCategoricalIn(e.categoricalIn.key)}};function xF(e,t){if("starsIn"in e)return t("starsIn",e);if("starsNotIn"in e)return t("starsNotIn",e);if("nameContains"in e)return t("nameContains",e);if("nameNotContains"in e)return t("nameNotContains",e);if("notesContains"in e)return t("notesContains",e);if("notesNotContains"in e)return t("notesNotContains",e);if("urlContains"in e)return t("urlContains",e);if("urlNotContains"in e)return t("urlNotContains",e);if("dateRange"in e)return t("dateRange",e);if("widthCompare"in e)return t("widthCompare",e);if("heightCompare"in e)return t("heightCompare",e);if("metricRange"in e)return t("metricRange",e);if("categoricalIn"in e)return t("categoricalIn",e)}function bF(e,t,n={}){const r=[],s=new Set(n.unavailableMetricKeys??[]),i=n.metricDisplayNames??null;for(const o of e.and)xF(o,(l,a)=>{const d=wF[l],f=d.read(a);if(!f)return;const h="metricRange"in a&&s.has(a.metricRange.key),m="metricRange"in a?`${ar(a.metricRange.key,i)}: ${lS(a.metricRange.min,a.metricRange.max)}`:f.label;r.push({id:f.id,label:h?`${m} (unavailable)`:m,onRemove:()=>d.clear(a,t)})});return r}function SF(e){const t=e.slice(0,3),n=e.length>t.length?`, +${e.length-t.length}`:"";return`${t.join(", ")}${n}`}function kF(e){return e instanceof Error&&e.message.trim()?e.message.trim():typeof e=="string"&&e.trim()?e.trim():null}function CF(e,t){const n=kF(t);return!n||n===e?e:`${e}: ${n}`}function EF(e){var n;const t=(n=e==null?void 0:e.title_label)==null?void 0:n.trim();return t?`Lenslet · ${t}`:"Lenslet"}const MF="lenslet.v2.theme.";function RF(e){if(typeof e!="string")return null;const t=e.trim();return t.length>0?t:null}function NF(e,t){const n=typeof e=="string"&&e.length>0?e:"browse";return typeof window<"u"&&window.location?`${n}:${window.location.origin}${window.location.pathname}`:`${n}:server`}function jF(e){let t=0xcbf29ce484222325n;const n=0x100000001b3n;for(let r=0;r<e.length;r+=1)t^=BigInt(e.charCodeAt(r)),t=BigInt.asUintN(64,t*n);return t.toString(16).padStart(16,"0")}function pS(){if(typeof window>"u")return null;try{return window.localStorage}catch{return null}}function gS(e,t,n){const r=RF(e),s=r?`workspace:${r}`:`fallback:${NF(t)}`;return`${MF}${jF(s)}`}function _F(e,t){const n=pS();if(!n)return null;const r=gS(e,t);try{const s=n.getItem(r);return Cb(s)?s:null}catch{return null}}function Kh(e,t){return _F(e,t)??"default"}function PF(e,t,n){const r=pS();if(!r)return;const s=gS(e,t);try{if(n==null){r.removeItem(s);return}r.setItem(s,n)}catch{}}function yw(e,t,n){return Math.max(0,e-Math.max(0,n-t))}function wp(e,t,n){const[r,s]=c.useState(()=>e&&n!=null&&yw(t,n,Date.now())===0);return c.useEffect(()=>{if(!e){s(!1);return}const i=n??Date.now(),o=yw(t,i,Date.now());if(o===0){s(!0);return}s(!1);const l=window.setTimeout(()=>s(!0),o);return()=>window.clearTimeout(l)},[e,t,n]),r}const yS=800,TF=800;function vS(e,t,n){return!t||n?e:" "}const wS=()=>Wm(()=>import("./CompareViewer-BtfY4arq.js"),__vite__mapDeps([0,1])),xS=()=>Wm(()=>import("./Inspector-BBVijhJH.js"),__vite__mapDeps([2,3])),IF=c.lazy(wS),LF=c.lazy(xS);function OF(){const e=()=>{xS().catch(()=>{}),wS().catch(()=>{})};if(typeof window.requestIdleCallback=="function"){const n=window.requestIdleCallback(e,{timeout:1e3});return()=>window.cancelIdleCallback(n)}const t=window.setTimeout(e,0);return()=>window.clearTimeout(t)}function vw(e){const t=c.useRef({key:e,revision:0});return t.current.key!==e&&(t.current={key:e,revision:t.current.revision+1}),t.current.revision}function ww(e,t,n,r){for(const s of e)Jm(n.get(s),r)||Fe.prefetchFile(s,t),Fe.prefetchThumb(s)}class Jd extends c.Component{constructor(){super(...arguments);ge(this,"state",{hasError:!1})}static getDerivedStateFromError(){return{hasError:!0}}componentDidUpdate(n){n.resetKey!==this.props.resetKey&&this.state.hasError&&this.setState({hasError:!1})}render(){return this.state.hasError?this.props.fallback:this.props.children}}function xw({message:e,onClose:t,busy:n=!1,visible:r=!0}){const s=wp(n,yS),i=vS(e,n,s);return u.jsx("div",{className:"app-right-panel inspector-panel col-start-3 row-start-2 border-l border-border bg-panel overflow-auto scrollbar-thin relative","data-inspector-panel":!0,"aria-busy":n?"true":void 0,"aria-hidden":!r||void 0,hidden:!r,children:u.jsxs("div",{className:"p-3 flex items-center justify-between gap-3 text-sm text-muted","data-lazy-surface":"inspector","data-loading-copy-visible":n&&s?"true":"false",children:[u.jsx("span",{children:i}),u.jsx("button",{className:"btn btn-sm",onClick:t,children:"Close"})]})})}function Zd({label:e,message:t,onClose:n,busy:r=!1}){const s=wp(r,yS),i=vS(t,r,s);return u.jsx("div",{role:"dialog","aria-modal":"true","aria-label":e,"aria-busy":r?"true":void 0,"data-lazy-surface":"overlay","data-loading-copy-visible":r&&s?"true":"false",tabIndex:-1,className:"toolbar-offset absolute inset-0 left-[var(--overlay-left)] right-[var(--overlay-right)] bg-panel z-viewer flex items-center justify-center",onKeyDown:o=>{o.key==="Escape"&&(o.preventDefault(),n())},children:u.jsxs("div",{className:"flex flex-col items-center gap-3 text-sm text-muted",children:[u.jsx("span",{children:i}),u.jsx("button",{className:"btn btn-sm",onClick:n,autoFocus:!0,children:"Close"})]})})}function FF({themeHealthMode:e,themeWorkspaceId:t}){var Jp,Zp,eg;c.useEffect(()=>OF(),[]);const[n,r]=c.useState("/"),[s]=c.useState(()=>SP()),[i]=c.useState(()=>oF()),[o,l]=c.useState(()=>s.query),[a,d]=c.useState(!1),[f,h]=c.useState(null),[m,y]=c.useState(null),[b,w]=c.useState(100),S=c.useCallback(_=>{w(Math.round(_)),y(_)},[]),{visibleBrowserZoomPercent:v,dismissBrowserZoomWarning:x}=JO(),[p,g]=c.useState(()=>s.viewState),[k,C]=c.useState(()=>s.randomSeed??Date.now()),[R,E]=c.useState(()=>i.viewMode??"adaptive"),[N,j]=c.useState(()=>i.gridItemSize??220),[P,$]=c.useState(!1),[U,q]=c.useState(!1),[V,A]=c.useState(!0),[Z,D]=c.useState(()=>i.leftOpen??!0),[z,B]=c.useState(()=>i.rightOpen??!0),{viewportWidth:O,viewportHeight:L}=vF(),[F,T]=c.useState("folders"),[H,G]=c.useState($T),[Y,re]=c.useState({resetKey:null,fields:{metric_keys:[],categorical_keys:[]}}),[le,he]=c.useState(()=>Kh(t,e)),[pe,Se]=c.useState(()=>i.autoloadImageMetadata??!0),[we,Ee]=c.useState(()=>i.proxyHttpOriginals??!1),[xe,Re]=c.useState(()=>i.compareOrderMode??"gallery"),[ue,Be]=c.useState(null),[ke,Ye]=c.useState(!1),[et,be]=c.useState(()=>s.unsupportedMetricIntent),[X,me]=c.useState(null),[Ne,K]=c.useState(!1),[W,fe]=c.useState(null),[ee,ce]=c.useState({}),Te=c.useRef(null),de=c.useRef(null),ut=c.useRef(null),Ke=c.useRef(null),sn=c.useRef(new sO),it=c.useRef(n),vt=c.useRef({query:s.query,randomSeed:s.randomSeed,viewState:s.viewState}),{leftW:mt,rightW:In,onResizeLeft:Ir,onResizeRight:Ln}=UP(Te,{userLeftOpen:Z,userRightOpen:z}),{getTopAnchorPath:fi,saveTopAnchorPath:Ft,invalidateSubtree:Lr}=WO(),[Rs,On]=c.useState(0),[Or,At]=c.useState(null),[Fn,jt]=c.useState(0),qe=xL(f,n,Fn);aF({viewMode:R,gridItemSize:N,leftOpen:Z,rightOpen:z,autoloadImageMetadata:pe,compareOrderMode:xe,proxyHttpOriginals:we});const pt=Ms(),on=rP(),hi=Po(),Ns=iP(),[To,mi]=c.useState(!1),Jn=c.useCallback(()=>{fe(null)},[]),dr=c.useCallback((_,te)=>{fe({kind:"error",message:CF(_,te)})},[]),fr=c.useCallback(async()=>{try{const _=await Fe.getTableSourceColumns();Be(_.enabled?_:null)}catch{Be(null)}},[]);c.useEffect(()=>{fr()},[fr]);const Fr=ue!=null&&ue.warning?`${ue.current??""}:${ue.warning}`:null,Io=Fr&&X!==Fr?`${(ue==null?void 0:ue.warning)??""} Switch image columns from Settings > Source.`:null;c.useEffect(()=>{const _=sn.current,te=pt.getQueryCache();return _.seed(te.getAll()),te.subscribe(De=>{iO(_,De)})},[pt]);const{data:ln,refetch:js,isLoading:Zn,isFetching:Ar,isError:pi,searching:An,normalizedQ:an,similarityActive:Me,embeddings:I,embeddingsRejected:Q,embeddingsAvailable:ae,embeddingsLoading:ve,embeddingsError:Ce,poolItems:_e,similarityItems:He,metricKeys:Le,categoricalKeys:Oe,browseCapabilityKeysReady:yn,metricDisplayNames:Dt,derivedMetric:Ve,items:_t,totalCount:Dr,filteredCount:hr,scopeTotal:zr,rootTotal:SS,hasMoreFolderItems:kS,isLoadingMoreFolderItems:CS,loadMoreFolderItems:ES,browseQueryUnavailableReason:Lc,analysisUnsupportedMetricIntent:Oc,browseTargetIdentity:Lo,browseTargetSettled:Oo}=TL({current:n,query:o,similarityState:qe,viewState:p,randomSeed:k,urlUnsupportedMetricIntent:et,localStarOverrides:ee,sessionResetToken:Fn});c.useEffect(()=>{if(!et)return;const _=vt.current;(o!==_.query||p!==_.viewState||_.randomSeed!==null&&k!==_.randomSeed)&&be(null)},[o,k,et,p]),c.useEffect(()=>{CP(p,{query:o,randomSeed:k,unsupportedMetricIntent:Oc})},[Oc,o,k,p]);const xp=c.useMemo(()=>qt(n||"/"),[n]),_s=JSON.stringify([t,xp,(ue==null?void 0:ue.current)??null,Fn]),Fc=JSON.stringify([t,(ue==null?void 0:ue.current)??null]),MS=_s,ha=c.useMemo(()=>Le.filter(_=>!ht(_)),[Le]),Ac=c.useMemo(()=>A1(Ve,Fc),[Fc,Ve]),RS=c.useMemo(()=>pr(D1(Ve.spec,ha)),[Ve.spec,ha]),Dc=Y.resetKey===Ac?Y.fields:RS,NS=c.useCallback(_=>{re({resetKey:Ac,fields:_})},[Ac]),bp=vw(li(Le)),Sp=vw(li(Oe)),zc=c.useMemo(()=>HT(H,_s,Le,Oe,{metric:bp,categorical:Sp}),[_s,Oe,Sp,Le,bp,H]),$c=c.useMemo(()=>Jb(p.filters),[p.filters]),jS=qe?He:_e,ma=c.useMemo(()=>o2(p.filters),[p.filters]),Bc=Me||An||ma>0,_S=nL(Me,Bc,hr,zr),PS=rL(Me,Bc,Dr,zr,SS,n),Yt=qe?null:p.sort.kind==="metric"?p.sort.key:null,Fo=Oo&&(qe!==null||_t.length>=hr),TS=Oo&&(qe!==null||p.filters.and.length===0&&an===""&&_t.length>=zr),IS=Yt!==null&&(ht(Yt)||!Fo),kp=c.useMemo(()=>G1(zc,p.selectedMetric,Le,Oe),[Oe,Le,zc,p.selectedMetric]),Cp=c.useMemo(()=>{const _=new Set(ha),te=new Set(Oe);return{metric_keys:Dc.metric_keys.filter(De=>_.has(De)),categorical_keys:Dc.categorical_keys.filter(De=>te.has(De))}},[Oe,Dc,ha]),Uc=c.useMemo(()=>{const _=F==="metrics"?kp:F==="derived"?Cp:{metric_keys:[],categorical_keys:[]};return{metric_keys:Array.from(new Set(_.metric_keys)).sort(),categorical_keys:Array.from(new Set(_.categorical_keys)).sort()}},[Cp,F,kp]),LS=Uc.metric_keys.length+Uc.categorical_keys.length>0,pa=gv({path:n,recursive:!0,filters:p.filters,sort:p.sort,textQuery:an,randomSeed:k,derivedMetric:p.derivedMetric??null,unsupportedToken:Oc,generationToken:String(Fn),facetFields:{metric_keys:Yt?[Yt]:[],categorical_keys:[]},enabled:IS&&!qe}),Hc=((Jp=pa.data)==null?void 0:Jp.path)===((ln==null?void 0:ln.path)??n)?pa.data:null,OS=Yt?yp((Zp=Hc==null?void 0:Hc.metrics[Yt])==null?void 0:Zp.histogram):null,FS=c.useMemo(()=>{if(!Yt||!Fo)return null;const _=Eo(_t,[Yt]);return Vb(Xi(_,Yt),48)},[_t,Yt,Fo]),AS=Yt?pa.fieldStates.metrics[Yt]??"pending":"settled",Kc=n_({active:Yt!==null,localComplete:Fo,localHistogram:FS,facetHistogram:OS,facetState:AS}),Ep=oL({similarityActive:Me,searching:An,itemCount:_t.length,isLoading:Zn,isFetching:Ar,isError:pi,unavailableReason:Lc,filteredCount:hr}),se=DL({targetKey:Lo,resetKey:_s,targetItems:_t,targetRatingItems:jS,targetFilteredCount:hr,targetDisplayItemCount:_S,targetDisplayTotalCount:PS,targetMetricsPopulationItemsComplete:TS,targetMetricsFilteredItemsComplete:Fo,targetMetricRailState:Kc.state,targetMetricRailHistogram:Kc.histogram,targetMetricRailKey:Yt,targetMetricRailSortDir:p.sort.dir,targetSettled:Oo&&Kc.state!=="pending",targetStatus:Ep}),Vc=se.membershipPaths,Wc=c.useCallback(_=>{if(!_)return;const te=()=>{const De=document.getElementById(`cell-${encodeURIComponent(_)}`);De==null||De.focus()};requestAnimationFrame(()=>requestAnimationFrame(te))},[]),{selectedPaths:un,setSelectedPaths:vn,viewer:wn,compareOpen:zt,restoreGridToSelectionToken:DS,bumpRestoreGridToSelectionToken:gi,selectedItems:ga,compareItems:qc,comparePaths:Qc,compareIndexClamped:Gc,compareA:Mp,compareB:Rp,canComparePrev:zS,canCompareNext:$S,compareEnabled:BS,canPrevImage:Np,canNextImage:jp,overlayActive:US,rememberFocusedPath:Yc,openViewer:HS,closeViewer:Xc,openCompare:_p,closeCompare:Jc,handleCompareNavigate:KS,handleNavigate:Zc,resetViewerState:ya,resetForScopeBoundary:Pp,syncHashImageSelection:VS}=QL({current:n,itemPaths:Vc,items:se.items,selectionPool:se.ratingItems,compareOrderMode:xe,membershipSettled:se.phase==="steady"&&se.targetKey===Lo,membershipComplete:se.filteredCount!==null&&se.items.length>=se.filteredCount,focusGridCell:Wc}),Ao=c.useMemo(()=>{const _=new Map;for(const te of se.ratingItems)_.set(te.path,te);for(const te of se.items)_.set(te.path,te);for(const te of ga)_.set(te.path,te);for(const te of qc)_.set(te.path,te);return _},[qc,se.items,se.ratingItems,ga]),Tp=c.useCallback(_=>{!_||_===(ue==null?void 0:ue.current)||ke||(Jn(),Ye(!0),Fe.switchTableSourceColumn(_).then(te=>{Be(te.enabled?te:null),me(null),Wr.clear(),Wu.clear(),zi.clear(),pt.invalidateQueries(),vn([]),h(null),ya(),r("/"),bv("/"),jt(De=>De+1)}).catch(te=>{dr("Image source switch failed",te)}).finally(()=>Ye(!1)))},[Jn,pt,dr,ya,vn,ue==null?void 0:ue.current,ke]);c.useEffect(()=>{const _=de.current;if(_){if(zt){_.setAttribute("inert",""),_.setAttribute("aria-hidden","true");return}_.removeAttribute("inert"),_.removeAttribute("aria-hidden")}},[zt]),c.useEffect(()=>{const _=Ke.current;if(_){if(zt){_.setAttribute("inert",""),_.setAttribute("aria-hidden","true");return}_.removeAttribute("inert"),_.removeAttribute("aria-hidden")}},[zt]);const Ip=ai(Z),Lp=ai(F);OO({setCurrent:r,syncHashImageSelection:VS,bumpRestoreGridToSelectionToken:gi});const WS=se.ratingItems,qS=se.metricsPopulationItemsComplete,Op=se.metricsFilteredItemsComplete;c.useLayoutEffect(()=>{if(!An||!Oo||se.phase!=="steady"||se.targetKey!==Lo)return;const _=se.filteredCount!==null&&se.items.length>=se.filteredCount;vn(te=>HL(te,se.membershipPaths,_))},[Lo,Oo,se.filteredCount,se.items.length,se.membershipPaths,se.phase,se.targetKey,An,vn]);const QS=se.retained?{kind:"updating",title:"Updating results...",message:"Keeping the previous gallery visible while the next view loads.",showCentered:!1}:Ep,Fp=c.useMemo(()=>TI({enabled:!0,embeddingsAvailable:ae,embeddingsLoading:ve,selectedCount:un.length}),[ae,ve,un.length]),GS=c.useCallback((_,te)=>{St.patch(_,{replaceMutableMetrics:te==null?void 0:te.replaceMutableMetrics}),Q2(pt,_.path,De=>De&&d1(De,_,{replaceMutableMetrics:te==null?void 0:te.replaceMutableMetrics})),oO(pt,sn.current,_,te)},[pt]),{connectionStatus:va,connectionLabel:YS,presence:XS,editingCount:JS,recentEditActive:ZS,hasEdits:ek,lastEditedLabel:tk,persistenceEnabled:ed,refreshEnabled:wa,refreshDisabledReason:Ap,indexing:nk,tableLaunchStatus:Dp,launchSession:xa,highlightedPaths:rk,onVisiblePathsChange:sk,offViewSummary:ik,recentTouchesDisplay:ok,clearOffViewActivity:lk}=TO({current:n,currentGalleryId:xp,itemPaths:se.membershipPaths,items:se.items,queryClient:pt,updateItemCaches:GS,setLocalStarOverrides:ce});c.useEffect(()=>{ed&&K(!1)},[ed]),c.useEffect(()=>{he(Kh(t,e))},[e,t]),c.useEffect(()=>{typeof document>"u"||(document.title=EF(xa))},[xa]);const zp=c.useCallback(_=>{const te=Mb(_);PF(t,e,te),he(te)},[e,t]),ak=c.useCallback(_=>{At(_),_&&Ft(n,_)},[n,Ft]),uk=c.useMemo(()=>fi(n),[n,fi]),dt=c.useCallback(()=>{gi(),On(_=>_+1)},[gi]);c.useEffect(()=>{At(null),On(_=>_+1)},[n]);const{folderCountsVersion:ck,headerRefreshBusy:dk,refreshFolderPath:fk,handlePullRefreshFolders:hk,handleHeaderRefresh:mk}=GO({current:n,refreshEnabled:wa,queryClient:pt,refetch:js,invalidateFolderSessionSubtree:Lr,setScopeSessionResetToken:jt,onActionStart:Jn,onActionError:dr}),$p=c.useMemo(()=>tL(se.ratingItems,ee),[se.ratingItems,ee]);c.useEffect(()=>{Me||Le.length&&g(_=>{const te=VI(_.selectedMetric,Le,Ve.key);return te===_.selectedMetric?_:{..._,selectedMetric:te}})},[Ve.key,Le,Me]),c.useEffect(()=>{yn&&WI(p.sort,Le,Me,Ve.key,Ve.status)&&g(_=>({..._,sort:{kind:"builtin",key:"added",dir:_.sort.dir}}))},[yn,Ve.key,Ve.status,Le,p.sort,Me]);const pk=on.state==="syncing"?"Syncing…":on.state==="saving"?"Saving…":on.state==="error"?on.message?`Not saved — ${on.message}`:"Not saved — retry":"Saved",gk=Ns!=null&&Ns>wI,yk=va==="offline"||va==="connecting"||va==="idle",vk=va==="reconnecting"||hi||on.state==="error"||gk,wk=yI({isOffline:yk,isUnstable:vk,recentEditActive:ZS,editingCount:JS}),xk=c.useMemo(()=>sL(qe),[qe]),bk=c.useMemo(()=>iL(qe!==null,ma,hr,Dr),[qe,ma,hr,Dr]),Bp=c.useCallback(_=>{dt(),l(_)},[dt]),Ct=c.useCallback(_=>{dt(),g(te=>({...te,filters:_(te.filters)}))},[dt]),Sk=c.useCallback(_=>{dt(),g(te=>({...te,filters:_}))},[dt]),td=c.useCallback(()=>{Ct(_=>xh(_,[]))},[Ct]),Up=c.useCallback(()=>{dt(),g(_=>({..._,filters:{and:[]}}))},[dt]),kk=c.useCallback(_=>{if(se.retained||!se.metricRailKey)return;const te=r_(se.items,se.metricRailKey,_);te&&(Yc(te),vn([te]),gi(),Wc(te))},[gi,Wc,se.items,se.metricRailKey,se.retained,Yc,vn]),{cancelPendingSimilaritySearch:Hp,clearSimilarity:Ck,handleRevealOffView:Ek,handleSimilaritySearch:Mk}=dF({similarityState:qe,setSimilarityState:h,selectedPaths:un,setSelectedPaths:vn,setQuery:Bp,setViewState:g,bumpRestoreGridToSelectionToken:gi,scopePath:n,sessionResetToken:Fn}),nd=c.useCallback(()=>{Hp(),d(!1)},[Hp]),rd=c.useCallback((_,te)=>{Ct(De=>r2(De,_,te))},[Ct]),sd=c.useCallback((_,te)=>{Ct(De=>i2(De,_,te))},[Ct]),Kp=c.useMemo(()=>oS(p.filters,Ve),[Ve,p.filters]),Rk=c.useMemo(()=>Lc??GI(p.sort,p.filters,Ve),[Lc,Ve,p.filters,p.sort]),Nk=c.useMemo(()=>bF(p.filters,{clearStarsIn:td,clearStarsNotIn:()=>Ct(_=>Zb(_,[])),clearNameContains:()=>Ct(_=>e1(_,"")),clearNameNotContains:()=>Ct(_=>t1(_,"")),clearNotesContains:()=>Ct(_=>n1(_,"")),clearNotesNotContains:()=>Ct(_=>r1(_,"")),clearUrlContains:()=>Ct(_=>s1(_,"")),clearUrlNotContains:()=>Ct(_=>i1(_,"")),clearDateRange:()=>Ct(_=>bh(_,null)),clearWidthCompare:()=>Ct(_=>uu(_,null)),clearHeightCompare:()=>Ct(_=>cu(_,null)),clearMetricRange:_=>rd(_,null),clearCategoricalIn:_=>sd(_,null)},{unavailableMetricKeys:Kp,metricDisplayNames:Dt}),[p.filters,td,rd,sd,Ct,Kp,Dt]),jk=c.useCallback(_=>{const te=new Set($c);te.has(_)?te.delete(_):te.add(_),dt(),g(De=>({...De,filters:xh(De.filters,Array.from(te))}))},[dt,$c]),_k=c.useCallback(()=>{D(!0),T("metrics")},[]),Vp=c.useCallback(()=>{B(!1)},[]),Pk=c.useCallback(_=>{const te=HP({activeTool:Lp.current,contentOpen:Ip.current,clickedTool:_});T(te.nextTool),D(te.contentOpen)},[Ip,Lp]),Tk=c.useCallback(_=>{G(te=>KT(te,_,_s))},[_s]),Ik=c.useCallback(_=>{dt(),g(te=>({...te,sort:_})),_.kind==="builtin"&&_.key==="random"&&C(Date.now())},[dt]),Lk=c.useCallback(_=>{dt(),E(_)},[dt]),Wp=c.useCallback(_=>{dt(),j(_)},[dt]),Ok=c.useCallback(_=>{dt(),g(te=>ZI(te,_))},[dt]),Fk=c.useCallback(_=>{dt(),g(te=>eL(te,_))},[dt]),Ak=c.useMemo(()=>dL(n),[n]),Dk=JI(Me),ba=O<=hl.mobileMax;c.useEffect(()=>{ba||P&&$(!1)},[ba,P]),nF({gridRef:ut,disabled:!!wn||zt,gridItemSize:N,onGridItemSizeChange:Wp}),c.useEffect(()=>{ww(EI(Vc,wn),"viewer",Ao,we)},[Ao,Vc,we,wn]),c.useEffect(()=>{zt&&ww(MI(Qc,Gc),"compare",Ao,we)},[Gc,zt,Qc,Ao,we]);const id=c.useCallback(_=>{ya();const te=qt(_);r(te),bv(te)},[ya]),zk=c.useCallback(()=>{const _=document.querySelector(".toolbar-right .input");_==null||_.focus()},[]),{ctx:$r,setCtx:Ps,openGridActions:qp,openFolderActions:Qp}=LO({selectedPaths:un,setSelectedPaths:vn});c.useLayoutEffect(()=>{se.retained&&Ps(null)},[se.retained,Ps]),c.useEffect(()=>{if(it.current===n)return;it.current=n;const{folderTarget:te,imageTarget:De}=M1(Lh()),Br=hL(n,te,De);Pp(Br),Ps(null),nd(),h(null),$(!1),At(null),On(yi=>yi+1),jt(yi=>yi+1),Bb(Br?["thumb"]:["thumb","file"])},[nd,n,Pp,Ps]);const{views:$k,activeViewId:Bk,activateView:Uk,clearActiveView:Hk,saveView:Kk}=yF({current:n,viewState:p,setViewState:g,openFolder:id});zO({current:n,items:_t,selectedPaths:un,viewerOpen:!!wn,compareOpen:zt,mobileSelectMode:P,leftOpen:Z,rightOpen:z,viewportWidth:O,openFolder:id,setSelectedPaths:vn,setLeftOpen:D,setRightOpen:B,setMobileSelectMode:$,setMobileSearchOpen:q,focusDesktopSearch:zk});const od=c.useMemo(()=>zt?"compare":wn?"viewer":"none",[zt,wn]),Ae=c.useMemo(()=>OP({viewportWidth:O,viewportHeight:L,userLeftOpen:Z,userRightOpen:z,leftPreferredWidth:mt,rightPreferredWidth:In,overlay:od,mobileSearchOpen:U,mobileDrawerOpen:V}),[O,L,Z,z,mt,In,od,U,V]),Gp=c.useRef(Ae.effectiveRightOpen);Ae.effectiveRightOpen&&(Gp.current=!0);const Yp=Ae.leftRailVisible&&Ae.effectiveLeftOpen&&(F==="metrics"||F==="derived")&&LS&&yn&&!qe,Do=gv({...lL({path:n,derivedMetric:p.derivedMetric??null,facetFields:Uc}),generationToken:String(Fn),analysisChannel:"metrics-population",enabled:Yp}),Vk=((eg=Do.data)==null?void 0:eg.path)===((ln==null?void 0:ln.path)??n)?Do.data:null,Wk=Do.isError?"error":Do.isLoading?"pending":"settled",Xp=Ae.leftRailVisible&&Ae.effectiveLeftOpen&&F==="folders";c.useLayoutEffect(()=>{!Xp&&($r==null?void 0:$r.kind)==="tree"&&Ps(null);const _=document.activeElement,te=document.querySelector(".app-left-panel");if(!(_ instanceof HTMLElement)||!(te!=null&&te.contains(_)))return;const De=_.closest("[data-left-tool-panel]"),Br=De instanceof HTMLElement&&De.dataset.leftToolPanel!==F;(!Ae.leftRailVisible||!Ae.effectiveLeftOpen||Br)&&_.blur()},[$r==null?void 0:$r.kind,Xp,Ae.effectiveLeftOpen,Ae.leftRailVisible,F,Ps]);const qk=`${Ae.gridInsets.left}px`,Qk=`${Ae.gridInsets.right}px`,Gk=`${Ae.overlayInsets.left}px`,Yk=`${Ae.overlayInsets.right}px`,Xk=`${Ae.shellReserves.toolbarHeightPx}px`,Jk=Ae.shellReserves.mobileDrawerHeightPx>0?`calc(${Ae.shellReserves.mobileDrawerHeightPx}px + env(safe-area-inset-bottom, 0px))`:"0px",Sa=se.metricRailKey!==null;return u.jsxs("div",{className:"app-shell grid h-full grid-cols-[var(--grid-left)_1fr_var(--grid-right)]",ref:Te,"data-layout-mode":Ae.mode,"data-short-height":Ae.shortHeight?"true":"false","data-left-suppression-reason":Ae.leftSuppressionReason,"data-right-suppression-reason":Ae.rightSuppressionReason,"data-inspector-suppression-reason":Ae.inspector.suppressionReason,"data-overlay-mode":od,"data-mobile-search-open":U?"true":"false","data-mobile-drawer-open":V?"true":"false","data-metrics-facet-observer-enabled":Yp?"true":"false","data-effective-left-width":Ae.leftWidth,"data-effective-right-width":Ae.rightWidth,"data-view-mode":R,"data-grid-item-size":N,"data-user-left-open":Z?"true":"false","data-user-right-open":z?"true":"false","data-autoload-image-metadata":pe?"true":"false","data-compare-order-mode":xe,"data-proxy-http-originals":we?"true":"false","data-query":o,"data-sort-kind":p.sort.kind,"data-sort-key":p.sort.key,"data-sort-dir":p.sort.dir,style:{"--grid-left":qk,"--grid-right":Qk,"--overlay-left":Gk,"--overlay-right":Yk,"--toolbar-h":Xk,"--mobile-drawer-h":Jk},children:[u.jsx(dN,{rootRef:Ke,onSearch:Bp,viewerActive:!!wn,onBack:Xc,zoomPercent:wn?b:void 0,onZoomPercentChange:S,currentLabel:Ak,itemCount:se.displayItemCount??void 0,totalCount:se.displayTotalCount??void 0,sortSpec:p.sort,metricKeys:Le,metricDisplayNames:Dt,onSortChange:Ik,sortDisabled:Me,filterCount:ma,onOpenFilters:_k,starsInFilter:$c,onToggleStarsIn:jk,onClearStarsIn:td,onClearFilters:Up,starCounts:$p,viewMode:R,onViewMode:Lk,gridItemSize:N,onGridItemSize:Wp,leftOpen:Z,rightOpen:z,onToggleLeft:()=>D(_=>mp(_)),onToggleRight:()=>B(_=>!_),onRefreshRoot:mk,refreshEnabled:wa,refreshDisabledReason:Ap,refreshBusy:dk,onPrevImage:()=>Zc(-1),onNextImage:()=>Zc(1),canPrevImage:Np,canNextImage:jp,searchDisabled:Me,searchPlaceholder:Me?"Exit similarity to search":void 0,mobileSearchOpen:U,onMobileSearchOpenChange:q,mobileDrawerOpen:V,onMobileDrawerOpenChange:A,themePreset:le,onThemePresetChange:zp,autoloadImageMetadata:pe,onAutoloadImageMetadataChange:Se,proxyHttpOriginals:we,onProxyHttpOriginalsChange:Ee,compareOrderMode:xe,onCompareOrderModeChange:Re,sourceColumns:ue,tableLaunchStatus:Dp,launchSession:xa,sourceColumnSwitching:ke,onSourceColumnChange:Tp,multiSelectMode:P,selectedCount:un.length,onToggleMultiSelectMode:ba?()=>$(_=>!_):void 0,syncIndicator:{state:wk,presence:XS,syncLabel:pk,connectionLabel:YS,lastEditedLabel:tk,hasEdits:ek,localTypingActive:To,recentTouches:ok}}),u.jsxs("div",{ref:de,className:"browse-shell","data-browse-shell":!0,"data-overlay-inert":zt?"true":"false","data-browse-presentation-target":se.targetKey??"","data-browse-requested-target":se.requestedTargetKey,"data-browse-presentation-epoch":se.epoch,"data-browse-rating-counts":JSON.stringify($p),"data-selected-paths":JSON.stringify(un),children:[u.jsx(hI,{visible:Ae.leftRailVisible,leftTool:F,contentOpen:Ae.effectiveLeftOpen,onToolChange:Pk,compareEnabled:BS,compareActive:zt,onOpenCompare:_p,views:$k,activeViewId:Bk,onActivateView:Uk,onSaveView:Kk,current:n,data:ln,onOpenFolder:_=>{Hk(),id(_)},onOpenFolderActions:Qp,onPullRefreshFolders:wa?hk:void 0,onContextMenu:(_,te)=>{_.preventDefault(),Qp(te,{x:_.clientX,y:_.clientY})},countVersion:ck,items:WS,filteredItems:se.items,metricKeys:Le,categoricalKeys:Oe,metricDisplayNames:Dt,metricsFacets:Vk,metricsFacetsState:Wk,metricsFacetFieldStates:Do.fieldStates,metricsPopulationItemsComplete:qS,metricsFilteredItemsComplete:Op,metricsPresentationResetKey:_s,derivedDraftResetKey:Fc,derivedMetric:Ve,derivedMetricBackendAuthoritative:!Me,derivedRankDisabledReason:Dk,selectedItems:ga,selectedMetric:p.selectedMetric,metricsFacetDemand:zc,onSelectMetric:_=>g(te=>({...te,selectedMetric:_})),onApplyDerivedMetric:Ok,onRankByDerivedMetric:Fk,filters:p.filters,onChangeRange:rd,onChangeCategoricalValues:sd,onChangeFilters:Sk,onMetricsFacetDemandAction:Tk,onDerivedFacetFieldsChange:NS,onResize:Ir,themePreset:le,onThemePresetChange:zp,autoloadImageMetadata:pe,onAutoloadImageMetadataChange:Se,proxyHttpOriginals:we,onProxyHttpOriginalsChange:Ee,compareOrderMode:xe,onCompareOrderModeChange:Re,tableSourceColumns:ue,tableLaunchStatus:Dp,launchSession:xa,tableSourceSwitching:ke,onTableSourceColumnChange:Tp}),u.jsxs("div",{className:"grid-shell col-start-2 row-start-2 relative overflow-hidden flex flex-col",children:[u.jsx("div",{"aria-live":"polite",className:"sr-only",children:un.length?`${un.length} selected`:""}),u.jsx(gI,{statusBarProps:{persistenceEnabled:ed,showPersistenceWarning:!Ne,onDismissPersistenceWarning:()=>K(!0),indexing:nk,offViewSummary:ik,canRevealOffView:Bc,onRevealOffView:Ek,onClearOffView:lk,browserZoomPercent:v,onDismissBrowserZoomWarning:x,tableSourceWarning:Io,derivedMetricWarning:Rk,onDismissTableSourceWarning:Fr?()=>me(Fr):void 0},actionFeedback:W,onDismissActionFeedback:Jn,similarity:qe?{embedding:qe.embedding,topK:qe.topK,minScore:qe.minScore,queryLabel:xk,countLabel:bk}:null,onExitSimilarity:Ck,filterChips:Nk,onClearFilters:Up}),u.jsxs("div",{className:"grid-body flex-1 min-h-0","data-grid-body":!0,children:[u.jsx("div",{className:"grid-body-main relative min-h-0 min-w-0","data-grid-body-main":!0,children:u.jsx(t_,{items:se.items,interactionDisabled:se.retained,presentationPhase:se.phase,proxyHttpOriginals:we,selected:un,restoreToSelectionToken:DS,restoreToTopAnchorToken:Rs,restoreToTopAnchorPath:uk,multiSelectMode:ba&&P,onSelectionChange:vn,onOpenViewer:_=>{Yc(_),HS(_),vn([_])},highlight:An?an:"",recentlyUpdated:rk,onVisiblePathsChange:sk,onTopAnchorPathChange:ak,suppressSelectionHighlight:US,viewMode:R,targetCellSize:N,onContextMenuItem:(_,te)=>{_.preventDefault(),qp(te,{x:_.clientX,y:_.clientY})},onOpenItemActions:qp,scrollRef:ut,gridStatus:QS,loadedCount:se.items.length,filteredCount:se.filteredCount??se.items.length,onRetry:()=>{js()},hasMore:!se.retained&&se.targetKey===Lo?kS:!1,isLoadingMore:!se.retained&&CS,onLoadMore:ES})}),u.jsx("div",{className:`metric-rail-slot${Sa?"":" is-inactive"}${se.retained?" is-inert":""}`,"data-metric-rail-slot":!0,"data-metric-rail-active":Sa?"true":"false","data-metric-rail-interaction-disabled":se.retained?"true":"false","aria-hidden":!Sa,"aria-busy":se.retained||void 0,"aria-disabled":se.retained||void 0,ref:_=>_==null?void 0:_.toggleAttribute("inert",se.retained),children:Sa?u.jsx(l_,{items:se.items,metricKey:se.metricRailKey,metricLabel:ar(se.metricRailKey,Dt),scrollRef:ut,sortDir:se.metricRailSortDir,currentPath:Or,state:se.metricRailState,histogramOverride:se.metricRailHistogram,populationComplete:Op,onJumpToMetricValue:kk,onRetry:()=>{pa.refetch()}}):u.jsx("div",{className:"metric-rail-placeholder","aria-hidden":"true"})})]})]}),Gp.current&&u.jsx(Jd,{resetKey:`inspector:${Ae.effectiveRightOpen?"open":"closed"}`,fallback:u.jsx(xw,{message:"Inspector could not load.",onClose:Vp,visible:Ae.effectiveRightOpen}),children:u.jsx(c.Suspense,{fallback:u.jsx(xw,{message:"Loading inspector...",onClose:Vp,busy:!0,visible:Ae.effectiveRightOpen}),children:u.jsx(LF,{path:un[0]??null,selectedPaths:un,comparePaths:Qc,items:ga,presentationResetKey:MS,visible:Ae.effectiveRightOpen,viewerCompareActive:zt,compareA:Mp,compareB:Rp,onOpenCompare:_p,sortSpec:p.sort,metricDisplayNames:Dt,onResize:Ln,onStarChanged:(_,te)=>{const De=_.filter(Br=>!St.patch({path:Br,star:te}));De.length&&ce(Br=>{const yi={...Br};for(const Zk of De)yi[Zk]=te;return yi})},onFindSimilar:()=>d(!0),embeddingsAvailable:ae,embeddingsLoading:ve,autoloadImageMetadata:pe,onLocalTypingChange:mi,onActionStart:Jn,onActionError:dr})})})]}),a&&u.jsx(f_,{embeddings:I,rejected:Q,selectedPath:un[0]??null,embeddingsLoading:ve,embeddingsError:Ce,onClose:nd,onSearch:Mk}),wn&&u.jsx(Jd,{resetKey:`viewer:${wn}`,fallback:u.jsx(Zd,{label:"Image viewer",message:"Viewer could not load.",onClose:Xc}),children:u.jsx(B_,{path:wn,item:Ao.get(wn)??null,proxyHttpOriginals:we,onClose:Xc,onZoomChange:_=>w(Math.round(_)),requestedZoomPercent:m,onZoomRequestConsumed:()=>y(null),canPrev:Np,canNext:jp,onNavigate:Zc})}),zt&&u.jsx(Jd,{resetKey:`compare:${zt}`,fallback:u.jsx(Zd,{label:"Compare images",message:"Compare could not load.",onClose:Jc}),children:u.jsx(c.Suspense,{fallback:u.jsx(Zd,{label:"Compare images",message:"Loading compare...",onClose:Jc,busy:!0}),children:u.jsx(IF,{aItem:Mp,bItem:Rp,proxyHttpOriginals:we,index:Gc,total:qc.length,canPrev:zS,canNext:$S,onNavigate:KS,onClose:Jc})})}),$r&&u.jsx($I,{ctx:$r,current:n,items:_t,setCtx:Ps,refreshEnabled:wa,refreshDisabledReason:Ap,onRefreshFolder:fk,canFindSimilar:Fp.canFindSimilar,findSimilarDisabledReason:Fp.disabledReason,onFindSimilar:_=>{vn([_]),d(!0)},onActionStart:Jn,onActionError:dr})]})}function AF(e){return(e==null?void 0:e.mode)==="ranking"?"ranking":"browse"}function DF(e){if(typeof e!="string")return null;const t=e.trim();return t.length>0?t:null}function zF(e){return e instanceof Error&&e.message.trim()?e.message:typeof e=="string"&&e.trim()?e:"health check failed"}function $F(e){return{mode:AF(e),healthMode:(e==null?void 0:e.mode)??null,workspaceId:DF(e==null?void 0:e.workspace_id)}}function BF(e){return{mode:"browse",healthMode:null,workspaceId:null,error:zF(e)}}function UF(){const e=Xe(ze("/health"));return{abort:e.abort,promise:e.promise.then(t=>({...$F(t),error:null})).catch(t=>BF(t))}}function HF(e){const t=Kh(e.workspaceId,e.healthMode);Mb(t)}function KF(e,t,n){e.mode!=="ranking"&&t(e),n({mode:e.mode,healthMode:e.healthMode,workspaceId:e.workspaceId,loading:!1,error:e.error})}function bw({showLoadingCopy:e}){return u.jsx("div",{className:"boot-loading","data-boot-shell":!0,"data-loading-copy-visible":e?"true":"false","aria-busy":"true",children:u.jsx("span",{"aria-live":"polite",children:e?"Loading Lenslet...":" "})})}const bS=()=>Wm(()=>import("./RankingApp-Br3Iku0W.js"),__vite__mapDeps([4,3,5])),VF=c.lazy(bS);function WF(){const[e]=c.useState(()=>Date.now()),[t,n]=c.useState({mode:"browse",healthMode:null,workspaceId:null,loading:!0,error:null}),[r,s]=c.useState(!1);c.useEffect(()=>{const l=UF();return l.promise.then(a=>{KF(a,HF,n)}).catch(a=>{const d=a instanceof Error?a.message:"health check failed";n({mode:"browse",healthMode:null,workspaceId:null,loading:!1,error:d})}),()=>l.abort()},[]),c.useEffect(()=>{if(t.loading||t.mode!=="ranking")return;let l=!0;return bS().then(()=>{l&&s(!0)}),()=>{l=!1}},[t.loading,t.mode]);const i=t.loading||t.mode==="ranking"&&!r,o=wp(i,TF,e);return t.loading?u.jsx(bw,{showLoadingCopy:o}):t.mode==="ranking"?u.jsx(c.Suspense,{fallback:u.jsx(bw,{showLoadingCopy:o}),children:u.jsx(VF,{bootStartedAtMs:e})}):u.jsxs(u.Fragment,{children:[t.error?u.jsxs("div",{className:"boot-warning",role:"status",children:["Health check failed; using browse mode fallback. (",t.error,")"]}):null,u.jsx(FF,{themeHealthMode:t.healthMode,themeWorkspaceId:t.workspaceId})]})}const qF=new cR({defaultOptions:{queries:{staleTime:1e4,gcTime:5*6e4,retry:2,retryDelay:e=>Math.min(1e3*Math.pow(2,e),1e4),refetchOnWindowFocus:!1,refetchOnReconnect:"always"},mutations:{retry:2,retryDelay:e=>Math.min(1e3*Math.pow(2,e),5e3)}}});function QF(){return u.jsx(dR,{client:qF,children:u.jsx(WF,{})})}_M();OM();Wx(document.getElementById("root")).render(u.jsx(QF,{}));export{ar as A,bw as B,gP as C,mu as D,rA as E,cP as F,w1 as G,hp as H,eA as I,tA as J,zi as K,Ub as L,Vu as M,Ms as N,TI as O,ZF as P,nA as Q,ig as R,Db as S,Zm as T,jo as U,ze as a,XF as b,ua as c,TF as d,nv as e,Xe as f,Xs as g,M_ as h,wh as i,u as j,Ka as k,Bl as l,Jm as m,y_ as n,Gj as o,E_ as p,Ib as q,c as r,Qm as s,JF as t,wp as u,ep as v,Fe as w,sA as x,Wt as y,Vd as z};
+`)}function jI(e){return e.map(t=>{const n=t.path.split("/").filter(Boolean);n.pop();const r=n.length?`/${n.join("/")}`:"/";return{path:t.path,folder:r,name:t.name,star:t.star??null,type:t.mime,size:t.size,width:t.width,height:t.height}})}const nS="Select a single image to search.",_I="No embeddings detected.",PI="Loading embeddings...";function TI({enabled:e,embeddingsAvailable:t,embeddingsLoading:n,selectedCount:r}){return e?t?r!==1?{canFindSimilar:!1,disabledReason:nS}:{canFindSimilar:!0,disabledReason:null}:{canFindSimilar:!1,disabledReason:n?PI:_I}:{canFindSimilar:!1,disabledReason:null}}function II({x:e,y:t,items:n}){const r=c.useRef(null),[s,i]=c.useState({x:e,y:t}),[o,l]=c.useState(!1),a=c.useCallback((f,h)=>{h.stopPropagation(),f.disabled||f.onClick()},[]),d=c.useCallback(()=>{const f=r.current,h=aa(),m=f==null?void 0:f.getBoundingClientRect(),y=Math.min(280,Math.max(0,h.width-2*la)),b=(m==null?void 0:m.height)??Math.max(40,n.length*36),w=zl({x:e,y:t,menuWidth:y,menuHeight:b,viewport:h});i(S=>S.x===w.x&&S.y===w.y&&S.width===y?S:{...w,width:y}),l(!0)},[n.length,e,t]);return c.useLayoutEffect(()=>{d()},[d]),c.useEffect(()=>Cc(d),[d]),u.jsx("div",{ref:r,className:"dropdown-panel context-menu-panel fixed",role:"menu",style:{left:s.x,top:s.y,width:s.width,visibility:o?"visible":"hidden"},onClick:f=>f.stopPropagation(),children:n.map((f,h)=>u.jsxs("button",{className:`dropdown-item w-full ${f.danger?"text-danger hover:text-danger":""}`,role:"menuitem","aria-disabled":f.disabled,disabled:f.disabled,onClick:m=>a(f,m),children:[f.icon&&u.jsx("span",{className:"shrink-0",children:f.icon}),u.jsx("span",{className:"context-menu-label",title:f.label,children:f.label})]},h))})}function mu(e,t){const n=URL.createObjectURL(e),r=document.createElement("a");r.href=n,r.download=t,document.body.appendChild(r),r.click(),r.remove(),URL.revokeObjectURL(n)}const LI="Refresh unavailable in current mode",OI="Find similar unavailable";function FI({refreshing:e,refreshEnabled:t,refreshDisabledReason:n,onRefresh:r}){return{label:t?e?"Refreshing…":"Refresh":n||LI,disabled:!t||e,onClick:r}}function AI({selectedPaths:e,canFindSimilar:t,findSimilarDisabledReason:n,onFindSimilar:r}){if(!r)return null;const s=e.length===1,i=s?e[0]:null,o=s?n||OI:n||nS,l=s&&t&&!!i;return{label:l?"Find similar":o,disabled:!l,onClick:()=>{!l||!i||r(i)}}}function rS(e){return e==="csv"?"text/csv;charset=utf-8":"application/json;charset=utf-8"}function sS(e,t){const n=jI(e);return t==="csv"?NI(n):RI(n)}function Qv(){return new Date().toISOString().replace(/[:.]/g,"-")}function DI({format:e,selectedPaths:t,items:n,setExporting:r,closeMenu:s,download:i,timestamp:o,onActionStart:l,onActionError:a}){return()=>{r(e),l==null||l();try{const d=new Set(t),f=n.filter(y=>d.has(y.path)),h=sS(f,e),m=rS(e);i(new Blob([h],{type:m}),`metadata_selection_${o()}.${e}`)}catch(d){a==null||a("Export selection metadata failed",d)}finally{r(null),s()}}}async function zI(e){return(await Fe.getFolder(e,{recursive:!0})).items}function $I({ctx:e,current:t,items:n,setCtx:r,refreshEnabled:s,refreshDisabledReason:i,onRefreshFolder:o,canFindSimilar:l=!1,findSimilarDisabledReason:a=null,onFindSimilar:d,onActionStart:f,onActionError:h}){const[m,y]=c.useState(!1),[b,w]=c.useState(null),S=e.kind==="grid"?e.payload.paths:[],v=c.useMemo(()=>new Map(n.map(E=>[E.path,E])),[n]),x=()=>{r(null)},p=async()=>{const E=e.kind==="tree"?e.payload.path:"/";y(!0),f==null||f();try{await o(E)}catch(N){h==null||h("Refresh folder failed",N)}finally{y(!1),x()}},g=E=>async()=>{w(E),f==null||f();const N=e.kind==="tree"?e.payload.path:t;try{const j=await zI(N),P=sS(j,E),$=rS(E),U=N==="/"?"root":(N.replace(/^\/+/,"")||"root").replace(/\//g,"_");mu(new Blob([P],{type:$}),`metadata_${U}_${Qv()}.${E}`)}catch(j){h==null||h("Export folder metadata failed",j)}finally{w(null),x()}},k=E=>DI({format:E,selectedPaths:S,items:n,setExporting:w,closeMenu:x,download:mu,timestamp:Qv,onActionStart:f,onActionError:h}),C=async()=>{var N;if(!S.length)return;x(),f==null||f();const E=[];for(const j of S)try{const P=await Fe.getFile(j),$=((N=v.get(j))==null?void 0:N.name)||pP(j)||"image";mu(P,$)}catch(P){E.push(P)}if(E.length){const j=E.length===S.length?"Download failed":`${E.length} download${E.length===1?"":"s"} failed`;h==null||h(j,E[0])}},R=e.kind==="tree"?[FI({refreshing:m,refreshEnabled:s,refreshDisabledReason:i,onRefresh:p}),{label:b==="csv"?"Exporting CSV…":"Export metadata (CSV)",disabled:!!b||m,onClick:g("csv")},{label:b==="json"?"Exporting JSON…":"Export metadata (JSON)",disabled:!!b||m,onClick:g("json")}]:BI({selectedPaths:S,exporting:b,canFindSimilar:l,findSimilarDisabledReason:a,onFindSimilar:d?E=>{d(E),x()}:void 0,onDownloadSelection:C,onExportCsv:k("csv"),onExportJson:k("json")});return u.jsx(II,{x:e.x,y:e.y,items:R})}function BI({selectedPaths:e,exporting:t,canFindSimilar:n,findSimilarDisabledReason:r,onFindSimilar:s,onDownloadSelection:i,onExportCsv:o,onExportJson:l}){const a=[],d=AI({selectedPaths:e,canFindSimilar:n,findSimilarDisabledReason:r,onFindSimilar:s});return d&&a.push(d),e.length&&a.push({label:e.length>1?`Download (${e.length})`:"Download",onClick:i}),e.length&&(a.push({label:t==="csv"?"Exporting CSV…":"Export metadata (CSV)",disabled:!!t,onClick:o}),a.push({label:t==="json"?"Exporting JSON…":"Export metadata (JSON)",disabled:!!t,onClick:l})),a}function ai(e){const t=c.useRef(e);return t.current=e,t}function iS(e,t){for(const n of t)if(!e.has(n))return!1;return!0}function UI(e,t=250,n=[]){const r=new Set,s=new Set(n.filter(o=>!ht(o)));let i=0;for(const o of e){const l=o.metrics;if(l)for(const a of Object.keys(l))ht(a)||r.add(a);if(i+=1,i>=t&&r.size>0&&iS(r,s))break}return Array.from(r).sort()}function HI(e,t=250,n=[]){const r=new Set,s=new Set(n);let i=0;for(const o of e){const l=o.categoricals;if(l)for(const a of Object.keys(l))r.add(a);if(i+=1,i>=t&&r.size>0&&iS(r,s))break}return Array.from(r).sort()}function KI(e,t,n,r=[]){return t?UI(n,250,r):e?e.filter(s=>!ht(s)):[]}function VI(e,t,n=null){return e&&(t.includes(e)||e===n)?e:t[0]}function WI(e,t,n,r=null,s="none"){return n||e.kind!=="metric"||t.includes(e.key)?!1:ht(e.key)?r!==e.key:!0}function qI(e,t){return t.key===e&&t.status==="valid"&&t.validCount>0}function oS(e,t){const n=new Set;for(const r of e.and){if(!("metricRange"in r))continue;const s=r.metricRange.key;ht(s)&&(qI(s,t)||n.add(s))}return Array.from(n).sort()}function QI(e){return e.length?e.join(", "):"unknown inputs"}function GI(e,t,n){const r=e.kind==="metric"&&ht(e.key)?e.key:null,s=oS(t,n);if(!(r!==null||s.length>0))return null;const o=new Set(s);if(r&&o.add(r),Array.from(o).some(a=>a!==n.key))return"Saved derived score is unavailable in this view.";if(n.status==="invalid")return n.invalidReasons[0]??"Saved derived score definition is invalid.";if(n.status==="unavailable"){const a=[...n.missingMetricKeys,...n.missingCategoricalKeys].sort();return`Derived score inputs unavailable in this view: ${QI(a)}.`}if(n.status==="valid"&&n.validCount===0)return"Derived score has no valid values in this view.";if(r&&n.partialLoadWarning){const a=n.totalItems??n.loadedCount;return`Derived score ranks only the ${n.loadedCount} loaded items out of ${a}.`}return null}function YI(e,t,n){return null}function XI(e,t,n,r=[]){return t?HI(n,250,r):e?[...e]:[]}function JI(e){return e?"Ranking disabled in similarity mode.":null}function ZI(e,t){if(t)return{...e,derivedMetric:t};const n={and:e.filters.and.filter(s=>!("metricRange"in s&&ht(s.metricRange.key)))},r={...e,filters:n,derivedMetric:null};return e.sort.kind==="metric"&&ht(e.sort.key)&&(r.sort={kind:"builtin",key:"added",dir:e.sort.dir}),e.selectedMetric&&ht(e.selectedMetric)&&delete r.selectedMetric,r}function eL(e,t){const n=ko(t);return{...e,derivedMetric:t,selectedMetric:n,sort:{kind:"metric",key:n,dir:"desc"}}}function tL(e,t){const n={0:0,1:0,2:0,3:0,4:0,5:0};for(const r of e){const s=t[r.path]??r.star??0,i=String(s);n[i]=(n[i]||0)+1}return n}function nL(e,t,n,r){return e||t?n:r}function rL(e,t,n,r,s,i){return e?n:t||i==="/"?r:s}function sL(e){if(!e)return null;if(e.queryPath){const t=e.queryPath.split("/").filter(Boolean);return t.length?t[t.length-1]:e.queryPath}return e.queryVector?"Vector query":null}function iL(e,t,n,r){return e?t>0?`${n} of ${r}`:`${r}`:null}function oL(e){return e.unavailableReason?{kind:"unsupported",title:"Query unavailable",message:e.unavailableReason,showCentered:e.itemCount===0}:e.isError?{kind:"failed",title:"Query failed",message:"Retry the current query.",showCentered:e.itemCount===0}:!e.similarityActive&&e.itemCount===0&&e.isLoading?{kind:"loading",title:"Loading gallery...",message:"Preparing gallery...",showCentered:!0}:e.itemCount>0&&e.isFetching?{kind:"updating",title:"Updating results...",message:"Showing the previous window until the backend response arrives.",showCentered:!1}:e.itemCount===0?{kind:"empty",title:(e.filteredCount??0)===0?"No matching items":"No items loaded",message:e.searching?"No filenames, tags, or notes match this search.":"No images match the current filters.",showCentered:!0}:{kind:"ready",title:"Ready",message:"",showCentered:!1}}function lL({path:e,derivedMetric:t,facetFields:n}){return{path:e,recursive:!0,filters:{and:[]},sort:{kind:"builtin",key:"added",dir:"desc"},textQuery:"",randomSeed:null,derivedMetric:t,unsupportedToken:null,facetFields:n}}function aL(e,t){const n=uL(e)||"view",r=new Set(t.map(i=>i.id));if(!r.has(n))return n;let s=2;for(;r.has(`${n}-${s}`);)s+=1;return`${n}-${s}`}function uL(e){return e.toLowerCase().trim().replace(/[^a-z0-9]+/g,"-").replace(/^-+|-+$/g,"")}function Gv(e){const t=e.filter(s=>s>0).sort((s,i)=>i-s),n=e.includes(0),r=[...t.map(s=>String(s))];return n&&r.push("None"),r.join(", ")}function cL(e,t){return e&&t?`${e} to ${t}`:e?`from ${e}`:t?`to ${t}`:""}function dL(e){if(e==="/"||e==="")return"Root";const t=e.split("/").filter(Boolean);return t.length?t.length<=2?`/${t.join("/")}`:`.../${t.slice(-2).join("/")}`:"Root"}function fL(e,t,n,r){return!n||r?t:e==="/"||e===""?e||"/":n===e||n.startsWith(`${e}/`)?e:t}function hL(e,t,n){return n&&t===e?n:null}function Bh(e){return typeof e!="number"||!Number.isFinite(e)||Math.abs(e-100)<2?null:Math.round(e/5)*5}function mL(e,t){const n=Bh(e);return n===null||n===t?null:e}function lS(e,t){return`${Yv(e)}–${Yv(t)}`}function Yv(e){const t=Math.abs(e);return t>=1e3?e.toFixed(0):t>=10?e.toFixed(2):e.toFixed(3)}function pL(e){const t=e.toLowerCase();return t.endsWith(".png")?"image/png":t.endsWith(".webp")?"image/webp":"image/jpeg"}function gL(e,t){const n=e.split("/").pop()??e;return{path:e,name:n,mime:pL(e),width:0,height:0,size:0,has_thumbnail:!0,has_metadata:!1,star:t??null}}const yL=()=>["embeddings"];function vL(){return _o({queryKey:yL(),queryFn:Fe.getEmbeddings,staleTime:6e4,gcTime:5*6e4,retry:1,refetchOnWindowFocus:!1})}function wL(e,t=250){const[n,r]=ig.useState(e);return ig.useEffect(()=>{const s=window.setTimeout(()=>r(e),Math.max(0,t));return()=>window.clearTimeout(s)},[e,t]),n}function aS(e,t){return Xb(e,t)}function xL(e,t,n){return e&&e.scopePath===qt(t)&&e.sessionResetToken===n?e:null}function bL(e,t){return e?t instanceof jn||t instanceof Error?t.message:"Failed to load embeddings.":null}function SL(e,t){if(e)return{version:1,path:e.path,generated_at:e.generated_at,items:t,folders:e.folders,metric_keys:e.metric_keys,categorical_keys:e.categorical_keys,total_items:e.scope_total,offset:0,limit:t.length}}function Uh(e){return{path:e,metricKeys:[],categoricalKeys:[],ready:!1}}function kL(e,t,n){const r=So(e);return(t==null?void 0:t.path)===r?{path:r,metricKeys:EL(t),categoricalKeys:ML(t),ready:!0}:n.path===r?n:Uh(r)}function CL(e,t){return e.path===t.path&&e.ready===t.ready&&Xv(e.metricKeys,t.metricKeys)&&Xv(e.categoricalKeys,t.categoricalKeys)}function Xv(e,t){return e.length!==t.length?!1:e.every((n,r)=>n===t[r])}function EL(e){const t=e.field_capabilities;return t?[...t.display_metrics]:[...e.metric_keys]}function ML(e){const t=e.field_capabilities;return t?[...t.categorical_inputs]:[...e.categorical_keys]}function RL(e){if(e[0]!=="folder-query")return"";const t=e[1];return Array.isArray(t)&&typeof t[1]=="string"?t[1]:""}function NL(e){const t=[],n=[],r=o=>{const l=o==null?void 0:o.trim();l&&!t.includes(l)&&t.push(l)},s=o=>{const l=o==null?void 0:o.trim();l&&!n.includes(l)&&n.push(l)};r(e.selectedMetric),e.sort.kind==="metric"&&r(e.sort.key);const i=Tr(e.derivedMetric);i&&r(ko(i));for(const o of e.filters.and)"metricRange"in o&&r(o.metricRange.key),"categoricalIn"in o&&s(o.categoricalIn.key);return{metric_keys:t.sort(),categorical_keys:n.sort()}}function jL(e){return e.metric_keys.length>64?"This view needs more than 64 metric columns. Remove metric filters to continue.":e.categorical_keys.length>32?"This view needs more than 32 categorical columns. Remove categorical filters to continue.":null}function Jv(e){return e.flatMap(t=>{const n=St.get(t);return n?[n]:[]})}function _L(e){return{and:e.and.filter(t=>!("urlContains"in t)&&!("urlNotContains"in t))}}function PL(e,t){const n=c.useRef({}),s=`${e.join("\0")}\0${JSON.stringify(t)}`,i=c.useMemo(()=>_L(t),[t]),o=c.useMemo(()=>Jv(e),[s]),[l,a]=c.useState(()=>({key:s,items:o}));return c.useEffect(()=>{const d=n.current,f=Array.from(new Set(e)),h=new Map(e.map((y,b)=>[y,b]));St.setActivePaths(d,f);const m=f.map(y=>St.subscribe(y,()=>{const b=St.get(y),w=b?aS([b],i).length===1:!1;a(S=>{const v=S.key===s?S.items:o,x=v.findIndex(C=>C.path===y);if(!w)return x<0?S.key===s?S:{key:s,items:v}:{key:s,items:v.filter((C,R)=>R!==x)};if(x>=0){if(v[x]===b)return S;const C=[...v];return C[x]=b,{key:s,items:C}}const p=h.get(y)??Number.MAX_SAFE_INTEGER,g=v.findIndex(C=>(h.get(C.path)??Number.MAX_SAFE_INTEGER)>p),k=[...v];return k.splice(g<0?k.length:g,0,b),{key:s,items:k}})}));return a({key:s,items:Jv(e)}),()=>{for(const y of m)y();St.release(d)}},[s]),l.key===s?l.items:o}function TL({current:e,query:t,similarityState:n,viewState:r,randomSeed:s,urlUnsupportedMetricIntent:i=null,localStarOverrides:o,sessionResetToken:l=0}){var ke,Ye,et;const a=Ms(),d=c.useRef(0),f=c.useMemo(()=>So(e),[e]),[h,m]=c.useState(()=>Uh(f)),y=n!==null,b=wL(t,250),w=c.useMemo(()=>y?null:U_(b,e),[y,b,e]),S=w!==null,v=(w==null?void 0:w.q)??"",x=c.useMemo(()=>NL(r),[r]),p=c.useMemo(()=>YI(r.sort,r.filters)??jL(x),[x,y,r.filters,r.sort]),g=p??i,k=c.useMemo(()=>({path:e,recursive:!0,filters:r.filters,sort:r.sort,textQuery:v,randomSeed:s,derivedMetric:r.derivedMetric??null,limit:f1,unsupportedToken:g,projection:x,generationToken:String(l)}),[g,x,e,v,s,l,r.derivedMetric,r.filters,r.sort]),C=c.useMemo(()=>JSON.stringify(n?["similarity",n.createdAt,r.filters]:g1(k)),[k,n,r.filters]),R=A2({...k,enabled:!y&&p===null}),{data:E}=H2("/",{enabled:e!=="/"}),N=K2(e,{enabled:!y}),j=c.useCallback(()=>R.refetch(),[R.refetch]);c.useEffect(()=>{a.removeQueries({predicate:({queryKey:be})=>Array.isArray(be)&&be[0]==="folder-query"?RL(be)!==e:I2(be,e,!1)})},[e,a]),c.useEffect(()=>{d.current+=1,TM({requestId:d.current})},[p,e,v,s,l,r.filters,r.sort,g]),c.useEffect(()=>()=>{Bb()},[e]),c.useEffect(()=>{var X;if(!((X=R.data)!=null&&X.pages[0]))return;const be=d.current;fy(be)},[R.data]),c.useEffect(()=>{p!==null&&fy(d.current)},[p]);const P=vL(),$=((ke=P.data)==null?void 0:ke.embeddings)??[],U=((Ye=P.data)==null?void 0:Ye.rejected)??[],q=$.length>0,V=bL(P.isError,P.error),A=(et=R.data)==null?void 0:et.pages[0],Z=c.useMemo(()=>{var be;return((be=R.data)==null?void 0:be.pages.flatMap(X=>X.item_paths))??[]},[R.data]),D=PL(Z,r.filters);c.useEffect(()=>{m(be=>{const X=kL(f,N.data,be);return CL(be,X)?be:X})},[f,N.data]);const z=c.useMemo(()=>h.path===f?h:Uh(f),[h,f]),B=D,O=c.useMemo(()=>SL(A,B),[A,B]),L=c.useMemo(()=>{const be=new Map;for(const X of B)be.set(X.path,X);return be},[B]),F=c.useMemo(()=>n?n.items.map(be=>{const X=L.get(be.path);return X||gL(be.path,o[be.path])}):[],[n,L,o]),T=c.useMemo(()=>d2(r.derivedMetric),[r.derivedMetric]),H=c.useMemo(()=>KI(z.metricKeys,y,F,T.metricKeys),[z.metricKeys,T.metricKeys,y,F]),G=c.useMemo(()=>XI(z.categoricalKeys,y,F,T.categoricalKeys),[z.categoricalKeys,T.categoricalKeys,y,F]),Y=c.useMemo(()=>{if(!y)return h2({items:B,metricKeys:H,categoricalKeys:G,spec:r.derivedMetric??null,backendStatus:(A==null?void 0:A.derived_metric_status)??null,loadedCount:B.length,totalItems:(A==null?void 0:A.filtered_total)??B.length});const be=F;return np({items:be,metricKeys:H,categoricalKeys:G,spec:r.derivedMetric??null,loadedCount:be.length,totalItems:be.length})},[A==null?void 0:A.derived_metric_status,A==null?void 0:A.filtered_total,B,F,y,G,H,r.derivedMetric]),re=y?B:Y.items,le=y?Y.items:F,he=Y.metricKeys,pe=Y.categoricalKeys,Se=c.useMemo(()=>n?aS(le,r.filters):re,[n,le,re,r.filters]),we=n?le.length:(A==null?void 0:A.scope_total)??re.length,Ee=n?Se.length:(A==null?void 0:A.filtered_total)??Se.length,xe=(A==null?void 0:A.scope_total)??(O==null?void 0:O.total_items)??(O==null?void 0:O.items.length)??we,Re=e==="/"?xe:E??xe,ue=!y&&p===null&&Se.length<Ee,Be=c.useCallback(()=>{!ue||R.isFetchingNextPage||R.fetchNextPage()},[R,ue]);return{data:O,refetch:j,isLoading:R.isLoading,isFetching:R.isFetching&&!R.isFetchingNextPage,isError:R.isError,searching:S,normalizedQ:v,similarityActive:y,embeddings:$,embeddingsRejected:U,embeddingsAvailable:q,embeddingsLoading:P.isLoading,embeddingsError:V,poolItems:re,similarityItems:le,metricKeys:he,categoricalKeys:pe,browseCapabilityKeysReady:z.ready,metricDisplayNames:Y.metricDisplayNames,derivedMetric:Y,items:Se,totalCount:we,filteredCount:Ee,scopeTotal:xe,rootTotal:Re,hasMoreFolderItems:ue,isLoadingMoreFolderItems:R.isFetchingNextPage,loadMoreFolderItems:Be,browseQueryUnavailableReason:p,analysisUnsupportedMetricIntent:g,browseTargetIdentity:C,browseTargetSettled:y||A!==void 0}}const IL=800;function LL(e,t){const n=(t==null?void 0:t.targetKey)===e.targetKey&&t.resetKey===e.resetKey,r=e.settled,s=e.statusKind==="failed"||e.statusKind==="unsupported";return{targetKey:e.targetKey,resetKey:e.resetKey,epoch:n?t.epoch:((t==null?void 0:t.epoch)??0)+1,membershipPaths:e.membershipPaths,ratingPaths:e.ratingPaths,filteredCount:r?e.filteredCount:null,displayItemCount:r?e.displayItemCount:null,displayTotalCount:r?e.displayTotalCount:null,metricsPopulationItemsComplete:r&&e.metricsPopulationItemsComplete,metricsFilteredItemsComplete:r&&e.metricsFilteredItemsComplete,metricRailState:s?"error":r?e.metricRailState:"pending",metricRailHistogram:r?e.metricRailHistogram:null,metricRailKey:s?null:e.metricRailKey,metricRailSortDir:e.metricRailSortDir}}function OL({target:e,previous:t,expiredTargetKey:n}){return!e.settled&&e.statusKind!=="failed"&&e.statusKind!=="unsupported"?(t==null?void 0:t.resetKey)===e.resetKey&&t.membershipPaths.length>0?{...t,requestedTargetKey:e.targetKey,phase:n===e.targetKey?"loading":"grace",retained:!0}:{targetKey:null,requestedTargetKey:e.targetKey,resetKey:e.resetKey,epoch:(t==null?void 0:t.epoch)??0,membershipPaths:[],ratingPaths:[],filteredCount:null,displayItemCount:null,displayTotalCount:null,metricsPopulationItemsComplete:!1,metricsFilteredItemsComplete:!1,metricRailState:"pending",metricRailHistogram:null,metricRailKey:null,metricRailSortDir:e.metricRailSortDir,phase:"loading",retained:!1}:{...LL(e,t),requestedTargetKey:e.targetKey,phase:"steady",retained:!1}}function FL(e){return{targetKey:e.targetKey,resetKey:e.resetKey,epoch:e.epoch,membershipPaths:e.membershipPaths,ratingPaths:e.ratingPaths,filteredCount:e.filteredCount,displayItemCount:e.displayItemCount,displayTotalCount:e.displayTotalCount,metricsPopulationItemsComplete:e.metricsPopulationItemsComplete,metricsFilteredItemsComplete:e.metricsFilteredItemsComplete,metricRailState:e.metricRailState,metricRailHistogram:e.metricRailHistogram,metricRailKey:e.metricRailKey,metricRailSortDir:e.metricRailSortDir}}function uS(e,t){var r;if(!e)return t;if(!t||e===t)return e;const n={...e.metrics??{}};for(const s of e.mutable_metric_keys??[])delete n[s];for(const s of t.mutable_metric_keys??[]){const i=(r=t.metrics)==null?void 0:r[s];i!=null&&(n[s]=i)}return{...e,star:t.star,notes:t.notes,metrics:Object.keys(n).length?n:void 0,mutable_metric_keys:t.mutable_metric_keys}}function AL(e,t,n,r,s){const i=c.useRef({}),[o,l]=c.useState(0),a=c.useMemo(()=>Array.from(new Set([...e.membershipPaths,...e.ratingPaths])),[e.membershipPaths,e.ratingPaths]),d=a.join("\0");c.useLayoutEffect(()=>{const m=i.current;St.seed([...r,...n]),St.setActivePaths(m,a);const y=a.map(b=>St.subscribe(b,()=>l(w=>w+1)));return l(b=>b+1),()=>{for(const b of y)b();St.release(m)}},[d]);const f=c.useMemo(()=>{const m=new Map;for(const y of r)m.set(y.path,y);for(const y of n)m.set(y.path,y);return m},[n,r]),h=e.targetKey===t&&!e.retained;return c.useMemo(()=>{const m=y=>y.flatMap(b=>{const w=h?f.get(b):s.get(b),S=uS(w,St.get(b));return S?[S]:[]});return{items:m(e.membershipPaths),ratingItems:m(e.ratingPaths)}},[e.membershipPaths,e.ratingPaths,s,f,h,o])}function DL({targetKey:e,resetKey:t,targetItems:n,targetRatingItems:r,targetFilteredCount:s,targetDisplayItemCount:i,targetDisplayTotalCount:o,targetMetricsPopulationItemsComplete:l,targetMetricsFilteredItemsComplete:a,targetMetricRailState:d,targetMetricRailHistogram:f,targetMetricRailKey:h,targetMetricRailSortDir:m,targetSettled:y,targetStatus:b}){var N,j;const w=c.useRef(null),S=c.useRef(new Map),v=c.useRef(e),[x,p]=c.useState(null);v.current=e;const g=c.useMemo(()=>({targetKey:e,resetKey:t,membershipPaths:n.map(P=>P.path),ratingPaths:r.map(P=>P.path),filteredCount:s,displayItemCount:i,displayTotalCount:o,metricsPopulationItemsComplete:l,metricsFilteredItemsComplete:a,metricRailState:d,metricRailHistogram:f,metricRailKey:h,metricRailSortDir:m,settled:y,statusKind:b.kind}),[t,i,o,s,n,e,d,f,h,m,l,a,r,y,b.kind]),k=OL({target:g,previous:w.current,expiredTargetKey:x}),C=AL(k,e,n,r,S.current),E=!y&&b.kind!=="failed"&&b.kind!=="unsupported"&&((N=w.current)==null?void 0:N.resetKey)===t&&(((j=w.current)==null?void 0:j.membershipPaths.length)??0)>0;return c.useLayoutEffect(()=>{p(null)},[t,e]),c.useEffect(()=>{if(!E)return;const P=window.setTimeout(()=>{v.current===e&&p(e)},IL);return()=>window.clearTimeout(P)},[E,t,e]),c.useLayoutEffect(()=>{if(k.phase!=="steady"||v.current!==e)return;p($=>$===e?null:$),w.current=FL(k);const P=new Map;for(const $ of r)P.set($.path,$);for(const $ of n)P.set($.path,$);S.current=P},[k,n,e,r]),{...k,...C}}function zL(e,t){return e&&!t}function $L(e,t){return{resetViewer:e!==null,resetCompare:t}}function cS(e,t,n){if(!e.length)return[];const r=new Map(t.map(i=>[i.path,i])),s=new Map(n.map(i=>[i.path,i]));return e.map(i=>r.get(i)??s.get(i)).filter(i=>!!i)}function BL(e,t){if(!e.length)return[];const n=new Set(e);return t.filter(r=>n.has(r.path))}function UL(e,t,n,r){return r==="selection"?cS(e,t,n):BL(e,n)}function Zv(e,t,n,r){if(!n)return!1;if(r)return!0;const s=new Set(t.map(i=>i.path));return e.every(i=>s.has(i))}function HL(e,t,n){if(!n||!e.length)return e;const r=new Set(t),s=e.filter(i=>r.has(i));return s.length===e.length?e:s}function KL(e,t){const n=new Map(t.map(r=>[r.path,r]));return e.flatMap(r=>{const s=n.get(r);return s?[s]:[]})}function VL(e,t,n){const r=new Set(e),s=new Map(n.map(i=>[i.path,i]));return t.filter(i=>r.has(i.path)).map(i=>s.get(i.path)??i)}function WL(e,t,n){if(!e.length||!t)return null;const r=e.indexOf(t);if(r===-1)return null;const s=Math.min(e.length-1,Math.max(0,r+n)),i=e[s];return!i||i===t?null:i}function Xd(e,t,n){return e[0]??t??n??null}function qL(e){return e||null}function QL({current:e,itemPaths:t,items:n,selectionPool:r,compareOrderMode:s,membershipSettled:i,membershipComplete:o,focusGridCell:l}){const[a,d]=c.useState([]),[f,h]=c.useState(null),[m,y]=c.useState(!1),[b,w]=c.useState(0),[S,v]=c.useState([]),[x,p]=c.useState(0),g=c.useRef(!1),k=c.useRef(!1),C=c.useRef(null),R=c.useRef({}),E=c.useRef([]),N=c.useRef([]),[j,P]=c.useState(0),$=a.join("\0");c.useLayoutEffect(()=>{const W=R.current;St.setActivePaths(W,a);const fe=a.map(ee=>St.subscribe(ee,()=>P(ce=>ce+1)));return P(ee=>ee+1),()=>{for(const ee of fe)ee();St.release(W)}},[$]);const U=c.useMemo(()=>cS(a,r,n),[a,r,n]),q=Zv(a,U,i,o);c.useLayoutEffect(()=>{q&&(E.current=U)},[q,U]);const V=q?U:E.current,A=c.useMemo(()=>KL(a,V),[V,a]),Z=c.useMemo(()=>A.flatMap(W=>{const fe=uS(W,St.get(W.path));return fe?[fe]:[]}),[A,j]),D=c.useMemo(()=>UL(a,r,n,s),[a,r,n,s]),z=Zv(a,D,i,o);c.useLayoutEffect(()=>{(!m||z)&&(N.current=D)},[z,m,D]);const B=c.useMemo(()=>!m||z?D:VL(a,N.current,Z),[z,m,Z,a,D]),O=c.useMemo(()=>B.map(W=>W.path),[B]),L=Math.max(0,B.length-2),F=Math.min(b,L),T=B[F]??null,H=B[F+1]??null,G=F>0,Y=F<B.length-2,re=B.length>=2,le=f!=null||m,he=f??a[0]??null,pe=f&&S.length?S:t,Se=he?pe.indexOf(he):-1,we=Se>0,Ee=Se>=0&&Se<pe.length-1;c.useEffect(()=>{w(W=>W>L?L:W)},[L]);const xe=c.useCallback(()=>{p(W=>W+1)},[]),Re=c.useCallback(W=>{W&&(C.current=W,p(fe=>fe+1),l(W))},[l]),ue=c.useCallback(W=>{C.current=W},[]),Be=c.useCallback(()=>{h(null),v([]),g.current=!1},[]),ke=c.useCallback(W=>{const fe=qL(W);if(y(!1),w(0),k.current=!1,g.current=!1,fe){h(fe),v(t.includes(fe)?t:[]),d([fe]),C.current=fe;return}d([]),h(null),v([]),C.current=null},[t]),Ye=c.useCallback(W=>{if(W){h(W),v(t.includes(W)?t:[]),d([W]);return}f&&Re(Xd(a,f,C.current)),Be()},[t,Be,Re,a,f]),et=c.useCallback(W=>{h(W),v(t.includes(W)?t:[]),g.current=!0,hP(W)},[t]),be=c.useCallback(()=>{const W=Xd(a,f,C.current);h(null),v([]),g.current?(g.current=!1,window.history.back()):Sv(e),Re(W)},[e,Re,a,f]),X=c.useCallback(()=>{m||!re||(a[0]&&(C.current=a[0]),w(0),y(!0),f&&(h(null),v([]),g.current&&(g.current=!1),Sv(e)),k.current||(window.history.pushState({compare:!0},"",window.location.href),k.current=!0))},[m,re,e,a,f]),me=c.useCallback(()=>{y(!1),k.current&&(k.current=!1,window.history.back()),l(C.current??a[0])},[l,a]),Ne=c.useCallback(W=>{B.length<2||w(fe=>{const ee=Math.max(0,B.length-2);return Math.min(ee,Math.max(0,fe+W))})},[B.length]),K=c.useCallback(W=>{const fe=f??a[0],ee=WL(pe,fe,W);ee&&(f&&(h(ee),mP(ee)),C.current=ee,d([ee]))},[pe,a,f]);return c.useEffect(()=>{!f||S.length||!t.includes(f)||v(t)},[t,f,S.length]),c.useLayoutEffect(()=>{zL(m,re)&&me()},[m,re,me]),c.useEffect(()=>{const W=()=>{const fe=$L(f,m);fe.resetViewer&&(Re(Xd(a,f,C.current)),g.current=!1,h(null),v([])),fe.resetCompare&&(k.current=!1,y(!1))};return window.addEventListener("popstate",W),()=>window.removeEventListener("popstate",W)},[m,Re,a,f]),{selectedPaths:a,setSelectedPaths:d,viewer:f,compareOpen:m,restoreGridToSelectionToken:x,bumpRestoreGridToSelectionToken:xe,selectedItems:Z,compareItems:B,comparePaths:O,compareIndexClamped:F,compareA:T,compareB:H,canComparePrev:G,canCompareNext:Y,compareEnabled:re,canPrevImage:we,canNextImage:Ee,overlayActive:le,rememberFocusedPath:ue,openViewer:et,closeViewer:be,openCompare:X,closeCompare:me,handleCompareNavigate:Ne,handleNavigate:K,resetViewerState:Be,resetForScopeBoundary:ke,syncHashImageSelection:Ye}}const GL=2048,YL=6,XL=10;function dS(e){const t=new Map;for(const n of e)t.set(n.path,n.name);return t}function fS(e,t){return t.get(e)??e.split("/").pop()??e}function ew(e,t){const n=e.filter(r=>!t.has(r.path));return n.length===e.length?e:n}function tw(e,t,n,r,s){const i=e.filter(l=>l.path!==t);return[{path:t,ts:n,kind:r},...i].slice(0,s)}function JL(e,t){if(!e.length)return null;const n=dS(t),r=new Set,s=[];for(const o of e)r.has(o.path)||(r.add(o.path),s.push(o.path));const i=s.slice(0,2).map(o=>fS(o,n));return{count:s.length,names:i,extra:Math.max(0,s.length-i.length)}}function ZL(e,t,n,r){if(!e.length)return[];const s=dS(t);return e.map(i=>({path:i.path,label:fS(i.path,s),timeLabel:r(i.ts,n)}))}function eO(e){const[t,n]=c.useState([]),[r,s]=c.useState([]),[i,o]=c.useState(new Map),l=c.useRef(new Map),a=c.useRef(new Set),d=c.useRef(new Set),f=c.useRef(new Set);c.useEffect(()=>()=>{for(const S of l.current.values())window.clearTimeout(S);l.current.clear(),a.current.clear()},[]),c.useEffect(()=>{d.current=new Set(e),n(S=>ew(S,f.current))},[e]);const h=c.useCallback((S,v)=>{if(v!=null){if(a.current.has(v))return;if(a.current.add(v),a.current.size>GL){const C=a.current.values().next().value;C!=null&&a.current.delete(C)}}const x=v!=null?`event:${v}`:`event:${S}:${Date.now()}`;o(C=>{if(C.get(S)===x)return C;const R=new Map(C);return R.set(S,x),R});const p=l.current,g=p.get(S);g!=null&&window.clearTimeout(g);const k=window.setTimeout(()=>{o(C=>{if(C.get(S)!==x)return C;const R=new Map(C);return R.delete(S),R}),p.delete(S)},kI);p.set(S,k)},[]),m=c.useCallback(S=>{f.current=S,n(v=>ew(v,S))},[]),y=c.useCallback((S,v,x)=>{const p=Date.now();d.current.has(S)&&f.current.has(S)||n(k=>tw(k,S,p,v,YL)),h(S,x)},[h]),b=c.useCallback((S,v,x)=>{const p=Date.now(),g=N1(x)??p;s(k=>tw(k,S,g,v,XL))},[]),w=c.useCallback(()=>{n([])},[]);return{offViewActivity:t,recentTouches:r,highlightedPaths:i,onVisiblePathsChange:m,markRecentActivity:y,markRecentTouch:b,clearOffViewActivity:w}}function tO(e){return Array.isArray(e)&&(e[0]==="folder"||e[0]==="search")}function nw(e,t){if(Array.isArray(e))for(const n of e){const r=n.path;typeof r=="string"&&r&&t.add(r)}}function nO(e){if(!e||typeof e!="object")return[];const t=new Set;nw(e.items,t);const n=e.pages;if(Array.isArray(n))for(const r of n)nw(r==null?void 0:r.items,t);return Array.from(t)}function rw(e){return e.queryHash??JSON.stringify(e.queryKey)}function rO(e,t){if(e.path!==t.path)return e;const n=Object.prototype.hasOwnProperty.call(t,"star"),r=t.metrics!==void 0,s=t.notes!==void 0;let i=e;return n&&e.star!==t.star&&(i={...i,star:t.star??null}),r&&(i={...i,metrics:t.metrics??void 0}),s&&e.notes!==t.notes&&(i={...i,notes:t.notes??""}),i}function sw(e,t){if(!e)return e;let n=!1;const r=e.items.map(s=>{const i=rO(s,t);return i!==s&&(n=!0),i});return n?{...e,items:r}:e}class sO{constructor(){ge(this,"hashesByPath",new Map);ge(this,"pathsByHash",new Map);ge(this,"queryKeyByHash",new Map)}seed(t){this.hashesByPath.clear(),this.pathsByHash.clear(),this.queryKeyByHash.clear();for(const n of t)this.syncQuery(n)}syncQuery(t){var i;const n=rw(t);if(this.deleteHash(n),!tO(t.queryKey))return;const r=nO((i=t.state)==null?void 0:i.data);if(!r.length)return;const s=new Set(r);this.pathsByHash.set(n,s),this.queryKeyByHash.set(n,t.queryKey);for(const o of s){const l=this.hashesByPath.get(o)??new Set;l.add(n),this.hashesByPath.set(o,l)}}removeQuery(t){this.deleteHash(rw(t))}getQueryKeys(t){const n=this.hashesByPath.get(t);if(!n||!n.size)return[];const r=[];for(const s of n){const i=this.queryKeyByHash.get(s);i&&r.push(i)}return r}deleteHash(t){const n=this.pathsByHash.get(t);if(n){for(const r of n){const s=this.hashesByPath.get(r);s&&(s.delete(t),s.size||this.hashesByPath.delete(r))}this.pathsByHash.delete(t)}this.queryKeyByHash.delete(t)}}function iO(e,t){const n=t==null?void 0:t.query;if(n){if((t==null?void 0:t.type)==="removed"){e.removeQuery(n);return}e.syncQuery(n)}}function oO(e,t,n,r={}){const s=Object.prototype.hasOwnProperty.call(n,"star"),i=n.metrics!==void 0,o=n.notes!==void 0;if(!(!s&&!i&&!o))for(const l of t.getQueryKeys(n.path))e.getQueryState(l)&&e.setQueryData(l,a=>aO(a,n,r.removeConclusiveFilterMismatch?lO(l):null))}function lO(e){if(!Array.isArray(e)||e[0]!=="folder-query")return null;const t=e[1];if(!Array.isArray(t))return null;const n=t[3];return!n||typeof n!="object"||!Array.isArray(n.and)?null:n}function aO(e,t,n){if(!e)return e;const r=e.pages;if(!Array.isArray(r))return sw(e,t);let s=!1,i=!1;const o=r.map(a=>{const d=sw(a,t);if(n&&d){const f=d.items.filter(h=>h.path!==t.path||Xb([h],n).length>0);if(f.length!==d.items.length)return s=!0,i=!0,{...d,items:f}}return d!==a&&(s=!0),d}),l=i?o.map(a=>{const d=a.filtered_total;return typeof d=="number"?{...a,filtered_total:Math.max(0,d-1)}:a}):o;return s?{...e,pages:l}:e}function iw(e){if(!e||typeof e!="object")return null;const t=e.dependency_manifest;if(t)return t;const n=e.pages;if(!Array.isArray(n))return null;for(const r of n){const s=r==null?void 0:r.dependency_manifest;if(s)return s}return null}function ow(e,t){if(!e.length)return!1;if(!t||t.unknown)return!0;const n=new Set(t.fields),r=new Set(t.metric_keys),s=new Set(t.categorical_keys);for(const i of e)if(n.has(i)||i==="metrics"&&r.size>0||i==="categoricals"&&s.size>0||i.startsWith("metric:")&&r.has(i.slice(7))||i.startsWith("categorical:")&&s.has(i.slice(12)))return!0;return!1}const uO=512,cO=10*6e4;class dO{constructor(t,n,r=()=>{var s;return((s=globalThis.performance)==null?void 0:s.now())??Date.now()}){ge(this,"seenMutationIds",new Map);ge(this,"pendingChangedFields",new Set);ge(this,"forceReconciliation",!1);ge(this,"throwOnReconciliationError",!1);ge(this,"active",null);ge(this,"reconciliationPasses",0);this.queryClient=t,this.project=n,this.now=r}accept(t){const n=this.now();if(this.pruneSeen(n),this.seenMutationIds.has(t.mutationId))return!1;if(this.seenMutationIds.set(t.mutationId,n),this.pruneSeen(n),this.project(t.item,{removeConclusiveFilterMismatch:!0,replaceMutableMetrics:t.replaceMutableMetrics}),!this.hasRelevantActiveQuery(t.changedFields))return!0;for(const r of t.changedFields)this.pendingChangedFields.add(r);return this.startReconciliation(),!0}diagnostics(){return this.pruneSeen(this.now()),{seenMutationIds:this.seenMutationIds.size,active:this.active!==null,reconciliationPasses:this.reconciliationPasses}}async whenIdle(){for(;this.active;)await this.active}async reconcileAll(){this.forceReconciliation=!0,this.throwOnReconciliationError=!0,this.startReconciliation(),await this.whenIdle()}pruneSeen(t){for(const[n,r]of this.seenMutationIds){if(t-r<=cO)break;this.seenMutationIds.delete(n)}for(;this.seenMutationIds.size>uO;){const n=this.seenMutationIds.keys().next().value;if(n===void 0)break;this.seenMutationIds.delete(n)}}hasRelevantActiveQuery(t){return this.queryClient.getQueryCache().findAll({type:"active"}).some(n=>lw(n.queryKey)&&ow(t,iw(n.state.data)))}startReconciliation(){if(this.active)return;const t=async()=>{await this.runPass(),(this.pendingChangedFields.size>0||this.forceReconciliation)&&await this.runPass()};this.active=t().finally(()=>{this.active=null,(this.pendingChangedFields.size>0||this.forceReconciliation)&&this.startReconciliation()})}async runPass(){const t=Array.from(this.pendingChangedFields);this.pendingChangedFields.clear();const n=this.forceReconciliation;this.forceReconciliation=!1;const r=this.throwOnReconciliationError;this.throwOnReconciliationError=!1;const s=this.queryClient.getQueryCache().findAll({type:"active"}).filter(i=>lw(i.queryKey)&&(n||ow(t,iw(i.state.data))));s.length&&(this.reconciliationPasses+=1,await Promise.all(s.map(i=>this.queryClient.invalidateQueries({queryKey:i.queryKey,exact:!0,refetchType:"active"},{throwOnError:r}))))}}function lw(e){return Array.isArray(e)&&(e[0]==="folder-query"||e[0]==="folder-facets")}function fO(e){const t=globalThis.requestIdleCallback;return typeof t=="function"?t(e):globalThis.setTimeout(e,0)}function hO(e){const t=globalThis.cancelIdleCallback;if(typeof t=="function"&&typeof e=="number"){t(e);return}globalThis.clearTimeout(e)}function mO(e,t=200){let n=null,r=null,s=null;const i=()=>{n!=null&&(globalThis.clearTimeout(n),n=null),r!=null&&(hO(r),r=null)},o=()=>{if(s==null)return;const l=s;s=null,e(l)};return{schedule(l){s=l,i(),n=globalThis.setTimeout(()=>{n=null,r=fO(()=>{r=null,o()})},t)},flush(){i(),o()},cancel(){i(),s=null}}}const pO=250,gO=[250,500,1e3,2e3,4e3];function yO(e,t=pO){let n=null;return{schedule:()=>{n!==null&&globalThis.clearTimeout(n),n=globalThis.setTimeout(()=>{n=null,e()},t)},cancel:()=>{n!==null&&globalThis.clearTimeout(n),n=null}}}function vO(e,t=gO){let n=0,r=null;const s=()=>{r!==null&&globalThis.clearTimeout(r),r=null};return{schedule:()=>{if(r!==null||n>=t.length)return;const i=t[n];n+=1,r=globalThis.setTimeout(()=>{r=null,e()},i)},reset:()=>{s(),n=0},cancel:()=>{s(),n=t.length}}}function wO(e){switch(e){case"live":return"Live";case"reconnecting":return"Reconnecting…";case"offline":return"Offline";case"connecting":case"idle":default:return"Connecting…"}}function xO({queryClient:e,updateItemCaches:t,setLocalStarOverrides:n,applyPresenceCounts:r,markRecentActivity:s,markRecentTouch:i,updateLastEdited:o}){const[l,a]=c.useState("idle"),d=c.useRef(t);d.current=t;const f=c.useRef(null);return(!f.current||f.current.queryClient!==e)&&(f.current={queryClient:e,reconciler:new dO(e,(h,m)=>d.current(h,m))}),c.useEffect(()=>{var E;const h=(E=f.current)==null?void 0:E.reconciler;if(!h)return;const m=yO(()=>{e.invalidateQueries({queryKey:["folder-fields"],refetchType:"active"})});let y=!0,b=0;const w=vO(()=>{v()}),S=async(N,j)=>{const P=as.observeStatus(N,j);if(!P.length)return;const $=P.flatMap(({path:U})=>[e.invalidateQueries({queryKey:Js(U),refetchType:"active"},{throwOnError:!0}),e.invalidateQueries({queryKey:up(U),refetchType:"active"},{throwOnError:!0})]);await Promise.all([...$,h.reconcileAll()]),y&&as.acknowledgeRepairs(P)},v=async()=>{b+=1;const N=b;try{const j=await Fe.getSyncState();if(!y||N!==b)return;await S(j,"sync"),w.reset()}catch{y&&w.schedule()}},x=(N,j,P)=>N.mutation_id||`${j}:event:${P??`${N.path}:${N.version??0}:${N.updated_at??""}`}`,p=(N,j)=>{if(!h.accept({mutationId:x(N,"item-updated",j),changedFields:N.changed_fields??["unknown"],item:{path:N.path,star:N.star??null,metrics:N.metrics,notes:N.notes??""},replaceMutableMetrics:N.metrics!==void 0}))return;N.accepted_event&&N.durable_watermark&&as.observeAccepted(N.path,N.accepted_event,N.persistence??"pending",N.durable_watermark);const U={...e.getQueryData(Js(N.path)),v:1,tags:N.tags??[],notes:N.notes??"",star:N.star??null,version:N.version??1,updated_at:N.updated_at??"",updated_by:N.updated_by??"server"};w1(e,N.path,U),aP(N.path,U),s(N.path,"item-updated",j),i(N.path,"item-updated",N.updated_at),o(N.updated_at),n(q=>{if(q[N.path]===void 0)return q;const V={...q};return delete V[N.path],V})},g=G2(N=>{p({...N.response.sidecar,path:N.path,mutation_id:N.response.mutation_id,changed_fields:N.changedFields},null)});FN();const k=DN(N=>{if(N.type==="table-source"){zy();return}if(N.type==="persistence"){S(N.data,"event").then(w.reset,w.schedule);return}if(N.type==="presence"){const $=N.data;if(!($!=null&&$.gallery_id))return;r([$]);return}const j=N.data;if(!(j!=null&&j.path))return;const P=j.path;if(N.type==="item-updated"){const $=N.data;p({...$,path:P},N.id)}else if(N.type==="metrics-updated"){const $=N.data;if(!h.accept({mutationId:x($,"metrics-updated",N.id),changedFields:$.changed_fields??["unknown"],item:{path:P,metrics:$.metrics},replaceMutableMetrics:!0}))return;$.accepted_event&&$.durable_watermark&&as.observeAccepted(P,$.accepted_event,$.persistence??"pending",$.durable_watermark),m.schedule(),s(P,"metrics-updated",N.id),i(P,"metrics-updated",$.updated_at),o($.updated_at)}}),C=zN(N=>{a(N),N==="live"&&(v(),zy())}),R=W2(()=>{v()});return()=>{y=!1,b+=1,m.cancel(),w.cancel(),g(),k(),C(),R(),AN()}},[r,s,i,e,n,o]),l}function aw(e){if(typeof e!="number"||!Number.isFinite(e))return;const t=Math.trunc(e);return t<0?0:t}function bO(e){if(typeof e!="string")return;const t=e.trim();return t.length?t:void 0}function SO(e){if(!e)return null;const t=e.state;if(t!=="idle"&&t!=="running"&&t!=="ready"&&t!=="error")return null;let n=aw(e.done);const r=aw(e.total);return n!==void 0&&r!==void 0&&n>r&&(n=r),{state:t,scope:typeof e.scope=="string"?e.scope:void 0,done:n,total:r,generation:bO(e.generation),started_at:typeof e.started_at=="string"?e.started_at:void 0,finished_at:typeof e.finished_at=="string"?e.finished_at:void 0,error:typeof e.error=="string"?e.error:void 0}}function kO(e,t){return e===t?!0:!e||!t?!1:e.state===t.state&&e.scope===t.scope&&e.done===t.done&&e.total===t.total&&e.generation===t.generation&&e.started_at===t.started_at&&e.finished_at===t.finished_at&&e.error===t.error}function CO(e){return(e==null?void 0:e.state)==="idle"||(e==null?void 0:e.state)==="running"}function EO(e,t,n){return(e==null?void 0:e.state)==="running"?t:n}const MO=1200,uw=3e3,cw="Refresh unavailable in current mode";function RO(){let e=0;return{begin:()=>(e+=1,e),isCurrent:t=>t===e}}function NO(e){const t=e==null?void 0:e.refresh;if(t&&typeof t.enabled=="boolean")return t.enabled?{enabled:!0,note:null}:{enabled:!1,note:typeof t.note=="string"&&t.note.trim()?t.note:cw};const n=(e==null?void 0:e.mode)??null;return n==="table"&&(e==null?void 0:e.can_write)===!0?{enabled:!0,note:null}:n==="dataset"||n==="table"?{enabled:!1,note:cw}:{enabled:!0,note:null}}function jO(){const[e,t]=c.useState(!0),[n,r]=c.useState(null),[s,i]=c.useState(!0),[o,l]=c.useState(null),[a,d]=c.useState(null),[f,h]=c.useState(null),[m,y]=c.useState(null);return c.useEffect(()=>{let b=!1,w=null;const S=RO(),v=()=>{w!=null&&(window.clearTimeout(w),w=null)},x=k=>{v(),w=window.setTimeout(()=>{p()},k)},p=async()=>{var C,R;const k=S.begin();try{const E=await Fe.getHealth();if(b||!S.isCurrent(k))return;t(((C=E==null?void 0:E.labels)==null?void 0:C.enabled)??!0),(R=E==null?void 0:E.labels)!=null&&R.persistence&&as.observeStatus(E.labels.persistence,"health"),r((E==null?void 0:E.mode)??null);const N=NO(E);i(N.enabled),l(N.note),h((E==null?void 0:E.table_launch_status)??null),y((E==null?void 0:E.launch_session)??null);const j=SO(E==null?void 0:E.indexing);d(P=>kO(P,j)?P:j),CO(j)&&x(EO(j,MO,uw))}catch{if(b||!S.isCurrent(k))return;x(uw)}},g=BN(()=>{p()});return p(),()=>{b=!0,v(),g()}},[]),{persistenceEnabled:e,healthMode:n,refreshEnabled:s,refreshDisabledReason:o,indexing:a,tableLaunchStatus:f,launchSession:m}}function dw(e){if(!(e instanceof jn))return null;const t=e.body;if(!t||typeof t!="object")return null;const n=t.error;return typeof n=="string"?n:null}function _O({currentGalleryId:e,connectionStatus:t,applyPresenceCounts:n,clearPresenceScope:r}){const s=c.useRef(null),i=c.useRef(null),o=c.useRef(null),l=c.useRef(!1),a=c.useRef(null),d=c.useRef("idle"),f=c.useCallback(()=>{a.current!=null&&(window.clearTimeout(a.current),a.current=null)},[]),h=c.useCallback(p=>{s.current=p.lease_id,i.current=p.gallery_id,n([p])},[n]),m=c.useCallback(async(p,g=!1)=>{const k=g?void 0:s.current??void 0,C=R=>Fe.joinPresence(p,R);try{h(await C(k));return}catch(R){if(!g&&dw(R)==="invalid_lease"){h(await C(void 0));return}throw R}},[h]),y=c.useCallback(async(p,g)=>{if(p===g){await m(g);return}const k=s.current;if(!k){await m(g,!0);return}try{const C=await Fe.movePresence(p,g,k);i.current=C.to_scope.gallery_id,n([C.from_scope,C.to_scope]);return}catch(C){const R=dw(C);if(R==="invalid_lease"){await m(g,!0);return}if(R==="scope_mismatch"){await m(g);return}throw C}},[n,m]),b=c.useCallback(async p=>{const g=i.current;if(!g){await m(p,!0);return}if(g===p){await m(p);return}await y(g,p)},[m,y]),w=c.useCallback(async()=>{if(l.current)return;const p=o.current;if(p){o.current=null,l.current=!0;try{await b(p)}catch{}finally{l.current=!1;const g=o.current;g&&g!==i.current&&w()}}},[b]),S=c.useCallback((p,g=!1)=>{if(o.current=p,f(),g||i.current==null){w();return}a.current=window.setTimeout(()=>{a.current=null,w()},SI)},[f,w]),v=c.useCallback(()=>{i.current=null,s.current=null,o.current=null,f()},[f]),x=c.useCallback(p=>{const g=i.current,k=s.current;!g||!k||(KN(g,k),p&&r(g),v())},[r,v]);c.useEffect(()=>{const p=i.current;p!==e&&S(e,p==null)},[e,S]),c.useEffect(()=>{const p=window.setInterval(()=>{const g=i.current;g&&m(g)},bI);return()=>{window.clearInterval(p)}},[m]),c.useEffect(()=>{const p=d.current;if(d.current=t,t==="live"&&p!=="live"){S(e,!0);return}(t==="reconnecting"||t==="offline")&&r(i.current)},[r,t,e,S]),c.useEffect(()=>{const p=()=>x(!0),g=()=>x(!0),k=()=>{S(e,!0)};return window.addEventListener("pagehide",p),window.addEventListener("beforeunload",g),window.addEventListener("pageshow",k),()=>{window.removeEventListener("pagehide",p),window.removeEventListener("beforeunload",g),window.removeEventListener("pageshow",k),x(!1)}},[e,S,x])}function fw(e,t){return t-e<xI?xP(e,t):bP(e)}function PO(){const[e,t]=c.useState(null),[n,r]=c.useState(null),[s,i]=c.useState(!1),[o,l]=c.useState(()=>Date.now());c.useEffect(()=>{if(n==null){i(!1);return}i(!0);const h=window.setTimeout(()=>i(!1),vI);return()=>window.clearTimeout(h)},[n]),c.useEffect(()=>{if(e==null)return;l(Date.now());const h=window.setInterval(()=>l(Date.now()),1e4);return()=>window.clearInterval(h)},[e]);const a=c.useCallback(h=>{const m=Date.now(),b=N1(h)??m,w=b>m?m:b;t(S=>S==null?w:S>w?S:w),r(m),l(m)},[]),d=e!=null,f=c.useMemo(()=>!d||e==null?"No edits yet.":fw(e,o),[d,e,o]);return{recentEditActive:s,hasEdits:d,lastEditedNow:o,lastEditedLabel:f,updateLastEdited:a,formatTimestampLabel:fw}}function TO({current:e,currentGalleryId:t,itemPaths:n,items:r,queryClient:s,updateItemCaches:i,setLocalStarOverrides:o}){const[l,a]=c.useState({}),{offViewActivity:d,recentTouches:f,highlightedPaths:h,onVisiblePathsChange:m,markRecentActivity:y,markRecentTouch:b,clearOffViewActivity:w}=eO(n),{recentEditActive:S,hasEdits:v,lastEditedNow:x,lastEditedLabel:p,updateLastEdited:g,formatTimestampLabel:k}=PO(),{persistenceEnabled:C,healthMode:R,refreshEnabled:E,refreshDisabledReason:N,indexing:j,tableLaunchStatus:P,launchSession:$}=jO(),U=c.useCallback(O=>{O.length&&a(L=>{let F=!1;const T={...L};for(const H of O){const G=L[H.gallery_id];G&&G.viewing===H.viewing&&G.editing===H.editing||(T[H.gallery_id]=H,F=!0)}return F?T:L})},[]),q=c.useCallback(O=>{O&&a(L=>{if(!(O in L))return L;const F={...L};return delete F[O],F})},[]),V=xO({queryClient:s,updateItemCaches:i,setLocalStarOverrides:o,applyPresenceCounts:U,markRecentActivity:y,markRecentTouch:b,updateLastEdited:g});_O({currentGalleryId:t,connectionStatus:V,applyPresenceCounts:U,clearPresenceScope:q});const A=l[e],Z=(A==null?void 0:A.editing)??0,D=c.useMemo(()=>wO(V),[V]),z=c.useMemo(()=>JL(d,r),[d,r]),B=c.useMemo(()=>ZL(f,r,x,k),[r,x,f]);return{connectionStatus:V,connectionLabel:D,presence:A,editingCount:Z,recentEditActive:S,hasEdits:v,lastEditedLabel:p,persistenceEnabled:C,healthMode:R,refreshEnabled:E,refreshDisabledReason:N,indexing:j,tableLaunchStatus:P,launchSession:$,highlightedPaths:h,onVisiblePathsChange:m,offViewSummary:z,recentTouchesDisplay:B,clearOffViewActivity:w}}function IO(e){return Array.from(new Set(e.filter(Boolean)))}function LO({selectedPaths:e,setSelectedPaths:t}){const[n,r]=c.useState(null),s=c.useCallback(l=>{const a=IO(e);return a.includes(l)?a:[l]},[e]),i=c.useCallback((l,a)=>{const d=s(l);t(d),r({x:a.x,y:a.y,kind:"grid",payload:{paths:d}})},[s,t]),o=c.useCallback((l,a)=>{r({x:a.x,y:a.y,kind:"tree",payload:{path:l}})},[]);return c.useEffect(()=>{const l=()=>r(null),a=d=>{d.key==="Escape"&&r(null)};return window.addEventListener("click",l),window.addEventListener("keydown",a),()=>{window.removeEventListener("click",l),window.removeEventListener("keydown",a)}},[]),{ctx:n,setCtx:r,openGridActions:i,openFolderActions:o}}function OO({setCurrent:e,syncHashImageSelection:t,bumpRestoreGridToSelectionToken:n}){const r=c.useRef(!1),s=ai(t),i=ai(n);c.useEffect(()=>{const o=a=>{const{folderTarget:d,imageTarget:f}=M1(a),h=!r.current;r.current=!0,s.current(f),e(m=>{const y=fL(m,d,f,h);return m===y?m:(i.current(),y)})};o(Lh());const l=()=>o(Lh());return window.addEventListener("hashchange",l),()=>window.removeEventListener("hashchange",l)},[i,e,s])}const Yo={kind:"none"};function FO(e,t){if(t.viewerOpen||t.compareOpen||e.activeModalOpen)return Yo;const n=e.key.toLowerCase(),r=e.ctrlKey||e.metaKey,s=r&&!e.altKey;if(r&&n==="b"&&!e.targetIsInput){const i=KP({leftContentOpen:t.leftOpen,rightOpen:t.rightOpen,altKey:e.altKey});return{kind:"toggleSidebars",leftOpen:i.leftContentOpen,rightOpen:i.rightOpen}}return e.targetIsKeyboardControl?Yo:s&&n==="a"?{kind:"selectAll"}:e.altKey||e.ctrlKey||e.metaKey?Yo:e.key==="Backspace"||e.key==="Delete"?{kind:"openParentFolder"}:e.key==="Escape"?t.selectedCount?{kind:"clearSelection"}:t.mobileSelectMode?{kind:"exitMobileSelectMode"}:Yo:e.key==="/"?t.isNarrowViewport?{kind:"openMobileSearch"}:{kind:"focusDesktopSearch"}:Yo}function AO(e){return{key:e.key,altKey:e.altKey,ctrlKey:e.ctrlKey,metaKey:e.metaKey,targetIsInput:Zm(e.target),targetIsKeyboardControl:Qb(e.target),activeModalOpen:x_()}}function DO(e){return{viewerOpen:e.viewerOpen,compareOpen:e.compareOpen,selectedCount:e.selectedPaths.length,mobileSelectMode:e.mobileSelectMode,leftOpen:e.leftOpen,rightOpen:e.rightOpen,isNarrowViewport:e.viewportWidth<=hl.narrowMax}}function zO(e){const t=ai(e);c.useEffect(()=>{const n=r=>{const s=t.current,i=FO(AO(r),DO(s));i.kind!=="none"&&(r.preventDefault(),i.kind==="toggleSidebars"?(s.setLeftOpen(i.leftOpen),s.setRightOpen(i.rightOpen)):i.kind==="selectAll"?s.setSelectedPaths(s.items.map(o=>o.path)):i.kind==="openParentFolder"?s.openFolder(E1(s.current)):i.kind==="clearSelection"?s.setSelectedPaths([]):i.kind==="exitMobileSelectMode"?s.setMobileSelectMode(!1):i.kind==="openMobileSearch"?s.setMobileSearchOpen(!0):s.focusDesktopSearch())};return window.addEventListener("keydown",n),()=>window.removeEventListener("keydown",n)},[t])}const $O=1e4;function Yn(e){const t=e.trim();return!t||t==="/"?"/":t.startsWith("/")?t:`/${t}`}function hS(e,t){const n=Yn(t),r=e[n];return r||{path:n,hydratedSnapshot:null,hydratedGeneratedAt:null,hydratedItemCount:0,hydratedAtMs:null,topAnchorPath:null}}function Hh(e,t){return t==="/"?!0:e===t||e.startsWith(`${t}/`)}function BO(e){for(const t of e)return t;return null}function UO(e,t,n,r){const s=hS(e,t),i=n.items.length<=$O?n:null,o={...s,path:Yn(t),hydratedSnapshot:i,hydratedGeneratedAt:n.generated_at??null,hydratedItemCount:n.total_items??n.items.length,hydratedAtMs:r};return s.hydratedSnapshot===o.hydratedSnapshot&&s.hydratedGeneratedAt===o.hydratedGeneratedAt&&s.hydratedItemCount===o.hydratedItemCount&&s.hydratedAtMs===o.hydratedAtMs?e:{...e,[o.path]:o}}function hw(e,t,n){const r=hS(e,t),s=Yn(t),i=n?Yn(n):null;return r.topAnchorPath===i&&r.path===s?e:{...e,[s]:{...r,path:s,topAnchorPath:i}}}function mS(e,t){const n=Yn(t);if(!e[n])return e;const r={...e};return delete r[n],r}function HO(e,t){const n=Yn(t);let r=!1;const s={...e};for(const i of Object.keys(s))Hh(i,n)&&(r=!0,delete s[i]);return r?s:e}function KO(e,t){const n=Yn(e),r=Yn(t);return!!(n===r||Hh(n,r)||Hh(r,n))}function VO(e,t,n){return KO(t,n)?e:mS(e,n)}function WO(){const e=c.useRef({}),t=c.useCallback(h=>e.current[Yn(h)]??null,[]),n=c.useCallback(h=>{var m;return((m=e.current[Yn(h)])==null?void 0:m.hydratedSnapshot)??null},[]),r=c.useCallback(h=>{var m;return((m=e.current[Yn(h)])==null?void 0:m.topAnchorPath)??null},[]),s=c.useCallback((h,m)=>{e.current=UO(e.current,h,m,Date.now())},[]),i=c.useCallback((h,m)=>{e.current=hw(e.current,h,m)},[]),o=c.useCallback((h,m)=>{const y=BO(m);y&&(e.current=hw(e.current,h,y))},[]),l=c.useCallback(h=>{e.current=mS(e.current,h)},[]),a=c.useCallback(h=>{e.current=HO(e.current,h)},[]),d=c.useCallback((h,m)=>{e.current=VO(e.current,h,m)},[]),f=c.useCallback(()=>{e.current={}},[]);return c.useMemo(()=>({getSession:t,getHydratedSnapshot:n,getTopAnchorPath:r,saveHydratedSnapshot:s,saveTopAnchorPath:i,saveTopAnchorFromVisiblePaths:o,invalidatePath:l,invalidateSubtree:a,invalidateForScopeTransition:d,clearAllSessions:f}),[t,n,r,s,i,o,l,a,d,f])}function qO(e){const t=qt(e||"/");return t===""?"/":t}function QO(e,t){return t==="/"?e.startsWith("/"):e===t||e.startsWith(`${t}/`)}function GO({current:e,refreshEnabled:t,queryClient:n,refetch:r,invalidateFolderSessionSubtree:s,setScopeSessionResetToken:i,onActionStart:o,onActionError:l}){const[a,d]=c.useState(0),[f,h]=c.useState(!1),m=c.useCallback(()=>{d(v=>v+1)},[]),y=c.useCallback(v=>{const x=p=>v==="/"?!0:p===v||p.startsWith(`${v}/`);n.invalidateQueries({predicate:({queryKey:p})=>{if(!Array.isArray(p)||p[0]!=="folder"&&p[0]!=="folder-query"&&p[0]!=="folder-facets")return!1;const g=typeof p[1]=="string"?p[1]:"";return x(g)}})},[n]),b=c.useCallback(async v=>{if(!t)return;const x=qO(v);await Fe.refreshFolder(x),y(x),m(),s(x),QO(e,x)&&(i(p=>p+1),await r()),Wu.evictPrefix(x),zi.evictPrefix(x),Wr.evictPrefix(x),Xq.evictPrefix(x)},[e,m,s,y,r,t,i]),w=c.useCallback(async()=>{if(t){o==null||o();try{await b(e)}catch(v){l==null||l("Refresh folder failed",v)}}},[e,l,o,t,b]),S=c.useCallback(async()=>{if(!(!t||f)){h(!0),o==null||o();try{await b("/")}catch(v){l==null||l("Refresh root folder failed",v)}finally{h(!1)}}},[f,l,o,t,b]);return{folderCountsVersion:a,headerRefreshBusy:f,refreshFolderPath:b,handlePullRefreshFolders:w,handleHeaderRefresh:S}}const mw=[1,1.25,1.5,1.75,2,3,4];function YO(e){return mw.reduce((t,n)=>Math.abs(n-e)<Math.abs(t-e)?n:t,mw[0])}function XO(){var s;const e=window.devicePixelRatio||1,t=YO(e),n=((s=window.visualViewport)==null?void 0:s.scale)??1,r=e*n/t;return Number.isFinite(r)?Math.min(500,Math.max(25,Math.round(r*100))):null}function JO(){const[e,t]=c.useState(null),[n,r]=c.useState(null);c.useEffect(()=>{if(typeof window>"u")return;const o=()=>{t(XO())};o(),window.addEventListener("resize",o),window.addEventListener("orientationchange",o);const l=window.visualViewport;return l&&l.addEventListener("resize",o),()=>{window.removeEventListener("resize",o),window.removeEventListener("orientationchange",o),l&&l.removeEventListener("resize",o)}},[]),c.useEffect(()=>{Bh(e)===null&&r(null)},[e]);const s=c.useMemo(()=>mL(e,n),[e,n]),i=c.useCallback(()=>{r(Bh(e))},[e]);return{visibleBrowserZoomPercent:s,dismissBrowserZoomWarning:i}}const pw=100;function ZO(e){return e.ctrlKey||e.metaKey}function eF(e,t){const n=Math.trunc(t/pw);if(n===0)return{gridItemSize:e,remainingDelta:t};const r=e+n*ws.step,s=jb(r);return{gridItemSize:s,remainingDelta:s===r?t-n*pw:0}}function gw(e){if(e.length<2)return 0;const[t,n]=[e[0],e[1]];return Math.hypot(t.clientX-n.clientX,t.clientY-n.clientY)}function tF({target:e,getGridItemSize:t,onGridItemSizeChange:n,requestFrame:r,cancelFrame:s}){let i=null,o=0,l=null;const a=()=>{l=null;const y=t(),b=eF(y,o);o=b.remainingDelta,b.gridItemSize!==y&&n(b.gridItemSize)},d=y=>{ZO(y)&&(y.preventDefault(),o-=y.deltaY,l===null&&(l=r(a)))},f=y=>{if(y.touches.length!==2)return;const b=gw(y.touches);b&&(i={dist:b,size:t()})},h=y=>{if(!i||y.touches.length!==2)return;const b=gw(y.touches);b&&(y.preventDefault(),n(jb(i.size*(b/i.dist))))},m=()=>{i=null};return e.addEventListener("wheel",d,{passive:!1}),e.addEventListener("touchstart",f,{passive:!0}),e.addEventListener("touchmove",h,{passive:!1}),e.addEventListener("touchend",m),e.addEventListener("touchcancel",m),()=>{e.removeEventListener("wheel",d),e.removeEventListener("touchstart",f),e.removeEventListener("touchmove",h),e.removeEventListener("touchend",m),e.removeEventListener("touchcancel",m),l!==null&&s(l)}}function nF({gridRef:e,disabled:t,gridItemSize:n,onGridItemSizeChange:r}){const s=ai(n),i=ai(r);c.useEffect(()=>{if(t)return;const o=e.current;if(o)return tF({target:o,getGridItemSize:()=>s.current,onGridItemSizeChange:l=>{s.current=l,i.current(l)},requestFrame:window.requestAnimationFrame.bind(window),cancelFrame:window.cancelAnimationFrame.bind(window)})},[t,s,e,i])}const Kt={viewState:"viewState",viewMode:"viewMode",gridItemSize:"gridItemSize",leftOpen:"leftOpen",rightOpen:"rightOpen",autoloadImageMetadata:"autoloadImageMetadata",compareOrderMode:"compareOrderMode",proxyHttpOriginals:"proxyHttpOriginals"},rF=["sortKey","sortDir","sortSpec","filterAst","selectedMetric"];function sF(e,t){e.removeItem(Kt.viewState);for(const n of rF)e.removeItem(n);e.setItem(Kt.viewMode,t.viewMode),e.setItem(Kt.gridItemSize,String(t.gridItemSize)),e.setItem(Kt.leftOpen,t.leftOpen?"1":"0"),e.setItem(Kt.rightOpen,t.rightOpen?"1":"0"),e.setItem(Kt.autoloadImageMetadata,t.autoloadImageMetadata?"1":"0"),e.setItem(Kt.compareOrderMode,t.compareOrderMode),e.setItem(Kt.proxyHttpOriginals,t.proxyHttpOriginals?"1":"0")}function iF(e){const t={},n=e.getItem(Kt.viewMode);(n==="grid"||n==="adaptive")&&(t.viewMode=n);const r=e.getItem(Kt.gridItemSize);if(r){const d=Number(r);!Number.isNaN(d)&&d>=ws.min&&d<=ws.max&&(t.gridItemSize=d)}const s=e.getItem(Kt.leftOpen);(s==="0"||s==="false")&&(t.leftOpen=!1);const i=e.getItem(Kt.rightOpen);(i==="0"||i==="false")&&(t.rightOpen=!1);const o=e.getItem(Kt.autoloadImageMetadata);o==="0"||o==="false"?t.autoloadImageMetadata=!1:(o==="1"||o==="true")&&(t.autoloadImageMetadata=!0);const l=e.getItem(Kt.compareOrderMode);(l==="gallery"||l==="selection")&&(t.compareOrderMode=l);const a=e.getItem(Kt.proxyHttpOriginals);return a==="1"||a==="true"?t.proxyHttpOriginals=!0:(a==="0"||a==="false")&&(t.proxyHttpOriginals=!1),t}function oF(){if(typeof window>"u")return{};try{return iF(window.localStorage)}catch{return{}}}function lF(e){if(!(typeof window>"u"))try{sF(window.localStorage,e)}catch{}}function aF({viewMode:e,gridItemSize:t,leftOpen:n,rightOpen:r,autoloadImageMetadata:s,compareOrderMode:i,proxyHttpOriginals:o}){const l=c.useRef(mO(lF));c.useEffect(()=>{if(typeof window>"u")return;const d=l.current,f=()=>d.flush();return window.addEventListener("pagehide",f),window.addEventListener("beforeunload",f),()=>{window.removeEventListener("pagehide",f),window.removeEventListener("beforeunload",f),d.flush()}},[]);const a=c.useMemo(()=>({viewMode:e,gridItemSize:t,leftOpen:n,rightOpen:r,autoloadImageMetadata:s,compareOrderMode:i,proxyHttpOriginals:o}),[s,i,t,n,o,r,e]);c.useEffect(()=>{l.current.schedule(a)},[a])}function uF(e,t){return`${qt(e)}\0${t}`}function cF(e,t,n,r){return e===n&&t===r}function dF({similarityState:e,setSimilarityState:t,selectedPaths:n,setSelectedPaths:r,setQuery:s,setViewState:i,bumpRestoreGridToSelectionToken:o,scopePath:l,sessionResetToken:a}){const d=c.useRef(null),f=uF(l,a),h=c.useRef(f),m=c.useRef(0);c.useLayoutEffect(()=>{h.current!==f&&(h.current=f,m.current+=1,d.current=null)},[f]);const y=c.useCallback(()=>{m.current+=1},[]),b=c.useCallback(()=>{m.current+=1,t(null);const v=d.current;d.current=null,v&&v.length?(r(v),o()):r([])},[o,r,t]),w=c.useCallback(()=>{e&&b(),s(""),i(v=>({...v,filters:{and:[]}}))},[b,s,i,e]),S=c.useCallback(async v=>{const x=!e&&d.current===null?[...n]:null,p=m.current+1;m.current=p;const g=f,k=await Fe.searchEmbeddings(v);if(!cF(g,p,h.current,m.current))return!1;x!==null&&d.current===null&&(d.current=x);const C=v.query.kind==="path"?v.query.path:null,R=v.query.kind==="vector"?v.query.vector_b64:null;if(t({scopePath:qt(l),sessionResetToken:a,embedding:k.embedding,queryPath:C,queryVector:R,topK:v.top_k??50,minScore:v.min_score??null,items:k.items,createdAt:Date.now()}),k.items.length){const E=C&&k.items.some(N=>N.path===C)?C:k.items[0].path;r([E]),o()}else r([]);return!0},[o,f,n,l,a,r,t,e]);return{cancelPendingSimilaritySearch:y,clearSimilarity:b,handleRevealOffView:w,handleSimilaritySearch:S}}const fF="No-write mode: exported Smart Folder JSON instead of saving.";function hF(e,t,n,r){const s=aL(e,t),i={id:s,name:e,pool:{kind:"folder",path:n},view:oi(JSON.parse(JSON.stringify(r)))};return{id:s,payload:i,nextViews:[...t.filter(o=>o.id!==s),i]}}function mF(e,t,n,r){if(!e)return!1;const s=t.find(i=>i.id===e);return s?s.pool.path!==n||JSON.stringify(oi(s.view))!==JSON.stringify(oi(r)):!0}function pF(e){return e instanceof jn&&e.status===403}function gF(e,t){return{filename:`lenslet-smart-folder-${e}.json`,json:JSON.stringify({version:1,views:t},null,2),type:"application/json"}}function yF({current:e,viewState:t,setViewState:n,openFolder:r}){const[s,i]=c.useState([]),[o,l]=c.useState(null);c.useEffect(()=>{let h=!0;return Fe.getViews().then(m=>{h&&i(m.views||[])}).catch(()=>{h&&i([])}),()=>{h=!1}},[]);const a=c.useCallback(async()=>{if(typeof window>"u")return;const h=window.prompt("Save Smart Folder as:","New Smart Folder");if(!h)return;const{id:m,nextViews:y}=hF(h,s,e,t);i(y),l(m);try{await Fe.saveViews({version:1,views:y})}catch(b){if(pF(b)){const w=gF(m,y),S=new Blob([w.json],{type:w.type});mu(S,w.filename),window.alert(fF);return}console.error("Failed to save Smart Folder:",b)}},[e,t,s]);c.useEffect(()=>{mF(o,s,e,t)&&l(null)},[o,s,e,t]);const d=c.useCallback(h=>{l(h.id),n(oi(h.view)),r(h.pool.path)},[r,n]),f=c.useCallback(()=>{l(null)},[]);return{views:s,activeViewId:o,activateView:d,clearActiveView:f,saveView:a}}function vF(){const[e,t]=c.useState(()=>typeof window>"u"?1440:window.innerWidth),[n,r]=c.useState(()=>typeof window>"u"?900:window.innerHeight);return c.useEffect(()=>{if(typeof window>"u")return;const s=()=>{t(window.innerWidth),r(window.innerHeight)};return s(),window.addEventListener("resize",s),window.addEventListener("orientationchange",s),()=>{window.removeEventListener("resize",s),window.removeEventListener("orientationchange",s)}},[]),{viewportWidth:e,viewportHeight:n}}const wF={starsIn:{read:e=>{const t=e.starsIn.values||[];return t.length?{id:"stars-in",label:`Rating in: ${Gv(t)}`}:null},clear:(e,t)=>t.clearStarsIn()},starsNotIn:{read:e=>{const t=e.starsNotIn.values||[];return t.length?{id:"stars-not-in",label:`Rating not in: ${Gv(t)}`}:null},clear:(e,t)=>t.clearStarsNotIn()},nameContains:{read:e=>{var n;const t=(n=e.nameContains.value)==null?void 0:n.trim();return t?{id:"name-contains",label:`Filename contains: ${t}`}:null},clear:(e,t)=>t.clearNameContains()},nameNotContains:{read:e=>{var n;const t=(n=e.nameNotContains.value)==null?void 0:n.trim();return t?{id:"name-not-contains",label:`Filename not: ${t}`}:null},clear:(e,t)=>t.clearNameNotContains()},notesContains:{read:e=>{var n;const t=(n=e.notesContains.value)==null?void 0:n.trim();return t?{id:"notes-contains",label:`Notes contain: ${t}`}:null},clear:(e,t)=>t.clearNotesContains()},notesNotContains:{read:e=>{var n;const t=(n=e.notesNotContains.value)==null?void 0:n.trim();return t?{id:"notes-not-contains",label:`Notes not: ${t}`}:null},clear:(e,t)=>t.clearNotesNotContains()},urlContains:{read:e=>{var n;const t=(n=e.urlContains.value)==null?void 0:n.trim();return t?{id:"url-contains",label:`URL contains: ${t}`}:null},clear:(e,t)=>t.clearUrlContains()},urlNotContains:{read:e=>{var n;const t=(n=e.urlNotContains.value)==null?void 0:n.trim();return t?{id:"url-not-contains",label:`URL not: ${t}`}:null},clear:(e,t)=>t.clearUrlNotContains()},dateRange:{read:e=>{const{from:t,to:n}=e.dateRange;return!t&&!n?null:{id:"date-range",label:`Date: ${cL(t,n)}`}},clear:(e,t)=>t.clearDateRange()},widthCompare:{read:e=>({id:"width-compare",label:`Width ${e.widthCompare.op} ${e.widthCompare.value}`}),clear:(e,t)=>t.clearWidthCompare()},heightCompare:{read:e=>({id:"height-compare",label:`Height ${e.heightCompare.op} ${e.heightCompare.value}`}),clear:(e,t)=>t.clearHeightCompare()},metricRange:{read:e=>({id:`metric:${e.metricRange.key}`,label:`${e.metricRange.key}: ${lS(e.metricRange.min,e.metricRange.max)}`}),clear:(e,t)=>t.clearMetricRange(e.metricRange.key)},categoricalIn:{read:e=>{const t=e.categoricalIn.values||[];return t.length?{id:`categorical:${e.categoricalIn.key}`,label:`${e.categoricalIn.key}: ${SF(t)}`}:null},clear:(e,t)=>t.clearCategoricalIn(e.categoricalIn.key)}};function xF(e,t){if("starsIn"in e)return t("starsIn",e);if("starsNotIn"in e)return t("starsNotIn",e);if("nameContains"in e)return t("nameContains",e);if("nameNotContains"in e)return t("nameNotContains",e);if("notesContains"in e)return t("notesContains",e);if("notesNotContains"in e)return t("notesNotContains",e);if("urlContains"in e)return t("urlContains",e);if("urlNotContains"in e)return t("urlNotContains",e);if("dateRange"in e)return t("dateRange",e);if("widthCompare"in e)return t("widthCompare",e);if("heightCompare"in e)return t("heightCompare",e);if("metricRange"in e)return t("metricRange",e);if("categoricalIn"in e)return t("categoricalIn",e)}function bF(e,t,n={}){const r=[],s=new Set(n.unavailableMetricKeys??[]),i=n.metricDisplayNames??null;for(const o of e.and)xF(o,(l,a)=>{const d=wF[l],f=d.read(a);if(!f)return;const h="metricRange"in a&&s.has(a.metricRange.key),m="metricRange"in a?`${ar(a.metricRange.key,i)}: ${lS(a.metricRange.min,a.metricRange.max)}`:f.label;r.push({id:f.id,label:h?`${m} (unavailable)`:m,onRemove:()=>d.clear(a,t)})});return r}function SF(e){const t=e.slice(0,3),n=e.length>t.length?`, +${e.length-t.length}`:"";return`${t.join(", ")}${n}`}function kF(e){return e instanceof Error&&e.message.trim()?e.message.trim():typeof e=="string"&&e.trim()?e.trim():null}function CF(e,t){const n=kF(t);return!n||n===e?e:`${e}: ${n}`}function EF(e){var n;const t=(n=e==null?void 0:e.title_label)==null?void 0:n.trim();return t?`Lenslet · ${t}`:"Lenslet"}const MF="lenslet.v2.theme.";function RF(e){if(typeof e!="string")return null;const t=e.trim();return t.length>0?t:null}function NF(e,t){const n=typeof e=="string"&&e.length>0?e:"browse";return typeof window<"u"&&window.location?`${n}:${window.location.origin}${window.location.pathname}`:`${n}:server`}function jF(e){let t=0xcbf29ce484222325n;const n=0x100000001b3n;for(let r=0;r<e.length;r+=1)t^=BigInt(e.charCodeAt(r)),t=BigInt.asUintN(64,t*n);return t.toString(16).padStart(16,"0")}function pS(){if(typeof window>"u")return null;try{return window.localStorage}catch{return null}}function gS(e,t,n){const r=RF(e),s=r?`workspace:${r}`:`fallback:${NF(t)}`;return`${MF}${jF(s)}`}function _F(e,t){const n=pS();if(!n)return null;const r=gS(e,t);try{const s=n.getItem(r);return Cb(s)?s:null}catch{return null}}function Kh(e,t){return _F(e,t)??"default"}function PF(e,t,n){const r=pS();if(!r)return;const s=gS(e,t);try{if(n==null){r.removeItem(s);return}r.setItem(s,n)}catch{}}function yw(e,t,n){return Math.max(0,e-Math.max(0,n-t))}function wp(e,t,n){const[r,s]=c.useState(()=>e&&n!=null&&yw(t,n,Date.now())===0);return c.useEffect(()=>{if(!e){s(!1);return}const i=n??Date.now(),o=yw(t,i,Date.now());if(o===0){s(!0);return}s(!1);const l=window.setTimeout(()=>s(!0),o);return()=>window.clearTimeout(l)},[e,t,n]),r}const yS=800,TF=800;function vS(e,t,n){return!t||n?e:" "}const wS=()=>Wm(()=>import("./CompareViewer-BtfY4arq.js"),__vite__mapDeps([0,1])),xS=()=>Wm(()=>import("./Inspector-BBVijhJH.js"),__vite__mapDeps([2,3])),IF=c.lazy(wS),LF=c.lazy(xS);function OF(){const e=()=>{xS().catch(()=>{}),wS().catch(()=>{})};if(typeof window.requestIdleCallback=="function"){const n=window.requestIdleCallback(e,{timeout:1e3});return()=>window.cancelIdleCallback(n)}const t=window.setTimeout(e,0);return()=>window.clearTimeout(t)}function vw(e){const t=c.useRef({key:e,revision:0});return t.current.key!==e&&(t.current={key:e,revision:t.current.revision+1}),t.current.revision}function ww(e,t,n,r){for(const s of e)Jm(n.get(s),r)||Fe.prefetchPreview(s,t),Fe.prefetchThumb(s,"prefetch")}class Jd extends c.Component{constructor(){super(...arguments);ge(this,"state",{hasError:!1})}static getDerivedStateFromError(){return{hasError:!0}}componentDidUpdate(n){n.resetKey!==this.props.resetKey&&this.state.hasError&&this.setState({hasError:!1})}render(){return this.state.hasError?this.props.fallback:this.props.children}}function xw({message:e,onClose:t,busy:n=!1,visible:r=!0}){const s=wp(n,yS),i=vS(e,n,s);return u.jsx("div",{className:"app-right-panel inspector-panel col-start-3 row-start-2 border-l border-border bg-panel overflow-auto scrollbar-thin relative","data-inspector-panel":!0,"aria-busy":n?"true":void 0,"aria-hidden":!r||void 0,hidden:!r,children:u.jsxs("div",{className:"p-3 flex items-center justify-between gap-3 text-sm text-muted","data-lazy-surface":"inspector","data-loading-copy-visible":n&&s?"true":"false",children:[u.jsx("span",{children:i}),u.jsx("button",{className:"btn btn-sm",onClick:t,children:"Close"})]})})}function Zd({label:e,message:t,onClose:n,busy:r=!1}){const s=wp(r,yS),i=vS(t,r,s);return u.jsx("div",{role:"dialog","aria-modal":"true","aria-label":e,"aria-busy":r?"true":void 0,"data-lazy-surface":"overlay","data-loading-copy-visible":r&&s?"true":"false",tabIndex:-1,className:"toolbar-offset absolute inset-0 left-[var(--overlay-left)] right-[var(--overlay-right)] bg-panel z-viewer flex items-center justify-center",onKeyDown:o=>{o.key==="Escape"&&(o.preventDefault(),n())},children:u.jsxs("div",{className:"flex flex-col items-center gap-3 text-sm text-muted",children:[u.jsx("span",{children:i}),u.jsx("button",{className:"btn btn-sm",onClick:n,autoFocus:!0,children:"Close"})]})})}function FF({themeHealthMode:e,themeWorkspaceId:t}){var Jp,Zp,eg;c.useEffect(()=>OF(),[]);const[n,r]=c.useState("/"),[s]=c.useState(()=>SP()),[i]=c.useState(()=>oF()),[o,l]=c.useState(()=>s.query),[a,d]=c.useState(!1),[f,h]=c.useState(null),[m,y]=c.useState(null),[b,w]=c.useState(100),S=c.useCallback(_=>{w(Math.round(_)),y(_)},[]),{visibleBrowserZoomPercent:v,dismissBrowserZoomWarning:x}=JO(),[p,g]=c.useState(()=>s.viewState),[k,C]=c.useState(()=>s.randomSeed??Date.now()),[R,E]=c.useState(()=>i.viewMode??"adaptive"),[N,j]=c.useState(()=>i.gridItemSize??220),[P,$]=c.useState(!1),[U,q]=c.useState(!1),[V,A]=c.useState(!0),[Z,D]=c.useState(()=>i.leftOpen??!0),[z,B]=c.useState(()=>i.rightOpen??!0),{viewportWidth:O,viewportHeight:L}=vF(),[F,T]=c.useState("folders"),[H,G]=c.useState($T),[Y,re]=c.useState({resetKey:null,fields:{metric_keys:[],categorical_keys:[]}}),[le,he]=c.useState(()=>Kh(t,e)),[pe,Se]=c.useState(()=>i.autoloadImageMetadata??!0),[we,Ee]=c.useState(()=>i.proxyHttpOriginals??!1),[xe,Re]=c.useState(()=>i.compareOrderMode??"gallery"),[ue,Be]=c.useState(null),[ke,Ye]=c.useState(!1),[et,be]=c.useState(()=>s.unsupportedMetricIntent),[X,me]=c.useState(null),[Ne,K]=c.useState(!1),[W,fe]=c.useState(null),[ee,ce]=c.useState({}),Te=c.useRef(null),de=c.useRef(null),ut=c.useRef(null),Ke=c.useRef(null),sn=c.useRef(new sO),it=c.useRef(n),vt=c.useRef({query:s.query,randomSeed:s.randomSeed,viewState:s.viewState}),{leftW:mt,rightW:In,onResizeLeft:Ir,onResizeRight:Ln}=UP(Te,{userLeftOpen:Z,userRightOpen:z}),{getTopAnchorPath:fi,saveTopAnchorPath:Ft,invalidateSubtree:Lr}=WO(),[Rs,On]=c.useState(0),[Or,At]=c.useState(null),[Fn,jt]=c.useState(0),qe=xL(f,n,Fn);aF({viewMode:R,gridItemSize:N,leftOpen:Z,rightOpen:z,autoloadImageMetadata:pe,compareOrderMode:xe,proxyHttpOriginals:we});const pt=Ms(),on=rP(),hi=Po(),Ns=iP(),[To,mi]=c.useState(!1),Jn=c.useCallback(()=>{fe(null)},[]),dr=c.useCallback((_,te)=>{fe({kind:"error",message:CF(_,te)})},[]),fr=c.useCallback(async()=>{try{const _=await Fe.getTableSourceColumns();Be(_.enabled?_:null)}catch{Be(null)}},[]);c.useEffect(()=>{fr()},[fr]);const Fr=ue!=null&&ue.warning?`${ue.current??""}:${ue.warning}`:null,Io=Fr&&X!==Fr?`${(ue==null?void 0:ue.warning)??""} Switch image columns from Settings > Source.`:null;c.useEffect(()=>{const _=sn.current,te=pt.getQueryCache();return _.seed(te.getAll()),te.subscribe(De=>{iO(_,De)})},[pt]);const{data:ln,refetch:js,isLoading:Zn,isFetching:Ar,isError:pi,searching:An,normalizedQ:an,similarityActive:Me,embeddings:I,embeddingsRejected:Q,embeddingsAvailable:ae,embeddingsLoading:ve,embeddingsError:Ce,poolItems:_e,similarityItems:He,metricKeys:Le,categoricalKeys:Oe,browseCapabilityKeysReady:yn,metricDisplayNames:Dt,derivedMetric:Ve,items:_t,totalCount:Dr,filteredCount:hr,scopeTotal:zr,rootTotal:SS,hasMoreFolderItems:kS,isLoadingMoreFolderItems:CS,loadMoreFolderItems:ES,browseQueryUnavailableReason:Lc,analysisUnsupportedMetricIntent:Oc,browseTargetIdentity:Lo,browseTargetSettled:Oo}=TL({current:n,query:o,similarityState:qe,viewState:p,randomSeed:k,urlUnsupportedMetricIntent:et,localStarOverrides:ee,sessionResetToken:Fn});c.useEffect(()=>{if(!et)return;const _=vt.current;(o!==_.query||p!==_.viewState||_.randomSeed!==null&&k!==_.randomSeed)&&be(null)},[o,k,et,p]),c.useEffect(()=>{CP(p,{query:o,randomSeed:k,unsupportedMetricIntent:Oc})},[Oc,o,k,p]);const xp=c.useMemo(()=>qt(n||"/"),[n]),_s=JSON.stringify([t,xp,(ue==null?void 0:ue.current)??null,Fn]),Fc=JSON.stringify([t,(ue==null?void 0:ue.current)??null]),MS=_s,ha=c.useMemo(()=>Le.filter(_=>!ht(_)),[Le]),Ac=c.useMemo(()=>A1(Ve,Fc),[Fc,Ve]),RS=c.useMemo(()=>pr(D1(Ve.spec,ha)),[Ve.spec,ha]),Dc=Y.resetKey===Ac?Y.fields:RS,NS=c.useCallback(_=>{re({resetKey:Ac,fields:_})},[Ac]),bp=vw(li(Le)),Sp=vw(li(Oe)),zc=c.useMemo(()=>HT(H,_s,Le,Oe,{metric:bp,categorical:Sp}),[_s,Oe,Sp,Le,bp,H]),$c=c.useMemo(()=>Jb(p.filters),[p.filters]),jS=qe?He:_e,ma=c.useMemo(()=>o2(p.filters),[p.filters]),Bc=Me||An||ma>0,_S=nL(Me,Bc,hr,zr),PS=rL(Me,Bc,Dr,zr,SS,n),Yt=qe?null:p.sort.kind==="metric"?p.sort.key:null,Fo=Oo&&(qe!==null||_t.length>=hr),TS=Oo&&(qe!==null||p.filters.and.length===0&&an===""&&_t.length>=zr),IS=Yt!==null&&(ht(Yt)||!Fo),kp=c.useMemo(()=>G1(zc,p.selectedMetric,Le,Oe),[Oe,Le,zc,p.selectedMetric]),Cp=c.useMemo(()=>{const _=new Set(ha),te=new Set(Oe);return{metric_keys:Dc.metric_keys.filter(De=>_.has(De)),categorical_keys:Dc.categorical_keys.filter(De=>te.has(De))}},[Oe,Dc,ha]),Uc=c.useMemo(()=>{const _=F==="metrics"?kp:F==="derived"?Cp:{metric_keys:[],categorical_keys:[]};return{metric_keys:Array.from(new Set(_.metric_keys)).sort(),categorical_keys:Array.from(new Set(_.categorical_keys)).sort()}},[Cp,F,kp]),LS=Uc.metric_keys.length+Uc.categorical_keys.length>0,pa=gv({path:n,recursive:!0,filters:p.filters,sort:p.sort,textQuery:an,randomSeed:k,derivedMetric:p.derivedMetric??null,unsupportedToken:Oc,generationToken:String(Fn),facetFields:{metric_keys:Yt?[Yt]:[],categorical_keys:[]},enabled:IS&&!qe}),Hc=((Jp=pa.data)==null?void 0:Jp.path)===((ln==null?void 0:ln.path)??n)?pa.data:null,OS=Yt?yp((Zp=Hc==null?void 0:Hc.metrics[Yt])==null?void 0:Zp.histogram):null,FS=c.useMemo(()=>{if(!Yt||!Fo)return null;const _=Eo(_t,[Yt]);return Vb(Xi(_,Yt),48)},[_t,Yt,Fo]),AS=Yt?pa.fieldStates.metrics[Yt]??"pending":"settled",Kc=n_({active:Yt!==null,localComplete:Fo,localHistogram:FS,facetHistogram:OS,facetState:AS}),Ep=oL({similarityActive:Me,searching:An,itemCount:_t.length,isLoading:Zn,isFetching:Ar,isError:pi,unavailableReason:Lc,filteredCount:hr}),se=DL({targetKey:Lo,resetKey:_s,targetItems:_t,targetRatingItems:jS,targetFilteredCount:hr,targetDisplayItemCount:_S,targetDisplayTotalCount:PS,targetMetricsPopulationItemsComplete:TS,targetMetricsFilteredItemsComplete:Fo,targetMetricRailState:Kc.state,targetMetricRailHistogram:Kc.histogram,targetMetricRailKey:Yt,targetMetricRailSortDir:p.sort.dir,targetSettled:Oo&&Kc.state!=="pending",targetStatus:Ep}),Vc=se.membershipPaths,Wc=c.useCallback(_=>{if(!_)return;const te=()=>{const De=document.getElementById(`cell-${encodeURIComponent(_)}`);De==null||De.focus()};requestAnimationFrame(()=>requestAnimationFrame(te))},[]),{selectedPaths:un,setSelectedPaths:vn,viewer:wn,compareOpen:zt,restoreGridToSelectionToken:DS,bumpRestoreGridToSelectionToken:gi,selectedItems:ga,compareItems:qc,comparePaths:Qc,compareIndexClamped:Gc,compareA:Mp,compareB:Rp,canComparePrev:zS,canCompareNext:$S,compareEnabled:BS,canPrevImage:Np,canNextImage:jp,overlayActive:US,rememberFocusedPath:Yc,openViewer:HS,closeViewer:Xc,openCompare:_p,closeCompare:Jc,handleCompareNavigate:KS,handleNavigate:Zc,resetViewerState:ya,resetForScopeBoundary:Pp,syncHashImageSelection:VS}=QL({current:n,itemPaths:Vc,items:se.items,selectionPool:se.ratingItems,compareOrderMode:xe,membershipSettled:se.phase==="steady"&&se.targetKey===Lo,membershipComplete:se.filteredCount!==null&&se.items.length>=se.filteredCount,focusGridCell:Wc}),Ao=c.useMemo(()=>{const _=new Map;for(const te of se.ratingItems)_.set(te.path,te);for(const te of se.items)_.set(te.path,te);for(const te of ga)_.set(te.path,te);for(const te of qc)_.set(te.path,te);return _},[qc,se.items,se.ratingItems,ga]),Tp=c.useCallback(_=>{!_||_===(ue==null?void 0:ue.current)||ke||(Jn(),Ye(!0),Fe.switchTableSourceColumn(_).then(te=>{Be(te.enabled?te:null),me(null),Wr.clear(),Xq.clear(),Wu.clear(),zi.clear(),pt.invalidateQueries(),vn([]),h(null),ya(),r("/"),bv("/"),jt(De=>De+1)}).catch(te=>{dr("Image source switch failed",te)}).finally(()=>Ye(!1)))},[Jn,pt,dr,ya,vn,ue==null?void 0:ue.current,ke]);c.useEffect(()=>{const _=de.current;if(_){if(zt){_.setAttribute("inert",""),_.setAttribute("aria-hidden","true");return}_.removeAttribute("inert"),_.removeAttribute("aria-hidden")}},[zt]),c.useEffect(()=>{const _=Ke.current;if(_){if(zt){_.setAttribute("inert",""),_.setAttribute("aria-hidden","true");return}_.removeAttribute("inert"),_.removeAttribute("aria-hidden")}},[zt]);const Ip=ai(Z),Lp=ai(F);OO({setCurrent:r,syncHashImageSelection:VS,bumpRestoreGridToSelectionToken:gi});const WS=se.ratingItems,qS=se.metricsPopulationItemsComplete,Op=se.metricsFilteredItemsComplete;c.useLayoutEffect(()=>{if(!An||!Oo||se.phase!=="steady"||se.targetKey!==Lo)return;const _=se.filteredCount!==null&&se.items.length>=se.filteredCount;vn(te=>HL(te,se.membershipPaths,_))},[Lo,Oo,se.filteredCount,se.items.length,se.membershipPaths,se.phase,se.targetKey,An,vn]);const QS=se.retained?{kind:"updating",title:"Updating results...",message:"Keeping the previous gallery visible while the next view loads.",showCentered:!1}:Ep,Fp=c.useMemo(()=>TI({enabled:!0,embeddingsAvailable:ae,embeddingsLoading:ve,selectedCount:un.length}),[ae,ve,un.length]),GS=c.useCallback((_,te)=>{St.patch(_,{replaceMutableMetrics:te==null?void 0:te.replaceMutableMetrics}),Q2(pt,_.path,De=>De&&d1(De,_,{replaceMutableMetrics:te==null?void 0:te.replaceMutableMetrics})),oO(pt,sn.current,_,te)},[pt]),{connectionStatus:va,connectionLabel:YS,presence:XS,editingCount:JS,recentEditActive:ZS,hasEdits:ek,lastEditedLabel:tk,persistenceEnabled:ed,refreshEnabled:wa,refreshDisabledReason:Ap,indexing:nk,tableLaunchStatus:Dp,launchSession:xa,highlightedPaths:rk,onVisiblePathsChange:sk,offViewSummary:ik,recentTouchesDisplay:ok,clearOffViewActivity:lk}=TO({current:n,currentGalleryId:xp,itemPaths:se.membershipPaths,items:se.items,queryClient:pt,updateItemCaches:GS,setLocalStarOverrides:ce});c.useEffect(()=>{ed&&K(!1)},[ed]),c.useEffect(()=>{he(Kh(t,e))},[e,t]),c.useEffect(()=>{typeof document>"u"||(document.title=EF(xa))},[xa]);const zp=c.useCallback(_=>{const te=Mb(_);PF(t,e,te),he(te)},[e,t]),ak=c.useCallback(_=>{At(_),_&&Ft(n,_)},[n,Ft]),uk=c.useMemo(()=>fi(n),[n,fi]),dt=c.useCallback(()=>{gi(),On(_=>_+1)},[gi]);c.useEffect(()=>{At(null),On(_=>_+1)},[n]);const{folderCountsVersion:ck,headerRefreshBusy:dk,refreshFolderPath:fk,handlePullRefreshFolders:hk,handleHeaderRefresh:mk}=GO({current:n,refreshEnabled:wa,queryClient:pt,refetch:js,invalidateFolderSessionSubtree:Lr,setScopeSessionResetToken:jt,onActionStart:Jn,onActionError:dr}),$p=c.useMemo(()=>tL(se.ratingItems,ee),[se.ratingItems,ee]);c.useEffect(()=>{Me||Le.length&&g(_=>{const te=VI(_.selectedMetric,Le,Ve.key);return te===_.selectedMetric?_:{..._,selectedMetric:te}})},[Ve.key,Le,Me]),c.useEffect(()=>{yn&&WI(p.sort,Le,Me,Ve.key,Ve.status)&&g(_=>({..._,sort:{kind:"builtin",key:"added",dir:_.sort.dir}}))},[yn,Ve.key,Ve.status,Le,p.sort,Me]);const pk=on.state==="syncing"?"Syncing…":on.state==="saving"?"Saving…":on.state==="error"?on.message?`Not saved — ${on.message}`:"Not saved — retry":"Saved",gk=Ns!=null&&Ns>wI,yk=va==="offline"||va==="connecting"||va==="idle",vk=va==="reconnecting"||hi||on.state==="error"||gk,wk=yI({isOffline:yk,isUnstable:vk,recentEditActive:ZS,editingCount:JS}),xk=c.useMemo(()=>sL(qe),[qe]),bk=c.useMemo(()=>iL(qe!==null,ma,hr,Dr),[qe,ma,hr,Dr]),Bp=c.useCallback(_=>{dt(),l(_)},[dt]),Ct=c.useCallback(_=>{dt(),g(te=>({...te,filters:_(te.filters)}))},[dt]),Sk=c.useCallback(_=>{dt(),g(te=>({...te,filters:_}))},[dt]),td=c.useCallback(()=>{Ct(_=>xh(_,[]))},[Ct]),Up=c.useCallback(()=>{dt(),g(_=>({..._,filters:{and:[]}}))},[dt]),kk=c.useCallback(_=>{if(se.retained||!se.metricRailKey)return;const te=r_(se.items,se.metricRailKey,_);te&&(Yc(te),vn([te]),gi(),Wc(te))},[gi,Wc,se.items,se.metricRailKey,se.retained,Yc,vn]),{cancelPendingSimilaritySearch:Hp,clearSimilarity:Ck,handleRevealOffView:Ek,handleSimilaritySearch:Mk}=dF({similarityState:qe,setSimilarityState:h,selectedPaths:un,setSelectedPaths:vn,setQuery:Bp,setViewState:g,bumpRestoreGridToSelectionToken:gi,scopePath:n,sessionResetToken:Fn}),nd=c.useCallback(()=>{Hp(),d(!1)},[Hp]),rd=c.useCallback((_,te)=>{Ct(De=>r2(De,_,te))},[Ct]),sd=c.useCallback((_,te)=>{Ct(De=>i2(De,_,te))},[Ct]),Kp=c.useMemo(()=>oS(p.filters,Ve),[Ve,p.filters]),Rk=c.useMemo(()=>Lc??GI(p.sort,p.filters,Ve),[Lc,Ve,p.filters,p.sort]),Nk=c.useMemo(()=>bF(p.filters,{clearStarsIn:td,clearStarsNotIn:()=>Ct(_=>Zb(_,[])),clearNameContains:()=>Ct(_=>e1(_,"")),clearNameNotContains:()=>Ct(_=>t1(_,"")),clearNotesContains:()=>Ct(_=>n1(_,"")),clearNotesNotContains:()=>Ct(_=>r1(_,"")),clearUrlContains:()=>Ct(_=>s1(_,"")),clearUrlNotContains:()=>Ct(_=>i1(_,"")),clearDateRange:()=>Ct(_=>bh(_,null)),clearWidthCompare:()=>Ct(_=>uu(_,null)),clearHeightCompare:()=>Ct(_=>cu(_,null)),clearMetricRange:_=>rd(_,null),clearCategoricalIn:_=>sd(_,null)},{unavailableMetricKeys:Kp,metricDisplayNames:Dt}),[p.filters,td,rd,sd,Ct,Kp,Dt]),jk=c.useCallback(_=>{const te=new Set($c);te.has(_)?te.delete(_):te.add(_),dt(),g(De=>({...De,filters:xh(De.filters,Array.from(te))}))},[dt,$c]),_k=c.useCallback(()=>{D(!0),T("metrics")},[]),Vp=c.useCallback(()=>{B(!1)},[]),Pk=c.useCallback(_=>{const te=HP({activeTool:Lp.current,contentOpen:Ip.current,clickedTool:_});T(te.nextTool),D(te.contentOpen)},[Ip,Lp]),Tk=c.useCallback(_=>{G(te=>KT(te,_,_s))},[_s]),Ik=c.useCallback(_=>{dt(),g(te=>({...te,sort:_})),_.kind==="builtin"&&_.key==="random"&&C(Date.now())},[dt]),Lk=c.useCallback(_=>{dt(),E(_)},[dt]),Wp=c.useCallback(_=>{dt(),j(_)},[dt]),Ok=c.useCallback(_=>{dt(),g(te=>ZI(te,_))},[dt]),Fk=c.useCallback(_=>{dt(),g(te=>eL(te,_))},[dt]),Ak=c.useMemo(()=>dL(n),[n]),Dk=JI(Me),ba=O<=hl.mobileMax;c.useEffect(()=>{ba||P&&$(!1)},[ba,P]),nF({gridRef:ut,disabled:!!wn||zt,gridItemSize:N,onGridItemSizeChange:Wp}),c.useEffect(()=>{ww(EI(Vc,wn),"viewer",Ao,we)},[Ao,Vc,we,wn]),c.useEffect(()=>{zt&&ww(MI(Qc,Gc),"compare",Ao,we)},[Gc,zt,Qc,Ao,we]);const id=c.useCallback(_=>{ya();const te=qt(_);r(te),bv(te)},[ya]),zk=c.useCallback(()=>{const _=document.querySelector(".toolbar-right .input");_==null||_.focus()},[]),{ctx:$r,setCtx:Ps,openGridActions:qp,openFolderActions:Qp}=LO({selectedPaths:un,setSelectedPaths:vn});c.useLayoutEffect(()=>{se.retained&&Ps(null)},[se.retained,Ps]),c.useEffect(()=>{if(it.current===n)return;it.current=n;const{folderTarget:te,imageTarget:De}=M1(Lh()),Br=hL(n,te,De);Pp(Br),Ps(null),nd(),h(null),$(!1),At(null),On(yi=>yi+1),jt(yi=>yi+1),Bb(Br?["thumb"]:["thumb","file"])},[nd,n,Pp,Ps]);const{views:$k,activeViewId:Bk,activateView:Uk,clearActiveView:Hk,saveView:Kk}=yF({current:n,viewState:p,setViewState:g,openFolder:id});zO({current:n,items:_t,selectedPaths:un,viewerOpen:!!wn,compareOpen:zt,mobileSelectMode:P,leftOpen:Z,rightOpen:z,viewportWidth:O,openFolder:id,setSelectedPaths:vn,setLeftOpen:D,setRightOpen:B,setMobileSelectMode:$,setMobileSearchOpen:q,focusDesktopSearch:zk});const od=c.useMemo(()=>zt?"compare":wn?"viewer":"none",[zt,wn]),Ae=c.useMemo(()=>OP({viewportWidth:O,viewportHeight:L,userLeftOpen:Z,userRightOpen:z,leftPreferredWidth:mt,rightPreferredWidth:In,overlay:od,mobileSearchOpen:U,mobileDrawerOpen:V}),[O,L,Z,z,mt,In,od,U,V]),Gp=c.useRef(Ae.effectiveRightOpen);Ae.effectiveRightOpen&&(Gp.current=!0);const Yp=Ae.leftRailVisible&&Ae.effectiveLeftOpen&&(F==="metrics"||F==="derived")&&LS&&yn&&!qe,Do=gv({...lL({path:n,derivedMetric:p.derivedMetric??null,facetFields:Uc}),generationToken:String(Fn),analysisChannel:"metrics-population",enabled:Yp}),Vk=((eg=Do.data)==null?void 0:eg.path)===((ln==null?void 0:ln.path)??n)?Do.data:null,Wk=Do.isError?"error":Do.isLoading?"pending":"settled",Xp=Ae.leftRailVisible&&Ae.effectiveLeftOpen&&F==="folders";c.useLayoutEffect(()=>{!Xp&&($r==null?void 0:$r.kind)==="tree"&&Ps(null);const _=document.activeElement,te=document.querySelector(".app-left-panel");if(!(_ instanceof HTMLElement)||!(te!=null&&te.contains(_)))return;const De=_.closest("[data-left-tool-panel]"),Br=De instanceof HTMLElement&&De.dataset.leftToolPanel!==F;(!Ae.leftRailVisible||!Ae.effectiveLeftOpen||Br)&&_.blur()},[$r==null?void 0:$r.kind,Xp,Ae.effectiveLeftOpen,Ae.leftRailVisible,F,Ps]);const qk=`${Ae.gridInsets.left}px`,Qk=`${Ae.gridInsets.right}px`,Gk=`${Ae.overlayInsets.left}px`,Yk=`${Ae.overlayInsets.right}px`,Xk=`${Ae.shellReserves.toolbarHeightPx}px`,Jk=Ae.shellReserves.mobileDrawerHeightPx>0?`calc(${Ae.shellReserves.mobileDrawerHeightPx}px + env(safe-area-inset-bottom, 0px))`:"0px",Sa=se.metricRailKey!==null;return u.jsxs("div",{className:"app-shell grid h-full grid-cols-[var(--grid-left)_1fr_var(--grid-right)]",ref:Te,"data-layout-mode":Ae.mode,"data-short-height":Ae.shortHeight?"true":"false","data-left-suppression-reason":Ae.leftSuppressionReason,"data-right-suppression-reason":Ae.rightSuppressionReason,"data-inspector-suppression-reason":Ae.inspector.suppressionReason,"data-overlay-mode":od,"data-mobile-search-open":U?"true":"false","data-mobile-drawer-open":V?"true":"false","data-metrics-facet-observer-enabled":Yp?"true":"false","data-effective-left-width":Ae.leftWidth,"data-effective-right-width":Ae.rightWidth,"data-view-mode":R,"data-grid-item-size":N,"data-user-left-open":Z?"true":"false","data-user-right-open":z?"true":"false","data-autoload-image-metadata":pe?"true":"false","data-compare-order-mode":xe,"data-proxy-http-originals":we?"true":"false","data-query":o,"data-sort-kind":p.sort.kind,"data-sort-key":p.sort.key,"data-sort-dir":p.sort.dir,style:{"--grid-left":qk,"--grid-right":Qk,"--overlay-left":Gk,"--overlay-right":Yk,"--toolbar-h":Xk,"--mobile-drawer-h":Jk},children:[u.jsx(dN,{rootRef:Ke,onSearch:Bp,viewerActive:!!wn,onBack:Xc,zoomPercent:wn?b:void 0,onZoomPercentChange:S,currentLabel:Ak,itemCount:se.displayItemCount??void 0,totalCount:se.displayTotalCount??void 0,sortSpec:p.sort,metricKeys:Le,metricDisplayNames:Dt,onSortChange:Ik,sortDisabled:Me,filterCount:ma,onOpenFilters:_k,starsInFilter:$c,onToggleStarsIn:jk,onClearStarsIn:td,onClearFilters:Up,starCounts:$p,viewMode:R,onViewMode:Lk,gridItemSize:N,onGridItemSize:Wp,leftOpen:Z,rightOpen:z,onToggleLeft:()=>D(_=>mp(_)),onToggleRight:()=>B(_=>!_),onRefreshRoot:mk,refreshEnabled:wa,refreshDisabledReason:Ap,refreshBusy:dk,onPrevImage:()=>Zc(-1),onNextImage:()=>Zc(1),canPrevImage:Np,canNextImage:jp,searchDisabled:Me,searchPlaceholder:Me?"Exit similarity to search":void 0,mobileSearchOpen:U,onMobileSearchOpenChange:q,mobileDrawerOpen:V,onMobileDrawerOpenChange:A,themePreset:le,onThemePresetChange:zp,autoloadImageMetadata:pe,onAutoloadImageMetadataChange:Se,proxyHttpOriginals:we,onProxyHttpOriginalsChange:Ee,compareOrderMode:xe,onCompareOrderModeChange:Re,sourceColumns:ue,tableLaunchStatus:Dp,launchSession:xa,sourceColumnSwitching:ke,onSourceColumnChange:Tp,multiSelectMode:P,selectedCount:un.length,onToggleMultiSelectMode:ba?()=>$(_=>!_):void 0,syncIndicator:{state:wk,presence:XS,syncLabel:pk,connectionLabel:YS,lastEditedLabel:tk,hasEdits:ek,localTypingActive:To,recentTouches:ok}}),u.jsxs("div",{ref:de,className:"browse-shell","data-browse-shell":!0,"data-overlay-inert":zt?"true":"false","data-browse-presentation-target":se.targetKey??"","data-browse-requested-target":se.requestedTargetKey,"data-browse-presentation-epoch":se.epoch,"data-browse-rating-counts":JSON.stringify($p),"data-selected-paths":JSON.stringify(un),children:[u.jsx(hI,{visible:Ae.leftRailVisible,leftTool:F,contentOpen:Ae.effectiveLeftOpen,onToolChange:Pk,compareEnabled:BS,compareActive:zt,onOpenCompare:_p,views:$k,activeViewId:Bk,onActivateView:Uk,onSaveView:Kk,current:n,data:ln,onOpenFolder:_=>{Hk(),id(_)},onOpenFolderActions:Qp,onPullRefreshFolders:wa?hk:void 0,onContextMenu:(_,te)=>{_.preventDefault(),Qp(te,{x:_.clientX,y:_.clientY})},countVersion:ck,items:WS,filteredItems:se.items,metricKeys:Le,categoricalKeys:Oe,metricDisplayNames:Dt,metricsFacets:Vk,metricsFacetsState:Wk,metricsFacetFieldStates:Do.fieldStates,metricsPopulationItemsComplete:qS,metricsFilteredItemsComplete:Op,metricsPresentationResetKey:_s,derivedDraftResetKey:Fc,derivedMetric:Ve,derivedMetricBackendAuthoritative:!Me,derivedRankDisabledReason:Dk,selectedItems:ga,selectedMetric:p.selectedMetric,metricsFacetDemand:zc,onSelectMetric:_=>g(te=>({...te,selectedMetric:_})),onApplyDerivedMetric:Ok,onRankByDerivedMetric:Fk,filters:p.filters,onChangeRange:rd,onChangeCategoricalValues:sd,onChangeFilters:Sk,onMetricsFacetDemandAction:Tk,onDerivedFacetFieldsChange:NS,onResize:Ir,themePreset:le,onThemePresetChange:zp,autoloadImageMetadata:pe,onAutoloadImageMetadataChange:Se,proxyHttpOriginals:we,onProxyHttpOriginalsChange:Ee,compareOrderMode:xe,onCompareOrderModeChange:Re,tableSourceColumns:ue,tableLaunchStatus:Dp,launchSession:xa,tableSourceSwitching:ke,onTableSourceColumnChange:Tp}),u.jsxs("div",{className:"grid-shell col-start-2 row-start-2 relative overflow-hidden flex flex-col",children:[u.jsx("div",{"aria-live":"polite",className:"sr-only",children:un.length?`${un.length} selected`:""}),u.jsx(gI,{statusBarProps:{persistenceEnabled:ed,showPersistenceWarning:!Ne,onDismissPersistenceWarning:()=>K(!0),indexing:nk,offViewSummary:ik,canRevealOffView:Bc,onRevealOffView:Ek,onClearOffView:lk,browserZoomPercent:v,onDismissBrowserZoomWarning:x,tableSourceWarning:Io,derivedMetricWarning:Rk,onDismissTableSourceWarning:Fr?()=>me(Fr):void 0},actionFeedback:W,onDismissActionFeedback:Jn,similarity:qe?{embedding:qe.embedding,topK:qe.topK,minScore:qe.minScore,queryLabel:xk,countLabel:bk}:null,onExitSimilarity:Ck,filterChips:Nk,onClearFilters:Up}),u.jsxs("div",{className:"grid-body flex-1 min-h-0","data-grid-body":!0,children:[u.jsx("div",{className:"grid-body-main relative min-h-0 min-w-0","data-grid-body-main":!0,children:u.jsx(t_,{items:se.items,interactionDisabled:se.retained,presentationPhase:se.phase,proxyHttpOriginals:we,selected:un,restoreToSelectionToken:DS,restoreToTopAnchorToken:Rs,restoreToTopAnchorPath:uk,multiSelectMode:ba&&P,onSelectionChange:vn,onOpenViewer:_=>{Yc(_),HS(_),vn([_])},highlight:An?an:"",recentlyUpdated:rk,onVisiblePathsChange:sk,onTopAnchorPathChange:ak,suppressSelectionHighlight:US,viewMode:R,targetCellSize:N,onContextMenuItem:(_,te)=>{_.preventDefault(),qp(te,{x:_.clientX,y:_.clientY})},onOpenItemActions:qp,scrollRef:ut,gridStatus:QS,loadedCount:se.items.length,filteredCount:se.filteredCount??se.items.length,onRetry:()=>{js()},hasMore:!se.retained&&se.targetKey===Lo?kS:!1,isLoadingMore:!se.retained&&CS,onLoadMore:ES})}),u.jsx("div",{className:`metric-rail-slot${Sa?"":" is-inactive"}${se.retained?" is-inert":""}`,"data-metric-rail-slot":!0,"data-metric-rail-active":Sa?"true":"false","data-metric-rail-interaction-disabled":se.retained?"true":"false","aria-hidden":!Sa,"aria-busy":se.retained||void 0,"aria-disabled":se.retained||void 0,ref:_=>_==null?void 0:_.toggleAttribute("inert",se.retained),children:Sa?u.jsx(l_,{items:se.items,metricKey:se.metricRailKey,metricLabel:ar(se.metricRailKey,Dt),scrollRef:ut,sortDir:se.metricRailSortDir,currentPath:Or,state:se.metricRailState,histogramOverride:se.metricRailHistogram,populationComplete:Op,onJumpToMetricValue:kk,onRetry:()=>{pa.refetch()}}):u.jsx("div",{className:"metric-rail-placeholder","aria-hidden":"true"})})]})]}),Gp.current&&u.jsx(Jd,{resetKey:`inspector:${Ae.effectiveRightOpen?"open":"closed"}`,fallback:u.jsx(xw,{message:"Inspector could not load.",onClose:Vp,visible:Ae.effectiveRightOpen}),children:u.jsx(c.Suspense,{fallback:u.jsx(xw,{message:"Loading inspector...",onClose:Vp,busy:!0,visible:Ae.effectiveRightOpen}),children:u.jsx(LF,{path:un[0]??null,selectedPaths:un,comparePaths:Qc,items:ga,presentationResetKey:MS,visible:Ae.effectiveRightOpen,viewerCompareActive:zt,compareA:Mp,compareB:Rp,onOpenCompare:_p,sortSpec:p.sort,metricDisplayNames:Dt,onResize:Ln,onStarChanged:(_,te)=>{const De=_.filter(Br=>!St.patch({path:Br,star:te}));De.length&&ce(Br=>{const yi={...Br};for(const Zk of De)yi[Zk]=te;return yi})},onFindSimilar:()=>d(!0),embeddingsAvailable:ae,embeddingsLoading:ve,autoloadImageMetadata:pe,onLocalTypingChange:mi,onActionStart:Jn,onActionError:dr})})})]}),a&&u.jsx(f_,{embeddings:I,rejected:Q,selectedPath:un[0]??null,embeddingsLoading:ve,embeddingsError:Ce,onClose:nd,onSearch:Mk}),wn&&u.jsx(Jd,{resetKey:`viewer:${wn}`,fallback:u.jsx(Zd,{label:"Image viewer",message:"Viewer could not load.",onClose:Xc}),children:u.jsx(B_,{path:wn,item:Ao.get(wn)??null,proxyHttpOriginals:we,onClose:Xc,onZoomChange:_=>w(Math.round(_)),requestedZoomPercent:m,onZoomRequestConsumed:()=>y(null),canPrev:Np,canNext:jp,onNavigate:Zc})}),zt&&u.jsx(Jd,{resetKey:`compare:${zt}`,fallback:u.jsx(Zd,{label:"Compare images",message:"Compare could not load.",onClose:Jc}),children:u.jsx(c.Suspense,{fallback:u.jsx(Zd,{label:"Compare images",message:"Loading compare...",onClose:Jc,busy:!0}),children:u.jsx(IF,{aItem:Mp,bItem:Rp,proxyHttpOriginals:we,index:Gc,total:qc.length,canPrev:zS,canNext:$S,onNavigate:KS,onClose:Jc})})}),$r&&u.jsx($I,{ctx:$r,current:n,items:_t,setCtx:Ps,refreshEnabled:wa,refreshDisabledReason:Ap,onRefreshFolder:fk,canFindSimilar:Fp.canFindSimilar,findSimilarDisabledReason:Fp.disabledReason,onFindSimilar:_=>{vn([_]),d(!0)},onActionStart:Jn,onActionError:dr})]})}function AF(e){return(e==null?void 0:e.mode)==="ranking"?"ranking":"browse"}function DF(e){if(typeof e!="string")return null;const t=e.trim();return t.length>0?t:null}function zF(e){return e instanceof Error&&e.message.trim()?e.message:typeof e=="string"&&e.trim()?e:"health check failed"}function $F(e){return{mode:AF(e),healthMode:(e==null?void 0:e.mode)??null,workspaceId:DF(e==null?void 0:e.workspace_id)}}function BF(e){return{mode:"browse",healthMode:null,workspaceId:null,error:zF(e)}}function UF(){const e=Xe(ze("/health"));return{abort:e.abort,promise:e.promise.then(t=>({...$F(t),error:null})).catch(t=>BF(t))}}function HF(e){const t=Kh(e.workspaceId,e.healthMode);Mb(t)}function KF(e,t,n){e.mode!=="ranking"&&t(e),n({mode:e.mode,healthMode:e.healthMode,workspaceId:e.workspaceId,loading:!1,error:e.error})}function bw({showLoadingCopy:e}){return u.jsx("div",{className:"boot-loading","data-boot-shell":!0,"data-loading-copy-visible":e?"true":"false","aria-busy":"true",children:u.jsx("span",{"aria-live":"polite",children:e?"Loading Lenslet...":" "})})}const bS=()=>Wm(()=>import("./RankingApp-Br3Iku0W.js"),__vite__mapDeps([4,3,5])),VF=c.lazy(bS);function WF(){const[e]=c.useState(()=>Date.now()),[t,n]=c.useState({mode:"browse",healthMode:null,workspaceId:null,loading:!0,error:null}),[r,s]=c.useState(!1);c.useEffect(()=>{const l=UF();return l.promise.then(a=>{KF(a,HF,n)}).catch(a=>{const d=a instanceof Error?a.message:"health check failed";n({mode:"browse",healthMode:null,workspaceId:null,loading:!1,error:d})}),()=>l.abort()},[]),c.useEffect(()=>{if(t.loading||t.mode!=="ranking")return;let l=!0;return bS().then(()=>{l&&s(!0)}),()=>{l=!1}},[t.loading,t.mode]);const i=t.loading||t.mode==="ranking"&&!r,o=wp(i,TF,e);return t.loading?u.jsx(bw,{showLoadingCopy:o}):t.mode==="ranking"?u.jsx(c.Suspense,{fallback:u.jsx(bw,{showLoadingCopy:o}),children:u.jsx(VF,{bootStartedAtMs:e})}):u.jsxs(u.Fragment,{children:[t.error?u.jsxs("div",{className:"boot-warning",role:"status",children:["Health check failed; using browse mode fallback. (",t.error,")"]}):null,u.jsx(FF,{themeHealthMode:t.healthMode,themeWorkspaceId:t.workspaceId})]})}const qF=new cR({defaultOptions:{queries:{staleTime:1e4,gcTime:5*6e4,retry:2,retryDelay:e=>Math.min(1e3*Math.pow(2,e),1e4),refetchOnWindowFocus:!1,refetchOnReconnect:"always"},mutations:{retry:2,retryDelay:e=>Math.min(1e3*Math.pow(2,e),5e3)}}});function QF(){return u.jsx(dR,{client:qF,children:u.jsx(WF,{})})}_M();OM();Wx(document.getElementById("root")).render(u.jsx(QF,{}));export{ar as A,bw as B,gP as C,mu as D,rA as E,cP as F,w1 as G,hp as H,eA as I,tA as J,zi as K,Ub as L,Vu as M,Ms as N,TI as O,ZF as P,nA as Q,ig as R,Db as S,Zm as T,jo as U,ze as a,XF as b,ua as c,TF as d,nv as e,Xe as f,Xs as g,M_ as h,wh as i,u as j,Ka as k,Bl as l,Jm as m,y_ as n,Gj as o,E_ as p,Ib as q,c as r,Qm as s,JF as t,wp as u,ep as v,Fe as w,sA as x,Wt as y,Vd as z};
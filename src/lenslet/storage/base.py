@@ -288,6 +288,24 @@ class S3DiagnosticsStorage(Protocol):
         ...
 
 
+class RemoteOriginalCacheStorage(Protocol):
+    """Disk-cached remote (S3/HTTP) original reads capability."""
+
+    def set_remote_original_cache(self, cache: Any | None) -> None:
+        ...
+
+
+class MemoryCacheStorage(Protocol):
+    """Byte-budgeted in-memory thumbnail/dimension cache capability."""
+
+    def set_memory_cache_budget(self, thumbnail_bytes: int, dimension_bytes: int | None = None) -> None:
+        ...
+
+    def memory_cache_stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters keyed by hotpath counter name."""
+        ...
+
+
 class MediaStorage(BrowseStorage, ThumbnailStorage, ThumbnailCacheKeyStorage, LocalFileStorage, Protocol):
     """Storage capability set needed by media and thumbnail responses."""
 
@@ -0,0 +1,159 @@
+"""Byte-budgeted LRU caches for per-item thumbnail and dimension state."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from dataclasses import dataclass
+import threading
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+DEFAULT_THUMBNAIL_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_DIMENSION_CACHE_BYTES = 64 * 1024 * 1024
+# Approximate per-entry cost of the dict slot, key object, and value container.
+_ENTRY_OVERHEAD_BYTES = 96
+_DIMENSION_VALUE_BYTES = 120
+
+
+def thumbnail_entry_bytes(key: str, value: bytes) -> int:
+    return len(key) + len(value) + _ENTRY_OVERHEAD_BYTES
+
+
+def dimension_entry_bytes(key: str, value: tuple[int, int]) -> int:
+    _ = value
+    return len(key) + _DIMENSION_VALUE_BYTES + _ENTRY_OVERHEAD_BYTES
+
+
+@dataclass(frozen=True, slots=True)
+class BoundedCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    budget_bytes: int
+
+
+class BoundedLRUCache(MutableMapping[K, V], Generic[K, V]):
+    """Thread-safe LRU mapping that evicts least-recently-used entries past a byte budget.
+
+    `get` is the lookup path that records hits and misses; `in` and item access
+    behave like a dict so existing invalidation loops keep working unchanged.
+    Entries larger than the whole budget are not stored.
+    """
+
+    def __init__(self, budget_bytes: int, weigh: Callable[[K, V], int]) -> None:
+        self._budget_bytes = max(0, int(budget_bytes))
+        self._weigh = weigh
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget_bytes
+
+    def set_budget(self, budget_bytes: int) -> None:
+        with self._lock:
+            self._budget_bytes = max(0, int(budget_bytes))
+            self._evict_over_budget()
+
+    def get(self, key: K, default: V | None = None) -> V | None:  # type: ignore[override]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            value, _size = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        size = max(0, int(self._weigh(key, value)))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size > self._budget_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict_over_budget()
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            _value, size = self._entries.pop(key)
+            self._bytes -= size
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            keys = list(self._entries)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> BoundedCacheStats:
+        with self._lock:
+            return BoundedCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                budget_bytes=self._budget_bytes,
+            )
+
+    def _evict_over_budget(self) -> None:
+        while self._bytes > self._budget_bytes and self._entries:
+            _key, (_value, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+def thumbnail_cache(budget_bytes: int = DEFAULT_THUMBNAIL_CACHE_BYTES) -> BoundedLRUCache[str, bytes]:
+    return BoundedLRUCache(budget_bytes, thumbnail_entry_bytes)
+
+
+def dimension_cache(
+    budget_bytes: int = DEFAULT_DIMENSION_CACHE_BYTES,
+) -> BoundedLRUCache[str, tuple[int, int]]:
+    return BoundedLRUCache(budget_bytes, dimension_entry_bytes)
+
+
+def memory_cache_counters(caches: dict[str, BoundedLRUCache]) -> dict[str, int]:
+    """Flatten cache stats into hotpath counter names such as `thumbnail_memory_cache_hit_total`."""
+    counters: dict[str, int] = {}
+    for name, cache in caches.items():
+        stats = cache.stats()
+        prefix = f"{name}_memory_cache"
+        counters[f"{prefix}_hit_total"] = stats.hits
+        counters[f"{prefix}_miss_total"] = stats.misses
+        counters[f"{prefix}_eviction_total"] = stats.evictions
+        counters[f"{prefix}_entries"] = stats.entries
+        counters[f"{prefix}_bytes"] = stats.bytes
+        counters[f"{prefix}_budget_bytes"] = stats.budget_bytes
+    return counters
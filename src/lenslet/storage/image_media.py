@@ -3,11 +3,24 @@ from __future__ import annotations
 import os
 import struct
 from io import BytesIO
-from typing import BinaryIO, Literal
+from typing import BinaryIO, Literal, Protocol
 
 ImageMime = Literal["image/webp", "image/jpeg", "image/png"]
 
 
+class ThumbnailRenderer(Protocol):
+    """Callable that turns encoded source bytes into WebP thumbnail bytes and source dimensions."""
+
+    def __call__(
+        self,
+        img_bytes: bytes,
+        *,
+        thumb_size: int,
+        thumb_quality: int,
+    ) -> tuple[bytes, tuple[int, int] | None]:
+        ...
+
+
 def guess_image_mime(name: str) -> ImageMime:
     if len(name) >= 5 and name[-5:].lower() == ".webp":
         return "image/webp"
@@ -87,22 +100,67 @@ def read_dimensions_fast(filepath: str) -> tuple[int, int] | None:
     return None
 
 
+THUMBNAIL_REDUCING_GAP = 2.0
+
+
+def thumbnail_target_size(width: int, height: int, thumb_size: int) -> tuple[int, int] | None:
+    """Return the resized thumbnail size, or None when the source short side already fits."""
+    short_side = min(width, height)
+    if short_side <= thumb_size:
+        return None
+    scale = thumb_size / short_side
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def _reduce_on_decode(image, target: tuple[int, int]) -> None:
+    """Ask the decoder for the smallest scaled-down image that still covers target.
+
+    JPEG honours this through DCT scaling (1/2, 1/4, 1/8); other formats ignore
+    `draft` and are shrunk by the integer `reduce` step in the resize instead.
+    """
+    if image.format != "JPEG":
+        return
+    try:
+        image.draft("RGB", target)
+    except (OSError, ValueError):
+        return
+
+
 def make_webp_thumbnail(
     img_bytes: bytes,
     *,
     thumb_size: int,
     thumb_quality: int,
+    reduce_on_decode: bool = True,
+) -> tuple[bytes, tuple[int, int] | None]:
+    return render_webp_thumbnail(
+        BytesIO(img_bytes),
+        thumb_size=thumb_size,
+        thumb_quality=thumb_quality,
+        reduce_on_decode=reduce_on_decode,
+    )
+
+
+def render_webp_thumbnail(
+    source: BinaryIO,
+    *,
+    thumb_size: int,
+    thumb_quality: int,
+    reduce_on_decode: bool = True,
 ) -> tuple[bytes, tuple[int, int] | None]:
     from PIL import Image
 
-    with Image.open(BytesIO(img_bytes)) as image:
+    with Image.open(source) as image:
         width, height = image.size
-        short_side = min(width, height)
-        if short_side > thumb_size:
-            scale = thumb_size / short_side
-            resized_width = max(1, int(width * scale))
-            resized_height = max(1, int(height * scale))
-            image = image.convert("RGB").resize((resized_width, resized_height), Image.LANCZOS)
+        target = thumbnail_target_size(width, height, thumb_size)
+        if target is not None:
+            if reduce_on_decode:
+                _reduce_on_decode(image, target)
+            image = image.convert("RGB").resize(
+                target,
+                Image.LANCZOS,
+                reducing_gap=THUMBNAIL_REDUCING_GAP if reduce_on_decode else None,
+            )
         else:
             image = image.convert("RGB")
         output = BytesIO()
@@ -110,6 +168,54 @@ def make_webp_thumbnail(
         return output.getvalue(), (width, height)
 
 
+PREVIEW_PASSTHROUGH_FORMATS: dict[str, ImageMime] = {"JPEG": "image/jpeg", "WEBP": "image/webp"}
+
+
+def preview_target_size(width: int, height: int, long_side: int) -> tuple[int, int] | None:
+    """Return the resized preview size, or None when the source long side already fits."""
+    longest = max(width, height)
+    if longest <= long_side:
+        return None
+    scale = long_side / longest
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def render_preview(
+    img_bytes: bytes,
+    *,
+    long_side: int,
+    quality: int,
+) -> tuple[bytes, ImageMime]:
+    """Return a viewer-sized encoding of `img_bytes` and its MIME type.
+
+    JPEG and WebP sources that already fit within `long_side` are returned
+    unchanged; everything else is downscaled and re-encoded as WebP, keeping
+    transparency when the source has it. Re-encoded previews drop EXIF, so
+    the EXIF orientation is applied to the pixels first.
+    """
+    from PIL import ExifTags, Image, ImageOps
+
+    with Image.open(BytesIO(img_bytes)) as image:
+        width, height = image.size
+        target = preview_target_size(width, height, long_side)
+        passthrough = PREVIEW_PASSTHROUGH_FORMATS.get(image.format or "")
+        if target is None and passthrough is not None:
+            return img_bytes, passthrough
+        if target is not None:
+            _reduce_on_decode(image, target)
+            if image.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+                target = target[1], target[0]
+        ImageOps.exif_transpose(image, in_place=True)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        if target is not None:
+            image = image.resize(target, Image.LANCZOS, reducing_gap=THUMBNAIL_REDUCING_GAP)
+        output = BytesIO()
+        # method=4 keeps multi-megapixel encodes interactive; thumbnails can afford 6.
+        image.save(output, format="WEBP", quality=quality, method=4)
+        return output.getvalue(), "image/webp"
+
+
 def read_jpeg_dimensions(handle: BinaryIO) -> tuple[int, int] | None:
     handle.seek(0)
     if handle.read(2) != b"\xff\xd8":
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from typing import Any
 
+from ..bounded_cache import BoundedLRUCache, memory_cache_counters
+
 
 class MemoryCacheInvalidationMixin:
     _bump_browse_generation: Callable[[], None]
     _cache_item_key: Callable[[str], str]
     _canonical_sidecar_key: Callable[[str], str]
-    _dimensions: dict[str, tuple[int, int]]
+    _dimensions: MutableMapping[str, tuple[int, int]]
     _drop_folder_indexes_for_subtree: Callable[[str], None]
     _drop_item_caches_for_subtree: Callable[..., None]
     _indexes: dict[str, Any]
@@ -17,7 +19,7 @@ class MemoryCacheInvalidationMixin:
     _sidecars: dict[str, dict[str, Any]]
     _normalize_path: Callable[[str], str]
     _recursive_indexes: dict[str, Any]
-    _thumbnails: dict[str, bytes]
+    _thumbnails: MutableMapping[str, bytes]
 
     def _bump_browse_generation(self) -> None:
         raise NotImplementedError
@@ -91,3 +93,18 @@ class MemoryCacheInvalidationMixin:
         self._leaf_batch.clear()
         self._drop_folder_indexes_for_subtree(norm)
         self._drop_item_caches_for_subtree(self._canonical_sidecar_key(path), clear_sidecars=clear_sidecars)
+
+    def set_memory_cache_budget(self, thumbnail_bytes: int, dimension_bytes: int | None = None) -> None:
+        """Resize the in-memory thumbnail (and optionally dimension) caches, evicting as needed."""
+        if isinstance(self._thumbnails, BoundedLRUCache):
+            self._thumbnails.set_budget(thumbnail_bytes)
+        if dimension_bytes is not None and isinstance(self._dimensions, BoundedLRUCache):
+            self._dimensions.set_budget(dimension_bytes)
+
+    def memory_cache_stats(self) -> dict[str, int]:
+        caches = {
+            name: cache
+            for name, cache in (("thumbnail", self._thumbnails), ("dimension", self._dimensions))
+            if isinstance(cache, BoundedLRUCache)
+        }
+        return memory_cache_counters(caches)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from dataclasses import dataclass, field
 import logging
 import os
@@ -94,7 +94,7 @@ class IndexBuildState:
         self,
         result: BuiltMemoryItem,
         *,
-        dimensions: dict[str, tuple[int, int]],
+        dimensions: MutableMapping[str, tuple[int, int]],
         progress: Callable[[int, int, str], None],
     ) -> None:
         idx, item, dims = result
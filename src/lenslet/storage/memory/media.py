@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, MutableMapping
 from io import BytesIO
 
 from PIL import Image
 
 from ...media_errors import MediaDecodeError, MediaReadError
-from ..image_media import ImageMime, guess_image_mime, make_webp_thumbnail, read_dimensions_fast
+from ..image_media import (
+    ImageMime,
+    ThumbnailRenderer,
+    guess_image_mime,
+    make_webp_thumbnail,
+    read_dimensions_fast,
+)
 
 
 class MemoryMediaMixin:
@@ -14,10 +20,11 @@ class MemoryMediaMixin:
     _cache_item_key: Callable[[str], str]
     thumb_quality: int
     thumb_size: int
-    _dimensions: dict[str, tuple[int, int]]
+    _dimensions: MutableMapping[str, tuple[int, int]]
     _load_dimensions_fast: Callable[[str], tuple[int, int] | None]
     _read_dimensions_fast: Callable[[str], tuple[int, int] | None]
-    _thumbnails: dict[str, bytes]
+    _thumbnails: MutableMapping[str, bytes]
+    _thumbnail_renderer: ThumbnailRenderer = staticmethod(make_webp_thumbnail)
     etag: Callable[[str], str | None]
     get_cached_thumbnail: Callable[[str], bytes | None]
     get_source_path: Callable[[str], str]
@@ -46,8 +53,9 @@ class MemoryMediaMixin:
     def load_dimensions(self, path: str) -> tuple[int, int]:
         """Load image dimensions and update dimension cache state."""
         key = self._cache_item_key(path)
-        if key in self._dimensions:
-            return self._dimensions[key]
+        cached = self._dimensions.get(key)
+        if cached is not None:
+            return cached
 
         dims = self._load_dimensions_fast(path)
         if dims:
@@ -93,7 +101,7 @@ class MemoryMediaMixin:
             raise MediaReadError.from_exception(path, exc) from exc
 
         try:
-            thumb, dims = make_webp_thumbnail(
+            thumb, dims = self._thumbnail_renderer(
                 raw,
                 thumb_size=self.thumb_size,
                 thumb_quality=self.thumb_quality,
@@ -107,6 +115,10 @@ class MemoryMediaMixin:
             self._dimensions[key] = dims
         return thumb
 
+    def set_thumbnail_renderer(self, renderer: ThumbnailRenderer | None) -> None:
+        """Route thumbnail encoding through renderer; None restores in-process encoding."""
+        self._thumbnail_renderer = renderer or make_webp_thumbnail
+
     def get_cached_thumbnail(self, path: str) -> bytes | None:
         key = self._cache_item_key(path)
         return self._thumbnails.get(key)
@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from typing import Any
 from ..base import SidecarState, StorageWriteUnsupportedError, join_storage_path
 from ..local.storage import LocalStorage
+from ..bounded_cache import dimension_cache, thumbnail_cache
 from .cache import MemoryCacheInvalidationMixin
 from .index import (
     BuiltMemoryItem,
@@ -56,9 +57,9 @@ class MemoryStorage(SidecarStateMixin, MemoryCacheInvalidationMixin, MemoryMedia
         # In-memory caches
         self._indexes: dict[str, MemoryBrowseIndex] = {}
         self._recursive_indexes: dict[str, MemoryBrowseIndex] = {}
-        self._thumbnails: dict[str, bytes] = {}  # path -> thumbnail bytes
+        self._thumbnails = thumbnail_cache()  # path -> thumbnail bytes
         self._sidecars: dict[str, SidecarState] = {}  # path -> sidecar state
-        self._dimensions: dict[str, tuple[int, int]] = {}  # path -> (w, h)
+        self._dimensions = dimension_cache()  # path -> (w, h)
         self._browse_generation = 0
         self._browse_signature = self._compute_browse_signature()
         self._path_to_row: dict[str, int] = {}
@@ -11,7 +11,7 @@ from ..sidecar_state import SidecarStateMixin, copy_sidecar_state, default_sidec
 from ..progress_state import StorageProgressMixin
 from ..search_text import build_search_haystack
 from .catalog import SourceCatalog
-from .media import MediaReadService
+from .media import MediaReadService, RemoteOriginalCache
 from .state import ItemT, SourceBackedIndexState, SourceRowIndexState
 from .probe import (
     RemoteDimensionProbeContext,
@@ -19,7 +19,8 @@ from .probe import (
     probe_remote_dimensions,
 )
 from ..base import BrowseIndex, SidecarState
-from ..image_media import ImageMime, guess_image_mime, make_webp_thumbnail
+from ..bounded_cache import BoundedLRUCache, memory_cache_counters, thumbnail_cache
+from ..image_media import ImageMime, ThumbnailRenderer, guess_image_mime, make_webp_thumbnail
 
 
 def guess_mime(name: str) -> ImageMime:
@@ -54,7 +55,8 @@ class SourceBackedStorageBase(SidecarStateMixin, StorageProgressMixin, Generic[I
     _source_config: SourceBackedConfig
     _source_services: SourceBackedServices
     _include_source_in_search: bool
-    _thumbnails: dict[str, bytes]
+    _thumbnails: BoundedLRUCache[str, bytes]
+    _thumbnail_renderer: ThumbnailRenderer
     _source_catalog: SourceCatalog[ItemT]
     _media_reads: MediaReadService
     _index_state: SourceBackedIndexState[ItemT]
@@ -94,7 +96,8 @@ class SourceBackedStorageBase(SidecarStateMixin, StorageProgressMixin, Generic[I
         )
         self._bind_source_state(self._source_catalog.state)
         self._row_index_state = None
-        self._thumbnails = {}
+        self._thumbnails = thumbnail_cache()
+        self._thumbnail_renderer = make_webp_thumbnail
         self._sidecars = {}
         self._media_reads = MediaReadService(
             remote_header_bytes=config.remote_header_bytes,
@@ -221,8 +224,9 @@ class SourceBackedStorageBase(SidecarStateMixin, StorageProgressMixin, Generic[I
 
     def get_or_build_thumbnail(self, path: str) -> bytes:
         norm = self._normalize_source_item_path(path)
-        if norm in self._thumbnails:
-            return self._thumbnails[norm]
+        cached = self._thumbnails.get(norm)
+        if cached is not None:
+            return cached
 
         try:
             raw = self.read_bytes(norm)
@@ -233,7 +237,7 @@ class SourceBackedStorageBase(SidecarStateMixin, StorageProgressMixin, Generic[I
         except Exception as exc:
             raise MediaReadError.from_exception(path, exc) from exc
         try:
-            thumb, dims = make_webp_thumbnail(
+            thumb, dims = self._thumbnail_renderer(
                 raw,
                 thumb_size=self.thumb_size,
                 thumb_quality=self.thumb_quality,
@@ -248,6 +252,26 @@ class SourceBackedStorageBase(SidecarStateMixin, StorageProgressMixin, Generic[I
                 item.width, item.height = dims
         return thumb
 
+    def set_thumbnail_renderer(self, renderer: ThumbnailRenderer | None) -> None:
+        """Route thumbnail encoding through renderer; None restores in-process encoding."""
+        self._thumbnail_renderer = renderer or make_webp_thumbnail
+
+    def set_remote_original_cache(self, cache: RemoteOriginalCache | None) -> None:
+        """Read S3/HTTP originals through a disk cache; None restores direct fetches."""
+        self._media_reads.set_original_cache(cache)
+
+    def set_memory_cache_budget(self, thumbnail_bytes: int, dimension_bytes: int | None = None) -> None:
+        """Resize the in-memory thumbnail cache, evicting least-recently-used entries as needed.
+
+        Dimensions here are index state shared with the row index and items, so
+        `dimension_bytes` is accepted for interface parity and ignored.
+        """
+        _ = dimension_bytes
+        self._thumbnails.set_budget(thumbnail_bytes)
+
+    def memory_cache_stats(self) -> dict[str, int]:
+        return memory_cache_counters({"thumbnail": self._thumbnails})
+
     def get_dimensions(self, path: str) -> tuple[int, int]:
         norm = self._normalize_source_item_path(path)
         if norm in self._dimensions:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 import socket
 from threading import Lock
-from typing import Any, Callable
+from typing import Any, BinaryIO, Callable, Protocol
 import urllib.error
 from urllib.parse import urlparse
 
@@ -74,6 +75,39 @@ def _remote_timeout_reason(exc: BaseException) -> bool:
     return isinstance(exc, (TimeoutError, socket.timeout)) or isinstance(reason, (TimeoutError, socket.timeout))
 
 
+class RemoteOriginalCache(Protocol):
+    """Disk cache of remote original bytes, validated by upstream ETag/Last-Modified."""
+
+    def lookup(self, source: str) -> Any | None:
+        ...
+
+    def is_fresh(self, entry: Any) -> bool:
+        ...
+
+    def read(self, entry: Any) -> bytes | None:
+        ...
+
+    def open(self, entry: Any) -> BinaryIO | None:
+        ...
+
+    def mark_validated(self, entry: Any) -> Any:
+        ...
+
+    def writer(self, source: str) -> Any | None:
+        ...
+
+    def store(
+        self,
+        source: str,
+        data: bytes,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str | None,
+    ) -> Any | None:
+        ...
+
+
 def _safe_range_header(value: str | None) -> str | None:
     raw = (value or "").strip()
     if not raw:
@@ -85,12 +119,48 @@ def _safe_range_header(value: str | None) -> str | None:
     return raw
 
 
+def _conditional_headers(entry: Any | None) -> dict[str, str]:
+    if entry is None:
+        return {}
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def _parse_single_range(value: str | None, size: int) -> tuple[int, int] | None:
+    """Return an inclusive byte span for one satisfiable `bytes=` range, else None."""
+    raw = _safe_range_header(value)
+    if raw is None or size <= 0:
+        return None
+    spec = raw[len("bytes="):].strip()
+    if "," in spec or "-" not in spec:
+        return None
+    start_text, end_text = (part.strip() for part in spec.split("-", 1))
+    try:
+        if not start_text:
+            suffix = int(end_text)
+            if suffix <= 0:
+                return None
+            return max(0, size - suffix), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        return None
+    if start < 0 or start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
 @dataclass(slots=True)
 class RemoteMediaStream:
     path: str
     source: str
     response: Any
     max_bytes: int = HTTP_STREAM_MAX_BYTES
+    cache_writer: Any | None = None
 
     @property
     def status_code(self) -> int:
@@ -107,6 +177,7 @@ class RemoteMediaStream:
 
     def iter_bytes(self) -> Iterator[bytes]:
         read = 0
+        writer = self.cache_writer
         try:
             for chunk in self.response.iter_bytes(chunk_size=HTTP_STREAM_CHUNK_SIZE):
                 if not chunk:
@@ -114,6 +185,83 @@ class RemoteMediaStream:
                 read += len(chunk)
                 if read > self.max_bytes:
                     raise RemoteMediaReadError(self.path, self.source, "too_large", "remote original exceeds byte limit")
+                if writer is not None:
+                    writer.write(chunk)
+                yield chunk
+            if writer is not None:
+                # Only a fully read body becomes a cache entry.
+                writer.commit(**_cache_validators(self.headers), expected_size=_content_length(self.headers))
+                writer = None
+        finally:
+            if writer is not None:
+                writer.discard()
+            self.close()
+
+
+def _content_length(headers: Any) -> int | None:
+    try:
+        return int(headers.get("content-length"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _cache_validators(headers: Any) -> dict[str, str | None]:
+    return {
+        "etag": headers.get("etag"),
+        "last_modified": headers.get("last-modified"),
+        "content_type": headers.get("content-type"),
+    }
+
+
+@dataclass(slots=True)
+class CachedMediaStream:
+    """Serve a cached remote original, honoring a single byte range."""
+
+    path: str
+    source: str
+    handle: BinaryIO
+    entry: Any
+    range_header: str | None = None
+    _span: tuple[int, int] | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self._span = _parse_single_range(self.range_header, self.entry.size)
+
+    @property
+    def status_code(self) -> int:
+        return 206 if self._span is not None else 200
+
+    @property
+    def headers(self) -> dict[str, str]:
+        size = self.entry.size
+        start, end = self._span if self._span is not None else (0, size - 1)
+        headers = {
+            "accept-ranges": "bytes",
+            "content-length": str(max(0, end - start + 1)),
+        }
+        if self._span is not None:
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+        if self.entry.etag:
+            headers["etag"] = self.entry.etag
+        if self.entry.last_modified:
+            headers["last-modified"] = self.entry.last_modified
+        if self.entry.content_type:
+            headers["content-type"] = self.entry.content_type
+        return headers
+
+    def close(self) -> None:
+        self.handle.close()
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        start, end = self._span if self._span is not None else (0, self.entry.size - 1)
+        remaining = end - start + 1
+        try:
+            self.handle.seek(start)
+            while remaining > 0:
+                chunk = self.handle.read(min(HTTP_STREAM_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
                 yield chunk
         finally:
             self.close()
@@ -132,6 +280,13 @@ class MediaReadService:
     _s3_client_creations: int = field(default=0, init=False)
     _http_client_lock: Lock = field(default_factory=Lock, init=False)
     _http_client: Any | None = field(default=None, init=False)
+    _original_cache: RemoteOriginalCache | None = field(default=None, init=False)
+    _original_fetch_lock: Lock = field(default_factory=Lock, init=False)
+    _original_fetches: dict[str, Future[bytes]] = field(default_factory=dict, init=False)
+
+    def set_original_cache(self, cache: RemoteOriginalCache | None) -> None:
+        """Serve remote originals through `cache`; None restores direct fetches."""
+        self._original_cache = cache
 
     @property
     def s3_client_creations(self) -> int:
@@ -204,11 +359,17 @@ class MediaReadService:
             )
             return self._http_client
 
-    def _http_get(self, url: str) -> Any:
-        return self._ensure_http_client().get(url)
+    def _http_get(self, url: str, headers: dict[str, str] | None = None) -> Any:
+        return self._ensure_http_client().get(url, headers=headers)
 
-    def _http_stream(self, url: str, *, range_header: str | None = None) -> Any:
-        headers = {}
+    def _http_stream(
+        self,
+        url: str,
+        *,
+        range_header: str | None = None,
+        conditional_headers: dict[str, str] | None = None,
+    ) -> Any:
+        headers = dict(conditional_headers or {})
         safe_range = _safe_range_header(range_header)
         if safe_range is not None:
             headers["Range"] = safe_range
@@ -302,19 +463,26 @@ class MediaReadService:
             raise RemoteMediaReadError(path, source, "timeout", detail) from exc
         raise RemoteMediaReadError(path, source, default_category, detail) from exc
 
-    def _read_http_bytes(
+    def _get_http_response(
         self,
         *,
         path: str,
         source: str,
         url: str,
         default_category: str,
-    ) -> bytes:
+        conditional_headers: dict[str, str] | None = None,
+    ) -> Any:
         httpx = _require_httpx()
         try:
-            response = self._http_get(require_http_url(url))
+            safe_url = require_http_url(url)
+            if conditional_headers:
+                response = self._http_get(safe_url, headers=conditional_headers)
+                if response.status_code == 304:
+                    return response
+            else:
+                response = self._http_get(safe_url)
             response.raise_for_status()
-            return response.content
+            return response
         except httpx.HTTPStatusError as exc:
             self._raise_http_status_read_error(path, source, exc.response.status_code, cause=exc)
         except httpx.TimeoutException as exc:
@@ -322,7 +490,85 @@ class MediaReadService:
         except (httpx.HTTPError, ValueError, OSError) as exc:
             self._raise_remote_read_error(path, source, exc, default_category=default_category)
 
+    def _read_http_bytes(
+        self,
+        *,
+        path: str,
+        source: str,
+        url: str,
+        default_category: str,
+    ) -> bytes:
+        return self._get_http_response(
+            path=path,
+            source=source,
+            url=url,
+            default_category=default_category,
+        ).content
+
+    def _remote_url(self, path: str, source: str) -> tuple[str, str]:
+        if not self.is_s3_uri(source):
+            return source, "network"
+        try:
+            return self.get_presigned_url(source), "s3"
+        except (ImportError, RuntimeError, ValueError, OSError, urllib.error.URLError) as exc:
+            self._raise_remote_read_error(path, source, exc, default_category="s3")
+
+    def _read_cached_original(self, cache: RemoteOriginalCache, path: str, source: str) -> bytes:
+        entry = cache.lookup(source)
+        if entry is not None and cache.is_fresh(entry):
+            data = cache.read(entry)
+            if data is not None:
+                return data
+        # Concurrent readers of one object share a single upstream fetch.
+        with self._original_fetch_lock:
+            pending = self._original_fetches.get(source)
+            leader = pending is None
+            if pending is None:
+                pending = Future()
+                self._original_fetches[source] = pending
+        if not leader:
+            return pending.result()
+        try:
+            data = self._fetch_original(cache, path, source, entry)
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        else:
+            pending.set_result(data)
+            return data
+        finally:
+            with self._original_fetch_lock:
+                self._original_fetches.pop(source, None)
+
+    def _fetch_original(
+        self,
+        cache: RemoteOriginalCache,
+        path: str,
+        source: str,
+        entry: Any | None,
+    ) -> bytes:
+        url, category = self._remote_url(path, source)
+        response = self._get_http_response(
+            path=path,
+            source=source,
+            url=url,
+            default_category=category,
+            conditional_headers=_conditional_headers(entry),
+        )
+        if response.status_code == 304 and entry is not None:
+            data = cache.read(cache.mark_validated(entry))
+            if data is not None:
+                return data
+            response = self._get_http_response(path=path, source=source, url=url, default_category=category)
+        data = response.content
+        cache.store(source, data, **_cache_validators(response.headers))
+        return data
+
     def read_bytes(self, path: str, source: str) -> bytes:
+        cache = self._original_cache
+        if cache is not None and (self.is_s3_uri(source) or self.is_http_url(source)):
+            return self._read_cached_original(cache, path, source)
+
         if self.is_s3_uri(source):
             try:
                 url = self.get_presigned_url(source)
@@ -350,26 +596,24 @@ class MediaReadService:
         with open(resolved, "rb") as handle:
             return handle.read()
 
-    def open_remote_stream(
+    def _open_http_stream(
         self,
         path: str,
         source: str,
+        url: str,
         *,
-        range_header: str | None = None,
-    ) -> RemoteMediaStream | None:
-        if self.is_s3_uri(source):
-            try:
-                url = self.get_presigned_url(source)
-            except (ImportError, RuntimeError, ValueError, OSError, urllib.error.URLError) as exc:
-                self._raise_remote_read_error(path, source, exc, default_category="s3")
-        elif self.is_http_url(source):
-            url = source
-        else:
-            return None
-
+        range_header: str | None,
+        conditional_headers: dict[str, str] | None = None,
+    ) -> Any:
         httpx = _require_httpx()
         try:
-            response = self._http_stream(url, range_header=range_header)
+            response = self._http_stream(
+                url,
+                range_header=range_header,
+                conditional_headers=conditional_headers,
+            )
+            if conditional_headers and response.status_code == 304:
+                return response
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             response = getattr(exc, "response", None)
@@ -380,4 +624,47 @@ class MediaReadService:
             raise RemoteMediaReadError(path, source, "timeout", _exception_detail(exc)) from exc
         except (httpx.HTTPError, ValueError, OSError) as exc:
             self._raise_remote_read_error(path, source, exc, default_category="network")
-        return RemoteMediaStream(path=path, source=source, response=response)
+        return response
+
+    def open_remote_stream(
+        self,
+        path: str,
+        source: str,
+        *,
+        range_header: str | None = None,
+    ) -> RemoteMediaStream | CachedMediaStream | None:
+        if self.is_s3_uri(source):
+            try:
+                url = self.get_presigned_url(source)
+            except (ImportError, RuntimeError, ValueError, OSError, urllib.error.URLError) as exc:
+                self._raise_remote_read_error(path, source, exc, default_category="s3")
+        elif self.is_http_url(source):
+            url = source
+        else:
+            return None
+
+        cache = self._original_cache
+        entry = cache.lookup(source) if cache is not None else None
+        if entry is not None and cache.is_fresh(entry):
+            handle = cache.open(entry)
+            if handle is not None:
+                return CachedMediaStream(path, source, handle, entry, range_header)
+
+        response = self._open_http_stream(
+            path,
+            source,
+            url,
+            range_header=range_header,
+            conditional_headers=_conditional_headers(entry),
+        )
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            entry = cache.mark_validated(entry)
+            handle = cache.open(entry)
+            if handle is not None:
+                return CachedMediaStream(path, source, handle, entry, range_header)
+            response = self._open_http_stream(path, source, url, range_header=range_header)
+        writer = None
+        if cache is not None and response.status_code == 200:
+            writer = cache.writer(source)
+        return RemoteMediaStream(path=path, source=source, response=response, cache_writer=writer)
@@ -0,0 +1,84 @@
+"""Packed slot bitsets for low-cardinality table columns.
+
+A bitmap is a Python int whose bit `slot` is set when that column-store slot
+holds the value. Ints are immutable, so snapshots share bitmaps without
+copying, and AND/OR/popcount run in C over whole machine words.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any, TypeVar
+
+
+V = TypeVar("V", bound=Hashable)
+
+
+def value_bitmaps(values: Sequence[V | None]) -> dict[V, int]:
+    """Return one bitmap per distinct non-null value."""
+    size = (len(values) + 7) // 8
+    buffers: dict[V, bytearray] = {}
+    for slot, value in enumerate(values):
+        if value is None:
+            continue
+        buffer = buffers.get(value)
+        if buffer is None:
+            buffer = buffers[value] = bytearray(size)
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return {value: int.from_bytes(buffer, "little") for value, buffer in buffers.items()}
+
+
+def slots_bitmap(slots: Iterable[int], row_count: int) -> int:
+    buffer = bytearray((row_count + 7) // 8)
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def with_bit(bitmap: int, slot: int, enabled: bool) -> int:
+    bit = 1 << slot
+    return bitmap | bit if enabled else bitmap & ~bit
+
+
+def full_bitmap(row_count: int) -> int:
+    return (1 << row_count) - 1
+
+
+def union(bitmaps: Iterable[int]) -> int:
+    result = 0
+    for bitmap in bitmaps:
+        result |= bitmap
+    return result
+
+
+def stars_bitmap(
+    values: Iterable[int],
+    star_bitmaps: Mapping[int, int],
+    row_count: int,
+) -> int:
+    """Return slots whose rating is in `values`, treating unrated as 0."""
+    selected = 0
+    for value in set(values):
+        if value == 0:
+            selected |= full_bitmap(row_count) & ~union(star_bitmaps.values())
+        else:
+            selected |= star_bitmaps.get(value, 0)
+    return selected
+
+
+def bitmap_nbytes(bitmaps: Iterable[int]) -> int:
+    return sum((bitmap.bit_length() + 7) // 8 for bitmap in bitmaps)
+
+
+def bitmap_mask(pa: Any, bitmap: int, row_count: int) -> Any:
+    """Return `bitmap` as an Arrow boolean array without copying bit by bit."""
+    data = bitmap.to_bytes((row_count + 7) // 8, "little")
+    return pa.Array.from_buffers(pa.bool_(), row_count, [None, pa.py_buffer(data)])
+
+
+def mask_bitmap(mask: Any) -> int:
+    """Return the set bits of an Arrow boolean array without nulls."""
+    if not len(mask):
+        return 0
+    data = mask.buffers()[1]
+    return (int.from_bytes(data, "little") >> mask.offset) & full_bitmap(len(mask))
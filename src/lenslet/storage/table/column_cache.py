@@ -0,0 +1,407 @@
+"""Workspace persistence for table row stores and derived column-store columns.
+
+Canonical identities, search haystacks, metric columns, and categorical
+columns are the costly part of `TableColumnStore.build`. They are saved as an
+uncompressed Arrow IPC file so a later launch of the same table memory-maps
+the metric buffers instead of rebuilding them row by row.
+
+The row store itself is saved next to them: its string blobs, offset and ID
+arrays, slot maps, folder tables, and path order, together with the launch
+state the scan derived from the source column. A later launch of an
+unchanged remote table restores it without reading the identity and media
+columns of the Parquet source again; only the path hash index is rebuilt,
+because it depends on the process's string hashes.
+
+A cache directory belongs to one table's workspace, so it keeps a single
+snapshot: each successful write removes the snapshots of earlier source
+generations, and a changed table costs one file rather than one per reload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+from ...atomic_write import atomic_write_path
+from .pyarrow_runtime import load_pyarrow_runtime
+from .query_engine import TableColumnStore
+from .row_columns import (
+    BasenameDefaultColumn,
+    CodedColumn,
+    FolderPathColumn,
+    OptionalAliasColumn,
+    PrefixedPathColumn,
+    StringColumn,
+)
+from .row_store import TableRowStore
+
+
+_CACHE_VERSION = 1
+_ROW_STORE_CACHE_VERSION = 1
+_METADATA_KEY = b"lenslet.column_store"
+_ROW_STORE_METADATA_KEY = b"lenslet.row_store"
+_ROW_STORE_SUFFIX = ".rows.arrow"
+
+
+@dataclass(frozen=True, slots=True)
+class TableRowStoreSnapshot:
+    """A persisted row store and the launch state its scan derived."""
+
+    store: TableRowStore
+    root: str | None
+    source_column: str
+    row_count: int
+    allow_local: bool
+    skip_dimension_probe: bool
+    source_kind: str | None
+    s3_prefixes: dict[str, str] = field(default_factory=dict)
+    s3_use_bucket: bool = False
+    local_prefix: str | None = None
+    path_column_aliases_source: bool = False
+    extensionless_source_trust_scope: str | None = None
+    source_column_warning: str | None = None
+    skipped_local: tuple[int, int, int, int] = (0, 0, 0, 0)
+
+
+def table_column_cache_identity(
+    *,
+    source_generation: str,
+    metric_keys: tuple[str, ...],
+    categorical_keys: tuple[str, ...],
+    include_source_in_search: bool,
+) -> dict[str, Any]:
+    return {
+        "version": _CACHE_VERSION,
+        "source_generation": source_generation,
+        "metric_keys": list(metric_keys),
+        "categorical_keys": list(categorical_keys),
+        "include_source_in_search": include_source_in_search,
+    }
+
+
+def table_row_store_cache_identity(
+    *,
+    source_generation: str,
+    columns: list[str] | None,
+    source_column: str | None,
+    path_column: str | None,
+    categorical_keys: tuple[str, ...],
+    base_dir: str | None,
+    auto_detect_root: bool,
+    skip_dimension_probe: bool,
+) -> dict[str, Any]:
+    return {
+        "version": _ROW_STORE_CACHE_VERSION,
+        "source_generation": source_generation,
+        "columns": columns,
+        "source_column": source_column,
+        "path_column": path_column,
+        "categorical_keys": list(categorical_keys),
+        "base_dir": base_dir,
+        "auto_detect_root": auto_detect_root,
+        "skip_dimension_probe": skip_dimension_probe,
+    }
+
+
+def column_cache_path(cache_dir: Path, identity: dict[str, Any], suffix: str = ".arrow") -> Path:
+    digest = hashlib.sha256(
+        repr(sorted(identity.items())).encode("utf-8")
+    ).hexdigest()
+    return cache_dir / digest[:2] / f"{digest}{suffix}"
+
+
+def load_column_store(
+    cache_dir: Path | None,
+    identity: dict[str, Any] | None,
+    row_store: TableRowStore,
+) -> TableColumnStore | None:
+    if cache_dir is None or identity is None:
+        return None
+    path = column_cache_path(cache_dir, identity)
+    if not path.exists():
+        return None
+    pa = load_pyarrow_runtime().pyarrow
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+    metadata = table.schema.metadata or {}
+    try:
+        saved = json.loads(metadata.get(_METADATA_KEY, b"null"))
+    except ValueError:
+        return None
+    if not isinstance(saved, dict) or saved.get("identity") != identity:
+        return None
+    metric_keys = saved.get("metric_keys")
+    categorical_keys = saved.get("categorical_keys")
+    if not isinstance(metric_keys, list) or not isinstance(categorical_keys, list):
+        return None
+    expected_columns = ["path", "identity", "search_text"] + [
+        f"metric_{index}" for index in range(len(metric_keys))
+    ] + [f"categorical_{index}" for index in range(len(categorical_keys))]
+    if table.column_names != expected_columns:
+        return None
+    if table.column("path").to_pylist() != list(row_store.paths):
+        return None
+
+    metrics: dict[str, memoryview] = {}
+    for index, key in enumerate(metric_keys):
+        values = table.column(f"metric_{index}").combine_chunks()
+        if values.null_count:
+            return None
+        data = memoryview(values.buffers()[1]).cast("B")
+        metrics[key] = data[values.offset * 8:(values.offset + len(values)) * 8].cast("d")
+    categoricals = {
+        key: tuple(table.column(f"categorical_{index}").to_pylist())
+        for index, key in enumerate(categorical_keys)
+    }
+    return TableColumnStore.from_persisted(
+        row_store,
+        source_generation=identity["source_generation"],
+        stable_identities=tuple(table.column("identity").to_pylist()),
+        static_search_text=tuple(table.column("search_text").to_pylist()),
+        metrics=metrics,
+        categoricals=categoricals,
+        include_source_in_search=identity["include_source_in_search"],
+    )
+
+
+def write_column_store(
+    cache_dir: Path | None,
+    identity: dict[str, Any] | None,
+    columns: TableColumnStore,
+) -> bool:
+    if cache_dir is None or identity is None:
+        return False
+    pa = load_pyarrow_runtime().pyarrow
+    arrays: dict[str, Any] = {
+        "path": pa.array(columns.paths, type=pa.large_string()),
+        "identity": pa.array(columns.stable_identities, type=pa.large_string()),
+        "search_text": pa.array(columns.static_search_text, type=pa.large_string()),
+    }
+    metric_keys = list(columns.metrics)
+    categorical_keys = list(columns.categoricals)
+    for index, key in enumerate(metric_keys):
+        values = columns.metrics[key]._values
+        arrays[f"metric_{index}"] = pa.Array.from_buffers(
+            pa.float64(),
+            len(values),
+            [None, pa.py_buffer(values)],
+        )
+    for index, key in enumerate(categorical_keys):
+        arrays[f"categorical_{index}"] = pa.array(
+            columns.categoricals[key],
+            type=pa.large_string(),
+        ).dictionary_encode()
+    saved = {
+        "identity": identity,
+        "metric_keys": metric_keys,
+        "categorical_keys": categorical_keys,
+    }
+    table = pa.table(arrays).replace_schema_metadata({
+        _METADATA_KEY: json.dumps(saved, sort_keys=True).encode("utf-8"),
+    })
+
+    def _write(tmp_path: Path) -> None:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    path = column_cache_path(cache_dir, identity)
+    try:
+        atomic_write_path(path, _write)
+    except (OSError, pa.ArrowException):
+        return False
+    _remove_stale_snapshots(cache_dir, keep=path)
+    return True
+
+
+def load_row_store(
+    cache_dir: Path | None,
+    identity: dict[str, Any] | None,
+) -> TableRowStoreSnapshot | None:
+    if cache_dir is None or identity is None:
+        return None
+    path = column_cache_path(cache_dir, identity, _ROW_STORE_SUFFIX)
+    if not path.exists():
+        return None
+    pa = load_pyarrow_runtime().pyarrow
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        saved = json.loads((table.schema.metadata or {}).get(_ROW_STORE_METADATA_KEY, b"null"))
+        if not isinstance(saved, dict) or saved.get("identity") != identity:
+            return None
+        return _row_store_snapshot(table, saved)
+    except (OSError, pa.ArrowException, AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def write_row_store(
+    cache_dir: Path | None,
+    identity: dict[str, Any] | None,
+    snapshot: TableRowStoreSnapshot,
+) -> bool:
+    if cache_dir is None or identity is None:
+        return False
+    pa = load_pyarrow_runtime().pyarrow
+    store = snapshot.store
+    folder_keys = list(store.folder_rows)
+    buffers: dict[str, Any] = {
+        "row_indices": store.row_indices,
+        "path_folder_ids": store.paths._folder_ids,
+        "path_basenames": store.paths._basenames._blob,
+        "path_basename_ends": store.paths._basenames._ends,
+        "source_prefix_ids": store.sources._prefix_ids,
+        "source_tails": store.sources._tails._blob,
+        "source_tail_ends": store.sources._tails._ends,
+        "names": store.names._values._blob,
+        "name_ends": store.names._values._ends,
+        "mime_codes": store.mimes._codes,
+        "widths": store.widths,
+        "heights": store.heights,
+        "sizes": store.sizes,
+        "mtimes": store.mtimes,
+        "url_present": store.urls._present,
+        "sorted_slots": store.sorted_paths._order,
+        "folder_rows": _concat_arrays(store.folder_rows[key] for key in folder_keys),
+        "folder_row_ends": array("q", accumulate(len(store.folder_rows[key]) for key in folder_keys)),
+    }
+    if store.row_to_slot is not None:
+        buffers["row_to_slot"] = store.row_to_slot
+    state = {item.name: getattr(snapshot, item.name) for item in fields(snapshot) if item.name != "store"}
+    saved = {
+        "identity": identity,
+        "state": state,
+        "row_count": store.row_count,
+        "typecodes": {
+            name: values.typecode for name, values in buffers.items() if isinstance(values, array)
+        },
+        "folders": store.paths._folders,
+        "source_prefixes": store.sources._prefixes,
+        "name_empty": sorted(store.names._empty),
+        "mimes": store.mimes._values,
+        "folder_keys": folder_keys,
+        "folder_children": store.folder_children,
+    }
+    table = pa.table({
+        name: pa.Array.from_buffers(
+            pa.large_binary(),
+            1,
+            [None, pa.py_buffer(array("q", [0, len(values) * getattr(values, "itemsize", 1)])), pa.py_buffer(values)],
+        )
+        for name, values in buffers.items()
+    }).replace_schema_metadata({
+        _ROW_STORE_METADATA_KEY: json.dumps(saved, sort_keys=True).encode("utf-8"),
+    })
+
+    def _write(tmp_path: Path) -> None:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    path = column_cache_path(cache_dir, identity, _ROW_STORE_SUFFIX)
+    try:
+        atomic_write_path(path, _write)
+    except (OSError, pa.ArrowException):
+        return False
+    _remove_stale_snapshots(cache_dir, keep=path)
+    return True
+
+
+def _row_store_snapshot(table: Any, saved: dict[str, Any]) -> TableRowStoreSnapshot | None:
+    typecodes = saved["typecodes"]
+
+    def buffer(name: str) -> Any:
+        return table.column(name)[0].as_buffer()
+
+    def values(name: str) -> array[Any]:
+        result = array(typecodes[name])
+        result.frombytes(buffer(name))
+        return result
+
+    def strings(name: str, ends: str) -> StringColumn:
+        return StringColumn(buffer(name), values(ends))
+
+    row_count = int(saved["row_count"])
+    row_indices = values("row_indices")
+    paths = FolderPathColumn(
+        saved["folders"],
+        values("path_folder_ids"),
+        strings("path_basenames", "path_basename_ends"),
+    )
+    sources = PrefixedPathColumn(
+        paths,
+        (tuple(prefix) for prefix in saved["source_prefixes"]),
+        values("source_prefix_ids"),
+        strings("source_tails", "source_tail_ends"),
+    )
+    names = BasenameDefaultColumn(paths, strings("names", "name_ends"), saved["name_empty"])
+    mimes: CodedColumn[Any] = CodedColumn(saved["mimes"], buffer("mime_codes"))
+    widths = values("widths")
+    heights = values("heights")
+    sizes = values("sizes")
+    mtimes = values("mtimes")
+    urls = OptionalAliasColumn(sources, buffer("url_present"))
+    sorted_slots = values("sorted_slots")
+    slot_columns = (paths, sources, names, mimes, widths, heights, sizes, mtimes, urls, sorted_slots)
+    if any(len(column) != len(row_indices) for column in slot_columns):
+        return None
+    row_to_slot = values("row_to_slot") if "row_to_slot" in typecodes else None
+    if row_to_slot is not None and len(row_to_slot) != row_count:
+        return None
+    folder_rows: dict[str, array[int]] = {}
+    folder_values = values("folder_rows")
+    start = 0
+    for key, end in zip(saved["folder_keys"], values("folder_row_ends")):
+        folder_rows[key] = folder_values[start:end]
+        start = end
+    state = dict(saved["state"])
+    state["skipped_local"] = tuple(state["skipped_local"])
+    store = TableRowStore.assemble(
+        row_count=row_count,
+        row_indices=row_indices,
+        paths=paths,
+        sources=sources,
+        names=names,
+        mimes=mimes,
+        widths=widths,
+        heights=heights,
+        sizes=sizes,
+        mtimes=mtimes,
+        urls=urls,
+        row_to_slot=row_to_slot,
+        folder_rows=folder_rows,
+        folder_children={key: tuple(children) for key, children in saved["folder_children"].items()},
+        sorted_slots=sorted_slots,
+    )
+    return TableRowStoreSnapshot(store=store, **state)
+
+
+def _concat_arrays(parts: Iterable[array[int]]) -> array[int]:
+    result = array("i")
+    for part in parts:
+        result.extend(part)
+    return result
+
+
+def _remove_stale_snapshots(cache_dir: Path, *, keep: Path) -> None:
+    # Row-store and column-store snapshots share the directory; each kind keeps its own.
+    keeps_row_store = keep.name.endswith(_ROW_STORE_SUFFIX)
+    for stale in cache_dir.glob("*/*.arrow"):
+        if stale == keep or stale.name.endswith(_ROW_STORE_SUFFIX) != keeps_row_store:
+            continue
+        try:
+            stale.unlink()
+            stale.parent.rmdir()
+        except OSError:
+            # A non-empty shard directory or a concurrent cleanup is fine.
+            continue
+
@@ -7,6 +7,7 @@ from typing import Any, Iterable
 
 from ...atomic_write import atomic_write_json
 from .index_types import TableCachedRowDimensions
+from .parquet_dataset import resolve_parquet_dataset
 
 
 _CACHE_VERSION = 1
@@ -29,14 +30,16 @@ def table_dimension_cache_identity(
     base_dir: str | None,
     workspace_cache_dir: Path,
 ) -> dict[str, Any]:
-    stat = parquet_path.stat()
+    dataset = resolve_parquet_dataset(parquet_path)
+    files = (parquet_path,) if dataset is None else dataset.files
+    stats = [file.stat() for file in files]
     schema_text = str(schema)
     workspace_id = str(workspace_cache_dir.resolve())
-    return {
+    identity = {
         "version": _CACHE_VERSION,
         "parquet_path": str(parquet_path.resolve()),
-        "parquet_size": stat.st_size,
-        "parquet_mtime_ns": stat.st_mtime_ns,
+        "parquet_size": sum(stat.st_size for stat in stats),
+        "parquet_mtime_ns": max(stat.st_mtime_ns for stat in stats),
         "schema_hash": hashlib.sha256(schema_text.encode("utf-8")).hexdigest(),
         "row_count": int(row_count),
         "source_column": source_column,
@@ -45,6 +48,15 @@ def table_dimension_cache_identity(
         "base_dir": base_dir,
         "workspace_id": workspace_id,
     }
+    if dataset is not None:
+        # Row IDs follow shard order, so the shard list is part of the identity.
+        identity["parquet_files"] = hashlib.sha256(
+            "\n".join(
+                f"{file}:{stat.st_size}:{stat.st_mtime_ns}"
+                for file, stat in zip(files, stats)
+            ).encode("utf-8")
+        ).hexdigest()
+    return identity
 
 
 def dimension_cache_path(cache_dir: Path, identity: dict[str, Any]) -> Path:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import Counter
 from typing import Any, Iterable
 
 from ...browse.query import (
@@ -40,16 +39,13 @@ def build_table_query_facet_summary(
     categorical_key_list = list(categorical_keys)
 
     with request_phase("facet"):
-        metric_values = {
-            key: list(engine.iter_metric_values(analysis, key))
-            for key in metric_key_list
-        }
+        metric_histograms = engine.metric_histograms(analysis, metric_key_list, bins)
         categorical_counts = {
-            key: Counter(engine.iter_categorical_values(analysis, key))
+            key: engine.categorical_counts(analysis, key)
             for key in categorical_key_list
         }
 
-        metric_keys_out = sorted(metric_values)
+        metric_keys_out = sorted(metric_histograms)
         categorical_keys_out = sorted(categorical_counts)
         return {
             "version": 1,
@@ -67,11 +63,11 @@ def build_table_query_facet_summary(
             "categorical_keys": categorical_keys_out,
             "metrics": {
                 key: {
-                    "histogram": histogram_summary(values, bins),
+                    "histogram": histogram,
                     "categories": [],
                 }
-                for key, values in metric_values.items()
-                if values
+                for key, histogram in metric_histograms.items()
+                if histogram is not None
             },
             "categoricals": {
                 key: {
@@ -88,23 +84,3 @@ def build_table_query_facet_summary(
             },
         }
 
-
-def histogram_summary(values: list[float], bins: int) -> dict[str, Any] | None:
-    if not values:
-        return None
-    safe_bins = max(1, bins)
-    min_value = min(values)
-    max_value = max(values)
-    if min_value == max_value:
-        max_value = min_value + 1
-    counts = [0] * safe_bins
-    scale = safe_bins / (max_value - min_value)
-    for value in values:
-        idx = max(0, min(safe_bins - 1, int((value - min_value) * scale)))
-        counts[idx] += 1
-    return {
-        "bins": counts,
-        "min": min_value,
-        "max": max_value,
-        "count": len(values),
-    }
@@ -0,0 +1,140 @@
+"""Generation-scoped table storage state and per-request generation pins.
+
+Everything a `TableStorage` derives from one snapshot of its source lives on
+a `TableGeneration`, reached through `GenerationField` descriptors. A source
+reload publishes its successor with one reference assignment, so a reader
+never sees half of one generation and half of the next.
+
+A reader that makes several reads still needs them to come from the same
+generation. Inside `pinned_table_generations()` the first read of a storage
+pins the generation it found, and every later read in that context (and in
+the threads and tasks it spawns) sees that same generation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_PINNED_GENERATIONS: ContextVar[dict[Any, TableGeneration] | None] = ContextVar(
+    "lenslet_pinned_table_generations",
+    default=None,
+)
+
+# State derived from one source snapshot; a reload replaces all of it at once.
+TABLE_GENERATION_FIELDS = (
+    "_source_catalog",
+    "_index_state",
+    "_items",
+    "_source_paths",
+    "_dimensions",
+    "_row_index_state",
+    "_row_dimensions",
+    "_path_to_row",
+    "_row_to_path",
+    "_row_field_provider",
+    "_row_field_provider_error_logged",
+    "_categorical_columns",
+    "_categorical_row_provider",
+    "_browse_signature_seed",
+    "_dimension_overrides",
+    "_launch_warnings",
+    "_source_refresh_tracker",
+    "_last_skipped_rows",
+    "_indexes",
+    "_row_store",
+    "_generated_at",
+    "_search_columns",
+    "_path_column_aliases_source",
+    "_columns",
+    "_data",
+    "_row_count",
+    "_source_column_warning",
+    "_source_column",
+    "_source_kind",
+    "_s3_prefixes",
+    "_s3_use_bucket",
+    "_local_prefix",
+    "_path_column",
+    "_name_column",
+    "_mime_column",
+    "_width_column",
+    "_height_column",
+    "_size_column",
+    "_mtime_column",
+    "_metrics_column",
+    "_extensionless_source_trust_scope",
+    "_index_context",
+    "_index_columns",
+    "_metric_column_names",
+    "_metric_keys",
+    "_browse_signature",
+    "_table_query_engine",
+)
+
+
+class TableGeneration:
+    """State of one table storage generation.
+
+    A generation is filled while its storage is built and is never swapped
+    piecemeal afterwards; only caches derived from its own data are added
+    lazily.
+    """
+
+
+class GenerationField:
+    """Data descriptor that stores one attribute on the readable generation."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, storage: Any, owner: type | None = None) -> Any:
+        if storage is None:
+            return self
+        try:
+            return readable_generation(storage).__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, storage: Any, value: Any) -> None:
+        readable_generation(storage).__dict__[self.name] = value
+
+
+def install_generation_fields(cls: type, names: Iterable[str] = TABLE_GENERATION_FIELDS) -> None:
+    """Route the named attributes of `cls` instances through their generation."""
+    for name in names:
+        setattr(cls, name, GenerationField(name))
+
+
+def readable_generation(storage: Any) -> TableGeneration:
+    """Return the generation `storage` readers see, pinning it in a pinned context."""
+    current = storage.__dict__["_generation"]
+    pins = _PINNED_GENERATIONS.get()
+    if pins is None:
+        return current
+    return pins.setdefault(storage, current)
+
+
+@contextmanager
+def pinned_table_generations(
+    pins: dict[Any, TableGeneration] | None = None,
+) -> Iterator[dict[Any, TableGeneration]]:
+    """Pin each storage to the first generation read within this context.
+
+    Nested calls without `pins` keep the enclosing pins.
+    """
+    if pins is None:
+        enclosing = _PINNED_GENERATIONS.get()
+        if enclosing is not None:
+            yield enclosing
+            return
+        pins = {}
+    token = _PINNED_GENERATIONS.set(pins)
+    try:
+        yield pins
+    finally:
+        _PINNED_GENERATIONS.reset(token)
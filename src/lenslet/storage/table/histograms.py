@@ -0,0 +1,69 @@
+"""Fixed-bin metric histograms for facet summaries.
+
+`histogram_summary` is the reference row-at-a-time form. `histogram_summary_array`
+computes the same bins over an Arrow float64 array with vectorized min/max and
+bin counting, repeating the reference arithmetic so the counts match exactly.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .pyarrow_runtime import load_pyarrow_runtime
+
+
+def histogram_summary(values: list[float], bins: int) -> dict[str, Any] | None:
+    if not values:
+        return None
+    safe_bins = max(1, bins)
+    min_value = min(values)
+    max_value = max(values)
+    if min_value == max_value:
+        max_value = min_value + 1
+    counts = [0] * safe_bins
+    scale = safe_bins / (max_value - min_value)
+    for value in values:
+        idx = max(0, min(safe_bins - 1, int((value - min_value) * scale)))
+        counts[idx] += 1
+    return {
+        "bins": counts,
+        "min": min_value,
+        "max": max_value,
+        "count": len(values),
+    }
+
+
+def histogram_summary_array(values: Any, bins: int) -> dict[str, Any] | None:
+    """Return `histogram_summary` of a float64 Arrow array, skipping nulls and NaN."""
+    pa = load_pyarrow_runtime().pyarrow
+    import pyarrow.compute as pc
+
+    values = values.filter(pc.invert(pc.is_nan(values)))
+    if not len(values):
+        return None
+    safe_bins = max(1, bins)
+    bounds = pc.min_max(values)
+    min_value = bounds["min"].as_py()
+    max_value = bounds["max"].as_py()
+    if min_value == max_value:
+        max_value = min_value + 1
+    scale = safe_bins / (max_value - min_value)
+    # Offsets are never negative, so flooring truncates exactly like `int()`.
+    offsets = pc.multiply(pc.subtract(values, pa.scalar(min_value)), pa.scalar(scale))
+    indices = pc.min_element_wise(
+        pc.floor(offsets).cast(pa.int64()),
+        pa.scalar(safe_bins - 1, pa.int64()),
+    )
+    counts = [0] * safe_bins
+    tallies = pc.value_counts(indices)
+    for index, count in zip(
+        tallies.field("values").to_pylist(),
+        tallies.field("counts").to_pylist(),
+    ):
+        counts[index] = count
+    return {
+        "bins": counts,
+        "min": min_value,
+        "max": max_value,
+        "count": len(values),
+    }
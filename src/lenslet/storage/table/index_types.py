@@ -54,6 +54,7 @@ class TableIndexPolicy:
     allow_local: bool
     skip_dimension_probe: bool
     skip_local_realpath_validation: bool
+    scan_workers: int = 1
 
 
 @dataclass(frozen=True, slots=True)
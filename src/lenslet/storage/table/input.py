@@ -136,7 +136,9 @@ def _startup_column_values(values: Any) -> Any:
                 return to_numpy(zero_copy_only=False)
             except Exception:
                 pass
-    return values.to_pylist()
+    to_pylist = getattr(values, "to_pylist", None)
+    # Columns streamed from Parquet have no `to_pylist` and stay on disk.
+    return to_pylist() if callable(to_pylist) else values
 
 
 def _null_free_numeric_arrow_column(values: Any) -> bool:
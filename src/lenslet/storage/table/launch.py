@@ -4,7 +4,7 @@ import logging
 import os
 from collections import OrderedDict
 from bisect import bisect_right
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from threading import RLock
 from typing import TYPE_CHECKING, Any, Callable, TypeAlias
@@ -22,7 +22,11 @@ from .dimension_cache import (
     table_dimension_cache_identity,
     write_dimension_cache,
 )
+from .column_cache import TableRowStoreSnapshot, load_row_store, table_row_store_cache_identity
 from .index import is_formula_metric_column_name
+from .index_types import TableCachedRowDimensions
+from .parquet_columns import ParquetColumnReader, StreamedParquetTable, column_values
+from .parquet_dataset import ParquetDataset, parquet_dataset_root, resolve_parquet_dataset
 from .launch_sources import (
     detect_source_column,
     is_safe_auto_root,
@@ -37,6 +41,7 @@ from .source_refresh import (
     TableSourceChangedError,
     TableSourceRefreshTracker,
 )
+from .source_reload import carry_dimension_overrides
 
 if TYPE_CHECKING:
     from ...embeddings.detect import EmbeddingDetection as EmbeddingDetectionType
@@ -141,10 +146,12 @@ class TableLaunchRequest:
     skip_dimension_probe: bool
     path_column: str | None = None
     dimension_cache_dir: Path | None = None
+    column_cache_dir: Path | None = None
     embedding_config: EmbeddingConfig | None = None
     auto_detect_root: bool = False
     thumb_size: int = 256
     thumb_quality: int = 70
+    carried_dimensions: tuple[TableCachedRowDimensions, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -193,7 +200,8 @@ class SourceDimensionCacheResult:
 
 def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
     parquet_path = request.parquet_path
-    source_refresh_tracker = TableSourceRefreshTracker.for_local_file(parquet_path)
+    dataset = resolve_parquet_dataset(parquet_path)
+    source_refresh_tracker = table_source_refresh_tracker(parquet_path, dataset)
     column_selection = select_embedding_columns(parquet_path, request.embedding_config)
     schema = column_selection.schema or load_parquet_schema(str(parquet_path))
     browse_columns = select_browse_columns(
@@ -201,12 +209,43 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
         request=request,
         schema=schema,
         readable_columns=column_selection.columns,
+        partition_columns=dataset.partition_keys if dataset is not None else (),
     )
-    table = load_parquet_table(str(parquet_path), columns=browse_columns.columns)
+    table = load_browse_table(parquet_path, dataset, schema, browse_columns)
+    table_is_projected = browse_columns.is_projected or isinstance(table, StreamedParquetTable)
     workspace_dimension_cache_enabled = request.dimension_cache_dir is not None
+    source_dimension_notices: tuple[TableLaunchNotice, ...] = ()
+    if dataset is not None and request.cache_dimensions:
+        # Shards are never rewritten; dimensions go to the workspace cache instead.
+        request = replace(request, cache_dimensions=False)
+        source_dimension_notices = (
+            TableLaunchNotice(
+                kind="dimensions_cache_unsupported",
+                message="[lenslet] Parquet datasets are not rewritten with width/height; "
+                "using the workspace dimension cache instead.",
+            ),
+        )
+    browse_signature_seed = parquet_browse_signature_seed(parquet_path)
+    row_store_cache_identity = (
+        table_row_store_cache_identity(
+            source_generation=browse_signature_seed,
+            columns=browse_columns.columns,
+            source_column=browse_columns.source_column or request.source_column,
+            path_column=request.path_column,
+            categorical_keys=browse_columns.categorical_columns,
+            base_dir=request.base_dir,
+            auto_detect_root=request.auto_detect_root,
+            skip_dimension_probe=request.skip_dimension_probe,
+        )
+        # Rewriting the source with dimensions changes its signature right away.
+        if request.column_cache_dir is not None and not request.cache_dimensions
+        else None
+    )
+    row_store_snapshot = load_row_store(request.column_cache_dir, row_store_cache_identity)
     dimensions = inspect_table_dimensions(
         table,
         count_missing=request.cache_dimensions or workspace_dimension_cache_enabled,
+        row_store_snapshot=row_store_snapshot,
     )
     dimension_probe_policy = resolve_dimension_probe_policy(
         cache_dimensions=request.cache_dimensions or workspace_dimension_cache_enabled,
@@ -219,6 +258,7 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
         source_column=browse_columns.source_column or request.source_column,
         base_dir=request.base_dir,
         auto_detect_root=request.auto_detect_root,
+        row_store_snapshot=row_store_snapshot,
     )
     dimension_cache_identity = (
         table_dimension_cache_identity(
@@ -238,6 +278,13 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
         request.dimension_cache_dir,
         dimension_cache_identity,
     )
+    carried_source_column = browse_columns.source_column or request.source_column
+    if request.carried_dimensions and carried_source_column in table.column_names:
+        dimension_overrides = carry_dimension_overrides(
+            dimension_overrides,
+            column_values(table.column(carried_source_column)),
+            request.carried_dimensions,
+        )
     categorical_row_provider = (
         ArrowTableRowFieldProvider(
             load_parquet_table(str(parquet_path), columns=list(browse_columns.categorical_columns))
@@ -257,11 +304,15 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
             table_field_columns=browse_columns.table_field_columns,
             categorical_columns=browse_columns.categorical_columns,
             categorical_row_provider=categorical_row_provider,
-            browse_signature_seed=parquet_browse_signature_seed(parquet_path),
+            browse_signature_seed=browse_signature_seed,
+            column_cache_dir=request.column_cache_dir,
+            row_store_cache_identity=row_store_cache_identity,
+            row_store_snapshot=row_store_snapshot,
             dimension_overrides=dimension_overrides,
             dimension_cache_policy=_dimension_cache_policy(request),
             dimension_write_policy=_dimension_write_policy(request),
             launch_warnings=tuple(notice.message for notice in (
+                *source_dimension_notices,
                 *column_selection.notices,
                 *dimension_probe_policy.notices,
                 *root_resolution.notices,
@@ -274,12 +325,13 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
         cache_dimensions=request.cache_dimensions,
         parquet_path=parquet_path,
         table=table,
-        table_is_projected=browse_columns.is_projected,
+        table_is_projected=table_is_projected,
         dimensions=dimensions,
         row_dims=storage.row_dimensions(),
         source_guard=source_refresh_tracker.ensure_current,
     )
     notices = [
+        *source_dimension_notices,
         *column_selection.notices,
         *dimension_probe_policy.notices,
         *root_resolution.notices,
@@ -287,11 +339,11 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
         *cache_workspace_dimensions(
             dimension_cache_dir=request.dimension_cache_dir,
             dimension_cache_identity=dimension_cache_identity,
-            rows=storage.dimension_cache_rows(),
+            rows=storage.dimension_cache_rows() if dimension_cache_identity is not None else [],
         ),
     ]
     if dimension_cache_result.rewritten_table is not None:
-        source_refresh_tracker = TableSourceRefreshTracker.for_local_file(parquet_path)
+        source_refresh_tracker = table_source_refresh_tracker(parquet_path, dataset)
         try:
             rewritten_source = load_parquet_table(str(parquet_path))
         except _table_schema_errors() as exc:
@@ -304,12 +356,15 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
         ):
             raise TableSourceChangedError(TABLE_SOURCE_CHANGED_MESSAGE)
     source_refresh_tracker.ensure_current()
-    if browse_columns.is_projected and browse_columns.table_field_columns:
+    if table_is_projected and browse_columns.table_field_columns:
         storage.set_row_field_provider(
-            ParquetRowFieldProvider(parquet_path, browse_columns.table_field_columns)
+            ParquetRowFieldProvider(parquet_path, browse_columns.table_field_columns, dataset=dataset)
         )
         source_refresh_tracker.ensure_current()
     storage.set_source_refresh_tracker(source_refresh_tracker)
+    # Embedding indexes map the row IDs captured at startup, so those tables still restart to reload.
+    if column_selection.detection is None or not column_selection.detection.available:
+        storage.set_source_reloader(lambda previous: reload_table_launch(request, previous))
 
     return TableLaunchResult(
         storage=storage,
@@ -320,6 +375,91 @@ def prepare_table_launch(request: TableLaunchRequest) -> TableLaunchResult:
     )
 
 
+def load_browse_table(
+    parquet_path: Path,
+    dataset: ParquetDataset | None,
+    schema: Any,
+    browse_columns: BrowseColumnSelection,
+) -> PyArrowTable:
+    """Load the browse columns, leaving identity and media columns on disk.
+
+    `TableStorage` reads those columns only in full passes while it builds the
+    row store, so they are streamed from the source rather than held as Arrow
+    arrays for the life of the storage.
+    """
+    selected = browse_columns.columns
+    if browse_columns.source_column is None or selected is None:
+        return load_parquet_table(str(parquet_path), columns=selected)
+    streamed = [
+        column
+        for column in (
+            browse_columns.source_column,
+            browse_columns.path_column,
+            *(
+                resolve_named_column(selected, candidates)
+                for candidates in (
+                    _NAME_COLUMNS,
+                    _MIME_COLUMNS,
+                    _WIDTH_COLUMNS,
+                    _HEIGHT_COLUMNS,
+                    _SIZE_COLUMNS,
+                    _MTIME_COLUMNS,
+                )
+            ),
+        )
+        if column is not None and column in selected
+    ]
+    retained = load_parquet_table(
+        str(parquet_path),
+        columns=[column for column in selected if column not in streamed],
+    )
+    pyarrow, _parquet = require_pyarrow()
+    reader = ParquetColumnReader(parquet_path, dataset=dataset)
+    return StreamedParquetTable(
+        retained,
+        reader.columns(list(dict.fromkeys(streamed))),
+        pyarrow.schema([schema.field(column) for column in selected]),
+    )
+
+
+def table_source_refresh_tracker(
+    parquet_path: Path,
+    dataset: ParquetDataset | None,
+) -> TableSourceRefreshTracker:
+    if dataset is None:
+        return TableSourceRefreshTracker.for_local_file(parquet_path)
+
+    def discover() -> tuple[Path, ...]:
+        current = resolve_parquet_dataset(parquet_path)
+        return current.files if current is not None else (parquet_path.absolute(),)
+
+    return TableSourceRefreshTracker.for_local_files(dataset.files, discover=discover)
+
+
+def reload_table_launch(request: TableLaunchRequest, previous: TableStorage) -> TableStorage:
+    """Build the storage for a changed source from the request that launched `previous`.
+
+    The reload keeps the live source column and local root, never rewrites
+    the source with dimensions, and seeds dimensions already known for
+    unchanged sources so they are not probed again.
+    """
+    result = prepare_table_launch(
+        replace(
+            request,
+            source_column=previous.source_column,
+            base_dir=previous.root or request.base_dir,
+            auto_detect_root=False,
+            cache_dimensions=False,
+            carried_dimensions=tuple(dims for _row_idx, dims in previous.dimension_cache_rows()),
+        )
+    )
+    return result.storage
+
+
+def default_table_root(parquet_path: Path) -> str:
+    return os.path.abspath(str(parquet_dataset_root(parquet_path)))
+
+
 def _dimension_cache_policy(request: TableLaunchRequest) -> str:
     if request.cache_dimensions:
         return "source"
@@ -371,6 +511,7 @@ def select_browse_columns(
     request: TableLaunchRequest,
     schema: Any,
     readable_columns: list[str] | None,
+    partition_columns: tuple[str, ...] = (),
 ) -> BrowseColumnSelection:
     schema_names = list(schema.names)
     readable = set(readable_columns) if readable_columns is not None else set(schema_names)
@@ -438,6 +579,7 @@ def select_browse_columns(
         source_column=source_column,
         path_column=path_column,
         table_field_columns=tuple(table_field_columns),
+        partition_columns=partition_columns,
     )
 
     return BrowseColumnSelection(
@@ -460,7 +602,7 @@ def resolve_launch_source_column(
         if resolved is None:
             raise ValueError(f"source column '{request.source_column}' not found")
         return resolved
-    default_root = os.path.abspath(str(parquet_path.parent))
+    default_root = default_table_root(parquet_path)
     return detect_source_column(str(parquet_path), request.base_dir or default_root)
 
 
@@ -486,18 +628,22 @@ def select_source_candidate_columns(
     if not candidate_columns:
         return ()
     try:
-        parquet = require_pyarrow_parquet()
-        parquet_file = parquet.ParquetFile(str(parquet_path))
-        batch = next(
-            parquet_file.iter_batches(batch_size=sample_size, columns=candidate_columns),
-            None,
-        )
+        dataset = resolve_parquet_dataset(parquet_path)
+        if dataset is not None:
+            batch = dataset.head(sample_size, columns=candidate_columns)
+        else:
+            parquet = require_pyarrow_parquet()
+            parquet_file = parquet.ParquetFile(str(parquet_path))
+            batch = next(
+                parquet_file.iter_batches(batch_size=sample_size, columns=candidate_columns),
+                None,
+            )
     except _table_schema_errors():
         return ()
     if batch is None or getattr(batch, "num_rows", 0) == 0:
         return ()
 
-    default_root = os.path.abspath(str(parquet_path.parent))
+    default_root = default_table_root(parquet_path)
     base_dir = request.base_dir or default_root
     candidates: list[tuple[float, str]] = []
     for column in candidate_columns:
@@ -626,13 +772,17 @@ def select_categorical_columns(
     source_column: str,
     path_column: str | None,
     table_field_columns: tuple[str, ...],
+    partition_columns: tuple[str, ...] = (),
     max_unique_values: int = CATEGORICAL_MAX_UNIQUE_VALUES,
 ) -> tuple[str, ...]:
+    # Partition values are constant per shard, so they are categorical by construction.
+    partitions = [column for column in table_field_columns if column in partition_columns and column in readable]
     candidates = [
         column
         for column in table_field_columns
         if (
-            column in readable
+            column not in partitions
+            and column in readable
             and column not in _duplicate_display_columns(
                 source_column=source_column,
                 path_column=path_column,
@@ -649,17 +799,16 @@ def select_categorical_columns(
         )
     ]
     if not candidates:
-        return ()
+        return tuple(partitions)
 
     try:
-        _pyarrow, parquet = require_pyarrow()
         import pyarrow.compute as compute
 
-        categorical_table = parquet.read_table(str(parquet_path), columns=candidates)
+        categorical_table = load_parquet_table(str(parquet_path), columns=candidates)
     except _table_schema_errors():
-        return ()
+        return tuple(partitions)
 
-    selected: list[str] = []
+    selected: list[str] = list(partitions)
     for column in candidates:
         if is_boolean_browse_column(schema, column) or arrow_array_has_low_cardinality(
             categorical_table[column],
@@ -672,6 +821,12 @@ def select_categorical_columns(
 
 
 def parquet_browse_signature_seed(parquet_path: Path) -> str:
+    try:
+        dataset = resolve_parquet_dataset(parquet_path)
+    except _table_schema_errors():
+        return str(parquet_path)
+    if dataset is not None:
+        return ";".join(parquet_browse_signature_seed(file) for file in dataset.files)
     try:
         stat = parquet_path.stat()
     except OSError:
@@ -679,11 +834,22 @@ def parquet_browse_signature_seed(parquet_path: Path) -> str:
     return f"{parquet_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
 
 
-def inspect_table_dimensions(table: PyArrowTable, *, count_missing: bool = True) -> TableDimensionState:
+def inspect_table_dimensions(
+    table: PyArrowTable,
+    *,
+    count_missing: bool = True,
+    row_store_snapshot: TableRowStoreSnapshot | None = None,
+) -> TableDimensionState:
     width_name = find_dimension_column(table, "width")
     height_name = find_dimension_column(table, "height")
     if not count_missing:
         missing_count = 0 if width_name and height_name else table.num_rows
+    elif row_store_snapshot is not None:
+        # A restored row store already holds every dimension the scan found.
+        store = row_store_snapshot.store
+        missing_count = sum(
+            1 for width, height in zip(store.widths, store.heights) if width <= 0 or height <= 0
+        )
     else:
         missing_count = count_missing_dimensions(table, width_name, height_name)
     return TableDimensionState(
@@ -720,15 +886,20 @@ def resolve_launch_root(
     source_column: str | None,
     base_dir: str | None,
     auto_detect_root: bool,
+    row_store_snapshot: TableRowStoreSnapshot | None = None,
 ) -> TableRootResolution:
-    effective_root = resolve_table_root(
-        parquet_path=parquet_path,
-        table=table,
-        source_column=source_column,
-        base_dir=base_dir,
-        auto_detect_root=auto_detect_root,
+    effective_root = (
+        row_store_snapshot.root
+        if row_store_snapshot is not None
+        else resolve_table_root(
+            parquet_path=parquet_path,
+            table=table,
+            source_column=source_column,
+            base_dir=base_dir,
+            auto_detect_root=auto_detect_root,
+        )
     )
-    default_root = os.path.abspath(str(parquet_path.parent))
+    default_root = default_table_root(parquet_path)
     notices: tuple[TableLaunchNotice, ...] = ()
     if auto_detect_root and base_dir is None and effective_root and effective_root != default_root:
         notices = (
@@ -819,7 +990,7 @@ def resolve_table_root(
     if base_dir:
         return os.path.abspath(base_dir)
 
-    default_root = os.path.abspath(str(parquet_path.parent))
+    default_root = default_table_root(parquet_path)
     if not auto_detect_root:
         return default_root
 
@@ -858,8 +1029,8 @@ def find_dimension_column(table: PyArrowTable, target: str) -> str | None:
 def count_missing_dimensions(table: PyArrowTable, width_name: str | None, height_name: str | None) -> int:
     if width_name is None or height_name is None:
         return table.num_rows
-    width = table[width_name].to_pylist()
-    height = table[height_name].to_pylist()
+    width = column_values(table[width_name])
+    height = column_values(table[height_name])
     missing = 0
     for w, h in zip(width, height):
         if not valid_dimension(w) or not valid_dimension(h):
@@ -948,11 +1119,19 @@ def write_missing_dimensions(
 
 
 class ParquetRowFieldProvider:
-    def __init__(self, parquet_path: Path, columns: tuple[str, ...]) -> None:
+    def __init__(
+        self,
+        parquet_path: Path,
+        columns: tuple[str, ...],
+        *,
+        dataset: ParquetDataset | None = None,
+    ) -> None:
         _pyarrow, parquet = require_pyarrow()
         self._parquet_path = parquet_path
-        self._parquet_file = parquet.ParquetFile(str(parquet_path))
+        self._dataset = dataset
+        self._parquet_file = parquet.ParquetFile(str(parquet_path)) if dataset is None else None
         self._columns = list(columns)
+        self._row_groups: list[tuple[int, int]] = []
         self._row_group_starts = self._build_row_group_starts()
         self._row_group_cache: OrderedDict[int, dict[str, list[Any]]] = OrderedDict()
         self._failed_row_groups: set[int] = set()
@@ -963,15 +1142,31 @@ class ParquetRowFieldProvider:
         self._source_refresh_tracker = tracker
 
     def _build_row_group_starts(self) -> list[int]:
+        if self._dataset is not None:
+            group_rows = self._dataset.row_group_rows
+        else:
+            metadata = self._parquet_file.metadata
+            if metadata is None:
+                self._row_groups = [(0, 0)]
+                return [0]
+            group_rows = (tuple(metadata.row_group(idx).num_rows for idx in range(metadata.num_row_groups)),)
         starts: list[int] = []
         total = 0
-        metadata = self._parquet_file.metadata
-        if metadata is None:
+        for file_index, rows in enumerate(group_rows):
+            for group, num_rows in enumerate(rows):
+                self._row_groups.append((file_index, group))
+                starts.append(total)
+                total += num_rows
+        if not starts:
+            self._row_groups = [(0, 0)]
             return [0]
-        for idx in range(metadata.num_row_groups):
-            starts.append(total)
-            total += metadata.row_group(idx).num_rows
-        return starts or [0]
+        return starts
+
+    def _read_row_group(self, row_group: int) -> Any:
+        file_index, group = self._row_groups[row_group]
+        if self._dataset is not None:
+            return self._dataset.read_row_group(file_index, group, self._columns)
+        return self._parquet_file.read_row_group(group, columns=self._columns)
 
     def __call__(self, row_idx: int) -> dict[str, Any]:
         row_group = max(0, bisect_right(self._row_group_starts, row_idx) - 1)
@@ -985,7 +1180,7 @@ class ParquetRowFieldProvider:
                 if tracker is not None:
                     tracker.ensure_current()
                 try:
-                    table = self._parquet_file.read_row_group(row_group, columns=self._columns)
+                    table = self._read_row_group(row_group)
                     cached_columns = table.to_pydict()
                 except _parquet_row_field_read_errors() as exc:
                     if tracker is not None:
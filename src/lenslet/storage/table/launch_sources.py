@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+from .parquet_columns import column_values
+from .parquet_dataset import resolve_parquet_dataset
 from .pyarrow_runtime import pyarrow_exception_types, require_pyarrow_parquet
 from .source_detection import (
     SourceColumnScore,
@@ -23,7 +25,7 @@ def _table_value_errors() -> tuple[type[BaseException], ...]:
 
 def local_source_layout(table, column_name: str) -> tuple[list[str], bool]:
     try:
-        values = table[column_name].to_pylist()
+        values = column_values(table[column_name])
     except _table_value_errors():
         return [], False
 
@@ -83,6 +85,13 @@ def best_source_column(columns: list[str], batch, base_dir: str | None) -> str |
 
 
 def detect_source_column(parquet_path: str, base_dir: str | None, sample_size: int = 50) -> str | None:
+    dataset = resolve_parquet_dataset(parquet_path)
+    if dataset is not None:
+        batch = dataset.head(sample_size)
+        if batch.num_rows == 0:
+            return None
+        return best_source_column(batch.schema.names, batch, base_dir)
+
     parquet = require_pyarrow_parquet()
     parquet_file = parquet.ParquetFile(parquet_path)
     if parquet_file.metadata is not None and parquet_file.metadata.num_rows == 0:
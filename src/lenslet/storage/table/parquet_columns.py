@@ -0,0 +1,202 @@
+"""Parquet columns that are streamed from the source instead of held in memory.
+
+A Parquet launch does not keep its identity and media columns (source, path,
+name, MIME type, dimensions, size, mtime) as an Arrow table. `TableStorage`
+only needs them in full while it builds the row store, so each full pass
+re-reads them one batch at a time and memory stays near one row group.
+Sampling reads a small head shared by the columns, read on first use; the
+rare random access reads and caches the row group holding the row.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from pathlib import Path
+from threading import Lock
+from typing import Any, overload
+
+from .parquet_dataset import ParquetDataset
+from .pyarrow_runtime import require_pyarrow_parquet
+
+PARQUET_COLUMN_HEAD_ROWS = 1024
+PARQUET_COLUMN_BATCH_ROWS = 16384
+
+
+class ParquetColumnReader:
+    """Reads named columns of one Parquet file or dataset in row order."""
+
+    def __init__(self, parquet_path: Path, *, dataset: ParquetDataset | None = None) -> None:
+        self._parquet_path = parquet_path
+        self._dataset = dataset
+        if dataset is not None:
+            group_rows = dataset.row_group_rows
+        else:
+            metadata = require_pyarrow_parquet().ParquetFile(str(parquet_path)).metadata
+            group_rows = (tuple(metadata.row_group(idx).num_rows for idx in range(metadata.num_row_groups)),)
+        self._row_groups: list[tuple[int, int]] = []
+        self._row_group_starts: list[int] = []
+        total = 0
+        for file_index, rows in enumerate(group_rows):
+            for group, num_rows in enumerate(rows):
+                self._row_groups.append((file_index, group))
+                self._row_group_starts.append(total)
+                total += num_rows
+        self.row_count = total
+
+    def iter_batches(
+        self,
+        columns: Sequence[str],
+        batch_rows: int = PARQUET_COLUMN_BATCH_ROWS,
+    ) -> Iterator[tuple[int, dict[str, list[Any]]]]:
+        """Yield `(first_row, {column: values})` for consecutive row batches."""
+        names = list(dict.fromkeys(columns))
+        start = 0
+        for table in self._iter_tables(names, batch_rows):
+            for offset in range(0, table.num_rows, batch_rows):
+                chunk = table.slice(offset, batch_rows)
+                yield start, {name: chunk.column(name).to_pylist() for name in names}
+                start += chunk.num_rows
+
+    def _iter_tables(self, names: list[str], batch_rows: int) -> Iterator[Any]:
+        if self._dataset is None:
+            parquet = require_pyarrow_parquet()
+            parquet_file = parquet.ParquetFile(str(self._parquet_path))
+            for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=names):
+                yield batch
+            return
+        for file_index, group in self._row_groups:
+            yield self._dataset.read_row_group(file_index, group, names)
+
+    def read_row_group_of(self, row_idx: int, column: str) -> tuple[int, int, list[Any]]:
+        """Return `(first_row, row_count, values)` of the row group holding `row_idx`."""
+        if not 0 <= row_idx < self.row_count:
+            raise IndexError(row_idx)
+        row_group = bisect_right(self._row_group_starts, row_idx) - 1
+        file_index, group = self._row_groups[row_group]
+        if self._dataset is not None:
+            table = self._dataset.read_row_group(file_index, group, [column])
+        else:
+            parquet = require_pyarrow_parquet()
+            table = parquet.ParquetFile(str(self._parquet_path)).read_row_group(group, columns=[column])
+        values = table.column(column).to_pylist()
+        return self._row_group_starts[row_group], len(values), values
+
+    def columns(self, names: Sequence[str]) -> dict[str, ParquetColumn]:
+        """Open streamed columns whose heads are read together on first use."""
+        head = _SharedHead(self, list(dict.fromkeys(names)))
+        return {name: ParquetColumn(self, name, head) for name in head.names}
+
+
+class _SharedHead:
+    """The first rows of several columns, read in one batch when first needed."""
+
+    __slots__ = ("reader", "names", "_values", "_lock")
+
+    def __init__(self, reader: ParquetColumnReader, names: list[str]) -> None:
+        self.reader = reader
+        self.names = names
+        self._values: dict[str, list[Any]] | None = None
+        self._lock = Lock()
+
+    def values(self, name: str) -> list[Any]:
+        with self._lock:
+            if self._values is None:
+                batches = self.reader.iter_batches(self.names, PARQUET_COLUMN_HEAD_ROWS)
+                self._values = next(batches, (0, {}))[1]
+            return self._values.get(name, [])
+
+
+class ParquetColumn(Sequence[Any]):
+    """One column of a `ParquetColumnReader`, read on demand.
+
+    Iterating streams the whole column; indexing serves the head or one cached
+    row group. There is deliberately no `to_pylist`, so storage code never
+    converts it into a whole-column Python list.
+    """
+
+    __slots__ = ("reader", "name", "_head", "_cached", "_lock")
+
+    def __init__(self, reader: ParquetColumnReader, name: str, head: _SharedHead) -> None:
+        self.reader = reader
+        self.name = name
+        self._head = head
+        self._cached: tuple[int, int, list[Any]] = (0, 0, [])
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self.reader.row_count
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return list(islice(self, *index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        head = self._head.values(self.name)
+        if 0 <= index < len(head):
+            return head[index]
+        with self._lock:
+            start, count, values = self._cached
+            if not start <= index < start + count:
+                self._cached = start, count, values = self.reader.read_row_group_of(index, self.name)
+            return values[index - start]
+
+    def __iter__(self) -> Iterator[Any]:
+        head = self._head.values(self.name)
+        yield from head
+        if len(head) >= len(self):
+            return
+        for start, batch in self.reader.iter_batches((self.name,)):
+            values = batch[self.name]
+            if start + len(values) <= len(head):
+                continue
+            yield from values[max(0, len(head) - start):]
+
+    def __repr__(self) -> str:
+        return f"ParquetColumn({self.name!r}, len={len(self)})"
+
+
+class StreamedParquetTable:
+    """Parquet browse columns where identity and media columns stay on disk.
+
+    Quacks like the Arrow table `TableStorage` and the launch helpers read:
+    retained columns are Arrow chunked arrays, streamed ones `ParquetColumn`s.
+    """
+
+    def __init__(self, retained: Any, streamed: dict[str, ParquetColumn], schema: Any) -> None:
+        self._retained = retained
+        self._streamed = streamed
+        self.schema = schema
+        self.num_rows = next(iter(streamed.values())).reader.row_count if streamed else retained.num_rows
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self.schema.names)
+
+    def column(self, name: str) -> Any:
+        streamed = self._streamed.get(name)
+        return streamed if streamed is not None else self._retained.column(name)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.column(name)
+
+    def to_pydict(self) -> dict[str, Any]:
+        """Return retained columns as lists and streamed ones as `ParquetColumn`s."""
+        return {
+            name: self._streamed[name] if name in self._streamed else self._retained.column(name).to_pylist()
+            for name in self.schema.names
+        }
+
+
+def column_values(values: Any) -> Sequence[Any]:
+    """Return a table column as a Python sequence, streaming `ParquetColumn`s."""
+    if isinstance(values, ParquetColumn):
+        return values
+    return values.to_pylist()
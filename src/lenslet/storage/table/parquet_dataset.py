@@ -0,0 +1,332 @@
+"""Multi-file Parquet datasets launched as one table.
+
+A directory of Parquet shards, optionally hive-partitioned into `key=value/`
+folders, or a glob of shard files reads as a single table. Shards are ordered
+by path and row IDs run through them in that order, so every file owns one
+contiguous row-ID range. Shard schemas are unified, and partition keys become
+dictionary-encoded columns that never hold one Python value per row.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+from .pyarrow_runtime import require_pyarrow
+
+
+PARQUET_DATASET_READ_WORKERS = 8
+_GLOB_CHARS = frozenset("*?[")
+_HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def is_glob_pattern(target: str | Path) -> bool:
+    return any(char in _GLOB_CHARS for char in str(target))
+
+
+def _is_hidden_part(name: str) -> bool:
+    # Spark and Hive keep markers like `_SUCCESS` and `_metadata` beside the shards.
+    return name.startswith((".", "_"))
+
+
+def _is_parquet_name(name: str) -> bool:
+    return name.lower().endswith(".parquet") and not _is_hidden_part(name)
+
+
+def _glob_files(pattern: str) -> tuple[Path, ...]:
+    return tuple(sorted(
+        Path(match).absolute()
+        for match in glob.glob(os.path.expanduser(pattern), recursive=True)
+        if os.path.isfile(match) and _is_parquet_name(os.path.basename(match))
+    ))
+
+
+def _directory_files(root: Path) -> tuple[Path, ...]:
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not _is_hidden_part(name)]
+        files.extend(Path(dirpath, name).absolute() for name in filenames if _is_parquet_name(name))
+    return tuple(sorted(files))
+
+
+def is_parquet_dataset_target(target: str | Path) -> bool:
+    """Whether `target` names a shard directory or glob rather than one file.
+
+    A directory only counts when every visible file under it is a Parquet
+    shard, so image folders and `items.parquet` datasets keep their own modes.
+    """
+    path = Path(target).expanduser()
+    if path.is_file():
+        return False
+    if not path.exists():
+        return is_glob_pattern(target) and bool(_glob_files(str(target)))
+    if not path.is_dir() or (path / "items.parquet").exists():
+        return False
+    found = False
+    for _dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = [name for name in dirnames if not _is_hidden_part(name)]
+        for name in filenames:
+            if _is_hidden_part(name):
+                continue
+            if not name.lower().endswith(".parquet"):
+                return False
+            found = True
+    return found
+
+
+def parquet_dataset_root(target: str | Path) -> Path:
+    """Directory that anchors a table target: the folder itself, a glob's fixed prefix, or a file's parent."""
+    path = Path(target).expanduser()
+    if path.is_dir():
+        return path.absolute()
+    if path.is_file() or not is_glob_pattern(target):
+        return path.absolute().parent
+    fixed_parts: list[str] = []
+    for part in path.parts:
+        if is_glob_pattern(part):
+            break
+        fixed_parts.append(part)
+    return Path(*fixed_parts).absolute() if fixed_parts else Path.cwd()
+
+
+def parquet_workspace_anchor(target: str | Path) -> Path:
+    """Path a table's workspace sidecar sits beside.
+
+    A glob has no file of its own, so its sidecar belongs to the fixed prefix.
+    """
+    path = Path(target).expanduser()
+    if path.exists() or not is_glob_pattern(target):
+        return path
+    return parquet_dataset_root(target)
+
+
+@lru_cache(maxsize=4096)
+def _file_footer(path: str, _size: int, _mtime_ns: int) -> tuple[int, Any, tuple[int, ...]]:
+    _pyarrow, parquet = require_pyarrow()
+    metadata = parquet.read_metadata(path)
+    row_groups = tuple(metadata.row_group(index).num_rows for index in range(metadata.num_row_groups))
+    return metadata.num_rows, metadata.schema.to_arrow_schema(), row_groups
+
+
+def _read_footer(path: Path) -> tuple[int, Any, tuple[int, ...]]:
+    stat = path.stat()
+    return _file_footer(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _hive_partitions(root: Path, path: Path) -> dict[str, str | None]:
+    try:
+        parts = path.parent.relative_to(root).parts
+    except ValueError:
+        return {}
+    partitions: dict[str, str | None] = {}
+    for part in parts:
+        key, separator, value = part.partition("=")
+        if not separator or not key:
+            continue
+        value = unquote(value)
+        partitions[unquote(key)] = None if value == _HIVE_NULL_PARTITION else value
+    return partitions
+
+
+@dataclass(frozen=True, slots=True)
+class ParquetDataset:
+    """Ordered Parquet shards read as one table.
+
+    `row_starts[i]` is the first row ID of `files[i]`; the last entry is the
+    total row count.
+    """
+
+    target: str
+    root: Path
+    files: tuple[Path, ...]
+    row_starts: tuple[int, ...]
+    file_schemas: tuple[Any, ...]
+    row_group_rows: tuple[tuple[int, ...], ...]
+    partition_keys: tuple[str, ...]
+    partition_values: tuple[tuple[str | None, ...], ...]
+
+    @property
+    def row_count(self) -> int:
+        return self.row_starts[-1]
+
+    def file_row_count(self, file_index: int) -> int:
+        return self.row_starts[file_index + 1] - self.row_starts[file_index]
+
+    def locate(self, row_idx: int) -> tuple[int, int]:
+        """Return `(file_index, row_in_file)` for a dataset row ID."""
+        if not 0 <= row_idx < self.row_count:
+            raise IndexError(row_idx)
+        file_index = bisect_right(self.row_starts, row_idx) - 1
+        return file_index, row_idx - self.row_starts[file_index]
+
+    def partitions_for_file(self, file_index: int) -> dict[str, str | None]:
+        return dict(zip(self.partition_keys, self.partition_values[file_index]))
+
+    def schema(self) -> Any:
+        pyarrow, _parquet = require_pyarrow()
+        schema = pyarrow.unify_schemas(list(self.file_schemas), promote_options="permissive")
+        for key in self.partition_keys:
+            schema = schema.append(pyarrow.field(key, pyarrow.dictionary(pyarrow.int32(), pyarrow.string())))
+        return schema
+
+    def _target_schema(self, columns: list[str] | None) -> Any:
+        pyarrow, _parquet = require_pyarrow()
+        schema = self.schema()
+        if columns is None:
+            return schema
+        for column in columns:
+            if schema.get_field_index(column) < 0:
+                raise ValueError(f"column '{column}' not found in Parquet dataset {self.target}")
+        return pyarrow.schema([schema.field(column) for column in columns])
+
+    def _partition_dictionaries(self, target: Any) -> dict[str, Any]:
+        pyarrow, _parquet = require_pyarrow()
+        dictionaries: dict[str, Any] = {}
+        for key_index, key in enumerate(self.partition_keys):
+            if key not in target.names:
+                continue
+            values = sorted({
+                values[key_index]
+                for values in self.partition_values
+                if values[key_index] is not None
+            })
+            dictionaries[key] = pyarrow.array(values, type=pyarrow.string())
+        return dictionaries
+
+    def _conform(self, file_index: int, table: Any, target: Any, dictionaries: dict[str, Any]) -> Any:
+        pyarrow, _parquet = require_pyarrow()
+        row_count = table.num_rows
+        arrays = []
+        for field in target:
+            dictionary = dictionaries.get(field.name)
+            if dictionary is not None:
+                value = self.partition_values[file_index][self.partition_keys.index(field.name)]
+                indices = (
+                    pyarrow.nulls(row_count, pyarrow.int32())
+                    if value is None
+                    else pyarrow.repeat(
+                        pyarrow.scalar(dictionary.index(value).as_py(), pyarrow.int32()),
+                        row_count,
+                    )
+                )
+                arrays.append(pyarrow.DictionaryArray.from_arrays(indices, dictionary))
+            elif field.name in table.column_names:
+                arrays.append(table.column(field.name).cast(field.type))
+            else:
+                arrays.append(pyarrow.nulls(row_count, field.type))
+        return pyarrow.Table.from_arrays(arrays, schema=target)
+
+    def _data_columns(self, file_index: int, target: Any) -> list[str]:
+        available = set(self.file_schemas[file_index].names)
+        return [
+            name
+            for name in target.names
+            if name in available and name not in self.partition_keys
+        ]
+
+    def read_table(self, columns: list[str] | None = None) -> Any:
+        """Read the requested columns from every shard, in parallel, as one table."""
+        pyarrow, parquet = require_pyarrow()
+        target = self._target_schema(columns)
+        dictionaries = self._partition_dictionaries(target)
+
+        def read(file_index: int) -> Any:
+            table = parquet.read_table(
+                str(self.files[file_index]),
+                columns=self._data_columns(file_index, target),
+            )
+            return self._conform(file_index, table, target, dictionaries)
+
+        workers = max(1, min(PARQUET_DATASET_READ_WORKERS, len(self.files)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lenslet-parquet-read") as executor:
+            tables = list(executor.map(read, range(len(self.files))))
+        if not tables:
+            return target.empty_table()
+        return pyarrow.concat_tables(tables)
+
+    def read_row_group(self, file_index: int, row_group: int, columns: list[str]) -> Any:
+        """Read one row group of one shard, conformed to the unified schema."""
+        _pyarrow, parquet = require_pyarrow()
+        target = self._target_schema(columns)
+        dictionaries = self._partition_dictionaries(target)
+        table = parquet.ParquetFile(str(self.files[file_index])).read_row_group(
+            row_group,
+            columns=self._data_columns(file_index, target),
+        )
+        return self._conform(file_index, table, target, dictionaries)
+
+    def head(self, row_count: int, columns: list[str] | None = None) -> Any:
+        """Read up to `row_count` leading rows, conformed to the unified schema."""
+        pyarrow, parquet = require_pyarrow()
+        target = self._target_schema(columns)
+        dictionaries = self._partition_dictionaries(target)
+        for file_index, path in enumerate(self.files):
+            if self.file_row_count(file_index) == 0:
+                continue
+            batch = next(
+                parquet.ParquetFile(str(path)).iter_batches(
+                    batch_size=row_count,
+                    columns=self._data_columns(file_index, target),
+                ),
+                None,
+            )
+            if batch is None:
+                continue
+            return self._conform(file_index, pyarrow.Table.from_batches([batch]), target, dictionaries)
+        return target.empty_table()
+
+
+def resolve_parquet_dataset(target: str | Path) -> ParquetDataset | None:
+    """Open `target` as a shard dataset, or return None for a single Parquet file.
+
+    Raises ValueError when a directory or glob matches no Parquet shards.
+    """
+    path = Path(target).expanduser()
+    if path.is_file():
+        return None
+    if path.is_dir():
+        root = path.absolute()
+        files = _directory_files(root)
+    elif is_glob_pattern(target):
+        root = parquet_dataset_root(target)
+        files = _glob_files(str(target))
+    else:
+        return None
+    if not files:
+        raise ValueError(f"no Parquet files found for '{target}'")
+
+    workers = max(1, min(PARQUET_DATASET_READ_WORKERS, len(files)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lenslet-parquet-footer") as executor:
+        footers = list(executor.map(_read_footer, files))
+    row_starts = [0]
+    for row_count, _schema, _row_groups in footers:
+        row_starts.append(row_starts[-1] + row_count)
+    file_schemas = tuple(schema for _row_count, schema, _row_groups in footers)
+
+    data_columns = {name for schema in file_schemas for name in schema.names}
+    file_partitions = [_hive_partitions(root, file) for file in files]
+    partition_keys: list[str] = []
+    for partitions in file_partitions:
+        for key in partitions:
+            if key not in data_columns and key not in partition_keys:
+                partition_keys.append(key)
+    return ParquetDataset(
+        target=str(target),
+        root=root,
+        files=files,
+        row_starts=tuple(row_starts),
+        file_schemas=file_schemas,
+        row_group_rows=tuple(row_groups for _row_count, _schema, row_groups in footers),
+        partition_keys=tuple(partition_keys),
+        partition_values=tuple(
+            tuple(partitions.get(key) for key in partition_keys)
+            for partitions in file_partitions
+        ),
+    )
@@ -4,14 +4,18 @@ import asyncio
 from collections import OrderedDict, deque
 from collections.abc import Awaitable, Callable, Hashable
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context, copy_context
 from dataclasses import dataclass, field
+import os
 import threading
 from time import monotonic
 from typing import Any, Generic, Literal, TypeVar, cast
 
 
 MAX_QUEUED_ANALYSES = 32
-MAX_FILTER_CACHE_ENTRIES = 8
+MAX_ANALYSIS_WORKERS = 8
+MAX_FILTER_CACHE_ENTRIES = 64
+FILTER_CACHE_BUDGET_BYTES = 256 << 20
 MAX_ORDER_CACHE_ENTRIES = 8
 MAX_SESSION_ENTRIES = 256
 SESSION_TTL_SECONDS = 5 * 60.0
@@ -49,6 +53,7 @@ class _Job:
     key: Hashable
     operation: Callable[[Callable[[], bool]], Any]
     owner_session: str
+    context: Context = field(default_factory=copy_context)
     subscribers: dict[int, _Subscriber] = field(default_factory=dict)
     cancel_event: threading.Event = field(default_factory=threading.Event)
     started: bool = False
@@ -64,24 +69,44 @@ class _SessionState:
     touched_at: float
 
 
+def analysis_worker_count(requested: int | None = None) -> int:
+    """Analysis parallelism: `requested` when given, else a default that leaves
+    the CPU pool to the Arrow kernels each analysis already runs."""
+    if requested is not None:
+        return max(1, requested)
+    cpu = os.cpu_count() or 2
+    return max(1, min(MAX_ANALYSIS_WORKERS, cpu // 4))
+
+
 class TableQueryCoordinator:
-    """Globally bounded, subscriber-aware scheduler for browse analysis work."""
+    """Globally bounded, subscriber-aware scheduler for browse analysis work.
+
+    Up to `max_workers` independent jobs run at once. Workers are handed jobs
+    in round-robin owner order, so a session with a deep queue cannot starve
+    others, and identical keys still join a single execution.
+    """
 
     def __init__(
         self,
         *,
+        max_workers: int = 1,
         clock: Callable[[], float] = monotonic,
         on_analysis_event: Callable[[str], None] | None = None,
     ) -> None:
         self._clock = clock
         self._on_analysis_event = on_analysis_event
-        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lenslet-query")
+        self._max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="lenslet-query",
+        )
         self._state_lock = threading.RLock()
         self._jobs: dict[tuple[AnalysisKind, Hashable], _Job] = {}
         self._owner_queues: dict[str, deque[tuple[AnalysisKind, Hashable]]] = {}
         self._round_robin: deque[str] = deque()
-        self._active: _Job | None = None
+        self._active: dict[tuple[AnalysisKind, Hashable], _Job] = {}
         self._filter_cache: OrderedDict[Hashable, Any] = OrderedDict()
+        self._filter_cache_bytes = 0
         self._order_cache: OrderedDict[Hashable, Any] = OrderedDict()
         self._sessions: OrderedDict[str, _SessionState] = OrderedDict()
         self._next_token = 0
@@ -170,9 +195,11 @@ class TableQueryCoordinator:
     def diagnostics(self) -> dict[str, int]:
         with self._state_lock:
             return {
-                "analysis_active_work": int(self._active is not None),
+                "analysis_workers": self._max_workers,
+                "analysis_active_work": len(self._active),
                 "analysis_queued_work": self._queued_count_locked(),
                 "analysis_filter_cache_entries": len(self._filter_cache),
+                "analysis_filter_cache_bytes": self._filter_cache_bytes,
                 "analysis_order_cache_entries": len(self._order_cache),
                 "analysis_session_entries": len(self._sessions),
             }
@@ -193,7 +220,7 @@ class TableQueryCoordinator:
         self._jobs.clear()
         self._owner_queues.clear()
         self._round_robin.clear()
-        self._active = None
+        self._active.clear()
         for job in stale_jobs:
             job.cancel_event.set()
         self._loop = loop
@@ -201,44 +228,61 @@ class TableQueryCoordinator:
         self._worker = None
 
     async def _run_worker(self) -> None:
-        while True:
-            job = self._take_next_job()
-            if job is None:
-                wake = self._wake
-                if wake is None:
-                    return
-                await wake.wait()
-                wake.clear()
-                continue
-            self._emit("started", job.kind)
-            loop = asyncio.get_running_loop()
-            try:
-                result = await loop.run_in_executor(
-                    self._executor,
-                    job.operation,
-                    job.cancel_event.is_set,
-                )
-            except asyncio.CancelledError:
-                job.cancel_event.set()
+        loop = asyncio.get_running_loop()
+        running: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                job = self._take_next_job()
+                if job is None:
+                    wake = self._wake
+                    if wake is None:
+                        return
+                    await wake.wait()
+                    wake.clear()
+                    continue
+                task = loop.create_task(self._run_job(job))
+                running.add(task)
+                task.add_done_callback(running.discard)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _run_job(self, job: _Job) -> None:
+        self._emit("started", job.kind)
+        loop = asyncio.get_running_loop()
+        try:
+            # Run in the creating request's context so it reads the same table generation.
+            result = await loop.run_in_executor(
+                self._executor,
+                job.context.run,
+                job.operation,
+                job.cancel_event.is_set,
+            )
+        except asyncio.CancelledError:
+            job.cancel_event.set()
+            self._complete_job(job, error=AnalysisSuperseded())
+            raise
+        except BaseException as exc:
+            if job.cancel_event.is_set():
+                self._emit("cancelled", job.kind)
                 self._complete_job(job, error=AnalysisSuperseded())
-                raise
-            except BaseException as exc:
-                if job.cancel_event.is_set():
-                    self._emit("cancelled", job.kind)
-                    self._complete_job(job, error=AnalysisSuperseded())
-                else:
-                    self._emit("failed", job.kind)
-                    self._complete_job(job, error=exc)
             else:
-                if job.cancel_event.is_set():
-                    self._emit("cancelled", job.kind)
-                    self._complete_job(job, error=AnalysisSuperseded())
-                else:
-                    self._emit("completed", job.kind)
-                    self._complete_job(job, result=result)
+                self._emit("failed", job.kind)
+                self._complete_job(job, error=exc)
+        else:
+            if job.cancel_event.is_set():
+                self._emit("cancelled", job.kind)
+                self._complete_job(job, error=AnalysisSuperseded())
+            else:
+                self._emit("completed", job.kind)
+                self._complete_job(job, result=result)
 
     def _take_next_job(self) -> _Job | None:
         with self._state_lock:
+            if len(self._active) >= self._max_workers:
+                return None
             while self._round_robin:
                 owner = self._round_robin.popleft()
                 queue = self._owner_queues.get(owner)
@@ -254,7 +298,7 @@ class TableQueryCoordinator:
                     else:
                         self._owner_queues.pop(owner, None)
                     job.started = True
-                    self._active = job
+                    self._active[identity] = job
                     return job
                 self._owner_queues.pop(owner, None)
             return None
@@ -268,23 +312,33 @@ class TableQueryCoordinator:
     ) -> None:
         with self._state_lock:
             self._jobs.pop(job.identity, None)
-            if self._active is job:
-                self._active = None
+            if self._active.get(job.identity) is job:
+                self._active.pop(job.identity, None)
             if error is None and job.subscribers:
-                cache = self._cache_for(job.kind)
-                if cache is not None:
-                    cache[job.key] = result
-                    cache.move_to_end(job.key)
-                    limit = (
-                        MAX_FILTER_CACHE_ENTRIES
-                        if job.kind == "filter"
-                        else MAX_ORDER_CACHE_ENTRIES
-                    )
-                    while len(cache) > limit:
-                        cache.popitem(last=False)
+                if job.kind == "filter":
+                    self._cache_filter_locked(job.key, result)
+                elif job.kind == "order":
+                    self._order_cache[job.key] = result
+                    self._order_cache.move_to_end(job.key)
+                    while len(self._order_cache) > MAX_ORDER_CACHE_ENTRIES:
+                        self._order_cache.popitem(last=False)
             self._signal_worker_locked()
         self._finish_subscribers(job, error, result=result)
 
+    def _cache_filter_locked(self, key: Hashable, result: Any) -> None:
+        """Cache a filter analysis within the entry cap and byte budget; keep the newest."""
+        cache = self._filter_cache
+        previous = cache.pop(key, None)
+        if previous is not None:
+            self._filter_cache_bytes -= _cached_nbytes(previous)
+        cache[key] = result
+        self._filter_cache_bytes += _cached_nbytes(result)
+        while len(cache) > MAX_FILTER_CACHE_ENTRIES or (
+            self._filter_cache_bytes > FILTER_CACHE_BUDGET_BYTES and len(cache) > 1
+        ):
+            _key, evicted = cache.popitem(last=False)
+            self._filter_cache_bytes -= _cached_nbytes(evicted)
+
     @staticmethod
     def _finish_subscribers(
         job: _Job,
@@ -397,3 +451,7 @@ class TableQueryCoordinator:
     def _emit(self, event: str, kind: AnalysisKind) -> None:
         if self._on_analysis_event is not None and kind != "request":
             self._on_analysis_event(event)
+
+
+def _cached_nbytes(value: Any) -> int:
+    return int(getattr(value, "nbytes", 0))
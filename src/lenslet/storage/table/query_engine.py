@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from array import array
-from collections.abc import Callable, Iterable, Iterator, Mapping
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field, replace
+from functools import partial
 import hashlib
 import math
 import struct
+import sys
 from threading import RLock
 from time import monotonic
 from types import MappingProxyType
-from typing import Protocol
+from typing import Any, Generic, Literal, Protocol, TypeVar
 
 from ...browse.query import (
     DERIVED_METRIC_ID_RE,
@@ -49,14 +53,34 @@ from ...metrics import coerce_finite_metric_value, normalize_metric_mapping
 from ..base import SidecarState
 from ..search_text import build_search_haystack, sidecar_source_fields
 from ..source.paths import normalize_item_path
-from .categoricals import normalize_categorical_value
+from .bitmaps import bitmap_nbytes, slots_bitmap, value_bitmaps, with_bit
+from .categoricals import CATEGORICAL_MAX_UNIQUE_VALUES, normalize_categorical_value
+from .histograms import histogram_summary, histogram_summary_array
+from .pyarrow_runtime import load_pyarrow_runtime
+from .query_order import TableSortRanks, WindowedOrder
+from .query_refinement import FilterRefinementCache
+from .query_vectorized import VectorizedFilterColumns, int_list
 from .row_store import TableRowStore
 
 
 CHECKPOINT_ROWS = 256
 CHECKPOINT_SECONDS = 0.025
+VECTORIZED_FILTER_MIN_ROWS = 2048
+MAX_HISTOGRAM_CACHE_ENTRIES = 1024
+# Rough retained size of one derived-score dict entry with its float.
+_DERIVED_SCORE_BYTES = 96
+# Row IDs past the small-int cache are separate int objects behind each tuple slot.
+_BOXED_ROW_ID_BYTES = sys.getsizeof(1 << 20)
+COLUMN_CHUNK_SHIFT = 12
+_COLUMN_CHUNK_ROWS = 1 << COLUMN_CHUNK_SHIFT
+_COLUMN_CHUNK_MASK = _COLUMN_CHUNK_ROWS - 1
 _POINTER_BYTES = struct.calcsize("P")
 
+T = TypeVar("T")
+
+
+TableFilterExecution = Literal["auto", "rows", "vectorized"]
+
 
 class CancellationProbe(Protocol):
     def __call__(self) -> bool: ...
@@ -87,6 +111,135 @@ class _NumericColumn:
         return None if math.isnan(value) else value
 
 
+class _ColumnView(Generic[T]):
+    """Immutable read view over the chunks of a `_ChunkedColumn`."""
+
+    __slots__ = ("_chunks", "_length")
+
+    def __init__(self, chunks: tuple[tuple[T, ...], ...], length: int) -> None:
+        self._chunks = chunks
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, slot: int) -> T:
+        if not 0 <= slot < self._length:
+            raise IndexError(slot)
+        return self._chunks[slot >> COLUMN_CHUNK_SHIFT][slot & _COLUMN_CHUNK_MASK]
+
+    def __iter__(self) -> Iterator[T]:
+        for chunk in self._chunks:
+            yield from chunk
+
+
+class _ChunkedColumn(Generic[T]):
+    """Copy-on-write column stored as fixed-size immutable chunks.
+
+    `view()` is O(1) while the column is unchanged. A write replaces only the
+    touched chunk, so views handed out earlier keep their values; the next
+    view costs one pointer per chunk.
+    """
+
+    __slots__ = ("_chunks", "_length", "_view")
+
+    def __init__(self, chunks: list[tuple[T, ...]], length: int) -> None:
+        self._chunks = chunks
+        self._length = length
+        self._view: _ColumnView[T] | None = None
+
+    @classmethod
+    def from_values(cls, values: Sequence[T]) -> _ChunkedColumn[T]:
+        return cls(
+            [
+                tuple(values[start:start + _COLUMN_CHUNK_ROWS])
+                for start in range(0, len(values), _COLUMN_CHUNK_ROWS)
+            ],
+            len(values),
+        )
+
+    @classmethod
+    def filled(cls, value: T, length: int) -> _ChunkedColumn[T]:
+        full, tail = divmod(length, _COLUMN_CHUNK_ROWS)
+        chunks = [(value,) * _COLUMN_CHUNK_ROWS] * full
+        if tail:
+            chunks.append((value,) * tail)
+        return cls(chunks, length)
+
+    def __getitem__(self, slot: int) -> T:
+        return self._chunks[slot >> COLUMN_CHUNK_SHIFT][slot & _COLUMN_CHUNK_MASK]
+
+    def __iter__(self) -> Iterator[T]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __setitem__(self, slot: int, value: T) -> None:
+        index = slot >> COLUMN_CHUNK_SHIFT
+        offset = slot & _COLUMN_CHUNK_MASK
+        chunk = self._chunks[index]
+        self._chunks[index] = (*chunk[:offset], value, *chunk[offset + 1:])
+        self._view = None
+
+    def same_values(self, other: _ChunkedColumn[T]) -> bool:
+        return self._length == other._length and all(
+            left is right or left == right
+            for left, right in zip(self._chunks, other._chunks)
+        )
+
+    def view(self) -> _ColumnView[T]:
+        if self._view is None:
+            self._view = _ColumnView(tuple(self._chunks), self._length)
+        return self._view
+
+
+def table_row_ids(row_store: TableRowStore) -> tuple[int, ...]:
+    """Return source row IDs in column-store slot order."""
+    return tuple(row_store.row_indices)
+
+
+@dataclass(frozen=True, slots=True)
+class _RowStoreColumns:
+    """Columns copied from the row store rather than derived from table values."""
+
+    paths: tuple[str, ...]
+    names: tuple[str, ...]
+    sources: tuple[str | None, ...]
+    urls: tuple[str | None, ...]
+    added_ms: array[float]
+    widths: array[float]
+    heights: array[float]
+
+    @classmethod
+    def collect(cls, row_store: TableRowStore, row_ids: Sequence[int]) -> _RowStoreColumns:
+        paths: list[str] = []
+        names: list[str] = []
+        sources: list[str | None] = []
+        urls: list[str | None] = []
+        added_ms = array("d")
+        widths = array("d")
+        heights = array("d")
+        for row_id in row_ids:
+            path, name, _mime, width, height, _size, mtime, url, source = (
+                row_store.item_fields_for_row(row_id)
+            )
+            paths.append(path)
+            names.append(name)
+            sources.append(source)
+            urls.append(url)
+            added_ms.append(mtime * 1000.0 if math.isfinite(mtime) and mtime > 0 else 0.0)
+            widths.append(_finite_or_nan(width))
+            heights.append(_finite_or_nan(height))
+        return cls(
+            paths=tuple(paths),
+            names=tuple(names),
+            sources=tuple(sources),
+            urls=tuple(urls),
+            added_ms=added_ms,
+            widths=widths,
+            heights=heights,
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class TableColumnStore:
     """Immutable dense columns keyed externally by stable source row IDs."""
@@ -104,6 +257,7 @@ class TableColumnStore:
     heights: _NumericColumn
     metrics: Mapping[str, _NumericColumn]
     categoricals: Mapping[str, tuple[str | None, ...]]
+    categorical_bitmaps: Mapping[str, Mapping[str, int]]
     include_source_in_search: bool
     buffer_nbytes: int
     _row_to_slot: Mapping[int, int] = field(repr=False)
@@ -121,7 +275,8 @@ class TableColumnStore:
         categoricals_for_row: Callable[[int], Mapping[str, object]],
         include_source_in_search: bool,
     ) -> TableColumnStore:
-        row_ids = tuple(row_store.path_to_row[path] for path in row_store.paths)
+        row_ids = table_row_ids(row_store)
+        base = _RowStoreColumns.collect(row_store, row_ids)
         metric_names = _normalized_keys(metric_keys)
         categorical_names = _normalized_keys(categorical_keys)
         missing = math.nan
@@ -133,29 +288,14 @@ class TableColumnStore:
             key: [None] * len(row_ids)
             for key in categorical_names
         }
-        paths: list[str] = []
         identities: list[str] = []
-        names: list[str] = []
-        sources: list[str | None] = []
-        urls: list[str | None] = []
         search_text: list[str] = []
-        added_ms = array("d")
-        widths = array("d")
-        heights = array("d")
 
-        for slot, row_id in enumerate(row_ids):
-            path, name, _mime, width, height, _size, mtime, url, source = (
-                row_store.item_fields_for_row(row_id)
-            )
+        for slot, (row_id, path, name, source, url) in enumerate(
+            zip(row_ids, base.paths, base.names, base.sources, base.urls)
+        ):
             canonical = _canonical_path(path)
-            paths.append(path)
             identities.append(canonical)
-            names.append(name)
-            sources.append(source)
-            urls.append(url)
-            added_ms.append(mtime * 1000.0 if math.isfinite(mtime) and mtime > 0 else 0.0)
-            widths.append(_finite_or_nan(width))
-            heights.append(_finite_or_nan(height))
             search_text.append(
                 build_search_haystack(
                     logical_path=canonical,
@@ -177,53 +317,116 @@ class TableColumnStore:
             for key, buffer in categorical_buffers.items():
                 buffer[slot] = normalize_categorical_value(row_categoricals.get(key))
 
-        numeric_columns = {
-            key: _NumericColumn.from_buffer(buffer)
-            for key, buffer in metric_buffers.items()
-        }
-        categorical_columns = {
-            key: tuple(values)
-            for key, values in categorical_buffers.items()
-        }
+        return cls._assemble(
+            base,
+            source_generation=source_generation,
+            row_ids=row_ids,
+            stable_identities=tuple(identities),
+            static_search_text=tuple(search_text),
+            metrics={
+                key: _NumericColumn.from_buffer(buffer)
+                for key, buffer in metric_buffers.items()
+            },
+            categoricals={
+                key: tuple(values)
+                for key, values in categorical_buffers.items()
+            },
+            include_source_in_search=include_source_in_search,
+        )
+
+    @classmethod
+    def from_persisted(
+        cls,
+        row_store: TableRowStore,
+        *,
+        source_generation: str,
+        stable_identities: tuple[str, ...],
+        static_search_text: tuple[str, ...],
+        metrics: Mapping[str, memoryview],
+        categoricals: Mapping[str, tuple[str | None, ...]],
+        include_source_in_search: bool,
+    ) -> TableColumnStore:
+        """Rebuild a store around derived columns saved by an earlier `build`.
+
+        The caller must have checked that the saved columns describe
+        `row_store.paths` in order; metric buffers are used without copying.
+        """
+        row_ids = table_row_ids(row_store)
+        return cls._assemble(
+            _RowStoreColumns.collect(row_store, row_ids),
+            source_generation=source_generation,
+            row_ids=row_ids,
+            stable_identities=stable_identities,
+            static_search_text=static_search_text,
+            metrics={key: _NumericColumn(values.toreadonly()) for key, values in metrics.items()},
+            categoricals=categoricals,
+            include_source_in_search=include_source_in_search,
+        )
+
+    @classmethod
+    def _assemble(
+        cls,
+        base: _RowStoreColumns,
+        *,
+        source_generation: str,
+        row_ids: tuple[int, ...],
+        stable_identities: tuple[str, ...],
+        static_search_text: tuple[str, ...],
+        metrics: Mapping[str, _NumericColumn],
+        categoricals: Mapping[str, tuple[str | None, ...]],
+        include_source_in_search: bool,
+    ) -> TableColumnStore:
+        categorical_bitmaps: dict[str, Mapping[str, int]] = {}
+        for key, values in categoricals.items():
+            bitmaps = value_bitmaps(values)
+            # Columns past the facet cardinality cap keep the scan kernels.
+            if len(bitmaps) <= CATEGORICAL_MAX_UNIQUE_VALUES:
+                categorical_bitmaps[key] = MappingProxyType(bitmaps)
         reference_slots = sum(
             len(values)
             for values in (
-                paths,
-                identities,
-                names,
-                sources,
-                urls,
-                search_text,
+                base.paths,
+                stable_identities,
+                base.names,
+                base.sources,
+                base.urls,
+                static_search_text,
                 row_ids,
-                *categorical_columns.values(),
+                *categoricals.values(),
             )
         )
+        added_ms = _NumericColumn.from_buffer(base.added_ms)
+        widths = _NumericColumn.from_buffer(base.widths)
+        heights = _NumericColumn.from_buffer(base.heights)
         numeric_nbytes = (
-            added_ms.buffer_info()[1] * added_ms.itemsize
-            + widths.buffer_info()[1] * widths.itemsize
-            + heights.buffer_info()[1] * heights.itemsize
-            + sum(column.nbytes for column in numeric_columns.values())
+            added_ms.nbytes
+            + widths.nbytes
+            + heights.nbytes
+            + sum(column.nbytes for column in metrics.values())
+            + sum(bitmap_nbytes(bitmaps.values()) for bitmaps in categorical_bitmaps.values())
         )
         return cls(
             source_generation=source_generation,
             row_ids=row_ids,
-            paths=tuple(paths),
-            stable_identities=tuple(identities),
-            names=tuple(names),
-            sources=tuple(sources),
-            urls=tuple(urls),
-            static_search_text=tuple(search_text),
-            added_ms=_NumericColumn.from_buffer(added_ms),
-            widths=_NumericColumn.from_buffer(widths),
-            heights=_NumericColumn.from_buffer(heights),
-            metrics=MappingProxyType(numeric_columns),
-            categoricals=MappingProxyType(categorical_columns),
+            paths=base.paths,
+            stable_identities=stable_identities,
+            names=base.names,
+            sources=base.sources,
+            urls=base.urls,
+            static_search_text=static_search_text,
+            added_ms=added_ms,
+            widths=widths,
+            heights=heights,
+            metrics=MappingProxyType(dict(metrics)),
+            categoricals=MappingProxyType(dict(categoricals)),
+            categorical_bitmaps=MappingProxyType(categorical_bitmaps),
             include_source_in_search=include_source_in_search,
             buffer_nbytes=numeric_nbytes + reference_slots * _POINTER_BYTES,
             _row_to_slot=MappingProxyType({row_id: slot for slot, row_id in enumerate(row_ids)}),
+            # Stable identities are the normalized path behind a leading slash.
             _path_to_slot=MappingProxyType({
-                normalize_item_path(path): slot
-                for slot, path in enumerate(paths)
+                identity[1:]: slot
+                for slot, identity in enumerate(stable_identities)
             }),
         )
 
@@ -257,13 +460,16 @@ class TableDependencyStamp:
 
 @dataclass(frozen=True, slots=True)
 class _MutableSnapshot:
-    stars: tuple[int | None, ...]
-    notes: tuple[str, ...]
-    search_text: tuple[str, ...]
-    dimension_overrides: tuple[tuple[float | None, float | None] | None, ...]
-    dynamic_metrics: tuple[tuple[tuple[str, float], ...], ...]
+    stars: _ColumnView[int | None]
+    notes: _ColumnView[str]
+    search_text: _ColumnView[str]
+    dimension_overrides: _ColumnView[tuple[float | None, float | None] | None]
+    dynamic_metrics: _ColumnView[tuple[tuple[str, float], ...]]
     available_metric_keys: frozenset[str]
     dependency_stamp: TableDependencyStamp
+    touched_slots: frozenset[int] = frozenset()
+    star_bitmaps: Mapping[int, int] = field(default_factory=dict)
+    metric_generations: Mapping[str, int] = field(default_factory=dict)
 
     def dynamic_metric_value(self, slot: int, key: str) -> float | None:
         for candidate, value in self.dynamic_metrics[slot]:
@@ -276,19 +482,25 @@ class _MutableColumns:
     def __init__(self, store: TableColumnStore) -> None:
         self._store = store
         self._lock = RLock()
-        self._stars: list[int | None] = [None] * len(store.row_ids)
-        self._notes = [""] * len(store.row_ids)
-        self._search_text = list(store.static_search_text)
-        self._dimension_overrides: list[tuple[float | None, float | None] | None] = [
-            None for _row_id in store.row_ids
-        ]
-        self._dynamic_metrics: list[tuple[tuple[str, float], ...]] = [
-            () for _row_id in store.row_ids
-        ]
+        row_count = len(store.row_ids)
+        self._stars: _ChunkedColumn[int | None] = _ChunkedColumn.filled(None, row_count)
+        self._notes = _ChunkedColumn.filled("", row_count)
+        self._search_text = _ChunkedColumn.from_values(store.static_search_text)
+        self._dimension_overrides: _ChunkedColumn[
+            tuple[float | None, float | None] | None
+        ] = _ChunkedColumn.filled(None, row_count)
+        self._dynamic_metrics: _ChunkedColumn[tuple[tuple[str, float], ...]] = (
+            _ChunkedColumn.filled((), row_count)
+        )
         self._dynamic_metric_counts: dict[str, int] = {}
+        # Replaced, never mutated, so snapshots can share it.
+        self._star_bitmaps: dict[int, int] = {}
+        self._touched_slots: set[int] = set()
+        self._touched_snapshot: frozenset[int] | None = frozenset()
         self._star_generation = 0
         self._text_generation = 0
         self._dimension_generation = 0
+        # Replaced, never mutated, so snapshots can share it.
         self._metric_generations: dict[str, int] = {}
         self._mutation_generation = 0
 
@@ -299,8 +511,10 @@ class _MutableColumns:
         star, notes, search_text, metrics = _sidecar_columns(self._store, slot, sidecar)
         with self._lock:
             changed = False
-            if self._stars[slot] != star:
+            previous_star = self._stars[slot]
+            if previous_star != star:
                 self._stars[slot] = star
+                self._set_star_bit_locked(slot, previous_star, star)
                 self._star_generation += 1
                 changed = True
             if self._notes[slot] != notes or self._search_text[slot] != search_text:
@@ -312,6 +526,7 @@ class _MutableColumns:
                 changed = True
             if changed:
                 self._mutation_generation += 1
+                self._touch(slot)
         return True
 
     def update_dimensions(self, path: str, dimensions: tuple[int, int]) -> bool:
@@ -326,6 +541,7 @@ class _MutableColumns:
                 self._dimension_overrides[slot] = override
                 self._dimension_generation += 1
                 self._mutation_generation += 1
+                self._touch(slot)
         return True
 
     def replace(self, sidecars: Mapping[str, SidecarState]) -> None:
@@ -333,50 +549,71 @@ class _MutableColumns:
         notes = [""] * len(self._store.row_ids)
         search_text = list(self._store.static_search_text)
         metrics: list[tuple[tuple[str, float], ...]] = [() for _row_id in self._store.row_ids]
+        touched: list[int] = []
         for path, sidecar in sidecars.items():
             slot = self._store.slot_for_path(path)
             if slot is None:
                 continue
+            touched.append(slot)
             stars[slot], notes[slot], search_text[slot], metrics[slot] = _sidecar_columns(
                 self._store,
                 slot,
                 sidecar,
             )
 
+        star_column = _ChunkedColumn.from_values(stars)
+        notes_column = _ChunkedColumn.from_values(notes)
+        search_column = _ChunkedColumn.from_values(search_text)
         with self._lock:
-            star_changed = stars != self._stars
-            text_changed = notes != self._notes or search_text != self._search_text
+            star_changed = not star_column.same_values(self._stars)
+            text_changed = not (
+                notes_column.same_values(self._notes)
+                and search_column.same_values(self._search_text)
+            )
             if star_changed:
                 self._star_generation += 1
             if text_changed:
                 self._text_generation += 1
             changed_metric_keys = _changed_metric_keys(self._dynamic_metrics, metrics)
-            for key in changed_metric_keys:
-                self._metric_generations[key] = self._metric_generations.get(key, 0) + 1
+            self._bump_metric_generations_locked(changed_metric_keys)
             if star_changed or text_changed or changed_metric_keys:
                 self._mutation_generation += 1
-            self._stars = stars
-            self._notes = notes
-            self._search_text = search_text
-            self._dynamic_metrics = metrics
+            self._stars = star_column
+            self._star_bitmaps = _star_bitmaps(stars, touched)
+            self._notes = notes_column
+            self._search_text = search_column
+            self._dynamic_metrics = _ChunkedColumn.from_values(metrics)
             self._dynamic_metric_counts = _metric_counts(metrics)
+            for slot in touched:
+                self._touch(slot)
 
     def snapshot(self, spec: BrowseQuerySpec) -> _MutableSnapshot:
         requirements = _dependency_requirements(spec)
         with self._lock:
             stamp = self._dependency_stamp_locked(*requirements)
             return _MutableSnapshot(
-                stars=tuple(self._stars),
-                notes=tuple(self._notes),
-                search_text=tuple(self._search_text),
-                dimension_overrides=tuple(self._dimension_overrides),
-                dynamic_metrics=tuple(self._dynamic_metrics),
+                stars=self._stars.view(),
+                notes=self._notes.view(),
+                search_text=self._search_text.view(),
+                dimension_overrides=self._dimension_overrides.view(),
+                dynamic_metrics=self._dynamic_metrics.view(),
                 available_metric_keys=frozenset(
                     (*self._store.metrics.keys(), *self._dynamic_metric_counts.keys())
                 ),
                 dependency_stamp=stamp,
+                touched_slots=self._touched_slots_locked(),
+                star_bitmaps=MappingProxyType(self._star_bitmaps),
+                metric_generations=MappingProxyType(self._metric_generations),
             )
 
+    def _set_star_bit_locked(self, slot: int, previous: int | None, star: int | None) -> None:
+        bitmaps = dict(self._star_bitmaps)
+        if previous:
+            bitmaps[previous] = with_bit(bitmaps.get(previous, 0), slot, False)
+        if star:
+            bitmaps[star] = with_bit(bitmaps.get(star, 0), slot, True)
+        self._star_bitmaps = bitmaps
+
     def available_metric_keys(self) -> tuple[str, ...]:
         with self._lock:
             return tuple(sorted({
@@ -411,6 +648,24 @@ class _MutableColumns:
             unknown_generation=self._mutation_generation if unknown_dependency else 0,
         )
 
+    def _bump_metric_generations_locked(self, keys: Iterable[str]) -> None:
+        generations = dict(self._metric_generations)
+        for key in keys:
+            generations[key] = generations.get(key, 0) + 1
+        self._metric_generations = generations
+
+    def _touch(self, slot: int) -> None:
+        # Touched slots only grow: a slot reset to its static defaults is still
+        # re-evaluated exactly, which is correct, just not vectorized.
+        if slot not in self._touched_slots:
+            self._touched_slots.add(slot)
+            self._touched_snapshot = None
+
+    def _touched_slots_locked(self) -> frozenset[int]:
+        if self._touched_snapshot is None:
+            self._touched_snapshot = frozenset(self._touched_slots)
+        return self._touched_snapshot
+
     def _replace_row_metrics(
         self,
         slot: int,
@@ -421,10 +676,11 @@ class _MutableColumns:
             return False
         previous_map = dict(previous)
         next_map = dict(metrics)
-        for key in previous_map.keys() | next_map.keys():
-            if previous_map.get(key) == next_map.get(key):
-                continue
-            self._metric_generations[key] = self._metric_generations.get(key, 0) + 1
+        self._bump_metric_generations_locked(
+            key
+            for key in previous_map.keys() | next_map.keys()
+            if previous_map.get(key) != next_map.get(key)
+        )
         for key in previous_map:
             count = self._dynamic_metric_counts[key] - 1
             if count:
@@ -471,11 +727,39 @@ class TableFilterAnalysis:
     derived_metric_status: DerivedMetricStatus
     _mutable: _MutableSnapshot = field(repr=False, compare=False)
 
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory retained by the row IDs and derived scores.
+
+        Every row ID is counted as its own boxed int, an upper bound when the
+        ints are shared with the column store's row tuple.
+        """
+        return (
+            sys.getsizeof(self.row_ids)
+            + _BOXED_ROW_ID_BYTES * len(self.row_ids)
+            + _DERIVED_SCORE_BYTES * len(self.derived_scores)
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class TableOrderAnalysis:
     key: TableOrderKey
-    ordered_row_ids: tuple[int, ...]
+    _order: WindowedOrder = field(repr=False, compare=False)
+
+    @property
+    def total(self) -> int:
+        return self._order.total
+
+    @property
+    def ordered_row_ids(self) -> tuple[int, ...]:
+        return self._order.prefix(self._order.total)
+
+    def window(self, start: int, end: int) -> tuple[int, ...]:
+        """Return ordered rows `[start, end)`, selecting only as far as `end`."""
+        return self._order.window(start, end)
+
+    def index_of(self, row_id: int) -> int | None:
+        return self._order.index_of(row_id)
 
 
 class TableQueryEngine:
@@ -487,10 +771,20 @@ class TableQueryEngine:
         *,
         sidecars: Mapping[str, SidecarState] | None = None,
         clock: Callable[[], float] = monotonic,
+        filter_execution: TableFilterExecution = "auto",
     ) -> None:
         self.columns = columns
         self._mutable = _MutableColumns(columns)
         self._clock = clock
+        self._filter_execution = filter_execution
+        self._vectorized = VectorizedFilterColumns(columns)
+        self._sort_ranks = TableSortRanks(columns)
+        self._refinements = FilterRefinementCache()
+        self._histogram_lock = RLock()
+        self._histograms: OrderedDict[
+            tuple[TableFilterKey, str, int, int],
+            dict[str, Any] | None,
+        ] = OrderedDict()
         if sidecars:
             self._mutable.replace(sidecars)
 
@@ -507,6 +801,7 @@ class TableQueryEngine:
         include_source_in_search: bool,
         sidecars: Mapping[str, SidecarState] | None = None,
         clock: Callable[[], float] = monotonic,
+        filter_execution: TableFilterExecution = "auto",
     ) -> TableQueryEngine:
         columns = TableColumnStore.build(
             row_store,
@@ -517,7 +812,12 @@ class TableQueryEngine:
             categoricals_for_row=categoricals_for_row,
             include_source_in_search=include_source_in_search,
         )
-        return cls(columns, sidecars=sidecars, clock=clock)
+        return cls(
+            columns,
+            sidecars=sidecars,
+            clock=clock,
+            filter_execution=filter_execution,
+        )
 
     def update_sidecar(self, path: str, sidecar: SidecarState) -> bool:
         return self._mutable.update(path, sidecar)
@@ -661,6 +961,141 @@ class TableQueryEngine:
             if value is not None:
                 yield value
 
+    def categorical_counts(
+        self,
+        analysis: TableFilterAnalysis,
+        key: str,
+    ) -> Counter[str]:
+        """Count categorical values over the filtered rows.
+
+        Large selections intersect the column's value bitmaps with the
+        selection and popcount, instead of visiting every row.
+        """
+        bitmaps = self.columns.categorical_bitmaps.get(key)
+        if bitmaps is None or not self._vectorized_filter(len(analysis.row_ids)):
+            return Counter(self.iter_categorical_values(analysis, key))
+        selection = self._vectorized.selection_bitmap(analysis.row_ids)
+        counts: Counter[str] = Counter()
+        for value, bitmap in bitmaps.items():
+            count = (bitmap & selection).bit_count()
+            if count:
+                counts[value] = count
+        return counts
+
+    def metric_histograms(
+        self,
+        analysis: TableFilterAnalysis,
+        keys: Iterable[str],
+        bins: int,
+    ) -> dict[str, dict[str, Any] | None]:
+        """Summarize each metric over the filtered rows; None when it has no values.
+
+        Large selections gather static columns with one `take` over the
+        selection's slots and bin them with Arrow kernels. Sidecar metrics and
+        derived scores are merged in as arrays. Summaries are memoized by the
+        analysis key and the metric's sidecar generation, so an unfiltered
+        scope is binned once per revision of that metric.
+        """
+        summaries: dict[str, dict[str, Any] | None] = {}
+        missing: list[str] = []
+        generations = analysis._mutable.metric_generations
+        with self._histogram_lock:
+            for key in keys:
+                cache_key = (analysis.key, key, bins, generations.get(key, 0))
+                if cache_key in self._histograms:
+                    self._histograms.move_to_end(cache_key)
+                    summaries[key] = self._histograms[cache_key]
+                else:
+                    summaries[key] = None
+                    missing.append(key)
+        if not missing:
+            return summaries
+        if self._vectorized_filter(len(analysis.row_ids)):
+            row_array, slots = self._vectorized.slots_for_rows(analysis.row_ids)
+            for key in missing:
+                summaries[key] = histogram_summary_array(
+                    self._metric_array(analysis, key, row_array, slots),
+                    bins,
+                )
+        else:
+            for key in missing:
+                summaries[key] = histogram_summary(list(self.iter_metric_values(analysis, key)), bins)
+        with self._histogram_lock:
+            for key in missing:
+                self._histograms[(analysis.key, key, bins, generations.get(key, 0))] = summaries[key]
+            while len(self._histograms) > MAX_HISTOGRAM_CACHE_ENTRIES:
+                self._histograms.popitem(last=False)
+        return summaries
+
+    def column_histograms(
+        self,
+        row_ids: Sequence[int],
+        keys: Iterable[str],
+        bins: int,
+    ) -> dict[str, dict[str, Any] | None]:
+        """Summarize static metric columns over `row_ids`, ignoring sidecars."""
+        if not self._vectorized_filter(len(row_ids)):
+            slots = [self.columns.slot_for_row(row_id) for row_id in row_ids]
+            return {
+                key: histogram_summary(
+                    [
+                        value
+                        for slot in slots
+                        if (value := self.columns.metric_value(slot, key)) is not None
+                    ],
+                    bins,
+                )
+                for key in keys
+            }
+        load_pyarrow_runtime()
+        import pyarrow.compute as pc
+
+        _row_array, slots = self._vectorized.slots_for_rows(row_ids)
+        summaries: dict[str, dict[str, Any] | None] = {}
+        for key in keys:
+            static = self._vectorized.metric_values(key)
+            summaries[key] = (
+                None if static is None else histogram_summary_array(pc.take(static, slots), bins)
+            )
+        return summaries
+
+    def _metric_array(
+        self,
+        analysis: TableFilterAnalysis,
+        key: str,
+        row_array: Any,
+        slots: Any,
+    ) -> Any:
+        """Return the float64 values of `key` for the selected rows, in no order."""
+        pa = load_pyarrow_runtime().pyarrow
+        import pyarrow.compute as pc
+
+        if key == analysis.derived_metric_status.key:
+            scores = analysis.derived_scores
+            score_rows = pa.array(scores.keys(), type=pa.int64())
+            values = pa.array(scores.values(), type=pa.float64())
+            return values.filter(pc.is_in(score_rows, value_set=row_array))
+        overridden = self._metric_overridden_rows(analysis, key)
+        parts: list[Any] = []
+        static = self._vectorized.metric_values(key)
+        if overridden:
+            moved = pa.array(sorted(overridden), type=pa.int64())
+            moved = moved.filter(pc.is_in(moved, value_set=row_array))
+            if static is not None:
+                slots = slots.filter(pc.invert(pc.is_in(row_array, value_set=moved)))
+            parts.append(pa.array(
+                [
+                    self._metric_value(self.columns.slot_for_row(row_id), key, analysis._mutable)
+                    for row_id in int_list(moved)
+                ],
+                type=pa.float64(),
+            ))
+        if static is not None:
+            parts.append(pc.take(static, slots))
+        if not parts:
+            return pa.array([], type=pa.float64())
+        return pa.concat_arrays(parts) if len(parts) > 1 else parts[0]
+
     def analyze_filter(
         self,
         row_ids: Iterable[int],
@@ -679,19 +1114,48 @@ class TableQueryEngine:
         key = self._filter_key(spec, mutable.dependency_stamp)
         if expected_key is not None and key != expected_key:
             raise TableQueryStale("table query dependencies changed")
-        base_filtered: list[int] = []
-        for row_id in row_ids:
-            slot = self.columns.slot_for_row(row_id)
-            if _matches_text(mutable.search_text[slot], text_query) and self._matches_filters(
+        rows = row_ids if isinstance(row_ids, Sequence) else tuple(row_ids)
+        # Derived scores are normalized over the whole base population, so
+        # only queries without a derived metric can start from a parent.
+        scope = (normalize_item_path(spec.path), spec.recursive, len(rows))
+        refinable = spec.derived_metric is None
+        if refinable:
+            parent = self._refinements.parent_for(
+                scope,
+                filters,
+                text_query,
+                lambda parent_spec, stamp: self._mutable.dependency_stamp(parent_spec) == stamp,
+            )
+            if parent is not None:
+                rows = parent.row_ids
+
+        def matches_base(slot: int) -> bool:
+            return _matches_text(mutable.search_text[slot], text_query) and self._matches_filters(
                 slot,
                 base_filters,
                 mutable,
                 None,
                 None,
                 date_bounds,
-            ):
-                base_filtered.append(row_id)
-            checkpoint.step()
+            )
+
+        if self._vectorized_filter(len(rows)):
+            base_filtered = self._vectorized.filter_rows(
+                rows,
+                base_filters,
+                text_query,
+                date_bounds,
+                touched_slots=mutable.touched_slots,
+                star_bitmaps=mutable.star_bitmaps,
+                matches_slot=matches_base,
+                checkpoint=checkpoint.force,
+            )
+        else:
+            base_filtered = []
+            for row_id in rows:
+                if matches_base(self.columns.slot_for_row(row_id)):
+                    base_filtered.append(row_id)
+                checkpoint.step()
 
         if spec.derived_metric is not None or _references_derived(spec):
             derived_scores, derived_status = self._evaluate_derived(
@@ -704,9 +1168,9 @@ class TableQueryEngine:
             derived_scores = MappingProxyType({})
             derived_status = DerivedMetricStatus()
 
-        filtered: list[int] = []
+        filtered: list[int] = [] if derived_filters.and_clauses else base_filtered
         status_key = derived_status.key
-        for row_id in base_filtered:
+        for row_id in base_filtered if derived_filters.and_clauses else ():
             slot = self.columns.slot_for_row(row_id)
             if self._matches_filters(
                 slot,
@@ -719,7 +1183,7 @@ class TableQueryEngine:
                 filtered.append(row_id)
             checkpoint.step()
         checkpoint.force()
-        return TableFilterAnalysis(
+        analysis = TableFilterAnalysis(
             key=key,
             source_generation=self.columns.source_generation,
             dependency_stamp=mutable.dependency_stamp,
@@ -729,6 +1193,9 @@ class TableQueryEngine:
             derived_metric_status=derived_status,
             _mutable=mutable,
         )
+        if refinable:
+            self._refinements.remember(scope, spec, filters, text_query, analysis)
+        return analysis
 
     def order(
         self,
@@ -738,43 +1205,128 @@ class TableQueryEngine:
         random_seed: str | None = None,
         cancel: CancellationProbe | None = None,
         key: TableOrderKey | None = None,
+        window_end: int | None = None,
     ) -> TableOrderAnalysis:
+        """Order the filtered rows.
+
+        Ordering is windowed: only the first `window_end` rows (all rows when
+        None) are selected up front, and `TableOrderAnalysis.window` extends the
+        selection as deeper pages are requested.
+        """
         checkpoint = _CancellationCheckpoint(cancel, self._clock)
         checkpoint.force()
+        seed = str(random_seed if random_seed is not None else "")
+        ordered = self._ranked_order(analysis, sort, seed) if analysis.row_ids else None
+        if ordered is None:
+            ordered = WindowedOrder(self._sorted_rows(analysis, sort, seed))
+        ordered.select(ordered.total if window_end is None else window_end)
+        checkpoint.force()
+        if key is None:
+            key = TableOrderKey(
+                filter_key=analysis.key,
+                semantic_key=_order_semantic_key(sort, random_seed=random_seed),
+            )
+        return TableOrderAnalysis(key=key, _order=ordered)
+
+    def _ranked_order(
+        self,
+        analysis: TableFilterAnalysis,
+        sort: BrowseSortSpec,
+        seed: str,
+    ) -> WindowedOrder | None:
+        """Order rows by gathering cached global ranks; None keeps the row sort."""
+        rows = analysis.row_ids
+        if isinstance(sort, MetricSortSpec):
+            if sort.key == analysis.derived_metric_status.key:
+                return None
+            ranks = self._sort_ranks.metric_ranks(sort.key, sort.direction)
+        elif sort.key == "random":
+            row_array, slots = self._vectorized.slots_for_rows(rows)
+            return self._sort_ranks.random_order(rows, row_array, slots, seed, _random_key)
+        elif sort.key == "name":
+            ranks = self._sort_ranks.name_ranks(sort.direction)
+        else:
+            ranks = self._sort_ranks.added_ranks(sort.direction)
+        if ranks is None:
+            return None
+        overridden = (
+            self._metric_overridden_rows(analysis, sort.key)
+            if isinstance(sort, MetricSortSpec)
+            else set()
+        )
+        moved = [row_id for row_id in rows if row_id in overridden] if overridden else []
+        if not moved:
+            return self._sort_ranks.windowed_rows(
+                rows,
+                *self._vectorized.slots_for_rows(rows),
+                ranks,
+            )
+
+        # Sidecar metrics override the static column, so rows carrying one are
+        # placed into the static order by their exact sort key.
+        static_rows = [row_id for row_id in rows if row_id not in overridden]
+        ordered: list[int] = []
+        if static_rows:
+            ordered = self._sort_ranks.order_rows(
+                *self._vectorized.slots_for_rows(static_rows),
+                ranks,
+            )
+        sort_key = partial(self._metric_sort_key, sort=sort, analysis=analysis)
+        merged: list[int] = []
+        start = 0
+        for row_id in sorted(moved, key=sort_key):
+            position = bisect_left(ordered, sort_key(row_id), lo=start, key=sort_key)
+            merged.extend(ordered[start:position])
+            merged.append(row_id)
+            start = position
+        merged.extend(ordered[start:])
+        return WindowedOrder(merged)
+
+    def _metric_overridden_rows(self, analysis: TableFilterAnalysis, key: str) -> set[int]:
+        mutable = analysis._mutable
+        row_ids = self.columns.row_ids
+        return {
+            row_ids[slot]
+            for slot in mutable.touched_slots
+            if mutable.dynamic_metric_value(slot, key) is not None
+        }
+
+    def _sorted_rows(
+        self,
+        analysis: TableFilterAnalysis,
+        sort: BrowseSortSpec,
+        seed: str,
+    ) -> list[int]:
         rows = analysis.row_ids
         if isinstance(sort, MetricSortSpec):
-            ordered = sorted(
+            return sorted(
                 rows,
                 key=lambda row_id: self._metric_sort_key(row_id, sort, analysis),
             )
-        elif sort.key == "random":
-            seed = str(random_seed if random_seed is not None else "")
-            ordered = sorted(
+        if sort.key == "random":
+            return sorted(
                 rows,
                 key=lambda row_id: (
                     _random_key(seed, self._identity(row_id)),
                     self._identity(row_id),
                 ),
             )
-        elif sort.key == "name":
+        if sort.key == "name":
             sort_key = (
                 self._descending_name_sort_key if sort.direction == "desc" else self._name_sort_key
             )
-            ordered = sorted(rows, key=sort_key)
-        else:
-            sort_key = (
-                self._descending_added_sort_key
-                if sort.direction == "desc"
-                else self._added_sort_key
-            )
-            ordered = sorted(rows, key=sort_key)
-        checkpoint.force()
-        if key is None:
-            key = TableOrderKey(
-                filter_key=analysis.key,
-                semantic_key=_order_semantic_key(sort, random_seed=random_seed),
-            )
-        return TableOrderAnalysis(key=key, ordered_row_ids=tuple(ordered))
+            return sorted(rows, key=sort_key)
+        sort_key = (
+            self._descending_added_sort_key
+            if sort.direction == "desc"
+            else self._added_sort_key
+        )
+        return sorted(rows, key=sort_key)
+
+    def _vectorized_filter(self, row_count: int) -> bool:
+        if self._filter_execution == "auto":
+            return row_count >= VECTORIZED_FILTER_MIN_ROWS
+        return self._filter_execution == "vectorized"
 
     def _filter_key(
         self,
@@ -1144,8 +1696,17 @@ def _sidecar_columns(
     return star, notes, search_text, tuple(sorted(metrics.items()))
 
 
+def _star_bitmaps(stars: Sequence[int | None], slots: Iterable[int]) -> dict[int, int]:
+    rated: dict[int, list[int]] = {}
+    for slot in slots:
+        star = stars[slot]
+        if star:
+            rated.setdefault(star, []).append(slot)
+    return {star: slots_bitmap(rated_slots, len(stars)) for star, rated_slots in rated.items()}
+
+
 def _changed_metric_keys(
-    previous: list[tuple[tuple[str, float], ...]],
+    previous: Iterable[tuple[tuple[str, float], ...]],
     current: list[tuple[tuple[str, float], ...]],
 ) -> set[str]:
     changed: set[str] = set()
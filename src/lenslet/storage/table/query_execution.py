@@ -79,6 +79,7 @@ def order_analysis(
         random_seed=spec.random_seed,
         cancel=cancel,
         key=key,
+        window_end=spec.offset + max(0, spec.limit),
     )
 
 
@@ -117,14 +118,9 @@ def query_scope_from_analysis(
         if spec.offset == 0 and spec.anchor_path is not None
         else None
     )
-    anchor_index = None
-    if anchor_row_id is not None:
-        try:
-            anchor_index = ordered.ordered_row_ids.index(anchor_row_id)
-        except ValueError:
-            pass
+    anchor_index = ordered.index_of(anchor_row_id) if anchor_row_id is not None else None
     start = resolve_browse_window_offset(
-        len(ordered.ordered_row_ids),
+        ordered.total,
         spec.offset,
         spec.limit,
         anchor_index,
@@ -144,7 +140,7 @@ def query_scope_from_analysis(
                 projected_metric_keys,
                 projected_categorical_keys,
             )
-            for row_id in ordered.ordered_row_ids[start:end]
+            for row_id in ordered.window(start, end)
         )
     return BrowseQueryResult(
         path=_canonical_path(norm),
@@ -0,0 +1,345 @@
+"""Cached global sort permutations for table query ordering.
+
+Each sortable column and direction gets a rank array mapping a column-store
+slot to its position in the full-table order. The ranks reproduce the row
+engine's sort keys exactly, including `DescendingTextSortKey` prefix ordering
+and stable-identity tie breaks, so ordering a filtered subset is a gather of
+ranks followed by one integer sort.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Literal
+
+from .pyarrow_runtime import load_pyarrow_runtime
+from .query_vectorized import int_list
+
+if TYPE_CHECKING:
+    from .query_engine import TableColumnStore, _NumericColumn
+
+
+SortDirection = Literal["asc", "desc"]
+RANDOM_KEY_CACHE_SEEDS = 2
+MIN_WINDOW_EXTENSION_ROWS = 256
+
+
+class WindowedOrder:
+    """Ordered row IDs whose sorted prefix is selected on demand.
+
+    Each extension selects only the next rows with a top-k partial selection
+    over the rows not yet placed, growing the prefix at least geometrically so
+    deep paging costs O(n log n) overall instead of a full sort per page.
+    Positions of placed rows are indexed on the first anchor lookup and kept
+    current as the prefix grows.
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[int],
+        *,
+        row_array: Any = None,
+        sort_table: Any = None,
+        sort_keys: Sequence[tuple[str, str]] = (),
+    ) -> None:
+        self._lock = Lock()
+        self._total = len(rows)
+        self._positions: dict[int, int] = {}
+        if sort_table is None:
+            self._prefix = list(rows)
+            self._remaining = None
+            return
+        runtime = load_pyarrow_runtime()
+        import pyarrow.compute as compute
+
+        self._pa = runtime.pyarrow
+        self._pc = compute
+        self._prefix = []
+        self._row_array = row_array
+        self._sort_keys = list(sort_keys)
+        self._remaining = sort_table.append_column(
+            "position",
+            self._pa.array(range(self._total), type=self._pa.int64()),
+        )
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def selected(self) -> int:
+        return len(self._prefix)
+
+    def select(self, end: int) -> None:
+        """Make sure the first `end` rows are placed."""
+        with self._lock:
+            self._extend_locked(min(max(0, end), self._total))
+
+    def prefix(self, end: int) -> tuple[int, ...]:
+        end = min(max(0, end), self._total)
+        with self._lock:
+            self._extend_locked(end)
+            return tuple(self._prefix[:end])
+
+    def window(self, start: int, end: int) -> tuple[int, ...]:
+        end = min(max(0, end), self._total)
+        with self._lock:
+            self._extend_locked(end)
+            return tuple(self._prefix[max(0, start):end])
+
+    def index_of(self, row_id: int) -> int | None:
+        """Return the position of `row_id`, placing rows only until it is found."""
+        with self._lock:
+            self._index_prefix_locked()
+            position = self._positions.get(row_id)
+            if position is not None or self._remaining is None:
+                return position
+            if self._pc.index(self._row_array, row_id).as_py() < 0:
+                # Not among the ordered rows: no amount of selection will place it.
+                return None
+            while position is None and self._remaining is not None:
+                # Each step at least doubles the prefix, like forward paging.
+                self._extend_locked(len(self._prefix) + 1)
+                self._index_prefix_locked()
+                position = self._positions.get(row_id)
+            return position
+
+    def _index_prefix_locked(self) -> None:
+        positions = self._positions
+        prefix = self._prefix
+        for position in range(len(positions), len(prefix)):
+            positions[prefix[position]] = position
+
+    def _extend_locked(self, end: int) -> None:
+        remaining = self._remaining
+        if remaining is None or end <= len(self._prefix):
+            return
+        pc = self._pc
+        wanted = max(end - len(self._prefix), len(self._prefix), MIN_WINDOW_EXTENSION_ROWS)
+        if wanted >= remaining.num_rows:
+            chosen = pc.sort_indices(remaining, sort_keys=self._sort_keys)
+            self._remaining = None
+        else:
+            chosen = pc.select_k_unstable(remaining, wanted, sort_keys=self._sort_keys)
+        positions = pc.take(remaining.column("position"), chosen).combine_chunks()
+        self._prefix.extend(int_list(pc.take(self._row_array, positions)))
+        if self._remaining is not None:
+            placed = pc.is_in(remaining.column("position"), value_set=positions)
+            self._remaining = remaining.filter(pc.invert(placed))
+
+
+class TableSortRanks:
+    """Lazily built, thread-safe rank arrays over one immutable column store."""
+
+    def __init__(self, columns: TableColumnStore) -> None:
+        runtime = load_pyarrow_runtime()
+        import pyarrow.compute as compute
+
+        self._pa = runtime.pyarrow
+        self._pc = compute
+        self._errors = (*runtime.arrow_errors, UnicodeError)
+        self._columns = columns
+        self._lock = Lock()
+        self._cache: dict[tuple[str, ...], Any] = {}
+        self._random_keys: OrderedDict[str, tuple[array[int], bytearray]] = OrderedDict()
+
+    def order_rows(self, row_array: Any, slots: Any, ranks: Any) -> list[int]:
+        """Return `row_array` sorted by the rank of each row's slot."""
+        pc = self._pc
+        return int_list(pc.take(row_array, pc.sort_indices(pc.take(ranks, slots))))
+
+    def windowed_rows(
+        self,
+        rows: Sequence[int],
+        row_array: Any,
+        slots: Any,
+        ranks: Any,
+    ) -> WindowedOrder:
+        return WindowedOrder(
+            rows,
+            row_array=row_array,
+            sort_table=self._pa.table({"rank": self._pc.take(ranks, slots)}),
+            sort_keys=[("rank", "ascending")],
+        )
+
+    def name_ranks(self, direction: SortDirection) -> Any | None:
+        return self._cached(("name", direction), lambda: self._build_name_ranks(direction))
+
+    def added_ranks(self, direction: SortDirection) -> Any | None:
+        return self._cached(("added", direction), lambda: self._build_added_ranks(direction))
+
+    def metric_ranks(self, key: str, direction: SortDirection) -> Any | None:
+        return self._cached(
+            ("metric", key, direction),
+            lambda: self._build_metric_ranks(key, direction),
+        )
+
+    def identity_ranks(self) -> Any | None:
+        return self._cached(("identity",), self._build_identity_ranks)
+
+    def random_order(
+        self,
+        rows: Sequence[int],
+        row_array: Any,
+        slots: Any,
+        seed: str,
+        random_key: Callable[[str, str], int],
+    ) -> WindowedOrder | None:
+        """Return `rows` in seeded random order.
+
+        Hash keys are memoized per slot for the most recent seeds, so changing
+        filters under one seed hashes each row at most once.
+        """
+        identities = self.identity_ranks()
+        if identities is None:
+            return None
+        keys, computed = self._random_key_memo(seed)
+        stable_identities = self._columns.stable_identities
+        for slot in int_list(slots):
+            if not computed[slot]:
+                keys[slot] = random_key(seed, stable_identities[slot])
+                computed[slot] = 1
+        pa = self._pa
+        pc = self._pc
+        key_array = pa.Array.from_buffers(pa.uint64(), len(keys), [None, pa.py_buffer(keys)])
+        return WindowedOrder(
+            rows,
+            row_array=row_array,
+            sort_table=pa.table({
+                "key": pc.take(key_array, slots),
+                "identity": pc.take(identities, slots),
+            }),
+            sort_keys=[("key", "ascending"), ("identity", "ascending")],
+        )
+
+    def _random_key_memo(self, seed: str) -> tuple[array[int], bytearray]:
+        with self._lock:
+            memo = self._random_keys.get(seed)
+            if memo is None:
+                row_count = len(self._columns.row_ids)
+                memo = (array("Q", [0]) * row_count, bytearray(row_count))
+                self._random_keys[seed] = memo
+                while len(self._random_keys) > RANDOM_KEY_CACHE_SEEDS:
+                    self._random_keys.popitem(last=False)
+            else:
+                self._random_keys.move_to_end(seed)
+            return memo
+
+    def _cached(self, key: tuple[str, ...], build: Callable[[], Any]) -> Any | None:
+        with self._lock:
+            if key not in self._cache:
+                try:
+                    self._cache[key] = build()
+                except self._errors:
+                    # Strings Arrow cannot encode keep the row-at-a-time sort.
+                    self._cache[key] = None
+            return self._cache[key]
+
+    def _build_name_ranks(self, direction: SortDirection) -> Any:
+        if direction == "desc":
+            return self._ranks_for(
+                {
+                    "name": self._descending_text_ranks(self._columns.names),
+                    "identity": self._descending_text_ranks(self._columns.stable_identities),
+                },
+                [("name", "ascending"), ("identity", "ascending")],
+            )
+        return self._ranks_for(
+            {
+                "name": self._strings(self._columns.names),
+                "identity": self._strings(self._columns.stable_identities),
+            },
+            [("name", "ascending"), ("identity", "ascending")],
+        )
+
+    def _build_added_ranks(self, direction: SortDirection) -> Any:
+        pc = self._pc
+        added = self._numeric(self._columns.added_ms)
+        added = pc.if_else(pc.is_nan(added), 0.0, added)
+        order = "descending" if direction == "desc" else "ascending"
+        names = self._name_ranks_locked(direction)
+        return self._ranks_for(
+            {"added": added, "name": names},
+            [("added", order), ("name", "ascending")],
+        )
+
+    def _build_metric_ranks(self, key: str, direction: SortDirection) -> Any:
+        pa = self._pa
+        pc = self._pc
+        column = self._columns.metrics.get(key)
+        if column is None:
+            values = pa.nulls(len(self._columns.row_ids), type=pa.float64())
+        else:
+            values = self._numeric(column)
+            values = pc.if_else(pc.is_nan(values), pa.scalar(None, type=pa.float64()), values)
+        order = "descending" if direction == "desc" else "ascending"
+        return self._ranks_for(
+            {"value": values, "name": self._name_ranks_locked("asc")},
+            [("value", order), ("name", "ascending")],
+        )
+
+    def _build_identity_ranks(self) -> Any:
+        return self._ranks_for(
+            {"identity": self._strings(self._columns.stable_identities)},
+            [("identity", "ascending")],
+        )
+
+    def _name_ranks_locked(self, direction: SortDirection) -> Any:
+        key = ("name", direction)
+        if key not in self._cache:
+            self._cache[key] = self._build_name_ranks(direction)
+        ranks = self._cache[key]
+        if ranks is None:
+            raise UnicodeError("name ranks are unavailable")
+        return ranks
+
+    def _ranks_for(self, columns: dict[str, Any], sort_keys: list[tuple[str, str]]) -> Any:
+        permutation = self._pc.sort_indices(
+            self._pa.table(columns),
+            sort_keys=sort_keys,
+            null_placement="at_end",
+        )
+        # The argsort of a permutation is its inverse: slot -> rank.
+        return self._pc.sort_indices(permutation)
+
+    def _descending_text_ranks(self, values: Sequence[str]) -> Any:
+        """Rank strings in `DescendingTextSortKey` order; equal strings tie.
+
+        In ascending order every string is followed by the contiguous run of
+        strings it prefixes. Descending order puts a prefix before that run and
+        reverses everything else, which is ascending order of (-run end, start).
+        """
+        pa = self._pa
+        pc = self._pc
+        strings = self._strings(values)
+        unique = pc.unique(strings)
+        ascending = pc.sort_indices(unique)
+        ordered = pc.take(unique, ascending).to_pylist()
+        ends = [0] * len(ordered)
+        stack: list[int] = []
+        for index, text in enumerate(ordered):
+            while stack and not text.startswith(ordered[stack[-1]]):
+                ends[stack.pop()] = index - 1
+            stack.append(index)
+        for index in stack:
+            ends[index] = len(ordered) - 1
+        sorted_ranks = self._ranks_for(
+            {
+                "end": pa.array(ends, type=pa.int64()),
+                "start": pa.array(range(len(ordered)), type=pa.int64()),
+            },
+            [("end", "descending"), ("start", "ascending")],
+        )
+        unique_ranks = pc.take(sorted_ranks, pc.sort_indices(ascending))
+        return pc.take(unique_ranks, pc.index_in(strings, value_set=unique))
+
+    def _strings(self, values: Sequence[str]) -> Any:
+        return self._pa.array(values, type=self._pa.large_string())
+
+    def _numeric(self, column: _NumericColumn) -> Any:
+        pa = self._pa
+        values = column._values
+        return pa.Array.from_buffers(pa.float64(), len(values), [None, pa.py_buffer(values)])
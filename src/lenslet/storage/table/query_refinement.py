@@ -0,0 +1,158 @@
+"""Reuse of cached filter analyses for strictly narrower queries.
+
+Brushing a metric range or typing one more character produces a filter that
+every row of the previous result must already satisfy. When a remembered
+analysis provably contains the new result, filtering its row IDs instead of
+the whole scope yields the same rows in the same order, because filtering
+preserves input order and the parent rows are a subsequence of the scope.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from ...browse.query import (
+    BrowseFilterAst,
+    BrowseFilterClause,
+    BrowseQuerySpec,
+    CategoricalInFilter,
+    MetricRangeFilter,
+    NameContainsFilter,
+    NotesContainsFilter,
+    StarsInFilter,
+    StarsNotInFilter,
+    UrlContainsFilter,
+)
+
+if TYPE_CHECKING:
+    from .query_engine import TableDependencyStamp, TableFilterAnalysis
+
+
+MAX_REFINEMENT_PARENTS = 16
+REFINEMENT_PARENT_BUDGET_BYTES = 64 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class _Parent:
+    scope: Hashable
+    spec: BrowseQuerySpec
+    filters: BrowseFilterAst
+    text_query: str | None
+    analysis: TableFilterAnalysis
+
+
+class FilterRefinementCache:
+    """Bounded LRU of recent filter analyses that later queries may narrow.
+
+    Entries share their row-ID tuples with the analyses handed to callers, so
+    the byte budget mostly limits how long those tuples stay alive.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = MAX_REFINEMENT_PARENTS,
+        budget_bytes: int = REFINEMENT_PARENT_BUDGET_BYTES,
+    ) -> None:
+        self._lock = Lock()
+        self._max_entries = max_entries
+        self._budget_bytes = budget_bytes
+        self._parents: OrderedDict[Hashable, _Parent] = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def parent_for(
+        self,
+        scope: Hashable,
+        filters: BrowseFilterAst,
+        text_query: str | None,
+        is_current: Callable[[BrowseQuerySpec, TableDependencyStamp], bool],
+    ) -> TableFilterAnalysis | None:
+        """Return the smallest remembered analysis whose rows contain the new result.
+
+        `is_current` reports whether the state a parent's query depends on is
+        unchanged since its stamp was taken.
+        """
+        best: _Parent | None = None
+        best_key: Hashable = None
+        with self._lock:
+            for key, parent in self._parents.items():
+                if (
+                    parent.scope != scope
+                    or (best is not None and len(parent.analysis.row_ids) >= len(best.analysis.row_ids))
+                    or not filter_implies(filters, text_query, parent.filters, parent.text_query)
+                    or not is_current(parent.spec, parent.analysis.dependency_stamp)
+                ):
+                    continue
+                best = parent
+                best_key = key
+            if best is None:
+                return None
+            self._parents.move_to_end(best_key)
+            return best.analysis
+
+    def remember(
+        self,
+        scope: Hashable,
+        spec: BrowseQuerySpec,
+        filters: BrowseFilterAst,
+        text_query: str | None,
+        analysis: TableFilterAnalysis,
+    ) -> None:
+        parent = _Parent(scope, spec, filters, text_query, analysis)
+        with self._lock:
+            previous = self._parents.pop(analysis.key, None)
+            if previous is not None:
+                self._nbytes -= previous.analysis.nbytes
+            self._parents[analysis.key] = parent
+            self._nbytes += analysis.nbytes
+            while len(self._parents) > self._max_entries or (
+                self._nbytes > self._budget_bytes and len(self._parents) > 1
+            ):
+                _key, evicted = self._parents.popitem(last=False)
+                self._nbytes -= evicted.analysis.nbytes
+
+
+def filter_implies(
+    filters: BrowseFilterAst,
+    text_query: str | None,
+    parent_filters: BrowseFilterAst,
+    parent_text_query: str | None,
+) -> bool:
+    """Whether every row matching `filters` also matches the parent filters."""
+    if parent_text_query is not None and (
+        text_query is None or parent_text_query.lower() not in text_query.lower()
+    ):
+        return False
+    return all(
+        any(_clause_implies(clause, parent) for clause in filters.and_clauses)
+        for parent in parent_filters.and_clauses
+    )
+
+
+def _clause_implies(clause: BrowseFilterClause, parent: BrowseFilterClause) -> bool:
+    if clause == parent:
+        return True
+    if type(clause) is not type(parent):
+        return False
+    if isinstance(clause, MetricRangeFilter) and isinstance(parent, MetricRangeFilter):
+        return (
+            clause.key == parent.key
+            and clause.min_value >= parent.min_value
+            and clause.max_value <= parent.max_value
+        )
+    if isinstance(clause, StarsInFilter) and isinstance(parent, StarsInFilter):
+        return set(clause.values) <= set(parent.values)
+    if isinstance(clause, StarsNotInFilter) and isinstance(parent, StarsNotInFilter):
+        return set(clause.values) >= set(parent.values)
+    if isinstance(clause, CategoricalInFilter) and isinstance(parent, CategoricalInFilter):
+        return clause.key == parent.key and set(clause.values) <= set(parent.values)
+    if isinstance(clause, (NameContainsFilter, NotesContainsFilter, UrlContainsFilter)):
+        return parent.value.lower() in clause.value.lower()  # type: ignore[union-attr]
+    return False
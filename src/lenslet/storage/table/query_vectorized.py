@@ -0,0 +1,399 @@
+"""Arrow compute kernels for batch evaluation of table filter clauses.
+
+The kernels evaluate a normalized filter AST against the immutable
+`TableColumnStore` buffers one chunk of rows at a time. Mutable sidecar state
+(stars, notes, search text, dimension overrides, dynamic metrics) is sparse, so
+the kernels assume static defaults for every row and leave the slots the
+mutable columns have touched to the exact per-row evaluator.
+
+Star and categorical clauses are answered from slot bitmaps, and substring
+clauses narrow each chunk to the candidates of a trigram index over the same
+lowered column, so only the surviving rows reach the Arrow kernels.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from ...browse.query import (
+    BrowseFilterAst,
+    CategoricalInFilter,
+    DateRangeFilter,
+    HeightCompareFilter,
+    MetricRangeFilter,
+    NameContainsFilter,
+    NameNotContainsFilter,
+    NotesContainsFilter,
+    NotesNotContainsFilter,
+    StarsInFilter,
+    StarsNotInFilter,
+    UrlContainsFilter,
+    UrlNotContainsFilter,
+    WidthCompareFilter,
+)
+from .bitmaps import bitmap_mask, full_bitmap, mask_bitmap, stars_bitmap, union
+from .pyarrow_runtime import load_pyarrow_runtime
+from .text_index import TrigramIndex, intersect_candidates
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .query_engine import TableColumnStore, _NumericColumn
+
+
+VECTORIZED_CHUNK_ROWS = 65_536
+
+
+class VectorizedFilterColumns:
+    """Lazily built Arrow views over one immutable column store."""
+
+    def __init__(self, columns: TableColumnStore) -> None:
+        runtime = load_pyarrow_runtime()
+        import pyarrow.compute as compute
+
+        self._pa = runtime.pyarrow
+        self._pc = compute
+        self._columns = columns
+        self._lock = Lock()
+        self._cache: dict[tuple[str, str], Any] = {}
+        self._row_chunks: tuple[tuple[int, ...], list[tuple[Any, Any]]] | None = None
+
+    def metric_values(self, key: str) -> Any | None:
+        """Return the static float64 column of metric `key`, NaN where missing."""
+        column = self._columns.metrics.get(key)
+        if column is None:
+            return None
+        return self._numeric(f"metric:{key}", column)
+
+    def slots_for_rows(self, row_ids: Sequence[int]) -> tuple[Any, Any]:
+        pa = self._pa
+        row_array = pa.array(row_ids, type=pa.int64())
+        slot_map = self._cached(("slots", ""), self._build_slot_map)
+        valid = self._pc.and_(
+            self._pc.greater_equal(row_array, 0),
+            self._pc.less(row_array, len(slot_map)),
+        )
+        if valid.false_count:
+            missing = row_array.filter(self._pc.invert(valid))[0].as_py()
+            raise KeyError(f"unknown table row ID: {missing}")
+        slots = self._pc.take(slot_map, row_array)
+        if slots.null_count:
+            missing = row_array.filter(self._pc.is_null(slots))[0].as_py()
+            raise KeyError(f"unknown table row ID: {missing}")
+        return row_array, slots
+
+    def filter_rows(
+        self,
+        row_ids: Sequence[int],
+        filters: BrowseFilterAst,
+        text_query: str | None,
+        date_bounds: Mapping[DateRangeFilter, tuple[float | None, float | None] | None],
+        *,
+        touched_slots: frozenset[int],
+        star_bitmaps: Mapping[int, int],
+        matches_slot: Callable[[int], bool],
+        checkpoint: Callable[[], None],
+    ) -> list[int]:
+        """Return `row_ids` that pass `filters`, preserving input order.
+
+        Touched slots are re-evaluated with `matches_slot` so mutable sidecar
+        state keeps the row evaluator's exact semantics.
+        """
+        pa = self._pa
+        pc = self._pc
+        bitmap, filters = self._bitmap_clauses(filters, star_bitmaps)
+        touched = (
+            pa.array(sorted(touched_slots), type=pa.int64())
+            if touched_slots and _reads_mutable_columns(filters, text_query)
+            else None
+        )
+        candidates = self._candidate_slots(filters, text_query)
+        candidate_mask = (
+            pc.is_in(self._slot_range(), value_set=candidates)
+            if candidates is not None
+            else None
+        )
+        if bitmap is not None:
+            selected_mask = bitmap_mask(pa, bitmap, len(self._columns.row_ids))
+            candidate_mask = (
+                selected_mask
+                if candidate_mask is None
+                else pc.and_(candidate_mask, selected_mask)
+            )
+        cached = self._row_chunks
+        chunks = cached[1] if cached is not None and cached[0] is row_ids else None
+        converted: list[tuple[Any, Any]] = []
+        selected: list[int] = []
+        for index, start in enumerate(range(0, len(row_ids), VECTORIZED_CHUNK_ROWS)):
+            checkpoint()
+            if chunks is not None:
+                row_array, slots = chunks[index]
+            else:
+                row_array, slots = self.slots_for_rows(row_ids[start:start + VECTORIZED_CHUNK_ROWS])
+                converted.append((row_array, slots))
+            if candidate_mask is not None:
+                keep = pc.take(candidate_mask, slots)
+                if touched is not None:
+                    keep = pc.or_(keep, pc.is_in(slots, value_set=touched))
+                if not keep.true_count:
+                    continue
+                row_array = row_array.filter(keep)
+                slots = slots.filter(keep)
+            mask = self._evaluate(slots, filters, text_query, date_bounds)
+            if touched is not None:
+                is_touched = pc.is_in(slots, value_set=touched)
+                if is_touched.true_count:
+                    exact = [
+                        matches_slot(slot)
+                        for slot in slots.filter(is_touched).to_pylist()
+                    ]
+                    mask = pc.replace_with_mask(mask, is_touched, pa.array(exact, type=pa.bool_()))
+            selected.extend(int_list(row_array.filter(mask)))
+        checkpoint()
+        if chunks is None and isinstance(row_ids, tuple):
+            # Scopes are immutable tuples, so repeated queries over one scope
+            # reuse its converted row and slot arrays.
+            self._row_chunks = (row_ids, converted)
+        return selected
+
+    def _bitmap_clauses(
+        self,
+        filters: BrowseFilterAst,
+        star_bitmaps: Mapping[int, int],
+    ) -> tuple[int | None, BrowseFilterAst]:
+        """AND the bitmaps of star and categorical clauses; return the rest."""
+        row_count = len(self._columns.row_ids)
+        bitmap: int | None = None
+        remaining: list[object] = []
+        for clause in filters.and_clauses:
+            if isinstance(clause, StarsInFilter):
+                selected = stars_bitmap(clause.values, star_bitmaps, row_count)
+            elif isinstance(clause, StarsNotInFilter):
+                selected = full_bitmap(row_count) & ~stars_bitmap(clause.values, star_bitmaps, row_count)
+            elif (
+                isinstance(clause, CategoricalInFilter)
+                and clause.key in self._columns.categorical_bitmaps
+            ):
+                values = self._columns.categorical_bitmaps[clause.key]
+                selected = union(values.get(value, 0) for value in set(clause.values) if value)
+            else:
+                remaining.append(clause)
+                continue
+            bitmap = selected if bitmap is None else bitmap & selected
+        return bitmap, BrowseFilterAst(tuple(remaining))
+
+    def selection_bitmap(self, row_ids: Sequence[int]) -> int:
+        """Return the slots of `row_ids` as a bitmap."""
+        row_count = len(self._columns.row_ids)
+        if len(row_ids) == row_count:
+            return full_bitmap(row_count)
+        _row_array, slots = self.slots_for_rows(row_ids)
+        return mask_bitmap(self._pc.is_in(self._slot_range(), value_set=slots))
+
+    def _candidate_slots(self, filters: BrowseFilterAst, text_query: str | None) -> Any | None:
+        """Intersect trigram candidates of every substring predicate; None keeps all slots."""
+        needles: list[tuple[str, str]] = []
+        if text_query is not None:
+            needles.append(("search_text", text_query.lower()))
+        for clause in filters.and_clauses:
+            if isinstance(clause, NameContainsFilter):
+                needles.append(("names", clause.value.lower()))
+            elif isinstance(clause, UrlContainsFilter):
+                needles.append(("urls", clause.value.lower()))
+        candidates = None
+        for column, needle in needles:
+            candidates = intersect_candidates(candidates, self._trigrams(column).candidates(needle))
+        return candidates
+
+    def _evaluate(
+        self,
+        slots: Any,
+        filters: BrowseFilterAst,
+        text_query: str | None,
+        date_bounds: Mapping[DateRangeFilter, tuple[float | None, float | None] | None],
+    ) -> Any:
+        """Return a boolean mask for `slots` under static mutable-column defaults."""
+        pa = self._pa
+        mask = None
+        if text_query is not None:
+            mask = self._contains("search_text", slots, text_query.lower())
+        for clause in filters.and_clauses:
+            clause_mask = self._clause_mask(slots, clause, date_bounds)
+            if clause_mask is None:
+                continue
+            if clause_mask is False:
+                return pa.repeat(pa.scalar(False), len(slots))
+            mask = clause_mask if mask is None else self._pc.and_(mask, clause_mask)
+        return mask if mask is not None else pa.repeat(pa.scalar(True), len(slots))
+
+    def _clause_mask(
+        self,
+        slots: Any,
+        clause: object,
+        date_bounds: Mapping[DateRangeFilter, tuple[float | None, float | None] | None],
+    ) -> Any:
+        pc = self._pc
+        if isinstance(clause, (NotesContainsFilter, NotesNotContainsFilter)):
+            return False
+        if isinstance(clause, NameContainsFilter):
+            return self._contains("names", slots, clause.value.lower())
+        if isinstance(clause, NameNotContainsFilter):
+            return pc.invert(self._contains("names", slots, clause.value.lower()))
+        if isinstance(clause, (UrlContainsFilter, UrlNotContainsFilter)):
+            values = pc.take(self._lowered("urls"), slots)
+            contains = pc.match_substring(values, clause.value.lower())
+            if isinstance(clause, UrlNotContainsFilter):
+                contains = pc.invert(contains)
+            return pc.fill_null(contains, False)
+        if isinstance(clause, DateRangeFilter):
+            bounds = date_bounds[clause]
+            if bounds is None:
+                return False
+            values = pc.take(self._numeric("added_ms", self._columns.added_ms), slots)
+            mask = pc.greater(values, 0.0)
+            from_ms, to_ms = bounds
+            if from_ms is not None:
+                mask = pc.and_(mask, pc.greater_equal(values, from_ms))
+            if to_ms is not None:
+                mask = pc.and_(mask, pc.less_equal(values, to_ms))
+            return mask
+        if isinstance(clause, (WidthCompareFilter, HeightCompareFilter)):
+            if isinstance(clause, WidthCompareFilter):
+                values = pc.take(self._numeric("widths", self._columns.widths), slots)
+            else:
+                values = pc.take(self._numeric("heights", self._columns.heights), slots)
+            mask = pc.greater(values, 0.0)
+            compare = _COMPARE_KERNELS.get(clause.op)
+            if compare is not None:
+                mask = pc.and_(mask, getattr(pc, compare)(values, clause.value))
+            return mask
+        if isinstance(clause, MetricRangeFilter):
+            column = self._columns.metrics.get(clause.key)
+            if column is None:
+                return False
+            values = pc.take(self._numeric(f"metric:{clause.key}", column), slots)
+            return pc.and_(
+                pc.greater_equal(values, clause.min_value),
+                pc.less_equal(values, clause.max_value),
+            )
+        if isinstance(clause, CategoricalInFilter):
+            wanted = [value for value in clause.values if value]
+            if clause.key not in self._columns.categoricals or not wanted:
+                return False
+            values = pc.take(self._categorical(clause.key), slots)
+            value_set = self._pa.array(wanted, type=self._pa.large_string())
+            return pc.fill_null(pc.is_in(values, value_set=value_set), False)
+        return None
+
+    def _contains(self, column: str, slots: Any, needle: str) -> Any:
+        values = self._pc.take(self._lowered(column), slots)
+        return self._pc.fill_null(self._pc.match_substring(values, needle), False)
+
+    def _lowered(self, column: str) -> Any:
+        return self._cached(("lowered", column), lambda: self._build_lowered(column))
+
+    def _trigrams(self, column: str) -> TrigramIndex:
+        lowered = self._lowered(column)
+        return self._cached(("trigrams", column), lambda: TrigramIndex(lowered))
+
+    def _slot_range(self) -> Any:
+        return self._cached(
+            ("slot_range", ""),
+            lambda: self._pa.array(range(len(self._columns.row_ids)), type=self._pa.int64()),
+        )
+
+    def _numeric(self, name: str, column: _NumericColumn) -> Any:
+        return self._cached(("numeric", name), lambda: self._build_numeric(column))
+
+    def _categorical(self, key: str) -> Any:
+        return self._cached(
+            ("categorical", key),
+            lambda: self._pa.array(self._columns.categoricals[key], type=self._pa.large_string()),
+        )
+
+    def _cached(self, key: tuple[str, str], build: Callable[[], Any]) -> Any:
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                value = build()
+                self._cache[key] = value
+            return value
+
+    def _build_slot_map(self) -> Any:
+        row_ids = self._columns.row_ids
+        size = max(row_ids, default=-1) + 1
+        dense: list[int | None] = [None] * size
+        for slot, row_id in enumerate(row_ids):
+            dense[row_id] = slot
+        return self._pa.array(dense, type=self._pa.int64())
+
+    def _build_numeric(self, column: _NumericColumn) -> Any:
+        pa = self._pa
+        values = column._values
+        return pa.Array.from_buffers(pa.float64(), len(values), [None, pa.py_buffer(values)])
+
+    def _build_lowered(self, column: str) -> Any:
+        if column == "names":
+            values: Sequence[str | None] = self._columns.names
+        elif column == "search_text":
+            values = self._columns.static_search_text
+        else:
+            values = [
+                source or url or None
+                for source, url in zip(self._columns.sources, self._columns.urls)
+            ]
+        return _lowered_strings(self._pa, self._pc, values)
+
+
+def int_list(values: Any) -> list[int]:
+    """Convert an Arrow int64/uint64 array to Python ints without per-value scalars."""
+    if not len(values):
+        return []
+    if values.null_count or values.type.bit_width != 64:
+        return values.to_pylist()
+    code = "Q" if load_pyarrow_runtime().pyarrow.types.is_unsigned_integer(values.type) else "q"
+    view = memoryview(values.buffers()[1]).cast(code)
+    return view[values.offset:values.offset + len(values)].tolist()
+
+
+def _reads_mutable_columns(filters: BrowseFilterAst, text_query: str | None) -> bool:
+    """Whether any clause left after the bitmaps depends on sidecar state."""
+    return text_query is not None or any(
+        isinstance(clause, _MUTABLE_CLAUSES)
+        for clause in filters.and_clauses
+    )
+
+
+_MUTABLE_CLAUSES = (
+    NotesContainsFilter,
+    NotesNotContainsFilter,
+    WidthCompareFilter,
+    HeightCompareFilter,
+    MetricRangeFilter,
+)
+
+_COMPARE_KERNELS = {
+    "<": "less",
+    "<=": "less_equal",
+    ">": "greater",
+    ">=": "greater_equal",
+}
+
+
+def _lowered_strings(pa: Any, pc: Any, values: Sequence[str | None]) -> Any:
+    """Lower-case strings exactly like `str.lower`.
+
+    Arrow's `utf8_lower` matches `str.lower` for ASCII only; rows with other
+    code points are lowered in Python so substring matches stay identical to
+    the row-at-a-time evaluator.
+    """
+    strings = pa.array(values, type=pa.large_string())
+    lowered = pc.utf8_lower(strings)
+    non_ascii = pc.invert(pc.fill_null(pc.string_is_ascii(strings), True))
+    if not non_ascii.true_count:
+        return lowered
+    positions = pc.indices_nonzero(non_ascii).to_pylist()
+    replacements = pa.array([values[index].lower() for index in positions], type=pa.large_string())
+    return pc.replace_with_mask(lowered, non_ascii, replacements)
@@ -0,0 +1,461 @@
+"""Compact column buffers backing `TableRowStore`.
+
+Strings live in one UTF-8 blob per column with an offset array, paths are
+split into a shared folder table plus a basename, sources into a shared
+prefix plus the row's path, and numerics use typed arrays. Columns grow by
+`append` while the row scan runs, so no per-row Python list is collected
+first. Every column reads like an immutable sequence, so the row store keeps
+indexing them by slot, at the cost of decoding a string per access instead of
+holding millions of Python objects.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Generic, TypeVar, overload
+
+
+T = TypeVar("T")
+_EMPTY_SLOT = -1
+_MAX_HASH_LOAD = 0.7
+
+
+def _offsets_array(total: int) -> array[int]:
+    return array("I" if total < (1 << 32) else "q")
+
+
+def _index_array(count: int) -> array[int]:
+    return array("i" if count < (1 << 31) else "q")
+
+
+_WIDER_ID_TYPECODE = {"B": "H", "H": "I", "I": "q"}
+_ID_LIMIT = {"B": 1 << 8, "H": 1 << 16, "I": 1 << 32}
+
+
+def _append_id(ids: array[int], value: int) -> array[int]:
+    """Append a table ID, widening `ids` once the value no longer fits."""
+    if value >= _ID_LIMIT.get(ids.typecode, 1 << 63):
+        ids = array(_WIDER_ID_TYPECODE[ids.typecode], ids)
+    ids.append(value)
+    return ids
+
+
+def _table_id(index: dict[T, int], table: list[T], value: T) -> int:
+    table_id = index.get(value)
+    if table_id is None:
+        table_id = index[value] = len(table)
+        table.append(value)
+    return table_id
+
+
+class _SequenceView(Sequence[T]):
+    """Read-only sequence whose slices materialize as tuples."""
+
+    __slots__ = ()
+
+    def _item(self, index: int) -> T:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[T, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> T | tuple[T, ...]:
+        if isinstance(index, slice):
+            return tuple(self._item(position) for position in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[T]:
+        item = self._item
+        for index in range(len(self)):
+            yield item(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={len(self)})"
+
+
+class StringColumn(_SequenceView[str]):
+    """Strings stored as one UTF-8 blob and end offsets."""
+
+    __slots__ = ("_blob", "_ends")
+
+    def __init__(self, blob: bytes | bytearray = b"", ends: array[int] | None = None) -> None:
+        self._blob = bytearray(blob)
+        self._ends = _offsets_array(len(blob)) if ends is None else ends
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> StringColumn:
+        column = cls()
+        for value in values:
+            column.append(value)
+        return column
+
+    def append(self, value: str) -> None:
+        blob = self._blob
+        blob += value.encode("utf-8")
+        if len(blob) >= _ID_LIMIT["I"] and self._ends.typecode == "I":
+            self._ends = array("q", self._ends)
+        self._ends.append(len(blob))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._blob) + len(self._ends) * self._ends.itemsize
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def _item(self, index: int) -> str:
+        start = self._ends[index - 1] if index else 0
+        return self._blob[start:self._ends[index]].decode("utf-8")
+
+
+class FolderPathColumn(_SequenceView[str]):
+    """Slash-separated strings stored as a shared folder ID plus basename."""
+
+    __slots__ = ("_folders", "_folder_index", "_folder_ids", "_basenames")
+
+    def __init__(
+        self,
+        folders: Iterable[str] = (),
+        folder_ids: array[int] | None = None,
+        basenames: StringColumn | None = None,
+    ) -> None:
+        self._folders = list(folders)
+        self._folder_index = {folder: folder_id for folder_id, folder in enumerate(self._folders)}
+        self._folder_ids = array("B") if folder_ids is None else folder_ids
+        self._basenames = StringColumn() if basenames is None else basenames
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> FolderPathColumn:
+        column = cls()
+        for value in values:
+            column.append(value)
+        return column
+
+    def append(self, value: str) -> None:
+        # The folder keeps its trailing slash, so joining is concatenation.
+        folder = value[:value.rfind("/") + 1]
+        folder_id = _table_id(self._folder_index, self._folders, folder)
+        self._folder_ids = _append_id(self._folder_ids, folder_id)
+        self._basenames.append(value[len(folder):])
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._folder_ids) * self._folder_ids.itemsize + self._basenames.nbytes
+
+    def __len__(self) -> int:
+        return len(self._folder_ids)
+
+    def basename(self, index: int) -> str:
+        return self._basenames._item(index)
+
+    def _item(self, index: int) -> str:
+        return self._folders[self._folder_ids[index]] + self._basenames._item(index)
+
+
+class PrefixedPathColumn(_SequenceView[str]):
+    """Strings stored as a shared prefix ID plus a tail, usually the row's path.
+
+    A source is most often a URL or directory prefix followed by the row's
+    logical path, so such rows keep only a prefix ID. Other values split at
+    their last slash and keep the basename in a tail column.
+    """
+
+    __slots__ = ("_paths", "_prefixes", "_prefix_index", "_prefix_ids", "_tails")
+
+    def __init__(
+        self,
+        paths: FolderPathColumn,
+        prefixes: Iterable[tuple[str, bool]] = (),
+        prefix_ids: array[int] | None = None,
+        tails: StringColumn | None = None,
+    ) -> None:
+        self._paths = paths
+        self._prefixes = list(prefixes)
+        self._prefix_index = {prefix: prefix_id for prefix_id, prefix in enumerate(self._prefixes)}
+        self._prefix_ids = array("B") if prefix_ids is None else prefix_ids
+        self._tails = StringColumn() if tails is None else tails
+
+    def append(self, value: str, path: str) -> None:
+        """Append the value of the slot that `path` was just appended for."""
+        if path and value.endswith(path):
+            prefix, tail = (value[:len(value) - len(path)], True), ""
+        else:
+            cut = value.rfind("/") + 1
+            prefix, tail = (value[:cut], False), value[cut:]
+        prefix_id = _table_id(self._prefix_index, self._prefixes, prefix)
+        self._prefix_ids = _append_id(self._prefix_ids, prefix_id)
+        self._tails.append(tail)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._prefix_ids) * self._prefix_ids.itemsize + self._tails.nbytes
+
+    def __len__(self) -> int:
+        return len(self._prefix_ids)
+
+    def _item(self, index: int) -> str:
+        prefix, uses_path = self._prefixes[self._prefix_ids[index]]
+        return prefix + (self._paths._item(index) if uses_path else self._tails._item(index))
+
+
+class BasenameDefaultColumn(_SequenceView[str]):
+    """Strings that default to the basename of a path column.
+
+    Only values that differ from the basename are stored; an empty value over
+    a non-empty basename is remembered separately.
+    """
+
+    __slots__ = ("_paths", "_values", "_empty")
+
+    def __init__(
+        self,
+        paths: FolderPathColumn,
+        values: StringColumn | None = None,
+        empty: Iterable[int] = (),
+    ) -> None:
+        self._paths = paths
+        self._values = StringColumn() if values is None else values
+        self._empty = set(empty)
+
+    def append(self, value: str) -> None:
+        """Append the value of the slot whose path was just appended."""
+        slot = len(self._values)
+        if value == self._paths.basename(slot):
+            value = ""
+        elif not value:
+            self._empty.add(slot)
+        self._values.append(value)
+
+    @property
+    def nbytes(self) -> int:
+        return self._values.nbytes
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _item(self, index: int) -> str:
+        value = self._values._item(index)
+        if value or index in self._empty:
+            return value
+        return self._paths.basename(index)
+
+
+class CodedColumn(_SequenceView[T]):
+    """Low-cardinality values stored as one-byte codes into a value table."""
+
+    __slots__ = ("_values", "_codes_by_value", "_codes")
+
+    def __init__(self, values: Iterable[T], codes: bytes | bytearray) -> None:
+        self._values = list(values)
+        self._codes_by_value = {value: code for code, value in enumerate(self._values)}
+        self._codes = bytearray(codes)
+
+    @classmethod
+    def from_values(cls, values: Iterable[T]) -> CodedColumn[T]:
+        column: CodedColumn[T] = cls((), b"")
+        for value in values:
+            column.append(value)
+        return column
+
+    def append(self, value: T) -> None:
+        code = _table_id(self._codes_by_value, self._values, value)
+        if code > 0xFF:
+            raise ValueError("coded column supports at most 256 distinct values")
+        self._codes.append(code)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def _item(self, index: int) -> T:
+        return self._values[self._codes[index]]
+
+
+class OptionalAliasColumn(_SequenceView[str | None]):
+    """Values that are either the matching entry of another column or None."""
+
+    __slots__ = ("_values", "_present")
+
+    def __init__(self, values: Sequence[str], present: bytes | bytearray = b"") -> None:
+        self._values = values
+        self._present = bytearray(present)
+
+    def append(self, present: bool) -> None:
+        self._present.append(present)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._present)
+
+    def __len__(self) -> int:
+        return len(self._present)
+
+    def present(self, index: int) -> bool:
+        return bool(self._present[index])
+
+    def _item(self, index: int) -> str | None:
+        return self._values[index] if self._present[index] else None
+
+
+class SlotLookupView(_SequenceView[T | None], Generic[T]):
+    """Per-row view over a slot-ordered column; skipped rows read as None."""
+
+    __slots__ = ("_values", "_row_to_slot", "_row_count")
+
+    def __init__(self, values: Sequence[T], row_to_slot: array[int] | None, row_count: int) -> None:
+        self._values = values
+        self._row_to_slot = row_to_slot
+        self._row_count = row_count
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def _item(self, index: int) -> T | None:
+        slot = index if self._row_to_slot is None else self._row_to_slot[index]
+        return self._values[slot] if 0 <= slot < len(self._values) else None
+
+
+class PermutedView(_SequenceView[T]):
+    """Read-only view of `values` in the order given by `order`."""
+
+    __slots__ = ("_values", "_order")
+
+    def __init__(self, values: Sequence[T], order: Sequence[int]) -> None:
+        self._values = values
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _item(self, index: int) -> T:
+        return self._values[self._order[index]]
+
+
+class RowDimensions(Sequence[tuple[int, int] | None]):
+    """Mutable per-row dimensions written through to slot-ordered arrays."""
+
+    __slots__ = ("_widths", "_heights", "_row_to_slot", "_row_count")
+
+    def __init__(
+        self,
+        widths: array[int],
+        heights: array[int],
+        row_to_slot: array[int] | None,
+        row_count: int,
+    ) -> None:
+        self._widths = widths
+        self._heights = heights
+        self._row_to_slot = row_to_slot
+        self._row_count = row_count
+
+    def _slot(self, row_idx: int) -> int:
+        if not 0 <= row_idx < self._row_count:
+            raise IndexError(row_idx)
+        slot = row_idx if self._row_to_slot is None else self._row_to_slot[row_idx]
+        return slot if slot < len(self._widths) else _EMPTY_SLOT
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def __getitem__(self, row_idx: int) -> tuple[int, int] | None:  # type: ignore[override]
+        slot = self._slot(row_idx)
+        if slot < 0:
+            return None
+        return self._widths[slot], self._heights[slot]
+
+    def __setitem__(self, row_idx: int, dims: tuple[int, int]) -> None:
+        slot = self._slot(row_idx)
+        if slot < 0:
+            return
+        self._widths[slot], self._heights[slot] = dims
+
+    def __iter__(self) -> Iterator[tuple[int, int] | None]:
+        for row_idx in range(self._row_count):
+            yield self[row_idx]
+
+
+class PathIndex(Mapping[str, int]):
+    """Open-addressing hash index from a path column to row indices.
+
+    The table stores slots only; keys are compared by decoding the path at
+    the probed slot, so no Python string is retained per row.
+    """
+
+    __slots__ = ("_paths", "_path_at", "_row_indices", "_table", "_mask")
+
+    def __init__(self, paths: Sequence[str], row_indices: Sequence[int]) -> None:
+        size = 8
+        while size * _MAX_HASH_LOAD < len(paths):
+            size <<= 1
+        mask = size - 1
+        table = array(_index_array(len(paths)).typecode, [_EMPTY_SLOT]) * size
+        for slot, path in enumerate(paths):
+            position = hash(path) & mask
+            while table[position] != _EMPTY_SLOT:
+                position = (position + 1) & mask
+            table[position] = slot
+        self._paths = paths
+        # Probes skip the bounds check; every stored slot is in range.
+        self._path_at = paths._item if isinstance(paths, _SequenceView) else paths.__getitem__
+        self._row_indices = row_indices
+        self._table = table
+        self._mask = mask
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._table) * self._table.itemsize
+
+    def slot(self, path: str) -> int | None:
+        table = self._table
+        mask = self._mask
+        path_at = self._path_at
+        position = hash(path) & mask
+        while True:
+            slot = table[position]
+            if slot == _EMPTY_SLOT:
+                return None
+            if path_at(slot) == path:
+                return slot
+            position = (position + 1) & mask
+
+    def get(self, path: str, default: int | None = None) -> int | None:  # type: ignore[override]
+        slot = self.slot(path) if isinstance(path, str) else None
+        return default if slot is None else self._row_indices[slot]
+
+    def __getitem__(self, path: str) -> int:
+        row_idx = self.get(path)
+        if row_idx is None:
+            raise KeyError(path)
+        return row_idx
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self.slot(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
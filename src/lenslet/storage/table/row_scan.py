@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import os
 import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
 from ..image_media import ImageMime, normalize_image_mime, read_dimensions_fast
 from .index_types import TableIndexData, TableIndexInput
+from .parquet_columns import ParquetColumn
 from ..source.paths import (
     LocalSourcePathError,
-    dedupe_path,
     derive_http_logical_path,
     derive_logical_path,
     extract_name,
@@ -21,6 +24,16 @@ from ..source.paths import (
 from .schema import coerce_int, coerce_timestamp
 
 
+INGEST_BATCH_ROWS = 16384
+SCAN_CHUNK_ROWS = 1024
+MAX_SCAN_WORKERS = 16
+
+
+def table_scan_worker_count() -> int:
+    """Default thread count for the launch row scan, which mostly waits on I/O."""
+    return max(1, min(MAX_SCAN_WORKERS, (os.cpu_count() or 1) * 2))
+
+
 @dataclass(frozen=True, slots=True)
 class IndexColumns:
     source_values: list[Any]
@@ -34,6 +47,73 @@ class IndexColumns:
     metrics_values: list[Any]
     metric_columns: tuple[tuple[str, list[Any]], ...]
 
+    def batches(self, row_count: int, batch_rows: int = INGEST_BATCH_ROWS) -> Iterator[IndexColumnBatch]:
+        """Yield the identity and media columns as Python lists one slice at a time.
+
+        Arrow-backed columns are converted per slice, which avoids a second,
+        whole-column Python copy. Columns a Parquet launch left on disk
+        (`ParquetColumn`) are streamed together in one pass over the source.
+        """
+        fields = (
+            self.source_values,
+            self.path_values,
+            self.name_values,
+            self.mime_values,
+            self.width_values,
+            self.height_values,
+            self.size_values,
+            self.mtime_values,
+        )
+        streamed = [values for values in fields if isinstance(values, ParquetColumn)]
+        if streamed:
+            reader = streamed[0].reader
+            bounds: Iterator[tuple[int, int, dict[str, list[Any]]]] = (
+                (start, start + len(next(iter(values.values()))), values)
+                for start, values in reader.iter_batches([column.name for column in streamed], batch_rows)
+            )
+        else:
+            bounds = (
+                (start, min(row_count, start + batch_rows), {})
+                for start in range(0, row_count, batch_rows)
+            )
+        for start, stop, streamed_values in bounds:
+            values = [
+                streamed_values[column.name] if isinstance(column, ParquetColumn) else _batch_values(column, start, stop)
+                for column in fields
+            ]
+            yield IndexColumnBatch(start, stop - start, *values)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexColumnBatch:
+    """Rows `start` to `start + row_count` of the columns the row scan reads.
+
+    Row-scan helpers index these lists with batch-local offsets.
+    """
+
+    start: int
+    row_count: int
+    source_values: list[Any]
+    path_values: list[Any]
+    name_values: list[Any]
+    mime_values: list[Any]
+    width_values: list[Any]
+    height_values: list[Any]
+    size_values: list[Any]
+    mtime_values: list[Any]
+
+
+def _batch_values(values: Any, start: int, stop: int) -> list[Any]:
+    if isinstance(values, list):
+        return values[start:stop]
+    to_pylist = getattr(values, "to_pylist", None)
+    if callable(to_pylist) and hasattr(values, "slice"):
+        return values.slice(start, stop - start).to_pylist()
+    tolist = getattr(values[start:stop], "tolist", None)
+    if callable(tolist):
+        return tolist()
+    return list(values[start:stop])
+
 
 @dataclass(slots=True)
 class LocalSkipCounts:
@@ -78,6 +158,24 @@ class LocalSourceResolution:
     skip_reason: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class ScannedRow:
+    """Row fields resolved before dedupe, so rows can be scanned out of order.
+
+    `identity.logical_path` is the path before dedupe. Width and height are
+    the table values; `probed_dims` holds a header probe run during the scan.
+    """
+
+    identity: RowIdentity
+    local_source: LocalSourceResolution
+    size: int
+    mtime: float
+    width: int
+    height: int
+    probed_dims: tuple[int, int] | None = None
+    cached_before_dedupe: bool = False
+
+
 def _can_scan_uniform_http_rows(context: TableIndexInput, columns: IndexColumns) -> bool:
     _ = columns
     table = context.table
@@ -125,14 +223,14 @@ def _supported_image_name(
     return None
 
 
-def _row_name(columns: IndexColumns, idx: int, fallback_name: str) -> str:
+def _row_name(columns: IndexColumnBatch, idx: int, fallback_name: str) -> str:
     name_value = columns.name_values[idx]
     return str(name_value).strip() if name_value else fallback_name
 
 
 def _raw_logical_path(
     table: TableIndexData,
-    columns: IndexColumns,
+    columns: IndexColumnBatch,
     idx: int,
     source: str,
 ) -> str:
@@ -195,10 +293,10 @@ def _image_name_for_row(
 
 def _resolve_row_identity(
     context: TableIndexInput,
-    columns: IndexColumns,
+    columns: IndexColumnBatch,
     idx: int,
-    seen_paths: set[str],
 ) -> RowIdentity | None:
+    """Resolve a row's identity before its logical path is deduplicated."""
     table = context.table
     source = _coerce_source_value(columns.source_values[idx])
     if source is None:
@@ -225,9 +323,6 @@ def _resolve_row_identity(
     if image_name is None:
         return None
 
-    logical_path = dedupe_path(logical_path, seen_paths)
-    seen_paths.add(logical_path)
-
     mime = normalize_image_mime(
         columns.mime_values[idx],
         image_name or fallback_name or source,
@@ -297,27 +392,14 @@ def _resolved_file_mtime(
         return time.time()
 
 
-def _resolved_dimensions(
+def _probe_local_dimensions(
     context: TableIndexInput,
-    columns: IndexColumns,
-    idx: int,
     identity: RowIdentity,
     local_source: LocalSourceResolution,
-) -> tuple[int, int, tuple[int, int] | None]:
-    width = coerce_int(columns.width_values[idx]) or 0
-    height = coerce_int(columns.height_values[idx]) or 0
-    if width > 0 and height > 0:
-        return width, height, None
-    cached = _cached_dimensions_for_row(context.table, idx, identity.source, identity.logical_path)
-    if cached is not None:
-        return cached[0], cached[1], cached
+) -> tuple[int, int] | None:
     if not identity.is_local or context.policy.skip_dimension_probe or local_source.resolved_path is None:
-        return width, height, None
-
-    dims = read_dimensions_fast(local_source.resolved_path)
-    if dims is None:
-        return width, height, None
-    return dims[0], dims[1], dims
+        return None
+    return read_dimensions_fast(local_source.resolved_path)
 
 
 def _cached_dimensions_for_row(
@@ -339,14 +421,98 @@ def _cached_dimensions_for_row(
     return cached.width, cached.height
 
 
-def _resolve_row_media_fields(
-    context: TableIndexInput,
-    columns: IndexColumns,
-    idx: int,
-    identity: RowIdentity,
-    local_source: LocalSourceResolution,
-) -> tuple[int, float, int, int, tuple[int, int] | None]:
+def _scan_row(context: TableIndexInput, columns: IndexColumnBatch, idx: int) -> ScannedRow | None:
+    identity = _resolve_row_identity(context, columns, idx)
+    if identity is None:
+        return None
+    local_source = (
+        _resolve_local_source(context, identity.source)
+        if identity.is_local
+        else LocalSourceResolution(resolved_path=None)
+    )
+    if local_source.skip_reason is not None:
+        return ScannedRow(identity, local_source, 0, 0.0, 0, 0)
+
     size = _resolved_file_size(columns.size_values[idx], local_source)
     mtime = _resolved_file_mtime(columns.mtime_values[idx], local_source, is_local=identity.is_local)
-    width, height, discovered_dims = _resolved_dimensions(context, columns, idx, identity, local_source)
-    return size, mtime, width, height, discovered_dims
+    width = coerce_int(columns.width_values[idx]) or 0
+    height = coerce_int(columns.height_values[idx]) or 0
+    probed_dims = None
+    cached_before_dedupe = False
+    if width <= 0 or height <= 0:
+        cached_before_dedupe = _cached_dimensions_for_row(
+            context.table,
+            columns.start + idx,
+            identity.source,
+            identity.logical_path,
+        ) is not None
+        if not cached_before_dedupe:
+            probed_dims = _probe_local_dimensions(context, identity, local_source)
+    return ScannedRow(
+        identity,
+        local_source,
+        size,
+        mtime,
+        width,
+        height,
+        probed_dims,
+        cached_before_dedupe,
+    )
+
+
+def scan_row_batch(context: TableIndexInput, columns: IndexColumnBatch) -> list[ScannedRow | None]:
+    """Resolve every row of a batch independently of the rows around it."""
+    return [_scan_row(context, columns, idx) for idx in range(columns.row_count)]
+
+
+def iter_scanned_batches(
+    context: TableIndexInput,
+    columns: IndexColumns,
+) -> Iterator[tuple[int, list[ScannedRow | None]]]:
+    """Yield `(start, rows)` for each scanned batch in table order.
+
+    Rows only touch the filesystem while being scanned, so with more than one
+    scan worker the batches are resolved on a thread pool, keeping a bounded
+    number in flight, and handed back in order for the serial merge.
+    """
+    table = context.table
+    workers = context.policy.scan_workers
+    if workers <= 1 or table.source_kind in {"http", "s3"} or table.row_count <= SCAN_CHUNK_ROWS:
+        for batch in columns.batches(table.row_count):
+            yield batch.start, scan_row_batch(context, batch)
+        return
+
+    batches = columns.batches(table.row_count, batch_rows=SCAN_CHUNK_ROWS)
+    pending: deque[tuple[int, Future[list[ScannedRow | None]]]] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lenslet-table-scan") as executor:
+        try:
+            for batch in batches:
+                pending.append((batch.start, executor.submit(scan_row_batch, context, batch)))
+                if len(pending) >= workers * 2:
+                    start, future = pending.popleft()
+                    yield start, future.result()
+            while pending:
+                start, future = pending.popleft()
+                yield start, future.result()
+        finally:
+            for _start, future in pending:
+                future.cancel()
+
+
+def finish_row_dimensions(
+    context: TableIndexInput,
+    row_idx: int,
+    row: ScannedRow,
+    logical_path: str,
+) -> tuple[int, int]:
+    """Resolve a scanned row's dimensions once its final logical path is known."""
+    if row.width > 0 and row.height > 0:
+        return row.width, row.height
+    cached = _cached_dimensions_for_row(context.table, row_idx, row.identity.source, logical_path)
+    if cached is not None:
+        return cached
+    dims = row.probed_dims
+    if dims is None and row.cached_before_dedupe:
+        # Dedupe renamed the path, so the cache entry the scan relied on no longer matches.
+        dims = _probe_local_dimensions(context, row.identity, row.local_source)
+    return dims or (row.width, row.height)
@@ -0,0 +1,111 @@
+"""Lower-cased search columns and trigram candidates for table text search.
+
+Columns follow the row store's sorted-path order, so a scope is one
+contiguous position range. Each column and its trigram index are built on
+first use and shared by later searches until the row store is replaced.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from typing import Literal
+
+from .query_vectorized import int_list
+from .row_store import TableRowStore
+from .text_index import TrigramIndex
+
+
+SearchColumnName = Literal["paths", "names", "sources"]
+
+
+class TableSearchColumns:
+    """Search text for one row store, one lower-cased string per sorted position."""
+
+    def __init__(self, row_store: TableRowStore) -> None:
+        self._row_store = row_store
+        self._columns: dict[SearchColumnName, list[str]] = {}
+        self._trigrams: dict[SearchColumnName, TrigramIndex] = {}
+
+    def is_built(self, name: SearchColumnName) -> bool:
+        return name in self._columns
+
+    def paths(self) -> list[str]:
+        return self._column("paths")
+
+    def names(self) -> list[str]:
+        return self._column("names")
+
+    def sources(self) -> list[str]:
+        """Sources, with a distinct URL appended so either one matches."""
+        return self._column("sources")
+
+    def candidate_positions(
+        self,
+        needle: str,
+        path_needle: str,
+        start: int,
+        end: int,
+        *,
+        search_names: bool,
+        search_sources: bool,
+        sidecar_paths: Iterable[str] = (),
+    ) -> list[int] | None:
+        """Return sorted positions in `[start, end)` that may match, or None to scan.
+
+        Path, name, and source matches come from trigram indexes; rows with
+        sidecars are always candidates because their tags and notes change at
+        runtime. The caller re-checks every candidate exactly.
+        """
+        parts = [self._trigram_index("paths").candidates(path_needle, start, end)]
+        if search_names:
+            parts.append(self._trigram_index("names").candidates(path_needle, start, end))
+        if search_sources:
+            parts.append(self._trigram_index("sources").candidates(needle, start, end))
+        if any(part is None for part in parts):
+            return None
+        if sum(len(part) for part in parts) * 4 > end - start:
+            # Dense matches fill the result limit quickly in a plain scan.
+            return None
+        positions: set[int] = set()
+        for part in parts:
+            positions.update(int_list(part))
+        row_store = self._row_store
+        for key in sidecar_paths:
+            row_idx = row_store.row_index_for_path(key)
+            path = row_store.path_for_row_index(row_idx) if row_idx is not None else None
+            if path is None:
+                continue
+            position = bisect_left(row_store.sorted_paths, path)
+            if start <= position < end and row_store.sorted_rows[position] == row_idx:
+                positions.add(position)
+        return sorted(positions)
+
+    def _column(self, name: SearchColumnName) -> list[str]:
+        column = self._columns.get(name)
+        if column is None:
+            column = self._build_column(name)
+            self._columns[name] = column
+        return column
+
+    def _build_column(self, name: SearchColumnName) -> list[str]:
+        row_store = self._row_store
+        if name == "paths":
+            return [path.lower() for path in row_store.sorted_paths]
+        if name == "names":
+            return [row_store.name_for_row(row_idx).lower() for row_idx in row_store.sorted_rows]
+        values: list[str] = []
+        for row_idx in row_store.sorted_rows:
+            source = row_store.source_for_row(row_idx)
+            url = row_store.url_for_row(row_idx) or ""
+            if url and url != source:
+                source = f"{source} {url}" if source else url
+            values.append(source.lower())
+        return values
+
+    def _trigram_index(self, name: SearchColumnName) -> TrigramIndex:
+        index = self._trigrams.get(name)
+        if index is None:
+            index = TrigramIndex.from_strings(self._column(name))
+            self._trigrams[name] = index
+        return index
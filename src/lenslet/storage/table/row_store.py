@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from array import array
 from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from typing import Callable
@@ -20,17 +21,26 @@ from ..source.paths import (
     normalize_item_path,
 )
 from .schema import coerce_int, coerce_timestamp
+from .row_columns import (
+    BasenameDefaultColumn,
+    CodedColumn,
+    FolderPathColumn,
+    OptionalAliasColumn,
+    PathIndex,
+    PermutedView,
+    PrefixedPathColumn,
+    RowDimensions,
+    SlotLookupView,
+)
 from .row_scan import (
     IndexColumns,
     LocalSkipCounts,
-    LocalSourceResolution,
     _can_scan_uniform_http_rows,
     _cached_dimensions_for_row,
     _fast_path_folder_and_name,
     _fast_text,
-    _resolve_local_source,
-    _resolve_row_identity,
-    _resolve_row_media_fields,
+    finish_row_dimensions,
+    iter_scanned_batches,
 )
 from .index_types import TableIndexInput
 
@@ -149,30 +159,105 @@ class TableRowViewItem:
 
 @dataclass(slots=True)
 class TableRowStore:
-    """Compact row-owned table state for the row-view backend."""
+    """Compact row-owned table state for the row-view backend.
+
+    Columns are indexed by slot, the position of a kept row. Row indices
+    address the source table, which may also contain skipped rows.
+    """
 
     row_count: int
-    paths: tuple[str, ...]
-    sources: tuple[str, ...]
-    names: tuple[str, ...]
-    mimes: tuple[ImageMime, ...]
-    widths: tuple[int, ...]
-    heights: tuple[int, ...]
-    sizes: tuple[int, ...]
-    mtimes: tuple[float, ...]
-    urls: tuple[str | None, ...]
-    sorted_paths: tuple[str, ...]
-    sorted_rows: tuple[int, ...]
-    path_to_row: dict[str, int]
-    row_to_path: list[str | None]
-    row_to_slot: list[int] | None
-    folder_rows: dict[str, tuple[int, ...]]
+    row_indices: array[int]
+    paths: FolderPathColumn
+    sources: PrefixedPathColumn
+    names: BasenameDefaultColumn
+    mimes: CodedColumn[ImageMime]
+    widths: array[int]
+    heights: array[int]
+    sizes: array[int]
+    mtimes: array[float]
+    urls: OptionalAliasColumn
+    sorted_paths: PermutedView[str]
+    sorted_rows: array[int]
+    path_to_row: PathIndex
+    row_to_path: SlotLookupView[str]
+    row_to_slot: array[int] | None
+    folder_rows: dict[str, array[int]]
     folder_children: dict[str, tuple[str, ...]]
-    row_dimensions: list[tuple[int, int] | None]
+    row_dimensions: RowDimensions
     dimensions: dict[str, tuple[int, int]] = field(default_factory=dict)
     size_overrides: dict[int, int] = field(default_factory=dict)
     materialized_item_count: int = 0
 
+    @classmethod
+    def assemble(
+        cls,
+        *,
+        row_count: int,
+        row_indices: array[int],
+        paths: FolderPathColumn,
+        sources: PrefixedPathColumn,
+        names: BasenameDefaultColumn,
+        mimes: CodedColumn[ImageMime],
+        widths: array[int],
+        heights: array[int],
+        sizes: array[int],
+        mtimes: array[float],
+        urls: OptionalAliasColumn,
+        row_to_slot: array[int] | None,
+        folder_rows: dict[str, array[int]],
+        folder_children: dict[str, tuple[str, ...]],
+        sorted_slots: array[int],
+    ) -> TableRowStore:
+        """Wire slot-ordered columns and their path order into a row store."""
+        return cls(
+            row_count=row_count,
+            row_indices=row_indices,
+            paths=paths,
+            sources=sources,
+            names=names,
+            mimes=mimes,
+            widths=widths,
+            heights=heights,
+            sizes=sizes,
+            mtimes=mtimes,
+            urls=urls,
+            sorted_paths=PermutedView(paths, sorted_slots),
+            sorted_rows=(
+                sorted_slots
+                if row_to_slot is None
+                else array("i", (row_indices[slot] for slot in sorted_slots))
+            ),
+            path_to_row=PathIndex(paths, row_indices),
+            row_to_path=SlotLookupView(paths, row_to_slot, row_count),
+            row_to_slot=row_to_slot,
+            folder_rows=folder_rows,
+            folder_children=folder_children,
+            row_dimensions=RowDimensions(widths, heights, row_to_slot, row_count),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the per-row buffers."""
+        arrays = (
+            self.row_indices,
+            self.widths,
+            self.heights,
+            self.sizes,
+            self.mtimes,
+            self.sorted_rows,
+            *self.folder_rows.values(),
+        )
+        return (
+            sum(len(values) * values.itemsize for values in arrays)
+            + (len(self.row_to_slot) * self.row_to_slot.itemsize if self.row_to_slot is not None else 0)
+            + self.paths.nbytes
+            + self.sources.nbytes
+            + self.names.nbytes
+            + self.mimes.nbytes
+            + self.urls.nbytes
+            + self.path_to_row.nbytes
+        )
+
     def total_rows(self) -> int:
         return len(self.paths)
 
@@ -246,27 +331,27 @@ class TableRowStore:
         row_idx: int,
     ) -> tuple[str, str, ImageMime, int, int, int, float, str | None, str]:
         slot = self._slot_for_row(row_idx)
-        width, height = self.dimensions_for_row(row_idx)
+        path = self.paths[slot]
+        source = self.sources[slot]
+        width, height = self.dimensions.get(path) or (self.widths[slot], self.heights[slot])
         return (
-            self.paths[slot],
+            path,
             self.names[slot],
             self.mimes[slot],
             width,
             height,
             self.size_for_row(row_idx),
             self.mtimes[slot],
-            self.urls[slot],
-            self.sources[slot],
+            source if self.urls.present(slot) else None,
+            source,
         )
 
     def dimensions_for_row(self, row_idx: int) -> tuple[int, int]:
-        path = self.path_for_row_index(row_idx)
-        if path is not None and path in self.dimensions:
-            return self.dimensions[path]
-        dims = self.row_dimensions[row_idx] if 0 <= row_idx < len(self.row_dimensions) else None
-        if dims is not None:
-            return dims
         slot = self._slot_for_row(row_idx)
+        if self.dimensions:
+            dims = self.dimensions.get(self.paths[slot])
+            if dims is not None:
+                return dims
         return self.widths[slot], self.heights[slot]
 
     def dimensions_for_path(self, path: str) -> tuple[int, int]:
@@ -315,7 +400,7 @@ class TableRowStore:
         return self.folder_children.get(normalize_search_path(path), ())
 
     def direct_rows(self, path: str) -> tuple[int, ...]:
-        return self.folder_rows.get(normalize_search_path(path), ())
+        return tuple(self.folder_rows.get(normalize_search_path(path), ()))
 
     def scope_bounds(self, path: str) -> tuple[int, int]:
         scope_norm = normalize_search_path(path)
@@ -328,13 +413,13 @@ class TableRowStore:
 
     def rows_in_scope(self, path: str) -> tuple[int, ...]:
         start, end = self.scope_bounds(path)
-        return self.sorted_rows[start:end]
+        return tuple(self.sorted_rows[start:end])
 
     def rows_in_scope_window(self, path: str, offset: int, limit: int) -> tuple[int, ...]:
         start, end = self.scope_bounds(path)
         window_start = min(end, start + max(0, offset))
         window_end = min(end, window_start + max(0, limit))
-        return self.sorted_rows[window_start:window_end]
+        return tuple(self.sorted_rows[window_start:window_end])
 
     def count_in_scope(self, path: str) -> int:
         start, end = self.scope_bounds(path)
@@ -426,66 +511,105 @@ def _int_or_zero(value: object) -> int:
         return 0
 
 
-def _remember_row_slot(
-    row_to_slot: list[int] | None,
-    *,
-    row_indices: list[int],
-    row_count: int,
-    row_idx: int,
-    slot: int,
-) -> list[int] | None:
-    if row_to_slot is None:
-        if row_idx == slot:
-            return None
-        row_to_slot = [-1] * row_count
-        for previous_slot, previous_row_idx in enumerate(row_indices):
-            row_to_slot[previous_row_idx] = previous_slot
-    row_to_slot[row_idx] = slot
-    return row_to_slot
+class _RowStoreBuilder:
+    """Growing row-store columns the row scans append kept rows to."""
+
+    __slots__ = (
+        "row_count",
+        "row_indices",
+        "paths",
+        "sources",
+        "names",
+        "mimes",
+        "widths",
+        "heights",
+        "sizes",
+        "mtimes",
+        "urls",
+        "row_to_slot",
+        "folder_rows",
+        "dir_children",
+        "seen_folders",
+    )
 
+    def __init__(self, row_count: int) -> None:
+        self.row_count = row_count
+        self.row_indices = array("i")
+        self.paths = FolderPathColumn()
+        self.sources = PrefixedPathColumn(self.paths)
+        self.names = BasenameDefaultColumn(self.paths)
+        self.mimes: CodedColumn[ImageMime] = CodedColumn((), b"")
+        self.widths = array("i")
+        self.heights = array("i")
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.urls = OptionalAliasColumn(self.sources)
+        self.row_to_slot: array[int] | None = None
+        self.folder_rows: dict[str, array[int]] = {}
+        self.dir_children: dict[str, set[str]] = {}
+        self.seen_folders: set[str] = set()
+
+    def append(
+        self,
+        *,
+        row_idx: int,
+        path: str,
+        folder_norm: str,
+        source: str,
+        name: str,
+        mime: ImageMime,
+        width: int,
+        height: int,
+        size: int,
+        mtime: float,
+        is_url: bool,
+    ) -> None:
+        slot = len(self.row_indices)
+        if self.row_to_slot is None and row_idx != slot:
+            self.row_to_slot = array("i", [-1]) * self.row_count
+            for previous_slot, previous_row_idx in enumerate(self.row_indices):
+                self.row_to_slot[previous_row_idx] = previous_slot
+        if self.row_to_slot is not None:
+            self.row_to_slot[row_idx] = slot
+        self.row_indices.append(row_idx)
+        self.paths.append(path)
+        self.sources.append(source, path)
+        self.names.append(name)
+        self.mimes.append(mime)
+        self.widths.append(width)
+        self.heights.append(height)
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+        self.urls.append(is_url)
+        rows = self.folder_rows.get(folder_norm)
+        if rows is None:
+            rows = self.folder_rows[folder_norm] = array("i")
+        rows.append(row_idx)
+        _record_folder_children(
+            folder_norm,
+            seen_folders=self.seen_folders,
+            dir_children=self.dir_children,
+        )
 
-def _finish_row_store(
-    *,
-    row_count: int,
-    row_indices: list[int],
-    paths: list[str],
-    sources: list[str],
-    names: list[str],
-    mimes: list[ImageMime],
-    widths: list[int],
-    heights: list[int],
-    sizes: list[int],
-    mtimes: list[float],
-    urls: list[str | None],
-    path_to_row: dict[str, int],
-    row_to_path: list[str | None],
-    row_to_slot: list[int] | None,
-    folder_rows: dict[str, list[int]],
-    dir_children: dict[str, set[str]],
-    row_dimensions: list[tuple[int, int] | None],
-) -> TableRowStore:
-    folder_rows.setdefault("", [])
-    sorted_pairs = sorted(zip(paths, row_indices), key=lambda pair: pair[0])
-    return TableRowStore(
-        row_count=row_count,
-        paths=tuple(paths),
-        sources=tuple(sources),
-        names=tuple(names),
-        mimes=tuple(mimes),
-        widths=tuple(widths),
-        heights=tuple(heights),
-        sizes=tuple(sizes),
-        mtimes=tuple(mtimes),
-        urls=tuple(urls),
-        sorted_paths=tuple(path for path, _row_idx in sorted_pairs),
-        sorted_rows=tuple(row_idx for _path, row_idx in sorted_pairs),
-        path_to_row=path_to_row,
-        row_to_path=row_to_path,
-        row_to_slot=row_to_slot,
-        folder_rows={key: tuple(value) for key, value in folder_rows.items()},
-        folder_children={key: tuple(sorted(value)) for key, value in dir_children.items()},
-        row_dimensions=row_dimensions,
-    )
+    def finish(self) -> TableRowStore:
+        self.folder_rows.setdefault("", array("i"))
+        return TableRowStore.assemble(
+            row_count=self.row_count,
+            row_indices=self.row_indices,
+            paths=self.paths,
+            sources=self.sources,
+            names=self.names,
+            mimes=self.mimes,
+            widths=self.widths,
+            heights=self.heights,
+            sizes=self.sizes,
+            mtimes=self.mtimes,
+            urls=self.urls,
+            row_to_slot=self.row_to_slot,
+            folder_rows=self.folder_rows,
+            folder_children={key: tuple(sorted(value)) for key, value in self.dir_children.items()},
+            sorted_slots=array("i", sorted(range(len(self.paths)), key=self.paths._item)),
+        )
 
 
 def build_table_row_store(
@@ -500,24 +624,7 @@ def build_table_row_store(
     seen_paths: set[str] = set()
     skipped = LocalSkipCounts()
     remote_tasks: list[TableRowRemoteDimensionTask] = []
-
-    row_indices: list[int] = []
-    paths: list[str] = []
-    sources: list[str] = []
-    names: list[str] = []
-    mimes: list[ImageMime] = []
-    widths: list[int] = []
-    heights: list[int] = []
-    sizes: list[int] = []
-    mtimes: list[float] = []
-    urls: list[str | None] = []
-    path_to_row: dict[str, int] = {}
-    row_to_path: list[str | None] = [None] * table.row_count
-    row_to_slot: list[int] | None = None
-    row_dimensions: list[tuple[int, int] | None] = [None] * table.row_count
-    folder_rows: dict[str, list[int]] = {}
-    dir_children: dict[str, set[str]] = {}
-    seen_folders: set[str] = set()
+    builder = _RowStoreBuilder(table.row_count)
 
     progress = ProgressTicker(
         total=table.row_count,
@@ -525,95 +632,99 @@ def build_table_row_store(
         emit=context.progress,
     )
 
-    for row_idx in range(table.row_count):
-        identity = _resolve_row_identity(context, columns, row_idx, seen_paths)
-        if identity is None:
+    for start, scanned_rows in iter_scanned_batches(context, columns):
+        for idx, scanned in enumerate(scanned_rows):
+            row_idx = start + idx
+            if scanned is None:
+                progress.step()
+                continue
+
+            # Dedupe follows table order, whichever worker scanned the row.
+            logical_path = dedupe_path(scanned.identity.logical_path, seen_paths)
+            seen_paths.add(logical_path)
+            if skipped.record(scanned.local_source.skip_reason):
+                progress.step()
+                continue
+
+            identity = scanned.identity
+            width, height = finish_row_dimensions(context, row_idx, scanned, logical_path)
+            builder.append(
+                row_idx=row_idx,
+                path=logical_path,
+                folder_norm=_folder_norm(logical_path),
+                source=identity.source,
+                name=identity.name,
+                mime=identity.mime,
+                width=width,
+                height=height,
+                size=scanned.size,
+                mtime=scanned.mtime or 0.0,
+                is_url=identity.is_http,
+            )
+            if (identity.is_s3 or identity.is_http) and (width == 0 or height == 0) and not policy.skip_dimension_probe:
+                remote_tasks.append(
+                    TableRowRemoteDimensionTask(
+                        row_idx=row_idx,
+                        path=logical_path,
+                        source=identity.source,
+                        name=identity.name,
+                    )
+                )
             progress.step()
-            continue
 
-        local_source = (
-            _resolve_local_source(context, identity.source)
-            if identity.is_local
-            else LocalSourceResolution(resolved_path=None)
-        )
-        if skipped.record(local_source.skip_reason):
-            progress.step()
-            continue
+    progress.finish()
+    store = builder.finish()
+    return TableRowStoreBuildResult(
+        store=store,
+        remote_tasks=remote_tasks,
+        skipped_local_disabled=skipped.disabled,
+        skipped_local_outside_root=skipped.outside_root,
+        skipped_local_resolved_outside_root=skipped.resolved_outside_root,
+        skipped_local_missing=skipped.missing,
+    )
 
-        size, mtime, width, height, discovered_dims = _resolve_row_media_fields(
-            context,
-            columns,
-            row_idx,
-            identity,
-            local_source,
-        )
-        slot = len(row_indices)
-        folder_norm = _folder_norm(identity.logical_path)
-        row_to_slot = _remember_row_slot(
-            row_to_slot,
-            row_indices=row_indices,
-            row_count=table.row_count,
-            row_idx=row_idx,
-            slot=slot,
-        )
 
-        row_indices.append(row_idx)
-        paths.append(identity.logical_path)
-        sources.append(identity.source)
-        names.append(identity.name)
-        mimes.append(identity.mime)
-        widths.append(width)
-        heights.append(height)
-        sizes.append(size)
-        mtimes.append(mtime or 0.0)
-        urls.append(identity.source if identity.is_http else None)
-        path_to_row[identity.logical_path] = row_idx
-        row_to_path[row_idx] = identity.logical_path
-        row_dimensions[row_idx] = discovered_dims or (width, height)
-        folder_rows.setdefault(folder_norm, []).append(row_idx)
-        _record_folder_children(
-            folder_norm,
-            seen_folders=seen_folders,
-            dir_children=dir_children,
-        )
-        if (identity.is_s3 or identity.is_http) and (width == 0 or height == 0) and not policy.skip_dimension_probe:
+def resume_table_row_store(
+    context: TableIndexInput,
+    store: TableRowStore,
+    *,
+    skipped_local: tuple[int, int, int, int] = (0, 0, 0, 0),
+) -> TableRowStoreBuildResult:
+    """Return the build result of a persisted row store without rescanning rows.
+
+    Workspace dimensions apply to rows the store still lacks dimensions for,
+    as the scan would have applied them, and rows left without dimensions are
+    queued for remote probing again.
+    """
+    table = context.table
+    widths = store.widths
+    heights = store.heights
+    remote_tasks: list[TableRowRemoteDimensionTask] = []
+    for slot, row_idx in enumerate(store.row_indices):
+        if widths[slot] > 0 and heights[slot] > 0:
+            continue
+        source = store.sources[slot]
+        path = store.paths[slot]
+        cached_dims = _cached_dimensions_for_row(table, row_idx, source, path)
+        if cached_dims is not None:
+            widths[slot], heights[slot] = cached_dims
+        elif not context.policy.skip_dimension_probe and (is_http_url(source) or is_s3_uri(source)):
             remote_tasks.append(
                 TableRowRemoteDimensionTask(
                     row_idx=row_idx,
-                    path=identity.logical_path,
-                    source=identity.source,
-                    name=identity.name,
+                    path=path,
+                    source=source,
+                    name=store.names[slot],
                 )
             )
-        progress.step()
-
-    progress.finish()
-    store = _finish_row_store(
-        row_count=table.row_count,
-        row_indices=row_indices,
-        paths=paths,
-        sources=sources,
-        names=names,
-        mimes=mimes,
-        widths=widths,
-        heights=heights,
-        sizes=sizes,
-        mtimes=mtimes,
-        urls=urls,
-        path_to_row=path_to_row,
-        row_to_path=row_to_path,
-        row_to_slot=row_to_slot,
-        folder_rows=folder_rows,
-        dir_children=dir_children,
-        row_dimensions=row_dimensions,
-    )
+    disabled, outside_root, resolved_outside_root, missing = skipped_local
     return TableRowStoreBuildResult(
         store=store,
         remote_tasks=remote_tasks,
-        skipped_local_disabled=skipped.disabled,
-        skipped_local_outside_root=skipped.outside_root,
-        skipped_local_resolved_outside_root=skipped.resolved_outside_root,
-        skipped_local_missing=skipped.missing,
+        skipped_local_disabled=disabled,
+        skipped_local_outside_root=outside_root,
+        skipped_local_resolved_outside_root=resolved_outside_root,
+        skipped_local_missing=missing,
     )
 
 
@@ -626,33 +737,8 @@ def _build_uniform_http_row_store(
     row_count = table.row_count
     seen_paths: set[str] = set()
     remote_tasks: list[TableRowRemoteDimensionTask] = []
+    builder = _RowStoreBuilder(row_count)
 
-    row_indices: list[int] = []
-    paths: list[str] = []
-    sources: list[str] = []
-    names: list[str] = []
-    mimes: list[ImageMime] = []
-    widths: list[int] = []
-    heights: list[int] = []
-    sizes: list[int] = []
-    mtimes: list[float] = []
-    urls: list[str | None] = []
-    path_to_row: dict[str, int] = {}
-    row_to_path: list[str | None] = [None] * row_count
-    row_to_slot: list[int] | None = None
-    row_dimensions: list[tuple[int, int] | None] = [None] * row_count
-    folder_rows: dict[str, list[int]] = {}
-    dir_children: dict[str, set[str]] = {}
-    seen_folders: set[str] = set()
-
-    source_values = columns.source_values
-    path_values = columns.path_values
-    name_values = columns.name_values
-    mime_values = columns.mime_values
-    width_values = columns.width_values
-    height_values = columns.height_values
-    size_values = columns.size_values
-    mtime_values = columns.mtime_values
     has_path_column = table.path_column is not None
     has_name_column = table.name_column is not None
     has_mime_column = table.mime_column is not None
@@ -666,122 +752,95 @@ def _build_uniform_http_row_store(
         label=f"table:{table.source_column}",
         emit=context.progress,
     )
-    progress_batch_size = 2048
-
-    for row_idx in range(row_count):
-        if (row_idx + 1) % progress_batch_size == 0:
-            progress.step(progress_batch_size)
-
-        source = _fast_text(source_values[row_idx])
-        if not source or not is_http_url(source):
-            continue
 
-        if has_path_column:
-            logical_value = _fast_text(path_values[row_idx]) or source
-            if is_http_url(logical_value):
-                logical_path = normalize_item_path(derive_http_logical_path(logical_value))
+    for batch in columns.batches(row_count):
+        source_values = batch.source_values
+        path_values = batch.path_values
+        name_values = batch.name_values
+        mime_values = batch.mime_values
+        width_values = batch.width_values
+        height_values = batch.height_values
+        size_values = batch.size_values
+        mtime_values = batch.mtime_values
+        for idx in range(batch.row_count):
+            row_idx = batch.start + idx
+            source = _fast_text(source_values[idx])
+            if not source or not is_http_url(source):
+                continue
+
+            if has_path_column:
+                logical_value = _fast_text(path_values[idx]) or source
+                if is_http_url(logical_value):
+                    logical_path = normalize_item_path(derive_http_logical_path(logical_value))
+                    folder_norm, fallback_name = _fast_path_folder_and_name(logical_path) if logical_path else ("", "")
+                elif is_s3_uri(logical_value):
+                    logical_path = normalize_item_path(
+                        derive_logical_path(
+                            logical_value,
+                            root=table.root,
+                            local_prefix=table.local_prefix,
+                            s3_prefixes=table.s3_prefixes,
+                            s3_use_bucket=table.s3_use_bucket,
+                        )
+                    )
+                    folder_norm, fallback_name = (
+                        _fast_path_folder_and_name(logical_path) if logical_path else ("", extract_name(source))
+                    )
+                else:
+                    logical_path = normalize_item_path(logical_value)
+                    folder_norm, _path_name = _fast_path_folder_and_name(logical_path)
+                    fallback_name = extract_name(source)
+            else:
+                logical_path = derive_http_logical_path(source)
                 folder_norm, fallback_name = _fast_path_folder_and_name(logical_path) if logical_path else ("", "")
-            elif is_s3_uri(logical_value):
-                logical_path = normalize_item_path(
-                    derive_logical_path(
-                        logical_value,
-                        root=table.root,
-                        local_prefix=table.local_prefix,
-                        s3_prefixes=table.s3_prefixes,
-                        s3_use_bucket=table.s3_use_bucket,
+            if not logical_path:
+                continue
+
+            explicit_name = _fast_text(name_values[idx]) if has_name_column else ""
+            image_name = explicit_name or fallback_name or extract_name(logical_path) or "image"
+
+            if logical_path in seen_paths:
+                logical_path = dedupe_path(logical_path, seen_paths)
+            seen_paths.add(logical_path)
+
+            mime = normalize_image_mime(mime_values[idx], image_name) if has_mime_column else context.source_resolver.guess_mime(image_name)
+            size = (coerce_int(size_values[idx]) or 0) if has_size_column else 0
+            mtime = (coerce_timestamp(mtime_values[idx]) or 0.0) if has_mtime_column else 0.0
+            width = _int_or_zero(width_values[idx]) if has_width_column else 0
+            height = _int_or_zero(height_values[idx]) if has_height_column else 0
+            cached_dims = None
+            if width <= 0 or height <= 0:
+                cached_dims = _cached_dimensions_for_row(context.table, row_idx, source, logical_path)
+                if cached_dims is not None:
+                    width, height = cached_dims
+
+            builder.append(
+                row_idx=row_idx,
+                path=logical_path,
+                folder_norm=folder_norm,
+                source=source,
+                name=image_name,
+                mime=mime,
+                width=width,
+                height=height,
+                size=size,
+                mtime=mtime,
+                is_url=True,
+            )
+            if (width == 0 or height == 0) and not policy.skip_dimension_probe:
+                remote_tasks.append(
+                    TableRowRemoteDimensionTask(
+                        row_idx=row_idx,
+                        path=logical_path,
+                        source=source,
+                        name=image_name,
                     )
                 )
-                folder_norm, fallback_name = (
-                    _fast_path_folder_and_name(logical_path) if logical_path else ("", extract_name(source))
-                )
-            else:
-                logical_path = normalize_item_path(logical_value)
-                folder_norm, _path_name = _fast_path_folder_and_name(logical_path)
-                fallback_name = extract_name(source)
-        else:
-            logical_path = derive_http_logical_path(source)
-            folder_norm, fallback_name = _fast_path_folder_and_name(logical_path) if logical_path else ("", "")
-        if not logical_path:
-            continue
 
-        explicit_name = _fast_text(name_values[row_idx]) if has_name_column else ""
-        image_name = explicit_name or fallback_name or extract_name(logical_path) or "image"
-
-        if logical_path in seen_paths:
-            logical_path = dedupe_path(logical_path, seen_paths)
-        seen_paths.add(logical_path)
-
-        mime = normalize_image_mime(mime_values[row_idx], image_name) if has_mime_column else context.source_resolver.guess_mime(image_name)
-        size = (coerce_int(size_values[row_idx]) or 0) if has_size_column else 0
-        mtime = (coerce_timestamp(mtime_values[row_idx]) or 0.0) if has_mtime_column else 0.0
-        width = _int_or_zero(width_values[row_idx]) if has_width_column else 0
-        height = _int_or_zero(height_values[row_idx]) if has_height_column else 0
-        cached_dims = None
-        if width <= 0 or height <= 0:
-            cached_dims = _cached_dimensions_for_row(context.table, row_idx, source, logical_path)
-            if cached_dims is not None:
-                width, height = cached_dims
-
-        slot = len(row_indices)
-        row_to_slot = _remember_row_slot(
-            row_to_slot,
-            row_indices=row_indices,
-            row_count=row_count,
-            row_idx=row_idx,
-            slot=slot,
-        )
-        row_indices.append(row_idx)
-        paths.append(logical_path)
-        sources.append(source)
-        names.append(image_name)
-        mimes.append(mime)
-        widths.append(width)
-        heights.append(height)
-        sizes.append(size)
-        mtimes.append(mtime)
-        urls.append(source)
-        path_to_row[logical_path] = row_idx
-        row_to_path[row_idx] = logical_path
-        row_dimensions[row_idx] = cached_dims or (width, height)
-        folder_rows.setdefault(folder_norm, []).append(row_idx)
-        _record_folder_children(
-            folder_norm,
-            seen_folders=seen_folders,
-            dir_children=dir_children,
-        )
-        if (width == 0 or height == 0) and not policy.skip_dimension_probe:
-            remote_tasks.append(
-                TableRowRemoteDimensionTask(
-                    row_idx=row_idx,
-                    path=logical_path,
-                    source=source,
-                    name=image_name,
-                )
-            )
+        progress.step(batch.row_count)
 
-    remainder = row_count % progress_batch_size
-    if remainder:
-        progress.step(remainder)
     progress.finish()
-    store = _finish_row_store(
-        row_count=row_count,
-        row_indices=row_indices,
-        paths=paths,
-        sources=sources,
-        names=names,
-        mimes=mimes,
-        widths=widths,
-        heights=heights,
-        sizes=sizes,
-        mtimes=mtimes,
-        urls=urls,
-        path_to_row=path_to_row,
-        row_to_path=row_to_path,
-        row_to_slot=row_to_slot,
-        folder_rows=folder_rows,
-        dir_children=dir_children,
-        row_dimensions=row_dimensions,
-    )
+    store = builder.finish()
     return TableRowStoreBuildResult(
         store=store,
         remote_tasks=remote_tasks,
@@ -5,8 +5,9 @@ import os
 import re
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from typing import Any
 
-from ..source.paths import extract_name, is_supported_image
+from ..source.paths import extract_name, is_http_url, is_s3_uri, is_supported_image
 
 MEDIA_SOURCE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
 
@@ -217,3 +218,21 @@ def _has_non_image_suffix(value: str) -> bool:
         return False
     suffix = os.path.splitext(name)[1].lower()
     return bool(suffix and suffix not in MEDIA_SOURCE_EXTS)
+
+
+def sample_source_kind(values: Iterable[Any], *, sample_size: int = 1024) -> str | None:
+    kind: str | None = None
+    checked = 0
+    for raw in values:
+        source = normalized_source_text(raw)
+        if source is None:
+            continue
+        current = "s3" if is_s3_uri(source) else "http" if is_http_url(source) else "local"
+        if kind is None:
+            kind = current
+        elif kind != current:
+            return "mixed"
+        checked += 1
+        if checked >= sample_size:
+            return kind
+    return kind
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, TypeAlias
@@ -15,6 +16,8 @@ TableSourceRefreshState: TypeAlias = Literal[
 ]
 
 TABLE_SOURCE_CHANGED_MESSAGE = "The source table changed; restart Lenslet to load the new snapshot."
+TABLE_SOURCE_RELOADING_MESSAGE = "The source table changed; Lenslet is loading the new snapshot."
+TABLE_SOURCE_RELOAD_FAILED_MESSAGE = "The source table changed and could not be reloaded; restart Lenslet to load it."
 
 
 class TableSourceChangedError(RuntimeError):
@@ -58,37 +61,58 @@ class _LocalSourceFingerprint:
 
 
 class TableSourceRefreshTracker:
+    """Watch the local file, or every shard of a Parquet dataset, behind a table.
+
+    Each file keeps its own fingerprint. For datasets, `discover` re-lists the
+    shards so an added or removed file is also a change. Once its storage
+    can reload in process, a change reads as `refreshing` while the next
+    generation builds, instead of requiring a restart.
+    """
+
     def __init__(
         self,
         *,
-        path: Path | None,
-        fingerprint: _LocalSourceFingerprint | None,
+        paths: tuple[Path, ...],
+        fingerprints: tuple[_LocalSourceFingerprint, ...] | None,
         status: TableSourceRefreshStatus,
+        discover: Callable[[], tuple[Path, ...]] | None = None,
     ) -> None:
-        self._path = path
-        self._fingerprint = fingerprint
+        self._paths = paths
+        self._fingerprints = fingerprints
         self._status = status
+        self._discover = discover
+        self._reloadable = False
         self._lock = threading.Lock()
         self._pending_transition = False
 
     @classmethod
     def for_local_file(cls, path: Path) -> TableSourceRefreshTracker:
-        watched_path = path.absolute()
-        fingerprint = _fingerprint(watched_path)
+        return cls.for_local_files((path,))
+
+    @classmethod
+    def for_local_files(
+        cls,
+        paths: tuple[Path, ...],
+        *,
+        discover: Callable[[], tuple[Path, ...]] | None = None,
+    ) -> TableSourceRefreshTracker:
+        watched_paths = tuple(path.absolute() for path in paths)
+        fingerprints = tuple(_fingerprint(path) for path in watched_paths)
         return cls(
-            path=watched_path,
-            fingerprint=fingerprint,
+            paths=watched_paths,
+            fingerprints=fingerprints,
             status=TableSourceRefreshStatus(
                 state="current",
-                generation=fingerprint.generation,
+                generation=_generation(fingerprints),
             ),
+            discover=discover,
         )
 
     @classmethod
     def restart_required(cls, message: str) -> TableSourceRefreshTracker:
         return cls(
-            path=None,
-            fingerprint=None,
+            paths=(),
+            fingerprints=None,
             status=TableSourceRefreshStatus(
                 state="restart-required",
                 generation=None,
@@ -103,13 +127,20 @@ class TableSourceRefreshTracker:
     def is_pollable(self) -> bool:
         with self._lock:
             return (
-                self._path is not None
-                and self._fingerprint is not None
-                and (self._status.state == "current" or self._pending_transition)
+                bool(self._paths)
+                and self._fingerprints is not None
+                and (self._status.state in ("current", "refreshing") or self._pending_transition)
             )
 
-    def ensure_current(self) -> None:
+    def ensure_current(self, *, allow_refreshing: bool = False) -> None:
+        """Raise `TableSourceChangedError` unless the tracked source is current.
+
+        `allow_refreshing` lets callers that only use the loaded generation
+        keep serving while a reload is in flight.
+        """
         status = self._refresh_status()
+        if status.state == "refreshing" and allow_refreshing:
+            return
         if status.state != "current":
             raise TableSourceChangedError(
                 status.message or "The source table is not current; restart Lenslet to reload it."
@@ -122,37 +153,66 @@ class TableSourceRefreshTracker:
             self._pending_transition = False
         return status, changed
 
+    def set_reloadable(self, reloadable: bool) -> None:
+        with self._lock:
+            self._reloadable = reloadable
+
+    def mark_reload_failed(self, message: str = TABLE_SOURCE_RELOAD_FAILED_MESSAGE) -> None:
+        with self._lock:
+            self._status = TableSourceRefreshStatus(
+                state="restart-required",
+                generation=self._status.generation,
+                message=message,
+            )
+            self._pending_transition = True
+
+    def flag_transition(self) -> None:
+        """Make the next `poll` report the current status as a transition."""
+        with self._lock:
+            self._pending_transition = True
+
     def _refresh_status(self) -> TableSourceRefreshStatus:
         with self._lock:
-            if self._status.state == "restart-required":
+            if self._status.state in ("restart-required", "refreshing"):
                 return self._status
             current_status = self._status
-        path = self._path
-        fingerprint = self._fingerprint
-        if path is None or fingerprint is None:
+            reloadable = self._reloadable
+        paths = self._paths
+        fingerprints = self._fingerprints
+        if not paths or fingerprints is None:
             return current_status
+        generation = _generation(fingerprints)
         try:
-            observed = _fingerprint(path)
-        except OSError:
+            if self._discover is not None and self._discover() != paths:
+                observed = None
+            else:
+                observed = tuple(_fingerprint(path) for path in paths)
+        except (OSError, ValueError):
             next_status = TableSourceRefreshStatus(
                 state="restart-required",
-                generation=fingerprint.generation,
+                generation=generation,
                 message="The source table is unavailable; restart Lenslet after restoring it.",
             )
         else:
-            if observed == fingerprint:
+            if observed == fingerprints:
                 next_status = TableSourceRefreshStatus(
                     state="current",
-                    generation=fingerprint.generation,
+                    generation=generation,
+                )
+            elif reloadable:
+                next_status = TableSourceRefreshStatus(
+                    state="refreshing",
+                    generation=generation,
+                    message=TABLE_SOURCE_RELOADING_MESSAGE,
                 )
             else:
                 next_status = TableSourceRefreshStatus(
                     state="restart-required",
-                    generation=fingerprint.generation,
+                    generation=generation,
                     message=TABLE_SOURCE_CHANGED_MESSAGE,
                 )
         with self._lock:
-            if self._status.state == "restart-required":
+            if self._status.state in ("restart-required", "refreshing"):
                 return self._status
             if next_status != self._status:
                 self._status = next_status
@@ -160,6 +220,13 @@ class TableSourceRefreshTracker:
             return self._status
 
 
+def _generation(fingerprints: tuple[_LocalSourceFingerprint, ...]) -> str:
+    if len(fingerprints) == 1:
+        return fingerprints[0].generation
+    raw = ":".join(fingerprint.generation for fingerprint in fingerprints)
+    return hashlib.sha256(raw.encode("ascii")).hexdigest()[:24]
+
+
 def _fingerprint(path: Path) -> _LocalSourceFingerprint:
     stat = path.stat()
     sample_digest = _sample_digest(path, stat.st_size)
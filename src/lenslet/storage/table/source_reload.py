@@ -0,0 +1,165 @@
+"""In-process reloads of a changed table source.
+
+A reload builds a successor storage off the request path and compares its
+column store with the live one by logical path. A row counts as unchanged
+when its source, URL, name, mtime, metrics, and categoricals all match, so
+state derived from those inputs can move to the new generation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Any
+
+from .generation import pinned_table_generations
+from .index_types import TableCachedRowDimensions
+from .source_refresh import TableSourceChangedError
+
+if TYPE_CHECKING:
+    from .query_engine import TableColumnStore
+    from .storage import TableStorage
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True, slots=True)
+class TableGenerationDiff:
+    """Row-level difference between two generations of one table source.
+
+    `changed_paths` holds every normalized path that was added, removed, or
+    changed; unchanged paths are only counted.
+    """
+
+    added: int
+    removed: int
+    changed: int
+    unchanged: int
+    changed_paths: frozenset[str]
+
+    def changed_scopes(self) -> frozenset[str]:
+        """Canonical folders that directly hold a changed path."""
+        return frozenset(
+            "/" + path.rsplit("/", 1)[0] if "/" in path else "/"
+            for path in self.changed_paths
+        )
+
+
+def _row_signature(columns: TableColumnStore, slot: int) -> tuple[Any, ...]:
+    return (
+        columns.sources[slot],
+        columns.urls[slot],
+        columns.names[slot],
+        columns.added_ms.value(slot),
+        *(columns.metric_value(slot, key) for key in columns.metrics),
+        *(values[slot] for values in columns.categoricals.values()),
+    )
+
+
+def diff_table_generations(
+    previous: TableColumnStore,
+    current: TableColumnStore,
+) -> TableGenerationDiff:
+    """Compare two column stores row by row, matching rows by logical path."""
+    comparable = (
+        tuple(previous.metrics) == tuple(current.metrics)
+        and tuple(previous.categoricals) == tuple(current.categoricals)
+    )
+    changed_paths: set[str] = set()
+    changed = 0
+    unchanged = 0
+    for slot, path in enumerate(current.paths):
+        previous_slot = previous.slot_for_path(path)
+        if previous_slot is None:
+            changed_paths.add(path)
+        elif comparable and _row_signature(previous, previous_slot) == _row_signature(current, slot):
+            unchanged += 1
+        else:
+            changed_paths.add(path)
+            changed += 1
+    added = len(changed_paths) - changed
+    removed = 0
+    for path in previous.paths:
+        if current.slot_for_path(path) is None:
+            changed_paths.add(path)
+            removed += 1
+    return TableGenerationDiff(
+        added=added,
+        removed=removed,
+        changed=changed,
+        unchanged=unchanged,
+        changed_paths=frozenset(changed_paths),
+    )
+
+
+def carry_dimension_overrides(
+    overrides: Mapping[int, TableCachedRowDimensions],
+    source_values: Sequence[Any],
+    carried: Iterable[TableCachedRowDimensions],
+) -> dict[int, TableCachedRowDimensions]:
+    """Extend row-indexed dimension overrides with dimensions known for the same source.
+
+    Row indices shift between generations, so carried dimensions are matched
+    by source value; the row scan still checks the logical path before
+    trusting one.
+    """
+    by_source = {dims.source: dims for dims in carried}
+    merged = dict(overrides)
+    if not by_source:
+        return merged
+    for row_idx, source in enumerate(source_values):
+        if row_idx in merged or source is None:
+            continue
+        dims = by_source.get(str(source).strip())
+        if dims is not None:
+            merged[row_idx] = dims
+    return merged
+
+
+def reload_table_generation(storage: TableStorage) -> TableGenerationDiff | None:
+    """Build the next generation of a refreshing source and swap it into `storage`.
+
+    Returns the row diff once the new generation is live, or None when no
+    reload was due or it could not complete. A source that changes again
+    mid-build stays `refreshing` so the next call retries; any other
+    failure leaves the loaded generation serving and requires a restart.
+    """
+    reloader = storage._source_reloader
+    tracker = storage._source_refresh_tracker
+    if reloader is None or tracker is None or tracker.status().state != "refreshing":
+        return None
+    try:
+        successor = reloader(storage)
+    except TableSourceChangedError:
+        return None
+    except Exception as exc:
+        logger.warning("failed to reload table source: %s", exc)
+        tracker.mark_reload_failed()
+        return None
+    return adopt_table_generation(storage, successor)
+
+
+def adopt_table_generation(storage: TableStorage, successor: TableStorage) -> TableGenerationDiff:
+    """Publish the successor's generation in `storage` with one reference swap.
+
+    Storage-owned state (launch configuration, the thumbnail cache, labels,
+    and web wiring) stays on `storage`; the thumbnail cache is pruned to
+    unchanged paths.
+    """
+    diff = diff_table_generations(
+        storage._table_query_engine.columns,
+        successor._table_query_engine.columns,
+    )
+    generation = successor._generation
+    with storage._generation_lock:
+        for path in diff.changed_paths:
+            storage._thumbnails.pop(path, None)
+        generation._table_query_engine.replace_sidecars(storage._sidecars)
+        # The successor's resolver callbacks are bound to it; rebind them here.
+        with pinned_table_generations({storage: generation}):
+            generation._index_context = storage._build_index_context()
+        # Readers see either generation whole; pinned requests keep the old one.
+        storage._generation = generation
+    if storage._source_refresh_tracker is not None:
+        storage._source_refresh_tracker.flag_transition()
+    return diff
@@ -7,10 +7,12 @@ import gc
 import hashlib
 import logging
 import os
+import threading
 import time
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from io import BytesIO
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import urlparse
 
@@ -38,7 +40,6 @@ from .display import (
     normalize_display_value,
     normalize_metrics_display_value,
 )
-from .facets import histogram_summary
 from .index import (
     build_index_columns,
     extract_row_display_fields,
@@ -61,10 +62,7 @@ from .input import (
     table_to_columns,
     validate_table_input,
 )
-from ..image_media import (
-    make_webp_thumbnail,
-    read_dimensions_from_bytes,
-)
+from ..image_media import read_dimensions_from_bytes
 from ..source.paths import (
     canonical_sidecar_key,
     compute_local_prefix,
@@ -90,27 +88,42 @@ from .schema import (
 )
 from .source_detection import (
     normalized_source_text,
+    sample_source_kind,
     score_source_column_values,
     source_column_name_priority,
 )
 from .source_refresh import TableSourceRefreshStatus, TableSourceRefreshTracker
+from .generation import TableGeneration, install_generation_fields
+from .source_reload import TableGenerationDiff, reload_table_generation
+from .parquet_dataset import resolve_parquet_dataset
 from .pyarrow_runtime import pyarrow_exception_types, require_pyarrow_parquet
 from . import query_execution
+from .column_cache import (
+    TableRowStoreSnapshot,
+    load_column_store,
+    table_column_cache_identity,
+    write_column_store,
+    write_row_store,
+)
 from .query_engine import (
     CancellationProbe,
+    TableColumnStore,
     TableFilterAnalysis,
     TableFilterKey,
     TableOrderAnalysis,
     TableOrderKey,
     TableQueryEngine,
 )
+from .row_search import TableSearchColumns
 from .row_store import (
     TableRowRemoteDimensionTask,
     TableRowStore,
     TableRowStoreBuildResult,
     TableRowViewItem,
     build_table_row_store,
+    resume_table_row_store,
 )
+from .row_scan import table_scan_worker_count
 from ..search_text import normalize_search_path
 
 
@@ -175,16 +188,20 @@ class TableStorageOptions:
     skip_dimension_probe: bool = False
     allow_local: bool = True
     skip_local_realpath_validation: bool = False
+    scan_workers: int | None = None
     row_field_provider: Callable[[int], dict[str, Any]] | None = None
     table_field_columns: tuple[str, ...] = ()
     categorical_columns: tuple[str, ...] = ()
     categorical_row_provider: Callable[[int], dict[str, Any]] | None = None
     browse_signature_seed: str = ""
+    column_cache_dir: Path | None = None
     dimension_overrides: dict[int, TableCachedRowDimensions] | None = None
     dimension_cache_policy: str = "none"
     dimension_write_policy: str = "none"
     launch_warnings: tuple[str, ...] = ()
     source_refresh_tracker: TableSourceRefreshTracker | None = None
+    row_store_cache_identity: dict[str, Any] | None = None
+    row_store_snapshot: TableRowStoreSnapshot | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -269,24 +286,6 @@ def _is_supported_table_image(name: str) -> bool:
     return is_supported_image(name, TABLE_IMAGE_EXTS)
 
 
-def _sample_source_kind(values: list[Any], *, sample_size: int = 1024) -> str | None:
-    kind: str | None = None
-    checked = 0
-    for raw in values:
-        source = normalized_source_text(raw)
-        if source is None:
-            continue
-        current = "s3" if is_s3_uri(source) else "http" if is_http_url(source) else "local"
-        if kind is None:
-            kind = current
-        elif kind != current:
-            return "mixed"
-        checked += 1
-        if checked >= sample_size:
-            return kind
-    return kind
-
-
 class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
     """
     In-memory storage backed by a single table (DataFrame or Parquet).
@@ -387,10 +386,14 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         options: TableStorageOptions | None = None,
     ):
         options = options or TableStorageOptions()
+        self._generation = TableGeneration()
         self.root = os.path.abspath(options.root) if options.root else None
         self._root_real = os.path.realpath(self.root) if self.root else None
         self._allow_local = options.allow_local
         self._skip_local_realpath_validation = bool(options.skip_local_realpath_validation)
+        self._scan_workers = (
+            table_scan_worker_count() if options.scan_workers is None else max(1, options.scan_workers)
+        )
         self._initialize_source_backed_state(
             config=SourceBackedConfig(
                 thumb_size=options.thumb_size,
@@ -419,25 +422,26 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         self._categorical_columns = tuple(options.categorical_columns)
         self._categorical_row_provider = options.categorical_row_provider
         self._browse_signature_seed = options.browse_signature_seed
+        self._column_cache_dir = options.column_cache_dir
         self._dimension_overrides = options.dimension_overrides
         self._dimension_cache_policy = options.dimension_cache_policy
         self._dimension_write_policy = options.dimension_write_policy
         self._launch_warnings = tuple(options.launch_warnings)
         self._source_refresh_tracker = options.source_refresh_tracker
+        self._source_reloader: Callable[[TableStorage], TableStorage] | None = None
+        self._generation_lock = threading.Lock()
         self._last_skipped_rows = TableSkippedRowCounts()
         self._progress_bar = ProgressBar()
 
         self._indexes: dict[str, TableBrowseIndex] = {}
         self._row_store: TableRowStore | None = None
         self._generated_at = datetime.now(timezone.utc).isoformat()
-        self._search_paths_lower: list[str] | None = None
-        self._search_names_lower: list[str] | None = None
-        self._search_sources_lower: list[str] | None = None
+        self._search_columns: TableSearchColumns | None = None
         self._path_column_aliases_source = False
 
         validated_table = validate_table_input(table)
         initial_columns = table_input_columns(validated_table)
-        python_columns = self._startup_python_columns(validated_table, initial_columns, options)
+        python_columns = self._startup_python_columns(initial_columns, options)
         columns, data, row_count = table_to_columns(validated_table, python_columns=python_columns)
         if row_count == 0:
             raise ValueError("table is empty")
@@ -462,54 +466,62 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
             source_column,
             explicit=options.source_column is not None,
         )
-        self._rebuild_for_source_column(source_column)
+        snapshot = options.row_store_snapshot
+        self._rebuild_for_source_column(source_column, row_store_snapshot=snapshot)
+        # Local rows are stat'ed on every scan, so only remote tables skip it.
+        if (snapshot is None or self._row_store is not snapshot.store) and self._source_kind in ("http", "s3"):
+            write_row_store(self._column_cache_dir, options.row_store_cache_identity, self._row_store_snapshot())
 
-    def _rebuild_for_source_column(self, source_column: str) -> None:
+    def _rebuild_for_source_column(
+        self,
+        source_column: str,
+        *,
+        row_store_snapshot: TableRowStoreSnapshot | None = None,
+    ) -> None:
         resolved = resolve_column(self._columns, source_column)
         if resolved is None:
             raise ValueError(f"source column '{source_column}' not found")
         self._ensure_python_column(resolved)
         self._source_column = resolved
+        snapshot = row_store_snapshot if self._matches_row_store_snapshot(row_store_snapshot) else None
         source_values = self._data.get(self._source_column, [])
-        self._source_kind = _sample_source_kind(source_values)
-        if self._source_kind == "http":
-            self._s3_prefixes, self._s3_use_bucket = {}, False
-            self._local_prefix = None
-        elif self._source_kind == "s3":
-            self._s3_prefixes, self._s3_use_bucket = compute_s3_prefixes(source_values)
-            self._local_prefix = None
+        if snapshot is not None:
+            self._source_kind = snapshot.source_kind
+            self._s3_prefixes, self._s3_use_bucket = dict(snapshot.s3_prefixes), snapshot.s3_use_bucket
+            self._local_prefix = snapshot.local_prefix
         else:
-            self._s3_prefixes, self._s3_use_bucket = compute_s3_prefixes(source_values)
-            self._local_prefix = compute_local_prefix(source_values) if self._allow_local else None
+            self._source_kind = sample_source_kind(source_values)
+            if self._source_kind == "http":
+                self._s3_prefixes, self._s3_use_bucket = {}, False
+                self._local_prefix = None
+            elif self._source_kind == "s3":
+                self._s3_prefixes, self._s3_use_bucket = compute_s3_prefixes(source_values)
+                self._local_prefix = None
+            else:
+                self._s3_prefixes, self._s3_use_bucket = compute_s3_prefixes(source_values)
+                self._local_prefix = compute_local_prefix(source_values) if self._allow_local else None
 
         self._path_column = resolve_path_column(
             self._columns,
             self._configured_path_column,
             logical_path_columns=self.LOGICAL_PATH_COLUMNS,
         )
-        self._path_column_aliases_source = self._auto_path_column_aliases_source_from_data(
-            source_column=self._source_column,
-            path_column=self._path_column,
-            path_column_was_explicit=self._configured_path_column is not None,
+        self._path_column_aliases_source = (
+            snapshot.path_column_aliases_source
+            if snapshot is not None
+            else self._auto_path_column_aliases_source_from_data(
+                source_column=self._source_column,
+                path_column=self._path_column,
+                path_column_was_explicit=self._configured_path_column is not None,
+            )
         )
-        if self._path_column and not self._path_column_aliases_source:
-            self._ensure_python_column(self._path_column)
+        # Path and media columns stay columnar; the row scan converts them one batch at a time.
         self._name_column = resolve_named_column(self._columns, self.NAME_COLUMNS)
         self._mime_column = resolve_named_column(self._columns, self.MIME_COLUMNS)
         self._width_column = resolve_named_column(self._columns, self.WIDTH_COLUMNS)
         self._height_column = resolve_named_column(self._columns, self.HEIGHT_COLUMNS)
         self._size_column = resolve_named_column(self._columns, self.SIZE_COLUMNS)
         self._mtime_column = resolve_named_column(self._columns, self.MTIME_COLUMNS)
-        for column in (
-            self._name_column,
-            self._mime_column,
-            self._width_column,
-            self._height_column,
-            self._size_column,
-            self._mtime_column,
-        ):
-            if column:
-                self._ensure_python_column(column)
         self._metrics_column = next((col for col in self._columns if col.lower() == "metrics"), None)
 
         if self._configured_categorical_columns:
@@ -529,7 +541,11 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
                 metrics_column=self._metrics_column,
             )
 
-        self._extensionless_source_trust_scope = self._selected_extensionless_source_trust_scope()
+        self._extensionless_source_trust_scope = (
+            snapshot.extensionless_source_trust_scope
+            if snapshot is not None
+            else self._selected_extensionless_source_trust_scope()
+        )
         self._index_context = self._build_index_context()
         self._index_columns = build_index_columns(self._index_context)
         self._metric_column_names = frozenset(column for column, _values in self._index_columns.metric_columns)
@@ -538,9 +554,10 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         self._build_path_index()
         self._generated_at = datetime.now(timezone.utc).isoformat()
         with _bulk_table_gc_pause(self._row_count):
-            row_store_result = build_table_row_store(
-                self._index_context,
-                columns=self._index_columns,
+            row_store_result = (
+                resume_table_row_store(self._index_context, snapshot.store, skipped_local=snapshot.skipped_local)
+                if snapshot is not None
+                else build_table_row_store(self._index_context, columns=self._index_columns)
             )
             self._apply_row_store_result(row_store_result)
         self._metric_keys = self._compute_metric_keys()
@@ -548,20 +565,82 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
             self._probe_row_remote_dimensions(row_store_result.remote_tasks)
         with _bulk_table_gc_pause(self._row_count):
             self._browse_signature = self._compute_browse_signature()
-            self._table_query_engine = TableQueryEngine.from_row_store(
-                self._require_row_store(),
-                source_generation=self._browse_signature, metric_keys=self._metric_keys,
-                categorical_keys=self._categorical_columns,
-                metrics_for_row=self._metrics_for_row,
-                categoricals_for_row=self._query_categoricals_for_row,
-                include_source_in_search=self._include_source_in_search,
+            self._table_query_engine = TableQueryEngine(
+                self._load_or_build_column_store(),
                 sidecars=self._sidecars,
             )
-        current_status = self._source_column_status(self._source_column, selected=True)
-        if row_store_result.store.total_rows() == 0:
+        if snapshot is not None:
+            self._source_column_warning = snapshot.source_column_warning
+        elif row_store_result.store.total_rows() == 0:
             self._source_column_warning = "The selected source column produced no loadable gallery entries."
         else:
-            self._source_column_warning = current_status.warning
+            self._source_column_warning = self._source_column_status(self._source_column, selected=True).warning
+
+    def _matches_row_store_snapshot(self, snapshot: TableRowStoreSnapshot | None) -> bool:
+        return snapshot is not None and (
+            snapshot.root,
+            snapshot.source_column,
+            snapshot.row_count,
+            snapshot.allow_local,
+            snapshot.skip_dimension_probe,
+        ) == (self.root, self._source_column, self._row_count, self._allow_local, self._skip_dimension_probe)
+
+    def _row_store_snapshot(self) -> TableRowStoreSnapshot:
+        skipped = self._last_skipped_rows
+        return TableRowStoreSnapshot(
+            store=self._require_row_store(),
+            root=self.root,
+            source_column=self._source_column,
+            row_count=self._row_count,
+            allow_local=self._allow_local,
+            skip_dimension_probe=self._skip_dimension_probe,
+            source_kind=self._source_kind,
+            s3_prefixes=self._s3_prefixes,
+            s3_use_bucket=self._s3_use_bucket,
+            local_prefix=self._local_prefix,
+            path_column_aliases_source=self._path_column_aliases_source,
+            extensionless_source_trust_scope=self._extensionless_source_trust_scope,
+            source_column_warning=self._source_column_warning,
+            skipped_local=(
+                skipped.local_disabled,
+                skipped.local_outside_root,
+                skipped.local_resolved_outside_root,
+                skipped.local_missing,
+            ),
+        )
+
+    def _load_or_build_column_store(self) -> TableColumnStore:
+        row_store = self._require_row_store()
+        # Without a source fingerprint the browse signature cannot tell table versions apart.
+        cache_identity = (
+            table_column_cache_identity(
+                source_generation=self._browse_signature,
+                metric_keys=self._metric_keys,
+                categorical_keys=self._categorical_columns,
+                include_source_in_search=self._include_source_in_search,
+            )
+            if self._column_cache_dir is not None and self._browse_signature_seed
+            else None
+        )
+        columns = load_column_store(self._column_cache_dir, cache_identity, row_store)
+        if columns is not None:
+            return columns
+        columns = TableColumnStore.build(
+            row_store,
+            source_generation=self._browse_signature,
+            metric_keys=self._metric_keys,
+            categorical_keys=self._categorical_columns,
+            metrics_for_row=self._metrics_for_row,
+            categoricals_for_row=self._query_categoricals_for_row,
+            include_source_in_search=self._include_source_in_search,
+        )
+        if cache_identity is not None and not write_column_store(
+            self._column_cache_dir,
+            cache_identity,
+            columns,
+        ):
+            logger.warning("failed to write table column cache under %s", self._column_cache_dir)
+        return columns
 
     def _source_column_with_sample_fallback(self, source_column: str, *, explicit: bool) -> str:
         if explicit:
@@ -728,7 +807,6 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
 
     def _startup_python_columns(
         self,
-        table: TableInput,
         columns: list[str],
         options: TableStorageOptions,
     ) -> set[str] | None:
@@ -744,80 +822,13 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
             allow_local=self._allow_local,
             is_loadable_value=self._is_loadable_value,
         )
-        path_column = resolve_path_column(
-            columns,
-            options.path_column,
-            logical_path_columns=self.LOGICAL_PATH_COLUMNS,
-        )
-        path_column_aliases_source = self._auto_path_column_aliases_source(
-            table,
-            source_column=source_column,
-            path_column=path_column,
-            path_column_was_explicit=options.path_column is not None,
-        )
-        self._path_column_aliases_source = path_column_aliases_source
-        selected = {
-            source_column,
-            None if path_column_aliases_source else path_column,
-            resolve_named_column(columns, self.NAME_COLUMNS),
-            resolve_named_column(columns, self.MIME_COLUMNS),
-            resolve_named_column(columns, self.WIDTH_COLUMNS),
-            resolve_named_column(columns, self.HEIGHT_COLUMNS),
-            resolve_named_column(columns, self.SIZE_COLUMNS),
-            resolve_named_column(columns, self.MTIME_COLUMNS),
-        }
+        selected = {source_column}
         for column in columns:
             if column.lower() == "metrics":
                 selected.add(column)
                 break
         return {column for column in selected if column}
 
-    @staticmethod
-    def _sample_pyarrow_strings(table: TableInput, column: str, sample_size: int = 1024) -> list[str] | None:
-        if not hasattr(table, "__getitem__"):
-            return None
-        try:
-            values = table[column]  # type: ignore[index]
-            if hasattr(values, "slice"):
-                values = values.slice(0, sample_size)
-            if not hasattr(values, "to_pylist"):
-                return None
-            sampled = values.to_pylist()
-        except Exception:
-            return None
-        result: list[str] = []
-        for raw in sampled:
-            value = normalized_source_text(raw)
-            if value is None:
-                return None
-            result.append(value)
-        return result
-
-    def _auto_path_column_aliases_source(
-        self,
-        table: TableInput,
-        *,
-        source_column: str,
-        path_column: str | None,
-        path_column_was_explicit: bool,
-    ) -> bool:
-        if path_column is None or path_column_was_explicit or path_column == source_column:
-            return False
-        source_values = self._sample_pyarrow_strings(table, source_column)
-        path_values = self._sample_pyarrow_strings(table, path_column)
-        if not source_values or not path_values or len(source_values) != len(path_values):
-            return False
-        source_matches_path = True
-        http_source_matches_path = True
-        for source, path in zip(source_values, path_values):
-            if source != path:
-                source_matches_path = False
-            if not is_http_url(source) or normalize_item_path(derive_http_logical_path(source)) != normalize_item_path(path):
-                http_source_matches_path = False
-            if not source_matches_path and not http_source_matches_path:
-                return False
-        return True
-
     def _auto_path_column_aliases_source_from_data(
         self,
         *,
@@ -873,6 +884,7 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
                 allow_local=self._allow_local,
                 skip_dimension_probe=self._skip_dimension_probe,
                 skip_local_realpath_validation=self._skip_local_realpath_validation,
+                scan_workers=self._scan_workers,
             ),
             source_resolver=TableSourceResolver(
                 guess_mime=self._guess_mime,
@@ -1205,41 +1217,14 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         return read_dimensions_from_bytes(header, None) is not None
 
     def _build_path_index(self) -> None:
-        self._search_paths_lower = None
-        self._search_names_lower = None
-        self._search_sources_lower = None
-
-    def _ensure_search_paths_lower(self) -> list[str]:
-        search_paths = self._search_paths_lower
-        if search_paths is None:
-            search_paths = [path.lower() for path in self._require_row_store().sorted_paths]
-            self._search_paths_lower = search_paths
-        return search_paths
-
-    def _ensure_search_names_lower(self) -> list[str]:
-        search_names = self._search_names_lower
-        if search_names is None:
-            row_store = self._require_row_store()
-            search_names = [
-                row_store.name_for_row(row_idx).lower() for row_idx in row_store.sorted_rows
-            ]
-            self._search_names_lower = search_names
-        return search_names
-
-    def _ensure_search_sources_lower(self) -> list[str]:
-        search_sources = self._search_sources_lower
-        if search_sources is None:
-            values: list[str] = []
-            row_store = self._require_row_store()
-            for row_idx in row_store.sorted_rows:
-                source = row_store.source_for_row(row_idx)
-                url = row_store.url_for_row(row_idx) or ""
-                if url and url != source:
-                    source = f"{source} {url}" if source else url
-                values.append(source.lower())
-            search_sources = values
-            self._search_sources_lower = search_sources
-        return search_sources
+        self._search_columns = None
+
+    def _require_search_columns(self) -> TableSearchColumns:
+        search_columns = self._search_columns
+        if search_columns is None:
+            search_columns = TableSearchColumns(self._require_row_store())
+            self._search_columns = search_columns
+        return search_columns
 
     def _sidecar_search_text(self, path: str) -> str:
         sidecar = self._sidecars.get(self._canonical_source_sidecar_key(path))
@@ -1400,7 +1385,8 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
 
         results: list[TableRowViewItem] = []
         has_sidecars = bool(self._sidecars)
-        search_paths = self._ensure_search_paths_lower()
+        search_columns = self._require_search_columns()
+        search_paths = search_columns.paths()
         source_search_covered_by_path = self._source_search_covered_by_path()
         name_search_covered_by_path = self._name_search_covered_by_path()
         path_needle = self._path_search_needle(
@@ -1410,8 +1396,17 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         if not path_needle:
             return self._materialize_rows(row_store.sorted_rows[start:min(end, start + limit)])
         search_sources: list[str] | None = None
-        search_names = None if name_search_covered_by_path else self._ensure_search_names_lower()
-        for idx in range(start, end):
+        search_names = None if name_search_covered_by_path else search_columns.names()
+        candidates = search_columns.candidate_positions(
+            needle,
+            path_needle,
+            start,
+            end,
+            search_names=search_names is not None,
+            search_sources=self._include_source_in_search and not source_search_covered_by_path,
+            sidecar_paths=self._sidecars,
+        )
+        for idx in range(start, end) if candidates is None else candidates:
             row_idx = row_store.sorted_rows[idx]
             base_match = path_needle in search_paths[idx]
             if not base_match and search_names is not None:
@@ -1422,7 +1417,7 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
                 and not source_search_covered_by_path
             ):
                 if search_sources is None:
-                    search_sources = self._ensure_search_sources_lower()
+                    search_sources = search_columns.sources()
                 base_match = needle in search_sources[idx]
             if base_match:
                 results.append(self._materialize_row_item(row_idx))
@@ -1478,8 +1473,9 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
 
     def get_or_build_thumbnail(self, path: str) -> bytes:
         norm = normalize_item_path(path)
-        if norm in self._thumbnails:
-            return self._thumbnails[norm]
+        cached = self._thumbnails.get(norm)
+        if cached is not None:
+            return cached
 
         try:
             raw = self.read_bytes(norm)
@@ -1490,7 +1486,7 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         except Exception as exc:
             raise MediaReadError.from_exception(path, exc) from exc
         try:
-            thumb, dims = make_webp_thumbnail(
+            thumb, dims = self._thumbnail_renderer(
                 raw,
                 thumb_size=self.thumb_size,
                 thumb_quality=self.thumb_quality,
@@ -1567,13 +1563,27 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
     def query_engine(self) -> TableQueryEngine:
         return self._table_query_engine
 
+    @property
+    def source_column(self) -> str:
+        return self._source_column
+
     def set_sidecar(self, path: str, sidecar: SidecarState) -> None:
-        super().set_sidecar(path, sidecar)
-        self._table_query_engine.update_sidecar(path, sidecar)
+        with self._generation_lock:
+            super().set_sidecar(path, sidecar)
+            for engine in self._sidecar_query_engines():
+                engine.update_sidecar(path, sidecar)
 
     def replace_sidecars(self, sidecars: dict[str, SidecarState]) -> None:
-        super().replace_sidecars(sidecars)
-        self._table_query_engine.replace_sidecars(self._sidecars)
+        with self._generation_lock:
+            super().replace_sidecars(sidecars)
+            for engine in self._sidecar_query_engines():
+                engine.replace_sidecars(self._sidecars)
+
+    def _sidecar_query_engines(self) -> tuple[TableQueryEngine, ...]:
+        # A request pinned to a replaced generation still writes through to the live one.
+        live = self._generation._table_query_engine
+        pinned = self._table_query_engine
+        return (live,) if pinned is live else (live, pinned)
 
     def thumbnail_cache_key(self, path: str) -> str | None:
         try:
@@ -1655,16 +1665,13 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         row_store = self._require_row_store()
         rows = row_store.rows_in_scope(path) if recursive else row_store.direct_rows(path)
 
-        metric_values: dict[str, list[float]] = {key: [] for key in self._metric_keys}
+        metric_histograms = self._table_query_engine.column_histograms(rows, self._metric_keys, bins)
         categorical_counts: dict[str, Counter[str]] = {
             key: Counter()
             for key in self._categorical_columns
         }
 
         for row_idx in rows:
-            for key, value in self._metrics_for_row(row_idx).items():
-                metric_values.setdefault(key, []).append(value)
-
             if self._categorical_row_provider is not None:
                 categoricals = self._extract_categoricals_from_row(
                     self._categorical_row_provider(row_idx)
@@ -1674,7 +1681,7 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
             for key, value in categoricals.items():
                 categorical_counts.setdefault(key, Counter())[value] += 1
 
-        metric_keys = sorted(metric_values)
+        metric_keys = sorted(metric_histograms)
         categorical_keys = sorted(categorical_counts)
         return {
             "version": 1,
@@ -1685,11 +1692,11 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
             "categorical_keys": categorical_keys,
             "metrics": {
                 key: {
-                    "histogram": histogram_summary(values, bins),
+                    "histogram": histogram,
                     "categories": [],
                 }
-                for key, values in metric_values.items()
-                if values
+                for key, histogram in metric_histograms.items()
+                if histogram is not None
             },
             "categoricals": {
                 key: {
@@ -1875,13 +1882,24 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
 
     def ensure_source_current(self) -> None:
         if self._source_refresh_tracker is not None:
-            self._source_refresh_tracker.ensure_current()
+            # The loaded generation stays valid in memory until its successor is swapped in.
+            self._source_refresh_tracker.ensure_current(allow_refreshing=self._source_reloader is not None)
 
     def poll_source_refresh(self) -> tuple[TableSourceRefreshStatus | None, bool]:
         if self._source_refresh_tracker is None:
             return None, False
         return self._source_refresh_tracker.poll()
 
+    def set_source_reloader(self, reloader: Callable[[TableStorage], TableStorage] | None) -> None:
+        """Build successor storages for a changed source with `reloader(self)`."""
+        self._source_reloader = reloader
+        if self._source_refresh_tracker is not None:
+            self._source_refresh_tracker.set_reloadable(reloader is not None)
+
+    def reload_source_generation(self) -> TableGenerationDiff | None:
+        """Swap in the next generation of a refreshing source; see `reload_table_generation`."""
+        return reload_table_generation(self)
+
     def path_for_row_index(self, index: int) -> str | None:
         return self._require_row_store().path_for_row_index(index)
 
@@ -1961,11 +1979,20 @@ class TableStorage(SourceBackedStorageBase[TableRowViewItem]):
         return self._media_reads.s3_client_creations
 
 
+install_generation_fields(TableStorage)
+
+
 def load_parquet_table(path: str, columns: list[str] | None = None) -> pa.Table:
+    dataset = resolve_parquet_dataset(path)
+    if dataset is not None:
+        return dataset.read_table(columns)
     parquet = require_pyarrow_parquet()
     return parquet.read_table(path, columns=columns)
 
 
 def load_parquet_schema(path: str) -> pa.Schema:
+    dataset = resolve_parquet_dataset(path)
+    if dataset is not None:
+        return dataset.schema()
     parquet = require_pyarrow_parquet()
     return parquet.read_schema(path)
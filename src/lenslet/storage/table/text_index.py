@@ -0,0 +1,172 @@
+"""Trigram inverted index for substring search over lower-cased table text.
+
+Every substring of a string contains the byte trigrams of its own UTF-8
+encoding, so intersecting the posting lists of a needle's trigrams yields a
+superset of the rows that contain the needle. Callers verify those candidates
+with the exact substring test, which keeps results identical to a scan.
+
+Postings are built with Arrow kernels one chunk of slots at a time and stored
+as ascending chunk-local `uint16` slots, so the index costs about two bytes per
+distinct trigram occurrence.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from .pyarrow_runtime import load_pyarrow_runtime
+
+
+TRIGRAM_CHUNK_ROWS = 65_536
+TRIGRAM_BYTES = 3
+TRIGRAM_PROBE_RATIO = 16
+
+
+class TrigramIndex:
+    """Byte-trigram postings over one column of lower-cased strings."""
+
+    def __init__(self, lowered: Any) -> None:
+        runtime = load_pyarrow_runtime()
+        import pyarrow.compute as compute
+
+        self._pa = runtime.pyarrow
+        self._pc = compute
+        self._row_count = len(lowered)
+        self._chunks = [
+            (start, self._build_chunk(lowered.slice(start, TRIGRAM_CHUNK_ROWS)))
+            for start in range(0, len(lowered), TRIGRAM_CHUNK_ROWS)
+        ]
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str | None]) -> TrigramIndex:
+        """Index strings that are already lower-cased."""
+        pa = load_pyarrow_runtime().pyarrow
+        return cls(pa.array(values, type=pa.large_string()))
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def candidates(self, needle: str, start: int = 0, end: int | None = None) -> Any | None:
+        """Return sorted int64 slots in `[start, end)` that may contain `needle`.
+
+        None means the needle is too short to narrow the search and every slot
+        is a candidate.
+        """
+        codes = _trigram_codes(needle.encode("utf-8"))
+        if not codes:
+            return None
+        pa = self._pa
+        pc = self._pc
+        end = self._row_count if end is None else min(end, self._row_count)
+        found: list[Any] = []
+        for chunk_start, (grams, run_ends, slots) in self._chunks:
+            if chunk_start >= end or chunk_start + TRIGRAM_CHUNK_ROWS <= start:
+                continue
+            postings: list[Any] = []
+            for code in codes:
+                position = pc.index(grams, code).as_py()
+                if position < 0:
+                    postings = []
+                    break
+                begin = run_ends[position - 1].as_py() if position else 0
+                postings.append(slots.slice(begin, run_ends[position].as_py() - begin))
+            if not postings:
+                continue
+            postings.sort(key=len)
+            matched = postings[0]
+            for posting in postings[1:]:
+                # Candidates are verified exactly, so stop once another
+                # intersection would cost more than it can remove.
+                if (
+                    not len(matched)
+                    or 2 * len(matched) > TRIGRAM_CHUNK_ROWS
+                    or len(posting) > TRIGRAM_PROBE_RATIO * len(matched)
+                ):
+                    break
+                # Hash the smaller side and probe the longer posting list.
+                matched = posting.filter(pc.is_in(posting, value_set=matched))
+            if len(matched):
+                found.append(pc.add(matched.cast(pa.int64()), chunk_start))
+        if not found:
+            return pa.array([], type=pa.int64())
+        candidates = pa.concat_arrays(found)
+        if start > 0 or end < self._row_count:
+            candidates = candidates.filter(pc.and_(
+                pc.greater_equal(candidates, start),
+                pc.less(candidates, end),
+            ))
+        return candidates
+
+    def _build_chunk(self, lowered: Any) -> tuple[Any, Any, Any]:
+        pa = self._pa
+        pc = self._pc
+        binary = lowered.cast(pa.large_binary())
+        offsets = pa.Array.from_buffers(
+            pa.int64(),
+            len(binary) + 1,
+            [None, binary.buffers()[1]],
+            offset=binary.offset,
+        )
+        data = binary.buffers()[2]
+        values = pa.Array.from_buffers(
+            pa.uint8(),
+            0 if data is None else data.size,
+            [None, data],
+        )
+        bytes_per_row = pa.LargeListArray.from_arrays(offsets, values)
+        flat = bytes_per_row.flatten().cast(pa.uint32())
+        parents = pc.list_parent_indices(bytes_per_row).cast(pa.uint16())
+        count = len(flat) - (TRIGRAM_BYTES - 1)
+        if count <= 0:
+            empty = pa.array([], type=pa.uint32())
+            return empty, pa.array([], type=pa.int32()), pa.array([], type=pa.uint16())
+        # A trigram is valid when its first and last byte come from the same row.
+        same_row = pc.equal(parents.slice(0, count), parents.slice(TRIGRAM_BYTES - 1, count))
+        codes = pc.add(
+            pc.add(
+                pc.multiply(flat.slice(0, count), pa.scalar(1 << 16, pa.uint32())),
+                pc.multiply(flat.slice(1, count), pa.scalar(1 << 8, pa.uint32())),
+            ),
+            flat.slice(2, count),
+        )
+        # Hash grouping without threads keeps each posting list in slot order,
+        # which is much cheaper than sorting every (trigram, slot) pair.
+        grouped = pa.table({
+            "code": codes.filter(same_row),
+            "slot": parents.slice(0, count).filter(same_row),
+        }).group_by("code", use_threads=False).aggregate([("slot", "list")])
+        lists = grouped.column("slot_list").combine_chunks()
+        slots = lists.flatten()
+        groups = pc.list_parent_indices(lists)
+        if len(slots) > 1:
+            # A trigram repeated within one row leaves adjacent duplicates.
+            repeated = pc.and_(
+                pc.equal(slots.slice(1), slots.slice(0, len(slots) - 1)),
+                pc.equal(groups.slice(1), groups.slice(0, len(groups) - 1)),
+            )
+            distinct = pa.concat_arrays([pa.array([True]), pc.invert(repeated)])
+            slots = slots.filter(distinct)
+            groups = groups.filter(distinct)
+        run_ends = pc.run_end_encode(groups, run_end_type=pa.int32()).run_ends
+        return grouped.column("code").combine_chunks(), run_ends, slots
+
+
+def intersect_candidates(left: Any | None, right: Any | None) -> Any | None:
+    """Intersect two sorted candidate arrays, where None means every slot."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    import pyarrow.compute as compute
+
+    if len(left) > len(right):
+        left, right = right, left
+    return right.filter(compute.is_in(right, value_set=left))
+
+
+def _trigram_codes(encoded: bytes) -> list[int]:
+    return sorted({
+        (encoded[index] << 16) | (encoded[index + 1] << 8) | encoded[index + 2]
+        for index in range(len(encoded) - (TRIGRAM_BYTES - 1))
+    })
@@ -103,11 +103,14 @@ def set_runtime_context(
 
 
 def build_runtime_context(context: BrowseAppContextInputs) -> AppContext:
+    _apply_runtime_storage_settings(context.storage, context.runtime)
+    recursive_browse_cache = RecursiveBrowseCache(cache_dir=context.workspace.browse_cache_dir())
+    context.runtime.table_source_monitor.bind_recursive_browse_cache(recursive_browse_cache)
     return AppContext(
         storage=context.storage,
         workspace=context.workspace,
         runtime=context.runtime,
-        recursive_browse_cache=RecursiveBrowseCache(cache_dir=context.workspace.browse_cache_dir()),
+        recursive_browse_cache=recursive_browse_cache,
         og_cache=og_cache_from_workspace(context.workspace, enabled=context.og_preview),
         storage_mode=context.storage_mode,
         storage_origin=context.storage_origin,
@@ -115,5 +118,21 @@ def build_runtime_context(context: BrowseAppContextInputs) -> AppContext:
     )
 
 
+def _apply_runtime_storage_settings(storage: BrowseAppStorage, runtime: AppRuntime) -> None:
+    # Refreshed storages replace the one the runtime was built with; keep them on the
+    # same thumbnail pool, memory budget, and original cache.
+    set_budget = getattr(storage, "set_memory_cache_budget", None)
+    if set_budget is not None:
+        set_budget(runtime.thumb_memory_cache_bytes)
+    set_original_cache = getattr(storage, "set_remote_original_cache", None)
+    if set_original_cache is not None:
+        set_original_cache(runtime.original_cache)
+    if runtime.thumb_processes is None:
+        return
+    set_renderer = getattr(storage, "set_thumbnail_renderer", None)
+    if set_renderer is not None:
+        set_renderer(runtime.thumb_processes)
+
+
 def _attach_request_context(app: FastAPI) -> None:
     app.add_middleware(RequestContextMiddleware)
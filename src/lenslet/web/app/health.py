@@ -90,6 +90,8 @@ def _base_health_payload(
             **hotpath.counters,
             **runtime.query_coordinator.diagnostics(),
             **runtime.thumb_queue.diagnostics(),
+            **(runtime.thumb_processes.diagnostics() if runtime.thumb_processes is not None else {}),
+            **(runtime.original_cache.diagnostics() if runtime.original_cache is not None else {}),
         },
     })
     table_launch_status = _table_launch_status_payload(storage, workspace)
@@ -184,6 +184,7 @@ def _prepare_items_table_launch(
                 path_column=options.path_column,
                 cache_dimensions=False,
                 dimension_cache_dir=workspace.dimension_cache_dir(),
+                column_cache_dir=workspace.column_store_cache_dir(),
                 skip_dimension_probe=options.skip_dimension_probe,
                 embedding_config=embedding_options.config or EmbeddingConfig(),
                 thumb_size=browse_options.thumb_size,
@@ -383,6 +384,7 @@ def refresh_preindex_storage(
                 updated_workspace,
                 preindex_storage,
                 thumb_cache_enabled=browse_options.thumb_cache,
+                thumb_cache_layout=browse_options.thumb_cache_layout,
             )
             updated_context = _stage_context(updated_runtime)
             with context.runtime.sidecar_lock:
@@ -466,9 +468,15 @@ def create_local_app(
         storage=storage,
         workspace=workspace,
         thumb_cache=browse_options.thumb_cache,
+        thumb_cache_layout=browse_options.thumb_cache_layout,
+        thumb_engine=browse_options.thumb_engine,
+        thumb_memory_cache_mb=browse_options.thumb_memory_cache_mb,
+        original_cache_mb=browse_options.original_cache_mb,
         presence_view_ttl=browse_options.presence_view_ttl,
         presence_edit_ttl=browse_options.presence_edit_ttl,
         presence_prune_interval=browse_options.presence_prune_interval,
+        analysis_workers=browse_options.analysis_workers,
+        thumb_cache_mb=browse_options.thumb_cache_mb,
     )
 
     embedding_manager = _build_local_embedding_manager(startup, storage, workspace, embedding_options)
@@ -7,6 +7,8 @@ from ...embeddings.config import EmbeddingConfig
 from ...indexing_status import IndexingListener
 from ...workspace import Workspace
 from ..models import LaunchSessionPayload
+from ..cache.thumbs import ThumbCacheLayout
+from ..thumbs import ThumbnailEngineMode
 
 StorageRefreshMode: TypeAlias = Literal["static", "subtree"]
 StorageMode: TypeAlias = Literal["memory", "table", "dataset", "storage"]
@@ -18,6 +20,12 @@ class BrowseAppOptions:
     thumb_size: int = 256
     thumb_quality: int = 70
     thumb_cache: bool = True
+    thumb_cache_layout: ThumbCacheLayout = "directory"
+    thumb_engine: ThumbnailEngineMode = "threads"
+    thumb_memory_cache_mb: int = 256
+    original_cache_mb: int = 1024
+    thumb_cache_mb: int = 200
+    analysis_workers: int | None = None
     presence_view_ttl: float = 75.0
     presence_edit_ttl: float = 60.0
     presence_prune_interval: float = 5.0
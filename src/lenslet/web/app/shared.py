@@ -16,6 +16,7 @@ from ...embeddings.config import EmbeddingConfig
 from ...embeddings.detect import EmbeddingDetection, detect_embeddings
 from ...embeddings.index import EmbeddingManager
 from ...storage.base import BrowseAppStorage, SidecarState
+from ...storage.table.query_coordinator import analysis_worker_count
 from ...storage.table.storage import TableStorage, load_parquet_schema
 from ...workspace import Workspace
 from ..auth import (
@@ -24,7 +25,9 @@ from ..auth import (
     READ_ONLY_MUTATION_POLICY,
     trusted_local_mutation_policy,
 )
-from ..cache.thumbs import ThumbCache
+from ..cache.packed_thumbs import PackedThumbCache
+from ..cache.originals import OriginalCache
+from ..cache.thumbs import ThumbCache, ThumbCacheLayout, ThumbCacheStore
 from ..context import get_app_context
 from ..hotpath import build_hotpath_metrics
 from ..lifecycle import register_lifecycle_handlers
@@ -48,9 +51,11 @@ from ..sync.labels import (
     should_persist_sidecar,
 )
 from ..sync.persistence import LabelWriteBuffer
+from ..thumbs import ThumbnailEngineMode
 
 _BYTES_PER_MIB = 1024 * 1024
 DEFAULT_THUMB_CACHE_CAP_BYTES = 200 * _BYTES_PER_MIB
+DEFAULT_PREVIEW_CACHE_CAP_BYTES = 1024 * _BYTES_PER_MIB
 
 _PARQUET_SCHEMA_ERRORS = (ArrowException, ImportError, OSError, ValueError)
 _EMBEDDING_DETECTION_ERRORS = (ArrowException, AttributeError, TypeError, ValueError)
@@ -190,6 +195,7 @@ def runtime_for_workspace(
     storage: BrowseAppStorage,
     *,
     thumb_cache_enabled: bool,
+    thumb_cache_layout: ThumbCacheLayout = "directory",
 ) -> AppRuntime:
     runtime.label_writer.flush_all()
     loaded = load_label_state(storage, workspace)
@@ -219,7 +225,14 @@ def runtime_for_workspace(
         runtime,
         idempotency_cache=idempotency_cache,
         label_writer=label_writer,
-        thumb_cache=thumb_cache_from_workspace(workspace, thumb_cache_enabled),
+        thumb_cache=thumb_cache_from_workspace(
+            workspace,
+            thumb_cache_enabled,
+            thumb_cache_layout,
+            runtime.thumb_cache_bytes,
+        ),
+        original_cache=original_cache_from_workspace(workspace, runtime.original_cache_bytes),
+        preview_cache=preview_cache_from_workspace(workspace, thumb_cache_enabled, thumb_cache_layout),
     )
 
 
@@ -229,9 +242,15 @@ def initialize_runtime(
     storage: BrowseAppStorage,
     workspace: Workspace,
     thumb_cache: bool,
+    thumb_cache_layout: ThumbCacheLayout,
+    thumb_engine: ThumbnailEngineMode,
+    thumb_memory_cache_mb: int,
+    original_cache_mb: int,
     presence_view_ttl: float,
     presence_edit_ttl: float,
     presence_prune_interval: float,
+    analysis_workers: int | None = None,
+    thumb_cache_mb: int = DEFAULT_THUMB_CACHE_CAP_BYTES // _BYTES_PER_MIB,
 ) -> AppRuntime:
     return build_app_runtime(
         app,
@@ -243,11 +262,19 @@ def initialize_runtime(
                 presence_edit_ttl=presence_edit_ttl,
                 presence_prune_interval=presence_prune_interval,
                 thumb_cache_enabled=thumb_cache,
-                thumb_worker_count=thumb_worker_count(),
+                thumb_cache_layout=thumb_cache_layout,
+                thumb_worker_count=thumb_worker_count(thumb_engine),
+                thumb_engine=thumb_engine,
+                thumb_memory_cache_bytes=max(0, thumb_memory_cache_mb) * _BYTES_PER_MIB,
+                original_cache_bytes=max(0, original_cache_mb) * _BYTES_PER_MIB,
+                analysis_worker_count=analysis_worker_count(analysis_workers),
+                thumb_cache_bytes=max(0, thumb_cache_mb) * _BYTES_PER_MIB,
             ),
             hooks=AppRuntimeHooks(
                 build_thumb_cache=thumb_cache_from_workspace,
                 build_hotpath_metrics=build_hotpath_metrics,
+                build_original_cache=original_cache_from_workspace,
+                build_preview_cache=preview_cache_from_workspace,
             ),
         ),
     )
@@ -260,13 +287,45 @@ def register_static_refresh_route(app: FastAPI, note: str) -> None:
         return RefreshResponse(ok=True, note=note)
 
 
-def thumb_cache_from_workspace(workspace: Workspace, enabled: bool) -> ThumbCache | None:
+def thumb_cache_from_workspace(
+    workspace: Workspace,
+    enabled: bool,
+    layout: ThumbCacheLayout = "directory",
+    max_disk_bytes: int = DEFAULT_THUMB_CACHE_CAP_BYTES,
+) -> ThumbCacheStore | None:
+    """Open the workspace thumbnail cache; `max_disk_bytes=0` leaves it uncapped."""
     if not enabled or not workspace.can_write:
         return None
     cache_dir = workspace.thumb_cache_dir()
     if cache_dir is None:
         return None
-    return ThumbCache(cache_dir, max_disk_bytes=DEFAULT_THUMB_CACHE_CAP_BYTES)
+    if layout == "packed":
+        return PackedThumbCache(cache_dir, max_disk_bytes=max_disk_bytes)
+    return ThumbCache(cache_dir, max_disk_bytes=max_disk_bytes)
+
+
+def preview_cache_from_workspace(
+    workspace: Workspace,
+    enabled: bool,
+    layout: ThumbCacheLayout = "directory",
+) -> ThumbCacheStore | None:
+    if not enabled or not workspace.can_write:
+        return None
+    cache_dir = workspace.preview_cache_dir()
+    if cache_dir is None:
+        return None
+    if layout == "packed":
+        return PackedThumbCache(cache_dir, max_disk_bytes=DEFAULT_PREVIEW_CACHE_CAP_BYTES)
+    return ThumbCache(cache_dir, max_disk_bytes=DEFAULT_PREVIEW_CACHE_CAP_BYTES)
+
+
+def original_cache_from_workspace(workspace: Workspace, max_disk_bytes: int) -> OriginalCache | None:
+    if max_disk_bytes <= 0 or not workspace.can_write:
+        return None
+    cache_dir = workspace.original_cache_dir()
+    if cache_dir is None:
+        return None
+    return OriginalCache(cache_dir, max_disk_bytes=max_disk_bytes)
 
 
 def embedding_cache_from_workspace(
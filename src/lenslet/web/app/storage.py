@@ -82,9 +82,15 @@ def create_storage_app(
         storage=storage,
         workspace=workspace,
         thumb_cache=browse_options.thumb_cache,
+        thumb_cache_layout=browse_options.thumb_cache_layout,
+        thumb_engine=browse_options.thumb_engine,
+        thumb_memory_cache_mb=browse_options.thumb_memory_cache_mb,
+        original_cache_mb=browse_options.original_cache_mb,
         presence_view_ttl=browse_options.presence_view_ttl,
         presence_edit_ttl=browse_options.presence_edit_ttl,
         presence_prune_interval=browse_options.presence_prune_interval,
+        analysis_workers=browse_options.analysis_workers,
+        thumb_cache_mb=browse_options.thumb_cache_mb,
     )
     indexing = IndexingLifecycle.ready(scope="/")
     if browse_options.indexing_listener is not None:
@@ -9,6 +9,7 @@ import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Callable, Iterable, Literal
 
@@ -157,6 +158,42 @@ class RecursiveBrowseCache(BestEffortCacheMixin):
     def clear(self) -> None:
         self.invalidate_path(None)
 
+    def carry_forward(
+        self,
+        previous_generation: str,
+        generation: str,
+        changed_scopes: Iterable[str],
+    ) -> int:
+        """Move in-memory windows of `previous_generation` that hold no changed folder to `generation`.
+
+        A window covers its scope and every folder below it, so it is kept
+        only when no changed scope sits at or beneath it. Returns the number
+        of windows carried.
+        """
+        if previous_generation == generation:
+            return 0
+        changed = tuple({_canonical_scope(scope) for scope in changed_scopes})
+        carried = 0
+        with self._lock:
+            for key, window in list(self._memory.items()):
+                scope, sort_mode, window_generation = key
+                if window_generation != previous_generation:
+                    continue
+                if any(
+                    scope == "/" or folder == scope or folder.startswith(scope + "/")
+                    for folder in changed
+                ):
+                    continue
+                next_key = (scope, sort_mode, generation)
+                accessed = self._memory_access.pop(key, time.monotonic())
+                del self._memory[key]
+                if next_key in self._memory:
+                    continue
+                self._memory[next_key] = replace(window, generation=generation)
+                self._memory_access[next_key] = accessed
+                carried += 1
+        return carried
+
     def schedule_warm(
         self,
         scope_path: str,
@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import BinaryIO
+
+from .signals import BestEffortCacheMixin
+
+
+DEFAULT_ORIGINAL_REVALIDATE_SECONDS = 300.0
+_DATA_SUFFIX = ".bin"
+_META_SUFFIX = ".json"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedOriginal:
+    key: str
+    source: str
+    size: int
+    etag: str | None
+    last_modified: str | None
+    content_type: str | None
+    validated_at: float
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class OriginalCacheWriter:
+    """Stage one original in a temp file; `commit` publishes it, `discard` drops it."""
+
+    def __init__(self, cache: "OriginalCache", source: str, handle: BinaryIO, temp_path: Path) -> None:
+        self._cache = cache
+        self._source = source
+        self._handle = handle
+        self._temp_path = temp_path
+        self._size = 0
+        self._failed = False
+
+    def write(self, chunk: bytes) -> None:
+        if self._failed:
+            return
+        self._size += len(chunk)
+        if self._size > self._cache.max_entry_bytes:
+            self._failed = True
+            return
+        try:
+            self._handle.write(chunk)
+        except OSError as exc:
+            self._failed = True
+            self._cache._record_failure("write", target=self._temp_path, exc=exc)
+
+    def commit(
+        self,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str | None,
+        expected_size: int | None = None,
+    ) -> CachedOriginal | None:
+        try:
+            self._handle.close()
+        except OSError as exc:
+            self._failed = True
+            self._cache._record_failure("write", target=self._temp_path, exc=exc)
+        if self._failed or (expected_size is not None and expected_size != self._size):
+            self.discard()
+            return None
+        return self._cache._publish(
+            self._source,
+            self._temp_path,
+            size=self._size,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=content_type,
+        )
+
+    def discard(self) -> None:
+        try:
+            self._handle.close()
+        except OSError:
+            pass
+        try:
+            self._temp_path.unlink(missing_ok=True)
+        except OSError as exc:
+            self._cache._record_failure("cleanup", target=self._temp_path, exc=exc)
+
+
+class OriginalCache(BestEffortCacheMixin):
+    """Size-capped on-disk cache of remote (S3/HTTP) original media bytes.
+
+    Entries are addressed by source URI and carry the upstream ETag and
+    Last-Modified validators in a JSON sidecar. An entry is served without
+    contacting the origin for `revalidate_after` seconds; after that the caller
+    revalidates it with a conditional request and either refreshes its
+    timestamp or replaces it. Least-recently-used entries are evicted once
+    `max_disk_bytes` is exceeded.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_disk_bytes: int,
+        revalidate_after: float = DEFAULT_ORIGINAL_REVALIDATE_SECONDS,
+    ) -> None:
+        self._cache_name = "original"
+        self._last_failure = None
+        self.root = Path(root)
+        self.max_disk_bytes = max(0, int(max_disk_bytes))
+        self.revalidate_after = max(0.0, float(revalidate_after))
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._entries: dict[str, CachedOriginal] = {}
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._stores = 0
+        self._evictions = 0
+        self._scan()
+
+    @property
+    def max_entry_bytes(self) -> int:
+        return self.max_disk_bytes
+
+    def _key(self, source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def _data_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{_DATA_SUFFIX}"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{_META_SUFFIX}"
+
+    def _scan(self) -> None:
+        try:
+            paths = list(self.root.glob(f"*/*{_DATA_SUFFIX}"))
+        except OSError as exc:
+            self._record_failure("scan", target=self.root, exc=exc)
+            return
+        found: list[tuple[float, str, int]] = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError as exc:
+                self._record_failure("stat", target=path, exc=exc)
+                continue
+            found.append((stat.st_mtime, path.stem, stat.st_size))
+        found.sort()
+        for _mtime, key, size in found:
+            self._sizes[key] = size
+            self._total_bytes += size
+        with self._lock:
+            self._evict_over_cap()
+
+    def lookup(self, source: str) -> CachedOriginal | None:
+        key = self._key(source)
+        with self._lock:
+            if key not in self._sizes:
+                self._misses += 1
+                return None
+            self._sizes.move_to_end(key)
+            entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load_meta(key, source)
+            if entry is None:
+                with self._lock:
+                    self._misses += 1
+                return None
+            with self._lock:
+                self._entries[key] = entry
+        return entry
+
+    def _load_meta(self, key: str, source: str) -> CachedOriginal | None:
+        path = self._meta_path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            self._record_failure("read", target=path, exc=exc)
+            return None
+        if not isinstance(payload, dict) or payload.get("source") != source:
+            return None
+        try:
+            return CachedOriginal(
+                key=key,
+                source=source,
+                size=int(payload["size"]),
+                etag=payload.get("etag"),
+                last_modified=payload.get("last_modified"),
+                content_type=payload.get("content_type"),
+                validated_at=float(payload.get("validated_at", 0.0)),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            self._record_failure("read", target=path, exc=exc)
+            return None
+
+    def is_fresh(self, entry: CachedOriginal) -> bool:
+        return time.time() - entry.validated_at < self.revalidate_after
+
+    def read(self, entry: CachedOriginal) -> bytes | None:
+        handle = self.open(entry)
+        if handle is None:
+            return None
+        with handle:
+            try:
+                data = handle.read()
+            except OSError as exc:
+                self._record_failure("read", target=self._data_path(entry.key), exc=exc)
+                return None
+        if len(data) != entry.size:
+            self._drop(entry.key)
+            return None
+        return data
+
+    def open(self, entry: CachedOriginal) -> BinaryIO | None:
+        path = self._data_path(entry.key)
+        try:
+            handle = open(path, "rb")
+        except FileNotFoundError:
+            self._drop(entry.key)
+            return None
+        except OSError as exc:
+            self._record_failure("read", target=path, exc=exc)
+            return None
+        with self._lock:
+            self._hits += 1
+        return handle
+
+    def mark_validated(self, entry: CachedOriginal) -> CachedOriginal:
+        updated = replace(entry, validated_at=time.time())
+        with self._lock:
+            self._revalidations += 1
+            if entry.key in self._sizes:
+                self._entries[entry.key] = updated
+        self._write_meta(updated)
+        return updated
+
+    def writer(self, source: str) -> OriginalCacheWriter | None:
+        if self.max_disk_bytes <= 0:
+            return None
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(prefix=".original.", suffix=".tmp", dir=self.root)
+        except OSError as exc:
+            self._record_failure("write", target=self.root, exc=exc)
+            return None
+        return OriginalCacheWriter(self, source, os.fdopen(fd, "wb"), Path(temp_name))
+
+    def store(
+        self,
+        source: str,
+        data: bytes,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str | None,
+    ) -> CachedOriginal | None:
+        if len(data) > self.max_entry_bytes:
+            return None
+        writer = self.writer(source)
+        if writer is None:
+            return None
+        writer.write(data)
+        return writer.commit(etag=etag, last_modified=last_modified, content_type=content_type)
+
+    def _publish(
+        self,
+        source: str,
+        temp_path: Path,
+        *,
+        size: int,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str | None,
+    ) -> CachedOriginal | None:
+        key = self._key(source)
+        entry = CachedOriginal(
+            key=key,
+            source=source,
+            size=size,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=content_type,
+            validated_at=time.time(),
+        )
+        data_path = self._data_path(key)
+        try:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, data_path)
+        except OSError as exc:
+            self._record_failure("write", target=data_path, exc=exc)
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        if not self._write_meta(entry):
+            self._drop(key)
+            return None
+        with self._lock:
+            previous = self._sizes.pop(key, 0)
+            self._total_bytes += size - previous
+            self._sizes[key] = size
+            self._entries[key] = entry
+            self._stores += 1
+            self._evict_over_cap()
+        return entry
+
+    def _write_meta(self, entry: CachedOriginal) -> bool:
+        path = self._meta_path(entry.key)
+        payload = {
+            "source": entry.source,
+            "size": entry.size,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "content_type": entry.content_type,
+            "validated_at": entry.validated_at,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(temp_name, path)
+        except OSError as exc:
+            self._record_failure("write", target=path, exc=exc)
+            return False
+        return True
+
+    def _evict_over_cap(self) -> None:
+        while self._total_bytes > self.max_disk_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._entries.pop(key, None)
+            self._total_bytes -= size
+            self._evictions += 1
+            self._unlink_entry(key)
+
+    def _drop(self, key: str) -> None:
+        with self._lock:
+            size = self._sizes.pop(key, None)
+            self._entries.pop(key, None)
+            if size is not None:
+                self._total_bytes -= size
+        self._unlink_entry(key)
+
+    def _unlink_entry(self, key: str) -> None:
+        for path in (self._data_path(key), self._meta_path(key)):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as exc:
+                self._record_failure("evict", target=path, exc=exc)
+
+    def diagnostics(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "original_cache_hit_total": self._hits,
+                "original_cache_miss_total": self._misses,
+                "original_cache_revalidated_total": self._revalidations,
+                "original_cache_store_total": self._stores,
+                "original_cache_eviction_total": self._evictions,
+                "original_cache_entries": len(self._sizes),
+                "original_cache_bytes": self._total_bytes,
+                "original_cache_budget_bytes": self.max_disk_bytes,
+            }
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from .signals import BestEffortCacheMixin
+
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+# Keep eviction granularity at or below 1/8 of the disk cap.
+_SEGMENTS_PER_CAP = 8
+_SEGMENT_DIRNAME = "segments"
+_RECORD_MAGIC = b"LTS1"
+# magic, sha256(key), payload length
+_RECORD_HEADER = struct.Struct("<4s32sI")
+# 64-bit key prefix, record offset within the segment
+_INDEX_RECORD = struct.Struct("<QQ")
+_OFFSET_BITS = 40
+_OFFSET_MASK = (1 << _OFFSET_BITS) - 1
+
+
+def _key_digest(key: str) -> bytes:
+    return hashlib.sha256(key.encode("utf-8")).digest()
+
+
+def _index_key(digest: bytes) -> int:
+    return int.from_bytes(digest[:8], "little")
+
+
+def _is_webp(data: bytes) -> bool:
+    return len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WEBP"
+
+
+class PackedThumbCache(BestEffortCacheMixin):
+    """On-disk WebP thumbnail cache packed into append-only segment files.
+
+    Each segment `NNNNNNNN.seg` holds `[header][webp]` records and is paired with
+    a `NNNNNNNN.idx` log of fixed-size (key prefix, offset) entries, so startup
+    reads a few compact index files instead of statting every thumbnail. Reads
+    slice a memory map of the segment and verify the full key digest stored in
+    the record header. When `max_disk_bytes` is exceeded, whole segments are
+    dropped oldest-first.
+
+    Thumbnails left by the one-file-per-entry `ThumbCache` layout under the same
+    root are imported on first read and then removed; `migrate_legacy` imports
+    the rest in one pass.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_disk_bytes: int | None = None,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> None:
+        self._cache_name = "thumb"
+        self._last_failure = None
+        self.root = Path(root)
+        self.max_disk_bytes = max(0, int(max_disk_bytes or 0))
+        segment_cap = max(1, int(segment_bytes))
+        if self.max_disk_bytes > 0:
+            segment_cap = min(segment_cap, max(1, self.max_disk_bytes // _SEGMENTS_PER_CAP))
+        self.segment_bytes = segment_cap
+        self._segments_dir = self.root / _SEGMENT_DIRNAME
+        self._lock = threading.Lock()
+        self._maps_lock = threading.Lock()
+        self._index: dict[int, int] = {}
+        self._segment_sizes: dict[int, int] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._active_id: int | None = None
+        self._active_data: BinaryIO | None = None
+        self._active_index: BinaryIO | None = None
+        self._total_bytes = 0
+        self._legacy_pending = self._has_legacy_entries()
+        self._load_segments()
+        if self.max_disk_bytes > 0 and self._total_bytes > self.max_disk_bytes:
+            with self._lock:
+                self._evict_to_cap()
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self._segments_dir / f"{segment_id:08d}.seg"
+
+    def _index_path(self, segment_id: int) -> Path:
+        return self._segments_dir / f"{segment_id:08d}.idx"
+
+    def _load_segments(self) -> None:
+        try:
+            names = sorted(entry.name for entry in os.scandir(self._segments_dir) if entry.name.endswith(".seg"))
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            self._record_failure("scan", target=self._segments_dir, exc=exc)
+            return
+        for name in names:
+            try:
+                segment_id = int(name[:-4])
+            except ValueError:
+                continue
+            self._load_segment(segment_id)
+
+    def _load_segment(self, segment_id: int) -> None:
+        segment_path = self._segment_path(segment_id)
+        index_path = self._index_path(segment_id)
+        try:
+            size = segment_path.stat().st_size
+            raw_index = index_path.read_bytes() if index_path.exists() else b""
+        except OSError as exc:
+            self._record_failure("scan", target=segment_path, exc=exc)
+            return
+        # A torn trailing index record from an interrupted write is ignored.
+        usable = len(raw_index) - (len(raw_index) % _INDEX_RECORD.size)
+        base = segment_id << _OFFSET_BITS
+        for key, offset in _INDEX_RECORD.iter_unpack(raw_index[:usable]):
+            if offset + _RECORD_HEADER.size <= size:
+                self._index[key] = base | offset
+        self._segment_sizes[segment_id] = size
+        self._total_bytes += size
+
+    def _has_legacy_entries(self) -> bool:
+        try:
+            with os.scandir(self.root) as entries:
+                return any(
+                    entry.is_dir() and len(entry.name) == 2 and entry.name != _SEGMENT_DIRNAME
+                    for entry in entries
+                )
+        except OSError:
+            return False
+
+    def _legacy_path(self, digest: bytes) -> Path:
+        hex_digest = digest.hex()
+        return self.root / hex_digest[:2] / f"{hex_digest}.webp"
+
+    def contains(self, key: str) -> bool:
+        """Return whether `key` has a cached entry, without reading it."""
+        digest = _key_digest(key)
+        if _index_key(digest) in self._index:
+            return True
+        return self._legacy_pending and self._legacy_path(digest).is_file()
+
+    def get(self, key: str) -> bytes | None:
+        digest = _key_digest(key)
+        location = self._index.get(_index_key(digest))
+        if location is not None:
+            data = self._read_record(location, digest)
+            if data is not None:
+                return data
+        if self._legacy_pending:
+            return self._import_legacy(digest)
+        return None
+
+    def _read_record(self, location: int, digest: bytes) -> bytes | None:
+        segment_id = location >> _OFFSET_BITS
+        offset = location & _OFFSET_MASK
+        try:
+            view = self._segment_map(segment_id, offset + _RECORD_HEADER.size)
+            if view is None:
+                return None
+            magic, stored_digest, length = _RECORD_HEADER.unpack_from(view, offset)
+            if magic != _RECORD_MAGIC or stored_digest != digest:
+                return None
+            start = offset + _RECORD_HEADER.size
+            view = self._segment_map(segment_id, start + length)
+            if view is None:
+                return None
+            data = view[start:start + length]
+        except (OSError, ValueError) as exc:
+            # ValueError covers a map closed by a concurrent eviction.
+            self._record_failure("read", target=self._segment_path(segment_id), exc=exc)
+            return None
+        if _is_webp(data):
+            return data
+        self._record_failure("read", target=self._segment_path(segment_id), detail="invalid WebP payload")
+        return None
+
+    def _segment_map(self, segment_id: int, required: int) -> mmap.mmap | None:
+        with self._maps_lock:
+            current = self._maps.get(segment_id)
+            if current is not None and len(current) >= required:
+                return current
+            if segment_id not in self._segment_sizes:
+                return None
+            # The active segment grows after it was mapped; remap to cover new records.
+            with open(self._segment_path(segment_id), "rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                if size < required:
+                    return None
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            # A superseded map may still be in use by another reader; it closes when released.
+            self._maps[segment_id] = mapped
+            return mapped
+
+    def set(self, key: str, data: bytes) -> bool:
+        digest = _key_digest(key)
+        with self._lock:
+            return self._append(digest, data)
+
+    def _append(self, digest: bytes, data: bytes) -> bool:
+        record_size = _RECORD_HEADER.size + len(data)
+        try:
+            segment_id, data_handle, index_handle = self._writable_segment(record_size)
+            offset = self._segment_sizes[segment_id]
+            data_handle.write(_RECORD_HEADER.pack(_RECORD_MAGIC, digest, len(data)))
+            data_handle.write(data)
+            data_handle.flush()
+            index_handle.write(_INDEX_RECORD.pack(_index_key(digest), offset))
+            index_handle.flush()
+        except OSError as exc:
+            self._record_failure("write", target=self._segments_dir, exc=exc)
+            self._close_active()
+            return False
+        self._segment_sizes[segment_id] = offset + record_size
+        self._total_bytes += record_size
+        self._index[_index_key(digest)] = (segment_id << _OFFSET_BITS) | offset
+        if self.max_disk_bytes > 0 and self._total_bytes > self.max_disk_bytes:
+            self._evict_to_cap()
+        return True
+
+    def _writable_segment(self, record_size: int) -> tuple[int, BinaryIO, BinaryIO]:
+        segment_id = self._active_id
+        data_handle = self._active_data
+        index_handle = self._active_index
+        if segment_id is not None and data_handle is not None and index_handle is not None:
+            used = self._segment_sizes.get(segment_id, 0)
+            if used == 0 or used + record_size <= self.segment_bytes:
+                return segment_id, data_handle, index_handle
+        self._close_active()
+        self._segments_dir.mkdir(parents=True, exist_ok=True)
+        segment_id = max(self._segment_sizes, default=-1) + 1
+        data_handle = open(self._segment_path(segment_id), "ab")
+        try:
+            index_handle = open(self._index_path(segment_id), "ab")
+        except OSError:
+            data_handle.close()
+            raise
+        self._active_id = segment_id
+        self._active_data = data_handle
+        self._active_index = index_handle
+        self._segment_sizes[segment_id] = 0
+        return segment_id, data_handle, index_handle
+
+    def _close_active(self) -> None:
+        for handle in (self._active_data, self._active_index):
+            if handle is None:
+                continue
+            try:
+                handle.close()
+            except OSError as exc:
+                self._record_failure("close", target=self._segments_dir, exc=exc)
+        self._active_data = None
+        self._active_index = None
+        self._active_id = None
+
+    def _evict_to_cap(self) -> None:
+        while self._total_bytes > self.max_disk_bytes and self._segment_sizes:
+            self._drop_segment(min(self._segment_sizes))
+
+    def _drop_segment(self, segment_id: int) -> None:
+        if segment_id == self._active_id:
+            self._close_active()
+        with self._maps_lock:
+            mapped = self._maps.pop(segment_id, None)
+            if mapped is not None:
+                mapped.close()
+        size = self._segment_sizes.pop(segment_id, 0)
+        self._total_bytes = max(0, self._total_bytes - size)
+        stale = [key for key, location in self._index.items() if location >> _OFFSET_BITS == segment_id]
+        for key in stale:
+            del self._index[key]
+        for path in (self._segment_path(segment_id), self._index_path(segment_id)):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as exc:
+                self._record_failure("evict", target=path, exc=exc)
+
+    def _import_legacy(self, digest: bytes) -> bytes | None:
+        path = self._legacy_path(digest)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            self._record_failure("read", target=path, exc=exc)
+            return None
+        if not _is_webp(data):
+            self._record_failure("read", target=path, detail="invalid WebP payload")
+            return None
+        with self._lock:
+            if self._append(digest, data):
+                self._unlink_legacy(path)
+        return data
+
+    def _unlink_legacy(self, path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as exc:
+            self._record_failure("cleanup", target=path, exc=exc)
+
+    def migrate_legacy(self) -> int:
+        """Import every thumbnail left in the directory layout; return how many moved."""
+        if not self._legacy_pending:
+            return 0
+        migrated = 0
+        for shard in sorted(self.root.iterdir()):
+            if not shard.is_dir() or len(shard.name) != 2 or shard.name == _SEGMENT_DIRNAME:
+                continue
+            for path in sorted(shard.glob("*.webp")):
+                try:
+                    digest = bytes.fromhex(path.stem)
+                    data = path.read_bytes()
+                except (OSError, ValueError) as exc:
+                    self._record_failure("migrate", target=path, exc=exc)
+                    continue
+                if len(digest) != 32 or not _is_webp(data):
+                    continue
+                with self._lock:
+                    if _index_key(digest) in self._index or self._append(digest, data):
+                        self._unlink_legacy(path)
+                        migrated += 1
+            try:
+                shard.rmdir()
+            except OSError:
+                pass
+        self._legacy_pending = self._has_legacy_entries()
+        return migrated
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "segments": len(self._segment_sizes),
+                "bytes": self._total_bytes,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_active()
+        with self._maps_lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
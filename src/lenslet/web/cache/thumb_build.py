@@ -0,0 +1,176 @@
+"""Offline thumbnail pre-generation into a persistent thumbnail cache."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from ...media_errors import MediaError
+from ..thumb_processes import ThumbnailProcessPool
+from .thumbs import ThumbCacheStore
+
+
+_BUILD_ERRORS = (FileNotFoundError, MediaError, OSError, ValueError)
+# Keep at most this many submissions per reader queued so huge scopes never
+# materialize one future per item.
+_PENDING_PER_READER = 2
+# Photo thumbnails average roughly this many WebP bytes per output pixel at the
+# default quality, with a 3:2 long edge; only used to size-check a build up front.
+_ESTIMATED_BYTES_PER_THUMB_PIXEL = 0.15
+_ESTIMATED_LONG_EDGE_RATIO = 1.5
+
+
+def estimate_thumbnail_cache_bytes(item_count: int, thumb_size: int) -> int:
+    """Rough disk footprint of `item_count` thumbnails with a `thumb_size` short edge."""
+    pixels = thumb_size * thumb_size * _ESTIMATED_LONG_EDGE_RATIO
+    return int(max(0, item_count) * pixels * _ESTIMATED_BYTES_PER_THUMB_PIXEL)
+
+
+@dataclass(frozen=True, slots=True)
+class ThumbBuildReport:
+    total: int
+    generated: int
+    skipped: int
+    failed: int
+    elapsed_seconds: float
+
+    @property
+    def processed(self) -> int:
+        return self.generated + self.skipped + self.failed
+
+    @property
+    def generated_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.generated / self.elapsed_seconds
+
+
+class _BuildProgress:
+    def __init__(self, total: int, started: float) -> None:
+        self.total = total
+        self.started = started
+        self.generated = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def report(self) -> ThumbBuildReport:
+        return ThumbBuildReport(
+            total=self.total,
+            generated=self.generated,
+            skipped=self.skipped,
+            failed=self.failed,
+            elapsed_seconds=time.monotonic() - self.started,
+        )
+
+
+def _build_one(storage: Any, thumb_cache: ThumbCacheStore, path: str, cache_key: str) -> bool:
+    try:
+        thumb = storage.get_or_build_thumbnail(path)
+    except _BUILD_ERRORS:
+        return False
+    return thumb_cache.set(cache_key, thumb)
+
+
+def build_thumbnails(
+    storage: Any,
+    thumb_cache: ThumbCacheStore,
+    *,
+    scope: str = "/",
+    processes: int = 1,
+    read_concurrency: int | None = None,
+    progress: Callable[[ThumbBuildReport], None] | None = None,
+    progress_interval: float = 2.0,
+    planned: Callable[[int], None] | None = None,
+) -> ThumbBuildReport:
+    """Generate and persist thumbnails for every item in `scope` that is not cached yet.
+
+    Items are enumerated through the storage and keyed with its
+    `thumbnail_cache_key`, so the server picks the results up unchanged. Keys
+    already present are skipped, which makes an interrupted build resumable.
+    With `processes > 1`, decoding runs in a `ThumbnailProcessPool`; source
+    reads run on `read_concurrency` threads (default: two per process), which
+    is the knob for capping concurrent requests against network sources.
+    `planned` receives the item count once the scope has been enumerated.
+    """
+    processes = max(1, int(processes))
+    readers = max(1, int(read_concurrency or processes * 2))
+    paths = [item.path for item in storage.items_in_scope(scope)]
+    state = _BuildProgress(len(paths), time.monotonic())
+    if planned is not None:
+        planned(len(paths))
+
+    pool = ThumbnailProcessPool(processes) if processes > 1 else None
+    set_renderer = getattr(storage, "set_thumbnail_renderer", None)
+    if pool is not None and callable(set_renderer):
+        set_renderer(pool)
+    # Built thumbnails go straight to disk; holding them in memory only evicts earlier ones.
+    set_memory_budget = getattr(storage, "set_memory_cache_budget", None)
+    if callable(set_memory_budget):
+        set_memory_budget(0)
+    executor = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="lenslet-thumb-build")
+    pending: set[Future[bool]] = set()
+    last_progress = state.started
+    try:
+        for path, cache_key in _uncached(storage, thumb_cache, paths, state):
+            if len(pending) >= readers * _PENDING_PER_READER:
+                pending = _collect(pending, state)
+            pending.add(executor.submit(_build_one, storage, thumb_cache, path, cache_key))
+            last_progress = _maybe_report(progress, state, last_progress, progress_interval)
+        while pending:
+            pending = _collect(pending, state)
+            last_progress = _maybe_report(progress, state, last_progress, progress_interval)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
+        if pool is not None:
+            if callable(set_renderer):
+                set_renderer(None)
+            pool.close()
+    return state.report()
+
+
+def _uncached(
+    storage: Any,
+    thumb_cache: ThumbCacheStore,
+    paths: Iterable[str],
+    state: _BuildProgress,
+) -> Iterable[tuple[str, str]]:
+    for path in paths:
+        try:
+            cache_key = storage.thumbnail_cache_key(path)
+        except _BUILD_ERRORS:
+            cache_key = None
+        if cache_key is None:
+            state.failed += 1
+            continue
+        if thumb_cache.contains(cache_key):
+            state.skipped += 1
+            continue
+        yield path, cache_key
+
+
+def _collect(pending: set[Future[bool]], state: _BuildProgress) -> set[Future[bool]]:
+    done, still_pending = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        if future.result():
+            state.generated += 1
+        else:
+            state.failed += 1
+    return still_pending
+
+
+def _maybe_report(
+    progress: Callable[[ThumbBuildReport], None] | None,
+    state: _BuildProgress,
+    last_progress: float,
+    interval: float,
+) -> float:
+    now = time.monotonic()
+    if progress is None or now - last_progress < interval:
+        return last_progress
+    progress(state.report())
+    return now
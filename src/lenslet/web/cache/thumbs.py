@@ -5,8 +5,32 @@ import os
 import tempfile
 import threading
 from pathlib import Path
+from typing import Literal, Protocol
 
-from .signals import BestEffortCacheMixin
+from .signals import BestEffortCacheMixin, CacheFailure
+
+
+ThumbCacheLayout = Literal["directory", "packed"]
+# Eviction trims to this fraction of the cap, so the directory rescan it needs
+# runs once per tenth of the cap written instead of on every write past it.
+_EVICTION_LOW_WATER = 0.9
+
+
+class ThumbCacheStore(Protocol):
+    """Persistent thumbnail cache used by thumbnail responses."""
+
+    @property
+    def last_failure(self) -> CacheFailure | None:
+        ...
+
+    def contains(self, key: str) -> bool:
+        ...
+
+    def get(self, key: str) -> bytes | None:
+        ...
+
+    def set(self, key: str, data: bytes) -> bool:
+        ...
 
 
 class ThumbCache(BestEffortCacheMixin):
@@ -48,8 +72,9 @@ class ThumbCache(BestEffortCacheMixin):
             self._current_size_bytes = total
             return total
         entries.sort(key=lambda entry: entry[0])
+        target = int(self.max_disk_bytes * _EVICTION_LOW_WATER)
         for _mtime, size, path in entries:
-            if total <= self.max_disk_bytes:
+            if total <= target:
                 break
             try:
                 path.unlink()
@@ -65,6 +90,10 @@ class ThumbCache(BestEffortCacheMixin):
         subdir = digest[:2]
         return self.root / subdir / f"{digest}.webp"
 
+    def contains(self, key: str) -> bool:
+        """Return whether `key` has a cached entry, without reading it."""
+        return self._path_for(key).is_file()
+
     def get(self, key: str) -> bytes | None:
         path = self._path_for(key)
         try:
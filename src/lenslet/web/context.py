@@ -12,6 +12,7 @@ from ..indexing_status import IndexingLifecycle
 from .app.options import StorageMode
 from .cache.og import OgImageCache
 from ..storage.base import BrowseAppStorage
+from ..storage.table.generation import pinned_table_generations
 from ..workspace import Workspace
 from .runtime import AppRuntime
 
@@ -36,9 +37,13 @@ class RequestContextMiddleware:
         self.app = app
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] == "http":
-            bind_request_context(Request(scope, receive=receive))
-        await self.app(scope, receive, send)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        bind_request_context(Request(scope, receive=receive))
+        # Every read of a table storage in this request sees one source generation.
+        with pinned_table_generations():
+            await self.app(scope, receive, send)
 
 
 def set_app_context(app: FastAPI, context: AppContext) -> AppContext:
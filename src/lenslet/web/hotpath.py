@@ -76,6 +76,7 @@ class HotpathTelemetry:
         s3_creations = _storage_s3_client_creations(storage)
         if s3_creations is not None:
             counters["s3_client_create_total"] = s3_creations
+        counters.update(_storage_memory_cache_counters(storage))
         return HotpathHealthPayload(counters=counters, timers_ms=timers)
 
 
@@ -141,6 +142,16 @@ def _server_timing_header(timings_ms: dict[str, float]) -> str:
     return ", ".join(f"{phase};dur={timings_ms[phase]:.3f}" for phase in ordered)
 
 
+def _storage_memory_cache_counters(storage: object | None) -> dict[str, int]:
+    memory_cache_stats = getattr(storage, "memory_cache_stats", None)
+    if memory_cache_stats is None:
+        return {}
+    try:
+        return {str(key): int(value) for key, value in memory_cache_stats().items()}
+    except Exception:
+        return {}
+
+
 def _storage_s3_client_creations(storage: S3DiagnosticsStorage | None) -> int | None:
     try:
         value = storage.s3_client_creations()
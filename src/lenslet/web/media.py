@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import stat
+import struct
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Hashable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
@@ -20,8 +26,19 @@ from ..media_errors import (
     RemoteMediaReadError,
 )
 from ..storage.base import MediaStorage
-from .cache.thumbs import ThumbCache
-from .thumbs import MAX_THUMBNAIL_WORKERS, ThumbnailBusy, ThumbnailScheduler
+from ..storage.image_media import render_preview
+from .auth import request_client_id
+from .cache.thumbs import ThumbCacheStore
+from .thumbs import (
+    MAX_PROCESS_THUMBNAIL_WORKERS,
+    MAX_THUMBNAIL_WORKERS,
+    THUMBNAIL_PRIORITIES,
+    CancelState,
+    ThumbnailBusy,
+    ThumbnailEngineMode,
+    ThumbnailPriority,
+    ThumbnailScheduler,
+)
 
 if TYPE_CHECKING:
     from .hotpath import HotpathTelemetry
@@ -37,13 +54,44 @@ class _ClientDisconnected(Exception):
 @dataclass(frozen=True, slots=True)
 class _ThumbnailWorkResult:
     content: bytes
-    source: Literal["memory", "disk", "generated"]
+    source: Literal["memory", "disk", "generated", "original"]
     persist_key: str | None = None
+    media_type: str = "image/webp"
+
+
+@dataclass(frozen=True, slots=True)
+class ThumbnailRequestHint:
+    """Client scheduling hint: priority class plus the session's viewport generation."""
 
+    priority: ThumbnailPriority = "visible"
+    session: str | None = None
+    generation: int | None = None
 
-def thumb_worker_count() -> int:
+
+THUMBNAIL_PRIORITY_HEADER = "x-lenslet-thumb-priority"
+THUMBNAIL_GENERATION_HEADER = "x-lenslet-thumb-generation"
+
+
+def thumbnail_request_hint(
+    request: Request | None,
+    default_priority: ThumbnailPriority = "visible",
+) -> ThumbnailRequestHint:
+    if request is None:
+        return ThumbnailRequestHint(priority=default_priority)
+    raw_priority = (request.headers.get(THUMBNAIL_PRIORITY_HEADER) or "").strip().lower()
+    priority = next((value for value in THUMBNAIL_PRIORITIES if value == raw_priority), default_priority)
+    try:
+        generation = int(request.headers.get(THUMBNAIL_GENERATION_HEADER) or "")
+    except ValueError:
+        return ThumbnailRequestHint(priority=priority)
+    # Generations only order requests within one browser session.
+    return ThumbnailRequestHint(priority=priority, session=request_client_id(request), generation=generation)
+
+
+def thumb_worker_count(engine: ThumbnailEngineMode = "threads") -> int:
     cpu = os.cpu_count() or 2
-    return max(1, min(MAX_THUMBNAIL_WORKERS, cpu))
+    cap = MAX_PROCESS_THUMBNAIL_WORKERS if engine == "processes" else MAX_THUMBNAIL_WORKERS
+    return max(1, min(cap, cpu))
 
 
 _FAST_PATH_FALLBACK_ERRORS = (OSError, ValueError)
@@ -52,10 +100,14 @@ _SAFE_STREAM_HEADERS = (
     "content-length",
     "content-range",
     "accept-ranges",
-    "cache-control",
     "etag",
     "last-modified",
 )
+# Media URLs are not versioned, so validated responses are reused briefly and then
+# revalidated; a matching If-None-Match costs a 304 without touching the scheduler.
+THUMBNAIL_CACHE_CONTROL = "private, max-age=300, must-revalidate"
+FILE_CACHE_CONTROL = "private, max-age=300, must-revalidate"
+UNVALIDATED_CACHE_CONTROL = "private, max-age=60"
 
 
 def _get_cached_thumbnail(storage: MediaStorage, path: str) -> bytes | None:
@@ -94,7 +146,41 @@ def _thumb_cache_key(storage: MediaStorage, path: str) -> str | None:
         return None
 
 
-def _read_disk_thumbnail(thumb_cache: ThumbCache, cache_key: str) -> bytes | None:
+def _strong_etag(seed: str) -> str:
+    return '"' + hashlib.sha256(seed.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _if_none_match(request: Request | None, etag: str) -> bool:
+    if request is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _validator_headers(etag: str | None, cache_control: str) -> dict[str, str]:
+    if etag is None:
+        return {"cache-control": UNVALIDATED_CACHE_CONTROL}
+    return {"etag": etag, "cache-control": cache_control}
+
+
+def _not_modified(
+    etag: str,
+    cache_control: str,
+    hotpath_metrics: HotpathTelemetry | None,
+    counter: str,
+) -> Response:
+    if hotpath_metrics is not None:
+        hotpath_metrics.increment(counter)
+    return Response(status_code=304, headers=_validator_headers(etag, cache_control))
+
+
+def _read_disk_thumbnail(thumb_cache: ThumbCacheStore, cache_key: str) -> bytes | None:
     try:
         return thumb_cache.get(cache_key)
     except Exception as exc:
@@ -105,13 +191,13 @@ def _read_disk_thumbnail(thumb_cache: ThumbCache, cache_key: str) -> bytes | Non
 def _resolve_thumbnail(
     storage: MediaStorage,
     path: str,
-    thumb_cache: ThumbCache | None,
+    thumb_cache: ThumbCacheStore | None,
+    cache_key: str | None,
 ) -> _ThumbnailWorkResult:
     cached = _get_cached_thumbnail(storage, path)
     if cached is not None:
         return _ThumbnailWorkResult(content=cached, source="memory")
 
-    cache_key = _thumb_cache_key(storage, path) if thumb_cache is not None else None
     if thumb_cache is not None and cache_key:
         cached_disk = _read_disk_thumbnail(thumb_cache, cache_key)
         if cached_disk is not None:
@@ -121,11 +207,11 @@ def _resolve_thumbnail(
     return _ThumbnailWorkResult(
         content=content,
         source="generated",
-        persist_key=cache_key,
+        persist_key=cache_key if thumb_cache is not None else None,
     )
 
 
-def _persist_thumbnail(thumb_cache: ThumbCache, cache_key: str, content: bytes) -> None:
+def _persist_thumbnail(thumb_cache: ThumbCacheStore, cache_key: str, content: bytes) -> None:
     try:
         persisted = thumb_cache.set(cache_key, content)
     except Exception as exc:
@@ -188,6 +274,7 @@ def _remote_stream_response(
     storage: MediaStorage,
     path: str,
     request: Request | None,
+    etag: str | None,
 ) -> Response | None:
     opener = getattr(storage, "open_remote_media_stream", None)
     if opener is None:
@@ -214,6 +301,9 @@ def _remote_stream_response(
     }
     if "accept-ranges" not in headers:
         headers["accept-ranges"] = "bytes"
+    if etag is not None:
+        headers["etag"] = etag
+    headers["cache-control"] = FILE_CACHE_CONTROL if "etag" in headers else UNVALIDATED_CACHE_CONTROL
     media_type = upstream_headers.get("content-type") or storage.guess_mime(path)
     status_code = 206 if getattr(stream, "status_code", 200) == 206 else 200
     return StreamingResponse(
@@ -229,14 +319,24 @@ async def thumb_response_async(
     path: str,
     request: Request,
     queue: ThumbnailScheduler,
-    thumb_cache: ThumbCache | None = None,
+    thumb_cache: ThumbCacheStore | None = None,
     hotpath_metrics: HotpathTelemetry | None = None,
+    hint: ThumbnailRequestHint = ThumbnailRequestHint(),
 ) -> Response:
+    # The cache key already folds in the source etag and thumbnail settings; building
+    # it stats the source, so it runs off the event loop.
+    cache_key = await asyncio.to_thread(_thumb_cache_key, storage, path)
+    etag = _strong_etag(cache_key) if cache_key else None
+    if etag is not None and _if_none_match(request, etag):
+        return _not_modified(etag, THUMBNAIL_CACHE_CONTROL, hotpath_metrics, "thumbnail_not_modified_total")
     work_key = (id(storage), path)
     try:
         future = queue.submit(
             work_key,
-            lambda: _resolve_thumbnail(storage, path, thumb_cache),
+            lambda: _resolve_thumbnail(storage, path, thumb_cache, cache_key),
+            priority=hint.priority,
+            session=hint.session,
+            generation=hint.generation,
         )
     except ThumbnailBusy as exc:
         if hotpath_metrics is not None:
@@ -245,12 +345,11 @@ async def thumb_response_async(
     try:
         result = await _await_thumbnail(request, future)
     except _ClientDisconnected:
-        cancel_state = queue.cancel(work_key, future)
-        if hotpath_metrics is not None:
-            hotpath_metrics.increment("thumb_disconnect_cancel_total")
-            if cancel_state in ("queued", "inflight"):
-                hotpath_metrics.increment(f"thumb_disconnect_cancel_{cancel_state}_total")
+        _record_thumbnail_cancel(hotpath_metrics, queue.cancel(work_key, future))
         return Response(status_code=204)
+    except ThumbnailBusy as exc:
+        # Queued work was displaced or superseded by a newer viewport generation.
+        raise _thumbnail_busy() from exc
     except _MEDIA_RESPONSE_ERRORS as exc:
         raise media_failure_to_http_error(exc) from exc
     except _FAST_PATH_FALLBACK_ERRORS as exc:
@@ -259,17 +358,239 @@ async def thumb_response_async(
 
     if hotpath_metrics is not None:
         hotpath_metrics.increment(f"thumbnail_{result.source}_total")
-    if thumb_cache is not None and result.persist_key:
-        persist_key = result.persist_key
-        accepted = queue.submit_background(
-            ("persist", persist_key),
-            lambda: _persist_thumbnail(thumb_cache, persist_key, result.content),
-        )
-        if not accepted:
-            logger.warning("thumbnail cache persistence skipped: coordinator busy")
-            if hotpath_metrics is not None:
-                hotpath_metrics.increment("thumbnail_cache_persist_skipped_total")
-    return Response(content=result.content, media_type="image/webp")
+    _schedule_thumbnail_persist(queue, thumb_cache, result, hotpath_metrics)
+    return Response(
+        content=result.content,
+        media_type="image/webp",
+        headers=_validator_headers(etag, THUMBNAIL_CACHE_CONTROL),
+    )
+
+
+def _record_thumbnail_cancel(hotpath_metrics: HotpathTelemetry | None, cancel_state: CancelState) -> None:
+    if hotpath_metrics is None:
+        return
+    hotpath_metrics.increment("thumb_disconnect_cancel_total")
+    if cancel_state in ("queued", "inflight"):
+        hotpath_metrics.increment(f"thumb_disconnect_cancel_{cancel_state}_total")
+
+
+def _schedule_thumbnail_persist(
+    queue: ThumbnailScheduler,
+    thumb_cache: ThumbCacheStore | None,
+    result: _ThumbnailWorkResult,
+    hotpath_metrics: HotpathTelemetry | None,
+) -> None:
+    if thumb_cache is None or not result.persist_key:
+        return
+    persist_key = result.persist_key
+    accepted = queue.submit_background(
+        ("persist", persist_key),
+        lambda: _persist_thumbnail(thumb_cache, persist_key, result.content),
+    )
+    if not accepted:
+        logger.warning("thumbnail cache persistence skipped: coordinator busy")
+        if hotpath_metrics is not None:
+            hotpath_metrics.increment("thumbnail_cache_persist_skipped_total")
+
+
+THUMBNAIL_BATCH_MEDIA_TYPE = "application/x-lenslet-thumbnail-batch"
+# Bounded so one batch cannot monopolize the scheduler queue shared with single /thumb requests.
+THUMBNAIL_BATCH_WINDOW = 16
+_BATCH_FRAME_LENGTH = struct.Struct(">I")
+
+
+@dataclass(slots=True)
+class _BatchThumbnailLookup:
+    requested: str
+    path: str = ""
+    cache_key: str | None = None
+    etag: str | None = None
+    cached: bytes | None = None
+    error: HTTPException | None = None
+
+
+@dataclass(slots=True)
+class _BatchThumbnailWork:
+    requested: str
+    etag: str | None
+    work_key: Hashable
+    future: Future[_ThumbnailWorkResult]
+
+
+def _batch_frame(requested: str, status: int, *, content: bytes = b"", **fields: str) -> bytes:
+    header = {"path": requested, "status": status, "size": len(content), **fields}
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return _BATCH_FRAME_LENGTH.pack(len(encoded)) + encoded + content
+
+
+def _batch_result_frame(
+    requested: str,
+    etag: str | None,
+    result: _ThumbnailWorkResult,
+    hotpath_metrics: HotpathTelemetry | None,
+) -> bytes:
+    if hotpath_metrics is not None:
+        hotpath_metrics.increment(f"thumbnail_{result.source}_total")
+    fields = {"source": result.source}
+    if etag is not None:
+        fields["etag"] = etag
+    return _batch_frame(requested, 200, content=result.content, **fields)
+
+
+def _batch_error_frame(requested: str, exc: Exception) -> bytes:
+    if isinstance(exc, HTTPException):
+        http_error = exc
+    elif isinstance(exc, _MEDIA_RESPONSE_ERRORS):
+        http_error = media_failure_to_http_error(exc)
+    else:
+        http_error = media_failure_to_http_error(MediaReadError.from_exception(requested, exc))
+    return _batch_frame(requested, http_error.status_code, detail=str(http_error.detail))
+
+
+def thumb_batch_response(
+    storage: MediaStorage,
+    paths: list[str],
+    request: Request,
+    queue: ThumbnailScheduler,
+    resolve_path: Callable[[str], str],
+    *,
+    known_etags: dict[str, str] | None = None,
+    thumb_cache: ThumbCacheStore | None = None,
+    hotpath_metrics: HotpathTelemetry | None = None,
+    hint: ThumbnailRequestHint = ThumbnailRequestHint(),
+) -> StreamingResponse:
+    """Stream thumbnails for `paths` as length-prefixed frames in completion order.
+
+    Each frame is a 4-byte big-endian header length, a JSON header with `path`,
+    `status`, and `size` (plus `etag`, `source`, or `detail`), then `size` bytes of
+    WebP. Paths whose etag matches `known_etags` get a bodiless 304 frame. If the
+    client goes away, unfinished work is cancelled through the scheduler.
+    """
+    frames = _thumb_batch_frames(
+        storage,
+        paths,
+        request,
+        queue,
+        resolve_path,
+        known_etags or {},
+        thumb_cache,
+        hotpath_metrics,
+        hint,
+    )
+    return StreamingResponse(
+        frames,
+        media_type=THUMBNAIL_BATCH_MEDIA_TYPE,
+        headers={"cache-control": "no-store"},
+    )
+
+
+def _lookup_batch_window(
+    storage: MediaStorage,
+    requested_paths: list[str],
+    resolve_path: Callable[[str], str],
+    known_etags: dict[str, str],
+) -> list[_BatchThumbnailLookup]:
+    # Path checks, etag stats, and memory-cache reads all touch storage, so a
+    # batch window runs them together in one worker-thread hop.
+    lookups: list[_BatchThumbnailLookup] = []
+    for requested in requested_paths:
+        try:
+            path = resolve_path(requested)
+        except HTTPException as exc:
+            lookups.append(_BatchThumbnailLookup(requested, error=exc))
+            continue
+        cache_key = _thumb_cache_key(storage, path)
+        etag = _strong_etag(cache_key) if cache_key else None
+        lookup = _BatchThumbnailLookup(requested, path, cache_key, etag)
+        if etag is None or known_etags.get(requested) != etag:
+            lookup.cached = _get_cached_thumbnail(storage, path)
+        lookups.append(lookup)
+    return lookups
+
+
+async def _thumb_batch_frames(
+    storage: MediaStorage,
+    paths: list[str],
+    request: Request,
+    queue: ThumbnailScheduler,
+    resolve_path: Callable[[str], str],
+    known_etags: dict[str, str],
+    thumb_cache: ThumbCacheStore | None,
+    hotpath_metrics: HotpathTelemetry | None,
+    hint: ThumbnailRequestHint,
+) -> AsyncIterator[bytes]:
+    waiting = deque(paths)
+    pending: dict[asyncio.Future[_ThumbnailWorkResult], _BatchThumbnailWork] = {}
+    if hotpath_metrics is not None:
+        hotpath_metrics.increment("thumbnail_batch_requests_total")
+        hotpath_metrics.increment("thumbnail_batch_paths_total", len(paths))
+    try:
+        while waiting or pending:
+            window = [waiting.popleft() for _ in range(min(len(waiting), THUMBNAIL_BATCH_WINDOW - len(pending)))]
+            if window:
+                lookups = await asyncio.to_thread(_lookup_batch_window, storage, window, resolve_path, known_etags)
+            else:
+                lookups = []
+            for lookup in lookups:
+                requested, path, cache_key, etag = lookup.requested, lookup.path, lookup.cache_key, lookup.etag
+                if lookup.error is not None:
+                    yield _batch_error_frame(requested, lookup.error)
+                    continue
+                if etag is not None and known_etags.get(requested) == etag:
+                    if hotpath_metrics is not None:
+                        hotpath_metrics.increment("thumbnail_not_modified_total")
+                    yield _batch_frame(requested, 304, etag=etag)
+                    continue
+                if lookup.cached is not None:
+                    memory_result = _ThumbnailWorkResult(content=lookup.cached, source="memory")
+                    yield _batch_result_frame(requested, etag, memory_result, hotpath_metrics)
+                    continue
+                work_key = (id(storage), path)
+                try:
+                    future = queue.submit(
+                        work_key,
+                        lambda path=path, cache_key=cache_key: _resolve_thumbnail(
+                            storage,
+                            path,
+                            thumb_cache,
+                            cache_key,
+                        ),
+                        priority=hint.priority,
+                        session=hint.session,
+                        generation=hint.generation,
+                    )
+                except ThumbnailBusy:
+                    if hotpath_metrics is not None:
+                        hotpath_metrics.increment("thumbnail_busy_total")
+                    yield _batch_frame(requested, 503, detail="thumbnail_busy")
+                    continue
+                pending[asyncio.wrap_future(future)] = _BatchThumbnailWork(requested, etag, work_key, future)
+            if not pending:
+                continue
+            done, _ = await asyncio.wait(pending, timeout=0.05, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                if await request.is_disconnected():
+                    return
+                continue
+            for wrapped in done:
+                work = pending.pop(wrapped)
+                try:
+                    result = wrapped.result()
+                except asyncio.CancelledError:
+                    yield _batch_frame(work.requested, 503, detail="thumbnail_cancelled")
+                    continue
+                except ThumbnailBusy:
+                    yield _batch_frame(work.requested, 503, detail="thumbnail_busy")
+                    continue
+                except Exception as exc:
+                    yield _batch_error_frame(work.requested, exc)
+                    continue
+                _schedule_thumbnail_persist(queue, thumb_cache, result, hotpath_metrics)
+                yield _batch_result_frame(work.requested, work.etag, result, hotpath_metrics)
+    finally:
+        # Runs on normal exit, disconnect polling, and stream cancellation alike.
+        for work in pending.values():
+            _record_thumbnail_cancel(hotpath_metrics, queue.cancel(work.work_key, work.future))
 
 
 FilePrefetchContext = Literal["viewer", "compare"]
@@ -286,6 +607,17 @@ def _file_prefetch_context(request: Request | None) -> FilePrefetchContext | Non
     return None
 
 
+def _storage_file_etag(storage: MediaStorage, path: str) -> str | None:
+    etag = getattr(storage, "etag", None)
+    if etag is None:
+        return None
+    try:
+        value = etag(path)
+    except _MEDIA_RESPONSE_ERRORS + _FAST_PATH_FALLBACK_ERRORS:
+        return None
+    return _strong_etag(f"{path}|{value}") if value else None
+
+
 def file_response(
     storage: MediaStorage,
     path: str,
@@ -300,10 +632,21 @@ def file_response(
     local_hit = _resolve_local_file_path(storage, path)
     if local_hit is not None:
         local_path, stat_result = local_hit
+        etag = _strong_etag(f"{local_path}|{stat_result.st_mtime_ns}|{stat_result.st_size}")
+        if _if_none_match(request, etag):
+            return _not_modified(etag, FILE_CACHE_CONTROL, hotpath_metrics, "file_not_modified_total")
         if hotpath_metrics is not None:
             hotpath_metrics.increment("file_response_local_stream_total")
-        return FileResponse(path=local_path, media_type=media_type, stat_result=stat_result)
-    remote_stream = _remote_stream_response(storage, path, request)
+        return FileResponse(
+            path=local_path,
+            media_type=media_type,
+            stat_result=stat_result,
+            headers=_validator_headers(etag, FILE_CACHE_CONTROL),
+        )
+    etag = _storage_file_etag(storage, path)
+    if etag is not None and _if_none_match(request, etag):
+        return _not_modified(etag, FILE_CACHE_CONTROL, hotpath_metrics, "file_not_modified_total")
+    remote_stream = _remote_stream_response(storage, path, request, etag)
     if remote_stream is not None:
         if hotpath_metrics is not None:
             hotpath_metrics.increment("file_response_remote_stream_total")
@@ -317,4 +660,120 @@ def file_response(
     except _FAST_PATH_FALLBACK_ERRORS as exc:
         read_error = MediaReadError.from_exception(path, exc)
         raise media_failure_to_http_error(read_error) from exc
-    return Response(content=data, media_type=media_type)
+    if etag is None:
+        etag = _strong_etag(hashlib.sha256(data).hexdigest())
+        if _if_none_match(request, etag):
+            return _not_modified(etag, FILE_CACHE_CONTROL, hotpath_metrics, "file_not_modified_total")
+    return Response(
+        content=data,
+        media_type=media_type,
+        headers=_validator_headers(etag, FILE_CACHE_CONTROL),
+    )
+
+
+# Long-side pixel tiers for viewer-sized derivatives. Compare panes split the
+# viewport, so compare prefetches default to the smaller tier.
+PREVIEW_SIZES: dict[FilePrefetchContext, int] = {"compare": 1600, "viewer": 2400}
+PREVIEW_QUALITY = 82
+
+
+def preview_long_side(size: int | None, context: FilePrefetchContext | None) -> int:
+    """Snap a requested long side to the smallest preview tier that covers it."""
+    tiers = sorted(PREVIEW_SIZES.values())
+    if size is None:
+        return PREVIEW_SIZES[context or "viewer"]
+    for tier in tiers:
+        if size <= tier:
+            return tier
+    return tiers[-1]
+
+
+def _preview_cache_key(storage: MediaStorage, path: str, long_side: int) -> str | None:
+    # The thumbnail key already folds in the source identity; previews only add their tier.
+    thumb_key = _thumb_cache_key(storage, path)
+    if thumb_key is None:
+        return None
+    return f"preview|{long_side}|{PREVIEW_QUALITY}|{thumb_key}"
+
+
+def _resolve_preview(
+    storage: MediaStorage,
+    path: str,
+    long_side: int,
+    preview_cache: ThumbCacheStore | None,
+    cache_key: str | None,
+) -> _ThumbnailWorkResult:
+    if preview_cache is not None and cache_key:
+        cached = _read_disk_thumbnail(preview_cache, cache_key)
+        if cached is not None:
+            return _ThumbnailWorkResult(cached, "disk")
+    data = storage.read_bytes(path)
+    try:
+        content, media_type = render_preview(data, long_side=long_side, quality=PREVIEW_QUALITY)
+    except Exception as exc:
+        raise MediaDecodeError.from_exception(path, exc) from exc
+    if media_type != "image/webp":
+        # Small JPEG/WebP sources are served as-is; caching them would only duplicate the original.
+        return _ThumbnailWorkResult(content, "original", media_type=media_type)
+    return _ThumbnailWorkResult(content, "generated", persist_key=cache_key)
+
+
+async def preview_response_async(
+    storage: MediaStorage,
+    path: str,
+    request: Request,
+    queue: ThumbnailScheduler,
+    preview_cache: ThumbCacheStore | None = None,
+    *,
+    size: int | None = None,
+    hotpath_metrics: HotpathTelemetry | None = None,
+) -> Response:
+    prefetch_context = _file_prefetch_context(request)
+    if prefetch_context is not None and hotpath_metrics is not None:
+        hotpath_metrics.increment(f"preview_prefetch_{prefetch_context}_total")
+    long_side = preview_long_side(size, prefetch_context)
+    # Without an explicit size the tier comes from the prefetch hint, so the URL
+    # alone does not identify the body.
+    vary = {"vary": "x-lenslet-prefetch"} if size is None else {}
+    cache_key = await asyncio.to_thread(_preview_cache_key, storage, path, long_side)
+    etag = _strong_etag(cache_key) if cache_key else None
+    if etag is not None and _if_none_match(request, etag):
+        response = _not_modified(etag, THUMBNAIL_CACHE_CONTROL, hotpath_metrics, "preview_not_modified_total")
+        response.headers.update(vary)
+        return response
+    work_key = ("preview", id(storage), path, long_side)
+    # Viewer/compare prefetches must not delay previews the user is looking at.
+    hint = thumbnail_request_hint(request, "prefetch" if prefetch_context is not None else "visible")
+    try:
+        future = queue.submit(
+            work_key,
+            lambda: _resolve_preview(storage, path, long_side, preview_cache, cache_key),
+            priority=hint.priority,
+            session=hint.session,
+            generation=hint.generation,
+        )
+    except ThumbnailBusy as exc:
+        if hotpath_metrics is not None:
+            hotpath_metrics.increment("preview_busy_total")
+        raise _thumbnail_busy() from exc
+    try:
+        result = await _await_thumbnail(request, future)
+    except _ClientDisconnected:
+        _record_thumbnail_cancel(hotpath_metrics, queue.cancel(work_key, future))
+        return Response(status_code=204)
+    except ThumbnailBusy as exc:
+        raise _thumbnail_busy() from exc
+    except _MEDIA_RESPONSE_ERRORS as exc:
+        raise media_failure_to_http_error(exc) from exc
+    except _FAST_PATH_FALLBACK_ERRORS as exc:
+        read_error = MediaReadError.from_exception(path, exc)
+        raise media_failure_to_http_error(read_error) from exc
+
+    if hotpath_metrics is not None:
+        hotpath_metrics.increment(f"preview_{result.source}_total")
+    _schedule_thumbnail_persist(queue, preview_cache, result, hotpath_metrics)
+    return Response(
+        content=result.content,
+        media_type=result.media_type,
+        headers={**_validator_headers(etag, THUMBNAIL_CACHE_CONTROL), **vary},
+    )
@@ -559,6 +559,14 @@ class TableSourceColumnsPayload(BaseModel):
     warning: str | None = None
 
 
+THUMBNAIL_BATCH_MAX_PATHS = 256
+
+
+class ThumbnailBatchRequest(StrictModel):
+    paths: list[str] = Field(min_length=1, max_length=THUMBNAIL_BATCH_MAX_PATHS)
+    etags: dict[str, str] = Field(default_factory=dict)
+
+
 class TableSourceColumnSwitchRequest(BaseModel):
     source_column: str
 
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, Request, Response
+import asyncio
+
+from fastapi import FastAPI, Query, Request, Response
 
 from ..browse import ensure_image, storage_from_request
 from ..context import get_request_context
-from ..media import file_response, thumb_response_async
+from ..media import (
+    file_response,
+    preview_response_async,
+    thumb_batch_response,
+    thumb_response_async,
+    thumbnail_request_hint,
+)
+from ..models import ThumbnailBatchRequest
 from ..paths import canonical_path
 from ...storage.base import MediaStorage
 from ...diagnostics import mark_request_handler_started, request_phase
@@ -21,7 +30,7 @@ def register_media_routes(app: FastAPI) -> None:
     @app.get("/thumb")
     async def get_thumb(path: str, request: Request) -> Response:
         mark_request_handler_started()
-        storage, path = _resolve_media_request(path, request)
+        storage, path = await asyncio.to_thread(_resolve_media_request, path, request)
         runtime = get_request_context(request).runtime
         with request_phase("thumbnail"):
             return await thumb_response_async(
@@ -31,6 +40,41 @@ def register_media_routes(app: FastAPI) -> None:
                 runtime.thumb_queue,
                 runtime.thumb_cache,
                 hotpath_metrics=runtime.hotpath_metrics,
+                hint=thumbnail_request_hint(request),
+            )
+
+    @app.post("/thumbs")
+    def get_thumb_batch(body: ThumbnailBatchRequest, request: Request) -> Response:
+        mark_request_handler_started()
+        storage = storage_from_request(request)
+        runtime = get_request_context(request).runtime
+        with request_phase("thumbnail"):
+            return thumb_batch_response(
+                storage,
+                body.paths,
+                request,
+                runtime.thumb_queue,
+                lambda path: _resolve_media_request(path, request)[1],
+                known_etags=body.etags,
+                thumb_cache=runtime.thumb_cache,
+                hotpath_metrics=runtime.hotpath_metrics,
+                hint=thumbnail_request_hint(request),
+            )
+
+    @app.get("/preview")
+    async def get_preview(path: str, request: Request, size: int | None = Query(None, ge=1)) -> Response:
+        mark_request_handler_started()
+        storage, path = await asyncio.to_thread(_resolve_media_request, path, request)
+        runtime = get_request_context(request).runtime
+        with request_phase("preview"):
+            return await preview_response_async(
+                storage,
+                path,
+                request,
+                runtime.thumb_queue,
+                runtime.preview_cache,
+                size=size,
+                hotpath_metrics=runtime.hotpath_metrics,
             )
 
     @app.get("/file")
@@ -7,15 +7,24 @@ from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 
-from .cache.thumbs import ThumbCache
+from .cache.originals import OriginalCache
+from .cache.thumbs import ThumbCacheLayout, ThumbCacheStore
 from .lifecycle import register_lifecycle_handlers
 from .sync.events import EventBroker, IdempotencyCache
 from .sync.labels import init_sync_state
 from .sync.persistence import LabelWriteBuffer
 from .sync.presence import PresenceMetrics, PresenceTracker
 from .source_monitor import TableSourceMonitor
-from .thumbs import ThumbnailScheduler
+from .thumb_processes import ThumbnailProcessPool
+from .thumbs import (
+    MAX_PROCESS_THUMBNAIL_WORKERS,
+    MAX_THUMBNAIL_WORKERS,
+    ThumbnailEngineMode,
+    ThumbnailPriority,
+    ThumbnailScheduler,
+)
 from ..storage.base import BrowseAppStorage
+from ..storage.bounded_cache import DEFAULT_THUMBNAIL_CACHE_BYTES
 from ..storage.table.query_coordinator import TableQueryCoordinator
 from ..workspace import Workspace
 
@@ -33,10 +42,16 @@ class AppRuntime:
     presence_metrics: PresenceMetrics
     presence_prune_interval: float
     thumb_queue: ThumbnailScheduler
-    thumb_cache: ThumbCache | None
+    thumb_processes: ThumbnailProcessPool | None
+    thumb_cache: ThumbCacheStore | None
     hotpath_metrics: HotpathTelemetry
     query_coordinator: TableQueryCoordinator
     table_source_monitor: TableSourceMonitor
+    thumb_memory_cache_bytes: int = DEFAULT_THUMBNAIL_CACHE_BYTES
+    original_cache: OriginalCache | None = None
+    original_cache_bytes: int = 0
+    preview_cache: ThumbCacheStore | None = None
+    thumb_cache_bytes: int = 0
 
 
 @dataclass(frozen=True, slots=True)
@@ -46,12 +61,21 @@ class AppRuntimeSettings:
     presence_prune_interval: float
     thumb_cache_enabled: bool
     thumb_worker_count: int
+    thumb_engine: ThumbnailEngineMode = "threads"
+    thumb_cache_layout: ThumbCacheLayout = "directory"
+    thumb_memory_cache_bytes: int = DEFAULT_THUMBNAIL_CACHE_BYTES
+    original_cache_bytes: int = 0
+    analysis_worker_count: int = 1
+    # Disk cap for the persistent thumbnail cache; 0 leaves it uncapped.
+    thumb_cache_bytes: int = 0
 
 
 @dataclass(frozen=True, slots=True)
 class AppRuntimeHooks:
-    build_thumb_cache: Callable[[Workspace, bool], ThumbCache | None]
+    build_thumb_cache: Callable[[Workspace, bool, ThumbCacheLayout, int], ThumbCacheStore | None]
     build_hotpath_metrics: Callable[[FastAPI], HotpathTelemetry]
+    build_original_cache: Callable[[Workspace, int], OriginalCache | None] | None = None
+    build_preview_cache: Callable[[Workspace, bool, ThumbCacheLayout], ThumbCacheStore | None] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -85,11 +109,42 @@ def build_app_runtime(
         edit_ttl=settings.presence_edit_ttl,
     )
     presence_metrics = PresenceMetrics()
-    thumb_queue = ThumbnailScheduler(max_workers=settings.thumb_worker_count)
-    register_lifecycle_handlers(app, startup=thumb_queue.start, shutdown=thumb_queue.close)
-    thumb_cache = hooks.build_thumb_cache(assembly.workspace, settings.thumb_cache_enabled)
     hotpath_metrics = hooks.build_hotpath_metrics(app)
+    thumb_queue, thumb_processes = _build_thumbnail_engine(
+        assembly.storage,
+        settings,
+        on_queue_wait=lambda priority, wait_ms: hotpath_metrics.observe_ms(
+            f"thumbnail_queue_wait_{priority}",
+            wait_ms,
+        ),
+    )
+    if thumb_processes is not None:
+        # Shutdown handlers run in reverse, so registering the pool first closes it
+        # only after the scheduler threads waiting on its futures have drained.
+        register_lifecycle_handlers(app, startup=thumb_processes.start, shutdown=thumb_processes.close)
+    register_lifecycle_handlers(app, startup=thumb_queue.start, shutdown=thumb_queue.close)
+    thumb_cache = hooks.build_thumb_cache(
+        assembly.workspace,
+        settings.thumb_cache_enabled,
+        settings.thumb_cache_layout,
+        settings.thumb_cache_bytes,
+    )
+    original_cache = (
+        hooks.build_original_cache(assembly.workspace, settings.original_cache_bytes)
+        if hooks.build_original_cache is not None
+        else None
+    )
+    preview_cache = (
+        hooks.build_preview_cache(
+            assembly.workspace,
+            settings.thumb_cache_enabled,
+            settings.thumb_cache_layout,
+        )
+        if hooks.build_preview_cache is not None
+        else None
+    )
     query_coordinator = TableQueryCoordinator(
+        max_workers=settings.analysis_worker_count,
         on_analysis_event=hotpath_metrics.record_analysis,
     )
     register_lifecycle_handlers(
@@ -112,8 +167,38 @@ def build_app_runtime(
         presence_metrics=presence_metrics,
         presence_prune_interval=settings.presence_prune_interval,
         thumb_queue=thumb_queue,
+        thumb_processes=thumb_processes,
         thumb_cache=thumb_cache,
         hotpath_metrics=hotpath_metrics,
         query_coordinator=query_coordinator,
         table_source_monitor=table_source_monitor,
+        thumb_memory_cache_bytes=settings.thumb_memory_cache_bytes,
+        original_cache=original_cache,
+        original_cache_bytes=settings.original_cache_bytes,
+        preview_cache=preview_cache,
+        thumb_cache_bytes=settings.thumb_cache_bytes,
+    )
+
+
+def _build_thumbnail_engine(
+    storage: BrowseAppStorage,
+    settings: AppRuntimeSettings,
+    *,
+    on_queue_wait: Callable[[ThumbnailPriority, float], None] | None = None,
+) -> tuple[ThumbnailScheduler, ThumbnailProcessPool | None]:
+    if settings.thumb_engine != "processes":
+        return ThumbnailScheduler(max_workers=settings.thumb_worker_count, on_queue_wait=on_queue_wait), None
+    set_renderer = getattr(storage, "set_thumbnail_renderer", None)
+    if set_renderer is None:
+        return ThumbnailScheduler(
+            max_workers=min(MAX_THUMBNAIL_WORKERS, settings.thumb_worker_count),
+            on_queue_wait=on_queue_wait,
+        ), None
+    thumb_processes = ThumbnailProcessPool(max_workers=settings.thumb_worker_count)
+    set_renderer(thumb_processes)
+    thumb_queue = ThumbnailScheduler(
+        max_workers=thumb_processes.max_workers,
+        worker_cap=MAX_PROCESS_THUMBNAIL_WORKERS,
+        on_queue_wait=on_queue_wait,
     )
+    return thumb_queue, thumb_processes
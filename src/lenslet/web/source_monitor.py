@@ -5,6 +5,8 @@ import logging
 from contextlib import suppress
 
 from ..storage.base import BrowseAppStorage
+from .cache.browse import RecursiveBrowseCache
+from .generation import build_browse_generation_token
 from .sync.events import EventBroker
 
 
@@ -12,6 +14,13 @@ logger = logging.getLogger(__name__)
 
 
 class TableSourceMonitor:
+    """Poll a tracked table source and publish its `table-source` transitions.
+
+    When the storage can reload in process, a `refreshing` source is rebuilt
+    off the event loop; recursive browse windows whose folders hold no
+    changed row move to the new generation before it is announced.
+    """
+
     def __init__(
         self,
         storage: BrowseAppStorage,
@@ -23,6 +32,10 @@ class TableSourceMonitor:
         self._broker = broker
         self._poll_interval = poll_interval
         self._task: asyncio.Task[None] | None = None
+        self._recursive_browse_cache: RecursiveBrowseCache | None = None
+
+    def bind_recursive_browse_cache(self, cache: RecursiveBrowseCache | None) -> None:
+        self._recursive_browse_cache = cache
 
     def start(self) -> None:
         if self._task is not None:
@@ -46,9 +59,32 @@ class TableSourceMonitor:
         if not callable(poll):
             return False
         status, changed = await asyncio.to_thread(poll)
-        if not changed or status is None:
+        if status is None:
+            return False
+        if changed:
+            self._broker.publish("table-source", status.event_payload())
+        if status.state == "refreshing" and await self._reload():
+            status, _changed = await asyncio.to_thread(poll)
+            if status is not None:
+                self._broker.publish("table-source", status.event_payload())
+            return True
+        return changed
+
+    async def _reload(self) -> bool:
+        reload = getattr(self._storage, "reload_source_generation", None)
+        if not callable(reload):
+            return False
+        previous_generation = build_browse_generation_token(self._storage)
+        diff = await asyncio.to_thread(reload)
+        if diff is None:
             return False
-        self._broker.publish("table-source", status.event_payload())
+        cache = self._recursive_browse_cache
+        if cache is not None:
+            cache.carry_forward(
+                previous_generation,
+                build_browse_generation_token(self._storage),
+                diff.changed_scopes(),
+            )
         return True
 
     async def _run(self) -> None:
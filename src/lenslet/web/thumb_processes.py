@@ -0,0 +1,240 @@
+"""Process-pool thumbnail rendering behind the thumbnail scheduler."""
+
+from __future__ import annotations
+
+import io
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+from ..storage.image_media import make_webp_thumbnail, render_webp_thumbnail
+from .thumbs import MAX_PROCESS_THUMBNAIL_WORKERS
+
+
+# Small sources are cheaper to pickle than to stage through a shared-memory segment.
+SHARED_MEMORY_MIN_BYTES = 256 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class _SharedBufferReader(io.RawIOBase):
+    """Seekable read-only file view over a shared-memory buffer, without copying it whole."""
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        start = self._position
+        count = max(0, min(len(buffer), len(self._view) - start))
+        buffer[:count] = self._view[start:start + count]
+        self._position = start + count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("negative seek position")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        self._view = memoryview(b"")
+        super().close()
+
+
+def _render_pickled(
+    img_bytes: bytes,
+    thumb_size: int,
+    thumb_quality: int,
+) -> tuple[bytes, tuple[int, int] | None]:
+    return make_webp_thumbnail(img_bytes, thumb_size=thumb_size, thumb_quality=thumb_quality)
+
+
+def _render_shared(
+    name: str,
+    size: int,
+    thumb_size: int,
+    thumb_quality: int,
+) -> tuple[bytes, tuple[int, int] | None]:
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = block.buf[:size]
+        try:
+            with _SharedBufferReader(view) as reader:
+                return render_webp_thumbnail(
+                    io.BufferedReader(reader),
+                    thumb_size=thumb_size,
+                    thumb_quality=thumb_quality,
+                )
+        finally:
+            view.release()
+    finally:
+        block.close()
+
+
+class ThumbnailProcessPool:
+    """Render WebP thumbnails in worker processes sized to the host's cores.
+
+    The pool only owns decode/resize/encode. Source reads, cache updates, per-key
+    deduplication, priority, and cancellation stay with the storage and the
+    `ThumbnailScheduler` threads that block on `render`, so those semantics are
+    unchanged. Large source payloads travel through shared memory instead of
+    being pickled across the worker pipe.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        shared_memory_min_bytes: int = SHARED_MEMORY_MIN_BYTES,
+    ) -> None:
+        self._max_workers = min(MAX_PROCESS_THUMBNAIL_WORKERS, max(1, int(max_workers)))
+        self._shared_memory_min_bytes = max(0, int(shared_memory_min_bytes))
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._closed = False
+        self._rendered = 0
+        self._shared_memory_renders = 0
+        self._restarts = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def start(self) -> None:
+        self._ensure_executor()
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("thumbnail process pool is closed")
+            if self._executor is None:
+                # Spawned workers never inherit the server's threads or sockets.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _discard_broken_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("thumbnail worker process exited; restarting the process pool")
+
+    def __call__(
+        self,
+        img_bytes: bytes,
+        *,
+        thumb_size: int,
+        thumb_quality: int,
+    ) -> tuple[bytes, tuple[int, int] | None]:
+        return self.render(img_bytes, thumb_size=thumb_size, thumb_quality=thumb_quality)
+
+    def render(
+        self,
+        img_bytes: bytes,
+        *,
+        thumb_size: int,
+        thumb_quality: int,
+    ) -> tuple[bytes, tuple[int, int] | None]:
+        executor = self._ensure_executor()
+        size = len(img_bytes)
+        try:
+            if size < self._shared_memory_min_bytes or size == 0:
+                result = executor.submit(
+                    _render_pickled,
+                    img_bytes,
+                    thumb_size,
+                    thumb_quality,
+                ).result()
+            else:
+                result = self._render_through_shared_memory(
+                    executor,
+                    img_bytes,
+                    thumb_size=thumb_size,
+                    thumb_quality=thumb_quality,
+                )
+        except BrokenProcessPool as exc:
+            self._discard_broken_executor(executor)
+            raise OSError("thumbnail worker process exited while decoding") from exc
+        with self._lock:
+            self._rendered += 1
+        return result
+
+    def _render_through_shared_memory(
+        self,
+        executor: ProcessPoolExecutor,
+        img_bytes: bytes,
+        *,
+        thumb_size: int,
+        thumb_quality: int,
+    ) -> tuple[bytes, tuple[int, int] | None]:
+        size = len(img_bytes)
+        block = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            block.buf[:size] = img_bytes
+            result = executor.submit(
+                _render_shared,
+                block.name,
+                size,
+                thumb_size,
+                thumb_quality,
+            ).result()
+        finally:
+            block.close()
+            block.unlink()
+        with self._lock:
+            self._shared_memory_renders += 1
+        return result
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self._max_workers,
+                "rendered": self._rendered,
+                "shared_memory_renders": self._shared_memory_renders,
+                "restarts": self._restarts,
+            }
+
+    def diagnostics(self) -> dict[str, int]:
+        stats = self.stats()
+        return {
+            "thumbnail_process_workers": stats["workers"],
+            "thumbnail_process_rendered_total": stats["rendered"],
+            "thumbnail_process_shared_memory_total": stats["shared_memory_renders"],
+            "thumbnail_process_restarts_total": stats["restarts"],
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -1,22 +1,32 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Callable, Hashable
 from concurrent.futures import Future
 from dataclasses import dataclass, field
 import logging
 from threading import Condition, Thread
+import time
 from typing import Any, Deque, Generic, Literal, TypeVar, cast
 
 
 MAX_THUMBNAIL_WORKERS = 4
+# Process-engine scheduler threads only wait on worker processes, so they may exceed the GIL-bound cap.
+MAX_PROCESS_THUMBNAIL_WORKERS = 32
 MAX_QUEUED_THUMBNAILS = 128
 MAX_INFLIGHT_THUMBNAILS = 256
+# Latest client generation is remembered for this many sessions (least recently seen are forgotten).
+MAX_TRACKED_THUMBNAIL_SESSIONS = 1024
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 CancelState = Literal["queued", "inflight", "none"]
+ThumbnailEngineMode = Literal["threads", "processes"]
+ThumbnailPriority = Literal["visible", "near", "prefetch"]
+# Highest priority first; workers always drain the first non-empty class.
+THUMBNAIL_PRIORITIES: tuple[ThumbnailPriority, ...] = ("visible", "near", "prefetch")
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(THUMBNAIL_PRIORITIES)}
 
 
 class ThumbnailBusy(RuntimeError):
@@ -30,10 +40,27 @@ class _ThumbnailJob:
     waiters: set[Future[Any]] = field(default_factory=set)
     background: bool = False
     started: bool = False
+    priority: ThumbnailPriority = "visible"
+    # Highest class any waiter asked for; demotions never lower it.
+    requested: ThumbnailPriority = "visible"
+    session: Hashable | None = None
+    generation: int = 0
+    enqueued_at: float = 0.0
 
 
 class ThumbnailScheduler(Generic[T]):
-    """Bounded dedicated worker pool with per-key work deduplication."""
+    """Bounded dedicated worker pool with per-key work deduplication.
+
+    Foreground work is queued by priority class (`visible`, `near`,
+    `prefetch`) and each class is served newest-first, so cells the user just
+    stopped on run before older requests from a fast scroll. A submission that
+    carries a newer client `generation` for its `session` demotes that
+    session's older queued work to `prefetch`, and drops older work that was
+    only ever requested as `prefetch`; work a client asked to show is never
+    dropped by a generation change, since that cell may still be on screen
+    without the client sending it again. Background work only runs when no foreground work is
+    queued. Queue wait per class is reported through `on_queue_wait`.
+    """
 
     def __init__(
         self,
@@ -42,22 +69,34 @@ class ThumbnailScheduler(Generic[T]):
         max_queue_size: int = MAX_QUEUED_THUMBNAILS,
         max_inflight_entries: int = MAX_INFLIGHT_THUMBNAILS,
         name: str = "lenslet-thumb",
+        worker_cap: int = MAX_THUMBNAIL_WORKERS,
+        on_queue_wait: Callable[[ThumbnailPriority, float], None] | None = None,
     ) -> None:
-        self._max_workers = min(MAX_THUMBNAIL_WORKERS, max(1, int(max_workers)))
+        worker_cap = min(MAX_PROCESS_THUMBNAIL_WORKERS, max(1, int(worker_cap)))
+        self._max_workers = min(worker_cap, max(1, int(max_workers)))
         self._max_queue_size = min(MAX_QUEUED_THUMBNAILS, max(1, int(max_queue_size)))
         self._max_inflight_entries = min(
             MAX_INFLIGHT_THUMBNAILS,
             max(1, int(max_inflight_entries)),
         )
         self._name = name
-        self._queue: Deque[_ThumbnailJob] = deque()
+        self._on_queue_wait = on_queue_wait
+        self._queues: dict[ThumbnailPriority, Deque[_ThumbnailJob]] = {
+            priority: deque() for priority in THUMBNAIL_PRIORITIES
+        }
+        self._background: Deque[_ThumbnailJob] = deque()
         self._inflight: dict[Hashable, _ThumbnailJob] = {}
+        self._generations: OrderedDict[Hashable, int] = OrderedDict()
         self._cond = Condition()
         self._closed = False
         self._started = False
         self._threads: list[Thread] = []
         self._background_dropped = 0
         self._active_background = 0
+        self._demoted = 0
+        self._superseded = 0
+        self._displaced = 0
+        self._max_wait_ms: dict[ThumbnailPriority, float] = {priority: 0.0 for priority in THUMBNAIL_PRIORITIES}
 
     def start(self) -> None:
         with self._cond:
@@ -71,22 +110,46 @@ class ThumbnailScheduler(Generic[T]):
             for thread in self._threads:
                 thread.start()
 
-    def submit(self, key: Hashable, operation: Callable[[], T]) -> Future[T]:
+    def submit(
+        self,
+        key: Hashable,
+        operation: Callable[[], T],
+        *,
+        priority: ThumbnailPriority = "visible",
+        session: Hashable | None = None,
+        generation: int | None = None,
+    ) -> Future[T]:
         self.start()
         with self._cond:
             self._ensure_open()
+            requested = priority
+            if session is not None and generation is not None:
+                if not self._advance_generation(session, generation):
+                    # A request from an older generation than the session already reported.
+                    priority = "prefetch"
+            else:
+                session = None
             job = self._inflight.get(key)
             waiter: Future[Any] = Future()
             if job is not None:
                 if job.background:
                     raise ThumbnailBusy("thumbnail key is occupied by background work")
                 job.waiters.add(waiter)
+                self._join_job(job, priority, requested, session, generation)
                 return cast(Future[T], waiter)
-            self._ensure_capacity(prefer_foreground=True)
-            job = _ThumbnailJob(key=key, operation=operation)
+            self._ensure_capacity(priority)
+            job = _ThumbnailJob(
+                key=key,
+                operation=operation,
+                priority=priority,
+                requested=requested,
+                session=session,
+                generation=generation or 0,
+                enqueued_at=time.monotonic(),
+            )
             job.waiters.add(waiter)
             self._inflight[key] = job
-            self._queue.append(job)
+            self._queues[priority].append(job)
             self._cond.notify()
             return cast(Future[T], waiter)
 
@@ -99,12 +162,12 @@ class ThumbnailScheduler(Generic[T]):
             if key in self._inflight:
                 return True
             try:
-                self._ensure_capacity(prefer_foreground=False)
+                self._ensure_capacity(None)
             except ThumbnailBusy:
                 return False
-            job = _ThumbnailJob(key=key, operation=operation, background=True)
+            job = _ThumbnailJob(key=key, operation=operation, background=True, enqueued_at=time.monotonic())
             self._inflight[key] = job
-            self._queue.appendleft(job)
+            self._background.appendleft(job)
             self._cond.notify()
             return True
 
@@ -112,29 +175,107 @@ class ThumbnailScheduler(Generic[T]):
         if self._closed:
             raise RuntimeError("thumbnail scheduler is closed")
 
-    def _ensure_capacity(self, *, prefer_foreground: bool) -> None:
-        if prefer_foreground:
-            while (
-                len(self._queue) >= self._max_queue_size
-                or len(self._inflight) >= self._max_inflight_entries
-            ) and self._drop_queued_background():
+    def _queued_count(self) -> int:
+        return len(self._background) + sum(len(queue) for queue in self._queues.values())
+
+    def _ensure_capacity(self, priority: ThumbnailPriority | None) -> None:
+        if priority is not None:
+            while self._over_capacity() and self._drop_queued_background():
                 pass
-        if len(self._queue) >= self._max_queue_size:
+            while self._over_capacity() and self._displace_lower_priority(priority):
+                pass
+        if self._queued_count() >= self._max_queue_size:
             raise ThumbnailBusy("thumbnail queue is full")
         if len(self._inflight) >= self._max_inflight_entries:
             raise ThumbnailBusy("thumbnail deduplication table is full")
 
+    def _over_capacity(self) -> bool:
+        return (
+            self._queued_count() >= self._max_queue_size
+            or len(self._inflight) >= self._max_inflight_entries
+        )
+
     def _drop_queued_background(self) -> bool:
-        for job in self._queue:
-            if not job.background:
-                continue
-            self._remove_queued_job(job)
-            self._release_inflight(job)
-            self._background_dropped += 1
-            logger.warning("thumbnail background work dropped for foreground admission")
-            return True
+        if not self._background:
+            return False
+        job = self._background.popleft()
+        self._release_inflight(job)
+        self._background_dropped += 1
+        logger.warning("thumbnail background work dropped for foreground admission")
+        return True
+
+    def _displace_lower_priority(self, priority: ThumbnailPriority) -> bool:
+        # The oldest entry of the lowest class below `priority` is the least likely to still be on screen.
+        for lower in reversed(THUMBNAIL_PRIORITIES[_PRIORITY_RANK[priority] + 1:]):
+            queue = self._queues[lower]
+            if queue:
+                self._fail_queued_job(queue[0], "thumbnail work displaced by higher-priority work")
+                self._displaced += 1
+                return True
         return False
 
+    def _advance_generation(self, session: Hashable, generation: int) -> bool:
+        """Record `generation` for `session`; return False when it is already stale."""
+        latest = self._generations.get(session)
+        if latest is not None:
+            self._generations.move_to_end(session)
+            if generation < latest:
+                return False
+            if generation == latest:
+                return True
+        self._generations[session] = generation
+        while len(self._generations) > MAX_TRACKED_THUMBNAIL_SESSIONS:
+            self._generations.popitem(last=False)
+        if latest is not None:
+            self._supersede_session(session, generation)
+        return True
+
+    def _supersede_session(self, session: Hashable, generation: int) -> None:
+        # Snapshot first: this pass moves and removes jobs across the queues.
+        queued = [job for priority in THUMBNAIL_PRIORITIES for job in self._queues[priority]]
+        for job in queued:
+            if job.session != session or job.generation >= generation:
+                continue
+            if job.requested == "prefetch":
+                self._fail_queued_job(job, "thumbnail work superseded by a newer client generation")
+                self._superseded += 1
+            elif job.priority != "prefetch":
+                self._move_job(job, "prefetch")
+                self._demoted += 1
+
+    def _join_job(
+        self,
+        job: _ThumbnailJob,
+        priority: ThumbnailPriority,
+        requested: ThumbnailPriority,
+        session: Hashable | None,
+        generation: int | None,
+    ) -> None:
+        if _PRIORITY_RANK[requested] < _PRIORITY_RANK[job.requested]:
+            job.requested = requested
+        if job.session != session:
+            # Shared by several clients: no single session's generation may demote it.
+            job.session = None
+        elif generation is not None:
+            job.generation = max(job.generation, generation)
+        if not job.started and _PRIORITY_RANK[priority] < _PRIORITY_RANK[job.priority]:
+            self._move_job(job, priority)
+
+    def _move_job(self, job: _ThumbnailJob, priority: ThumbnailPriority) -> None:
+        self._remove_queued_job(job)
+        job.priority = priority
+        self._queues[priority].append(job)
+
+    def _fail_queued_job(self, job: _ThumbnailJob, reason: str) -> None:
+        self._remove_queued_job(job)
+        self._release_inflight(job)
+        waiters = tuple(job.waiters)
+        job.waiters.clear()
+        error = ThumbnailBusy(reason)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(error)
+
     def cancel(self, key: Hashable, future: Future[T]) -> CancelState:
         with self._cond:
             job = self._inflight.get(key)
@@ -151,7 +292,11 @@ class ThumbnailScheduler(Generic[T]):
             return "inflight"
 
     def _remove_queued_job(self, job: _ThumbnailJob) -> None:
-        self._queue = deque(queued_job for queued_job in self._queue if queued_job is not job)
+        queue = self._background if job.background else self._queues[job.priority]
+        try:
+            queue.remove(job)
+        except ValueError:
+            pass
 
     def _release_inflight(self, job: _ThumbnailJob) -> None:
         if self._inflight.get(job.key) is job:
@@ -192,6 +337,8 @@ class ThumbnailScheduler(Generic[T]):
             if not job.background and not job.waiters:
                 self._finish_job(job)
                 continue
+            if not job.background:
+                self._observe_queue_wait(job)
             try:
                 result = job.operation()
             except Exception as exc:
@@ -200,21 +347,33 @@ class ThumbnailScheduler(Generic[T]):
                 self._finish_job(job, result=result)
 
     def _take_next_job(self) -> _ThumbnailJob | None:
-        if not self._queue:
+        for priority in THUMBNAIL_PRIORITIES:
+            queue = self._queues[priority]
+            if queue:
+                job = queue.pop()
+                job.started = True
+                return job
+        if not self._background or self._active_background:
             return None
-        if self._queue[-1].background:
-            if self._active_background:
-                return None
-            self._active_background += 1
-        job = self._queue.pop()
+        self._active_background += 1
+        job = self._background.pop()
         job.started = True
         return job
 
+    def _observe_queue_wait(self, job: _ThumbnailJob) -> None:
+        wait_ms = (time.monotonic() - job.enqueued_at) * 1000.0
+        with self._cond:
+            if wait_ms > self._max_wait_ms[job.priority]:
+                self._max_wait_ms[job.priority] = wait_ms
+        if self._on_queue_wait is not None:
+            self._on_queue_wait(job.priority, wait_ms)
+
     def stats(self) -> dict[str, int]:
         with self._cond:
             return {
                 "workers": self._max_workers,
-                "queued": len(self._queue),
+                "queued": self._queued_count(),
+                **{f"queued_{priority}": len(queue) for priority, queue in self._queues.items()},
                 "active": sum(job.started for job in self._inflight.values()),
                 "inflight": len(self._inflight),
                 "waiters": sum(len(job.waiters) for job in self._inflight.values()),
@@ -222,6 +381,10 @@ class ThumbnailScheduler(Generic[T]):
                 "inflight_capacity": self._max_inflight_entries,
                 "background_dropped": self._background_dropped,
                 "active_background": self._active_background,
+                "demoted": self._demoted,
+                "superseded": self._superseded,
+                "displaced": self._displaced,
+                **{f"max_wait_ms_{priority}": round(wait) for priority, wait in self._max_wait_ms.items()},
             }
 
     def diagnostics(self) -> dict[str, int]:
@@ -234,6 +397,17 @@ class ThumbnailScheduler(Generic[T]):
             "thumbnail_waiters": stats["waiters"],
             "thumbnail_background_dropped_total": stats["background_dropped"],
             "thumbnail_active_background_work": stats["active_background"],
+            "thumbnail_demoted_total": stats["demoted"],
+            "thumbnail_superseded_total": stats["superseded"],
+            "thumbnail_displaced_total": stats["displaced"],
+            **{
+                f"thumbnail_queued_{priority}_work": stats[f"queued_{priority}"]
+                for priority in THUMBNAIL_PRIORITIES
+            },
+            **{
+                f"thumbnail_queue_wait_{priority}_max_ms": stats[f"max_wait_ms_{priority}"]
+                for priority in THUMBNAIL_PRIORITIES
+            },
         }
 
     def close(self) -> None:
@@ -241,8 +415,10 @@ class ThumbnailScheduler(Generic[T]):
             if self._closed:
                 return
             self._closed = True
-            queued = tuple(self._queue)
-            self._queue.clear()
+            queued = (*self._background, *(job for queue in self._queues.values() for job in queue))
+            self._background.clear()
+            for queue in self._queues.values():
+                queue.clear()
             for job in queued:
                 self._release_inflight(job)
             self._cond.notify_all()
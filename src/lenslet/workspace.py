@@ -204,6 +204,36 @@ class Workspace:
             return None
         return self.root / "dimensions"
 
+    def column_store_cache_dir(self) -> Path | None:
+        if not self.can_write:
+            return None
+        override_dir = self._views_override_cache_dir("column-store")
+        if override_dir is not None:
+            return override_dir
+        if self.root is None:
+            return None
+        return self.root / "column-store"
+
+    def original_cache_dir(self) -> Path | None:
+        if not self.can_write:
+            return None
+        override_dir = self._views_override_cache_dir("originals")
+        if override_dir is not None:
+            return override_dir
+        if self.root is None:
+            return None
+        return self.root / "originals"
+
+    def preview_cache_dir(self) -> Path | None:
+        if not self.can_write:
+            return None
+        override_dir = self._views_override_cache_dir("previews")
+        if override_dir is not None:
+            return override_dir
+        if self.root is None:
+            return None
+        return self.root / "previews"
+
     def og_cache_dir(self) -> Path | None:
         if not self.can_write:
             return None
@@ -29,6 +29,12 @@ def _browse_args(**overrides: Any) -> cli_browse.BrowseCliArgs:
         "cache_dimensions": False,
         "skip_dimension_probe": True,
         "thumb_cache": True,
+        "thumb_cache_layout": "directory",
+        "thumb_cache_mb": 200,
+        "thumb_engine": "threads",
+        "thumb_memory_cache_mb": 256,
+        "original_cache_mb": 1024,
+        "analysis_workers": None,
         "og_preview": False,
         "reload": False,
         "no_write": False,
@@ -269,6 +275,55 @@ def test_local_parquet_launch_supplies_session(monkeypatch, tmp_path: Path) -> N
     assert launch_session.copy_command is None
 
 
+def test_parquet_shard_directory_and_glob_resolve_as_table_datasets(monkeypatch, tmp_path: Path) -> None:
+    shards = tmp_path / "exports" / "date=2024-01-01"
+    shards.mkdir(parents=True)
+    for index in range(2):
+        (shards / f"part-{index}.parquet").write_bytes(b"PAR1")
+    glob_target = str(tmp_path / "exports" / "*" / "*.parquet")
+    captured: dict[str, Any] = {}
+
+    def _fake_prepare_table_launch(request):
+        captured["request"] = request
+        return TableLaunchResult(
+            storage=object(),
+            effective_root=str(tmp_path),
+            default_root=str(tmp_path),
+            notices=(),
+        )
+
+    def _fake_create_app_from_storage(storage, *, options):
+        captured["options"] = options
+        return object()
+
+    monkeypatch.setattr(cli_browse, "prepare_table_launch", _fake_prepare_table_launch)
+    monkeypatch.setattr(cli_browse.server_api, "create_app_from_storage", _fake_create_app_from_storage)
+
+    directory_target = cli_browse._resolve_browse_target_or_exit(str(tmp_path / "exports"))
+    target_info = cli_browse._resolve_browse_target_or_exit(glob_target)
+
+    assert directory_target.is_parquet_dataset and directory_target.is_table_file
+    assert target_info.is_parquet_dataset and target_info.target == Path(glob_target)
+    assert cli_browse._storage_label_for_banner(target_info) == "Table index (parquet dataset)"
+
+    plan = cli_browse.BrowseLaunchPlan(
+        args=_browse_args(directory=glob_target),
+        target_info=target_info,
+        port=7070,
+        dataset_workspace=None,
+        preindex_signature=None,
+        embedding_config=EmbeddingConfig(),
+        browse_options=BrowseAppOptions(),
+        embedding_options=EmbeddingAppOptions(),
+        trusted_write_origins=(),
+    )
+    cli_browse._create_browse_app_or_exit(plan)
+
+    assert captured["request"].parquet_path == Path(glob_target)
+    assert captured["options"].workspace.views_override == tmp_path / "exports.lenslet.json"
+    assert captured["options"].embedding_table_path is None
+
+
 def test_remote_table_launch_uses_detected_source_column(monkeypatch) -> None:
     sentinel_app = object()
     rows = [{"image_url": "https://example.test/a.jpg", "path": "a.jpg"}]
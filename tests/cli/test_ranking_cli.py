@@ -50,6 +50,12 @@ def _browse_args(**overrides: Any) -> cli_browse.BrowseCliArgs:
         "cache_dimensions": False,
         "skip_dimension_probe": True,
         "thumb_cache": True,
+        "thumb_cache_layout": "directory",
+        "thumb_cache_mb": 200,
+        "thumb_engine": "threads",
+        "thumb_memory_cache_mb": 256,
+        "original_cache_mb": 1024,
+        "analysis_workers": None,
         "og_preview": True,
         "reload": False,
         "no_write": False,
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from lenslet.cli.main import main
+from lenslet.server import BrowseAppOptions, LocalAppOptions, create_app
+from lenslet.web.cache.thumb_build import build_thumbnails
+from lenslet.web.cache.thumbs import ThumbCache
+
+
+def _batch_sources(payload: bytes) -> dict[str, str | None]:
+    sources: dict[str, str | None] = {}
+    offset = 0
+    while offset < len(payload):
+        (header_length,) = struct.unpack_from(">I", payload, offset)
+        header = json.loads(payload[offset + 4:offset + 4 + header_length])
+        offset += 4 + header_length + header["size"]
+        sources[header["path"]] = header.get("source")
+    return sources
+
+
+def test_thumbs_build_warms_workspace_cache_and_resumes(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    for index in range(3):
+        Image.new("RGB", (64, 48), color=(index * 40, 40, 60)).save(tmp_path / f"img{index}.jpg", format="JPEG")
+
+    main(["thumbs", "build", str(tmp_path), "--thumb-size", "32", "--workers", "1"])
+    first = capsys.readouterr().out
+    main(["thumbs", "build", str(tmp_path), "--thumb-size", "32", "--workers", "1"])
+    second = capsys.readouterr().out
+
+    assert "3/3 items (3 generated, 0 cached, 0 failed)" in first
+    assert "3/3 items (0 generated, 3 cached, 0 failed)" in second
+    app = create_app(
+        str(tmp_path),
+        options=LocalAppOptions(browse=BrowseAppOptions(thumb_size=32)),
+    )
+    with TestClient(app) as client:
+        response = client.post("/thumbs", json={"paths": ["/img0.jpg", "/img1.jpg", "/img2.jpg"]})
+    assert _batch_sources(response.content) == {
+        "/img0.jpg": "disk",
+        "/img1.jpg": "disk",
+        "/img2.jpg": "disk",
+    }
+
+
+def test_build_thumbnails_counts_failures_and_honors_read_concurrency(tmp_path: Path) -> None:
+    class Item:
+        def __init__(self, path: str) -> None:
+            self.path = path
+
+    class Storage:
+        active = 0
+        peak = 0
+
+        @staticmethod
+        def items_in_scope(_path: str) -> list[Item]:
+            return [Item(f"/{index}.jpg") for index in range(6)] + [Item("/broken.jpg"), Item("/gone.jpg")]
+
+        @staticmethod
+        def thumbnail_cache_key(path: str) -> str | None:
+            return None if path == "/gone.jpg" else f"key:{path}"
+
+        @classmethod
+        def get_or_build_thumbnail(cls, path: str) -> bytes:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+            try:
+                if path == "/broken.jpg":
+                    raise OSError("unreadable")
+                buffer = tmp_path / "thumb.webp"
+                Image.new("RGB", (4, 4)).save(buffer, format="WEBP")
+                return buffer.read_bytes()
+            finally:
+                cls.active -= 1
+
+    cache = ThumbCache(tmp_path / "thumbs")
+    cache.set("key:/0.jpg", b"RIFF\x00\x00\x00\x00WEBP")
+
+    report = build_thumbnails(Storage(), cache, read_concurrency=1)
+
+    assert (report.total, report.generated, report.skipped, report.failed) == (8, 5, 1, 2)
+    assert Storage.peak == 1
+    assert all(cache.contains(f"key:/{index}.jpg") for index in range(6))
+
+
+def test_thumbs_build_warns_when_the_scope_outgrows_the_cache_cap(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    for index in range(3):
+        Image.new("RGB", (64, 48), color=(index * 40, 40, 60)).save(tmp_path / f"img{index}.jpg", format="JPEG")
+
+    main(["thumbs", "build", str(tmp_path), "--thumb-size", "2048", "--thumb-cache-mb", "1", "--workers", "1"])
+    capped = capsys.readouterr()
+    main(["thumbs", "build", str(tmp_path), "--thumb-size", "2048", "--thumb-cache-mb", "0", "--workers", "1"])
+    uncapped = capsys.readouterr()
+
+    assert "over the 1 MiB cache cap" in capped.err
+    assert "3/3 items" in capped.out
+    assert "cache cap" not in uncapped.err
+
+
+def test_server_thumb_cache_uses_the_configured_cap(tmp_path: Path) -> None:
+    Image.new("RGB", (8, 8)).save(tmp_path / "img.jpg", format="JPEG")
+
+    app = create_app(str(tmp_path), options=LocalAppOptions(browse=BrowseAppOptions(thumb_cache_mb=0)))
+
+    thumb_cache = app.state.lenslet_app_context.runtime.thumb_cache
+    assert isinstance(thumb_cache, ThumbCache)
+    assert thumb_cache.max_disk_bytes == 0
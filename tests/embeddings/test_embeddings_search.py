@@ -74,6 +74,7 @@ def _runtime_stub(workspace: Workspace) -> AppRuntime:
         presence_metrics=PresenceMetrics(),
         presence_prune_interval=1.0,
         thumb_queue=thumb_queue,
+        thumb_processes=None,
         thumb_cache=None,
         hotpath_metrics=type("Metrics", (), {"snapshot": lambda self, storage=None: {"counters": {}, "timers_ms": {}}})(),
         query_coordinator=Mock(spec=TableQueryCoordinator),
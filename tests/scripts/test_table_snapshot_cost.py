@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.perf import table_snapshot_cost
+
+
+def test_snapshot_benchmark_reports_each_row_count() -> None:
+    result = table_snapshot_cost.run_benchmark(row_counts=(20, 50), repetitions=3)
+
+    assert result["schema_version"] == 1
+    assert [case["row_count"] for case in result["cases"]] == [20, 50]
+    for case in result["cases"]:
+        for name in ("snapshot_unchanged_us", "snapshot_after_update_us", "full_tuple_copy_us"):
+            assert set(case[name]) == {"p50", "p95", "max"}
+            assert case[name]["p50"] >= 0
+
+
+def test_snapshot_benchmark_rejects_empty_inputs() -> None:
+    with pytest.raises(ValueError):
+        table_snapshot_cost.run_benchmark(row_counts=(), repetitions=3)
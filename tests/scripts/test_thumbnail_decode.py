@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.perf import thumbnail_decode
+
+
+def test_decode_benchmark_reports_both_modes_with_matching_output() -> None:
+    result = thumbnail_decode.run_benchmark(width=1_200, height=800, thumb_size=64, repetitions=1)
+
+    assert result["schema_version"] == 1
+    assert result["source"]["width"] == 1_200
+    full = result["cases"]["full_decode"]
+    reduced = result["cases"]["reduced_decode"]
+    assert full["thumbnail_size"] == reduced["thumbnail_size"] == [96, 64]
+    for case in (full, reduced):
+        assert case["mean_ms"] > 0
+        assert case["peak_rss_mb"] > 0
+        assert case["peak_rss_delta_mb"] >= 0
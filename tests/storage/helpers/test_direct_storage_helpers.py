@@ -127,6 +127,38 @@ def test_image_media_reads_dimensions_from_image_bytes() -> None:
     assert image_media.normalize_image_mime("application/octet-stream", "scan.png") == "image/png"
 
 
+def test_image_media_thumbnail_decodes_jpeg_at_reduced_scale(monkeypatch) -> None:
+    from PIL import JpegImagePlugin
+
+    buffer = BytesIO()
+    Image.new("RGB", (1600, 1200), color=(10, 20, 30)).save(buffer, format="JPEG")
+    drafts: list[tuple[int, int]] = []
+    original_draft = JpegImagePlugin.JpegImageFile.draft
+
+    def recording_draft(self, mode, size):
+        drafts.append(size)
+        return original_draft(self, mode, size)
+
+    monkeypatch.setattr(JpegImagePlugin.JpegImageFile, "draft", recording_draft)
+    thumb, dims = image_media.make_webp_thumbnail(buffer.getvalue(), thumb_size=128, thumb_quality=70)
+
+    assert dims == (1600, 1200)
+    assert drafts == [(170, 128)]
+    with Image.open(BytesIO(thumb)) as image:
+        assert image.size == (170, 128)
+    assert image_media.thumbnail_target_size(100, 80, 128) is None
+
+    full_thumb, full_dims = image_media.make_webp_thumbnail(
+        _png_bytes((400, 200)),
+        thumb_size=100,
+        thumb_quality=70,
+        reduce_on_decode=False,
+    )
+    assert full_dims == (400, 200)
+    with Image.open(BytesIO(full_thumb)) as image:
+        assert image.size == (200, 100)
+
+
 def test_http_safety_accepts_only_http_urls() -> None:
     assert http_safety.require_http_url("https://example.com/image.jpg") == "https://example.com/image.jpg"
     request = http_safety.http_request("http://example.com/health", method="HEAD")
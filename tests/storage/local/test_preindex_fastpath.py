@@ -73,6 +73,9 @@ def test_create_app_folder_items_parquet_uses_strict_local_validation(
         def set_source_refresh_tracker(self, tracker):
             captured["source_refresh_tracker"] = tracker
 
+        def set_source_reloader(self, reloader):
+            captured["source_reloader"] = reloader
+
         def load_index(self, path: str):
             _ = path
             return None
@@ -15,6 +15,7 @@ from lenslet.storage.search_text import (
     path_in_scope,
 )
 from lenslet.storage.table import TableStorage, TableStorageOptions, load_parquet_table
+from lenslet.storage.table.row_search import TableSearchColumns
 
 
 def _make_image(path: Path) -> None:
@@ -228,8 +229,10 @@ def test_table_search_name_cache_preserves_hits_without_materializing_misses() -
 
     assert storage.search(query="definitely-not-present") == []
     assert row_store.materialized_item_count == 0
-    assert storage._search_names_lower is not None
-    assert storage._search_sources_lower is None
+    search_columns = storage._search_columns
+    assert search_columns is not None
+    assert search_columns.is_built("names")
+    assert not search_columns.is_built("sources")
 
     assert "custom/id-0007.jpg" in _result_paths(storage.search(query="source-name-0007"))
     assert row_store.materialized_item_count == 1
@@ -338,3 +341,32 @@ def test_search_text_helpers_cover_scope_and_haystack_contract() -> None:
         "s3://bucket/cat.jpg",
         None,
     )
+
+
+def test_table_search_trigram_candidates_match_full_scan(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [
+        {
+            "path": f"gallery/set-{idx % 7}/shot-{idx:04d}.jpg",
+            "source": f"https://cdn-{idx % 3}.example.com/media/raw-{idx:04d}.jpg",
+        }
+        for idx in range(800)
+    ]
+    storage = _table_storage(rows, root=None, include_source_in_search=True, skip_dimension_probe=True)
+    _set_search_sidecar(storage, "gallery/set-3/shot-0010.jpg")
+    queries = ("shot-0123", "raw-0456", "set-3/shot-01", "night scout", "feline", "shot-9999", "jp")
+
+    indexed = {
+        (query, path): _result_paths(storage.search(query=query, path=path, limit=5))
+        for query in queries
+        for path in ("/", "/gallery/set-3")
+    }
+    monkeypatch.setattr(TableSearchColumns, "candidate_positions", lambda *_args, **_kwargs: None)
+    scanned = {
+        (query, path): _result_paths(storage.search(query=query, path=path, limit=5))
+        for query in queries
+        for path in ("/", "/gallery/set-3")
+    }
+
+    assert indexed == scanned
+    assert indexed[("night scout", "/")] == {"gallery/set-3/shot-0010.jpg"}
+    assert indexed[("raw-0456", "/")] == {"gallery/set-1/shot-0456.jpg"}
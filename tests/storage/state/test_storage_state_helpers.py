@@ -5,6 +5,7 @@ from typing import Any
 
 from PIL import Image
 
+from lenslet.storage.bounded_cache import BoundedLRUCache, dimension_cache, thumbnail_cache, thumbnail_entry_bytes
 from lenslet.storage.memory.cache import MemoryCacheInvalidationMixin
 from lenslet.storage.memory.media import MemoryMediaMixin
 from lenslet.storage.sidecar_state import SidecarStateMixin
@@ -168,3 +169,51 @@ def test_memory_media_mixin_caches_dimensions_thumbnails_and_keys(tmp_path: Path
     assert host.thumbnail_cache_key("cat.jpg").endswith("|16|70|etag")
     assert host.resolve_local_file_path("missing.jpg") is None
     assert host.guess_mime("cat.png") == "image/png"
+
+
+def test_bounded_lru_cache_evicts_least_recently_used_past_byte_budget() -> None:
+    entry = thumbnail_entry_bytes("/a.jpg", b"x" * 100)
+    cache: BoundedLRUCache[str, bytes] = thumbnail_cache(budget_bytes=entry * 2)
+    cache["/a.jpg"] = b"x" * 100
+    cache["/b.jpg"] = b"y" * 100
+
+    assert cache.get("/a.jpg") == b"x" * 100
+    cache["/c.jpg"] = b"z" * 100
+
+    assert list(cache) == ["/a.jpg", "/c.jpg"]
+    assert cache.get("/b.jpg") is None
+    cache["/huge.jpg"] = b"h" * (entry * 3)
+    assert "/huge.jpg" not in cache
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 1, 1, 2)
+    assert stats.bytes <= stats.budget_bytes
+
+    cache.set_budget(entry)
+
+    assert list(cache) == ["/c.jpg"]
+    assert cache.stats().evictions == 2
+
+
+def test_memory_cache_mixin_invalidates_bounded_caches_and_reports_counters() -> None:
+    host = _CacheHost()
+    host._thumbnails = thumbnail_cache()
+    host._dimensions = dimension_cache()
+    for key in ("/folder/a.jpg", "/folder/sub/b.jpg", "/other/c.jpg"):
+        host._thumbnails[key] = b"thumb"
+        host._dimensions[key] = (1, 2)
+
+    host.invalidate_subtree("folder")
+
+    assert list(host._thumbnails) == ["/other/c.jpg"]
+    assert list(host._dimensions) == ["/other/c.jpg"]
+    assert host._thumbnails.get("/folder/a.jpg") is None
+
+    host.set_memory_cache_budget(0, dimension_bytes=0)
+    counters = host.memory_cache_stats()
+
+    assert counters["thumbnail_memory_cache_miss_total"] == 1
+    assert counters["thumbnail_memory_cache_eviction_total"] == 1
+    assert counters["thumbnail_memory_cache_entries"] == 0
+    assert counters["dimension_memory_cache_eviction_total"] == 1
+    assert counters["dimension_memory_cache_budget_bytes"] == 0
@@ -17,8 +17,14 @@ from lenslet.server import (
     create_app_from_table,
 )
 from lenslet.storage.table import TableStorage, TableStorageOptions
-from lenslet.storage.table.launch import ParquetRowFieldProvider, TableLaunchRequest, prepare_table_launch
+from lenslet.storage.table.launch import (
+    ParquetRowFieldProvider,
+    TableLaunchRequest,
+    prepare_table_launch,
+    table_source_refresh_tracker,
+)
 from lenslet.storage.table.launch_sources import detect_source_column
+from lenslet.storage.table.parquet_dataset import resolve_parquet_dataset
 from lenslet.web.context import get_app_context
 
 LOCAL_ORIGIN = "http://localhost:7070"
@@ -872,6 +878,94 @@ def test_workspace_dimension_cache_is_namespaced_by_source_column(tmp_path: Path
     assert len(list(dimension_cache_dir.rglob("*.json"))) == 2
 
 
+def test_prepare_table_launch_reuses_workspace_column_store(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    parquet_path = tmp_path / "items.parquet"
+    _write_parquet(
+        parquet_path,
+        {
+            "source": [f"https://cdn.example.test/{index}.jpg" for index in range(6)],
+            "path": [f"gallery/item-{index}.jpg" for index in range(6)],
+            "score": [0.5, None, 2.0, float("nan"), 4.0, 1.5],
+            "split": ["train", "val", "train", None, "test", "val"],
+        },
+    )
+    column_cache_dir = tmp_path / "items.parquet.cache" / "column-store"
+
+    def _launch():
+        return prepare_table_launch(
+            TableLaunchRequest(
+                parquet_path=parquet_path,
+                base_dir=None,
+                source_column="source",
+                path_column="path",
+                cache_dimensions=False,
+                column_cache_dir=column_cache_dir,
+                skip_dimension_probe=True,
+            )
+        )
+
+    built_storage = _launch().storage
+    built = built_storage.query_engine.columns
+    assert len(list(column_cache_dir.rglob("*.arrow"))) == 2
+    assert len(list(column_cache_dir.rglob("*.rows.arrow"))) == 1
+
+    def _fail_build(*_args, **_kwargs):
+        raise AssertionError("workspace column store should avoid rebuilding columns")
+
+    def _fail_scan(*_args, **_kwargs):
+        raise AssertionError("workspace row store should avoid reading identity columns")
+
+    monkeypatch.setattr("lenslet.storage.table.storage.TableColumnStore.build", _fail_build)
+    monkeypatch.setattr("lenslet.storage.table.storage.build_table_row_store", _fail_scan)
+    monkeypatch.setattr("lenslet.storage.table.parquet_columns.ParquetColumnReader.iter_batches", _fail_scan)
+    loaded_storage = _launch().storage
+    loaded = loaded_storage.query_engine.columns
+    built_rows = built_storage._require_row_store()
+    loaded_rows = loaded_storage._require_row_store()
+
+    assert loaded_rows is not built_rows
+    assert list(loaded_rows.sources) == list(built_rows.sources)
+    assert list(loaded_rows.sorted_rows) == list(built_rows.sorted_rows)
+    assert loaded_rows.folder_children == built_rows.folder_children
+    assert loaded_storage.row_index_for_path("gallery/item-4.jpg") == 4
+    assert loaded_storage.root == built_storage.root
+    assert loaded_storage._browse_signature == built_storage._browse_signature
+
+    assert loaded.row_ids == built.row_ids
+    assert loaded.paths == built.paths
+    assert loaded.stable_identities == built.stable_identities
+    assert loaded.static_search_text == built.static_search_text
+    assert set(loaded.metrics) == set(built.metrics) == {"score"}
+    assert [loaded.metric_value(slot, "score") for slot in range(6)] == [
+        built.metric_value(slot, "score") for slot in range(6)
+    ]
+    assert set(loaded.categoricals) == {"split"}
+    assert loaded.categoricals == built.categoricals
+    assert loaded.categorical_bitmaps == built.categorical_bitmaps
+    assert loaded.slot_for_path("/gallery/item-4.jpg") == built.slot_for_path("gallery/item-4.jpg") == 4
+    assert loaded.buffer_nbytes == built.buffer_nbytes
+
+    monkeypatch.undo()
+    _write_parquet(
+        parquet_path,
+        {
+            "source": ["https://cdn.example.test/other.jpg"],
+            "path": ["gallery/other.jpg"],
+            "score": [9.0],
+            "split": ["train"],
+        },
+    )
+    rebuilt = _launch().storage.query_engine.columns
+
+    assert rebuilt.paths == ("gallery/other.jpg",)
+    assert rebuilt.metric_value(0, "score") == 9.0
+    # The snapshots of the replaced source generation are removed, not kept alongside.
+    assert len(list(column_cache_dir.rglob("*.arrow"))) == 2
+
+
 def test_prepare_table_launch_caches_extensionless_remote_dimensions(
     tmp_path: Path,
     monkeypatch,
@@ -958,3 +1052,146 @@ def test_explicit_remote_source_column_does_not_report_default_root_as_auto_dete
 
     assert all(notice.kind != "auto_detected_root" for notice in launch_result.notices)
     assert "Auto-detected local source root" not in capsys.readouterr().out
+
+
+def test_prepare_table_launch_reads_hive_partitioned_parquet_dataset(tmp_path: Path) -> None:
+    dataset = tmp_path / "exports"
+    shards = (
+        ("2024-01-01", "a", range(0, 3), {"score": pa.array([1, 2, 3], type=pa.int32())}),
+        ("2024-01-01", "b", range(3, 5), {"score": pa.array([4.5, 5.5])}),
+        ("2024-01-02", "a", range(5, 7), {}),
+    )
+    for date, model, rows, extra in shards:
+        shard_dir = dataset / f"date={date}" / f"model={model}"
+        shard_dir.mkdir(parents=True)
+        _write_parquet(shard_dir / "part-0.parquet", {
+            "source": [f"https://cdn.example.test/{index}.jpg" for index in rows],
+            "path": [f"gallery/{index}.jpg" for index in rows],
+            "caption": [f"caption {index}" for index in rows],
+            **extra,
+        })
+    (dataset / "_SUCCESS").write_text("")
+
+    def _launch(target: Path):
+        return prepare_table_launch(
+            TableLaunchRequest(
+                parquet_path=target,
+                base_dir=None,
+                source_column="source",
+                path_column="path",
+                cache_dimensions=True,
+                skip_dimension_probe=True,
+            )
+        )
+
+    result = _launch(dataset)
+    storage = result.storage
+
+    assert storage.row_index_for_path("gallery/5.jpg") == 5
+    assert storage.categorical_keys() == ["date", "model"]
+    assert storage.categoricals_for_path("gallery/5.jpg") == {"date": "2024-01-02", "model": "a"}
+    assert [notice.kind for notice in result.notices][:1] == ["dimensions_cache_unsupported"]
+    assert result.default_root == str(dataset)
+
+    provider = ParquetRowFieldProvider(
+        dataset,
+        ("caption", "score", "model"),
+        dataset=resolve_parquet_dataset(dataset),
+    )
+    assert provider(1) == {"caption": "caption 1", "score": 2.0, "model": "a"}
+    assert provider(6) == {"caption": "caption 6", "score": None, "model": "a"}
+
+    globbed = _launch(dataset / "date=2024-01-01" / "*" / "*.parquet").storage
+    assert globbed.row_index_for_path("gallery/4.jpg") == 4
+    assert globbed.row_index_for_path("gallery/5.jpg") is None
+
+
+def test_parquet_dataset_refresh_tracker_watches_each_shard(tmp_path: Path) -> None:
+    dataset = tmp_path / "shards"
+    dataset.mkdir()
+    for index in range(2):
+        _write_parquet(dataset / f"part-{index}.parquet", {"source": [f"https://cdn.example.test/{index}.jpg"]})
+
+    tracker = table_source_refresh_tracker(dataset, resolve_parquet_dataset(dataset))
+    assert tracker.poll()[0].state == "current"
+
+    _write_parquet(dataset / "part-2.parquet", {"source": ["https://cdn.example.test/2.jpg"]})
+    assert tracker.poll()[0].state == "restart-required"
+
+    (dataset / "part-2.parquet").unlink()
+    tracker = table_source_refresh_tracker(dataset, resolve_parquet_dataset(dataset))
+    _write_parquet(dataset / "part-1.parquet", {"source": ["https://cdn.example.test/changed.jpg"]})
+    assert tracker.poll()[0].state == "restart-required"
+
+
+def test_prepare_table_launch_streams_identity_columns_from_parquet_row_groups(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    import lenslet.storage.table.launch as launch
+    from lenslet.browse.query import BrowseQuerySpec, BuiltinSortSpec
+    from lenslet.storage.table.parquet_columns import ParquetColumn
+
+    row_count = 5_000
+    data = {
+        "source": [f"https://cdn.example.test/gallery/img{index:05}.jpg" for index in range(row_count)],
+        "path": [f"gallery/img{index:05}.jpg" for index in range(row_count)],
+        "name": [f"shot {index}" for index in range(row_count)],
+        "width": [8 + index % 7 for index in range(row_count)],
+        "height": [6] * row_count,
+        "caption": [f"caption {index}" for index in range(row_count)],
+        "score": [float(index % 11) for index in range(row_count)],
+    }
+    parquet_path = tmp_path / "items.parquet"
+    pq.write_table(pa.table(data), parquet_path, row_group_size=1_500)
+    loaded_columns: list[list[str] | None] = []
+    real_load = launch.load_parquet_table
+
+    def recording_load(path: str, columns: list[str] | None = None):
+        loaded_columns.append(columns)
+        return real_load(path, columns=columns)
+
+    monkeypatch.setattr(launch, "load_parquet_table", recording_load)
+    storage = prepare_table_launch(
+        TableLaunchRequest(
+            parquet_path=parquet_path,
+            base_dir=None,
+            source_column="source",
+            path_column="path",
+            cache_dimensions=False,
+            skip_dimension_probe=True,
+        )
+    ).storage
+    in_memory = TableStorage(
+        pa.table(data),
+        options=TableStorageOptions(
+            source_column="source",
+            path_column="path",
+            skip_dimension_probe=True,
+            allow_local=False,
+        ),
+    )
+
+    assert all(
+        isinstance(storage._data[column], ParquetColumn)
+        for column in ("source", "path", "name", "width", "height")
+    )
+    assert not any(
+        {"source", "path", "name", "width", "height"} & set(columns or ())
+        for columns in loaded_columns
+    )
+    spec = BrowseQuerySpec(
+        path="/gallery",
+        recursive=True,
+        offset=1_400,
+        limit=400,
+        sort=BuiltinSortSpec("name", "asc"),
+    )
+    streamed_items = storage.query_browse_scope(spec).items
+    assert [(item.path, item.name, item.width, item.height) for item in streamed_items] == [
+        (item.path, item.name, item.width, item.height)
+        for item in in_memory.query_browse_scope(spec).items
+    ]
+    assert storage.row_dimensions() == in_memory.row_dimensions()
+    assert storage.metric_keys() == in_memory.metric_keys()
+    assert storage.row_index_for_path("gallery/img04321.jpg") == 4_321
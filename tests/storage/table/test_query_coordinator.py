@@ -7,6 +7,9 @@ from typing import Any
 import pytest
 
 from lenslet.storage.table.query_coordinator import (
+    FILTER_CACHE_BUDGET_BYTES,
+    MAX_FILTER_CACHE_ENTRIES,
+    MAX_ORDER_CACHE_ENTRIES,
     MAX_QUEUED_ANALYSES,
     MAX_SESSION_ENTRIES,
     SESSION_TTL_SECONDS,
@@ -94,7 +97,7 @@ def test_queue_cache_and_session_state_are_exactly_bounded() -> None:
         contention_results = await asyncio.gather(*queued, return_exceptions=True)
         assert sum(isinstance(result, AnalysisBusy) for result in contention_results) == 8
 
-        for index in range(10):
+        for index in range(MAX_FILTER_CACHE_ENTRIES + 2):
             await coordinator.acquire(
                 "filter",
                 f"filter-{index}",
@@ -102,6 +105,7 @@ def test_queue_cache_and_session_state_are_exactly_bounded() -> None:
                 client_session="cache-session",
                 query_revision=1,
             )
+        for index in range(MAX_ORDER_CACHE_ENTRIES + 2):
             await coordinator.acquire(
                 "order",
                 f"order-{index}",
@@ -110,13 +114,13 @@ def test_queue_cache_and_session_state_are_exactly_bounded() -> None:
                 query_revision=1,
             )
         diagnostics = coordinator.diagnostics()
-        assert diagnostics["analysis_filter_cache_entries"] == 8
-        assert diagnostics["analysis_order_cache_entries"] == 8
+        assert diagnostics["analysis_filter_cache_entries"] == MAX_FILTER_CACHE_ENTRIES
+        assert diagnostics["analysis_order_cache_entries"] == MAX_ORDER_CACHE_ENTRIES
 
         for index in range(MAX_SESSION_ENTRIES + 20):
             await coordinator.acquire(
                 "filter",
-                "filter-9",
+                f"filter-{MAX_FILTER_CACHE_ENTRIES + 1}",
                 lambda _cancel: 9,
                 client_session=f"hostile-{index}",
                 query_revision=1,
@@ -125,7 +129,7 @@ def test_queue_cache_and_session_state_are_exactly_bounded() -> None:
         clock[0] = SESSION_TTL_SECONDS + 1
         await coordinator.acquire(
             "filter",
-            "filter-9",
+            f"filter-{MAX_FILTER_CACHE_ENTRIES + 1}",
             lambda _cancel: 9,
             client_session="after-ttl",
             query_revision=1,
@@ -309,3 +313,99 @@ def test_admitted_sessions_are_scheduled_round_robin() -> None:
         await coordinator.close()
 
     asyncio.run(scenario())
+
+
+def test_parallel_workers_run_sessions_concurrently_in_round_robin_order() -> None:
+    async def scenario() -> None:
+        release = threading.Event()
+        barrier = threading.Barrier(2, timeout=2)
+        order: list[str] = []
+
+        def gate(_cancel) -> None:
+            barrier.wait()
+            assert release.wait(timeout=2)
+
+        def record(value: str):
+            def operation(_cancel) -> str:
+                order.append(value)
+                return value
+
+            return operation
+
+        coordinator = TableQueryCoordinator(max_workers=2)
+        gates = [
+            asyncio.create_task(coordinator.acquire(
+                "request",
+                f"gate-{session}",
+                gate,
+                client_session=session,
+                query_revision=1,
+            ))
+            for session in ("gate-a", "gate-b")
+        ]
+        while coordinator.diagnostics()["analysis_active_work"] < 2:
+            await asyncio.sleep(0.001)
+        tasks = [
+            asyncio.create_task(coordinator.acquire(
+                "request",
+                key,
+                record(key),
+                client_session=session,
+                query_revision=1,
+            ))
+            for key, session in (("a1", "a"), ("a2", "a"), ("a3", "a"), ("b1", "b"))
+        ]
+        await asyncio.sleep(0)
+        diagnostics = coordinator.diagnostics()
+        assert diagnostics["analysis_workers"] == 2
+        assert diagnostics["analysis_queued_work"] == 4
+        release.set()
+        await asyncio.gather(*gates)
+        await asyncio.gather(*tasks)
+
+        assert order.index("b1") < order.index("a3")
+        assert coordinator.diagnostics()["analysis_active_work"] == 0
+        await coordinator.close()
+
+    asyncio.run(scenario())
+
+
+def test_filter_cache_evicts_oldest_entries_over_the_byte_budget() -> None:
+    class Sized:
+        def __init__(self, nbytes: int) -> None:
+            self.nbytes = nbytes
+
+    async def scenario() -> None:
+        coordinator = TableQueryCoordinator()
+        chunk = FILTER_CACHE_BUDGET_BYTES // 3
+        for index in range(4):
+            await coordinator.acquire(
+                "filter",
+                f"sized-{index}",
+                lambda _cancel: Sized(chunk),
+                client_session="budget-session",
+                query_revision=1,
+            )
+        diagnostics = coordinator.diagnostics()
+        assert diagnostics["analysis_filter_cache_entries"] == 3
+        assert diagnostics["analysis_filter_cache_bytes"] == 3 * chunk
+        first = await coordinator.acquire(
+            "filter",
+            "sized-0",
+            lambda _cancel: Sized(0),
+            client_session="budget-session",
+            query_revision=1,
+        )
+        assert not first.cached
+
+        await coordinator.acquire(
+            "filter",
+            "huge",
+            lambda _cancel: Sized(2 * FILTER_CACHE_BUDGET_BYTES),
+            client_session="budget-session",
+            query_revision=1,
+        )
+        assert coordinator.diagnostics()["analysis_filter_cache_entries"] == 1
+        await coordinator.close()
+
+    asyncio.run(scenario())
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import replace
 from datetime import datetime, timezone
 import math
 import random
+import sys
 
 import lenslet.storage.table.query_engine as query_engine_module
+import lenslet.storage.table.query_vectorized as query_vectorized_module
+import lenslet.storage.table.text_index as text_index_module
 import pytest
 
 from lenslet.browse.query import (
@@ -22,10 +26,13 @@ from lenslet.browse.query import (
     MetricRangeFilter,
     MetricSortSpec,
     NameContainsFilter,
+    NameNotContainsFilter,
     NotesContainsFilter,
     NotesNotContainsFilter,
     StarsInFilter,
+    StarsNotInFilter,
     UrlContainsFilter,
+    UrlNotContainsFilter,
     WidthCompareFilter,
     derived_metric_key,
     evaluate_browse_records,
@@ -35,6 +42,7 @@ from lenslet.metrics import normalize_metric_mapping
 from lenslet.storage.search_text import build_search_haystack, sidecar_source_fields
 from lenslet.storage.source.paths import normalize_item_path
 from lenslet.storage.table import TableStorage, TableStorageOptions
+from lenslet.storage.table.histograms import histogram_summary
 from lenslet.storage.table.query_engine import (
     TableQueryCancelled,
     TableQueryEngine,
@@ -287,6 +295,16 @@ def test_malformed_date_filter_bounds_match_no_table_rows() -> None:
     assert analysis.row_ids == ()
 
 
+def test_filter_analysis_size_counts_boxed_row_ids() -> None:
+    storage = _storage(_parity_rows(600))
+    spec = BrowseQuerySpec("/gallery", True, 0, 8, BrowseFilterAst(()))
+
+    analysis = storage.query_engine.analyze_filter(_scope_rows(storage), spec)
+
+    assert len(analysis.row_ids) == 600
+    assert analysis.nbytes >= sys.getsizeof(analysis.row_ids) + sum(map(sys.getsizeof, analysis.row_ids))
+
+
 def test_descending_table_order_handles_identity_prefix_unicode_and_missing_dates() -> None:
     storage = _storage(
         [
@@ -623,6 +641,437 @@ def test_filter_cancellation_checks_row_and_time_bounds() -> None:
     assert calls == 2
 
 
+def test_chunked_column_views_are_shared_until_a_chunk_is_written() -> None:
+    column = query_engine_module._ChunkedColumn.filled(None, 10_000)
+    first = column.view()
+
+    assert column.view() is first
+    column[9_999] = 4
+    second = column.view()
+
+    assert second is not first
+    assert first[9_999] is None and second[9_999] == 4
+    assert second._chunks[0] is first._chunks[0]
+    assert second._chunks[-1] is not first._chunks[-1]
+    assert len(second) == 10_000 and list(second)[-2:] == [None, 4]
+    with pytest.raises(IndexError):
+        second[10_000]
+
+
+def test_mutable_snapshots_are_reused_and_isolated_from_later_updates() -> None:
+    storage = _storage(_parity_rows(10), categorical_keys=("category",))
+    engine = storage.query_engine
+    rows = _scope_rows(storage)
+    spec = BrowseQuerySpec(
+        "/gallery",
+        True,
+        0,
+        10,
+        filters=BrowseFilterAst((StarsInFilter((5,)),)),
+    )
+    before = engine.analyze_filter(rows, spec)
+    again = engine.analyze_filter(rows, spec)
+    assert again._mutable.stars is before._mutable.stars
+    assert again._mutable.search_text is before._mutable.search_text
+
+    path = "/gallery/batch-0/image-000.jpg"
+    sidecar = storage.ensure_sidecar(path)
+    sidecar["star"] = 5
+    storage.set_sidecar(path, sidecar)
+    after = engine.analyze_filter(rows, spec)
+
+    assert after.row_ids == (0,)
+    assert before._mutable.stars[0] is None
+    assert after._mutable.stars[0] == 5
+    assert after._mutable.notes is before._mutable.notes
+    assert engine.project_sidecar(before, 0)["star"] is None
+
+
+def _differential_rows(count: int) -> list[dict[str, object]]:
+    rng = random.Random(20261017)
+    names = ("Item", "İstanbul", "ÉCLAIR", "plain", "straße", "")
+    rows: list[dict[str, object]] = []
+    for index in range(count):
+        rows.append({
+            "source": rng.choice((
+                f"https://Bucket-{index % 3}.example.test/assets/{index}.jpg",
+                f"s3://ARCHIVE/İmages/{index}.png",
+                None,
+            )),
+            "url": rng.choice((None, f"https://cdn.example.test/{index}.jpg")),
+            "path": f"gallery/batch-{index % 4}/image-{index:04}.jpg",
+            "name": f"{rng.choice(names)} {index % 13:02}.jpg",
+            "width": rng.choice((0, -5, None, 64 + index % 300)),
+            "height": rng.choice((0, None, 48 + index % 250)),
+            "mtime": rng.choice((0.0, -1.0, 1_700_000_000.0 + index * 3_600)),
+            "q1": rng.choice((math.nan, None, math.inf, float(index % 10))),
+            "q2": rng.uniform(-5.0, 5.0),
+            "category": rng.choice((None, "", "group-0", "group-1", "Group-1")),
+        })
+    return rows
+
+
+def _differential_specs(rng: random.Random) -> list[BrowseQuerySpec]:
+    clauses = [
+        StarsInFilter((0,)),
+        StarsInFilter((3, 5)),
+        StarsNotInFilter((0, 1)),
+        NameContainsFilter("İ"),
+        NameContainsFilter("i̇stan"),
+        NameContainsFilter("item 0"),
+        NameNotContainsFilter("straSSe"),
+        NameContainsFilter(""),
+        NotesContainsFilter("blue"),
+        NotesNotContainsFilter("blue"),
+        UrlContainsFilter("bucket-1"),
+        UrlContainsFilter("i̇mages"),
+        UrlNotContainsFilter("cdn"),
+        DateRangeFilter("2023-11-15", "2023-11-30"),
+        DateRangeFilter(None, "2023-11-20"),
+        DateRangeFilter("not-a-date", None),
+        WidthCompareFilter(">=", 200),
+        WidthCompareFilter("<", 120),
+        HeightCompareFilter(">", 100),
+        HeightCompareFilter("<=", 60),
+        MetricRangeFilter("q1", 2.0, 8.0),
+        MetricRangeFilter("q2", -1.0, 2.5),
+        MetricRangeFilter("dynamic", 0.0, 0.5),
+        MetricRangeFilter("missing", 0.0, 1.0),
+        CategoricalInFilter("category", ("group-1", "")),
+        CategoricalInFilter("category", ("",)),
+        CategoricalInFilter("unknown", ("group-0",)),
+    ]
+    texts = (None, None, "tag-needle", "bucket-0", "İSTANBUL", "archive")
+    specs = [
+        BrowseQuerySpec("/gallery", True, 0, 100, BrowseFilterAst((clause,)))
+        for clause in clauses
+    ]
+    for _index in range(40):
+        chosen = tuple(rng.sample(clauses, rng.randint(0, 3)))
+        specs.append(BrowseQuerySpec(
+            "/gallery",
+            True,
+            0,
+            100,
+            BrowseFilterAst(chosen),
+            text_query=rng.choice(texts),
+        ))
+    return specs
+
+
+def test_vectorized_filter_execution_matches_row_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(query_vectorized_module, "VECTORIZED_CHUNK_ROWS", 97)
+    monkeypatch.setattr(text_index_module, "TRIGRAM_CHUNK_ROWS", 128)
+    storage = _storage(_differential_rows(700), categorical_keys=("category",))
+    columns = storage.query_engine.columns
+    rng = random.Random(7)
+    sidecars: dict[str, dict[str, object]] = {}
+    for slot in rng.sample(range(len(columns.row_ids)), 120):
+        sidecars[columns.paths[slot]] = {
+            "star": rng.choice((None, 0, 1, 3, 5)),
+            "notes": rng.choice(("", "Blue target", "ordinary")),
+            "tags": rng.choice(([], ["tag-needle"])),
+            "metrics": rng.choice(({}, {"dynamic": rng.random()}, {"q1": 5.0})),
+        }
+    engines = {
+        mode: TableQueryEngine(columns, sidecars=sidecars, filter_execution=mode)
+        for mode in ("rows", "vectorized")
+    }
+    for slot in rng.sample(range(len(columns.row_ids)), 30):
+        dimensions = (rng.randint(0, 400), rng.randint(0, 400))
+        for engine in engines.values():
+            engine.update_dimensions(columns.paths[slot], dimensions)
+    rows = tuple(reversed(_scope_rows(storage)))
+
+    for spec in _differential_specs(rng):
+        expected = engines["rows"].analyze_filter(rows, spec)
+        actual = engines["vectorized"].analyze_filter(rows, spec)
+        assert actual.row_ids == expected.row_ids, spec
+        assert actual.key == expected.key
+
+    for engine in engines.values():
+        engine.replace_sidecars({})
+    cleared = BrowseQuerySpec("/gallery", True, 0, 100, BrowseFilterAst((StarsInFilter((0,)),)))
+    assert (
+        engines["vectorized"].analyze_filter(rows, cleared).row_ids
+        == engines["rows"].analyze_filter(rows, cleared).row_ids
+        == rows
+    )
+
+
+def test_star_bitmaps_track_updates_and_categorical_counts_match_rows() -> None:
+    storage = _storage(_differential_rows(600), categorical_keys=("category",))
+    columns = storage.query_engine.columns
+    engines = {
+        mode: TableQueryEngine(columns, filter_execution=mode)
+        for mode in ("rows", "vectorized")
+    }
+    assert set(columns.categorical_bitmaps["category"]) == {"group-0", "group-1", "Group-1"}
+    rng = random.Random(3)
+    specs = [
+        BrowseQuerySpec("/gallery", True, 0, 100, BrowseFilterAst((clause,)))
+        for clause in (
+            StarsInFilter((0,)),
+            StarsInFilter((2, 5)),
+            StarsNotInFilter((0, 5)),
+            CategoricalInFilter("category", ("group-1", "Group-1", "")),
+        )
+    ]
+    rows = _scope_rows(storage)
+    for _round in range(4):
+        for slot in rng.sample(range(len(columns.row_ids)), 40):
+            sidecar = {"star": rng.choice((None, 0, 2, 5, 9))}
+            for engine in engines.values():
+                engine.update_sidecar(columns.paths[slot], sidecar)
+        for spec in specs:
+            expected = engines["rows"].analyze_filter(rows, spec)
+            actual = engines["vectorized"].analyze_filter(rows, spec)
+            assert actual.row_ids == expected.row_ids, spec
+
+    engine = engines["vectorized"]
+    for spec in (BrowseQuerySpec("/gallery", True, 0, 100), *specs):
+        analysis = engine.analyze_filter(rows, spec)
+        assert engine.categorical_counts(analysis, "category") == Counter(
+            engine.iter_categorical_values(analysis, "category")
+        )
+    assert engine.categorical_counts(analysis, "unknown") == Counter()
+
+
+@pytest.mark.parametrize("mode", ["rows", "vectorized"])
+def test_narrowing_queries_refine_cached_parents_with_identical_results(mode: str) -> None:
+    storage = _storage(_differential_rows(600), categorical_keys=("category",))
+    columns = storage.query_engine.columns
+    engine = TableQueryEngine(columns, filter_execution=mode)
+    rows = _scope_rows(storage)
+    spans = [
+        BrowseFilterAst((MetricRangeFilter("q2", -4.0, 4.0),)),
+        BrowseFilterAst((MetricRangeFilter("q2", -3.0, 2.5),)),
+        BrowseFilterAst((MetricRangeFilter("q2", -2.0, 2.0), StarsInFilter((0, 3)))),
+        BrowseFilterAst((MetricRangeFilter("q2", -2.0, 1.0), StarsInFilter((3,)))),
+    ]
+    specs = [
+        BrowseQuerySpec("/gallery", True, 0, 100, filters)
+        for filters in spans
+    ] + [
+        BrowseQuerySpec("/gallery", True, 0, 100, text_query=text)
+        for text in ("i", "im", "image-0", "image-01")
+    ]
+    rng = random.Random(9)
+    for round_index in range(3):
+        for spec in specs:
+            expected = TableQueryEngine(columns, filter_execution=mode)
+            for slot in range(len(columns.row_ids)):
+                sidecar = storage.get_sidecar_readonly(columns.paths[slot])
+                if sidecar:
+                    expected.update_sidecar(columns.paths[slot], sidecar)
+            assert engine.analyze_filter(rows, spec).row_ids == expected.analyze_filter(rows, spec).row_ids
+        if round_index < 2:
+            for slot in rng.sample(range(len(columns.row_ids)), 30):
+                sidecar = {"star": rng.choice((None, 3, 5))}
+                storage.set_sidecar(columns.paths[slot], sidecar)
+                engine.update_sidecar(columns.paths[slot], sidecar)
+
+    narrowed = specs[1]
+    assert engine._refinements.parent_for(
+        (normalize_item_path(narrowed.path), True, len(rows)),
+        narrowed.filters,
+        None,
+        lambda spec, stamp: engine._mutable.dependency_stamp(spec) == stamp,
+    ) is not None
+    widened = BrowseQuerySpec(
+        "/gallery", True, 0, 100, BrowseFilterAst((MetricRangeFilter("q2", -5.0, 5.0),)),
+    )
+    assert engine._refinements.parent_for(
+        (normalize_item_path(widened.path), True, len(rows)),
+        widened.filters,
+        None,
+        lambda spec, stamp: engine._mutable.dependency_stamp(spec) == stamp,
+    ) is None
+
+
+def test_vectorized_metric_histograms_match_row_values() -> None:
+    storage = _storage(_differential_rows(600), categorical_keys=("category",))
+    engine = TableQueryEngine(storage.query_engine.columns, filter_execution="vectorized")
+    columns = engine.columns
+    rng = random.Random(5)
+    for slot in rng.sample(range(len(columns.row_ids)), 60):
+        metrics = rng.choice(({"q1": rng.uniform(-20.0, 20.0)}, {"dynamic": rng.random()}))
+        engine.update_sidecar(columns.paths[slot], {"metrics": metrics})
+    derived = DerivedMetricSpec(
+        "blend",
+        "Blend",
+        1.0,
+        (DerivedMetricNumericTerm("q2", 2.0, "zero", True),),
+    )
+    derived_key = derived_metric_key(derived)
+    specs = [
+        BrowseQuerySpec("/gallery", True, 0, 100),
+        BrowseQuerySpec("/gallery", True, 0, 100, BrowseFilterAst((MetricRangeFilter("q2", -1.0, 3.0),))),
+        BrowseQuerySpec(
+            "/gallery",
+            True,
+            0,
+            100,
+            BrowseFilterAst((MetricRangeFilter(derived_key, -1.0, 1.0),)),
+            derived_metric=derived,
+        ),
+    ]
+    keys = ["q1", "q2", "dynamic", "missing", derived_key]
+    rows = _scope_rows(storage)
+    for spec in specs:
+        analysis = engine.analyze_filter(rows, spec)
+        for bins in (1, 7, 40):
+            histograms = engine.metric_histograms(analysis, keys, bins)
+            for key in keys:
+                expected = histogram_summary(list(engine.iter_metric_values(analysis, key)), bins)
+                assert histograms[key] == expected, (spec, key, bins)
+            assert engine.metric_histograms(analysis, keys, bins) == histograms
+
+    static = engine.column_histograms(rows, ["q1", "q2", "missing"], 12)
+    for key in ("q1", "q2", "missing"):
+        values = [
+            value
+            for row_id in rows
+            if (value := columns.metric_value(columns.slot_for_row(row_id), key)) is not None
+        ]
+        assert static[key] == histogram_summary(values, 12)
+
+
+def test_metric_histograms_follow_sidecar_metric_edits() -> None:
+    storage = _storage(_parity_rows(40))
+    engine = storage.query_engine
+    spec = BrowseQuerySpec("/gallery", True, 0, 40)
+    path = "/gallery/batch-1/image-001.jpg"
+
+    before = engine.metric_histograms(engine.analyze_filter(_scope_rows(storage), spec), ["q1"], 8)["q1"]
+    storage.set_sidecar(path, {"metrics": {"q1": 1e6}})
+    analysis = engine.analyze_filter(_scope_rows(storage), spec)
+    after = engine.metric_histograms(analysis, ["q1"], 8)["q1"]
+
+    assert before is not None and after is not None
+    assert after != before
+    assert after == histogram_summary(list(engine.iter_metric_values(analysis, "q1")), 8)
+    assert 1e6 in engine.iter_metric_values(analysis, "q1")
+
+
+def test_ranked_ordering_matches_row_sort_keys() -> None:
+    rows = _differential_rows(500)
+    for index, row in enumerate(rows[:60]):
+        row["name"] = ("item 1", "item 10", "item", "Item 1", "ite")[index % 5]
+        row["path"] = f"gallery/prefix/{'a' * (index % 4 + 1)}-{index}.jpg"
+    storage = _storage(rows, categorical_keys=("category",))
+    engine = storage.query_engine
+    rng = random.Random(11)
+    for slot in rng.sample(range(len(engine.columns.row_ids)), 80):
+        sidecar = storage.ensure_sidecar(engine.columns.paths[slot])
+        sidecar["metrics"] = rng.choice(({"q1": rng.uniform(-2.0, 12.0)}, {"dynamic": rng.random()}))
+        storage.set_sidecar(engine.columns.paths[slot], sidecar)
+    sorts = [
+        BuiltinSortSpec(key, direction)
+        for key in ("name", "added", "random")
+        for direction in ("asc", "desc")
+    ] + [
+        MetricSortSpec(key, direction)
+        for key in ("q1", "q2", "dynamic", "missing")
+        for direction in ("asc", "desc")
+    ]
+    specs = [
+        BrowseQuerySpec("/gallery", True, 0, 500),
+        BrowseQuerySpec("/gallery", True, 0, 500, BrowseFilterAst((NameContainsFilter("item"),))),
+        BrowseQuerySpec("/gallery", True, 0, 500, BrowseFilterAst((MetricRangeFilter("q1", 2.0, 9.0),))),
+    ]
+
+    for spec in specs:
+        analysis = engine.analyze_filter(_scope_rows(storage), spec)
+        for sort in sorts:
+            ranked = engine.order(analysis, sort, random_seed="seed-a")
+            expected = engine._sorted_rows(analysis, sort, "seed-a")
+            assert list(ranked.ordered_row_ids) == expected, sort
+
+
+def test_ordering_falls_back_to_row_sort_when_ranks_are_unavailable() -> None:
+    storage = _storage(_parity_rows(12))
+    engine = storage.query_engine
+    analysis = engine.analyze_filter(_scope_rows(storage), BrowseQuerySpec("/gallery", True, 0, 12))
+    engine._sort_ranks._cache[("name", "asc")] = None
+
+    ordered = engine.order(analysis, BuiltinSortSpec("name", "asc"))
+
+    assert list(ordered.ordered_row_ids) == engine._sorted_rows(
+        analysis,
+        BuiltinSortSpec("name", "asc"),
+        "",
+    )
+
+
+def test_windowed_ordering_selects_pages_lazily_and_matches_full_order() -> None:
+    storage = _storage(_differential_rows(3000), categorical_keys=("category",))
+    engine = storage.query_engine
+    analysis = engine.analyze_filter(
+        _scope_rows(storage),
+        BrowseQuerySpec("/gallery", True, 0, 3000),
+    )
+    for sort in (
+        BuiltinSortSpec("name", "desc"),
+        BuiltinSortSpec("random", "asc"),
+        MetricSortSpec("q1", "asc"),
+    ):
+        expected = engine._sorted_rows(analysis, sort, "seed-a")
+        ordered = engine.order(analysis, sort, random_seed="seed-a", window_end=50)
+        assert ordered.total == len(expected)
+        assert ordered._order.selected < len(expected)
+
+        pages = [ordered.window(start, start + 100) for start in range(0, 600, 100)]
+        assert [row_id for page in pages for row_id in page] == expected[:600], sort
+        assert ordered._order.selected < len(expected)
+
+        assert ordered.index_of(expected[-1]) == len(expected) - 1
+        assert ordered._order.selected == len(expected)
+        assert ordered.window(len(expected) - 50, 3100) == tuple(expected[-50:])
+        assert list(ordered.ordered_row_ids) == expected
+
+    ordered = engine.order(analysis, BuiltinSortSpec("name", "asc"), window_end=50)
+    expected = engine._sorted_rows(analysis, BuiltinSortSpec("name", "asc"), "")
+    assert ordered.index_of(expected[300]) == 300
+    # The anchor search stops once the anchor is placed instead of sorting the whole table.
+    assert 300 < ordered._order.selected < len(expected)
+    assert ordered.index_of(-1) is None
+    assert ordered._order.selected < len(expected)
+
+    empty = engine.analyze_filter(
+        _scope_rows(storage),
+        BrowseQuerySpec("/gallery", True, 0, 10, BrowseFilterAst((NameContainsFilter("absent"),))),
+    )
+    ordered = engine.order(empty, BuiltinSortSpec("name", "asc"), window_end=10)
+    assert ordered.total == 0
+    assert ordered.window(0, 10) == ()
+    assert ordered.index_of(0) is None
+
+
+def test_vectorized_filter_checks_cancellation_per_chunk_and_rejects_unknown_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(query_vectorized_module, "VECTORIZED_CHUNK_ROWS", 100)
+    storage = _storage(_parity_rows(600), categorical_keys=("category",))
+    engine = TableQueryEngine(storage.query_engine.columns, filter_execution="vectorized")
+    spec = BrowseQuerySpec("/gallery", True, 0, 600)
+    calls = 0
+
+    def cancel_at_third_chunk() -> bool:
+        nonlocal calls
+        calls += 1
+        return calls >= 4
+
+    with pytest.raises(TableQueryCancelled):
+        engine.analyze_filter(_scope_rows(storage), spec, cancel_at_third_chunk)
+    assert calls == 4
+
+    with pytest.raises(KeyError, match="unknown table row ID: 9999"):
+        engine.analyze_filter((0, 9999), spec)
+    with pytest.raises(KeyError, match="unknown table row ID: -1"):
+        engine.analyze_filter((-1,), spec)
+
+
 @pytest.mark.parametrize(
     "derived",
     [
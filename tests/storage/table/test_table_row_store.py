@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
+import pyarrow as pa
 from PIL import Image
 
 from lenslet.storage.image_media import read_dimensions_from_bytes
@@ -15,6 +17,7 @@ from lenslet.storage.table.index import (
     TableSourceResolver,
     build_index_columns,
 )
+from lenslet.storage.table import row_scan
 from lenslet.storage.table.row_store import TableRowSourceAdapter, build_table_row_store
 
 
@@ -197,8 +200,174 @@ def test_row_store_allocates_slot_map_only_when_rows_are_skipped() -> None:
     result = build_table_row_store(context, build_index_columns(context))
     store = result.store
 
-    assert store.row_to_slot == [-1, 0]
+    assert store.row_to_slot is not None
+    assert list(store.row_to_slot) == [-1, 0]
     assert store.path_for_row_index(0) is None
     assert store.path_for_row_index(1) == "animals/cat.jpg"
     assert store.row_index_for_path("animals/cat.jpg") == 1
     assert store.materialize_item(1).name == "cat.jpg"
+
+
+def test_row_scan_over_arrow_batches_matches_python_lists() -> None:
+    values = {
+        "source": [f"/data/{index % 3}.jpg" if index != 4 else None for index in range(10)],
+        "path": [f"animals/{index % 3}.jpg" for index in range(10)],
+        "width": [index + 1 for index in range(10)],
+        "height": [index + 2 for index in range(10)],
+        "mtime": [1_700_000_000.0 + index for index in range(10)],
+    }
+    arrow_values = {
+        key: pa.chunked_array([column[:6], column[6:]])
+        for key, column in values.items()
+    }
+    context = _context(values)
+    arrow_context = _context(arrow_values)
+    arrow_columns = build_index_columns(arrow_context)
+
+    batches = list(arrow_columns.batches(10, batch_rows=3))
+    assert [batch.start for batch in batches] == [0, 3, 6, 9]
+    assert [value for batch in batches for value in batch.path_values] == values["path"]
+
+    expected = build_table_row_store(context, build_index_columns(context)).store
+    store = build_table_row_store(arrow_context, arrow_columns).store
+
+    assert store.paths == expected.paths
+    assert store.paths[:4] == ("animals/0.jpg", "animals/1.jpg", "animals/2.jpg", "animals/0-2.jpg")
+    assert store.row_to_path == expected.row_to_path
+    assert store.widths == expected.widths
+    assert store.mtimes == expected.mtimes
+
+
+def test_row_store_columns_are_compact_and_write_dimensions_through() -> None:
+    row_count = 2_000
+    values = {
+        "source": [f"https://cdn.example.com/set{index % 20}/img_{index}.jpg" for index in range(row_count)],
+        "width": [0] * row_count,
+        "height": [0] * row_count,
+    }
+    context = _context(values, path_column=None)
+
+    store = build_table_row_store(context, build_index_columns(context)).store
+
+    assert store.nbytes < row_count * 100
+    assert store.paths[7] == "cdn.example.com/set7/img_7.jpg"
+    assert store.sources[-1] == values["source"][-1]
+    assert store.url_for_row(3) == values["source"][3]
+    assert store.row_index_for_path("cdn.example.com/set7/img_1227.jpg") == 1227
+    assert store.row_index_for_path("cdn.example.com/set7/missing.jpg") is None
+    assert list(store.sorted_paths) == sorted(store.paths)
+    assert store.direct_rows("cdn.example.com/set3")[:2] == (3, 23)
+
+    store.update_dimensions("cdn.example.com/set3/img_23.jpg", (40, 30))
+
+    assert store.row_dimensions[23] == (40, 30)
+    assert store.dimensions_for_row(23) == (40, 30)
+
+
+def test_row_store_source_and_name_columns_fall_back_when_they_do_not_alias_the_path() -> None:
+    from lenslet.storage.table.row_columns import BasenameDefaultColumn, FolderPathColumn, PrefixedPathColumn
+
+    paths = FolderPathColumn()
+    sources = PrefixedPathColumn(paths)
+    names = BasenameDefaultColumn(paths)
+    rows = [
+        ("set/a.jpg", "https://cdn.example.com/set/a.jpg", "a.jpg"),
+        ("set/a-2.jpg", "https://cdn.example.com/set/a.jpg", "cover"),
+        ("b.jpg", "/data/images/other.jpg", ""),
+        ("c.jpg", "relative.jpg", "c.jpg"),
+    ]
+    for path, source, name in rows:
+        paths.append(path)
+        sources.append(source, path)
+        names.append(name)
+
+    assert list(sources) == [source for _path, source, _name in rows]
+    assert list(names) == [name for _path, _source, name in rows]
+    assert sources.nbytes < FolderPathColumn.from_values(source for _path, source, _name in rows).nbytes
+
+
+def test_parallel_row_scan_matches_serial_dedupe_and_skip_counts(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(row_scan, "SCAN_CHUNK_ROWS", 4)
+    for index in range(0, 30, 3):
+        _make_image(tmp_path / "img" / f"{index}.jpg", size=(10 + index, 5))
+    values = {
+        "source": [f"img/{index}.jpg" if index != 13 else None for index in range(30)],
+        "path": [f"dup/{index % 4}.jpg" for index in range(30)],
+        "width": [0] * 30,
+        "height": [0] * 30,
+    }
+    context = _context(values, root=str(tmp_path), skip_dimension_probe=False)
+    serial_context = replace(context, policy=replace(context.policy, skip_local_realpath_validation=False))
+    parallel_context = replace(serial_context, policy=replace(serial_context.policy, scan_workers=4))
+
+    serial = build_table_row_store(serial_context, build_index_columns(serial_context))
+    parallel = build_table_row_store(parallel_context, build_index_columns(parallel_context))
+
+    assert serial.skipped_local_missing == 19
+    assert parallel.skipped_local_missing == serial.skipped_local_missing
+    assert list(parallel.store.row_indices) == list(serial.store.row_indices) == list(range(0, 30, 3))
+    assert parallel.store.paths == serial.store.paths
+    assert parallel.store.paths[:3] == ("dup/0.jpg", "dup/3.jpg", "dup/2-2.jpg")
+    assert parallel.store.row_to_path == serial.store.row_to_path
+    assert list(parallel.store.widths) == list(serial.store.widths) == list(range(10, 40, 3))
+
+
+def test_persisted_row_store_round_trips_and_resumes_pending_dimension_probes(tmp_path: Path) -> None:
+    from lenslet.storage.table.column_cache import TableRowStoreSnapshot, load_row_store, write_row_store
+    from lenslet.storage.table.index_types import TableCachedRowDimensions
+    from lenslet.storage.table.row_store import resume_table_row_store
+
+    values = {
+        "source": [
+            "https://cdn.example.com/set/a.jpg",
+            None,
+            "https://cdn.example.com/set/b.jpg",
+            "s3://bucket/other/c.jpg",
+        ],
+        "path": ["set/a.jpg", None, "set/b.jpg", "other/c.jpg"],
+        "name": ["a.jpg", None, "", "cover"],
+        "width": [10, 0, 0, 0],
+        "height": [5, 0, 0, 0],
+    }
+    context = _context(values, skip_dimension_probe=False)
+    store = build_table_row_store(context, build_index_columns(context)).store
+    identity = {"source_generation": "items.parquet:1"}
+    snapshot = TableRowStoreSnapshot(
+        store=store,
+        root=None,
+        source_column="source",
+        row_count=4,
+        allow_local=True,
+        skip_dimension_probe=False,
+        source_kind="mixed",
+        s3_prefixes={"bucket": ""},
+        skipped_local=(0, 0, 0, 1),
+    )
+
+    assert write_row_store(tmp_path, identity, snapshot)
+    assert load_row_store(tmp_path, {"source_generation": "items.parquet:2"}) is None
+    loaded = load_row_store(tmp_path, identity)
+    assert loaded is not None
+    restored = loaded.store
+
+    assert (loaded.s3_prefixes, loaded.skipped_local) == ({"bucket": ""}, (0, 0, 0, 1))
+    for column in ("row_indices", "paths", "sources", "names", "mimes", "urls", "sorted_paths", "sorted_rows"):
+        assert list(getattr(restored, column)) == list(getattr(store, column))
+    assert list(restored.row_to_slot) == [0, -1, 1, 2]
+    assert {key: list(rows) for key, rows in restored.folder_rows.items()} == {
+        key: list(rows) for key, rows in store.folder_rows.items()
+    }
+    assert restored.folder_children == store.folder_children
+    assert restored.row_index_for_path("other/c.jpg") == 3
+
+    cached = {2: TableCachedRowDimensions("https://cdn.example.com/set/b.jpg", "set/b.jpg", 4, 3)}
+    result = resume_table_row_store(
+        replace(context, table=replace(context.table, dimension_overrides=cached)),
+        restored,
+        skipped_local=loaded.skipped_local,
+    )
+
+    assert list(result.store.row_dimensions) == [(10, 5), None, (4, 3), (0, 0)]
+    assert [(task.row_idx, task.source) for task in result.remote_tasks] == [(3, "s3://bucket/other/c.jpg")]
+    assert result.remote_tasks[0].name == store.names[2]
+    assert result.skipped_local_missing == 1
@@ -236,3 +236,188 @@ def test_dimension_rewrite_rejects_replacement_before_recapture(
                 skip_dimension_probe=True,
             )
         )
+
+
+def test_changed_source_reloads_in_process_and_reuses_probed_dimensions(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    from PIL import Image
+
+    import lenslet.storage.table.row_scan as row_scan_module
+
+    images = tmp_path / "images"
+    images.mkdir()
+    for name in ("a", "b", "c"):
+        Image.new("RGB", (8, 6)).save(images / f"{name}.jpg", format="JPEG")
+    source = tmp_path / "items.parquet"
+    pq.write_table(
+        pa.table({
+            "source": [str(images / "a.jpg"), str(images / "b.jpg")],
+            "path": ["a.jpg", "b.jpg"],
+        }),
+        source,
+    )
+    probed: list[str] = []
+    real_probe = row_scan_module.read_dimensions_fast
+
+    def counting_probe(path: str):
+        probed.append(os.path.basename(path))
+        return real_probe(path)
+
+    monkeypatch.setattr(row_scan_module, "read_dimensions_fast", counting_probe)
+    storage = prepare_table_launch(
+        TableLaunchRequest(
+            parquet_path=source,
+            base_dir=str(tmp_path),
+            source_column="source",
+            path_column="path",
+            cache_dimensions=False,
+            skip_dimension_probe=False,
+        )
+    ).storage
+    assert sorted(probed) == ["a.jpg", "b.jpg"]
+    assert storage.reload_source_generation() is None
+
+    probed.clear()
+    pq.write_table(
+        pa.table({
+            "source": [str(images / "a.jpg"), str(images / "c.jpg")],
+            "path": ["a.jpg", "b.jpg"],
+        }),
+        tmp_path / "next.parquet",
+    )
+    os.replace(tmp_path / "next.parquet", source)
+    status, transitioned = storage.poll_source_refresh()
+    assert (status.state, transitioned) == ("refreshing", True)
+    storage.ensure_source_current()
+
+    diff = storage.reload_source_generation()
+
+    assert diff is not None
+    assert (diff.added, diff.removed, diff.changed, diff.unchanged) == (0, 0, 1, 1)
+    assert diff.changed_paths == frozenset({"b.jpg"})
+    assert probed == ["c.jpg"]
+    assert storage.get_source_path("b.jpg") == str(images / "c.jpg")
+    assert storage.get_dimensions("a.jpg") == (8, 6)
+    status, transitioned = storage.poll_source_refresh()
+    assert (status.state, transitioned) == ("current", True)
+
+    pq.write_table(pa.table({"source": [str(images / "a.jpg")], "path": ["a.jpg"]}), tmp_path / "last.parquet")
+    os.replace(tmp_path / "last.parquet", source)
+
+    def failing_launch(_request):
+        raise ValueError("broken snapshot")
+
+    monkeypatch.setattr(table_launch_module, "prepare_table_launch", failing_launch)
+    assert storage.poll_source_refresh()[0].state == "refreshing"
+    assert storage.reload_source_generation() is None
+    status, transitioned = storage.poll_source_refresh()
+    assert (status.state, transitioned) == ("restart-required", True)
+    assert status.message == "The source table changed and could not be reloaded; restart Lenslet to load it."
+    assert storage.total_items() == 2
+
+
+def test_query_running_across_a_reload_keeps_reading_its_generation(tmp_path: Path) -> None:
+    import threading
+
+    from PIL import Image
+
+    from lenslet.browse.query import BrowseQuerySpec, BuiltinSortSpec
+    from lenslet.storage.table.generation import pinned_table_generations
+    from lenslet.storage.table.query_coordinator import TableQueryCoordinator
+
+    images = tmp_path / "images"
+    images.mkdir()
+    for name in ("a", "b", "c"):
+        Image.new("RGB", (8, 6)).save(images / f"{name}.jpg", format="JPEG")
+    source = tmp_path / "items.parquet"
+    pq.write_table(
+        pa.table({
+            "source": [str(images / f"{name}.jpg") for name in ("a", "b", "c")],
+            "path": ["a.jpg", "b.jpg", "c.jpg"],
+        }),
+        source,
+    )
+    storage = prepare_table_launch(
+        TableLaunchRequest(
+            parquet_path=source,
+            base_dir=str(tmp_path),
+            source_column="source",
+            path_column="path",
+            cache_dimensions=False,
+            skip_dimension_probe=True,
+        )
+    ).storage
+    spec = BrowseQuerySpec(path="/", recursive=True, offset=0, limit=10, sort=BuiltinSortSpec("name", "asc"))
+    started = threading.Event()
+    release = threading.Event()
+
+    async def scenario() -> tuple[list[str], list[str]]:
+        coordinator = TableQueryCoordinator()
+
+        async def query() -> list[str]:
+            with pinned_table_generations():
+                key = storage.table_filter_key(spec)
+
+                def analyze(cancel):
+                    started.set()
+                    assert release.wait(timeout=5)
+                    return storage.analyze_table_filter(spec, key, cancel)
+
+                lease = await coordinator.acquire(
+                    "filter",
+                    key,
+                    analyze,
+                    client_session="session",
+                    query_revision=1,
+                )
+                analysis = storage.refresh_table_filter(spec, lease.value)
+                order_key = storage.table_order_key(spec, analysis)
+                ordered = storage.order_table_analysis(spec, analysis, order_key, lambda: False)
+                result = storage.query_browse_scope_from_analysis(spec, analysis, ordered)
+                return [item.path for item in result.items]
+
+        running = asyncio.create_task(query())
+        await asyncio.to_thread(started.wait, 5)
+        pq.write_table(
+            pa.table({"source": [str(images / "c.jpg")], "path": ["z.jpg"]}),
+            tmp_path / "next.parquet",
+        )
+        os.replace(tmp_path / "next.parquet", source)
+        assert storage.poll_source_refresh()[0].state == "refreshing"
+        assert await asyncio.to_thread(storage.reload_source_generation) is not None
+        release.set()
+        pinned = await running
+        await coordinator.close()
+        current = [item.path for item in storage.query_browse_scope(spec).items]
+        return pinned, current
+
+    pinned, current = asyncio.run(scenario())
+
+    assert pinned == ["a.jpg", "b.jpg", "c.jpg"]
+    assert current == ["z.jpg"]
+
+
+def test_table_storage_keeps_only_launch_wiring_outside_its_generation() -> None:
+    storage = TableStorage(
+        [{"source": "https://example.com/a.jpg", "path": "a.jpg"}],
+        options=TableStorageOptions(
+            source_column="source",
+            path_column="path",
+            skip_dimension_probe=True,
+            allow_local=False,
+        ),
+    )
+
+    # Anything else is source-derived and must move with the generation on reload.
+    assert set(vars(storage)) == {
+        "root", "_root_real", "_allow_local", "_skip_local_realpath_validation", "_scan_workers",
+        "_source_config", "_source_services", "thumb_size", "thumb_quality", "_include_source_in_search",
+        "_normalize_source_item_path", "_canonical_source_sidecar_key", "_source_is_s3_uri",
+        "_source_is_http_url", "_thumbnails", "_thumbnail_renderer", "_sidecars", "_media_reads",
+        "sample_size", "loadable_threshold", "_skip_dimension_probe", "_table_field_columns",
+        "_column_cache_dir", "_dimension_cache_policy", "_dimension_write_policy",
+        "_configured_path_column", "_configured_categorical_columns", "_source_reloader",
+        "_generation_lock", "_progress_bar", "_generation",
+    }
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import lenslet.storage.table.text_index as text_index_module
+from lenslet.storage.table.text_index import TrigramIndex, intersect_candidates
+
+
+def _random_strings(rng: random.Random, count: int) -> list[str | None]:
+    alphabet = "abcxyz/._-0123 éİı̇ß"
+    values: list[str | None] = []
+    for _index in range(count):
+        if rng.random() < 0.05:
+            values.append(None)
+            continue
+        length = rng.randint(0, 12)
+        values.append("".join(rng.choice(alphabet) for _ in range(length)).lower())
+    return values
+
+
+def test_trigram_candidates_cover_every_substring_match(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(text_index_module, "TRIGRAM_CHUNK_ROWS", 64)
+    rng = random.Random(5)
+    values = _random_strings(rng, 500)
+    index = TrigramIndex.from_strings(values)
+    needles = ["abc", "xyz", "é", "i̇", "ss", "0123", "/._", "zzzz", "ab", ""]
+    needles.extend(value[1:5] for value in rng.sample([value for value in values if value], 40))
+
+    for needle in needles:
+        expected = [slot for slot, value in enumerate(values) if value is not None and needle in value]
+        candidates = index.candidates(needle)
+        if len(needle.encode("utf-8")) < 3:
+            assert candidates is None
+            continue
+        slots = candidates.to_pylist()
+        assert slots == sorted(set(slots))
+        assert set(expected) <= set(slots), needle
+
+        ranged = index.candidates(needle, 100, 300).to_pylist()
+        assert set(slot for slot in expected if 100 <= slot < 300) <= set(ranged)
+        assert all(100 <= slot < 300 for slot in ranged)
+
+
+def test_trigram_candidates_narrow_selective_needles() -> None:
+    values = [f"gallery/item_{index:05d}.jpg" for index in range(5000)]
+    index = TrigramIndex.from_strings(values)
+
+    assert index.candidates("item_01234").to_pylist() == [1234]
+    assert index.candidates("missing").to_pylist() == []
+    assert len(index.candidates(".jpg")) == 5000
+    assert intersect_candidates(None, None) is None
+    assert intersect_candidates(
+        index.candidates("item_012"),
+        index.candidates("34.jpg"),
+    ).to_pylist() == [1234]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from lenslet.storage.source.media import CachedMediaStream, MediaReadService
+from lenslet.web.app.shared import original_cache_from_workspace
+from lenslet.web.cache.originals import OriginalCache
+from lenslet.workspace import Workspace
+
+SOURCE = "https://example.test/cat.jpg"
+
+
+class _Origin:
+    def __init__(self, payload: bytes, etag: str = '"v1"') -> None:
+        self.payload = payload
+        self.etag = etag
+        self.requests: list[dict[str, str]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def respond(self, url: str, headers: dict[str, str] | None) -> httpx.Response:
+        self.requests.append(dict(headers or {}))
+        self.release.wait(timeout=2)
+        request = httpx.Request("GET", url)
+        if headers and headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, request=request)
+        response_headers = {"etag": self.etag, "content-type": "image/jpeg"}
+        return httpx.Response(200, content=self.payload, headers=response_headers, request=request)
+
+
+def _service(origin: _Origin, cache: OriginalCache) -> MediaReadService:
+    class _Service(MediaReadService):
+        def _http_get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+            return origin.respond(url, headers)
+
+        def _http_stream(self, url: str, *, range_header=None, conditional_headers=None) -> httpx.Response:
+            return origin.respond(url, conditional_headers)
+
+    service = _Service(
+        remote_header_bytes=256,
+        resolve_local_source=lambda source: source,
+        is_s3_uri=lambda source: source.startswith("s3://"),
+        is_http_url=lambda source: source.startswith("https://"),
+        read_dimensions_from_bytes=lambda _data, _ext: None,
+    )
+    service.set_original_cache(cache)
+    return service
+
+
+def test_original_cache_serves_repeat_reads_and_revalidates_with_etag(tmp_path: Path) -> None:
+    origin = _Origin(b"original-bytes")
+    cache = OriginalCache(tmp_path / "originals", max_disk_bytes=1024)
+    service = _service(origin, cache)
+
+    assert service.read_bytes("/cat.jpg", SOURCE) == b"original-bytes"
+    assert service.read_bytes("/cat.jpg", SOURCE) == b"original-bytes"
+    assert origin.requests == [{}]
+
+    cache.revalidate_after = 0.0
+    assert service.read_bytes("/cat.jpg", SOURCE) == b"original-bytes"
+    assert origin.requests[-1] == {"If-None-Match": '"v1"'}
+
+    origin.payload, origin.etag = b"changed", '"v2"'
+    assert service.read_bytes("/cat.jpg", SOURCE) == b"changed"
+    reopened = OriginalCache(tmp_path / "originals", max_disk_bytes=1024)
+    entry = reopened.lookup(SOURCE)
+    assert entry is not None and entry.etag == '"v2"'
+    assert reopened.read(entry) == b"changed"
+    counters = cache.diagnostics()
+    assert counters["original_cache_revalidated_total"] == 1
+    assert counters["original_cache_store_total"] == 2
+
+
+def test_original_cache_deduplicates_concurrent_fetches(tmp_path: Path) -> None:
+    origin = _Origin(b"shared")
+    origin.release.clear()
+    service = _service(origin, OriginalCache(tmp_path / "originals", max_disk_bytes=1024))
+    results: list[bytes] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(service.read_bytes("/cat.jpg", SOURCE)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 1
+    while not origin.requests and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    origin.release.set()
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert results == [b"shared"] * 4
+    assert len(origin.requests) == 1
+
+
+def test_original_cache_tees_streams_and_serves_ranges(tmp_path: Path) -> None:
+    origin = _Origin(b"0123456789")
+    service = _service(origin, OriginalCache(tmp_path / "originals", max_disk_bytes=1024))
+
+    first = service.open_remote_stream("/cat.jpg", SOURCE)
+    assert b"".join(first.iter_bytes()) == b"0123456789"
+    ranged = service.open_remote_stream("/cat.jpg", SOURCE, range_header="bytes=2-5")
+
+    assert isinstance(ranged, CachedMediaStream)
+    assert ranged.status_code == 206
+    assert ranged.headers["content-range"] == "bytes 2-5/10"
+    assert ranged.headers["content-type"] == "image/jpeg"
+    assert b"".join(ranged.iter_bytes()) == b"2345"
+    suffix = service.open_remote_stream("/cat.jpg", SOURCE, range_header="bytes=-3")
+    assert b"".join(suffix.iter_bytes()) == b"789"
+    assert len(origin.requests) == 1
+
+
+def test_original_cache_evicts_least_recently_used_past_cap(tmp_path: Path) -> None:
+    cache = OriginalCache(tmp_path / "originals", max_disk_bytes=10)
+    validators = {"etag": None, "last_modified": None, "content_type": None}
+
+    cache.store("https://a", b"aaaa", **validators)
+    cache.store("https://b", b"bbbb", **validators)
+    assert cache.lookup("https://a") is not None
+    cache.store("https://c", b"cccc", **validators)
+
+    assert cache.lookup("https://b") is None
+    assert cache.lookup("https://a") is not None
+    assert cache.store("https://big", b"x" * 11, **validators) is None
+    assert cache.diagnostics()["original_cache_bytes"] == 8
+
+
+def test_original_cache_from_workspace_respects_budget_and_writability(tmp_path: Path) -> None:
+    workspace = Workspace(root=tmp_path / ".lenslet", can_write=True, is_temp=False)
+
+    cache = original_cache_from_workspace(workspace, 4096)
+
+    assert isinstance(cache, OriginalCache)
+    assert cache.root == tmp_path / ".lenslet" / "originals"
+    assert original_cache_from_workspace(workspace, 0) is None
+    assert original_cache_from_workspace(Workspace.for_dataset(None, can_write=False), 4096) is None
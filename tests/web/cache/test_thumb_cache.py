@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 
 from lenslet.web.app.shared import DEFAULT_THUMB_CACHE_CAP_BYTES, thumb_cache_from_workspace
+from lenslet.web.cache.packed_thumbs import PackedThumbCache
 from lenslet.web.cache.thumbs import ThumbCache
 from lenslet.workspace import Workspace
 
@@ -69,3 +70,95 @@ def test_thumb_cache_does_not_fsync_best_effort_thumbnail_files(tmp_path, monkey
     monkeypatch.setattr("lenslet.web.cache.thumbs.os.fsync", _fail_fsync)
 
     assert cache.set("a", b"thumbnail")
+
+
+def _webp(tag: bytes, size: int = 64) -> bytes:
+    body = b"WEBP" + tag.ljust(size, b"\0")
+    return b"RIFF" + len(body).to_bytes(4, "little") + body
+
+
+def test_packed_thumb_cache_round_trips_and_reloads_from_segment_index(tmp_path):
+    cache = PackedThumbCache(tmp_path / "thumbs")
+
+    assert cache.set("a", _webp(b"a"))
+    assert cache.set("b", _webp(b"b"))
+    assert cache.set("a", _webp(b"a2"))
+    assert cache.get("a") == _webp(b"a2")
+    assert cache.get("missing") is None
+    cache.close()
+
+    reopened = PackedThumbCache(tmp_path / "thumbs")
+
+    assert reopened.get("a") == _webp(b"a2")
+    assert reopened.get("b") == _webp(b"b")
+    assert not list((tmp_path / "thumbs").rglob("*.webp"))
+    assert reopened.stats()["entries"] == 2
+
+
+def test_packed_thumb_cache_evicts_whole_segments_past_cap(tmp_path):
+    payload_size = len(_webp(b"x", size=200))
+    cache = PackedThumbCache(tmp_path / "thumbs", max_disk_bytes=payload_size * 4 + 400)
+
+    for index in range(12):
+        assert cache.set(f"k{index}", _webp(b"x", size=200))
+
+    stats = cache.stats()
+    segment_bytes = sum(path.stat().st_size for path in (tmp_path / "thumbs").rglob("*.seg"))
+    assert segment_bytes == stats["bytes"] <= cache.max_disk_bytes
+    assert cache.get("k0") is None
+    assert cache.get("k11") == _webp(b"x", size=200)
+
+
+def test_packed_thumb_cache_migrates_directory_layout_entries(tmp_path):
+    root = tmp_path / "thumbs"
+    legacy = ThumbCache(root)
+    legacy.set("old-a", _webp(b"old-a"))
+    legacy.set("old-b", _webp(b"old-b"))
+
+    cache = PackedThumbCache(root)
+
+    assert cache.get("old-a") == _webp(b"old-a")
+    assert len(list(root.rglob("*.webp"))) == 1
+    assert cache.migrate_legacy() == 1
+    assert not list(root.rglob("*.webp"))
+    assert cache.get("old-b") == _webp(b"old-b")
+
+
+def test_thumb_cache_from_workspace_selects_packed_layout(tmp_path):
+    workspace = Workspace(root=tmp_path / ".lenslet", can_write=True, is_temp=False)
+
+    cache = thumb_cache_from_workspace(workspace, enabled=True, layout="packed")
+
+    assert isinstance(cache, PackedThumbCache)
+    assert cache.max_disk_bytes == DEFAULT_THUMB_CACHE_CAP_BYTES
+
+
+def test_thumb_cache_eviction_leaves_headroom_instead_of_rescanning_every_write(tmp_path, monkeypatch):
+    cache = ThumbCache(tmp_path / "thumbs", max_disk_bytes=100)
+    scans = 0
+    scan = ThumbCache._scan_cache_entries
+
+    def _counting_scan(self):
+        nonlocal scans
+        scans += 1
+        return scan(self)
+
+    monkeypatch.setattr(ThumbCache, "_scan_cache_entries", _counting_scan)
+    for index in range(40):
+        cache.set(f"key-{index}", b"x" * 10)
+
+    total_bytes = sum(path.stat().st_size for path in (tmp_path / "thumbs").rglob("*.webp"))
+    assert total_bytes <= 100
+    assert scans <= 40 // 2
+
+
+def test_thumb_cache_from_workspace_accepts_a_cap_or_none(tmp_path):
+    workspace = Workspace(root=tmp_path / ".lenslet", can_write=True, is_temp=False)
+
+    capped = thumb_cache_from_workspace(workspace, enabled=True, max_disk_bytes=4096)
+    uncapped = thumb_cache_from_workspace(workspace, enabled=True, layout="packed", max_disk_bytes=0)
+
+    assert isinstance(capped, ThumbCache)
+    assert capped.max_disk_bytes == 4096
+    assert isinstance(uncapped, PackedThumbCache)
+    assert uncapped.max_disk_bytes == 0
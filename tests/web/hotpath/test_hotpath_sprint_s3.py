@@ -8,7 +8,7 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 from PIL import Image
 
-from lenslet.server import create_app
+from lenslet.server import BrowseAppOptions, LocalAppOptions, create_app
 from lenslet.storage.dataset import DatasetStorage
 from lenslet.storage.memory import MemoryStorage
 from lenslet.storage.table import TableStorage, TableStorageOptions
@@ -319,3 +319,21 @@ def test_memory_storage_omits_s3_metric_from_hotpath_snapshot(tmp_path: Path) ->
     storage = MemoryStorage(str(tmp_path))
 
     assert "s3_client_create_total" not in HotpathTelemetry().snapshot(storage).counters
+
+
+def test_thumbnail_memory_cache_counters_and_budget_reach_health(tmp_path: Path) -> None:
+    _make_image(tmp_path / "sample.jpg")
+    app = create_app(
+        str(tmp_path),
+        options=LocalAppOptions(no_write=True, browse=BrowseAppOptions(thumb_memory_cache_mb=1)),
+    )
+    client = TestClient(app)
+
+    assert client.get("/thumb", params={"path": "/sample.jpg"}).status_code == 200
+    assert client.get("/thumb", params={"path": "/sample.jpg"}).status_code == 200
+
+    counters = client.get("/health").json()["hotpath"]["counters"]
+    assert counters["thumbnail_memory_cache_hit_total"] >= 1
+    assert counters["thumbnail_memory_cache_miss_total"] >= 1
+    assert counters["thumbnail_memory_cache_entries"] == 1
+    assert counters["thumbnail_memory_cache_budget_bytes"] == 1024 * 1024
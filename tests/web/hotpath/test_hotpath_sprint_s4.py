@@ -136,6 +136,47 @@ def test_file_route_streams_local_files_and_tracks_prefetch_counters(
     assert counters.get("file_response_fallback_bytes_total", 0) == 0
 
 
+@pytest.mark.parametrize("build_app", APP_BUILDERS)
+def test_thumb_and_file_routes_answer_matching_etags_with_304(
+    tmp_path: Path,
+    build_app: AppBuilder,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _seed_gallery(tmp_path)
+    app, _, file_path = build_app(tmp_path)
+
+    with TestClient(app) as client:
+        thumb = client.get("/thumb", params={"path": file_path})
+        original = client.get("/file", params={"path": file_path})
+        submitted: list[object] = []
+        monkeypatch.setattr(ThumbnailScheduler, "submit", lambda *args, **kwargs: submitted.append(args))
+        thumb_304 = client.get(
+            "/thumb",
+            params={"path": file_path},
+            headers={"if-none-match": f'W/"stale", {thumb.headers["etag"]}'},
+        )
+        file_304 = client.get(
+            "/file",
+            params={"path": file_path},
+            headers={"if-none-match": original.headers["etag"]},
+        )
+        health = client.get("/health")
+
+    assert thumb.status_code == 200
+    assert thumb.headers["etag"].startswith('"')
+    assert thumb.headers["cache-control"] == "private, max-age=300, must-revalidate"
+    assert original.headers["cache-control"] == "private, max-age=300, must-revalidate"
+    assert thumb_304.status_code == 304
+    assert thumb_304.content == b""
+    assert thumb_304.headers["etag"] == thumb.headers["etag"]
+    assert file_304.status_code == 304
+    assert file_304.headers["etag"] == original.headers["etag"]
+    assert submitted == []
+    counters = health.json()["hotpath"]["counters"]
+    assert counters["thumbnail_not_modified_total"] == 1
+    assert counters["file_not_modified_total"] == 1
+
+
 def test_table_file_route_falls_back_to_read_bytes_for_remote_sources(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -166,14 +207,22 @@ def test_table_file_route_falls_back_to_read_bytes_for_remote_sources(
 
     with TestClient(app) as client:
         response = client.get("/file", params={"path": "/gallery/a.jpg"})
+        revalidated = client.get(
+            "/file",
+            params={"path": "/gallery/a.jpg"},
+            headers={"if-none-match": response.headers["etag"]},
+        )
         health = client.get("/health")
 
     assert response.status_code == 200
     assert response.content == b"table-remote"
     assert response.headers.get("accept-ranges") is None
+    assert response.headers["cache-control"] == "private, max-age=300, must-revalidate"
     assert calls["read"] == 1
     counters = health.json()["hotpath"]["counters"]
     assert counters["file_response_fallback_bytes_total"] >= 1
+    assert revalidated.status_code == 304
+    assert counters["file_not_modified_total"] == 1
 
 
 def test_table_remote_url_path_column_serves_file_through_backend(
@@ -79,6 +79,7 @@ def test_query_and_facet_routes_emit_named_server_timing_and_health_counts(
 def test_thumbnail_and_mutation_routes_emit_work_phase_timing(tmp_path: Path) -> None:
     with _table_client(tmp_path, writable=True) as client:
         thumbnail = client.get("/thumb", params={"path": "/gallery/item.jpg"})
+        batch = client.post("/thumbs", json={"paths": ["/gallery/item.jpg"]})
         mutation = client.patch(
             "/item",
             params={"path": "/gallery/item.jpg"},
@@ -91,6 +92,8 @@ def test_thumbnail_and_mutation_routes_emit_work_phase_timing(tmp_path: Path) ->
 
     assert thumbnail.status_code == 200
     assert "thumbnail" in _timing_names(thumbnail)
+    assert batch.status_code == 200
+    assert {"queue", "thumbnail"} <= _timing_names(batch)
     assert mutation.status_code == 200
     assert {"mutation", "writer"} <= _timing_names(mutation)
 
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from lenslet.server import BrowseAppOptions, LocalAppOptions, create_app
+from lenslet.storage.image_media import render_preview
+from lenslet.web.media import preview_long_side
+
+
+def _encoded(image: Image.Image, fmt: str) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def test_render_preview_downscales_long_side_and_passes_small_jpeg_through() -> None:
+    large = _encoded(Image.new("RGBA", (3000, 1200), color=(20, 40, 60, 128)), "PNG")
+    content, media_type = render_preview(large, long_side=1600, quality=80)
+    assert media_type == "image/webp"
+    with Image.open(BytesIO(content)) as image:
+        assert image.size == (1600, 640)
+        assert image.mode == "RGBA"
+
+    small = _encoded(Image.new("RGB", (800, 600), color=(20, 40, 60)), "JPEG")
+    assert render_preview(small, long_side=1600, quality=80) == (small, "image/jpeg")
+
+    small_png = _encoded(Image.new("RGB", (800, 600), color=(20, 40, 60)), "PNG")
+    content, media_type = render_preview(small_png, long_side=1600, quality=80)
+    assert media_type == "image/webp"
+    with Image.open(BytesIO(content)) as image:
+        assert image.size == (800, 600)
+
+
+def test_render_preview_applies_exif_orientation_before_reencoding() -> None:
+    source = Image.new("RGB", (3200, 1600), color=(20, 40, 60))
+    source.paste((250, 10, 10), (0, 0, 400, 400))
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Rotated 90 degrees clockwise for display.
+    buffer = BytesIO()
+    source.save(buffer, format="JPEG", exif=exif)
+
+    content, media_type = render_preview(buffer.getvalue(), long_side=1600, quality=90)
+    assert media_type == "image/webp"
+    with Image.open(BytesIO(content)) as image:
+        assert image.size == (800, 1600)
+        assert image.getexif().get(0x0112) is None
+        # The red top-left corner of the stored pixels ends up top-right once rotated.
+        red, _green, _blue = image.convert("RGB").getpixel((780, 20))
+        assert red > 200
+
+
+def test_preview_long_side_snaps_to_tiers_and_follows_prefetch_context() -> None:
+    assert preview_long_side(None, None) == 2400
+    assert preview_long_side(None, "viewer") == 2400
+    assert preview_long_side(None, "compare") == 1600
+    assert preview_long_side(900, "viewer") == 1600
+    assert preview_long_side(2000, "compare") == 2400
+    assert preview_long_side(9000, None) == 2400
+
+
+def test_preview_endpoint_serves_tiers_with_validators(tmp_path: Path) -> None:
+    Image.new("RGB", (3200, 1600), color=(20, 40, 60)).save(tmp_path / "large.png", format="PNG")
+    Image.new("RGB", (640, 480), color=(20, 40, 60)).save(tmp_path / "small.jpg", format="JPEG")
+    app = create_app(str(tmp_path), options=LocalAppOptions(no_write=True, browse=BrowseAppOptions()))
+
+    with TestClient(app) as client:
+        viewer = client.get("/preview", params={"path": "/large.png"}, headers={"x-lenslet-prefetch": "viewer"})
+        compare = client.get("/preview", params={"path": "/large.png"}, headers={"x-lenslet-prefetch": "compare"})
+        sized = client.get("/preview", params={"path": "/large.png", "size": 1000})
+        revalidated = client.get(
+            "/preview",
+            params={"path": "/large.png", "size": 1000},
+            headers={"if-none-match": sized.headers["etag"]},
+        )
+        small = client.get("/preview", params={"path": "/small.jpg"})
+        missing = client.get("/preview", params={"path": "/missing.png"})
+        counters = client.get("/health").json()["hotpath"]["counters"]
+
+    assert viewer.status_code == 200
+    assert viewer.headers["content-type"] == "image/webp"
+    assert viewer.headers["vary"] == "x-lenslet-prefetch"
+    with Image.open(BytesIO(viewer.content)) as image:
+        assert image.size == (2400, 1200)
+    with Image.open(BytesIO(compare.content)) as image:
+        assert image.size == (1600, 800)
+    assert compare.headers["etag"] != viewer.headers["etag"]
+
+    assert sized.status_code == 200
+    assert "vary" not in sized.headers
+    assert sized.headers["etag"] == compare.headers["etag"]
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    assert small.status_code == 200
+    assert small.headers["content-type"] == "image/jpeg"
+    assert small.content == (tmp_path / "small.jpg").read_bytes()
+    assert missing.status_code == 404
+
+    assert counters["preview_prefetch_viewer_total"] == 1
+    assert counters["preview_prefetch_compare_total"] == 1
+    assert counters["preview_not_modified_total"] == 1
+    assert counters["preview_original_total"] == 1
+    assert counters["preview_generated_total"] + counters.get("preview_disk_total", 0) == 3
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import struct
 import logging
 import threading
 import time
@@ -10,11 +12,23 @@ import pytest
 from fastapi import HTTPException
 from PIL import Image
 
+from fastapi.testclient import TestClient
+from io import BytesIO
+
+from lenslet.server import BrowseAppOptions, LocalAppOptions, create_app
 from lenslet.web.cache.thumbs import ThumbCache
+from lenslet.web.context import get_app_runtime
 from lenslet.web.hotpath import HotpathTelemetry
-from lenslet.web.media import thumb_response_async
+from lenslet.web.media import (
+    THUMBNAIL_BATCH_MEDIA_TYPE,
+    thumb_batch_response,
+    thumb_response_async,
+    thumb_worker_count,
+)
+from lenslet.web.thumb_processes import ThumbnailProcessPool
 from lenslet.web.thumbs import (
     MAX_INFLIGHT_THUMBNAILS,
+    MAX_PROCESS_THUMBNAIL_WORKERS,
     MAX_QUEUED_THUMBNAILS,
     MAX_THUMBNAIL_WORKERS,
     ThumbnailBusy,
@@ -23,6 +37,8 @@ from lenslet.web.thumbs import (
 
 
 class _ConnectedRequest:
+    headers: dict[str, str] = {}
+
     @staticmethod
     async def is_disconnected() -> bool:
         return False
@@ -221,6 +237,123 @@ def test_background_persistence_leaves_workers_available_for_foreground() -> Non
         scheduler.close()
 
 
+def test_thumbnail_scheduler_runs_higher_priority_classes_first_and_reports_queue_wait() -> None:
+    waits: list[tuple[str, float]] = []
+    scheduler: ThumbnailScheduler[str] = ThumbnailScheduler(
+        max_workers=1,
+        on_queue_wait=lambda priority, wait_ms: waits.append((priority, wait_ms)),
+    )
+    started = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+    try:
+        active = scheduler.submit("active", lambda: _wait_and_return(started, release))
+        assert started.wait(timeout=1)
+        futures = [
+            scheduler.submit(name, lambda name=name: order.append(name) or name, priority=priority)
+            for name, priority in (
+                ("prefetch", "prefetch"),
+                ("near", "near"),
+                ("visible-old", "visible"),
+                ("visible-new", "visible"),
+            )
+        ]
+        # Joining queued work with a higher class promotes it.
+        promoted = scheduler.submit("prefetch", lambda: pytest.fail("duplicate operation ran"), priority="visible")
+        diagnostics = scheduler.diagnostics()
+        assert diagnostics["thumbnail_queued_visible_work"] == 3
+        assert diagnostics["thumbnail_queued_prefetch_work"] == 0
+        release.set()
+        assert active.result(timeout=1) == b"active"
+        assert [future.result(timeout=1) for future in futures] == [
+            "prefetch",
+            "near",
+            "visible-old",
+            "visible-new",
+        ]
+        assert promoted.result(timeout=1) == "prefetch"
+    finally:
+        release.set()
+        scheduler.close()
+
+    assert order == ["prefetch", "visible-new", "visible-old", "near"]
+    assert [priority for priority, _wait in waits] == ["visible", "visible", "visible", "visible", "near"]
+    assert all(wait_ms >= 0 for _priority, wait_ms in waits)
+
+
+def test_thumbnail_scheduler_newer_generation_demotes_visible_and_drops_prefetch_work() -> None:
+    scheduler: ThumbnailScheduler[str] = ThumbnailScheduler(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    try:
+        active = scheduler.submit("active", lambda: _wait_and_return(started, release))
+        assert started.wait(timeout=1)
+        old_visible = scheduler.submit("old-visible", lambda: "old-visible", session="s", generation=1)
+        old_prefetch = scheduler.submit(
+            "old-prefetch",
+            lambda: pytest.fail("superseded work ran"),
+            priority="prefetch",
+            session="s",
+            generation=1,
+        )
+        other_session = scheduler.submit("other", lambda: "other", session="t", generation=1)
+        scheduler.submit("new", lambda: "new", session="s", generation=2)
+
+        with pytest.raises(ThumbnailBusy, match="superseded"):
+            old_prefetch.result(timeout=1)
+        diagnostics = scheduler.diagnostics()
+        assert diagnostics["thumbnail_demoted_total"] == 1
+        assert diagnostics["thumbnail_superseded_total"] == 1
+        assert diagnostics["thumbnail_queued_visible_work"] == 2
+        assert diagnostics["thumbnail_queued_prefetch_work"] == 1
+
+        # Requests still tagged with an older generation only get the prefetch class.
+        stale = scheduler.submit("stale", lambda: "stale", session="s", generation=1)
+        stale_prefetch = scheduler.submit(
+            "stale-prefetch",
+            lambda: pytest.fail("superseded work ran"),
+            priority="prefetch",
+            session="s",
+            generation=1,
+        )
+        assert scheduler.stats()["queued_prefetch"] == 3
+        # Work requested as visible may still be on screen, so later generations never drop it.
+        scheduler.submit("newest", lambda: "newest", session="s", generation=3)
+        with pytest.raises(ThumbnailBusy, match="superseded"):
+            stale_prefetch.result(timeout=1)
+        diagnostics = scheduler.diagnostics()
+        assert diagnostics["thumbnail_superseded_total"] == 2
+        assert diagnostics["thumbnail_queued_prefetch_work"] == 3
+        release.set()
+        assert old_visible.result(timeout=1) == "old-visible"
+        assert stale.result(timeout=1) == "stale"
+        assert other_session.result(timeout=1) == "other"
+    finally:
+        release.set()
+        scheduler.close()
+
+
+def test_thumbnail_scheduler_displaces_lower_priority_work_when_queue_is_full() -> None:
+    scheduler: ThumbnailScheduler[str] = ThumbnailScheduler(max_workers=1, max_queue_size=1)
+    started = threading.Event()
+    release = threading.Event()
+    try:
+        active = scheduler.submit("active", lambda: _wait_and_return(started, release))
+        assert started.wait(timeout=1)
+        prefetch = scheduler.submit("prefetch", lambda: "prefetch", priority="prefetch")
+        visible = scheduler.submit("visible", lambda: "visible")
+        with pytest.raises(ThumbnailBusy, match="displaced"):
+            prefetch.result(timeout=1)
+        with pytest.raises(ThumbnailBusy, match="queue is full"):
+            scheduler.submit("near", lambda: "near", priority="near")
+        assert scheduler.diagnostics()["thumbnail_displaced_total"] == 1
+        release.set()
+        assert visible.result(timeout=1) == "visible"
+    finally:
+        release.set()
+        scheduler.close()
+
+
 def test_thumbnail_admission_failure_returns_explicit_503() -> None:
     scheduler: ThumbnailScheduler[bytes] = ThumbnailScheduler(max_workers=1, max_queue_size=1)
     started = threading.Event()
@@ -384,3 +517,213 @@ def test_corrupt_cache_and_failed_write_do_not_fail_generated_response(
         assert "thumbnail cache persistence failed" in caplog.text
     finally:
         failed_scheduler.close()
+
+
+def test_process_pool_renders_through_pickle_and_shared_memory() -> None:
+    buffer = BytesIO()
+    Image.new("RGB", (400, 300), color=(20, 40, 60)).save(buffer, format="JPEG")
+    source = buffer.getvalue()
+    pool = ThumbnailProcessPool(max_workers=1, shared_memory_min_bytes=len(source))
+    try:
+        small_thumb, small_dims = pool(_tiny_png(), thumb_size=64, thumb_quality=70)
+        thumb, dims = pool.render(source, thumb_size=64, thumb_quality=70)
+    finally:
+        pool.close()
+
+    assert small_dims == (4, 3)
+    assert dims == (400, 300)
+    with Image.open(BytesIO(small_thumb)) as image:
+        assert image.format == "WEBP"
+    with Image.open(BytesIO(thumb)) as image:
+        assert image.size == (85, 64)
+    assert pool.diagnostics() == {
+        "thumbnail_process_workers": 1,
+        "thumbnail_process_rendered_total": 2,
+        "thumbnail_process_shared_memory_total": 1,
+        "thumbnail_process_restarts_total": 0,
+    }
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.render(source, thumb_size=64, thumb_quality=70)
+
+
+def _tiny_png() -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (4, 3), color=(20, 40, 60)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_process_engine_serves_thumbnails_and_lifts_scheduler_worker_cap(tmp_path: Path) -> None:
+    Image.new("RGB", (64, 48), color=(20, 40, 60)).save(tmp_path / "sample.jpg", format="JPEG")
+    assert ThumbnailScheduler(max_workers=99, worker_cap=99).stats()["workers"] == MAX_PROCESS_THUMBNAIL_WORKERS
+    assert thumb_worker_count("threads") <= MAX_THUMBNAIL_WORKERS
+    app = create_app(
+        str(tmp_path),
+        options=LocalAppOptions(
+            no_write=True,
+            browse=BrowseAppOptions(thumb_size=16, thumb_engine="processes"),
+        ),
+    )
+
+    with TestClient(app) as client:
+        response = client.get("/thumb", params={"path": "/sample.jpg"})
+        counters = client.get("/health").json()["hotpath"]["counters"]
+
+    assert response.status_code == 200
+    with Image.open(BytesIO(response.content)) as image:
+        assert image.size == (21, 16)
+    assert counters["thumbnail_generated_total"] == 1
+    assert counters["thumbnail_process_rendered_total"] == 1
+    assert counters["thumbnail_workers"] == counters["thumbnail_process_workers"]
+    assert counters["thumbnail_workers"] == thumb_worker_count("processes")
+    runtime = get_app_runtime(app)
+    shutdown_order = list(reversed(app.state.lenslet_shutdown_handlers))
+    assert shutdown_order.index(runtime.thumb_queue.close) < shutdown_order.index(runtime.thumb_processes.close)
+
+
+def test_thumb_endpoint_applies_priority_hint_and_reports_queue_wait(tmp_path: Path) -> None:
+    Image.new("RGB", (64, 48), color=(20, 40, 60)).save(tmp_path / "sample.jpg", format="JPEG")
+    app = create_app(
+        str(tmp_path),
+        options=LocalAppOptions(no_write=True, browse=BrowseAppOptions(thumb_size=16)),
+    )
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/thumb",
+            params={"path": "/sample.jpg"},
+            headers={"x-lenslet-thumb-priority": "near", "x-lenslet-thumb-generation": "3"},
+        )
+        hotpath = client.get("/health").json()["hotpath"]
+
+    assert response.status_code == 200
+    assert hotpath["timers_ms"]["thumbnail_queue_wait_near"]["count"] == 1
+    assert "thumbnail_queue_wait_visible" not in hotpath["timers_ms"]
+    assert hotpath["counters"]["thumbnail_queued_prefetch_work"] == 0
+
+
+def _batch_frames(payload: bytes) -> list[tuple[dict, bytes]]:
+    frames: list[tuple[dict, bytes]] = []
+    offset = 0
+    while offset < len(payload):
+        (header_length,) = struct.unpack_from(">I", payload, offset)
+        offset += 4
+        header = json.loads(payload[offset:offset + header_length])
+        offset += header_length
+        body = payload[offset:offset + header["size"]]
+        offset += header["size"]
+        frames.append((header, body))
+    return frames
+
+
+def test_thumbnail_batch_streams_frames_and_honors_known_etags(tmp_path: Path) -> None:
+    for name in ("a.jpg", "b.jpg", "c.jpg"):
+        Image.new("RGB", (64, 48), color=(20, 40, 60)).save(tmp_path / name, format="JPEG")
+    app = create_app(
+        str(tmp_path),
+        options=LocalAppOptions(no_write=True, browse=BrowseAppOptions(thumb_size=16)),
+    )
+
+    with TestClient(app) as client:
+        first = client.post("/thumbs", json={"paths": ["/a.jpg", "/b.jpg", "/c.jpg", "/missing.jpg"]})
+        frames = _batch_frames(first.content)
+        etags = {header["path"]: header["etag"] for header, _body in frames if header["status"] == 200}
+        second = client.post("/thumbs", json={"paths": ["/a.jpg", "/b.jpg"], "etags": {"/a.jpg": etags["/a.jpg"]}})
+        too_many = client.post("/thumbs", json={"paths": ["/a.jpg"] * 257})
+        counters = client.get("/health").json()["hotpath"]["counters"]
+
+    assert first.status_code == 200
+    assert first.headers["content-type"] == THUMBNAIL_BATCH_MEDIA_TYPE
+    assert first.headers["cache-control"] == "no-store"
+    by_path = {header["path"]: (header, body) for header, body in frames}
+    assert set(by_path) == {"/a.jpg", "/b.jpg", "/c.jpg", "/missing.jpg"}
+    for name in ("/a.jpg", "/b.jpg", "/c.jpg"):
+        header, body = by_path[name]
+        assert header["status"] == 200
+        assert header["size"] == len(body)
+        with Image.open(BytesIO(body)) as image:
+            assert image.format == "WEBP"
+    assert by_path["/missing.jpg"][0]["status"] == 404
+    assert by_path["/missing.jpg"][1] == b""
+
+    second_frames = {header["path"]: (header, body) for header, body in _batch_frames(second.content)}
+    assert second_frames["/a.jpg"][0]["status"] == 304
+    assert second_frames["/a.jpg"][1] == b""
+    assert second_frames["/b.jpg"][0]["status"] == 200
+    assert second_frames["/b.jpg"][0]["etag"] == etags["/b.jpg"]
+    assert too_many.status_code == 422
+    assert counters["thumbnail_batch_requests_total"] == 2
+    assert counters["thumbnail_batch_paths_total"] == 6
+    assert counters["thumbnail_not_modified_total"] == 1
+
+
+def test_thumbnail_batch_disconnect_cancels_unfinished_work() -> None:
+    scheduler: ThumbnailScheduler[bytes] = ThumbnailScheduler(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    metrics = HotpathTelemetry()
+
+    class Storage:
+        @staticmethod
+        def get_or_build_thumbnail(path: str) -> bytes:
+            started.set()
+            release.wait(timeout=2)
+            return b"slow"
+
+    class DisconnectingRequest:
+        headers: dict[str, str] = {}
+
+        @staticmethod
+        async def is_disconnected() -> bool:
+            return started.is_set()
+
+    async def _drain() -> list[bytes]:
+        response = thumb_batch_response(
+            Storage(),
+            ["/slow.jpg", "/queued.jpg"],
+            DisconnectingRequest(),
+            scheduler,
+            lambda path: path,
+            hotpath_metrics=metrics,
+        )
+        return [chunk async for chunk in response.body_iterator]
+
+    try:
+        chunks = asyncio.run(_drain())
+        assert chunks == []
+        assert scheduler.stats()["queued"] == 0
+        assert metrics.snapshot().counters["thumb_disconnect_cancel_total"] >= 1
+    finally:
+        release.set()
+        scheduler.close()
+
+
+def test_thumbnail_batch_resolves_paths_and_cache_keys_off_the_event_loop() -> None:
+    scheduler: ThumbnailScheduler[bytes] = ThumbnailScheduler(max_workers=1)
+    storage_threads: set[int] = set()
+
+    class Storage:
+        @staticmethod
+        def thumbnail_cache_key(path: str) -> str:
+            storage_threads.add(threading.get_ident())
+            return f"key|{path}"
+
+        @staticmethod
+        def get_cached_thumbnail(path: str) -> bytes:
+            storage_threads.add(threading.get_ident())
+            return b"cached"
+
+    def resolve_path(path: str) -> str:
+        storage_threads.add(threading.get_ident())
+        return path
+
+    async def _drain() -> tuple[int, list[bytes]]:
+        response = thumb_batch_response(Storage(), ["/a.jpg", "/b.jpg"], _ConnectedRequest(), scheduler, resolve_path)
+        return threading.get_ident(), [chunk async for chunk in response.body_iterator]
+
+    try:
+        loop_thread, chunks = asyncio.run(_drain())
+    finally:
+        scheduler.close()
+    frames = _batch_frames(b"".join(chunks))
+    assert [header["source"] for header, _body in frames] == ["memory", "memory"]
+    assert storage_threads and loop_thread not in storage_threads
@@ -15,7 +15,7 @@ from PIL import Image
 import lenslet.web.browse as browse
 import lenslet.web.app.storage as storage_app
 from lenslet.browse.query import BrowseQuerySpec
-from lenslet.server import TableAppOptions, create_app_from_storage, create_app_from_table
+from lenslet.server import BrowseAppOptions, TableAppOptions, create_app_from_storage, create_app_from_table
 from lenslet.storage.memory import MemoryStorage
 from lenslet.storage.table import TableStorage, TableStorageOptions
 from lenslet.web.models import BrowseItemPayload
@@ -470,6 +470,20 @@ def test_query_and_facets_share_one_table_filter_execution() -> None:
     assert counters["analysis_queued_work"] == 0
 
 
+def test_table_app_sizes_the_analysis_pool_from_browse_options() -> None:
+    app = create_app_from_table(
+        [{"path": "gallery/a.jpg", "source": "https://example.test/a.jpg"}],
+        options=TableAppOptions(
+            browse=BrowseAppOptions(analysis_workers=11),
+            source_column="source",
+            skip_dimension_probe=True,
+        ),
+    )
+
+    coordinator = app.state.lenslet_app_context.runtime.query_coordinator
+    assert coordinator.diagnostics()["analysis_workers"] == 11
+
+
 def test_analysis_ownership_headers_are_validated_together(tmp_path: Path) -> None:
     client = _client_for_six_row_table(tmp_path)
     client.headers.pop("X-Lenslet-Client-Session")
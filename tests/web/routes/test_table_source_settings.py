@@ -20,6 +20,7 @@ from lenslet.server import (
 from lenslet.storage.table import TableStorage
 from lenslet.storage.table.launch import TableLaunchRequest, prepare_table_launch
 from lenslet.web.context import get_app_context
+from lenslet.web.generation import build_browse_generation_token
 from lenslet.web.models import LaunchSessionPayload
 from lenslet.workspace import Workspace
 
@@ -169,7 +170,7 @@ def test_health_exposes_redacted_table_launch_status(tmp_path: Path) -> None:
     assert query_item["original_media"]["mode"] == "local_streaming"
 
 
-def test_local_table_source_change_publishes_one_restart_transition(tmp_path: Path) -> None:
+def test_unreloadable_table_source_change_publishes_one_restart_transition(tmp_path: Path) -> None:
     source = tmp_path / "items.parquet"
     _write_parquet(source, {
         "source": ["https://example.test/a.jpg"],
@@ -185,6 +186,7 @@ def test_local_table_source_change_publishes_one_restart_transition(tmp_path: Pa
             skip_dimension_probe=True,
         )
     )
+    launch.storage.set_source_reloader(None)
     launch_session = LaunchSessionPayload(
         kind="local_parquet",
         loaded_from_label="Local Parquet",
@@ -243,6 +245,85 @@ def test_local_table_source_change_publishes_one_restart_transition(tmp_path: Pa
     assert str(tmp_path) not in str(source_events[0])
 
 
+def test_local_table_source_change_reloads_in_process_and_keeps_unchanged_rows(tmp_path: Path) -> None:
+    source = tmp_path / "items.parquet"
+    _write_parquet(source, {
+        "source": ["https://example.test/a.jpg", "https://example.test/b.jpg"],
+        "path": ["keep/a.jpg", "edit/b.jpg"],
+    })
+    launch = prepare_table_launch(
+        TableLaunchRequest(
+            parquet_path=source,
+            base_dir=None,
+            source_column="source",
+            path_column="path",
+            cache_dimensions=False,
+            skip_dimension_probe=True,
+        )
+    )
+    storage = launch.storage
+    app = create_app_from_storage(
+        storage,
+        options=StorageAppOptions(
+            workspace=Workspace.for_dataset(None, can_write=False),
+            storage_mode="table",
+            storage_origin="parquet",
+            refresh="static",
+        ),
+    )
+
+    with TestClient(app) as client:
+        context = get_app_context(app)
+        client.portal.call(context.runtime.table_source_monitor.close)
+        initial = client.get("/health").json()
+        sidecar = storage.get_sidecar_readonly("keep/a.jpg")
+        sidecar["star"] = 4
+        storage.set_sidecar("keep/a.jpg", sidecar)
+        storage._thumbnails["keep/a.jpg"] = b"thumb-a"
+        storage._thumbnails["edit/b.jpg"] = b"thumb-b"
+        cache = context.recursive_browse_cache
+        previous_generation = build_browse_generation_token(storage)
+        cache.save("/keep", "name", previous_generation, [])
+        cache.save("/edit", "name", previous_generation, [])
+
+        replacement = tmp_path / "replacement.parquet"
+        _write_parquet(replacement, {
+            "source": [
+                "https://example.test/a.jpg",
+                "https://example.test/b-v2.jpg",
+                "https://example.test/c.jpg",
+            ],
+            "path": ["keep/a.jpg", "edit/b.jpg", "edit/c.jpg"],
+        })
+        os.replace(replacement, source)
+
+        assert client.portal.call(context.runtime.table_source_monitor.poll_once) is True
+        assert client.portal.call(context.runtime.table_source_monitor.poll_once) is False
+        reloaded = client.get("/health").json()
+        generation = build_browse_generation_token(storage)
+        kept_window = cache.load("/keep", "name", generation)
+        edited_window = cache.load("/edit", "name", generation)
+
+    assert reloaded["table_launch_status"]["source_refresh"]["state"] == "current"
+    assert reloaded["table_launch_status"]["source_refresh"]["generation"] != (
+        initial["table_launch_status"]["source_refresh"]["generation"]
+    )
+    assert reloaded["total_images"] == 3
+    assert storage.get_source_path("edit/b.jpg") == "https://example.test/b-v2.jpg"
+    assert storage.get_sidecar_readonly("keep/a.jpg")["star"] == 4
+    assert storage._thumbnails.get("keep/a.jpg") == b"thumb-a"
+    assert "edit/b.jpg" not in storage._thumbnails
+    assert generation != previous_generation
+    assert kept_window is not None
+    assert edited_window is None
+    source_events = [
+        event["data"]
+        for event in context.runtime.broker.replay(0)
+        if event["event"] == "table-source"
+    ]
+    assert [event["state"] for event in source_events] == ["refreshing", "current"]
+
+
 def test_unversioned_table_source_reports_restart_required() -> None:
     client = TestClient(
         create_app_from_table(